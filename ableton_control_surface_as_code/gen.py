@@ -6,7 +6,7 @@ from pathlib import Path
 import shutil
 from string import Template
 from collections import defaultdict
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
 from ableton_control_surface_as_code.gen_code import class_function_body_code_block, \
     class_function_code_block, get_python_code_error, device_templates, GeneratedCode, \
@@ -21,7 +21,7 @@ from ableton_control_surface_as_code.core_model import EncoderType
 from ableton_control_surface_as_code.encoder_coords import EncoderRefinements
 from ableton_control_surface_as_code.behavior_doc import build_behavior_doc
 from ableton_control_surface_as_code.hud_layout import (
-    allocate_global_layout, collect_mode_labels, combine_layouts,
+    allocate_global_layout, collect_mode_labels, combine_sections, dial_count, button_count,
 )
 from ableton_control_surface_as_code.model_composition import is_composition_file, read_composition
 from ableton_control_surface_as_code.model_custom_devices import validate_custom_device_mappings
@@ -228,15 +228,16 @@ def generate_code_as_template_vars(modes: ModeGroupWithMidi, controller=None, hu
     # keeps its own dedicated client; these are additional output targets driven
     # off the same burst (see Remote._feedback_sinks).
     feedback_sink_ctors = {
-        'ec4_text': 'Ec4Client(self.manager)',
-        'grid_led': 'GridLedClient(self.manager)',
+        'ec4_text': lambda d: 'Ec4Client(self.manager, midi_out=self._midi_out)',
+        'grid_led': lambda d: ('GridLedClient(self.manager, midi_out=self._midi_out)' if d.led_fps is None
+                               else f'GridLedClient(self.manager, max_fps={d.led_fps}, midi_out=self._midi_out)'),
     }
     feedback_sinks = ", ".join(
-        feedback_sink_ctors[d.type.value] for d in (feedback or [])
+        feedback_sink_ctors[d.type.value](d) for d in (feedback or [])
     )
 
     osc_clients = ", ".join(
-        f"OSCClient(host='{t.host}', port={t.port})"
+        f"OSCClient(host='{t.host}', port={t.port}{', bundle=True' if sink.bundle else ''})"
         for sink in (outputs or [])
         if sink.type.value == 'osc'
         for t in sink.targets
@@ -401,8 +402,9 @@ def print_ascii_layout(controller):
 
 def generate(input_path):
     """Generate one or more surfaces from a config file. A composition config
-    (declares `primary:`/`secondary:`) emits the lc_parks compositor + the
-    secondary forwarder; any other config is a normal single surface."""
+    (declares `primary:` + `secondary:`/`secondaries:`) emits the lc_parks
+    compositor + one forwarder per secondary; any other config is a normal
+    single surface."""
     if is_composition_file(input_path):
         generate_composition(input_path)
     else:
@@ -417,7 +419,7 @@ class CompositionOverrides:
     (see REGION_CONFIG / HUD_TARGET in main_component.py) — never a code string.
     All-None is a standalone surface."""
     hud_target: Optional[Tuple[str, int]] = None     # forwarder's HUD client (host, port)
-    region_config: Optional[dict] = None             # compositor's {dial_offset, button_offset, port}
+    region_config: Optional[Union[dict, list]] = None  # compositor's {dial_offset, button_offset, port, ..} (list: one per secondary)
     hud_cells: Optional[list] = None                 # combined layout override
     hud_trigger: Optional['HudTrigger'] = None       # force show-hud-on (compositor: Selection)
     mode_link: Optional[dict] = None                 # reverse mode channel {role: sender|listener, port}
@@ -474,6 +476,7 @@ def _generate_surface(mapping_file_path, surface_name, target_dir, overrides=Non
         'parameter_mappings_raw': repr(parameter_mappings_raw),
         'smart_zoning': repr(bool(mappings.smart_zoning)),
         'zone_tables_raw': repr(zone_tables_raw),
+        'send_thread': repr(bool(mappings.send_thread)),
         # HUD client target as data. None -> the HUD on 127.0.0.1:5006; the parks
         # forwarder sets (host, port) to reach the compositor's region port.
         'hud_target': repr(overrides.hud_target),
@@ -571,74 +574,119 @@ def validate_composition_modes(primary_root, secondary_root):
             ErrorCode.SEMANTIC_VALIDATION)
 
 
+def _composition_ports(comp_stem, secondaries):
+    """(region_port, mode_port) per secondary. Region ports come from each
+    entry's `region-port` or, like the mode ports, from the composition stem:
+    secondary i gets base+3+2i / base+4+2i (offset +3 to dodge each surface's
+    udp/osc ports), so the first secondary keeps the two-surface ports."""
+    base = generate_5_digit_number(comp_stem)
+    ports = []
+    for i, spec in enumerate(secondaries):
+        region_port = spec.region_port if spec.region_port is not None else base + 3 + 2 * i
+        ports.append((region_port, base + 4 + 2 * i))
+    used = [p for pair in ports for p in pair]
+    if len(set(used)) != len(used):
+        raise GenError(
+            f"Invalid composition {comp_stem}: region/mode ports collide ({used}); "
+            f"set a distinct `region-port` on each secondary.",
+            ErrorCode.SEMANTIC_VALIDATION)
+    return ports
+
+
 def generate_composition(comp_path):
     comp = read_composition(comp_path.read_text())
     comp_dir = comp_path.parent
     comp_stem = comp_path.stem  # e.g. lc_parks
+    secondaries = comp.all_secondaries()
 
     primary_path = (comp_dir / comp.primary).resolve()
-    secondary_path = (comp_dir / comp.secondary.mapping).resolve()
+    secondary_paths = [(comp_dir / spec.mapping).resolve() for spec in secondaries]
 
-    # Both surfaces are emitted INTO the composition folder under unique,
+    # Every surface is emitted INTO the composition folder under unique,
     # composition-namespaced names (no dashes — Ableton won't load those). This
-    # makes each surface unambiguously "part of lc_parks": the secondary here is
-    # always the forwarder, never confusable with a standalone build of the same
-    # mapping. Role = the referenced mapping's parent dir (launch_control/parks).
+    # makes each surface unambiguously "part of lc_parks": a secondary here is
+    # always a forwarder, never confusable with a standalone build of the same
+    # mapping. Role = the referenced mapping's parent dir (launch_control/parks),
+    # numbered when two secondaries share one.
     primary_name = f"ck_{comp_stem}__{primary_path.parent.name}"      # ck_lc_parks__launch_control
-    secondary_name = f"ck_{comp_stem}__{secondary_path.parent.name}"  # ck_lc_parks__parks
-
-    # Region port: single source of truth for both surfaces. Derived from the
-    # composition stem (offset +3 to dodge each surface's udp/osc ports) unless
-    # set explicitly.
-    region_port = comp.region_port if comp.region_port is not None else generate_5_digit_number(comp_stem) + 3
-    # Reverse mode channel port (primary -> secondary). Same stem-derived base as
-    # region_port but a different offset so the two channels can't collide.
-    mode_port = generate_5_digit_number(comp_stem) + 4
-    assert mode_port != region_port, "mode_port must differ from region_port"
+    secondary_names = []
+    for i, path in enumerate(secondary_paths):
+        name = f"ck_{comp_stem}__{path.parent.name}"                  # ck_lc_parks__parks
+        if name == primary_name or name in secondary_names:
+            name = f"{name}{i + 1}"
+        secondary_names.append(name)
+
+    # Region port per secondary: single source of truth for the compositor and
+    # that secondary's forwarder. Each secondary with modes also gets its own
+    # reverse mode channel port (primary -> that secondary).
+    ports = _composition_ports(comp_stem, secondaries)
 
     primary_root = read_root(primary_path.read_text(), source=primary_path.name)
-    secondary_root = read_root(secondary_path.read_text(), source=secondary_path.name)
-    validate_composition_modes(primary_root, secondary_root)
+    secondary_roots = [read_root(path.read_text(), source=path.name) for path in secondary_paths]
+    for secondary_root in secondary_roots:
+        validate_composition_modes(primary_root, secondary_root)
 
-    # Combined layout: primary cells + secondary cells offset to the right.
+    # Combined layout: primary cells, then each secondary as its own section.
     primary_ctrl = read_controller((primary_path.parent / primary_root.controller).read_text())
-    secondary_ctrl = read_controller((secondary_path.parent / secondary_root.controller).read_text())
     primary_cells = allocate_global_layout(primary_ctrl)
-    secondary_cells = allocate_global_layout(secondary_ctrl)
-    combined_cells, dial_offset, button_offset = combine_layouts(primary_cells, secondary_cells)
+    secondary_cells = [
+        allocate_global_layout(read_controller((path.parent / root.controller).read_text()))
+        for path, root in zip(secondary_paths, secondary_roots)]
+    combined_cells, offsets = combine_sections([primary_cells] + secondary_cells)
 
     # 1. Compositor surface (the named lc_parks): primary mapping + combined
-    #    layout + region listener. Output lands in the composition folder.
+    #    layout + one region listener per secondary. Output lands in the
+    #    composition folder.
     # Force the compositor to show-hud-on='selection'. The primary mapping is
     # often 'controller-nav' (launch_control is), which SUPPRESSES the burst on
     # a plain selection AND sends HIDE. That HIDE races the parks-triggered
     # combined COMMIT (two independent selection polls in two processes), so the
     # values flash then vanish. Showing on selection removes the HIDE-on-select
     # entirely; device-nav (source='nav') still shows as before.
-    # The primary forwards its mode to the secondary ONLY when it actually has a
-    # shift mode-button to forward; mode_link is None otherwise (single-mode
-    # primary), so the secondary just stays in its first mode.
-    primary_drives_modes = primary_root.mode_button is not None and bool(_declared_mode_names(secondary_root))
-    primary_mode_link = {'role': 'sender', 'port': mode_port} if primary_drives_modes else None
-    secondary_mode_link = {'role': 'listener', 'port': mode_port} if primary_drives_modes else None
+    # The primary forwards its mode to a secondary ONLY when it actually has a
+    # shift mode-button to forward and that secondary declares modes; mode_link
+    # is None otherwise (single-mode primary), so the secondary just stays in
+    # its first mode.
+    drives_modes = [primary_root.mode_button is not None and bool(_declared_mode_names(root))
+                    for root in secondary_roots]
+    mode_ports = [mode_port for (_r, mode_port), drives in zip(ports, drives_modes) if drives]
+    primary_mode_link = None
+    if mode_ports:
+        # One secondary (the lc_parks case) keeps a plain port.
+        primary_mode_link = {'role': 'sender',
+                             'port': mode_ports[0] if len(mode_ports) == 1 else mode_ports}
+
+    regions = []
+    for cells, (dial_offset, button_offset), (region_port, _m) in zip(
+            secondary_cells, offsets[1:], ports):
+        regions.append({'dial_offset': dial_offset, 'button_offset': button_offset,
+                        'port': region_port,
+                        # Secondary region size: RegionState preallocates its slots.
+                        'dial_count': dial_count(cells),
+                        'button_count': button_count(cells)})
 
     _generate_surface(primary_path, primary_name, comp_dir, CompositionOverrides(
-        region_config={'dial_offset': dial_offset, 'button_offset': button_offset,
-                       'port': region_port},
+        # A plain dict for one secondary (the two-surface lc_parks shape), a
+        # list of them, in section order, for more.
+        region_config=regions[0] if len(regions) == 1 else regions,
         hud_cells=combined_cells,
         hud_trigger=HudTrigger.Selection,
         mode_link=primary_mode_link))
 
-    # 2. Secondary forwarder: a normal surface whose HudClient is redirected at
-    #    the compositor's region port instead of the HUD. Emitted into the
-    #    composition folder under the namespaced name (NOT next to its own
-    #    mapping), so it can't be confused with a standalone build.
-    _generate_surface(secondary_path, secondary_name, comp_dir, CompositionOverrides(
-        hud_target=('127.0.0.1', region_port),
-        mode_link=secondary_mode_link))
-
-    print(f"Composition {comp_stem}: {primary_name} (compositor) + {secondary_name} "
-          f"(forwarder) share region port {region_port}.")
+    # 2. Secondary forwarders: normal surfaces whose HudClient is redirected at
+    #    the compositor's region port for their section instead of the HUD.
+    #    Emitted into the composition folder under the namespaced name (NOT
+    #    next to their own mapping), so they can't be confused with a
+    #    standalone build.
+    for path, name, (region_port, mode_port), drives in zip(
+            secondary_paths, secondary_names, ports, drives_modes):
+        _generate_surface(path, name, comp_dir, CompositionOverrides(
+            hud_target=('127.0.0.1', region_port),
+            mode_link={'role': 'listener', 'port': mode_port} if drives else None))
+
+    forwarders = ', '.join(f"{name} (port {region_port})"
+                           for name, (region_port, _m) in zip(secondary_names, ports))
+    print(f"Composition {comp_stem}: {primary_name} (compositor) + forwarders {forwarders}.")
 
 
 if __name__ == '__main__':
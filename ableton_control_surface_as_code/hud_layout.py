@@ -109,21 +109,35 @@ def offset_layout(cells: List[LayoutCell], dial_offset: int,
     return out
 
 
+def combine_sections(layouts: List[List[LayoutCell]]):
+    """Concatenate N per-controller layouts into one cell list. Layout k becomes
+    section k (the HUD lays each section out as its own sub-grid, left to right
+    in section order) and keeps its own grid, but its wire indices are bumped
+    past every earlier section's dial/button counts so the shared flat slot
+    arrays don't collide.
+
+    Returns (combined_cells, offsets): offsets[k] is section k's
+    (dial_offset, button_offset) -- (0, 0) for the primary -- i.e. what that
+    section's RegionState adds to incoming slot indices."""
+    combined: List[LayoutCell] = []
+    offsets = []
+    dial_offset = button_offset = 0
+    for section, cells in enumerate(layouts):
+        cells = [LayoutCell.from_raw(c) for c in cells]
+        offsets.append((dial_offset, button_offset))
+        combined += offset_layout(cells, dial_offset, button_offset, section) if section else cells
+        dial_offset += dial_count(cells)
+        button_offset += button_count(cells)
+    return combined, offsets
+
+
 def combine_layouts(primary: List[LayoutCell], secondary: List[LayoutCell]):
-    """Concatenate two per-controller layouts into one cell list: the primary is
-    section 0, the secondary section 1. The secondary keeps its own grid (the HUD
-    lays each section out independently and places section 1 to the right of
-    section 0), but its wire indices are bumped past the primary's dial/button
-    counts so the shared flat slot arrays don't collide.
-
-    Returns (combined_cells, dial_offset, button_offset). The offsets are what
-    the RegionListener adds to incoming secondary slot indices to remap them
-    into the shared wire space."""
-    primary = [LayoutCell.from_raw(c) for c in primary]
-    dial_offset = dial_count(primary)
-    button_offset = button_count(primary)
-    shifted = offset_layout(secondary, dial_offset, button_offset, section=1)
-    return primary + shifted, dial_offset, button_offset
+    """Two-section `combine_sections`: the primary is section 0, the secondary
+    section 1. Returns (combined_cells, dial_offset, button_offset) for the
+    secondary."""
+    combined, offsets = combine_sections([primary, secondary])
+    dial_offset, button_offset = offsets[1]
+    return combined, dial_offset, button_offset
 
 
 def _kind_for(group_type) -> str:
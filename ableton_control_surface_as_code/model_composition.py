@@ -4,7 +4,7 @@ A composition declares the "primary-drives-the-whole-HUD" pairing: a PRIMARY
 surface that owns its MIDI port and drives the entire HUD, and a display-only
 SECONDARY surface that owns its own MIDI port but forwards its resolved HUD
 region to the primary over UDP. Generating from a composition emits TWO surface
-directories:
+directories (one more per additional secondary):
 
   - the named compositor surface (this file's stem, e.g. `lc_parks`) — the
     primary, with the secondary's grid placement baked in + a region listener;
@@ -19,32 +19,68 @@ File shape:
         mapping: ../parks/ck_parkstool_buttons.nt
         placement: right
     region-port: 5123        # optional; derived from the stem when omitted
+
+More than one secondary: list them under `secondaries:` instead. Each becomes
+its own forwarder with its own region port (per-entry `region-port`, derived
+from the stem and position when omitted) and its own section of the combined
+HUD, in list order left to right:
+
+    primary: ../launch_control/ck_launch_control_16.nt
+    secondaries:
+        -
+            mapping: ../parks/ck_parkstool_buttons.nt
+        -
+            mapping: ../grid/ck_grid.nt
+            region-port: 5124
 """
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from nestedtext import nestedtext as nt
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 class SecondarySpec(BaseModel):
     mapping: str
     placement: str = 'right'   # only 'right' is meaningful today
+    region_port: Optional[int] = Field(default=None, alias='region-port')
 
     class Config:
         extra = 'forbid'
+        populate_by_name = True
 
 
 class CompositionRoot(BaseModel):
     ableton_dir: str = Field(alias='ableton-dir')
     primary: str
-    secondary: SecondarySpec
+    secondary: Optional[SecondarySpec] = None
+    secondaries: Optional[List[SecondarySpec]] = None
     region_port: Optional[int] = Field(default=None, alias='region-port')
 
     class Config:
         extra = 'forbid'
         populate_by_name = True
 
+    @model_validator(mode='after')
+    def _one_secondary_form(self):
+        if (self.secondary is None) == (self.secondaries is None):
+            raise ValueError("declare exactly one of `secondary:` or `secondaries:`")
+        if self.secondaries is not None:
+            if not self.secondaries:
+                raise ValueError("`secondaries:` must list at least one surface")
+            if self.region_port is not None:
+                raise ValueError("with `secondaries:`, set `region-port` on each entry")
+        return self
+
+    def all_secondaries(self) -> List[SecondarySpec]:
+        """The secondaries in section order; the single-`secondary:` form is a
+        list of one whose region port is the top-level `region-port`."""
+        if self.secondaries is not None:
+            return list(self.secondaries)
+        if self.region_port is not None and self.secondary.region_port is None:
+            return [self.secondary.model_copy(update={'region_port': self.region_port})]
+        return [self.secondary]
+
 
 def read_composition(text: str) -> CompositionRoot:
     data = nt.loads(text) or {}
@@ -52,7 +88,8 @@ def read_composition(text: str) -> CompositionRoot:
 
 
 def is_composition_file(path: Path) -> bool:
-    """A config is a composition if it declares `primary:` and `secondary:`.
+    """A config is a composition if it declares `primary:` and `secondary:`
+    (or `secondaries:`).
     Cheap top-level key sniff so `generate()` can dispatch without fully parsing
     (and without tripping a normal mapping's `extra='forbid'`)."""
     if path.suffix != '.nt':
@@ -61,4 +98,5 @@ def is_composition_file(path: Path) -> bool:
         data = nt.loads(path.read_text()) or {}
     except Exception:
         return False
-    return isinstance(data, dict) and 'primary' in data and 'secondary' in data
+    return (isinstance(data, dict) and 'primary' in data
+            and ('secondary' in data or 'secondaries' in data))
@@ -106,8 +106,16 @@ class FeedbackSinkType(str, Enum):
 class FeedbackSinkDef(BaseModel, frozen=True):
     """A generic runtime feedback sink — an output target driven on device /
     mode / control-remap changes (e.g. the EC4 text readouts). The HUD has its
-    own dedicated path; these are additional sinks listed under `feedback:`."""
+    own dedicated path; these are additional sinks listed under `feedback:`.
+    `led-fps` (grid_led only) caps live-update LED frames per second."""
     type: FeedbackSinkType
+    led_fps: Optional[int] = Field(default=None, alias='led-fps', gt=0)
+
+    @model_validator(mode='after')
+    def _led_fps_only_for_grid_led(self):
+        if self.led_fps is not None and self.type != FeedbackSinkType.GridLed:
+            raise ValueError(f"led-fps only applies to grid_led feedback, not {self.type.value}")
+        return self
 
     class Config:
         extra = 'forbid'
@@ -126,9 +134,12 @@ class OSCTarget(BaseModel):
 
 
 class OutputSinkDef(BaseModel):
-    """A declared output sink — a target that receives parameter-update publishes."""
+    """A declared output sink — a target that receives parameter-update publishes.
+    `bundle: true` sends each device burst as a single OSC bundle; off by default
+    because a receiver has to understand `#bundle` datagrams."""
     type: OutputSinkType
     targets: List[OSCTarget] = Field(default_factory=list)
+    bundle: bool = False
 
     class Config:
         extra = 'forbid'
@@ -152,6 +163,7 @@ class RootV2(BaseModel):
     # ai-coding/plans/shared-functions-file-plan.md.
     functions_file: Optional[str] = None
     smart_zoning: bool = False
+    send_thread: bool = False
     hud: HudMode = HudMode.On
     # Built model: always constructed with an explicit value from the (now
     # required) parsed model, so this default is only a safety net for direct
@@ -177,6 +189,10 @@ class RootV2ModesOrModeless(BaseModel):
     # other surfaces are untouched until they opt in; a 32-slot template only
     # makes sense on this surface's 32 pots.
     smart_zoning: bool = Field(default=False, alias='smart-zoning')
+    # Socket writes on a background thread (source_modules/send_queue.py).
+    # Off by default: inline sends are simpler to reason about and fast enough
+    # unless a receiver stalls.
+    send_thread: bool = Field(default=False, alias='send-thread')
     # Required — no default. A surface must state what the HUD shows and when it
     # appears; `read_root` pre-checks their presence for a friendly error.
     hud: HudMode
@@ -202,6 +218,7 @@ class RootV2ModesOrModeless(BaseModel):
             parameter_mappings_file=self.parameter_mappings_file,
             functions_file=self.functions_file,
             smart_zoning=self.smart_zoning,
+            send_thread=self.send_thread,
             hud=self.hud,
             show_hud_on=self.show_hud_on,
             feedback=self.feedback,
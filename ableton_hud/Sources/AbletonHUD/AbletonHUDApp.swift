@@ -52,7 +52,7 @@ class AppDelegate: NSObject, NSApplicationDelegate {
         addr.sin_family = sa_family_t(AF_INET)
         addr.sin_port = UInt16(40844).bigEndian
         addr.sin_addr.s_addr = inet_addr("127.0.0.1")
-        let data = "HELLO".data(using: .utf8)!
+        let data = WireProtocol.helloLine.data(using: .utf8)!
         _ = data.withUnsafeBytes { buf in
             sendto(sock, buf.baseAddress, data.count, 0,
                    withUnsafePointer(to: &addr) { UnsafeRawPointer($0).assumingMemoryBound(to: sockaddr.self) },
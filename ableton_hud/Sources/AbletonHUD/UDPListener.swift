@@ -15,6 +15,8 @@ class UDPListener {
     private var fd: Int32 = -1
     private var thread: Thread?
     private var running = false
+    /// Only touched on the recv thread.
+    private var parts = PartAssembler()
 
     func start() {
         // Seed the fine-trace gate from the sentinel at launch (the recv loop
@@ -69,7 +71,13 @@ class UDPListener {
         while running {
             let n = recv(fd, &buf, buf.count, 0)
             if n <= 0 { break }
-            let data = Data(buf[0..<n])
+            var data = Data(buf[0..<n])
+            if PartAssembler.isPart(data) {
+                // One fragment of an oversized burst; nothing to apply until
+                // the last one arrives and the burst decodes as a whole.
+                guard let whole = parts.feed(data) else { continue }
+                data = whole
+            }
             let text = String(data: data, encoding: .utf8) ?? "(non-utf8)"
             // Re-read the /tmp/ableton_hud_fine sentinel each datagram so a
             // touch/rm toggles tracing at runtime within one message.
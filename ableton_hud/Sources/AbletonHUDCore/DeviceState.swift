@@ -117,6 +117,19 @@ public class DeviceState: ObservableObject {
             pendingDialColors = [:]
             pendingButtonColors = [:]
 
+        case .delta(let name):
+            // Delta burst: clear the sticky dismiss exactly like DEVICE, but keep
+            // the pending page/zone/cell state from the last burst and seed the
+            // pending slots from the *published* arrays (which include any live
+            // UPDATE patches) — the delta only carries lines that changed.
+            hudLog("apply DELTA name=\(name) dismissed=\(dismissed)->false", level: .fine)
+            dismissed = false
+            pendingName = name
+            pendingDials = [:]
+            for (i, s) in dialSlots.enumerated() { if let s = s { pendingDials[i] = s } }
+            pendingButtons = [:]
+            for (i, s) in buttonSlots.enumerated() { if let s = s { pendingButtons[i] = s } }
+
         case .slot(let kind, let index, let slot):
             guard index >= 0 else { return }
             switch kind {
@@ -54,6 +54,10 @@ public struct ZoneTint: Equatable {
 public enum WireMessage: Equatable {
     case layout([HudCell])
     case device(String)
+    /// Delta-burst start (hud_protocol.md "Delta bursts"): like `device`, but the
+    /// pending state is seeded from what was last published, so only the lines
+    /// that changed since the previous COMMIT follow before this burst's COMMIT.
+    case delta(String)
     case slot(SlotKind, Int, Slot)
     /// Immediate single-slot update — no burst, no COMMIT needed.
     case update(SlotKind, Int, Slot)
@@ -93,6 +97,15 @@ public enum WireMessage: Equatable {
 }
 
 public enum WireProtocol {
+    /// Capabilities this receiver announces in its HELLO to the surface
+    /// (`HELLO|delta,bin1,part1`). The sender only uses an optional wire feature
+    /// once it has been announced, so an older HUD keeps getting full bursts.
+    public static let helloCapabilities = ["delta", "bin1", "part1"]
+
+    public static var helloLine: String {
+        "HELLO|" + helloCapabilities.joined(separator: ",")
+    }
+
     /// Single-source parser: the HUD has exactly one sender (a standalone
     /// surface, or the `lc_parks` compositor which merges any secondary region
     /// itself before emitting). No source/group/order on the wire.
@@ -131,6 +144,10 @@ public enum WireProtocol {
             guard fields.count >= 2 else { return .unknown }
             return .device(fields[1])
 
+        case "DELTA":
+            guard fields.count >= 2 else { return .unknown }
+            return .delta(fields[1])
+
         case "SLOT", "UPDATE":
             // Optional 8th `glyph` field: 7 fields = text-only (glyph ""),
             // 8 = with SF Symbol. Tolerating both keeps an older sender working.
@@ -215,7 +232,12 @@ public enum WireProtocol {
         }
     }
 
+    /// Leading bytes of a binary frame (hud_protocol.md "Binary frames"). The
+    /// NUL can never start a text line, so one datagram is one or the other.
+    public static let binaryMagic: [UInt8] = [0x00, 0x48, 0x42, 0x31]
+
     public static func parseAll(data: Data) -> [WireMessage] {
+        if data.starts(with: binaryMagic) { return parseBinary(data: data) }
         guard let text = String(data: data, encoding: .utf8) else { return [] }
         return text
             .components(separatedBy: "\n")
@@ -223,4 +245,163 @@ public enum WireProtocol {
             .filter { !$0.isEmpty }
             .map { parse(line: $0) }
     }
+
+    /// Decode one binary frame. A truncated or malformed frame keeps the
+    /// messages decoded before the damage and appends `.unknown`, mirroring a
+    /// bad text line.
+    public static func parseBinary(data: Data) -> [WireMessage] {
+        let bytes = [UInt8](data)
+        var pos = binaryMagic.count
+        var messages: [WireMessage] = []
+
+        func u16() -> Int? {
+            guard pos + 2 <= bytes.count else { return nil }
+            defer { pos += 2 }
+            return Int(bytes[pos]) | Int(bytes[pos + 1]) << 8
+        }
+        func f32() -> Float? {
+            guard pos + 4 <= bytes.count else { return nil }
+            defer { pos += 4 }
+            let bits = UInt32(bytes[pos]) | UInt32(bytes[pos + 1]) << 8
+                | UInt32(bytes[pos + 2]) << 16 | UInt32(bytes[pos + 3]) << 24
+            return Float(bitPattern: bits)
+        }
+        func str() -> String? {
+            guard let n = u16(), pos + n <= bytes.count else { return nil }
+            defer { pos += n }
+            return String(decoding: bytes[pos..<pos + n], as: UTF8.self)
+        }
+
+        guard let nameCount = u16() else { return [.unknown] }
+        var names: [String] = []
+        for _ in 0..<nameCount {
+            guard let name = str() else { return [.unknown] }
+            names.append(name)
+        }
+        guard let rangeCount = u16() else { return [.unknown] }
+        var ranges: [(Float, Float)] = []
+        for _ in 0..<rangeCount {
+            guard let vmin = f32(), let vmax = f32() else { return [.unknown] }
+            ranges.append((vmin, vmax))
+        }
+        guard let recordCount = u16() else { return [.unknown] }
+        for _ in 0..<recordCount {
+            guard pos < bytes.count else { messages.append(.unknown); break }
+            let tag = bytes[pos]
+            pos += 1
+            switch tag {
+            case UInt8(ascii: "T"):
+                guard let line = str() else { messages.append(.unknown); return messages }
+                messages.append(parse(line: line))
+            case UInt8(ascii: "S"), UInt8(ascii: "U"):
+                guard pos + 1 <= bytes.count else { messages.append(.unknown); return messages }
+                let kindCode = bytes[pos]
+                pos += 1
+                guard let index = u16(), let nameId = u16(), let glyphId = u16(),
+                      let rangeId = u16(), let value = f32(),
+                      nameId < names.count, glyphId < names.count, rangeId < ranges.count,
+                      kindCode <= 1 else { messages.append(.unknown); return messages }
+                let kind: SlotKind = kindCode == 0 ? .dial : .button
+                let (vmin, vmax) = ranges[rangeId]
+                let slot = Slot(name: names[nameId], value: value, min: vmin, max: vmax,
+                                glyph: names[glyphId])
+                messages.append(tag == UInt8(ascii: "U") ? .update(kind, index, slot)
+                                                         : .slot(kind, index, slot))
+            default:
+                messages.append(.unknown)
+                return messages
+            }
+        }
+        return messages
+    }
+}
+
+/// Reassembles multipart bursts (hud_protocol.md "Multipart bursts"): an
+/// oversized burst arrives as `PART|<seq>|<i>|<n>\n<chunk>` datagrams, and the
+/// concatenated chunks decode exactly like one datagram. Mirrors
+/// `hud_protocol.PartAssembler`: in-progress bursts are kept in arrival order,
+/// completing one evicts every burst that started before it (stale), and
+/// sequence numbers are never compared for order, so a reloaded surface that
+/// restarts its counter is accepted on its first burst -- even one reusing the
+/// seq just delivered: a fragment of that seq is only a late duplicate while it
+/// matches the delivered burst byte for byte.
+public struct PartAssembler {
+    public static let prefix: [UInt8] = Array("PART|".utf8)
+    public static let maxParts = 64
+
+    private struct Pending {
+        let seq: Int
+        var parts: [Data?]
+        var held: Int
+    }
+
+    private struct Delivered {
+        let seq: Int
+        let parts: [Data?]
+        var repeated: Set<Int>
+    }
+
+    private let maxPending: Int
+    private var pending: [Pending] = []
+    private var lastComplete: Delivered?
+
+    public init(maxPending: Int = 4) {
+        self.maxPending = maxPending
+    }
+
+    public static func isPart(_ data: Data) -> Bool {
+        data.starts(with: prefix)
+    }
+
+    /// Take one fragment; returns the whole datagram once this fragment
+    /// completes its burst, nil otherwise (or for a malformed fragment).
+    public mutating func feed(_ data: Data) -> Data? {
+        guard let nl = data.firstIndex(of: 0x0A),
+              let header = String(data: data[data.startIndex..<nl], encoding: .utf8) else { return nil }
+        let fields = header.split(separator: "|", omittingEmptySubsequences: false)
+        guard fields.count == 4, fields[0] == "PART",
+              let seq = Int(fields[1]), let i = Int(fields[2]), let n = Int(fields[3]),
+              n > 0, n <= PartAssembler.maxParts, i >= 0, i < n else { return nil }
+        let chunk = Data(data[data.index(after: nl)...])
+
+        var slot = pending.firstIndex(where: { $0.seq == seq })
+        if slot == nil {
+            guard let seeded = restarted(seq: seq, i: i, n: n, chunk: chunk) else {
+                return nil  // late duplicate of the last burst
+            }
+            if pending.count >= maxPending { pending.removeFirst() }
+            pending.append(Pending(seq: seq, parts: seeded, held: seeded.filter { $0 != nil }.count))
+            slot = pending.count - 1
+        }
+        guard let at = slot, pending[at].parts.count == n else { return nil }
+        if pending[at].parts[i] == nil {
+            pending[at].parts[i] = chunk
+            pending[at].held += 1
+        }
+        guard pending[at].held == n else { return nil }
+
+        var whole = Data()
+        for part in pending[at].parts { whole.append(part ?? Data()) }
+        lastComplete = Delivered(seq: seq, parts: pending[at].parts, repeated: [])
+        pending.removeFirst(at + 1)
+        return whole
+    }
+
+    /// Fresh parts for a new burst, or nil when the fragment repeats the burst
+    /// last delivered. A same-seq fragment that differs means the sender
+    /// restarted its counter: the new burst keeps the fragments that already
+    /// arrived identical to the delivered ones.
+    private mutating func restarted(seq: Int, i: Int, n: Int, chunk: Data) -> [Data?]? {
+        guard var last = lastComplete, last.seq == seq else {
+            return Array(repeating: nil, count: n)
+        }
+        let sameShape = last.parts.count == n
+        if sameShape && last.parts[i] == chunk {
+            last.repeated.insert(i)
+            lastComplete = last
+            return nil
+        }
+        lastComplete = nil
+        return (0..<n).map { sameShape && last.repeated.contains($0) ? last.parts[$0] : nil }
+    }
 }
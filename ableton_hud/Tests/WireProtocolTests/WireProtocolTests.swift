@@ -20,6 +20,11 @@ final class WireProtocolTests: XCTestCase {
         XCTAssertEqual(msg, .unknown)
     }
 
+    func test_delta_line() {
+        XCTAssertEqual(WireProtocol.parse(line: "DELTA|EQ Eight"), .delta("EQ Eight"))
+        XCTAssertEqual(WireProtocol.parse(line: "DELTA"), .unknown)
+    }
+
     // MARK: - SLOT
 
     func test_slot_dial() {
@@ -323,6 +328,80 @@ final class WireProtocolTests: XCTestCase {
         let msgs = WireProtocol.parseAll(data: data)
         XCTAssertEqual(msgs, [.device("Test"), .unknown, .commit(0)])
     }
+
+    // MARK: - Binary frames
+
+    /// `hud_protocol.encode_binary` of DEVICE|EQ, SLOT|dial|0|Freq|0.5|0.0|1.0,
+    /// UPDATE|button|1|On|1.0|0.0|1.0|power, COMMIT|1 — pins the Python encoder
+    /// and this decoder to the same bytes.
+    static let binaryFrame: [UInt8] = [
+        0x00, 0x48, 0x42, 0x31, 0x04, 0x00, 0x04, 0x00, 0x46, 0x72, 0x65, 0x71,
+        0x00, 0x00, 0x02, 0x00, 0x4F, 0x6E, 0x05, 0x00, 0x70, 0x6F, 0x77, 0x65,
+        0x72, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0x3F, 0x04,
+        0x00, 0x54, 0x09, 0x00, 0x44, 0x45, 0x56, 0x49, 0x43, 0x45, 0x7C, 0x45,
+        0x51, 0x53, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00,
+        0x00, 0x00, 0x3F, 0x55, 0x01, 0x01, 0x00, 0x02, 0x00, 0x03, 0x00, 0x00,
+        0x00, 0x00, 0x00, 0x80, 0x3F, 0x54, 0x08, 0x00, 0x43, 0x4F, 0x4D, 0x4D,
+        0x49, 0x54, 0x7C, 0x31,
+    ]
+
+    func test_binary_frame_decodes_like_text() {
+        let msgs = WireProtocol.parseAll(data: Data(Self.binaryFrame))
+        XCTAssertEqual(msgs, [
+            .device("EQ"),
+            .slot(.dial, 0, Slot(name: "Freq", value: 0.5, min: 0, max: 1)),
+            .update(.button, 1, Slot(name: "On", value: 1, min: 0, max: 1, glyph: "power")),
+            .commit(1),
+        ])
+    }
+
+    func test_truncated_binary_frame_keeps_decoded_prefix() {
+        let msgs = WireProtocol.parseAll(data: Data(Self.binaryFrame.dropLast(5)))
+        XCTAssertEqual(msgs.first, .device("EQ"))
+        XCTAssertEqual(msgs.last, .unknown)
+        XCTAssertFalse(msgs.contains(.commit(1)))
+    }
+
+    func test_hello_announces_binary() {
+        XCTAssertEqual(WireProtocol.helloLine, "HELLO|delta,bin1,part1")
+    }
+
+    // MARK: - Multipart bursts
+
+    private func part(_ seq: Int, _ i: Int, _ n: Int, _ chunk: String) -> Data {
+        Data("PART|\(seq)|\(i)|\(n)\n\(chunk)".utf8)
+    }
+
+    func test_parts_reassemble_in_any_order() {
+        var asm = PartAssembler()
+        XCTAssertNil(asm.feed(part(3, 1, 2, "COMMIT|0\n")))
+        let whole = asm.feed(part(3, 0, 2, "DEVICE|EQ\n"))
+        XCTAssertEqual(whole.map { WireProtocol.parseAll(data: $0) }, [.device("EQ"), .commit(0)])
+    }
+
+    func test_newer_burst_evicts_stale_parts() {
+        var asm = PartAssembler()
+        XCTAssertNil(asm.feed(part(1, 0, 2, "DEVICE|Old\n")))
+        XCTAssertNil(asm.feed(part(2, 0, 2, "DEVICE|New\n")))
+        XCTAssertNotNil(asm.feed(part(2, 1, 2, "COMMIT|0\n")))
+        XCTAssertNil(asm.feed(part(1, 1, 2, "COMMIT|0\n")))
+    }
+
+    func test_reload_restarting_at_the_delivered_seq_is_accepted() {
+        var asm = PartAssembler()
+        XCTAssertNil(asm.feed(part(0, 0, 2, "DEVICE|Old\n")))
+        XCTAssertNotNil(asm.feed(part(0, 1, 2, "COMMIT|0\n")))
+        XCTAssertNil(asm.feed(part(0, 1, 2, "COMMIT|0\n")))  // late duplicate
+        XCTAssertNil(asm.feed(part(0, 0, 2, "DEVICE|New\n")))
+        let whole = asm.feed(part(0, 1, 2, "COMMIT|0\n"))
+        XCTAssertEqual(whole.map { WireProtocol.parseAll(data: $0) }, [.device("New"), .commit(0)])
+    }
+
+    func test_malformed_part_header_is_dropped() {
+        var asm = PartAssembler()
+        XCTAssertNil(asm.feed(Data("PART|x|0|1\nDEVICE|EQ\n".utf8)))
+        XCTAssertNil(asm.feed(Data("PART|1|2|2\nDEVICE|EQ\n".utf8)))
+    }
 }
 
 // MARK: - DeviceState burst tests
@@ -371,6 +450,26 @@ final class DeviceStateBurstTests: XCTestCase {
         XCTAssertEqual(state.dialSlots[2]?.name, "Damp")
     }
 
+    func test_delta_burst_keeps_unchanged_slots_and_live_updates() async {
+        let state = makeState()
+        state.apply(message: .layout([HudCell(gridRow: 0, gridCol: 0, kind: .dial, count: 3, startIndex: 0)]))
+        state.apply(message: .device("Reverb"))
+        state.apply(message: .slot(.dial, 0, Slot(name: "Size", value: 0.5, min: 0, max: 1)))
+        state.apply(message: .slot(.dial, 1, Slot(name: "Decay", value: 0.1, min: 0, max: 1)))
+        state.apply(message: .commit(2))
+        state.apply(message: .update(.dial, 1, Slot(name: "Decay", value: 0.9, min: 0, max: 1)))
+        state.apply(message: .hide)
+
+        state.apply(message: .delta("Reverb"))
+        state.apply(message: .slot(.dial, 2, Slot(name: "Damp", value: 0.3, min: 0, max: 1)))
+        state.apply(message: .commit(1))
+
+        XCTAssertFalse(state.dismissed)
+        XCTAssertEqual(state.dialSlots[0]?.name, "Size")
+        XCTAssertEqual(state.dialSlots[1]?.value, 0.9)  // UPDATE survives the delta
+        XCTAssertEqual(state.dialSlots[2]?.name, "Damp")
+    }
+
     func test_dividers_publish_on_commit_and_persist_across_device() async {
         let state = makeState()
         state.apply(message: .layout([HudCell(gridRow: 0, gridCol: 0, kind: .dial, count: 1, startIndex: 0)]))
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the surface runtime's hot paths (pure Python, no Live).
+Usage:
+  python bin/bench.py resolver        # per-event resolve cost vs plugin parameter count
+  python bin/bench.py osc             # OSC encode + send: message builder vs templates
+  python bin/bench.py regions         # compositor region merge cost vs secondary count
+  python bin/bench.py names           # named track/device lookup: linear scan vs index
+
+Each benchmark prints a small table; the point is the *shape* across sizes
+(flat vs growing), not the absolute numbers, which depend on the machine and
+on Live's own per-call overhead that fakes can't model.
+"""
+import argparse
+import os
+import socket
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from source_modules.param_resolver import ParameterResolver
+from source_modules.osc_client import MessageTemplates
+from source_modules.hud_protocol import encode_binary, encode_slot_payload
+from source_modules.region_state import RegionState, RegionSet
+from source_modules.name_index import NameIndex
+from source_modules.pythonosc.osc_message_builder import OscMessageBuilder
+
+
+def _time_per_call(fn, calls):
+    """Best-of-3 mean microseconds per `fn()` call."""
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        elapsed = (time.perf_counter() - start) / calls * 1e6
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+# ---- resolver ---------------------------------------------------------------
+
+class _Param:
+    def __init__(self, i):
+        self.name = self.original_name = f"Param {i}"
+        self.is_quantized = i % 7 == 0
+        self.value, self.min, self.max = 0.5, 0.0, 1.0
+
+
+class _Device:
+    # A third-party plugin: no BOB entry, no standard banks -> fallback tier.
+    def __init__(self, n):
+        self.class_name = self.name = "PluginDevice"
+        self.parameters = [_Param(i) for i in range(n)]
+
+
+def bench_resolver(args):
+    sizes = (25, 100, 400, 1600)
+    print(f"{'params':>8} {'event us':>10} {'page flip us':>14} {'cold page flip us':>18}")
+    for n in sizes:
+        dev = _Device(n)
+        r = ParameterResolver({}, {}, {}, banks_per_page=2, button_switch_count=0,
+                              button_slot_count=8, log=lambda _m: None)
+        r.ensure_focused(dev)
+        c = [0]
+
+        def event():
+            # A knob sweep across the 16 encoders of page 1.
+            c[0] = c[0] % 16 + 1
+            r.resolve_encoder(dev, c[0])
+
+        def page_flip():
+            # What a page flip costs the resolver: page count + a fresh plan.
+            r.encoder_page = 2 if r.encoder_page == 1 else 1
+            r.encoder_pages_count(dev)
+            for c_idx in range(1, 17):
+                r.resolve_encoder(dev, c_idx)
+
+        def cold_page_flip():
+            # Same, with per-device indices dropped first: the pre-cache cost
+            # of re-filtering every parameter.
+            r._drop_indices()
+            page_flip()
+
+        print(f"{n:>8} {_time_per_call(event, args.calls):>10.2f} "
+              f"{_time_per_call(page_flip, args.calls // 16):>14.2f} "
+              f"{_time_per_call(cold_page_flip, args.calls // 16):>18.2f}")
+
+
+# ---- osc --------------------------------------------------------------------
+
+_OSC_MESSAGES = (
+    ('name', "/selected-device/name", ["Operator [Filter]"]),
+    ('param-update', "/selected-device/parameter-update", [3, 0.25, "Filter Freq", 0.0, 1.0, None]),
+    ('complete', "/selected-device/parameter-update-complete", [16]),
+)
+
+
+def bench_osc(args):
+    # Sends go to a bound local socket nobody reads: the kernel drops what
+    # overflows its buffer, so the loop measures the send call, not a peer.
+    rx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    rx.bind(('127.0.0.1', 0))
+    dest = rx.getsockname()
+    tx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    tx.setblocking(False)
+    templates = MessageTemplates()
+
+    def builder(address, values):
+        b = OscMessageBuilder(address=address)
+        for v in values:
+            b.add_arg(v)
+        return b.build().dgram
+
+    def sent(encode, address, values):
+        def fn():
+            try:
+                tx.sendto(encode(address, values), dest)
+            except BlockingIOError:
+                pass
+        return fn
+
+    print(f"{'message':>14} {'builder us':>11} {'template us':>12} "
+          f"{'builder+send us':>16} {'template+send us':>17}")
+    for label, address, values in _OSC_MESSAGES:
+        print(f"{label:>14} "
+              f"{_time_per_call(lambda: builder(address, values), args.calls):>11.2f} "
+              f"{_time_per_call(lambda: templates.encode(address, values), args.calls):>12.2f} "
+              f"{_time_per_call(sent(builder, address, values), args.calls):>16.2f} "
+              f"{_time_per_call(sent(templates.encode, address, values), args.calls):>17.2f}")
+    tx.close()
+    rx.close()
+
+
+# ---- regions ----------------------------------------------------------------
+
+class _NullHud:
+    def send_update(self, *args):
+        pass
+
+    def send_ping(self):
+        pass
+
+
+def _region_burst(n_dials, n_buttons, tag):
+    lines = ["DEVICE|Dev"]
+    lines += [f"SLOT|dial|{i}|Dial {i}|{tag}|0.0|1.0" for i in range(n_dials)]
+    lines += [f"SLOT|button|{i}|Btn {i}|{tag}|0.0|1.0" for i in range(n_buttons)]
+    lines.append(f"COMMIT|{n_dials + n_buttons}")
+    return encode_binary(lines)
+
+
+def bench_regions(args):
+    # One secondary commits a 16 dial + 16 button burst; the compositor then
+    # builds the combined region lines. "merged" is the RegionSet path (only
+    # the committing region is decoded + re-encoded); "full" re-encodes every
+    # region's slots, which is what a merge without per-region caching costs.
+    n_dials, n_buttons = 16, 16
+    bursts = [_region_burst(n_dials, n_buttons, v) for v in (0.25, 0.75)]
+    print(f"{'regions':>8} {'commit+merged us':>17} {'commit+full us':>15}")
+    for n in (1, 2, 4, 8, 16):
+        hud = _NullHud()
+        regions = RegionSet([
+            RegionState(hud, dial_offset=n_dials * (k + 1), button_offset=n_buttons * (k + 1),
+                        dial_count=n_dials, button_count=n_buttons)
+            for k in range(n)])
+        for state in regions.regions:
+            state.handle_datagram(bursts[0])
+        flip = [0]
+
+        def commit():
+            flip[0] ^= 1
+            regions.regions[0].handle_datagram(bursts[flip[0]])
+
+        def merged():
+            commit()
+            regions.slot_lines()
+
+        def full():
+            commit()
+            lines = []
+            for state in regions.regions:
+                lines += [encode_slot_payload('dial', i, p) for i, p in state.dial_payloads()]
+                lines += [encode_slot_payload('button', i, p) for i, p in state.button_payloads()]
+
+        calls = max(1, args.calls // 20)
+        print(f"{n:>8} {_time_per_call(merged, calls):>17.1f} {_time_per_call(full, calls):>15.1f}")
+
+
+# ---- names ------------------------------------------------------------------
+
+class _Lom:
+    # Accepts any Live-style add/remove/has listener call.
+    def __init__(self, name):
+        self.name = name
+
+    def __getattr__(self, attr):
+        if attr.endswith('_has_listener'):
+            return lambda fn: False
+        if attr.endswith('_listener'):
+            return lambda fn: None
+        raise AttributeError(attr)
+
+
+def _named_set(n_tracks, n_devices=8):
+    tracks = []
+    for t in range(n_tracks):
+        track = _Lom(f"Track {t}")
+        track.devices = [_Lom(f"Device {d}") for d in range(n_devices)]
+        tracks.append(track)
+    song = _Lom("song")
+    song.tracks = tracks
+    return song
+
+
+def _scan_device(song, track_name, device_name):
+    # What Helpers.find_track + find_device_on_track did before NameIndex.
+    for track in song.tracks:
+        if track is not None and track.name == track_name:
+            for device in track.devices:
+                if device is not None and device.name == device_name:
+                    return device
+            return None
+    return None
+
+
+def bench_names(args):
+    # A mapping bound to the last track's last device (worst case for the scan),
+    # resolved once per CC as the generated listeners do.
+    print(f"{'tracks':>8} {'scan us':>10} {'index us':>10}")
+    for n in (8, 32, 120, 500):
+        song = _named_set(n)
+        track_name, device_name = f"Track {n - 1}", "Device 7"
+        names = NameIndex()
+
+        def indexed():
+            track = names.track(song, track_name)
+            return names.device(track, device_name) if track is not None else None
+
+        assert indexed() is _scan_device(song, track_name, device_name)
+        scan = _time_per_call(lambda: _scan_device(song, track_name, device_name), args.calls)
+        print(f"{n:>8} {scan:>10.2f} {_time_per_call(indexed, args.calls):>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Surface runtime micro-benchmarks.")
+    parser.add_argument('--calls', type=int, default=20000, help='calls per measurement')
+    sub = parser.add_subparsers(dest='bench', required=True)
+    sub.add_parser('resolver', help='per-event resolve cost vs plugin parameter count')
+    sub.add_parser('osc', help='OSC encode + send: message builder vs templates')
+    sub.add_parser('regions', help='compositor region merge cost vs secondary count')
+    sub.add_parser('names', help='named track/device lookup: linear scan vs index')
+    args = parser.parse_args()
+    {'resolver': bench_resolver, 'osc': bench_osc, 'regions': bench_regions,
+     'names': bench_names}[args.bench](args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,5 @@
+### Script Generated by Control Surface Studio for Python 3 (resorted to default: no)
+from .ck_grid import ck_grid
+
+def create_instance(c_instance):
+    return ck_grid(c_instance)
\ No newline at end of file
@@ -0,0 +1,1088 @@
+from dataclasses import dataclass, replace
+from time import perf_counter
+from typing import Any, Optional
+
+from .hud_client import HudClient, NullHudClient
+from .update_coalescer import NullUpdateCoalescer
+from .hud_protocol import (
+    SlotPayload, EMPTY_SLOT, LayoutCell, PageInfo, BurstSnapshot, parse_hello, encode_slot,
+    encode_slot_payload,
+)
+from .param_resolver import (
+    ParameterResolver, RealParameter, ParameterMapping, SwitchSlotMapping,
+    M4L_CLASSES, _device_table_key, _build_device_table, _build_zone_tables,
+    _default_device_banks, _default_bank_names,
+    _device_alive, _safe_device_attr, _same_device,
+)
+from .hud_presenter import HudPresenter
+from .latency_stats import STATS
+from .name_index import NameIndex
+from .doctor import Doctor
+from .show_info import ShowInfo
+import logging
+
+logger = logging.getLogger("helpers")
+
+
+def _safe_param_fields(param, alias):
+    """Read (name, value, min, max) off a live device parameter, tolerating a
+    dead Boost.Python handle. The new Operator rebuilds its parameter list in
+    place, so a reference resolved a moment ago can already be freed — any
+    attribute access then raises `Boost.Python.ArgumentError`. The resolver now
+    hands back live handles (see ParameterResolver._live_param); this is the
+    last-line net so one un-readable param degrades to an empty/skipped slot
+    instead of aborting the whole burst (which propagates up and crashes the
+    mode switch). Returns None when the handle can't be read."""
+    try:
+        name = param.name if alias is None else alias
+        return (name, param.value, param.min, param.max)
+    except Exception:
+        return None
+
+
+def _overlay_labels(payloads, labels, kind):
+    """Replace EMPTY slots with labeled placeholders when the active mode
+    binds that wire index to a non-device mapping. Real device data stays
+    untouched."""
+    if not labels:
+        return payloads
+    out = []
+    for wire_idx, p in payloads:
+        if p == EMPTY_SLOT:
+            label = labels.get((kind, wire_idx))
+            if label is not None:
+                # Values are (name, glyph) pairs; tolerate a bare string too
+                # (glyph-less) so older baked label dicts still overlay.
+                if isinstance(label, tuple):
+                    name, glyph = label
+                else:
+                    name, glyph = label, ""
+                out.append((wire_idx, SlotPayload(name, 0, 0, 1, glyph or "")))
+                continue
+        out.append((wire_idx, p))
+    return out
+
+
+@dataclass
+class SurfaceConfig:
+    """Static per-surface configuration baked at codegen time. Groups the
+    constructor inputs that used to be a dozen positional/keyword params on
+    Helpers.__init__ so the generated template passes one object plus the two
+    live collaborators (manager, remote). None means "use the runtime default"."""
+    slot_assignments: Any = None
+    switch_slot_assignments: Any = None
+    # Per-mode device encoder / switch assignments ({mode_name: [(idx, slot)]}).
+    # The HUD presenter resolves only the active mode's device bindings so a slot
+    # device-bound in one mode doesn't show stale device data in another.
+    slot_assignments_by_mode: Any = None
+    switch_slot_assignments_by_mode: Any = None
+    # Base mode whose device page is previewed on the HUD when the parameter-pager
+    # is pressed from a mode that doesn't show the device encoders (e.g. paging
+    # while holding shift). None when there's no distinct base device mode.
+    pager_preview_mode: Any = None
+    parameter_mappings_raw: Any = None
+    # Smart-zoning (grid-po16-synth-surface-plan): flag + shipped zone tables,
+    # both baked by gen.py. Off/None -> resolver behaves exactly as today.
+    smart_zoning: bool = False
+    zone_tables_raw: Any = None
+    encoder_slot_count: int = 8
+    button_slot_count: int = 8
+    hud_cells: Any = None
+    # Cosmetic HUD column dividers (hud_dividers plan): grid_col boundaries where
+    # the HUD draws a vertical rule. None/empty -> no dividers emitted.
+    hud_dividers: Any = None
+    mode_hud_labels: Any = None
+    device_banks: Any = None
+    bank_names: Any = None
+    hud_trigger: str = 'controller-nav'
+    # 'momentary' (default) or 'toggle' — how this controller's buttons report a
+    # press (see ButtonBehaviour). Drives the press-once edge guard.
+    button_behaviour: str = 'momentary'
+
+
+class Helpers:
+    def __init__(self, manager, remote, config: 'SurfaceConfig' = None, share=None):
+        """`share` is the surface's shared_hub.SurfaceShare: compiled tables and
+        the bank index come from the process-wide registry instead of being
+        built per surface. None builds them privately."""
+        if config is None:
+            config = SurfaceConfig()
+        self._manager = manager
+        self._remote = remote
+        # Generated surfaces bake hud_cells as plain tuples (see gen.py boundary);
+        # re-wrap them as LayoutCells so the rest of the runtime gets named access.
+        hud_cells = [LayoutCell.from_raw(c) for c in (config.hud_cells or [])]
+        slot_assignments = list(config.slot_assignments or [])
+        switch_slot_assignments = list(config.switch_slot_assignments or [])
+        device_banks, bank_names = config.device_banks, config.bank_names
+        if share is not None and (device_banks is None or bank_names is None):
+            shipped_banks, shipped_names = share.banks()
+            device_banks = device_banks if device_banks is not None else shipped_banks
+            bank_names = bank_names if bank_names is not None else shipped_names
+        device_banks = device_banks if device_banks is not None else _default_device_banks()
+        bank_names = bank_names if bank_names is not None else _default_bank_names()
+        # 16-slot controllers pack two 8-param banks per page; 8-slot pack one.
+        banks_per_page = 2 if config.encoder_slot_count >= 16 else 1
+        # Number of distinct physical button switches: max switch slot number from
+        # assignments. Used as the per-page stride when paging BOB buttons for
+        # known devices.
+        button_switch_count = (
+            max((slot for _, slot in switch_slot_assignments), default=0)
+            if switch_slot_assignments else 0
+        )
+        # Pure parameter-resolution + paging math lives in ParameterResolver
+        # (no Live coupling); HUD burst assembly + show/hide intent live in
+        # HudPresenter (no Live writes). The Live-coupled writes/listeners/
+        # messages stay here on the facade.
+        self._resolver = ParameterResolver(
+            device_table=(share.device_table(config.parameter_mappings_raw) if share is not None
+                          else _build_device_table(config.parameter_mappings_raw)),
+            device_banks=device_banks, bank_names=bank_names,
+            banks_per_page=banks_per_page, button_switch_count=button_switch_count,
+            button_slot_count=config.button_slot_count, log=self.log_message,
+            smart_zoning=config.smart_zoning,
+            zone_tables=(share.zone_tables(config.zone_tables_raw) if share is not None
+                         else _build_zone_tables(config.zone_tables_raw)))
+        self._presenter = HudPresenter(
+            remote=remote, resolver=self._resolver,
+            slot_assignments=slot_assignments,
+            switch_slot_assignments=switch_slot_assignments,
+            slot_assignments_by_mode=config.slot_assignments_by_mode,
+            switch_slot_assignments_by_mode=config.switch_slot_assignments_by_mode,
+            hud_cells=hud_cells,
+            mode_hud_labels=config.mode_hud_labels or {},
+            log=self.log_message, hud_trigger=config.hud_trigger,
+            fine=self.fine)
+        # Input-driven auto-hide is a summon-only behaviour: the HUD sticky-hides
+        # on any mac mouse/keyboard input in Ableton (hud-input-autohide-plan).
+        # Set before init_layout so the flag rides the initial LAYOUT emission.
+        self._remote.set_autohide_on_input(config.hud_trigger == 'summon')
+        self._remote.init_layout(hud_cells, config.hud_dividers)
+        self._last_selected_device = None
+        self._group_selector_listeners = []  # [(param, callback)] for teardown
+        # Named-target lookups (find_track/find_device_on_track), listener-kept.
+        self._names = NameIndex()
+        self._button_behaviour = config.button_behaviour
+        self._pager_preview_mode = config.pager_preview_mode
+        # Button diagnostics, both off until their update.py command enables them.
+        self._doctor = Doctor(log=self.log_message, assumed_behaviour=config.button_behaviour)
+        self._show_info = ShowInfo(
+            send_event=lambda kind, idx, text: self._remote._hud_client.send_event(kind, idx, text),
+            log=self.log_message)
+
+    def should_act_on_edge(self, value):
+        """Whether this raw MIDI button edge is a distinct *press* that should act
+        once. Parameterised on the controller's hardware button mode so a
+        press-once button works on both:
+
+        - 'toggle' hardware sends one alternating on/off event per press, so
+          *every* edge is its own press → always act.
+        - 'momentary' hardware sends on-then-0 per press, so only the non-zero
+          down is a press; the 0 release is suppressed.
+
+        Continuous knobs/sliders never call this (they are not press-once)."""
+        if self._button_behaviour == 'toggle':
+            return True
+        return value != 0
+
+    def button_event(self, fn_name, value, wire_idx=-1):
+        """Single chokepoint every generated *button* listener calls (continuous
+        knobs/sliders do not). Fans out to the diagnostics that care about raw
+        button edges: the hardware doctor and HUD show-info."""
+        self._doctor.observe(fn_name, value)
+        self._show_info.notify(fn_name, value, wire_idx)
+
+    def doctor_toggle(self):
+        """Toggle doctor mode; when turning off, emit the classification report."""
+        was_enabled = self._doctor.enabled
+        self._doctor.toggle()
+        if was_enabled:
+            self._doctor.report()
+        return self._doctor.enabled
+
+    def show_info_toggle(self):
+        """Toggle HUD show-info mode (edge-annotated button feedback)."""
+        return self._show_info.toggle()
+
+    def show_message(self, message):
+        self._manager.show_message(message)
+
+    def log_message(self, message):
+        self._manager.log_message(message)
+
+    def fine(self, message):
+        """Gated protocol-trace channel.
+        Silent unless the surface's `manager.fine` flag is on; every line is
+        `[hudtrace]`-tagged so a captured trace is greppable in tail_logs.sh.
+        Threaded into HudPresenter/HudVisibility the same way `log_message` is."""
+        if getattr(self._manager, 'fine', False):
+            self._manager.log_message(f"[hudtrace] {message}")
+
+    def selected_device_changed(self, device, source='selection'):
+        # Both device_nav_* and on_device_selected pass through here, and the
+        # same-device guard below is where a nav-call-vs-listener-fire race
+        # gets decided (see the [hudtrace] lines in device_nav_* / on_device_selected
+        # for the ordering evidence). Trace device + source + whether the guard
+        # short-circuited so a captured HIDE can be attributed to its cause.
+        dev_name = _safe_device_attr(device, 'name')
+        # Fail-OPEN same-device guard: short-circuit only when the previous
+        # device is a *live* handle equal to the new one. A dead previous handle
+        # (device was replaced out from under us) is treated as changed so the
+        # funnel proceeds and re-bursts — otherwise a stale dead reference makes
+        # this guard short-circuit forever and the HUD never recovers.
+        if device is None:
+            # Track-nav landed on a device-less track (empty / return / master /
+            # fresh). There is nothing to resolve, but the focus-loss must still
+            # reach the visibility table so a summoned HUD hides instead of
+            # freezing on the previous track's device (hud-hide-on-empty-track).
+            # Leave _last_selected_device untouched: nav-back to the original
+            # track then short-circuits on the same-device guard below (stays
+            # hidden = summon semantics).
+            self.fine(
+                f"[funnel] selected_device_changed device=None source={source} "
+                f"guard=short-circuit (none) -> on_device_focus_lost"
+            )
+            self._presenter.on_device_focus_lost(source)
+            return
+        if _same_device(device, self._last_selected_device):
+            self.fine(
+                f"[funnel] selected_device_changed device={dev_name!r} source={source} "
+                f"guard=short-circuit (same-device)"
+            )
+            return
+        # A freshly-read selection is normally a live handle, but during a
+        # device delete/replace Live can momentarily hand back a freed one.
+        # Reading class_name/params below or attaching group listeners would
+        # then raise ArgumentError, so drop it (don't pin a dead reference); the
+        # settled devices/appointed listener re-fires with a live device.
+        if not _device_alive(device):
+            self.fine(
+                f"[funnel] selected_device_changed device=<dead> source={source} "
+                f"guard=short-circuit (dead-new-device)"
+            )
+            return
+        self.fine(
+            f"[funnel] selected_device_changed device={dev_name!r} source={source} "
+            f"guard=pass prev={_safe_device_attr(self._last_selected_device, 'name')!r}"
+        )
+        self._teardown_group_selector_listeners()
+        self._last_selected_device = device
+        # Reset the resolver's per-device state (name indices + paging) before
+        # re-attaching group-selector listeners, which resolve against the fresh
+        # index. ensure_focused records the device so the burst-side guard in
+        # emit_burst is a no-op on this same-device path.
+        self._resolver.ensure_focused(device)
+        self._attach_group_selector_listeners(device)
+        self._log_device_focus(device)
+        # show-hud-on gating lives in the HudVisibility table: in
+        # 'controller-nav' mode only an explicit nav action shows the HUD; a
+        # selection-poll change still remaps encoders + pushes OSC but the HUD
+        # burst is suppressed (and HIDE sent). 'selection' mode never suppresses.
+        self._presenter.on_device_focus(device, source)
+        if self._resolver.has_user_defined_parameters(device):
+            self.show_message(f"{device.class_name}")
+
+    def _log_device_focus(self, device):
+        """Single line at focus-change summarising what the runtime will and
+        won't do for this device: BOB match? Standard banks? M4L collision?
+        Reading this in tail_logs.sh tells you in one glance which branch of
+        the resolver every subsequent knob/button event will hit."""
+        cn = getattr(device, 'class_name', '?')
+        dn = getattr(device, 'name', '?')
+        key = _device_table_key(device)
+        bob = self._resolver.device_entry(device) is not None
+        banks = self._resolver.standard_banks(device)
+        bank_count = len(banks) if banks else 0
+        nparams = len(getattr(device, 'parameters', []) or [])
+        is_m4l = cn in M4L_CLASSES
+        m4l_note = ''
+        if is_m4l and not bob:
+            # List the M4L deviceNames present in the JSON for the same class
+            # so a missing entry is obvious from the log alone.
+            siblings = [k[1] for k in self._resolver.device_table.keys() if k[0] == cn]
+            m4l_note = f" m4l_no_match available_deviceNames={siblings}"
+        self.log_message(
+            f"[focus] class={cn!r} name={dn!r} params={nparams} "
+            f"bob={'yes' if bob else 'no'} key={key} "
+            f"std_banks={bank_count}{m4l_note}"
+        )
+
+    def _attach_group_selector_listeners(self, device):
+        for name in self._resolver.group_selector_names(device):
+            selector = self._resolver.resolve_param_by_name(device, name)
+            if selector is None or not hasattr(selector, 'add_value_listener'):
+                continue
+            cb = self._on_group_selector_changed
+            try:
+                selector.add_value_listener(cb)
+                self._group_selector_listeners.append((selector, cb))
+            except Exception as ex:
+                self.log_message(f"[group] failed to attach listener on {name}: {ex}")
+
+    def _teardown_group_selector_listeners(self):
+        for selector, cb in self._group_selector_listeners:
+            try:
+                selector.remove_value_listener(cb)
+            except Exception:
+                pass
+        self._group_selector_listeners = []
+
+    def _on_group_selector_changed(self):
+        if self._last_selected_device is not None:
+            self.update_remote_parameters()
+
+    def device_parameter_action(self, device, raw_parameter_no, midi_no, value, fn_name, toggle=False):
+        if device is None:
+            return
+        t0 = perf_counter()
+        try:
+            self.selected_device_changed(device)
+            t_resolve = perf_counter()
+            rp = self._resolver.resolve_encoder(device, raw_parameter_no)
+            STATS.record('resolve', t_resolve)
+            if rp is None:
+                self.log_message(f"{fn_name}: encoder {raw_parameter_no} not resolvable on {device.class_name}")
+                return
+            parameter = rp.param
+            # For a latching button (toggle=True) act once per *press*; the edge
+            # guard handles momentary vs toggle hardware. Continuous knobs
+            # (toggle=False) always apply.
+            will_fire = not toggle or self.should_act_on_edge(value)
+            if toggle:
+                next_value = parameter.max if parameter.value == parameter.min else parameter.min
+            else:
+                next_value = self.normalise(value, parameter.min, parameter.max)
+            if will_fire:
+                parameter.value = next_value
+                self._remote.parameter_updated(rp, raw_parameter_no)
+        finally:
+            # Every event, resolved or not, so the histogram isn't biased
+            # towards the ones that reached a parameter.
+            STATS.record('param_event', t0)
+
+    def switch_slot_action(self, device, slot, value, fn_name):
+        """`slot` is a 1-based device switch-slot index (int)."""
+        self.log_message(f"[switch] enter fn={fn_name} slot={slot} value={value} device={getattr(device,'class_name','None')}")
+        if device is None:
+            return
+        self.selected_device_changed(device)
+        switch_idx = slot - 1
+        info = self._resolver.resolve_switch(device, switch_idx)
+        if info is None:
+            self.log_message(f"[switch] {slot} not resolvable on {device.class_name}")
+            return
+        kind = info.get('kind', 'param')
+        if kind == 'enum':
+            self._cycle_enum_property(info['device'], info['prop'])
+            self.update_remote_parameters()
+            return
+        if kind == 'bool':
+            self._toggle_bool_property(info['device'], info['prop'])
+            self.update_remote_parameters()
+            return
+        if kind == 'function':
+            self._call_device_function(info['device'], info['fn'])
+            return
+        p = info['param']
+        before = p.value
+        is_q = getattr(p, 'is_quantized', False)
+        self.log_message(f"[switch] resolved d_idx={info['d_idx']} alias={info.get('alias')} has_range={info['has_range']} json_min={info.get('min')} json_max={info.get('max')} min_max={info.get('min_max')} param.min={p.min} param.max={p.max} param.value={before} is_quantized={is_q}")
+        if info.get('min_max'):
+            steps = None
+            if is_q:
+                try:
+                    steps = int(round(p.max)) - int(round(p.min)) + 1
+                except (TypeError, ValueError):
+                    steps = None
+            if is_q and steps != 2:
+                self.log_message(f"[switch] min_max requested on quantized param {info.get('alias')} with steps={steps} — skipping")
+                return
+            p.value = p.min
+            p.value = p.max
+            self.log_message(f"[switch] applied mode=min_max before={before} after={p.value}")
+            return
+        if info['has_range']:
+            self._cycle(p, info['min'], info['max'])
+            mode = "cycle(json)"
+        elif is_q:
+            try:
+                self._cycle(p, int(p.min), int(p.max))
+                mode = "cycle(param)"
+            except (TypeError, ValueError):
+                self._pulse(p)
+                mode = "pulse(fallback)"
+        else:
+            self._pulse(p)
+            mode = "pulse"
+        self.log_message(f"[switch] applied mode={mode} before={before} after={p.value}")
+
+    def _cycle_enum_property(self, device, prop):
+        try:
+            current = getattr(device, prop)
+            members = self._resolver.enum_members(current, device, prop)
+            if not members:
+                self.log_message(f"[enum] no members discovered for {prop} on {device.class_name}")
+                return
+            idx = self._resolver.enum_index_of(members, current)
+            nxt = members[(idx + 1) % len(members)]
+            try:
+                setattr(device, prop, nxt)
+            except Exception:
+                try:
+                    setattr(device, prop, int(nxt))
+                except Exception:
+                    raise
+            self.log_message(f"[enum] {device.class_name}.{prop}: {current} -> {nxt}")
+        except Exception as ex:
+            self.log_message(f"[enum] failed to cycle {prop} on {getattr(device,'class_name','?')}: {ex}")
+
+    def _toggle_bool_property(self, device, prop):
+        try:
+            current = getattr(device, prop)
+            setattr(device, prop, not current)
+            self.log_message(f"[bool] {device.class_name}.{prop}: {current} -> {not current}")
+        except Exception as ex:
+            self.log_message(f"[bool] failed to toggle {prop} on {getattr(device,'class_name','?')}: {ex}")
+
+    def _call_device_function(self, device, fn_name):
+        try:
+            fn = getattr(device, fn_name, None)
+            if fn is None or not callable(fn):
+                self.log_message(f"[fn] {device.class_name} has no callable {fn_name}")
+                return
+            fn()
+            self.log_message(f"[fn] called {device.class_name}.{fn_name}()")
+        except Exception as ex:
+            self.log_message(f"[fn] failed to call {fn_name} on {getattr(device,'class_name','?')}: {ex}")
+
+    def _cycle(self, parameter, cmin, cmax):
+        steps = cmax - cmin + 1
+        if steps < 2:
+            return
+        try:
+            current = int(round(parameter.value))
+        except (TypeError, ValueError):
+            current = cmin
+        parameter.value = cmin + ((current - cmin + 1) % steps)
+
+    def _pulse(self, parameter):
+        parameter.value = parameter.max
+
+    def parameter_page_inc(self, target):
+        device = self._last_selected_device
+        if device is None:
+            self.log_message(f"[page] inc target={target} ignored: no focused device")
+            return
+        if target == 'encoder':
+            enc_count = self._resolver.encoder_pages_count(device)
+            btn_count = self._resolver.button_pages_count(device)
+            changed = False
+            if self._resolver.encoder_page < enc_count:
+                self._resolver.encoder_page += 1
+                changed = True
+            if self._resolver.button_page < btn_count:
+                self._resolver.button_page += 1
+                changed = True
+            self.log_message(
+                f"[page] inc enc enc={self._resolver.encoder_page}/{enc_count} "
+                f"btn={self._resolver.button_page}/{btn_count} changed={changed} "
+                f"class={getattr(device,'class_name','?')}"
+            )
+            if changed:
+                self.show_message(f"Enc page {self._resolver.encoder_page}/{enc_count}")
+                self.update_remote_parameters(preview_mode_name=self._pager_preview_mode)
+        else:
+            count = self._resolver.button_pages_count(device)
+            changed = self._resolver.button_page < count
+            if changed:
+                self._resolver.button_page += 1
+                self.show_message(f"Btn page {self._resolver.button_page}/{count}")
+                self.update_remote_parameters(preview_mode_name=self._pager_preview_mode)
+            self.log_message(
+                f"[page] inc btn btn={self._resolver.button_page}/{count} changed={changed} "
+                f"class={getattr(device,'class_name','?')}"
+            )
+
+    def parameter_page_dec(self, target):
+        device = self._last_selected_device
+        if device is None:
+            self.log_message(f"[page] dec target={target} ignored: no focused device")
+            return
+        if target == 'encoder':
+            enc_count = self._resolver.encoder_pages_count(device)
+            btn_count = self._resolver.button_pages_count(device)
+            changed = False
+            if self._resolver.encoder_page > 1:
+                self._resolver.encoder_page -= 1
+                changed = True
+            if self._resolver.button_page > 1:
+                self._resolver.button_page -= 1
+                changed = True
+            self.log_message(
+                f"[page] dec enc enc={self._resolver.encoder_page}/{enc_count} "
+                f"btn={self._resolver.button_page}/{btn_count} changed={changed} "
+                f"class={getattr(device,'class_name','?')}"
+            )
+            if changed:
+                self.show_message(f"Enc page {self._resolver.encoder_page}/{enc_count}")
+                self.update_remote_parameters(preview_mode_name=self._pager_preview_mode)
+        else:
+            count = self._resolver.button_pages_count(device)
+            changed = self._resolver.button_page > 1
+            if changed:
+                self._resolver.button_page -= 1
+                self.show_message(f"Btn page {self._resolver.button_page}/{count}")
+                self.update_remote_parameters(preview_mode_name=self._pager_preview_mode)
+            self.log_message(
+                f"[page] dec btn btn={self._resolver.button_page}/{count} changed={changed} "
+                f"class={getattr(device,'class_name','?')}"
+            )
+
+    def update_remote_parameters(self, suppress_hud=False, preview_mode_name=None):
+        # Burst assembly lives in HudPresenter; Helpers owns the focused device.
+        # preview_mode_name (parameter-pager only) previews a base mode's device
+        # page while staying in the current mode; the presenter no-ops it when it
+        # equals the active mode.
+        self._presenter.emit_burst(self._last_selected_device, suppress_hud=suppress_hud,
+                                   preview_mode_name=preview_mode_name)
+
+    def burst_cache_stats(self):
+        return self._presenter.burst_cache_stats()
+
+    def reset_burst_cache_stats(self):
+        self._presenter.reset_burst_cache_stats()
+
+    def reemit_combined_burst(self):
+        """Compositor hook (lc_parks): re-emit the combined burst for the
+        current device with the parks region appended -- from the cached
+        primary burst when there is one. See HudPresenter.reemit_combined_burst."""
+        self._presenter.reemit_combined_burst(self._last_selected_device)
+
+    def refresh_hud_for_mode(self, mode_name, device):
+        """Called by the surface when goto_mode swaps bindings. Sets the active
+        overlay and re-emits a burst so the HUD reflects the new labels."""
+        # A bare assignment is safe for the reported index/paging staleness:
+        # refresh_for_mode -> emit_current_burst -> emit_burst runs the resolver's
+        # ensure_focused guard, which resets a stale index/page for a changed
+        # device. (Residual: on a mode+device change together this skips
+        # group-selector listener re-attach until the next real selection —
+        # tracked as a follow-up, not part of the reported bug.)
+        if device is not None:
+            self._last_selected_device = device
+        self._presenter.refresh_for_mode(mode_name, self._last_selected_device)
+
+    def toggle_hud(self):
+        """Bound to a `functions: hud_toggle` button. Flips the HUD between
+        hidden and shown."""
+        self._presenter.toggle(self._last_selected_device)
+
+    def hud_view_left(self):
+        """The generated surface's app-view listeners (doc-view switch, browser
+        opened, detail hidden) forward here. Routes through the HudVisibility
+        table so the dismiss mirror stays in sync with the Swift sticky flag."""
+        self._presenter.view_left()
+
+    def hud_clip_view_changed(self, visible):
+        """The generated surface's Detail/Clip visibility listener forwards both
+        directions here. Entering clip view hides the HUD and gates bursts;
+        leaving clears the gate without re-showing (hud-summon-only-plan)."""
+        self._presenter.clip_view_changed(visible)
+
+    def value_is_max(self, value, max):
+        return value == max
+
+    def normalise(self, midi_value, min_value, max_value):
+        if min_value == max_value:
+            return min_value
+        normalized_value = midi_value / 127.0
+        mapped_value = min_value + normalized_value * (max_value - min_value)
+        return max(min_value, min(mapped_value, max_value))
+
+    def find_device(self, song, track_name, device_name):
+        track = self.find_track(song, track_name)
+        if track is not None:
+            return self.find_device_on_track(track, device_name)
+        return None
+
+    def find_track(self, song, track_name):
+        if track_name == "selected":
+            return song.view.selected_track
+        elif track_name == "master":
+            return song.master_track
+        elif track_name.isnumeric():
+            return song.tracks[int(track_name) - 1]
+        return self._names.track(self._manager.song(), track_name)
+
+    def find_device_on_track(self, track, device_name):
+        if device_name == "selected":
+            return track.view.selected_device
+        elif device_name.isnumeric():
+            return track.devices[int(device_name) - 1]
+        return self._names.device(track, device_name)
+
+    def disconnect(self):
+        """Detach the name-index listeners (surface disconnect)."""
+        self._names.release()
+
+
+class Remote:
+    def __init__(self, manager, osc_client, hud_client=None, feedback_sinks=None, update_coalescer=None):
+        self._manager = manager
+        self._osc_client = osc_client
+        self._hud_client = hud_client if hud_client is not None else NullHudClient()
+        # Live (knob-turn) updates go through the coalescer, which keeps only the
+        # latest value per slot and flushes once per tick. The default is the
+        # pass-through NullUpdateCoalescer: every update is sent immediately.
+        self._updates = (update_coalescer if update_coalescer is not None
+                         else NullUpdateCoalescer(self._hud_client, self._osc_client))
+        # Generic feedback sinks (e.g. Ec4Client) driven off the same burst as
+        # the HUD. The HUD keeps its own bespoke wire protocol; these consume
+        # the dense dial/button payloads.
+        self._feedback_sinks = list(feedback_sinks) if feedback_sinks else []
+        # ...and the subset that also follows live value changes between bursts
+        # (GridLedClient.on_update). Sinks rate-limit themselves.
+        self._update_sinks = [s for s in self._feedback_sinks if hasattr(s, 'on_update')]
+        self._in_burst = False  # suppresses UPDATE during device_update burst
+        # Controller layout (HUD LAYOUT cells). Stored so every burst can re-emit
+        # it: LAYOUT is otherwise a one-shot at surface init, and if the HUD app
+        # starts/restarts AFTER the surface, it misses that single LAYOUT and
+        # renders an empty grid. Re-emitting at the head of each burst makes the
+        # HUD/Ableton startup order irrelevant.
+        self._hud_cells = []
+        # Cosmetic HUD column dividers (hud_dividers plan). Re-emitted with LAYOUT
+        # each burst for the same restart-resilience reason. Empty -> no DIVIDERS
+        # line, so non-divider surfaces are byte-identical on the wire.
+        self._hud_dividers = []
+        # Input-driven auto-hide flag (hud-input-autohide-plan). Summon surfaces
+        # set this True; re-emitted with LAYOUT each burst for the same
+        # restart-resilience reason (a HUD that started late learns it).
+        self._hud_autohide = False
+        # Optional secondary-region cache (lc_parks compositor). When set, its
+        # cached dial/button payloads are appended to the HUD burst so the parks
+        # region rides along in the single combined stream.
+        self._region_state = None
+        # Compositor only: the last primary burst (dials/buttons as lists) and
+        # each dial's position in it by wire index. A secondary-region COMMIT
+        # re-sends this plus the new region (`reemit_region_burst`) instead of
+        # re-resolving the primary's device; live dial UPDATEs patch it so it
+        # never lags what the HUD shows.
+        self._region_base = None
+        self._region_base_dial_pos = {}
+        # ... and its slots as encoded SLOT lines (dials first, so a dial's
+        # position is the same in both), built on first use.
+        self._region_base_lines = None
+        # HUD-owner election result (HudArbiter). A non-owner's HUD datagrams
+        # would only be discarded by the disabled HudClient, so it skips HUD
+        # assembly altogether; OSC and feedback sinks are unaffected.
+        self._hud_owner = True
+        self.reset_hud_stats()
+
+    def reset_hud_stats(self):
+        # bursts_assembled -- bursts whose HUD lines were built
+        # bursts_skipped   -- bursts whose HUD lines were skipped (non-owner)
+        # updates_skipped  -- live HUD UPDATEs not built (non-owner)
+        # region_reemits   -- combined bursts re-sent from the cached primary
+        self.bursts_assembled = 0
+        self.bursts_skipped = 0
+        self.updates_skipped = 0
+        self.region_reemits = 0
+
+    def hud_stats(self):
+        return {
+            'owner': self._hud_owner,
+            'bursts_assembled': self.bursts_assembled,
+            'bursts_skipped': self.bursts_skipped,
+            'updates_skipped': self.updates_skipped,
+            'region_reemits': self.region_reemits,
+        }
+
+    @property
+    def hud_owner(self):
+        return self._hud_owner
+
+    def set_hud_owner(self, flag):
+        """Apply a HUD-owner election. Gates the HudClient exactly as before
+        (silent on the wire, including HIDE) and, as a non-owner, also stops
+        building the HUD side of bursts and live updates."""
+        self._hud_owner = bool(flag)
+        self._hud_client.set_enabled(self._hud_owner)
+        if not self._hud_owner:
+            self._updates.discard_hud()
+
+    def set_region_state(self, region_state):
+        self._region_state = region_state
+
+    def refresh_feedback(self):
+        """Ask feedback sinks that diff against what they last wrote (Ec4Client)
+        to rewrite everything: after a controller reconnect their shadow of the
+        hardware's state can no longer be trusted."""
+        for sink in self._feedback_sinks:
+            refresh = getattr(sink, 'refresh', None)
+            if refresh is None:
+                continue
+            try:
+                refresh()
+            except Exception as e:
+                logger.error(f"feedback sink {type(sink).__name__} refresh failed: {e}")
+
+    def set_autohide_on_input(self, enabled):
+        """Record + emit the input-driven auto-hide flag (summon surfaces only).
+        Stored so every burst re-emits it (restart-resilient), and sent once now
+        for the common case where the HUD is already up."""
+        self._hud_autohide = bool(enabled)
+        self._hud_client.send_autohide(self._hud_autohide)
+
+    def init_layout(self, cells, dividers=None):
+        # Remember the layout so every burst can re-emit it (restart-resilient),
+        # and send it once now for the common case where the HUD is already up.
+        self._hud_cells = [LayoutCell.from_raw(c) for c in cells] if cells else []
+        self._hud_dividers = list(dividers) if dividers else []
+        if self._hud_cells:
+            self._hud_client.send_layout(self._hud_cells)
+        if self._hud_dividers:
+            self._hud_client.send_dividers(self._hud_dividers)
+        self._hud_client.send_autohide(self._hud_autohide)
+
+    def resend_layout(self):
+        """Re-emit the stored LAYOUT without re-deriving it. Public entry point
+        for re-handshake callers (HELLO command, HudArbiter on election) that
+        need the layout Remote already holds -- they must not reach into
+        Remote's private `_hud_cells` themselves."""
+        if self._hud_cells:
+            self._hud_client.send_layout(self._hud_cells)
+        if self._hud_dividers:
+            self._hud_client.send_dividers(self._hud_dividers)
+        self._hud_client.send_autohide(self._hud_autohide)
+
+    def negotiate(self, hello_line):
+        """HELLO from a (re)started HUD. Adopt the optional wire features it
+        announced (e.g. delta bursts) and drop any delta shadow, so the burst
+        the HELLO handler sends next is a full keyframe."""
+        self._hud_client.negotiate(parse_hello(hello_line))
+
+    def hide(self):
+        """Sticky-dismiss the HUD (HIDE). Stays hidden until the next burst."""
+        # A pending UPDATE flushed after HIDE would patch stale slots; drop it.
+        self._updates.discard_hud()
+        self._hud_client.send_hide()
+
+    def send_toggle(self):
+        """Emit a TOGGLE marker (hud_toggle press). Must be sent immediately
+        before the fresh burst so the HUD arms its show-vs-hide arbitration
+        against its pre-burst visibility."""
+        self._hud_client.send_toggle()
+
+    def seconds_since_last_hud_send(self):
+        """Seconds since any datagram (burst/UPDATE/PING) last left for the HUD,
+        or None if nothing has been sent. HudPresenter reads this to detect a
+        Swift idle-dismiss so hud_toggle re-shows on a single press."""
+        return self._hud_client.seconds_since_last_send()
+
+    #TODO unit tests datatypes sent
+    def parameter_updated(self, real_param, parameter_no):
+        if self._in_burst:
+            # Burst fill: timed as part of the burst, not as a live update.
+            self._parameter_updated(real_param, parameter_no)
+            return
+        t0 = perf_counter()
+        self._parameter_updated(real_param, parameter_no)
+        STATS.record('param_update', t0)
+
+    def _parameter_updated(self, real_param, parameter_no):
+        param = real_param.param
+        fields = _safe_param_fields(param, real_param.alias)
+        if fields is None:
+            # Dead Live handle — skip this slot loudly rather than abort the burst.
+            try:
+                self._manager.log_message(
+                    f"[deadparam] skipped parameter_no={parameter_no}: unreadable Live handle")
+            except Exception:
+                logger.error(f"[deadparam] skipped parameter_no={parameter_no}")
+            return
+        name, value, pmin, pmax = fields
+        osc_args = [parameter_no, value, name, pmin, pmax, real_param.button]
+        if self._in_burst:
+            # Burst fill: sent directly, in order between the burst's
+            # `/selected-device/name` and `parameter-update-complete`.
+            self._osc_client.send_message(f"/selected-device/parameter-update", osc_args)
+            return
+        self._updates.send_parameter_update(parameter_no, osc_args)
+        # Live HUD update — skip on/off (index 0)
+        if parameter_no > 0:
+            if self._region_base is not None:
+                pos = self._region_base_dial_pos.get(parameter_no - 1)
+                if pos is not None:
+                    self._region_base.dials[pos] = (
+                        parameter_no - 1, SlotPayload(name, value, pmin, pmax))
+                    if self._region_base_lines is not None:
+                        self._region_base_lines[pos] = encode_slot(
+                            'dial', parameter_no - 1, name, value, pmin, pmax)
+            if self._update_sinks:
+                self._update_feedback_sinks(parameter_no - 1, SlotPayload(name, value, pmin, pmax))
+            if not self._hud_owner:
+                self.updates_skipped += 1
+                return
+            self._updates.send_update('dial', parameter_no - 1, name, value, pmin, pmax)
+
+    def _update_feedback_sinks(self, index, payload):
+        for sink in self._update_sinks:
+            try:
+                sink.on_update('dial', index, payload)
+            except Exception as e:
+                logger.error(f"feedback sink {type(sink).__name__} update failed: {e}")
+
+    def reemit_region_burst(self, suppress_hud=False):
+        """Compositor hook: the secondary region changed. Re-send the cached
+        primary burst with the region's current slots appended -- no resolver
+        or Live reads, and no OSC/feedback-sink traffic (nothing on the primary
+        changed). With delta bursts negotiated the HudClient turns this into a
+        delta carrying just the region's changed slots.
+
+        False when there is no cached primary burst; the caller then falls back
+        to a full device burst."""
+        base = self._region_base
+        if base is None:
+            return False
+        self.region_reemits += 1
+        self.refresh_burst(replace(base, suppress_hud=suppress_hud), region_only=True)
+        return True
+
+    def _remember_region_base(self, snapshot):
+        dials = list(snapshot.dials)
+        self._region_base = replace(snapshot, dials=dials, buttons=list(snapshot.buttons))
+        self._region_base_dial_pos = {idx: i for i, (idx, _p) in enumerate(dials)}
+        self._region_base_lines = None
+        return self._region_base
+
+    def _send_region_burst_slots(self):
+        """Compositor burst body: the cached primary lines, then every
+        region's (each re-encoded only if that region changed). Returns the
+        slot count for COMMIT."""
+        lines = self._region_base_lines
+        if lines is None:
+            base = self._region_base
+            lines = [encode_slot_payload('dial', i, p) for i, p in base.dials]
+            lines += [encode_slot_payload('button', i, p) for i, p in base.buttons]
+            self._region_base_lines = lines
+        region_lines = self._region_state.slot_lines()
+        self._hud_client.send_lines(lines)
+        self._hud_client.send_lines(region_lines)
+        return len(lines) + len(region_lines)
+
+    def refresh_burst(self, snapshot: BurstSnapshot, region_only=False):
+        """Generic dense burst. `snapshot.dials` / `snapshot.buttons` are
+        iterables of (wire_idx, SlotPayload). Caller is responsible for filling
+        empty slots with hud_protocol.EMPTY_SLOT — the wire is sender-dense.
+
+        snapshot.page is a PageInfo, or None to emit no PAGE line.
+
+        snapshot.suppress_hud skips the HUD wire (show-hud-on='controller-nav'
+        on a non-nav selection change). Feedback sinks (EC4 readouts) still fire
+        — they reflect device state regardless of the HUD trigger. A surface
+        that isn't the elected HUD owner skips the HUD wire the same way.
+
+        region_only marks a `reemit_region_burst` re-send: the snapshot is the
+        cached primary burst, so it is neither re-cached nor fanned out to the
+        feedback sinks again."""
+        t0 = perf_counter()
+        if self._region_state is not None and not region_only:
+            snapshot = self._remember_region_base(snapshot)
+        self._in_burst = True
+        # The burst repaints every slot from live values; a pending UPDATE
+        # flushed after it could only re-apply an older value.
+        self._updates.discard_hud()
+        # Buffer the whole burst into one datagram so it lands atomically: a
+        # dropped datagram loses the entire burst (HUD stays on the last good
+        # device) rather than dropping a lone DEVICE frame and publishing the new
+        # device's slots under the previous device's name. See
+        # hud-burst-datagram-atomicity-plan.
+        self._hud_client.begin_burst()
+        try:
+            if not self._hud_owner:
+                self.bursts_skipped += 1
+            elif not snapshot.suppress_hud:
+                self.bursts_assembled += 1
+                # Re-emit LAYOUT at the head of the burst so a HUD that started
+                # after the surface (and missed the one-shot init LAYOUT) still
+                # gets a grid. The receiver stores it in pendingCells and
+                # publishes on COMMIT; DEVICE clears pending slots but not cells.
+                if self._hud_cells:
+                    self._hud_client.send_layout(self._hud_cells)
+                if self._hud_dividers:
+                    self._hud_client.send_dividers(self._hud_dividers)
+                self._hud_client.send_autohide(self._hud_autohide)
+                self._hud_client.send_device(snapshot.device_name)
+                if snapshot.page is not None:
+                    p = snapshot.page
+                    self._hud_client.send_page_info(
+                        p.enc_page, p.enc_total, p.btn_page, p.btn_total,
+                        p.enc_label, p.btn_label)
+                # Zone tints, keyed by wire index. Emitted every (non-suppressed)
+                # burst — empty for a non-zoned device, which clears any previous
+                # synth's tint (same stale-state care as HIDE).
+                self._hud_client.send_zones(snapshot.zone_colors)
+                if self._region_state is not None:
+                    # Compositor (lc_parks): the primary's slots, then the
+                    # secondary regions' cached slots. These carry combined wire
+                    # indices already; sent after the primary's so any
+                    # same-index empty placeholder is overridden on the receiver
+                    # (last-write-wins per index).
+                    count = self._send_region_burst_slots()
+                else:
+                    count = 0
+                    for idx, p in snapshot.dials:
+                        self._hud_client.send_slot('dial', idx, p.name, p.value, p.vmin, p.vmax)
+                        count += 1
+                    for idx, p in snapshot.buttons:
+                        self._hud_client.send_slot('button', idx, p.name, p.value, p.vmin, p.vmax, p.glyph)
+                        count += 1
+                self._hud_client.commit(count)
+            # Fan the whole snapshot out to generic feedback sinks (EC4 readouts, etc.).
+            for sink in (() if region_only else self._feedback_sinks):
+                try:
+                    sink.on_burst(snapshot)
+                except Exception as e:
+                    # Surface log so a sink mismatch is visible in tail_logs.sh
+                    # rather than silently swallowed during a burst.
+                    try:
+                        self._manager.log_message(
+                            f"feedback sink {type(sink).__name__} failed: {e}")
+                    except Exception:
+                        logger.error(f"feedback sink {type(sink).__name__} failed: {e}")
+        finally:
+            self._hud_client.flush_burst()
+            self._in_burst = False
+            STATS.record('burst_wire', t0)
+
+    def device_update(self, device_name, real_parameters, info_text="", switch_entries=None, device_parameters=None, hud_layout=None, mode_labels=None, page: PageInfo = None, suppress_hud=False, dial_zone_colors=None, button_zone_colors=None):
+        # Pending live updates belong to whatever was focused before; both sinks
+        # get a full resend below.
+        self._updates.discard()
+        # OSC targets configured with `bundle: true` collect name .. complete
+        # into one bundle (one datagram, atomic like the HUD burst); the rest
+        # send each message as before.
+        self._osc_client.begin_burst()
+        try:
+            self._device_update(device_name, real_parameters, info_text, switch_entries,
+                                device_parameters, hud_layout, mode_labels, page,
+                                suppress_hud, dial_zone_colors, button_zone_colors)
+        finally:
+            self._osc_client.flush_burst()
+
+    def _device_update(self, device_name, real_parameters, info_text, switch_entries,
+                       device_parameters, hud_layout, mode_labels, page, suppress_hud,
+                       dial_zone_colors, button_zone_colors):
+        self._osc_client.send_message(f"/selected-device/name", [f"{device_name} [{info_text}]"])
+
+        # HUD burst: suppress live UPDATE calls while we build the full snapshot.
+        # `parameter_updated` reads `_in_burst`, so we set it before the loop.
+        self._in_burst = True
+        try:
+            for i, pm in enumerate(real_parameters):
+                if pm is None:
+                    continue
+                self.parameter_updated(pm, i)
+        finally:
+            self._in_burst = False
+
+        if self._hud_owner or self._feedback_sinks:
+            dial_payloads = self._build_dial_payloads(real_parameters, hud_layout)
+            button_payloads = self._build_button_payloads(switch_entries, device_parameters, hud_layout)
+            if mode_labels:
+                dial_payloads = _overlay_labels(dial_payloads, mode_labels, 'dial')
+                button_payloads = _overlay_labels(button_payloads, mode_labels, 'button')
+            zone_colors = self._build_zone_color_entries(
+                dial_zone_colors, button_zone_colors, hud_layout)
+            self.refresh_burst(BurstSnapshot(
+                device_name, dial_payloads, button_payloads,
+                page=page if page is not None else PageInfo(),
+                suppress_hud=suppress_hud, zone_colors=zone_colors))
+        else:
+            # Non-owner with no feedback sinks: nothing would consume the
+            # payloads, so don't build them. OSC above already went out.
+            self.bursts_skipped += 1
+
+        self._osc_client.send_message(f"/selected-device/parameter-update-complete", [min(len(real_parameters), 16)])
+
+    @staticmethod
+    def _build_dial_payloads(real_parameters, hud_layout):
+        """Dense dial payloads keyed on wire index. real_parameters[0] is
+        Device On (skipped); wire idx N corresponds to real_parameters[N+1]."""
+        payloads = []
+        for cell in map(LayoutCell.from_raw, hud_layout or []):
+            if cell.kind != 'dial' or cell.start < 0:
+                continue
+            count, start = cell.count, cell.start
+            for i in range(count):
+                wire_idx = start + i
+                rp_idx = wire_idx + 1
+                if rp_idx < len(real_parameters):
+                    pm = real_parameters[rp_idx]
+                    if pm is None:
+                        payloads.append((wire_idx, EMPTY_SLOT))
+                        continue
+                    fields = _safe_param_fields(pm.param, pm.alias)
+                    if fields is None:
+                        payloads.append((wire_idx, EMPTY_SLOT))
+                        continue
+                    name, value, vmin, vmax = fields
+                    payloads.append((wire_idx, SlotPayload(name, value, vmin, vmax)))
+                else:
+                    payloads.append((wire_idx, EMPTY_SLOT))
+        return payloads
+
+    @staticmethod
+    def _build_zone_color_entries(dial_zone_colors, button_zone_colors, hud_layout):
+        """Zone tints as [(kind, wire_idx, hex)], aligned to the SLOT wire.
+
+        Dials mirror `_build_dial_payloads` exactly: wire idx W ->
+        real-parameter index W+1, so `dial_zone_colors` (parallel to
+        `real_parameters`, hence None at index 0 = Device On) is indexed the
+        same way — no contiguity assumption. Buttons are keyed by wire index
+        directly (the presenter knows each button's wire_idx). Empty inputs =>
+        no entries => `ZONES|0` clears the tint."""
+        entries = []
+        if dial_zone_colors:
+            for cell in map(LayoutCell.from_raw, hud_layout or []):
+                if cell.kind != 'dial' or cell.start < 0:
+                    continue
+                for i in range(cell.count):
+                    wire_idx = cell.start + i
+                    rp_idx = wire_idx + 1
+                    hexv = dial_zone_colors[rp_idx] if rp_idx < len(dial_zone_colors) else None
+                    if hexv:
+                        entries.append(('dial', wire_idx, hexv))
+        if button_zone_colors:
+            for wire_idx, hexv in sorted(button_zone_colors.items()):
+                if hexv:
+                    entries.append(('button', wire_idx, hexv))
+        return tuple(entries)
+
+    @staticmethod
+    def _build_button_payloads(switch_entries, device_parameters, hud_layout):
+        switch_by_idx = {e.switch_idx: e for e in (switch_entries or [])}
+        payloads = []
+        for cell in map(LayoutCell.from_raw, hud_layout or []):
+            if cell.kind != 'button' or cell.start < 0:
+                continue
+            count, start = cell.count, cell.start
+            for i in range(count):
+                wire_idx = start + i
+                entry = switch_by_idx.get(wire_idx)
+                if entry is not None:
+                    if entry.payload is not None:
+                        payloads.append((wire_idx, entry.payload))
+                        continue
+                    if entry.d_idx is not None and device_parameters:
+                        try:
+                            p = device_parameters[entry.d_idx]
+                        except IndexError:
+                            p = None
+                        if p is not None:
+                            fields = _safe_param_fields(p, entry.alias or None)
+                            if fields is not None:
+                                name, value, vmin, vmax = fields
+                                payloads.append((wire_idx, SlotPayload(name, value, vmin, vmax)))
+                                continue
+                payloads.append((wire_idx, EMPTY_SLOT))
+        return payloads
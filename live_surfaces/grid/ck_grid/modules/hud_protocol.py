@@ -0,0 +1,992 @@
+"""HUD wire protocol — pure encode/decode.
+
+The transport (UDP send) lives in `hud_client.py`. Everything in this module
+is pure: no sockets, no globals, no logging. That makes it cheap to test and
+keeps a single source of truth for the bytes-on-the-wire format.
+
+See `hud_protocol.md` for the spec. Mirrors the Swift `WireProtocol` parser
+in /Users/ck/current/ableton_hud.
+"""
+import struct
+from dataclasses import dataclass
+from typing import List, NamedTuple, Optional, Union
+
+
+# Idle-dismiss window shared with the Swift HUD. When the overlay sees no
+# COMMIT/UPDATE/PING for this many seconds it sticky-dismisses itself (see
+# HUDOverlayManager.armDismissTimer's `withTimeInterval: 7`). The Python side
+# mirrors the same constant so `hud_toggle` can tell, from send activity alone,
+# when the Swift timer has probably fired and re-show on a single press instead
+# of two. Keep the two values in lockstep — see hud_protocol.md.
+IDLE_DISMISS_SECONDS = 7
+
+# Empty-slot sentinel used by senders for any cell position not bound to a
+# real parameter. Receivers render this as a blank slot.
+EMPTY_NAME = ''
+EMPTY_VALUE = 0
+EMPTY_MIN = 0
+EMPTY_MAX = 1
+
+
+class LayoutCell(NamedTuple):
+    """One HUD grid cell on the wire. `section` groups cells into
+    independently-laid-out blocks: a standalone surface emits everything as
+    section 0; the lc_parks compositor tags the secondary controller section 1
+    so the HUD renders it as its own sub-grid to the right of the primary.
+
+    A NamedTuple (not a plain tuple) so producers/consumers get named field
+    access, but it stays tuple-compatible — it unpacks, indexes, compares equal
+    to the matching plain tuple, and `repr()`s into an `eval`-able literal.
+    This is the single source of truth for the LAYOUT cell shape; both the
+    codegen side (`hud_layout`) and the runtime (`helpers`) import it from here,
+    the wire-format owner.
+    """
+    grid_row: int
+    grid_col: int
+    kind: str          # 'dial' or 'button'
+    count: int
+    start: int
+    section: int = 0
+
+    @classmethod
+    def from_raw(cls, c) -> "LayoutCell":
+        """Accept either a LayoutCell or a plain tuple (as baked into generated
+        surfaces at the template boundary) and return a LayoutCell."""
+        return c if isinstance(c, cls) else cls(*c)
+
+
+class SlotAddress(NamedTuple):
+    """A HUD slot's wire address: which array ('dial'|'button') and the index
+    within it. Tuple-compatible, so it interoperates with the `(kind, index)`
+    plain tuples used as label-dict keys and baked into generated surfaces."""
+    kind: str
+    index: int
+
+
+@dataclass(frozen=True)
+class SlotPayload:
+    name: str
+    value: float
+    vmin: float
+    vmax: float
+    # Optional SF Symbol name rendered *inside* a button cell (empty = none).
+    # Non-optional and empty-by-default so the wire never carries "None".
+    glyph: str = ""
+
+
+EMPTY_SLOT = SlotPayload(EMPTY_NAME, EMPTY_VALUE, EMPTY_MIN, EMPTY_MAX)
+
+
+@dataclass(frozen=True)
+class PageInfo:
+    """Encoder/button paging state for a burst. Replaces the old
+    "4-tuple or 6-tuple" page_info that forced arity-sniffing at the callee.
+    The labels carry the standard-bank page name (e.g. "Amplitude / Filter")
+    or "Best of"; empty labels make the wire fall back to the counts-only
+    PAGE form (see encode_page_info)."""
+    enc_page: int = 1
+    enc_total: int = 1
+    btn_page: int = 1
+    btn_total: int = 1
+    enc_label: str = ''
+    btn_label: str = ''
+
+
+@dataclass(frozen=True)
+class BurstSnapshot:
+    """One device-focus burst as data. Bundles what used to be the 14
+    positional params of Remote.device_update / refresh_burst so the burst
+    path has one thing to pass around and feedback sinks have room to grow.
+
+    dials/buttons are sequences of (wire_idx, SlotPayload). page=None means
+    "don't emit a PAGE line" (mixer/transport bursts that have no paging);
+    device bursts always carry a PageInfo."""
+    device_name: str
+    dials: tuple = ()
+    buttons: tuple = ()
+    page: 'PageInfo' = None
+    suppress_hud: bool = False
+    # Zone-colour tints for this burst: sequence of (kind, wire_idx, hex6).
+    # Empty => emit `ZONES|0` (clears any prior tint). See
+    # grid-zone-colour-coding-plan.
+    zone_colors: tuple = ()
+
+
+# ---- encode -----------------------------------------------------------------
+
+# Single-source protocol: the HUD has exactly one sender (a standalone surface,
+# or the `lc_parks` compositor which merges any secondary region itself before
+# emitting). No source/group/order on the wire.
+
+
+def encode_layout(cells: List[LayoutCell]) -> str:
+    parts = [str(len(cells))]
+    for gr, gc, kind, count, start, section in cells:
+        parts += [str(gr), str(gc), kind, str(count), str(start), str(section)]
+    return "LAYOUT|" + "|".join(parts)
+
+
+# `encode_layout` unpacks 6 fields; this assertion guards the LayoutCell shape
+# against silently regrowing/shrinking out of sync with the wire format.
+assert len(LayoutCell._fields) == 6
+
+
+def encode_device(name: str) -> str:
+    return f"DEVICE|{name}"
+
+
+# The optional 8th `glyph` field is appended only when non-empty, so the common
+# no-glyph slot stays the historical 7-field shape (existing golden tests and
+# any older HUD keep parsing it). Receivers accept 7 or 8 fields.
+def encode_slot(kind: str, index: int, name: str, value, vmin, vmax, glyph: str = "") -> str:
+    base = f"SLOT|{kind}|{index}|{name}|{value}|{vmin}|{vmax}"
+    return f"{base}|{glyph}" if glyph else base
+
+
+def encode_slot_payload(kind: str, index: int, payload: SlotPayload) -> str:
+    return encode_slot(kind, index, payload.name, payload.value, payload.vmin,
+                       payload.vmax, payload.glyph)
+
+
+def encode_update(kind: str, index: int, name: str, value, vmin, vmax, glyph: str = "") -> str:
+    base = f"UPDATE|{kind}|{index}|{name}|{value}|{vmin}|{vmax}"
+    return f"{base}|{glyph}" if glyph else base
+
+
+def encode_commit(count: int) -> str:
+    return f"COMMIT|{count}"
+
+
+def encode_ping() -> str:
+    return "PING"
+
+
+def encode_hide() -> str:
+    return "HIDE"
+
+
+def encode_autohide(enabled: bool) -> str:
+    # Input-driven auto-hide flag (hud-input-autohide-plan). Only summon surfaces
+    # send AUTOHIDE|1; the HUD defaults it off. Sent with LAYOUT so a HUD that
+    # started after the surface still learns it.
+    return f"AUTOHIDE|{1 if enabled else 0}"
+
+
+def encode_toggle() -> str:
+    # hud_toggle press. Sent at the head of a fresh burst; the HUD arbitrates
+    # show-vs-hide from its own true visibility (hud-input-autohide-plan).
+    return "TOGGLE"
+
+
+def encode_page_info(enc_page: int, enc_total: int, btn_page: int, btn_total: int,
+                     enc_label: str = '', btn_label: str = '') -> str:
+    # Labels carry the standard-bank page name (e.g. "Amplitude / Filter") or
+    # "Best of" for page 1 of a known device. Additive: when both labels are
+    # empty we emit the short (counts-only) form.
+    if not enc_label and not btn_label:
+        return f"PAGE|{enc_page}|{enc_total}|{btn_page}|{btn_total}"
+    return f"PAGE|{enc_page}|{enc_total}|{btn_page}|{btn_total}|{enc_label}|{btn_label}"
+
+
+def encode_mode(is_shift: bool) -> str:
+    return "MODE|shift" if is_shift else "MODE|normal"
+
+
+def encode_set_mode(name: str) -> str:
+    # Reverse mode channel (lc_parks): the PRIMARY tells the SECONDARY which
+    # named mode to switch into when the user holds shift on the primary. Carries
+    # the mode NAME (not a bool) so it stays correct under the "identical mode
+    # names" validation and generalizes past two modes. Distinct verb from the
+    # secondary->primary `MODE|shift|normal` (which RegionState ignores).
+    return f"SETMODE|{name}"
+
+
+def encode_zones(entries) -> str:
+    """Per-burst zone-colour message (grid-zone-colour-coding-plan). `entries`
+    is an iterable of (kind, wire_idx, hex6) — the zone tint for HUD dial/button
+    outlines, keyed by the same wire index the SLOT uses. An empty iterable
+    yields `ZONES|0`, which the receiver treats as "no tint" (clears any
+    previous synth's colours on a non-zoned focus)."""
+    entries = list(entries)
+    parts = [str(len(entries))]
+    for kind, idx, hexv in entries:
+        parts += [kind, str(idx), hexv]
+    return "ZONES|" + "|".join(parts)
+
+
+def encode_dividers(cols) -> str:
+    """Cosmetic HUD column dividers (hud_dividers plan). `cols` is an iterable of
+    HUD grid_col boundaries — the HUD draws a full-height vertical rule to the
+    left of each listed column. `DIVIDERS|0` carries no dividers."""
+    cols = list(cols)
+    parts = [str(len(cols))] + [str(c) for c in cols]
+    return "DIVIDERS|" + "|".join(parts)
+
+
+def encode_drum(pad_name: str, pattern: str, page: int = 1, pages: int = 1,
+                resolution: str = '16') -> str:
+    # Drum-rack step feedback: the selected pad's name plus the visible page of
+    # its step pattern ('X' filled, '.' empty), sent on pad select, page /
+    # length / resolution change and after step edits. Independent of the SLOT
+    # path (whose button-slot rules are flagged unstable). `pattern` is a
+    # compact fixed alphabet; the pad name is free-form and may contain '|', so
+    # it is always the FINAL field. Page metadata rides on the pattern field as
+    # `@<page>/<pages>/<resolution>`, and only when it says more than the
+    # original one-page sixteenth grid, so that form is unchanged.
+    safe_pattern = pattern.replace('|', ' ').replace('@', ' ')
+    if pages != 1 or page != 1 or resolution != '16':
+        safe_pattern += f"@{page}/{pages}/{resolution}"
+    return f"DRUM|{safe_pattern}|{pad_name}"
+
+
+def encode_delta(name: str) -> str:
+    # Delta-burst start marker (the DEVICE analogue for a delta). The receiver
+    # seeds its pending state from what it last published instead of clearing
+    # it, so only the lines that changed since the last COMMIT need to follow.
+    # Carries the device name so DEVICE (which clears pending) never appears
+    # inside a delta. See hud_protocol.md "Delta bursts".
+    return f"DELTA|{name}"
+
+
+# ---- HELLO capabilities -----------------------------------------------------
+
+# The HUD announces what it can receive in its HELLO to the surface control
+# port: `HELLO` (a plain, pre-capability HUD) or `HELLO|<cap>,<cap>...`. The
+# sender only switches on an optional wire feature the receiver has announced,
+# so an old HUD keeps getting the historical full bursts.
+CAP_DELTA = 'delta'
+CAP_BINARY = 'bin1'
+CAP_MULTIPART = 'part1'
+
+# The parks forwarder's HudClient targets the lc_parks compositor's region port,
+# which never sends a HELLO. Both ends are generated from this tree together,
+# so the compositor's capabilities are known statically instead. Binary and
+# multipart (RegionState reassembles PART fragments); no deltas: the region
+# cache is re-merged on every COMMIT, so deltas would save nothing.
+REGION_CAPABILITIES = frozenset((CAP_BINARY, CAP_MULTIPART))
+
+
+def encode_hello(capabilities=()) -> str:
+    caps = ','.join(capabilities)
+    return f"HELLO|{caps}" if caps else "HELLO"
+
+
+def parse_hello(line: str) -> frozenset:
+    """Capabilities announced by a HELLO line. Tolerant by design: anything
+    that isn't a well-formed HELLO announces nothing (plain text fallback)."""
+    fields = line.strip().split('|')
+    if fields[0] != 'HELLO' or len(fields) < 2:
+        return frozenset()
+    return frozenset(c.strip() for c in fields[1].split(',') if c.strip())
+
+
+# ---- delta bursts -----------------------------------------------------------
+
+# Verbs whose single line fully describes one piece of receiver state, so a
+# burst line can be compared against the same key in the last published burst.
+_SINGLETON_STATE_VERBS = frozenset(('LAYOUT', 'DIVIDERS', 'AUTOHIDE', 'PAGE', 'ZONES'))
+
+
+def state_key(line: str):
+    """Which piece of receiver state an encoded line overwrites, or None for
+    lines that aren't diffable state (framing, PING, HIDE, EVENT, ...). SLOT and
+    UPDATE share a key per (kind, index): an UPDATE patches exactly the slot a
+    later SLOT would rewrite."""
+    verb, _, rest = line.partition('|')
+    if verb == 'SLOT' or verb == 'UPDATE':
+        parts = rest.split('|', 2)
+        if len(parts) < 2:
+            return None
+        return ('SLOT', parts[0], parts[1])
+    if verb in _SINGLETON_STATE_VERBS:
+        return verb
+    return None
+
+
+def diff_burst(lines, shadow):
+    """Compare a full encoded burst against `shadow` (the {state_key: line} map
+    of the last burst the receiver committed) and return `(delta, state)`.
+
+    `state` is this burst's own {state_key: line} map — the new shadow once it
+    has actually been sent. `delta` is the `DELTA … COMMIT` line list carrying
+    only what changed, or None when the burst must go out in full: there is no
+    shadow yet, the burst has no DEVICE line to name the delta, or a slot the
+    receiver still holds is absent from this burst (a delta can only overwrite,
+    never clear)."""
+    state = {}
+    name = None
+    for line in lines:
+        key = state_key(line)
+        if key is not None:
+            state[key] = line
+        elif line.startswith('DEVICE|'):
+            name = line[len('DEVICE|'):]
+    if shadow is None or name is None or any(k not in state for k in shadow):
+        return None, state
+    delta = [encode_delta(name)]
+    slots = 0
+    for line in lines:
+        key = state_key(line)
+        if key is None:
+            # DEVICE is replaced by the DELTA marker and COMMIT is re-counted
+            # below; any other unkeyed line is an event, so always forward it.
+            if not (line.startswith('DEVICE|') or line.startswith('COMMIT|')):
+                delta.append(line)
+        elif shadow.get(key) != line:
+            delta.append(line)
+            if key[0] == 'SLOT':
+                slots += 1
+    delta.append(encode_commit(slots))
+    return delta, state
+
+
+def encode_event(kind: str, wire_idx: int, text: str) -> str:
+    # Show-info feedback: explains a button press on the HUD at the moment it
+    # happens (see momentary-vs-toggle-made-explicit-plan, item #7). `kind` is
+    # the slot kind ('button'/'dial') or 'info' when not tied to a HUD cell;
+    # `wire_idx` is the HUD button-array index (-1 when none). `text` is free
+    # form and may itself contain '|', so it is always the final field.
+    safe_text = text.replace('\n', ' ')
+    return f"EVENT|{kind}|{wire_idx}|{safe_text}"
+
+
+# ---- parse ------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class LayoutMsg:
+    cells: List[LayoutCell]
+
+
+@dataclass(frozen=True)
+class DeviceMsg:
+    name: str
+
+
+@dataclass(frozen=True)
+class DeltaMsg:
+    name: str
+
+
+@dataclass(frozen=True)
+class SlotMsg:
+    kind: str
+    index: int
+    payload: SlotPayload
+
+
+@dataclass(frozen=True)
+class UpdateMsg:
+    kind: str
+    index: int
+    payload: SlotPayload
+
+
+@dataclass(frozen=True)
+class CommitMsg:
+    count: int
+
+
+@dataclass(frozen=True)
+class PingMsg:
+    pass
+
+
+@dataclass(frozen=True)
+class HideMsg:
+    pass
+
+
+@dataclass(frozen=True)
+class ModeMsg:
+    is_shift: bool
+
+
+@dataclass(frozen=True)
+class SetModeMsg:
+    name: str
+
+
+@dataclass(frozen=True)
+class PageMsg:
+    enc_page: int
+    enc_total: int
+    btn_page: int
+    btn_total: int
+    enc_label: str = ''
+    btn_label: str = ''
+
+
+@dataclass(frozen=True)
+class EventMsg:
+    kind: str
+    wire_idx: int
+    text: str
+
+
+@dataclass(frozen=True)
+class DrumMsg:
+    pattern: str
+    pad_name: str
+    page: int = 1
+    pages: int = 1
+    resolution: str = '16'
+
+
+@dataclass(frozen=True)
+class DividersMsg:
+    cols: List[int]
+
+
+@dataclass(frozen=True)
+class UnknownMsg:
+    line: str
+
+
+Message = Union[LayoutMsg, DeviceMsg, DeltaMsg, SlotMsg, UpdateMsg, CommitMsg, PingMsg, HideMsg, ModeMsg, SetModeMsg, PageMsg, EventMsg, DrumMsg, DividersMsg, UnknownMsg]
+
+
+def _parse_slot_fields(fields):
+    # fields: [verb, kind, index, name, value, vmin, vmax, (glyph)?]
+    if len(fields) not in (7, 8):
+        return None
+    kind = fields[1]
+    if kind not in ('dial', 'button'):
+        return None
+    try:
+        index = int(fields[2])
+        value = float(fields[4])
+        vmin = float(fields[5])
+        vmax = float(fields[6])
+    except ValueError:
+        return None
+    glyph = fields[7] if len(fields) == 8 else ""
+    return kind, index, SlotPayload(fields[3], value, vmin, vmax, glyph)
+
+
+def parse(line: str) -> Message:
+    line = line.rstrip('\r\n')
+    if not line:
+        return UnknownMsg(line)
+    fields = line.split('|')
+    verb = fields[0]
+
+    if verb == 'LAYOUT':
+        # LAYOUT|<n>|<gr>|<gc>|<kind>|<count>|<start>|<section>... × n
+        if len(fields) < 2:
+            return UnknownMsg(line)
+        try:
+            n = int(fields[1])
+        except ValueError:
+            return UnknownMsg(line)
+        expected = 2 + n * 6
+        if len(fields) != expected:
+            return UnknownMsg(line)
+        cells: List[LayoutCell] = []
+        try:
+            for i in range(n):
+                base = 2 + i * 6
+                cells.append(LayoutCell(
+                    int(fields[base]),
+                    int(fields[base + 1]),
+                    fields[base + 2],
+                    int(fields[base + 3]),
+                    int(fields[base + 4]),
+                    int(fields[base + 5]),
+                ))
+        except ValueError:
+            return UnknownMsg(line)
+        return LayoutMsg(cells)
+
+    if verb == 'DEVICE':
+        if len(fields) < 2:
+            return UnknownMsg(line)
+        return DeviceMsg(fields[1])
+
+    if verb == 'DELTA':
+        if len(fields) < 2:
+            return UnknownMsg(line)
+        return DeltaMsg(fields[1])
+
+    if verb in ('SLOT', 'UPDATE'):
+        parsed = _parse_slot_fields(fields)
+        if parsed is None:
+            return UnknownMsg(line)
+        kind, index, payload = parsed
+        return (SlotMsg(kind, index, payload) if verb == 'SLOT'
+                else UpdateMsg(kind, index, payload))
+
+    if verb == 'COMMIT':
+        if len(fields) != 2:
+            return UnknownMsg(line)
+        try:
+            return CommitMsg(int(fields[1]))
+        except ValueError:
+            return UnknownMsg(line)
+
+    if verb == 'PING':
+        if len(fields) != 1:
+            return UnknownMsg(line)
+        return PingMsg()
+
+    if verb == 'HIDE':
+        if len(fields) != 1:
+            return UnknownMsg(line)
+        return HideMsg()
+
+    if verb == 'MODE':
+        if len(fields) == 2:
+            return ModeMsg(is_shift=(fields[1] == 'shift'))
+        return UnknownMsg(line)
+
+    if verb == 'SETMODE':
+        if len(fields) == 2 and fields[1]:
+            return SetModeMsg(name=fields[1])
+        return UnknownMsg(line)
+
+    if verb == 'EVENT':
+        # EVENT|<kind>|<wire_idx>|<text...> — text is the rest, may contain '|'.
+        if len(fields) < 4:
+            return UnknownMsg(line)
+        try:
+            wire_idx = int(fields[2])
+        except ValueError:
+            return UnknownMsg(line)
+        text = '|'.join(fields[3:])
+        return EventMsg(fields[1], wire_idx, text)
+
+    if verb == 'DRUM':
+        # DRUM|<pattern>|<pad name...> — pad name is the rest, may contain '|'.
+        if len(fields) < 3:
+            return UnknownMsg(line)
+        pattern, _, meta = fields[1].partition('@')
+        if not meta:
+            return DrumMsg(pattern, '|'.join(fields[2:]))
+        parts = meta.split('/')
+        if len(parts) != 3:
+            return UnknownMsg(line)
+        try:
+            page, pages = int(parts[0]), int(parts[1])
+        except ValueError:
+            return UnknownMsg(line)
+        return DrumMsg(pattern, '|'.join(fields[2:]), page, pages, parts[2])
+
+    if verb == 'DIVIDERS':
+        # DIVIDERS|<n>|<col0>|<col1>|... — cosmetic HUD column rules.
+        if len(fields) < 2:
+            return UnknownMsg(line)
+        try:
+            n = int(fields[1])
+        except ValueError:
+            return UnknownMsg(line)
+        if len(fields) != 2 + n:
+            return UnknownMsg(line)
+        try:
+            cols = [int(f) for f in fields[2:]]
+        except ValueError:
+            return UnknownMsg(line)
+        return DividersMsg(cols)
+
+    if verb == 'PAGE':
+        if len(fields) not in (5, 7):
+            return UnknownMsg(line)
+        try:
+            counts = (int(fields[1]), int(fields[2]), int(fields[3]), int(fields[4]))
+        except ValueError:
+            return UnknownMsg(line)
+        if len(fields) == 7:
+            return PageMsg(*counts, enc_label=fields[5], btn_label=fields[6])
+        return PageMsg(*counts)
+
+    return UnknownMsg(line)
+
+
+def parse_all(data: str) -> List[Message]:
+    return [parse(line) for line in data.split('\n') if line.strip()]
+
+
+# ---- binary frames ----------------------------------------------------------
+
+# Compact alternative to the text wire, switched on per receiver by the
+# `bin1` HELLO capability (see hud_protocol.md "Binary frames"). A datagram is
+# either text or one binary frame; the leading NUL of the magic can never start
+# a text line, so a receiver dispatches on the first byte alone.
+#
+#   magic     4s   b'\x00HB1'
+#   names     H    count, then per name: H byte length + UTF-8 bytes
+#   ranges    H    count, then per range: f vmin, f vmax
+#   records   H    count, then per record a 1-byte tag:
+#     'S'/'U'      SLOT/UPDATE: B kind, H index, H name id, H glyph id,
+#                  H range id, f value  (float32 — the HUD's own precision)
+#     'T'          any other line, verbatim: H byte length + UTF-8 bytes
+#
+# Names, glyphs and (min, max) ranges are interned per frame: a burst repeats
+# "" (empty slots), a glyph across buttons and 0..1 ranges on nearly every slot,
+# and each is stored once. All integers little-endian.
+BINARY_MAGIC = b'\x00HB1'
+_KIND_CODES = {'dial': 0, 'button': 1}
+_KIND_NAMES = ('dial', 'button')
+_U16 = struct.Struct('<H')
+_RANGE = struct.Struct('<ff')
+_F32 = struct.Struct('<f')
+_SLOT_RECORD = struct.Struct('<BHHHHf')
+_SLOT_TAGS = {'SLOT': b'S', 'UPDATE': b'U'}
+
+
+def _from_f32(value: float) -> float:
+    """Shortest decimal that packs to the same float32, so a decoded 0.1 is
+    0.1 again rather than 0.10000000149011612: anything re-encoding decoded
+    slots as text (the compositor's RegionState) emits what the text wire
+    would have."""
+    for digits in (6, 7, 8):
+        short = float(f"{value:.{digits}g}")
+        if _F32.pack(short) == _F32.pack(value):
+            return short
+    return float(f"{value:.9g}")
+
+
+def is_binary(data: bytes) -> bool:
+    return data[:len(BINARY_MAGIC)] == BINARY_MAGIC
+
+
+def _pack_str(text: str) -> bytes:
+    raw = text.encode('utf-8')
+    return _U16.pack(len(raw)) + raw
+
+
+def encode_binary(lines) -> bytes:
+    """Pack already-encoded text lines into one binary frame. SLOT/UPDATE lines
+    become fixed-width records; anything else (or a slot line whose numbers
+    don't survive float parsing) rides along verbatim as a text record, so the
+    frame always decodes to exactly what the text lines would. The same goes
+    for numbers float32 can't hold and indexes past u16."""
+    names = {}
+    ranges = {}
+    records = []
+    for line in lines:
+        fields = line.split('|')
+        tag = _SLOT_TAGS.get(fields[0])
+        packed = None
+        if tag is not None and len(fields) in (7, 8) and fields[1] in _KIND_CODES:
+            try:
+                packed = (_KIND_CODES[fields[1]], int(fields[2]),
+                          float(fields[4]), float(fields[5]), float(fields[6]))
+                # Range-check before interning anything for this line.
+                _RANGE.pack(packed[3], packed[4])
+                _SLOT_RECORD.pack(packed[0], packed[1], 0, 0, 0, packed[2])
+            except (ValueError, OverflowError, struct.error):
+                packed = None
+        if packed is None:
+            records.append(b'T' + _pack_str(line))
+            continue
+        kind, index, value, vmin, vmax = packed
+        name_id = names.setdefault(fields[3], len(names))
+        glyph_id = names.setdefault(fields[7] if len(fields) == 8 else '', len(names))
+        range_id = ranges.setdefault((vmin, vmax), len(ranges))
+        records.append(tag + _SLOT_RECORD.pack(kind, index, name_id, glyph_id, range_id, value))
+    return b''.join([BINARY_MAGIC, _U16.pack(len(names))]
+                    + [_pack_str(n) for n in names]
+                    + [_U16.pack(len(ranges))]
+                    + [_RANGE.pack(*r) for r in ranges]
+                    + [_U16.pack(len(records))] + records)
+
+
+def parse_binary(data: bytes) -> List[Message]:
+    """Decode one binary frame. A truncated or malformed frame yields the
+    messages decoded before the damage plus an UnknownMsg — the same
+    drop-what-you-can't-read contract as `parse` on a bad text line."""
+    view = memoryview(data)
+    pos = len(BINARY_MAGIC)
+    messages: List[Message] = []
+    try:
+        (n_names,), pos = _U16.unpack_from(view, pos), pos + 2
+        names = []
+        for _ in range(n_names):
+            (n,), pos = _U16.unpack_from(view, pos), pos + 2
+            names.append(str(view[pos:pos + n], 'utf-8'))
+            pos += n
+        (n_ranges,), pos = _U16.unpack_from(view, pos), pos + 2
+        ranges = []
+        for _ in range(n_ranges):
+            vmin, vmax = _RANGE.unpack_from(view, pos)
+            ranges.append((_from_f32(vmin), _from_f32(vmax)))
+            pos += _RANGE.size
+        (n_records,), pos = _U16.unpack_from(view, pos), pos + 2
+        for _ in range(n_records):
+            tag, pos = view[pos], pos + 1
+            if tag == 0x54:  # 'T'
+                (n,), pos = _U16.unpack_from(view, pos), pos + 2
+                if pos + n > len(view):
+                    raise ValueError("truncated text record")
+                messages.append(parse(str(view[pos:pos + n], 'utf-8')))
+                pos += n
+            elif tag in (0x53, 0x55):  # 'S' / 'U'
+                kind, index, name_id, glyph_id, range_id, value = _SLOT_RECORD.unpack_from(view, pos)
+                pos += _SLOT_RECORD.size
+                vmin, vmax = ranges[range_id]
+                payload = SlotPayload(names[name_id], _from_f32(value), vmin, vmax, names[glyph_id])
+                msg_type = SlotMsg if tag == 0x53 else UpdateMsg
+                messages.append(msg_type(_KIND_NAMES[kind], index, payload))
+            else:
+                raise ValueError(f"unknown record tag {tag}")
+    except (struct.error, IndexError, UnicodeDecodeError, ValueError):
+        messages.append(UnknownMsg(repr(bytes(view[pos:pos + 16]))))
+    return messages
+
+
+def parse_datagram(data: bytes) -> List[Message]:
+    """Decode one received datagram, binary frame or text."""
+    if is_binary(data):
+        return parse_binary(data)
+    return parse_all(data.decode('utf-8', errors='replace'))
+
+
+# ---- lazy slot scanning -----------------------------------------------------
+
+# The compositor's region link receives a full secondary burst per COMMIT, and
+# most of its slots are only read back when the primary next re-emits (or are
+# overwritten by the next burst first). `scan_datagram` walks a datagram without
+# building a SlotMsg per slot: SLOT records come out as a (kind, index) plus a
+# lazy reference into the received bytes, decoded by `.decode()` on demand.
+# Every other line is parsed as usual.
+
+SCAN_SLOT = 'S'
+SCAN_UPDATE = 'U'
+
+
+class _FrameTables:
+    """A binary frame's name / range tables, located but not decoded. Names
+    decode on first use and are cached: a frame's slots share most of them."""
+    __slots__ = ('view', 'name_spans', 'ranges_at', 'names')
+
+    def __init__(self, view, name_spans, ranges_at):
+        self.view = view
+        self.name_spans = name_spans
+        self.ranges_at = ranges_at
+        self.names = {}
+
+    def name(self, i):
+        text = self.names.get(i)
+        if text is None:
+            start, end = self.name_spans[i]
+            text = self.names[i] = str(self.view[start:end], 'utf-8', 'replace')
+        return text
+
+
+class LazyBinarySlot:
+    __slots__ = ('frame', 'name_id', 'glyph_id', 'range_id', 'value')
+
+    def __init__(self, frame, name_id, glyph_id, range_id, value):
+        self.frame = frame
+        self.name_id = name_id
+        self.glyph_id = glyph_id
+        self.range_id = range_id
+        self.value = value
+
+    def decode(self) -> Optional[SlotPayload]:
+        frame = self.frame
+        vmin, vmax = _RANGE.unpack_from(frame.view, frame.ranges_at + self.range_id * _RANGE.size)
+        # Same float32 -> shortest-decimal step as parse_binary, so slots the
+        # compositor re-encodes match the text wire.
+        return SlotPayload(frame.name(self.name_id), _from_f32(self.value),
+                           _from_f32(vmin), _from_f32(vmax), frame.name(self.glyph_id))
+
+
+class LazyTextSlot:
+    __slots__ = ('line',)
+
+    def __init__(self, line: bytes):
+        self.line = line
+
+    def decode(self) -> Optional[SlotPayload]:
+        parsed = _parse_slot_fields(self.line.decode('utf-8', errors='replace').split('|'))
+        return parsed[2] if parsed is not None else None
+
+
+def scan_datagram(data: bytes):
+    """Yield `(tag, kind, index, item)` per message of one datagram: for SLOT
+    (tag SCAN_SLOT) and UPDATE (SCAN_UPDATE) records `item` is a lazy slot with
+    `.decode()`; otherwise tag/kind/index are None and `item` is the parsed
+    Message. Malformed input ends with an UnknownMsg, like `parse_datagram`."""
+    if is_binary(data):
+        yield from _scan_binary(data)
+        return
+    for line in data.split(b'\n'):
+        if not line.strip():
+            continue
+        if line.startswith(b'SLOT|') and 6 <= line.count(b'|') <= 7:
+            fields = line.split(b'|', 3)
+            kind = _KIND_BYTES.get(fields[1])
+            if kind is not None:
+                try:
+                    index = int(fields[2])
+                except ValueError:
+                    index = -1
+                if index >= 0:
+                    yield SCAN_SLOT, kind, index, LazyTextSlot(line.rstrip(b'\r'))
+                    continue
+        yield None, None, None, parse(line.decode('utf-8', errors='replace'))
+
+
+_KIND_BYTES = {b'dial': 'dial', b'button': 'button'}
+
+
+def _scan_binary(data: bytes):
+    view = memoryview(data)
+    pos = len(BINARY_MAGIC)
+    try:
+        (n_names,), pos = _U16.unpack_from(view, pos), pos + 2
+        spans = []
+        for _ in range(n_names):
+            (n,), pos = _U16.unpack_from(view, pos), pos + 2
+            if pos + n > len(view):
+                raise ValueError("truncated name table")
+            spans.append((pos, pos + n))
+            pos += n
+        (n_ranges,), pos = _U16.unpack_from(view, pos), pos + 2
+        tables = _FrameTables(view, spans, pos)
+        pos += n_ranges * _RANGE.size
+        (n_records,), pos = _U16.unpack_from(view, pos), pos + 2
+        for _ in range(n_records):
+            tag, pos = view[pos], pos + 1
+            if tag == 0x54:  # 'T'
+                (n,), pos = _U16.unpack_from(view, pos), pos + 2
+                if pos + n > len(view):
+                    raise ValueError("truncated text record")
+                yield None, None, None, parse(str(view[pos:pos + n], 'utf-8'))
+                pos += n
+            elif tag in (0x53, 0x55):  # 'S' / 'U'
+                kind, index, name_id, glyph_id, range_id, value = _SLOT_RECORD.unpack_from(view, pos)
+                pos += _SLOT_RECORD.size
+                if name_id >= n_names or glyph_id >= n_names or range_id >= n_ranges or kind > 1:
+                    raise ValueError("bad slot record")
+                yield (SCAN_SLOT if tag == 0x53 else SCAN_UPDATE, _KIND_NAMES[kind], index,
+                       LazyBinarySlot(tables, name_id, glyph_id, range_id, value))
+            else:
+                raise ValueError(f"unknown record tag {tag}")
+    except (struct.error, IndexError, UnicodeDecodeError, ValueError):
+        yield None, None, None, UnknownMsg(repr(bytes(view[pos:pos + 16])))
+
+
+# ---- multipart bursts -------------------------------------------------------
+
+# A burst whose datagram would exceed the sender's cap goes out, to a receiver
+# that announced `part1`, as fragments of the *encoded* datagram (text or binary
+# frame alike), each prefixed with an ASCII header line:
+#
+#   PART|<seq>|<i>|<n>\n<chunk>
+#
+# `seq` numbers bursts per sender (mod 65536), `i` is 0-based, `n` the fragment
+# count. The receiver concatenates the chunks in order once all n have arrived
+# and decodes the result exactly like a single datagram, so the burst stays
+# atomic: a lost fragment loses the whole burst, never half of it.
+# See hud_protocol.md "Multipart bursts".
+PART_PREFIX = b'PART|'
+MAX_PARTS = 64
+# Room for the longest header, `PART|65535|63|64\n` (17 bytes).
+_PART_HEADER_RESERVE = 20
+
+
+def encode_parts(payload: bytes, seq: int, max_datagram: int) -> Optional[List[bytes]]:
+    """Split one encoded burst datagram into PART fragments of at most
+    `max_datagram` bytes each, or None if that would take more than MAX_PARTS."""
+    chunk = max_datagram - _PART_HEADER_RESERVE
+    n = max(1, -(-len(payload) // chunk))
+    if n > MAX_PARTS:
+        return None
+    seq &= 0xFFFF
+    return [b'PART|%d|%d|%d\n' % (seq, i, n) + payload[i * chunk:(i + 1) * chunk]
+            for i in range(n)]
+
+
+def is_part(data: bytes) -> bool:
+    return data[:len(PART_PREFIX)] == PART_PREFIX
+
+
+def parse_part(data: bytes):
+    """(seq, i, n, chunk) of one fragment, or None when the header is malformed."""
+    nl = data.find(b'\n')
+    if nl < 0:
+        return None
+    fields = data[:nl].split(b'|')
+    if len(fields) != 4:
+        return None
+    try:
+        seq, i, n = int(fields[1]), int(fields[2]), int(fields[3])
+    except ValueError:
+        return None
+    if not (0 < n <= MAX_PARTS and 0 <= i < n):
+        return None
+    return seq, i, n, data[nl + 1:]
+
+
+class PartAssembler:
+    """Receiver-side reassembly of PART fragments.
+
+    In-progress bursts are keyed by `seq` and kept in arrival order. Completing
+    a burst evicts every burst that started before it: those are stale (a newer
+    burst already replaced them on the receiver), and delivering one later would
+    roll the HUD back. At most `max_pending` bursts are held; the oldest goes
+    first. Nothing compares sequence numbers for order, so a sender that
+    restarts its counter (surface reload) is picked up on its first burst --
+    even one reusing the seq just delivered: a fragment of that seq is only a
+    late duplicate while it matches the delivered burst byte for byte."""
+
+    def __init__(self, max_pending=4):
+        self._max_pending = max_pending
+        self._pending = {}  # seq -> [parts list, fragments held]; insertion-ordered
+        # [seq, delivered parts, indices re-received as exact duplicates]
+        self._last_complete = None
+        self.completed = 0
+        self.evicted = 0
+        self.malformed = 0
+
+    def feed(self, data: bytes) -> Optional[bytes]:
+        """Take one fragment. Returns the whole datagram when this fragment
+        completed its burst, None otherwise."""
+        part = parse_part(data)
+        if part is None:
+            self.malformed += 1
+            return None
+        seq, i, n, chunk = part
+        entry = self._pending.get(seq)
+        if entry is None:
+            seeded = self._restarted(seq, i, n, chunk)
+            if seeded is None:
+                return None  # late duplicate of the burst just delivered
+            if len(self._pending) >= self._max_pending:
+                del self._pending[next(iter(self._pending))]
+                self.evicted += 1
+            entry = self._pending[seq] = [seeded, sum(c is not None for c in seeded)]
+        parts = entry[0]
+        if len(parts) != n:
+            self.malformed += 1
+            return None
+        if parts[i] is None:
+            parts[i] = chunk
+            entry[1] += 1
+        if entry[1] < n:
+            return None
+        for older in list(self._pending):
+            del self._pending[older]
+            if older == seq:
+                break
+            self.evicted += 1
+        self._last_complete = [seq, parts, set()]
+        self.completed += 1
+        return b''.join(parts)
+
+    def _restarted(self, seq, i, n, chunk):
+        """Fresh parts list for a new burst, or None when the fragment repeats
+        the burst last delivered. A same-seq fragment that differs means the
+        sender restarted its counter: the new burst keeps the fragments that
+        already arrived identical to the delivered ones."""
+        last = self._last_complete
+        if last is None or last[0] != seq:
+            return [None] * n
+        delivered, repeated = last[1], last[2]
+        if len(delivered) == n and delivered[i] == chunk:
+            repeated.add(i)
+            return None
+        self._last_complete = None
+        return [delivered[j] if j in repeated and len(delivered) == n else None
+                for j in range(n)]
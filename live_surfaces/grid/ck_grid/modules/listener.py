@@ -0,0 +1,63 @@
+"""
+OSC listener class for receiving OSC messages.
+"""
+
+import socket
+import traceback
+
+from .io_hub import IoHub
+from .pythonosc.osc_message import OscMessage
+
+
+class OSCListener:
+    """
+    A listener for OSC messages that sets up a UDP socket and processes received messages.
+    """
+    def __init__(self, manager, button_handler, port=5015, name="surface", hub=None):
+        """
+        Initialize the OSC listener.
+
+        Args:
+            manager: The manager object that provides scheduling and logging functionality
+            button_handler: The handler for button events
+            port: UDP port to bind for OSC button input. Must be unique per
+                surface so multiple surfaces can run at once (set by codegen).
+            name: surface name, for log messages.
+            hub: the surface's IoHub, which polls this socket alongside the
+                others; a listener built without one gets its own.
+        """
+        self._manager = manager
+        self.button_handler = button_handler
+        self._socket = None
+        try:
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self._socket.bind(('0.0.0.0', port))
+            self.log_message(f"{name}: OSC button listener on port {port}")
+
+            hub = hub if hub is not None else IoHub(manager, name=name)
+            hub.register(self._socket, self.on_datagram, bufsize=1024, label=f"{name}-osc")
+        except Exception as e:
+            self.log_message(f"{name}: OSC listener socket error on port {port}: {traceback.format_exc()}")
+
+    def log_message(self, msg):
+        """
+        Log a message using the manager.
+
+        Args:
+            msg: The message to log
+        """
+        self._manager.log_message(msg)
+
+    def on_datagram(self, data, addr):
+        """
+        Process one received OSC message. Called by the IoHub poll loop.
+        """
+        self.log_message(f"data = {data}")
+
+        message = OscMessage(data)
+        self.log_message(f"message.address: {message.address}")
+        self.log_message(f"message.params: {message.params}")
+
+        if message.address == '/button/down':
+            if len(message.params) > 1:
+                self.button_handler(message.params[0], message.params[1])
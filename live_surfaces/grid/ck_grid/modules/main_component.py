@@ -0,0 +1,2530 @@
+from _Framework.ControlSurfaceComponent import ControlSurfaceComponent
+import Live
+from _Framework.ControlSurface import ControlSurface
+from _Framework.InputControlElement import *
+from _Framework.EncoderElement import EncoderElement
+from _Framework.MixerComponent import MixerComponent
+from Launchpad.ConfigurableButtonElement import ConfigurableButtonElement
+from .helpers import Helpers, Remote, SurfaceConfig
+from .osc_client import OSCClient, OSCMultiClient, NullOSCClient
+from .hud_client import HudClient, NullHudClient
+from .send_queue import SendQueue
+from .hud_protocol import REGION_CAPABILITIES
+from .update_coalescer import UpdateCoalescer
+from .midi_out import MidiOutQueue
+from .ec4_client import Ec4Client, NullEc4Client
+from .grid_led_client import GridLedClient, NullGridLedClient
+from .clip_actions import ClipActions
+from .drum_rack import DrumRackController
+from .listener import OSCListener
+from .region_state import RegionState, RegionSet
+from .region_listener import RegionListener
+from .mode_link import ModeSender, ModeListener
+from .nav import Nav
+from .shared_hub import SurfaceShare
+# from _Framework.EncoderElement import *
+
+functions_loaded_error = None
+
+try:
+    from .functions import Functions
+except Exception as e:
+    functions_loaded_error = e
+
+class MainComponent(ControlSurfaceComponent):
+    def __init__(self, manager):
+        super().__init__(manager)
+        self.class_identifier = "main_component"
+
+        self.manager = manager
+
+        self.mixer = MixerComponent(124, 24)
+        # self.setup_controls()
+        # self.setup_listeners()
+
+        if functions_loaded_error is not None:
+            self.log_message(f"Error loading functions: {functions_loaded_error}")
+        else:
+            self.functions = Functions(self)
+
+        self._modes = {}
+        # Default None so goto_mode's guards hold on surfaces with no physical
+        # mode-button and on non-composition surfaces. The mode setup and the
+        # MODE_LINK block below overwrite these when present.
+        self.mode_button = None
+        self._mode_sender = None
+        self._song = self.manager.song()
+        self._nav = Nav(self.manager)
+        self.clip_actions = ClipActions(self.manager)
+
+        # `send-thread: true`: HUD/OSC datagrams are encoded here but written by
+        # a background thread, so a stalled receiver can't delay MIDI handling.
+        # Closed on disconnect/reload, before the shared socket is released.
+        self._sender = SendQueue(name="ck_grid") if False else None
+
+        self._osc_client = NullOSCClient()
+        _osc_targets = []
+        if _osc_targets:
+            self._osc_client = OSCMultiClient(_osc_targets, sender=self._sender)
+
+        # HUD_TARGET is data, not code: None for a standalone surface (HUD on
+        # 127.0.0.1:5006), or (host, port) for the parks forwarder which retargets
+        # its HUD client at the compositor's region port.
+        HUD_TARGET = None
+        _hud_host, _hud_port = HUD_TARGET if HUD_TARGET is not None else ('127.0.0.1', 5006)
+        # Process-wide resources shared with co-loaded surfaces (one UDP send
+        # socket, one compiled table per unique mapping, one bank index);
+        # released on disconnect/reload.
+        self._share = SurfaceShare()
+        self._hud_client = HudClient(
+            _hud_host, _hud_port, sock=self._share.udp_socket(), sender=self._sender)
+        if HUD_TARGET is not None:
+            # The compositor's region port never sends a HELLO; it is generated
+            # from the same tree, so its wire capabilities are known up front.
+            self._hud_client.negotiate(REGION_CAPABILITIES)
+        # SysEx feedback sinks enqueue here; the tick writes them, so a burst
+        # never waits on the MIDI port.
+        self._midi_out = MidiOutQueue(self.manager)
+        self._feedback_sinks = []
+        # Knob sweeps: keep only the latest value per slot and flush once per
+        # tick (one HUD datagram) instead of a datagram per incoming CC.
+        self._update_coalescer = UpdateCoalescer(self.manager, self._hud_client, self._osc_client)
+        self._remote = Remote(self.manager, self._osc_client, self._hud_client, self._feedback_sinks,
+                              update_coalescer=self._update_coalescer)
+
+        # Drum-rack step/velocity editor. Resolves the focused drum rack + detail
+        # clip at call time and is inert when the focused device isn't a drum
+        # rack, so this instantiation is unconditional (like clip_actions).
+        # DEFERRED SEAM: controller pad-tap selection + audition are not wired
+        # yet (need a Live note-forwarding spike); step/velocity edits already
+        # work against Live's mouse-selected pad. Edits are batched per tick:
+        # one clip rewrite per finger-run / velocity sweep, not one per event.
+        self.drum_rack = DrumRackController(self.manager, self._hud_client, batch=True)
+
+        
+        self.current_mode = None
+        self._first_mode = 'main_mode'
+        self.mode_button = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 60)
+    
+
+        self._modes['main_mode'] = {
+            'name': 'main_mode',
+            'next_mode_name': 'shift_mode',
+            'add_listeners_fn': self.mode_main_mode_add_listeners,
+            'is_shift': True,
+            'color': 13
+        }
+
+
+        self._modes['shift_mode'] = {
+            'name': 'shift_mode',
+            'next_mode_name': 'main_mode',
+            'add_listeners_fn': self.mode_shift_mode_add_listeners,
+            'is_shift': True,
+            'color': 60
+        }
+
+        self.mode_button.add_value_listener(self.mode_button_listener)
+
+
+        code_slot_assignments = [
+            (1, 'slot1'),
+			(2, 'slot2'),
+			(3, 'slot3'),
+			(4, 'slot4'),
+			(5, 'slot5'),
+			(6, 'slot6'),
+			(7, 'slot7'),
+			(8, 'slot8'),
+			(9, 'slot9'),
+			(10, 'slot10'),
+			(11, 'slot11'),
+			(12, 'slot12'),
+			(13, 'slot13'),
+			(14, 'slot14'),
+			(15, 'slot15'),
+			(16, 'slot16'),
+			(17, 'slot17'),
+			(18, 'slot18'),
+			(19, 'slot19'),
+			(20, 'slot20'),
+			(21, 'slot21'),
+			(22, 'slot22'),
+			(23, 'slot23'),
+			(24, 'slot24'),
+			(25, 'slot25'),
+			(26, 'slot26'),
+			(27, 'slot27'),
+			(28, 'slot28'),
+			(29, 'slot29'),
+			(30, 'slot30'),
+			(31, 'slot31'),
+			(32, 'slot32'),
+			(1, 'slot33'),
+			(2, 'slot34'),
+			(3, 'slot35'),
+			(4, 'slot36'),
+			(5, 'slot37'),
+			(6, 'slot38'),
+			(7, 'slot39'),
+			(8, 'slot40'),
+			(9, 'slot41'),
+			(10, 'slot42'),
+			(11, 'slot43'),
+			(12, 'slot44'),
+			(13, 'slot45'),
+			(14, 'slot46'),
+			(15, 'slot47'),
+			(16, 'slot48')
+
+        ]
+
+        code_switch_slot_assignments = [
+            (0, 1),
+			(1, 2),
+			(2, 3),
+			(3, 4),
+			(4, 5),
+			(5, 6),
+			(6, 7),
+			(7, 8),
+			(8, 9),
+			(9, 10),
+			(10, 11),
+			(11, 12),
+			(12, 13),
+			(13, 14),
+			(14, 15),
+			(15, 16),
+			(0, 17),
+			(1, 18),
+			(2, 19),
+			(3, 20),
+			(4, 21),
+			(5, 22),
+			(6, 23),
+			(7, 24),
+			(8, 25),
+			(9, 26),
+			(10, 27),
+			(11, 28),
+			(12, 29),
+			(13, 30),
+			(14, 31),
+			(15, 32)
+
+        ]
+
+        # Per-mode device bindings so the HUD resolves only the active mode's
+        # device slots (a slot device-bound in one mode otherwise shows stale
+        # device data in a mode where it is mixer/empty-bound).
+        code_slot_assignments_by_mode = {'main_mode': [(1, 'slot1'), (2, 'slot2'), (3, 'slot3'), (4, 'slot4'), (5, 'slot5'), (6, 'slot6'), (7, 'slot7'), (8, 'slot8'), (9, 'slot9'), (10, 'slot10'), (11, 'slot11'), (12, 'slot12'), (13, 'slot13'), (14, 'slot14'), (15, 'slot15'), (16, 'slot16'), (17, 'slot17'), (18, 'slot18'), (19, 'slot19'), (20, 'slot20'), (21, 'slot21'), (22, 'slot22'), (23, 'slot23'), (24, 'slot24'), (25, 'slot25'), (26, 'slot26'), (27, 'slot27'), (28, 'slot28'), (29, 'slot29'), (30, 'slot30'), (31, 'slot31'), (32, 'slot32')], 'shift_mode': [(1, 'slot33'), (2, 'slot34'), (3, 'slot35'), (4, 'slot36'), (5, 'slot37'), (6, 'slot38'), (7, 'slot39'), (8, 'slot40'), (9, 'slot41'), (10, 'slot42'), (11, 'slot43'), (12, 'slot44'), (13, 'slot45'), (14, 'slot46'), (15, 'slot47'), (16, 'slot48')]}
+        code_switch_slot_assignments_by_mode = {'main_mode': [(0, 1), (1, 2), (2, 3), (3, 4), (4, 5), (5, 6), (6, 7), (7, 8), (8, 9), (9, 10), (10, 11), (11, 12), (12, 13), (13, 14), (14, 15), (15, 16)], 'shift_mode': [(0, 17), (1, 18), (2, 19), (3, 20), (4, 21), (5, 22), (6, 23), (7, 24), (8, 25), (9, 26), (10, 27), (11, 28), (12, 29), (13, 30), (14, 31), (15, 32)]}
+
+        self._helpers = Helpers(self.manager, self._remote, SurfaceConfig(
+            slot_assignments=code_slot_assignments,
+            switch_slot_assignments=code_switch_slot_assignments,
+            slot_assignments_by_mode=code_slot_assignments_by_mode,
+            switch_slot_assignments_by_mode=code_switch_slot_assignments_by_mode,
+            pager_preview_mode='main_mode',
+            parameter_mappings_raw={'devices': [{'className': 'Amp', 'deviceName': 'Amp', 'fixed': True, 'encoders': [{'name': 'Bass'}, {'name': 'Middle'}, {'name': 'Treble'}, {'name': 'Presence'}, {'name': 'Gain'}, {'name': 'Volume'}, {'name': 'Dry/Wet'}, {'name': 'Dry/Wet'}], 'buttons': [{'name': 'Amp Type', 'type': 'param'}, {'name': 'Dual Mono', 'type': 'param'}]}, {'className': 'AutoPan2', 'deviceName': 'Auto Pan-Tremolo', 'encoders': [{'name': 'Amount'}, {'name': 'Frequency'}, {'name': 'Panning Shape'}, {'name': 'Tremolo Shape'}, {'name': 'Time'}, {'name': 'Rate'}, {'name': '16th'}, {'name': 'Phase'}, {'name': 'Offset'}, {'name': 'Spin'}, {'name': 'Attack Time'}, {'name': 'Dyn Mod'}], 'buttons': [{'name': 'Mode', 'type': 'param'}, {'name': 'Invert', 'type': 'param'}, {'name': 'Harmonic', 'type': 'param'}, {'name': 'Vintage', 'type': 'param'}, {'name': 'Time Mode', 'type': 'param'}, {'name': 'Stereo Mode', 'type': 'param'}, {'name': 'Waveform', 'type': 'param'}]}, {'className': 'OriginalSimpler', 'deviceName': 'stb_dark solo stab', 'encoders': [{'name': 'S Start', 'display': 'Start'}, {'name': 'S Length', 'display': 'Length'}, {'name': 'Transpose'}, {'name': 'Detune'}, {'name': 'Ve Attack', 'display': 'Attack'}, {'name': 'Ve Decay', 'display': 'Decay'}, {'name': 'Ve Sustain', 'display': 'Sustain'}, {'name': 'Ve Release', 'display': 'Release'}, {'name': 'Filter Freq'}, {'name': 'Filter Res'}, {'name': 'Filter Morph'}, {'name': 'Filter Drive'}, {'name': 'Volume'}, {'name': 'Fade In'}, {'name': 'Fade Out'}, {'name': 'Spread'}, {'name': 'Vol < Vel'}, {'name': 'Filt < Vel'}, {'name': 'Vol < LFO'}, {'name': 'Filt < LFO'}, {'name': 'Fe Attack'}, {'name': 'Fe Decay'}, {'name': 'Fe Sustain'}, {'name': 'Fe Release'}, {'name': 'Pitch < LFO'}, {'name': 'S Loop Length'}, {'name': 'S Loop Fade'}, {'name': 'Glide Time'}, {'name': 'Pan'}, {'name': 'Pan < Rnd'}, {'name': 'Pan < LFO'}, {'name': 'Ve Loop'}, {'name': 'Ve Retrig'}, {'name': 'Sample Selector'}, {'name': 'Fe < Env'}, {'name': 'Filt < Key'}], 'buttons': [{'lom_property': 'playback_mode', 'type': 'enum'}, {'name': 'Trigger Mode', 'type': 'param'}, {'name': 'Filter Type', 'type': 'param'}, {'name': 'Filter Slope', 'type': 'param'}, {'name': 'Filter Circuit - LP/HP', 'type': 'param'}, {'name': 'F On', 'type': 'param'}, {'name': 'Filter Circuit - BP/NO/Morph', 'type': 'param'}, {'name': 'Snap', 'type': 'param'}, {'name': 'S Loop On', 'type': 'param'}, {'name': 'Glide Mode', 'type': 'param'}, {'name': 'Pe On', 'type': 'param'}, {'name': 'Ve Mode', 'type': 'param'}, {'name': 'Fe On', 'type': 'param'}, {'name': 'L On', 'type': 'param'}]}, {'className': 'Hybrid', 'deviceName': 'Hybrid Reverb', 'encoders': [{'name': 'Blend'}, {'name': 'Decay'}, {'name': 'Size'}, {'name': 'Damping'}, {'name': 'Width'}, {'name': 'Diffusion'}, {'name': 'Modulation'}, {'name': 'Dry/Wet'}, {'controlledBy': 'Algo Type', 'group': [{'name': 'DH Shape', 'activeWhen': [0]}, {'name': 'Qz Low Damp', 'activeWhen': [1]}, {'name': 'Sh Pitch Shift', 'activeWhen': [2]}, {'name': 'Ti Tide', 'activeWhen': [3]}, {'name': 'Pr High Mult', 'activeWhen': [4]}]}, {'controlledBy': 'Algo Type', 'group': [{'name': 'DH BassMult', 'activeWhen': [0]}, {'name': 'Qz Distance', 'activeWhen': [1]}, {'name': 'Sh Shimmer', 'activeWhen': [2]}, {'name': 'Ti Rate', 'activeWhen': [3]}, {'name': 'Pr X Over', 'activeWhen': [4]}]}, {'name': 'Algo Delay'}, {'name': 'Predelay'}, {'name': 'Predelay 16th'}, {'name': 'Predelay FB'}, {'name': 'Predel. FB 16th'}, {'name': 'Vintage'}, {'name': 'Sh Pitch Shift'}, {'name': 'Ti Rate'}, {'name': 'Ti Waveform'}, {'name': 'Qz Low Damp'}, {'name': 'Qz Distance'}, {'name': 'Pr High Mult'}, {'name': 'Pr Low Mult'}, {'name': 'Pr X Over'}, {'name': 'Pr Sixth'}, {'name': 'Pr Seventh'}, {'name': 'EQ Lo Freq'}, {'name': 'EQ Lo Gain'}, {'name': 'EQ Lo Slope'}, {'name': 'EQ Peak 1 Freq'}, {'name': 'EQ Peak 1 Gain'}, {'name': 'EQ Peak 1 Q'}, {'name': 'EQ Peak 2 Freq'}, {'name': 'EQ Peak 2 Gain'}, {'name': 'EQ Peak 2 Q'}, {'name': 'EQ Hi Freq'}, {'name': 'EQ Hi Gain'}, {'name': 'EQ Hi Slope'}, {'name': 'Send Gain'}], 'buttons': [{'name': 'Algo Type', 'type': 'param'}, {'name': 'Predelay Sync', 'type': 'param'}, {'name': 'Freeze', 'type': 'param'}, {'name': 'Bass Mono', 'type': 'param'}, {'name': 'Freeze In', 'type': 'param'}, {'name': 'EQ On', 'type': 'param'}, {'name': 'EQ Pre Algo', 'type': 'param'}, {'name': 'EQ Lo Type', 'type': 'param'}, {'name': 'EQ Hi Type', 'type': 'param'}, {'name': 'Routing', 'type': 'param'}]}, {'className': 'Corpus', 'deviceName': 'Corpus', 'encoders': [{'name': 'Tune'}, {'name': 'Transpose'}, {'name': 'Fine'}, {'name': 'Spread'}, {'name': 'Decay'}, {'name': 'Material'}, {'name': 'Radius'}, {'name': 'Dry Wet'}, {'name': 'Brightness'}, {'name': 'Inharmonics'}, {'name': 'Opening'}, {'name': 'Ratio'}, {'name': 'Hit'}, {'name': 'Listening L'}, {'name': 'Listening R'}, {'name': 'LFO Rate'}, {'name': 'LFO Sync Rate'}, {'name': 'Spin'}, {'name': 'Phase'}, {'name': 'Offset'}, {'name': 'LFO Amount'}, {'name': 'Mid Freq'}, {'name': 'Width'}, {'name': 'PB Range'}, {'name': 'Off Decay'}, {'name': 'Gain'}, {'name': 'Width'}, {'name': 'Bleed'}], 'buttons': [{'name': 'Resonance Type', 'type': 'param'}, {'name': 'Resonator Quality', 'type': 'param'}, {'name': 'Filter On/Off', 'type': 'param'}, {'name': 'LFO On/Off', 'type': 'param'}, {'name': 'LFO Shape', 'type': 'param'}, {'name': 'LFO Sync', 'type': 'param'}, {'name': 'LFO Stereo Mode', 'type': 'param'}, {'name': 'MIDI Frequency', 'type': 'param'}, {'name': 'MIDI Mode', 'type': 'param'}, {'name': 'Note Off', 'type': 'param'}]}, {'className': 'AutoFilter2', 'deviceName': 'Auto Filter', 'fixed': True, 'encoders': [{'name': 'Frequency'}, {'name': 'Resonance'}, {'name': 'LFO Amount'}, {'name': 'LFO Wave'}, {'controlledBy': 'LFO T Mode', 'group': [{'name': 'LFO Freq', 'activeWhen': [0]}, {'name': 'LFO Time', 'activeWhen': [1]}, {'name': 'LFO Rate', 'activeWhen': [2, 3, 4]}, {'name': 'LFO 16th', 'activeWhen': [5]}]}, {'name': 'Drive'}, {'name': 'Env Amount'}, {'name': 'Dry/Wet'}, {'name': 'Output'}, {'name': 'Morph Slope'}, {'name': 'Filter Morph'}, {'name': 'Control'}, {'name': 'Pitch'}, {'name': 'Formant'}, {'name': 'LFO Phase'}, {'name': 'LFO Offset'}, {'name': 'LFO S Mode'}, {'name': 'LFO Spin'}, {'name': 'LFO Morph'}, {'name': 'LFO Smoothing'}, {'name': 'LFO Q Mode'}, {'name': 'LFO Steps'}, {'name': 'LFO S&H'}, {'name': 'Env Attack'}, {'name': 'Env Hold On'}, {'name': 'Env Release'}, {'name': 'Env S&H On'}, {'name': 'Env S&H'}, {'name': 'S/C EQ On'}, {'name': 'S/C EQ Type'}, {'name': 'S/C EQ Freq'}, {'name': 'S/C EQ Q'}, {'name': 'S/C EQ Gain'}, {'name': 'S/C On'}, {'name': 'S/C Gain'}, {'name': 'S/C Mix'}], 'buttons': [{'name': 'Filter Type', 'type': 'param'}, {'name': 'Filter Slope', 'type': 'param'}, {'name': 'LFO T Mode', 'type': 'param'}, {'name': 'Circuit', 'type': 'param'}, {'name': 'Soft Clip On', 'type': 'param'}]}, {'className': 'Delay', 'deviceName': 'Delay', 'encoders': [{'name': 'L 16th'}, {'name': 'R 16th'}, {'name': 'Filter Freq'}, {'name': 'Filter Width'}, {'name': 'Feedback'}, {'name': 'L Offset'}, {'name': 'R Offset'}, {'name': 'Dry/Wet'}, {'name': 'LFO Freq'}, {'name': 'LFO Time'}, {'name': 'LFO Synced'}, {'name': 'LFO 16th'}, {'name': 'LFO Morph'}, {'name': 'LFO > Delay'}, {'name': 'LFO > Filter'}, {'name': 'L Time'}, {'name': 'R Time'}], 'buttons': [{'name': 'Link', 'type': 'param'}, {'name': 'Smoothing', 'type': 'param'}, {'name': 'Ping Pong', 'type': 'param'}, {'name': 'L Sync', 'type': 'param'}, {'name': 'R Sync', 'type': 'param'}, {'name': 'Freeze', 'type': 'param'}, {'name': 'Filter On', 'type': 'param'}, {'name': 'LFO Mode', 'type': 'param'}, {'name': 'LFO Wave', 'type': 'param'}]}, {'className': 'Compressor2', 'deviceName': 'Compressor', 'encoders': [{'name': 'Threshold'}, {'name': 'Ratio'}, {'name': 'Attack'}, {'name': 'Release'}, {'name': 'Output'}, {'name': 'Knee'}, {'name': 'Expansion Ratio'}, {'name': 'Dry/Wet'}, {'name': 'S/C EQ Freq'}, {'name': 'S/C EQ Q'}, {'name': 'S/C EQ Gain'}, {'name': 'S/C Gain'}, {'name': 'S/C Mix'}], 'buttons': [{'name': 'Model', 'type': 'param'}, {'name': 'Auto Release On/Off', 'type': 'param'}, {'name': 'Makeup', 'type': 'param'}, {'name': 'LookAhead', 'type': 'param'}, {'name': 'Env Mode', 'type': 'param'}, {'name': 'S/C On', 'type': 'param'}, {'name': 'S/C Listen', 'type': 'param'}, {'name': 'S/C EQ On', 'type': 'param'}, {'name': 'S/C EQ Type', 'type': 'param'}]}, {'className': 'GlueCompressor', 'deviceName': 'Glue Compressor', 'encoders': [{'name': 'Threshold'}, {'name': 'Range'}, {'name': 'Output'}, {'name': 'Attack'}, {'name': 'Ratio'}, {'name': 'Release'}, {'name': 'Dry/Wet'}, {'name': 'Dry/Wet'}, {'name': 'S/C Gain'}, {'name': 'S/C Mix'}, {'name': 'S/C EQ Freq'}, {'name': 'S/C EQ Gain'}, {'name': 'S/C EQ Q'}], 'buttons': [{'name': 'Peak Clip In', 'type': 'param'}, {'name': 'S/C On', 'type': 'param'}, {'name': 'S/C EQ Type', 'type': 'param'}, {'name': 'S/C EQ On', 'type': 'param'}]}, {'className': 'StereoGain', 'deviceName': 'Utility', 'encoders': [{'name': 'Output'}, {'name': 'Balance'}, {'name': 'Stereo Width'}, {'name': 'Bass Freq'}], 'buttons': [{'name': 'Mono', 'type': 'param'}, {'name': 'Bass Mono', 'type': 'param'}, {'name': 'Left Inv', 'type': 'param'}, {'name': 'Right Inv', 'type': 'param'}, {'name': 'Channel Mode', 'type': 'param'}, {'name': 'Mute', 'type': 'param'}, {'name': 'DC Filter', 'type': 'param'}]}, {'className': 'Echo', 'deviceName': 'Echo', 'encoders': [{'name': 'L 16th'}, {'name': 'R 16th'}, {'name': 'L Synced'}, {'name': 'R Synced'}, {'name': 'Feedback'}, {'name': 'Output'}, {'name': 'Reverb Level'}, {'name': 'Dry Wet'}, {'name': 'Reverb Decay'}, {'name': 'Input Gain'}, {'name': 'Repitch Smoothing Time'}, {'name': 'Stereo Width'}, {'name': 'Gate Thr'}, {'name': 'Gate Release'}, {'name': 'Duck Thr'}, {'name': 'Duck Release'}, {'name': 'HP Freq'}, {'name': 'HP Res'}, {'name': 'L Time'}, {'name': 'R Time'}, {'name': 'L Offset'}, {'name': 'R Offset'}, {'name': 'LP Freq'}, {'name': 'Wobble Mrph'}, {'name': 'LP Res'}, {'name': 'Mod Freq'}, {'name': 'Mod Rate'}, {'name': 'Mod Phase'}, {'name': 'Env Mix'}, {'name': 'Dly < Mod'}, {'name': 'Flt < Mod'}, {'name': 'Noise Amt'}, {'name': 'Noise Mrph'}, {'name': 'Wobble Amt'}], 'buttons': [{'name': 'Link', 'type': 'param'}, {'name': 'Channel Mode', 'type': 'param'}, {'name': 'L Sync Mode', 'type': 'param'}, {'name': 'R Sync Mode', 'type': 'param'}, {'name': 'Gate On', 'type': 'param'}, {'name': 'Duck On', 'type': 'param'}, {'name': 'Noise On', 'type': 'param'}, {'name': 'Wobble On', 'type': 'param'}, {'name': 'L Sync', 'type': 'param'}, {'name': 'R Sync', 'type': 'param'}, {'name': 'Repitch', 'type': 'param'}, {'name': 'FB Invert', 'type': 'param'}, {'name': 'Clip Dry', 'type': 'param'}, {'name': 'Filter On', 'type': 'param'}, {'name': 'Mod Wave', 'type': 'param'}, {'name': 'Mod Sync', 'type': 'param'}, {'name': 'Mod 4x', 'type': 'param'}, {'name': 'Reverb Loc', 'type': 'param'}]}, {'className': 'DrumBuss', 'deviceName': 'Drum Buss', 'encoders': [{'name': 'Drive'}, {'name': 'Crunch'}, {'name': 'Damping Freq'}, {'name': 'Transients'}, {'name': 'Boom Freq'}, {'name': 'Boom Amt'}, {'name': 'Output'}, {'name': 'Dry/Wet'}, {'name': 'Trim'}, {'name': 'Boom Decay'}], 'buttons': [{'name': 'Compressor On', 'type': 'param'}, {'name': 'Drive Type', 'type': 'param'}, {'name': 'Boom Audition', 'type': 'param'}]}, {'className': 'MxDeviceAudioEffect', 'deviceName': 'LFO', 'encoders': [{'name': 'Rate'}, {'name': 'Depth'}, {'name': 'Jitter'}, {'name': 'Offset'}, {'name': 'Phase'}, {'name': 'Smooth'}, {'name': 'Wave Shape'}], 'buttons': [{'name': 'Time Mode', 'type': 'param'}, {'name': 'Shape', 'type': 'param'}, {'name': 'Steps', 'type': 'param'}, {'name': 'Rate', 'type': 'param'}, {'name': 'x10', 'type': 'param'}, {'name': 'Hold', 'type': 'param'}, {'name': 'Re-Trigger', 'type': 'param'}]}, {'className': 'PhaserNew', 'deviceName': 'Phaser-Flanger', 'encoders': [{'name': 'Mod Freq'}, {'name': 'Mod Rate'}, {'name': 'Amount'}, {'name': 'Feedback'}, {'name': 'Warmth'}, {'name': 'Spread'}, {'name': 'Output'}, {'name': 'Dry/Wet'}, {'name': 'Flanger Time'}, {'name': 'Doubler Time'}, {'name': 'Mod Phase'}, {'name': 'Spin'}, {'name': 'Duty Cycle'}, {'name': 'Lfo Blend'}, {'name': 'Env Amount'}, {'name': 'Env Attack'}, {'name': 'Env Release'}, {'name': 'Notches'}, {'name': 'Mod Blend'}, {'name': 'Center Freq'}, {'name': 'Safe Freq'}, {'name': 'Mod Freq 2'}, {'name': 'Mod Rate 2'}], 'buttons': [{'name': 'Mode', 'type': 'param'}, {'name': 'Mod Sync', 'type': 'param'}, {'name': 'Mod Wave', 'type': 'param'}, {'name': 'Mod Sync 2', 'type': 'param'}, {'name': 'Spin Enabled', 'type': 'param'}, {'name': 'Env Enabled', 'type': 'param'}, {'name': 'FB Invert', 'type': 'param'}]}, {'className': 'Saturator', 'deviceName': 'Saturator', 'encoders': [{'name': 'Drive'}, {'name': 'Output'}, {'name': 'Threshold'}, {'name': 'Color Amt Low'}, {'name': 'Color Freq'}, {'name': 'Color Width'}, {'name': 'Color Amt Hi'}, {'name': 'Dry/Wet'}, {'name': 'WS Drive'}, {'name': 'WS Linearity'}, {'name': 'WS Curve'}, {'name': 'WS Damp'}, {'name': 'WS Period'}, {'name': 'WS Depth'}], 'buttons': [{'name': 'Type', 'type': 'param'}, {'name': 'Pre Dc Filter', 'type': 'param'}, {'name': 'Color On', 'type': 'param'}, {'name': 'Post Clip Mode', 'type': 'param'}]}, {'className': 'Shifter', 'deviceName': 'Shifter', 'encoders': [{'name': 'Pitch Fine'}, {'name': 'Pitch Coarse'}, {'name': 'Tone'}, {'name': 'Delay Time'}, {'name': 'FShift Coarse'}, {'name': 'Delay Synced'}, {'name': 'Delay Feedback'}, {'name': 'Dry/Wet'}, {'name': 'Lfo Amount Hz'}, {'name': 'Lfo Amount St'}, {'name': 'Lfo Rate Hz'}, {'name': 'Lfo S. Rate'}, {'name': 'Lfo Phase'}, {'name': 'Lfo Spin Amount'}, {'name': 'Lfo Offset'}, {'name': 'Lfo Width'}, {'name': 'Lfo Duty Cycle'}, {'name': 'Pitch Window'}, {'name': 'Mod Fine'}, {'name': 'RM Coarse'}, {'name': 'RM Drive Gain'}, {'name': 'MidiPitch Glide'}, {'name': 'Env Attack'}, {'name': 'Env Release'}, {'name': 'Env Amount Hz'}, {'name': 'Env Amount St'}], 'buttons': [{'name': 'Mode', 'type': 'param'}, {'name': 'Delay On', 'type': 'param'}, {'name': 'Delay Sync', 'type': 'param'}, {'name': 'Env On', 'type': 'param'}, {'name': 'Lfo Waveform', 'type': 'param'}, {'name': 'Lfo Sync', 'type': 'param'}, {'name': 'Lfo Spin', 'type': 'param'}, {'name': 'RM Drive', 'type': 'param'}, {'name': 'Wide', 'type': 'param'}]}, {'className': 'MxDeviceMidiEffect', 'deviceName': 'SQ Sequencer', 'encoders': [{'name': 'PStep1', 'display': 'Note 1'}, {'name': 'PStep2', 'display': 'Note 2'}, {'name': 'PStep3', 'display': 'Note 3'}, {'name': 'PStep4', 'display': 'Note 4'}, {'name': 'PStep5', 'display': 'Note 5'}, {'name': 'PStep6', 'display': 'Note 6'}, {'name': 'PStep7', 'display': 'Note 7'}, {'name': 'PStep8', 'display': 'Note 8'}, {'name': 'VelStep1', 'display': 'Vel 1'}, {'name': 'VelStep2', 'display': 'Vel 2'}, {'name': 'VelStep3', 'display': 'Vel 3'}, {'name': 'VelStep4', 'display': 'Vel 4'}, {'name': 'VelStep5', 'display': 'Vel 5'}, {'name': 'VelStep6', 'display': 'Vel 6'}, {'name': 'VelStep7', 'display': 'Vel 7'}, {'name': 'VelStep8', 'display': 'Vel 8'}, {'name': 'SQMax', 'display': 'Seq length'}, {'name': 'Swing'}, {'name': 'LStep1'}, {'name': 'LStep2'}, {'name': 'LStep3'}, {'name': 'LStep4'}, {'name': 'LStep5'}, {'name': 'LStep6'}, {'name': 'VelStep9'}, {'name': 'VelStep10'}, {'name': 'VelStep11'}, {'name': 'VelStep12'}, {'name': 'VelStep13'}, {'name': 'VelStep14'}, {'name': 'VelStep15'}, {'name': 'VelStep16'}, {'name': 'LStep9'}, {'name': 'LStep10'}, {'name': 'LStep11'}, {'name': 'LStep12'}, {'name': 'LStep13'}, {'name': 'LStep14'}, {'name': 'LStep15'}, {'name': 'LStep16'}, {'name': 'PStep10'}, {'name': 'PStep11'}, {'name': 'PStep12'}, {'name': 'PStep13'}, {'name': 'PStep14'}, {'name': 'PStep15'}, {'name': 'PStep16'}, {'name': 'PStep9'}, {'name': 'LStep7'}, {'name': 'LStep8'}, {'name': 'BPM'}, {'name': 'ConStep10'}, {'name': 'ConStep11'}, {'name': 'ConStep12'}, {'name': 'ConStep13'}, {'name': 'ConStep14'}, {'name': 'ConStep15'}, {'name': 'ConStep16'}, {'name': 'ConStep9'}, {'name': 'ConditionAll'}, {'name': 'ConditionMax1'}, {'name': 'ConditionMax2'}, {'name': 'ConditionMin1'}, {'name': 'ConditionMin2'}, {'name': 'CondRandRange'}, {'name': 'LengthMax1'}, {'name': 'LengthMax2'}, {'name': 'LengthMin2'}, {'name': 'LengthAll'}, {'name': 'LengthRandRange'}, {'name': 'LengthMin1'}, {'name': 'OStep1'}, {'name': 'OStep10'}, {'name': 'OStep11'}, {'name': 'OStep12'}, {'name': 'OStep13'}, {'name': 'OStep14'}, {'name': 'OStep15'}, {'name': 'OStep16'}, {'name': 'OStep2'}, {'name': 'OStep3'}, {'name': 'OStep4'}, {'name': 'OStep5'}, {'name': 'OStep6'}, {'name': 'OStep7'}, {'name': 'OStep8'}, {'name': 'OStep9'}, {'name': 'OctaveMax1'}, {'name': 'OctaveMax2'}, {'name': 'OctaveMin1'}, {'name': 'OctaveMin2'}, {'name': 'OctaveAll'}, {'name': 'OctaveRandRange'}, {'name': 'PitchMax1'}, {'name': 'PitchMax2'}, {'name': 'PitchMin1'}, {'name': 'PitchMin2'}, {'name': 'PitchAll'}, {'name': 'PitchRandRange'}, {'name': 'RatchetAll'}, {'name': 'RatchetMax1'}, {'name': 'RatchetMax2'}, {'name': 'RatchetMin1'}, {'name': 'RatchetMin2'}, {'name': 'RatStep1'}, {'name': 'RatStep10'}, {'name': 'RatStep11'}, {'name': 'RatStep12'}, {'name': 'RatStep13'}, {'name': 'RatStep14'}, {'name': 'RatStep15'}, {'name': 'RatStep16'}, {'name': 'RatStep2'}, {'name': 'RatStep3'}, {'name': 'RatStep4'}, {'name': 'RatStep5'}, {'name': 'RatStep6'}, {'name': 'RatStep7'}, {'name': 'RatStep8'}, {'name': 'RatStep9'}, {'name': 'RatchetRandRange'}, {'name': 'SQMax'}, {'name': 'SQMax2'}, {'name': 'SQMin'}, {'name': 'SQMin2'}, {'name': 'StepNumber'}, {'name': 'TimeShiftAll'}, {'name': 'TimeShiftMax1'}, {'name': 'TimeShiftMax2'}, {'name': 'TimeShiftMin1'}, {'name': 'TimeShiftMin2'}, {'name': 'TSRandRange'}, {'name': 'TShift1'}, {'name': 'TShift10'}, {'name': 'TShift11'}, {'name': 'TShift12'}, {'name': 'TShift13'}, {'name': 'TShift14'}, {'name': 'TShift15'}, {'name': 'TShift16'}, {'name': 'TShift2'}, {'name': 'TShift3'}, {'name': 'TShift4'}, {'name': 'TShift5'}, {'name': 'TShift6'}, {'name': 'TShift7'}, {'name': 'TShift8'}, {'name': 'TShift9'}, {'name': 'Tab'}, {'name': 'VelocityAll'}, {'name': 'VelocityMax1'}, {'name': 'VelocityMax2'}, {'name': 'VelocityMin1'}, {'name': 'VelocityMin2'}, {'name': 'VelRandRange'}], 'buttons': [{'name': 'RandPitch', 'display': 'Rnd Pitch', 'type': 'param', 'min_max': True}, {'name': 'VelRandom', 'display': 'Rnd Velocity', 'type': 'param', 'min_max': True}, {'name': 'RandLength', 'display': 'Rnd Length', 'type': 'param', 'min_max': True}, {'name': 'RandSteps', 'display': 'Rnd Steps', 'type': 'param', 'min_max': True}, {'name': 'ResetPitch', 'display': 'Reset Pitch', 'type': 'param'}, {'name': 'ResetVelocity', 'display': 'Reset Velocity', 'type': 'param'}, {'name': 'ResetLength', 'display': 'Reset Length', 'type': 'param'}, {'name': 'ResetSteps', 'display': 'Reset Steps', 'type': 'param'}, {'name': 'ScramblePitch', 'type': 'param', 'min_max': True}, {'name': 'ScrambleVel', 'type': 'param', 'min_max': True}, {'name': 'ScrambleLength', 'type': 'param', 'min_max': True}, {'name': 'ScrambleSteps', 'type': 'param', 'min_max': True}, {'name': 'ShiftLeft', 'type': 'param', 'min_max': True}, {'name': 'ShiftRight', 'type': 'param', 'min_max': True}, {'name': 'RandomSelect', 'type': 'param', 'min_max': True}, {'name': 'Scale', 'type': 'param'}, {'name': 'ResetOctave', 'type': 'param'}, {'name': 'ResetRatchet', 'type': 'param'}, {'name': 'ResetTS', 'type': 'param'}, {'name': 'RandOct', 'type': 'param', 'min_max': True}, {'name': 'ClockSource', 'type': 'param'}, {'name': 'ConditionDirection', 'type': 'param'}, {'name': 'ConditionLock', 'type': 'param'}, {'name': 'ScrambleCond', 'type': 'param', 'min_max': True}, {'name': 'ConditionRand', 'type': 'param', 'min_max': True}, {'name': 'Division', 'type': 'param'}, {'name': 'FollowRoot', 'type': 'param'}, {'name': 'FollowScales', 'type': 'param'}, {'name': 'LaneLock', 'type': 'param'}, {'name': 'LengthDirection', 'type': 'param'}, {'name': 'LengthLock', 'type': 'param'}, {'name': 'LockSelect', 'type': 'param'}, {'name': 'MIDItrnsp', 'type': 'param'}, {'name': 'OctaveDirection', 'type': 'param'}, {'name': 'ScrambleOct', 'type': 'param', 'min_max': True}, {'name': 'OctaveLock', 'type': 'param'}, {'name': 'PitchDirection', 'type': 'param'}, {'name': 'PitchLock', 'type': 'param'}, {'name': 'RandTS', 'type': 'param', 'min_max': True}, {'name': 'RatchetDirection', 'type': 'param'}, {'name': 'RatchetLock', 'type': 'param'}, {'name': 'RatchetRand', 'type': 'param', 'min_max': True}, {'name': 'ScrambleRatchet', 'type': 'param', 'min_max': True}, {'name': 'ResetCond', 'type': 'param', 'min_max': True}, {'name': 'SQ Run', 'type': 'param'}, {'name': 'SQDirection', 'type': 'param'}, {'name': 'ShiftDown', 'type': 'param', 'min_max': True}, {'name': 'ShiftUp', 'type': 'param', 'min_max': True}, {'name': 'StepMode', 'type': 'param'}, {'name': 'On/Off', 'type': 'param'}, {'name': 'StepRecord', 'type': 'param'}, {'name': 'TimeShiftDirection', 'type': 'param'}, {'name': 'ScrambleTS', 'type': 'param', 'min_max': True}, {'name': 'Time/MIDI', 'type': 'param'}, {'name': 'TimeShiftLock', 'type': 'param'}, {'name': 'VelocityDirection', 'type': 'param'}, {'name': 'VelocityLock', 'type': 'param'}, {'name': 'View', 'type': 'param'}, {'name': 'TimeMode', 'type': 'param'}, {'name': 'DotSync', 'type': 'param'}, {'name': 'Triplet', 'type': 'param'}]}, {'className': 'InstrumentGroupDevice', 'deviceName': 'SHED SKIN - LOW END GENERATOR RACK', 'encoders': [], 'buttons': [{'name': 'Macro 1', 'min_max': True, 'type': 'param'}]}]},
+            smart_zoning=True,
+            zone_tables_raw={'comment': 'Smart-zoning tables for the Grid dual-PO16 synth surface. Generated from grid-po16-synth-surface-plan §4/§5; names byte-exact vs devices_12.json.', 'zone_colors': {'osc': 'E0A33E', 'filter': '33B5A6', 'lfo': '9B8CE0', 'env': 'E06B86', 'global': '57B368', 'signature': '8A9A4B', 'character': '5B8BC4'}, 'template': {'encoders': [{'slot': 17, 'role': 'amp_attack', 'zone': 'env', 'display': 'Amp attack'}, {'slot': 18, 'role': 'amp_decay', 'zone': 'env', 'display': 'Amp decay'}, {'slot': 19, 'role': 'amp_sustain', 'zone': 'env', 'display': 'Amp sustain'}, {'slot': 20, 'role': 'amp_release', 'zone': 'env', 'display': 'Amp release'}, {'slot': 21, 'role': 'env2_attack', 'zone': 'env', 'display': 'Env 2 attack'}, {'slot': 22, 'role': 'env2_decay', 'zone': 'env', 'display': 'Env 2 decay'}, {'slot': 23, 'role': 'env2_sustain', 'zone': 'env', 'display': 'Env 2 sustain'}, {'slot': 24, 'role': 'env2_release', 'zone': 'env', 'display': 'Env 2 release'}, {'slot': 25, 'role': 'volume', 'zone': 'global', 'display': 'Volume'}, {'slot': 26, 'role': 'glide', 'zone': 'global', 'display': 'Glide'}, {'slot': 27, 'role': 'transpose', 'zone': 'global', 'display': 'Transpose'}, {'slot': 28, 'role': 'spread', 'zone': 'global', 'display': 'Spread'}, {'slot': 29, 'role': 'sig1', 'zone': 'signature', 'display': 'Signature 1'}, {'slot': 30, 'role': 'sig2', 'zone': 'signature', 'display': 'Signature 2'}, {'slot': 31, 'role': 'sig3', 'zone': 'signature', 'display': 'Signature 3'}, {'slot': 32, 'role': 'sig4', 'zone': 'signature', 'display': 'Signature 4'}, {'slot': 1, 'role': 'osc1_timbre', 'zone': 'osc', 'display': 'Osc 1 timbre'}, {'slot': 2, 'role': 'osc1_timbre2', 'zone': 'osc', 'display': 'Osc 1 timbre 2'}, {'slot': 3, 'role': 'osc1_pitch', 'zone': 'osc', 'display': 'Osc 1 pitch'}, {'slot': 4, 'role': 'osc1_level', 'zone': 'osc', 'display': 'Osc 1 level'}, {'slot': 5, 'role': 'osc2_timbre', 'zone': 'osc', 'display': 'Osc 2 timbre'}, {'slot': 6, 'role': 'osc2_detune', 'zone': 'osc', 'display': 'Osc 2 detune'}, {'slot': 7, 'role': 'osc2_pitch', 'zone': 'osc', 'display': 'Osc 2 pitch'}, {'slot': 8, 'role': 'osc2_level', 'zone': 'osc', 'display': 'Osc 2 level'}, {'slot': 9, 'role': 'cutoff', 'zone': 'filter', 'display': 'Cutoff'}, {'slot': 10, 'role': 'resonance', 'zone': 'filter', 'display': 'Resonance'}, {'slot': 11, 'role': 'filter_env_amt', 'zone': 'filter', 'display': 'Filter env amt'}, {'slot': 12, 'role': 'drive_morph', 'zone': 'filter', 'display': 'Drive / morph'}, {'slot': 13, 'role': 'lfo_rate', 'zone': 'lfo', 'display': 'LFO rate'}, {'slot': 14, 'role': 'lfo_depth', 'zone': 'lfo', 'display': 'LFO depth'}, {'slot': 15, 'role': 'lfo_shape', 'zone': 'lfo', 'display': 'LFO shape'}, {'slot': 16, 'role': 'lfo_extra', 'zone': 'lfo', 'display': 'LFO extra'}], 'buttons': [{'slot': 1, 'role': 'filt1', 'zone': 'filter', 'display': 'Filter A'}, {'slot': 2, 'role': 'filt2', 'zone': 'filter', 'display': 'Filter B'}, {'slot': 3, 'role': 'filt3', 'zone': 'filter', 'display': 'Filter C'}, {'slot': 4, 'role': 'filt4', 'zone': 'filter', 'display': 'Filter D'}, {'slot': 5, 'role': 'osc_b1', 'zone': 'osc', 'display': 'Osc A'}, {'slot': 6, 'role': 'osc_b2', 'zone': 'osc', 'display': 'Osc B'}, {'slot': 7, 'role': 'osc_b3', 'zone': 'osc', 'display': 'Osc C'}, {'slot': 8, 'role': 'osc_b4', 'zone': 'osc', 'display': 'Osc D'}, {'slot': 9, 'role': 'char1', 'zone': 'character', 'display': 'LFO sync'}, {'slot': 10, 'role': 'char2', 'zone': 'character', 'display': 'LFO retrig'}, {'slot': 11, 'role': 'char3', 'zone': 'character', 'display': 'Char 3'}, {'slot': 12, 'role': 'char4', 'zone': 'character', 'display': 'Char 4'}, {'slot': 13, 'role': 'char5', 'zone': 'character', 'display': 'Char 5'}, {'slot': 14, 'role': 'char6', 'zone': 'character', 'display': 'Char 6'}, {'slot': 15, 'role': 'char7', 'zone': 'character', 'display': 'Char 7'}, {'slot': 16, 'role': 'char8', 'zone': 'character', 'display': 'Device on'}]}, 'synths': {'InstrumentVector': {'display': 'Wavetable', 'encoders': {'amp_attack': {'name': 'Amp Attack'}, 'amp_decay': {'name': 'Amp Decay'}, 'amp_sustain': {'name': 'Amp Sustain'}, 'amp_release': {'name': 'Amp Release'}, 'env2_attack': {'name': 'Env 2 Attack'}, 'env2_decay': {'name': 'Env 2 Decay'}, 'env2_sustain': {'name': 'Env 2 Sustain'}, 'env2_release': {'name': 'Env 2 Release'}, 'volume': {'name': 'Volume'}, 'glide': {'name': 'Glide'}, 'transpose': {'name': 'Transpose'}, 'spread': {'name': 'Unison Amount'}, 'sig1': {'name': 'Sub Gain'}, 'sig2': {'name': 'Osc 1 Effect 2'}, 'sig3': {'name': 'Global Mod Amount'}, 'sig4': {'name': 'Filter 2 Freq'}, 'osc1_timbre': {'name': 'Osc 1 Pos'}, 'osc1_timbre2': {'name': 'Osc 1 Effect 1'}, 'osc1_pitch': {'name': 'Osc 1 Transp'}, 'osc1_level': {'name': 'Osc 1 Gain'}, 'osc2_timbre': {'name': 'Osc 2 Pos'}, 'osc2_detune': {'name': 'Osc 2 Detune'}, 'osc2_pitch': {'name': 'Osc 2 Transp'}, 'osc2_level': {'name': 'Osc 2 Gain'}, 'cutoff': {'name': 'Filter 1 Freq'}, 'resonance': {'name': 'Filter 1 Res'}, 'filter_env_amt': {'name': 'Filter 1 Drive'}, 'drive_morph': {'name': 'Filter 1 Morph'}, 'lfo_rate': {'name': 'LFO 1 Rate'}, 'lfo_depth': {'name': 'LFO 1 Amount'}, 'lfo_shape': {'name': 'LFO 1 Shape'}, 'lfo_extra': {'name': 'LFO 1 Shaping'}}, 'buttons': {'filt1': {'name': 'Filter 1 On'}, 'filt2': {'name': 'Filter 1 Type'}, 'filt3': {'name': 'Filter 1 LP/HP'}, 'filt4': {'name': 'Filter 2 On'}, 'osc_b1': {'name': 'Osc 1 On'}, 'osc_b2': {'name': 'Osc 2 On'}, 'osc_b3': {'name': 'Sub On'}, 'osc_b4': {'name': 'Sub Transpose'}, 'char1': {'name': 'LFO 1 Sync'}, 'char2': {'name': 'LFO 1 Retrigger'}, 'char3': {'name': 'LFO 2 Sync'}, 'char4': {'name': 'LFO 2 Retrigger'}, 'char5': {'name': 'Amp Loop Mode'}, 'char6': {'name': 'Env 2 Loop Mode'}, 'char7': {'name': 'Filter 1 Slope'}, 'char8': {'name': 'Device On'}}}, 'Drift': {'display': 'Drift', 'encoders': {'amp_attack': {'name': 'Env 1 Attack'}, 'amp_decay': {'name': 'Env 1 Decay'}, 'amp_sustain': {'name': 'Env 1 Sustain'}, 'amp_release': {'name': 'Env 1 Release'}, 'env2_attack': {'name': 'Env 2 Attack'}, 'env2_decay': {'name': 'Env 2 Decay'}, 'env2_sustain': {'name': 'Env 2 Sustain'}, 'env2_release': {'name': 'Env 2 Release'}, 'volume': {'name': 'Volume'}, 'glide': {'name': 'Glide Time'}, 'transpose': {'name': 'Transpose'}, 'spread': {'name': 'Spread'}, 'sig1': {'name': 'Drift'}, 'sig2': {'name': 'Thickness'}, 'sig3': {'name': 'Strength'}, 'sig4': {'name': 'Noise Gain'}, 'osc1_timbre': {'name': 'Osc 1 Shape'}, 'osc1_timbre2': {'name': 'Osc 1 Shape Mod Amt'}, 'osc1_pitch': {'name': 'Osc 1 Oct'}, 'osc1_level': {'name': 'Osc 1 Gain'}, 'osc2_timbre': {'name': 'Osc 2 Wave'}, 'osc2_detune': {'name': 'Osc 2 Detune'}, 'osc2_pitch': {'name': 'Osc 2 Oct'}, 'osc2_level': {'name': 'Osc 2 Gain'}, 'cutoff': {'name': 'LP Freq'}, 'resonance': {'name': 'LP Reso'}, 'filter_env_amt': {'name': 'LP Mod Amt 1'}, 'drive_morph': {'name': 'HP Freq'}, 'lfo_rate': {'name': 'LFO Rate'}, 'lfo_depth': {'name': 'LFO Amt'}, 'lfo_shape': {'name': 'LFO Wave'}, 'lfo_extra': {'name': 'LFO Mod Amt'}}, 'buttons': {'filt1': {'name': 'Osc 1 Flt On'}, 'filt2': {'name': 'LP Type'}, 'filt3': {'name': 'Osc 2 Flt On'}, 'filt4': {'name': 'Noise Flt On'}, 'osc_b1': {'name': 'Osc 1 On'}, 'osc_b2': {'name': 'Osc 2 On'}, 'osc_b3': {'name': 'Noise On'}, 'osc_b4': {'name': 'Osc 1 Wave'}, 'char1': {'name': 'LFO Synced'}, 'char2': {'name': 'LFO Retrig On'}, 'char3': {'name': 'LFO Time Mode'}, 'char4': {'name': 'Osc Retrig On'}, 'char5': {'name': 'Env 2 Cyc On'}, 'char6': {'name': 'Legato On'}, 'char7': {'name': 'Cyc Env Time Mode'}, 'char8': {'name': 'Device On'}}}, 'Operator': {'display': 'Operator', 'encoders': {'amp_attack': {'name': 'Ae Attack'}, 'amp_decay': {'name': 'Ae Decay'}, 'amp_sustain': {'name': 'Ae Sustain'}, 'amp_release': {'name': 'Ae Release'}, 'env2_attack': {'name': 'Fe Attack'}, 'env2_decay': {'name': 'Fe Decay'}, 'env2_sustain': {'name': 'Fe Sustain'}, 'env2_release': {'name': 'Fe Release'}, 'volume': {'name': 'Volume'}, 'glide': {'name': 'Glide Time'}, 'transpose': {'name': 'Transpose'}, 'spread': {'name': 'Spread'}, 'sig1': {'name': 'Tone'}, 'sig2': {'name': 'Time'}, 'sig3': {'name': 'Pe Amount'}, 'sig4': {'name': 'Shaper Drive'}, 'osc1_timbre': {'controlledBy': 'A Fix On ', 'group': [{'name': 'A Coarse', 'activeWhen': [0]}, {'name': 'A Fix Freq', 'display': 'A Freq', 'activeWhen': [1]}]}, 'osc1_timbre2': {'controlledBy': 'A Fix On ', 'group': [{'name': 'A Fine', 'activeWhen': [0]}, {'name': 'A Fix Freq Mul', 'display': 'A Multi', 'activeWhen': [1]}]}, 'osc1_pitch': {'name': 'Osc-A Wave'}, 'osc1_level': {'name': 'Osc-A Level'}, 'osc2_timbre': {'controlledBy': 'B Fix On ', 'group': [{'name': 'B Coarse', 'activeWhen': [0]}, {'name': 'B Fix Freq', 'display': 'B Freq', 'activeWhen': [1]}]}, 'osc2_detune': {'controlledBy': 'B Fix On ', 'group': [{'name': 'B Fine', 'activeWhen': [0]}, {'name': 'B Fix Freq Mul', 'display': 'B Multi', 'activeWhen': [1]}]}, 'osc2_pitch': {'name': 'Osc-B Wave'}, 'osc2_level': {'name': 'Osc-B Level'}, 'cutoff': {'name': 'Filter Freq'}, 'resonance': {'name': 'Filter Res'}, 'filter_env_amt': {'name': 'Fe Amount'}, 'drive_morph': {'name': 'Filter Drive'}, 'lfo_rate': {'name': 'LFO Rate'}, 'lfo_depth': {'name': 'LFO Amt'}, 'lfo_shape': {'name': 'LFO Type'}, 'lfo_extra': {'name': 'LFO Amt B'}}, 'buttons': {'filt1': {'name': 'Filter On'}, 'filt2': {'name': 'Filter Type'}, 'filt3': {'name': 'Filter Circuit - LP/HP'}, 'filt4': {'name': 'Filt < LFO'}, 'osc_b1': {'name': 'Osc-A On'}, 'osc_b2': {'name': 'Osc-B On'}, 'osc_b3': {'name': 'A Fix On '}, 'osc_b4': {'name': 'B Fix On '}, 'char1': {'name': 'LFO Sync'}, 'char2': {'name': 'LFO Retrigger'}, 'char3': {'name': 'LFO On'}, 'char4': {'name': 'Algorithm'}, 'char5': {'name': 'Ae Loop'}, 'char6': {'name': 'Fe Loop'}, 'char7': {'name': 'Glide On'}, 'char8': {'name': 'Device On'}}}, 'UltraAnalog': {'display': 'Analog', 'encoders': {'amp_attack': {'name': 'AEG1 Attack'}, 'amp_decay': {'name': 'AEG1 Decay'}, 'amp_sustain': {'name': 'AEG1 Sustain'}, 'amp_release': {'name': 'AEG1 Rel'}, 'env2_attack': {'name': 'FEG1 Attack'}, 'env2_decay': {'name': 'FEG1 Decay'}, 'env2_sustain': {'name': 'FEG1 Sustain'}, 'env2_release': {'name': 'FEG1 Rel'}, 'volume': {'name': 'Volume'}, 'glide': {'name': 'Glide Time'}, 'transpose': {'name': 'Semitone'}, 'spread': {'name': 'Unison Detune'}, 'sig1': {'name': 'Vib Amount'}, 'sig2': {'name': 'Vib Speed'}, 'sig3': {'name': 'Noise Level'}, 'sig4': {'name': 'Noise Color'}, 'osc1_timbre': {'name': 'OSC1 Shape'}, 'osc1_timbre2': {'name': 'OSC1 PW'}, 'osc1_pitch': {'name': 'OSC1 Octave'}, 'osc1_level': {'name': 'OSC1 Level'}, 'osc2_timbre': {'name': 'OSC2 Shape'}, 'osc2_detune': {'name': 'OSC2 Detune'}, 'osc2_pitch': {'name': 'OSC2 Octave'}, 'osc2_level': {'name': 'OSC2 Level'}, 'cutoff': {'name': 'F1 Freq'}, 'resonance': {'name': 'F1 Resonance'}, 'filter_env_amt': {'name': 'F1 Freq < Env'}, 'drive_morph': {'name': 'F1 Drive'}, 'lfo_rate': {'name': 'LFO1 Speed'}, 'lfo_depth': {'name': 'F1 Freq < LFO'}, 'lfo_shape': {'name': 'LFO1 Shape'}, 'lfo_extra': {'name': 'LFO1 Fade In'}}, 'buttons': {'filt1': {'name': 'F1 On/Off'}, 'filt2': {'name': 'F1 Type'}, 'filt3': {'name': 'F2 On/Off'}, 'filt4': {'name': 'F2 Type'}, 'osc_b1': {'name': 'OSC1 On/Off'}, 'osc_b2': {'name': 'OSC2 On/Off'}, 'osc_b3': {'name': 'Noise On/Off'}, 'osc_b4': {'name': 'O1 Sub/Sync'}, 'char1': {'name': 'LFO1 Sync'}, 'char2': {'name': 'LFO1 Retrig'}, 'char3': {'name': 'Unison On/Off'}, 'char4': {'name': 'Vib On/Off'}, 'char5': {'name': 'Glide On/Off'}, 'char6': {'name': 'Glide Legato'}, 'char7': {'name': 'Glide Mode'}, 'char8': {'name': 'Device On'}}}}},
+            encoder_slot_count=32,
+            hud_cells=[(0, 0, 'button', 4, 0, 0), (1, 0, 'button', 4, 4, 0), (2, 0, 'button', 4, 8, 0), (3, 0, 'button', 4, 12, 0), (0, 1, 'dial', 4, 0, 0), (1, 1, 'dial', 4, 4, 0), (2, 1, 'dial', 4, 8, 0), (3, 1, 'dial', 4, 12, 0), (0, 2, 'dial', 4, 16, 0), (1, 2, 'dial', 4, 20, 0), (2, 2, 'dial', 4, 24, 0), (3, 2, 'dial', 4, 28, 0), (0, 3, 'button', 4, 16, 0), (1, 3, 'button', 4, 20, 0), (2, 3, 'button', 4, 24, 0), (3, 3, 'button', 4, 28, 0)],
+            hud_dividers=[2],
+            mode_hud_labels={'main_mode': {('button', 18): ('dev on/off', ''), ('button', 16): ('mute', ''), ('button', 17): ('solo', ''), ('button', 19): ('Mono on/off', ''), ('button', 29): ('hud_toggle', ''), ('button', 31): ('device right', 'arrowtriangle.right.fill'), ('button', 30): ('device left', 'arrowtriangle.left.fill'), ('button', 25): ('device first-last', 'arrow.left.and.right'), ('button', 27): ('track inc', 'chevron.right'), ('button', 26): ('track dec', 'chevron.left'), ('button', 22): ('Back 8', ''), ('button', 23): ('Fwd 8', ''), ('button', 20): ('Move loop L', 'arrowshape.left.fill'), ('button', 21): ('Move loop R', 'arrowshape.right.fill'), ('button', 24): ('To loop start', 'arrow.left.to.line')}, 'shift_mode': {('dial', 19): ('volume', ''), ('dial', 18): ('pan', ''), ('dial', 20): ('send 1', ''), ('dial', 21): ('send 2', ''), ('dial', 22): ('send 3', ''), ('dial', 23): ('send 4', ''), ('dial', 24): ('send 5', ''), ('dial', 25): ('send 6', ''), ('dial', 26): ('send 7', ''), ('dial', 27): ('send 8', ''), ('button', 24): ('Rack Random', ''), ('button', 20): ('half loop', 'arrow.right.and.line.vertical.and.arrow.left'), ('button', 21): ('x2 loop', 'arrow.left.and.line.vertical.and.arrow.right'), ('button', 22): ('Move dev L', ''), ('button', 23): ('Move dev R', ''), ('button', 16): ('Rec Audio new', ''), ('button', 17): ('Rec Audio resample', ''), ('button', 18): ('Rec MIDI new', ''), ('button', 19): ('Audio -> Simpler', ''), ('button', 25): ('iterate_midi_pattern', ''), ('button', 26): ('Track L x3', ''), ('button', 27): ('Track R x3', ''), ('button', 31): ('page inc', 'chevron.down'), ('button', 30): ('page dec', 'chevron.up')}},
+            hud_trigger='summon',
+            button_behaviour='momentary'), share=self._share)
+
+        self._song.add_appointed_device_listener(self.on_device_selected)
+        # A device *replace* (e.g. Wavetable → Drift) doesn't reliably fire the
+        # appointed-device listener, so also observe the selected track and its
+        # device chain. The devices-list observer fires on any add/remove/replace
+        # and re-bursts against the live device; it is re-attached whenever the
+        # selected track changes.
+        self._devices_listener_track = None
+        self._song.view.add_selected_track_listener(self.on_selected_track_changed)
+        self._attach_track_devices_listener()
+
+
+        self.log_message(f"main_component finish init.")
+        self._previous_values = {}
+
+        self._lisetenr = OSCListener(self.manager, self.button_handler, port=58580,
+                                     name="ck_grid", hub=self.manager.io_hub)
+
+        # Compositor only: receive each secondary surface's forwarded HUD region
+        # and merge them into this surface's single combined HUD stream. The
+        # wiring is real (always present, syntax-checked) and gated on
+        # REGION_CONFIG — data, not a code string built in gen.py. None for
+        # standalone surfaces; one dict for a single secondary, a list of them
+        # (section order) for several.
+        REGION_CONFIG = None
+        if REGION_CONFIG is not None:
+            _regions = REGION_CONFIG if isinstance(REGION_CONFIG, list) else [REGION_CONFIG]
+            self._region_state = RegionSet([
+                RegionState(self._hud_client,
+                    dial_offset=region['dial_offset'],
+                    button_offset=region['button_offset'],
+                    on_commit=self._helpers.reemit_combined_burst,
+                    dial_count=region.get('dial_count', 0),
+                    button_count=region.get('button_count', 0))
+                for region in _regions])
+            self._remote.set_region_state(self._region_state)
+            self._region_listeners = [
+                RegionListener(self.manager, state, port=region['port'],
+                    name=f"ck_grid-region{i}", hub=self.manager.io_hub)
+                for i, (region, state) in enumerate(zip(_regions, self._region_state.regions))]
+
+        # Reverse mode channel (lc_parks only): the primary sends the active mode
+        # name to the secondary so holding shift on the primary switches the
+        # secondary's mappings too. Data, not code; None on standalone surfaces.
+        # role='sender' -> primary (this surface owns a shift mode-button; its
+        #                  port is a list when several secondaries follow it);
+        # role='listener' -> secondary (headless FSM driven remotely).
+        MODE_LINK = None
+        if MODE_LINK is not None:
+            if MODE_LINK['role'] == 'sender':
+                self._mode_sender = ModeSender('127.0.0.1', MODE_LINK['port'])
+            else:
+                self._mode_listener = ModeListener(self.manager, self,
+                    port=MODE_LINK['port'], name="ck_grid-mode", hub=self.manager.io_hub)
+
+        self._song.view.add_selected_parameter_listener(self._on_selected_parameter_changed)
+
+        # Dismiss the HUD when the user navigates away from the device
+        # (Session/Arrangement switch, leaving the device chain, opening a clip).
+        # We over-index on hiding: only a fresh device burst re-shows the HUD.
+        # Callbacks are directional so they can't race our own show burst. The
+        # broader "any GUI interaction" auto-hide (browser/mixer/etc.) lives in
+        # the Swift input monitor (hud-input-autohide-plan), not here.
+        self._app_view = Live.Application.get_application().view
+        self._register_app_view_listeners()
+
+    def _register_app_view_listeners(self):
+        try:
+            self._app_view.add_focused_document_view_listener(self._on_doc_view_changed)
+        except Exception as e:
+            self.log_message(f"HUD dismiss: failed to add focused_document_view listener: {e}")
+        # Note: the browser (and mixer/arrangement/etc.) are handled by the Swift
+        # HUD's global input monitor now (hud-input-autohide-plan) — any mac
+        # mouse/keyboard input in Ableton sticky-hides a summon HUD — not by
+        # enumerating view listeners here (Live's API can't even observe a click
+        # into an already-open docked browser).
+        try:
+            self._app_view.add_is_view_visible_listener('Detail/DeviceChain', self._on_detail_changed)
+        except Exception as e:
+            self.log_message(f"HUD dismiss: failed to add Detail/DeviceChain visibility listener: {e}")
+        try:
+            # Detail/Clip visibility gates the HUD under show-hud-on: summon
+            # (hud-summon-only-plan): opening a clip hides the HUD and keeps it
+            # silent through selection/mode bursts; closing it clears the gate.
+            # Unlike the other three (dismiss-only), this forwards BOTH directions.
+            self._app_view.add_is_view_visible_listener('Detail/Clip', self._on_clip_view_changed)
+            self._helpers.hud_clip_view_changed(self._app_view.is_view_visible('Detail/Clip'))
+        except Exception as e:
+            self.log_message(f"HUD dismiss: failed to add Detail/Clip visibility listener: {e}")
+
+    def _attach_track_devices_listener(self):
+        """Observe the selected track's device chain so a device *replace*
+        (Wavetable → Drift) — which doesn't reliably fire the appointed-device
+        listener — still re-bursts. Idempotent: detaches the previous track's
+        observer first, so repeated calls (e.g. on every track change) don't
+        stack listeners."""
+        self._teardown_track_devices_listener()
+        try:
+            track = self._song.view.selected_track
+        except Exception:
+            track = None
+        if track is None:
+            return
+        try:
+            track.add_devices_listener(self._on_track_devices_changed)
+            self._devices_listener_track = track
+        except Exception as e:
+            self.log_message(f"HUD: failed to add devices listener: {e}")
+
+    def _teardown_track_devices_listener(self):
+        track = getattr(self, '_devices_listener_track', None)
+        if track is None:
+            return
+        try:
+            track.remove_devices_listener(self._on_track_devices_changed)
+        except Exception:
+            pass
+        self._devices_listener_track = None
+
+    def _on_track_devices_changed(self):
+        # Device chain changed (add/remove/replace). Re-resolve the focused
+        # device and funnel through selected_device_changed; its fail-open guard
+        # treats a now-dead previous handle as changed and re-bursts for the live
+        # device.
+        self.fine(f"[listener] _on_track_devices_changed dev={getattr(self.selected_device(),'name',None)!r}")
+        self._helpers.selected_device_changed(self.selected_device())
+
+    def remove_app_view_listeners(self):
+        self._teardown_track_devices_listener()
+        try:
+            self._song.view.remove_selected_track_listener(self.on_selected_track_changed)
+        except Exception:
+            pass
+        try:
+            self._app_view.remove_focused_document_view_listener(self._on_doc_view_changed)
+        except Exception:
+            pass
+        try:
+            self._app_view.remove_is_view_visible_listener('Detail/DeviceChain', self._on_detail_changed)
+        except Exception:
+            pass
+        try:
+            self._app_view.remove_is_view_visible_listener('Detail/Clip', self._on_clip_view_changed)
+        except Exception:
+            pass
+
+    def _on_doc_view_changed(self):
+        # Session <-> Arrangement switch. Device selection never changes this, so
+        # an unconditional hide can't race our show burst. Note: Live emits this
+        # redundantly (several times per change); HIDE is idempotent so that's fine.
+        self.fine("[appview] _on_doc_view_changed -> hud_view_left")
+        self._helpers.hud_view_left()
+
+    def _on_detail_changed(self):
+        # Hide only when the device chain becomes hidden. Selecting a device makes
+        # it visible, so this won't fire a hide on selection.
+        try:
+            visible = self._app_view.is_view_visible('Detail/DeviceChain')
+            self.fine(f"[appview] _on_detail_changed device_chain_visible={visible}")
+            if not visible:
+                self._helpers.hud_view_left()
+        except Exception as e:
+            self.log_message(f"HUD dismiss: Detail/DeviceChain visibility check failed: {e}")
+
+    def _on_clip_view_changed(self):
+        # Detail/Clip visibility flipped. Both directions matter: visible=True
+        # hides + arms the clip-view gate, visible=False disarms it (without
+        # re-showing). The visibility table owns that logic.
+        try:
+            visible = self._app_view.is_view_visible('Detail/Clip')
+            self.fine(f"[appview] _on_clip_view_changed clip_visible={visible}")
+            self._helpers.hud_clip_view_changed(visible)
+        except Exception as e:
+            self.log_message(f"HUD dismiss: Detail/Clip visibility check failed: {e}")
+
+    def button_handler(self, button, send_value):
+        value = 127 if send_value > 0.0 else 0
+
+        self._helpers.device_parameter_action(self.selected_device(), button, -1, value, '<OSC Button Press>')
+
+    def remove_all_listeners(self, modes_only=False):
+        
+        self.knob_ch1_16_CC.remove_value_listener(self.knob_ch1_16_CC__mode_main_mode_slot1_listener)
+        self.knob_ch1_17_CC.remove_value_listener(self.knob_ch1_17_CC__mode_main_mode_slot2_listener)
+        self.knob_ch1_18_CC.remove_value_listener(self.knob_ch1_18_CC__mode_main_mode_slot3_listener)
+        self.knob_ch1_19_CC.remove_value_listener(self.knob_ch1_19_CC__mode_main_mode_slot4_listener)
+        self.knob_ch1_20_CC.remove_value_listener(self.knob_ch1_20_CC__mode_main_mode_slot5_listener)
+        self.knob_ch1_21_CC.remove_value_listener(self.knob_ch1_21_CC__mode_main_mode_slot6_listener)
+        self.knob_ch1_22_CC.remove_value_listener(self.knob_ch1_22_CC__mode_main_mode_slot7_listener)
+        self.knob_ch1_23_CC.remove_value_listener(self.knob_ch1_23_CC__mode_main_mode_slot8_listener)
+        self.knob_ch1_24_CC.remove_value_listener(self.knob_ch1_24_CC__mode_main_mode_slot9_listener)
+        self.knob_ch1_25_CC.remove_value_listener(self.knob_ch1_25_CC__mode_main_mode_slot10_listener)
+        self.knob_ch1_26_CC.remove_value_listener(self.knob_ch1_26_CC__mode_main_mode_slot11_listener)
+        self.knob_ch1_27_CC.remove_value_listener(self.knob_ch1_27_CC__mode_main_mode_slot12_listener)
+        self.knob_ch1_28_CC.remove_value_listener(self.knob_ch1_28_CC__mode_main_mode_slot13_listener)
+        self.knob_ch1_29_CC.remove_value_listener(self.knob_ch1_29_CC__mode_main_mode_slot14_listener)
+        self.knob_ch1_30_CC.remove_value_listener(self.knob_ch1_30_CC__mode_main_mode_slot15_listener)
+        self.knob_ch1_31_CC.remove_value_listener(self.knob_ch1_31_CC__mode_main_mode_slot16_listener)
+        self.knob_ch1_32_CC.remove_value_listener(self.knob_ch1_32_CC__mode_main_mode_slot17_listener)
+        self.knob_ch1_33_CC.remove_value_listener(self.knob_ch1_33_CC__mode_main_mode_slot18_listener)
+        self.knob_ch1_34_CC.remove_value_listener(self.knob_ch1_34_CC__mode_main_mode_slot19_listener)
+        self.knob_ch1_35_CC.remove_value_listener(self.knob_ch1_35_CC__mode_main_mode_slot20_listener)
+        self.knob_ch1_36_CC.remove_value_listener(self.knob_ch1_36_CC__mode_main_mode_slot21_listener)
+        self.knob_ch1_37_CC.remove_value_listener(self.knob_ch1_37_CC__mode_main_mode_slot22_listener)
+        self.knob_ch1_38_CC.remove_value_listener(self.knob_ch1_38_CC__mode_main_mode_slot23_listener)
+        self.knob_ch1_39_CC.remove_value_listener(self.knob_ch1_39_CC__mode_main_mode_slot24_listener)
+        self.knob_ch1_40_CC.remove_value_listener(self.knob_ch1_40_CC__mode_main_mode_slot25_listener)
+        self.knob_ch1_41_CC.remove_value_listener(self.knob_ch1_41_CC__mode_main_mode_slot26_listener)
+        self.knob_ch1_42_CC.remove_value_listener(self.knob_ch1_42_CC__mode_main_mode_slot27_listener)
+        self.knob_ch1_43_CC.remove_value_listener(self.knob_ch1_43_CC__mode_main_mode_slot28_listener)
+        self.knob_ch1_44_CC.remove_value_listener(self.knob_ch1_44_CC__mode_main_mode_slot29_listener)
+        self.knob_ch1_45_CC.remove_value_listener(self.knob_ch1_45_CC__mode_main_mode_slot30_listener)
+        self.knob_ch1_46_CC.remove_value_listener(self.knob_ch1_46_CC__mode_main_mode_slot31_listener)
+        self.knob_ch1_47_CC.remove_value_listener(self.knob_ch1_47_CC__mode_main_mode_slot32_listener)
+        self.button_ch1_50_note.remove_value_listener(self.button_ch1_50_note__mode_main_mode_p0_listener)
+        self.button_ch1_0_note.remove_value_listener(self.button_ch1_0_note__mode_main_mode_button1_listener)
+        self.button_ch1_1_note.remove_value_listener(self.button_ch1_1_note__mode_main_mode_button2_listener)
+        self.button_ch1_2_note.remove_value_listener(self.button_ch1_2_note__mode_main_mode_button3_listener)
+        self.button_ch1_3_note.remove_value_listener(self.button_ch1_3_note__mode_main_mode_button4_listener)
+        self.button_ch1_4_note.remove_value_listener(self.button_ch1_4_note__mode_main_mode_button5_listener)
+        self.button_ch1_5_note.remove_value_listener(self.button_ch1_5_note__mode_main_mode_button6_listener)
+        self.button_ch1_6_note.remove_value_listener(self.button_ch1_6_note__mode_main_mode_button7_listener)
+        self.button_ch1_7_note.remove_value_listener(self.button_ch1_7_note__mode_main_mode_button8_listener)
+        self.button_ch1_8_note.remove_value_listener(self.button_ch1_8_note__mode_main_mode_button9_listener)
+        self.button_ch1_9_note.remove_value_listener(self.button_ch1_9_note__mode_main_mode_button10_listener)
+        self.button_ch1_10_note.remove_value_listener(self.button_ch1_10_note__mode_main_mode_button11_listener)
+        self.button_ch1_11_note.remove_value_listener(self.button_ch1_11_note__mode_main_mode_button12_listener)
+        self.button_ch1_12_note.remove_value_listener(self.button_ch1_12_note__mode_main_mode_button13_listener)
+        self.button_ch1_13_note.remove_value_listener(self.button_ch1_13_note__mode_main_mode_button14_listener)
+        self.button_ch1_14_note.remove_value_listener(self.button_ch1_14_note__mode_main_mode_button15_listener)
+        self.button_ch1_15_note.remove_value_listener(self.button_ch1_15_note__mode_main_mode_button16_listener)
+        self.mixer.selected_strip().set_mute_button(None)
+        self.mixer.selected_strip().set_solo_button(None)
+        self.button_ch1_51_note.remove_value_listener(self.button_ch1_51_note__mode_main_mode_fn_toggle_mono_on_master_listener)
+        self.button_ch1_61_note.remove_value_listener(self.button_ch1_61_note__mode_main_mode_fn_hud_toggle_listener)
+        self.button_ch1_63_note.remove_value_listener(self.button_ch1_63_note__mode_main_mode_right_listener)
+        self.button_ch1_62_note.remove_value_listener(self.button_ch1_62_note__mode_main_mode_left_listener)
+        self.button_ch1_57_note.remove_value_listener(self.button_ch1_57_note__mode_main_mode_first_last_listener)
+        self.button_ch1_59_note.remove_value_listener(self.button_ch1_59_note__mode_main_mode_inc_listener)
+        self.button_ch1_58_note.remove_value_listener(self.button_ch1_58_note__mode_main_mode_dec_listener)
+        self.button_ch1_54_note.remove_value_listener(self.button_ch1_54_note__mode_main_mode_fn_back8_listener)
+        self.button_ch1_55_note.remove_value_listener(self.button_ch1_55_note__mode_main_mode_fn_fwd8_listener)
+        self.button_ch1_52_note.remove_value_listener(self.button_ch1_52_note__mode_main_mode_fn_move_loop_left_listener)
+        self.button_ch1_53_note.remove_value_listener(self.button_ch1_53_note__mode_main_mode_fn_move_loop_right_listener)
+        self.button_ch1_56_note.remove_value_listener(self.button_ch1_56_note__mode_main_mode_fn_move_playhead_to_loop_start_listener)
+
+
+        self.mixer.selected_strip().set_volume_control(None)
+        self.mixer.selected_strip().set_pan_control(None)
+        self.mixer.selected_strip().set_send_controls(None)
+        self.knob_ch1_16_CC.remove_value_listener(self.knob_ch1_16_CC__mode_shift_mode_slot33_listener)
+        self.knob_ch1_17_CC.remove_value_listener(self.knob_ch1_17_CC__mode_shift_mode_slot34_listener)
+        self.knob_ch1_18_CC.remove_value_listener(self.knob_ch1_18_CC__mode_shift_mode_slot35_listener)
+        self.knob_ch1_19_CC.remove_value_listener(self.knob_ch1_19_CC__mode_shift_mode_slot36_listener)
+        self.knob_ch1_20_CC.remove_value_listener(self.knob_ch1_20_CC__mode_shift_mode_slot37_listener)
+        self.knob_ch1_21_CC.remove_value_listener(self.knob_ch1_21_CC__mode_shift_mode_slot38_listener)
+        self.knob_ch1_22_CC.remove_value_listener(self.knob_ch1_22_CC__mode_shift_mode_slot39_listener)
+        self.knob_ch1_23_CC.remove_value_listener(self.knob_ch1_23_CC__mode_shift_mode_slot40_listener)
+        self.knob_ch1_24_CC.remove_value_listener(self.knob_ch1_24_CC__mode_shift_mode_slot41_listener)
+        self.knob_ch1_25_CC.remove_value_listener(self.knob_ch1_25_CC__mode_shift_mode_slot42_listener)
+        self.knob_ch1_26_CC.remove_value_listener(self.knob_ch1_26_CC__mode_shift_mode_slot43_listener)
+        self.knob_ch1_27_CC.remove_value_listener(self.knob_ch1_27_CC__mode_shift_mode_slot44_listener)
+        self.knob_ch1_28_CC.remove_value_listener(self.knob_ch1_28_CC__mode_shift_mode_slot45_listener)
+        self.knob_ch1_29_CC.remove_value_listener(self.knob_ch1_29_CC__mode_shift_mode_slot46_listener)
+        self.knob_ch1_30_CC.remove_value_listener(self.knob_ch1_30_CC__mode_shift_mode_slot47_listener)
+        self.knob_ch1_31_CC.remove_value_listener(self.knob_ch1_31_CC__mode_shift_mode_slot48_listener)
+        self.button_ch1_0_note.remove_value_listener(self.button_ch1_0_note__mode_shift_mode_button17_listener)
+        self.button_ch1_1_note.remove_value_listener(self.button_ch1_1_note__mode_shift_mode_button18_listener)
+        self.button_ch1_2_note.remove_value_listener(self.button_ch1_2_note__mode_shift_mode_button19_listener)
+        self.button_ch1_3_note.remove_value_listener(self.button_ch1_3_note__mode_shift_mode_button20_listener)
+        self.button_ch1_4_note.remove_value_listener(self.button_ch1_4_note__mode_shift_mode_button21_listener)
+        self.button_ch1_5_note.remove_value_listener(self.button_ch1_5_note__mode_shift_mode_button22_listener)
+        self.button_ch1_6_note.remove_value_listener(self.button_ch1_6_note__mode_shift_mode_button23_listener)
+        self.button_ch1_7_note.remove_value_listener(self.button_ch1_7_note__mode_shift_mode_button24_listener)
+        self.button_ch1_8_note.remove_value_listener(self.button_ch1_8_note__mode_shift_mode_button25_listener)
+        self.button_ch1_9_note.remove_value_listener(self.button_ch1_9_note__mode_shift_mode_button26_listener)
+        self.button_ch1_10_note.remove_value_listener(self.button_ch1_10_note__mode_shift_mode_button27_listener)
+        self.button_ch1_11_note.remove_value_listener(self.button_ch1_11_note__mode_shift_mode_button28_listener)
+        self.button_ch1_12_note.remove_value_listener(self.button_ch1_12_note__mode_shift_mode_button29_listener)
+        self.button_ch1_13_note.remove_value_listener(self.button_ch1_13_note__mode_shift_mode_button30_listener)
+        self.button_ch1_14_note.remove_value_listener(self.button_ch1_14_note__mode_shift_mode_button31_listener)
+        self.button_ch1_15_note.remove_value_listener(self.button_ch1_15_note__mode_shift_mode_button32_listener)
+        self.button_ch1_56_note.remove_value_listener(self.button_ch1_56_note__mode_shift_mode_fn_press_rack_random_button_listener)
+        self.button_ch1_52_note.remove_value_listener(self.button_ch1_52_note__mode_shift_mode_fn_halve_loop_length_listener)
+        self.button_ch1_53_note.remove_value_listener(self.button_ch1_53_note__mode_shift_mode_fn_double_loop_length_listener)
+        self.button_ch1_54_note.remove_value_listener(self.button_ch1_54_note__mode_shift_mode_fn_move_device_left_listener)
+        self.button_ch1_55_note.remove_value_listener(self.button_ch1_55_note__mode_shift_mode_fn_move_device_right_listener)
+        self.button_ch1_48_note.remove_value_listener(self.button_ch1_48_note__mode_shift_mode_fn_create_audio_track_taking_input_from_selected_track_listener)
+        self.button_ch1_49_note.remove_value_listener(self.button_ch1_49_note__mode_shift_mode_fn_record_audio_resample_listener)
+        self.button_ch1_50_note.remove_value_listener(self.button_ch1_50_note__mode_shift_mode_fn_record_midi_from_track_to_new_track_listener)
+        self.button_ch1_51_note.remove_value_listener(self.button_ch1_51_note__mode_shift_mode_fn_selected_audio_to_simpler_in_new_track_listener)
+        self.button_ch1_57_note.remove_value_listener(self.button_ch1_57_note__mode_shift_mode_fn_iterate_midi_pattern_listener)
+        self.button_ch1_58_note.remove_value_listener(self.button_ch1_58_note__mode_shift_mode_fn_track_nav_left_x3_listener)
+        self.button_ch1_59_note.remove_value_listener(self.button_ch1_59_note__mode_shift_mode_fn_track_nav_right_x3_listener)
+        self.button_ch1_63_note.remove_value_listener(self.button_ch1_63_note__mode_shift_mode_pager_encoder_inc_listener)
+        self.button_ch1_62_note.remove_value_listener(self.button_ch1_62_note__mode_shift_mode_pager_encoder_dec_listener)
+
+
+        if not modes_only:
+            self.mode_button.remove_value_listener(self.mode_button_listener)
+    
+
+    def debug(self):
+        return self.manager.debug
+
+    def update_selected_device(self):
+        self._helpers.selected_device_changed(self.selected_device())
+
+    def setup_controls(self):
+        
+        self.knob_ch1_16_CC = EncoderElement(MIDI_CC_TYPE, 0, 16, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_17_CC = EncoderElement(MIDI_CC_TYPE, 0, 17, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_18_CC = EncoderElement(MIDI_CC_TYPE, 0, 18, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_19_CC = EncoderElement(MIDI_CC_TYPE, 0, 19, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_20_CC = EncoderElement(MIDI_CC_TYPE, 0, 20, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_21_CC = EncoderElement(MIDI_CC_TYPE, 0, 21, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_22_CC = EncoderElement(MIDI_CC_TYPE, 0, 22, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_23_CC = EncoderElement(MIDI_CC_TYPE, 0, 23, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_24_CC = EncoderElement(MIDI_CC_TYPE, 0, 24, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_25_CC = EncoderElement(MIDI_CC_TYPE, 0, 25, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_26_CC = EncoderElement(MIDI_CC_TYPE, 0, 26, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_27_CC = EncoderElement(MIDI_CC_TYPE, 0, 27, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_28_CC = EncoderElement(MIDI_CC_TYPE, 0, 28, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_29_CC = EncoderElement(MIDI_CC_TYPE, 0, 29, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_30_CC = EncoderElement(MIDI_CC_TYPE, 0, 30, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_31_CC = EncoderElement(MIDI_CC_TYPE, 0, 31, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_32_CC = EncoderElement(MIDI_CC_TYPE, 0, 32, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_33_CC = EncoderElement(MIDI_CC_TYPE, 0, 33, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_34_CC = EncoderElement(MIDI_CC_TYPE, 0, 34, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_35_CC = EncoderElement(MIDI_CC_TYPE, 0, 35, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_36_CC = EncoderElement(MIDI_CC_TYPE, 0, 36, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_37_CC = EncoderElement(MIDI_CC_TYPE, 0, 37, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_38_CC = EncoderElement(MIDI_CC_TYPE, 0, 38, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_39_CC = EncoderElement(MIDI_CC_TYPE, 0, 39, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_40_CC = EncoderElement(MIDI_CC_TYPE, 0, 40, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_41_CC = EncoderElement(MIDI_CC_TYPE, 0, 41, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_42_CC = EncoderElement(MIDI_CC_TYPE, 0, 42, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_43_CC = EncoderElement(MIDI_CC_TYPE, 0, 43, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_44_CC = EncoderElement(MIDI_CC_TYPE, 0, 44, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_45_CC = EncoderElement(MIDI_CC_TYPE, 0, 45, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_46_CC = EncoderElement(MIDI_CC_TYPE, 0, 46, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_47_CC = EncoderElement(MIDI_CC_TYPE, 0, 47, Live.MidiMap.MapMode.absolute)
+        self.button_ch1_50_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 50)
+        self.button_ch1_0_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 0)
+        self.button_ch1_1_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 1)
+        self.button_ch1_2_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 2)
+        self.button_ch1_3_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 3)
+        self.button_ch1_4_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 4)
+        self.button_ch1_5_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 5)
+        self.button_ch1_6_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 6)
+        self.button_ch1_7_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 7)
+        self.button_ch1_8_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 8)
+        self.button_ch1_9_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 9)
+        self.button_ch1_10_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 10)
+        self.button_ch1_11_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 11)
+        self.button_ch1_12_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 12)
+        self.button_ch1_13_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 13)
+        self.button_ch1_14_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 14)
+        self.button_ch1_15_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 15)
+        self.button_ch1_48_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 48)
+        self.button_ch1_49_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 49)
+        self.button_ch1_51_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 51)
+        self.button_ch1_61_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 61)
+        self.button_ch1_63_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 63)
+        self.button_ch1_62_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 62)
+        self.button_ch1_57_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 57)
+        self.button_ch1_59_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 59)
+        self.button_ch1_58_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 58)
+        self.button_ch1_54_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 54)
+        self.button_ch1_55_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 55)
+        self.button_ch1_52_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 52)
+        self.button_ch1_53_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 53)
+        self.button_ch1_56_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 56)
+        self.knob_ch1_35_CC = EncoderElement(MIDI_CC_TYPE, 0, 35, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_34_CC = EncoderElement(MIDI_CC_TYPE, 0, 34, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_36_CC = EncoderElement(MIDI_CC_TYPE, 0, 36, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_37_CC = EncoderElement(MIDI_CC_TYPE, 0, 37, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_38_CC = EncoderElement(MIDI_CC_TYPE, 0, 38, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_39_CC = EncoderElement(MIDI_CC_TYPE, 0, 39, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_40_CC = EncoderElement(MIDI_CC_TYPE, 0, 40, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_41_CC = EncoderElement(MIDI_CC_TYPE, 0, 41, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_42_CC = EncoderElement(MIDI_CC_TYPE, 0, 42, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_43_CC = EncoderElement(MIDI_CC_TYPE, 0, 43, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_16_CC = EncoderElement(MIDI_CC_TYPE, 0, 16, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_17_CC = EncoderElement(MIDI_CC_TYPE, 0, 17, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_18_CC = EncoderElement(MIDI_CC_TYPE, 0, 18, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_19_CC = EncoderElement(MIDI_CC_TYPE, 0, 19, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_20_CC = EncoderElement(MIDI_CC_TYPE, 0, 20, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_21_CC = EncoderElement(MIDI_CC_TYPE, 0, 21, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_22_CC = EncoderElement(MIDI_CC_TYPE, 0, 22, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_23_CC = EncoderElement(MIDI_CC_TYPE, 0, 23, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_24_CC = EncoderElement(MIDI_CC_TYPE, 0, 24, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_25_CC = EncoderElement(MIDI_CC_TYPE, 0, 25, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_26_CC = EncoderElement(MIDI_CC_TYPE, 0, 26, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_27_CC = EncoderElement(MIDI_CC_TYPE, 0, 27, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_28_CC = EncoderElement(MIDI_CC_TYPE, 0, 28, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_29_CC = EncoderElement(MIDI_CC_TYPE, 0, 29, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_30_CC = EncoderElement(MIDI_CC_TYPE, 0, 30, Live.MidiMap.MapMode.absolute)
+        self.knob_ch1_31_CC = EncoderElement(MIDI_CC_TYPE, 0, 31, Live.MidiMap.MapMode.absolute)
+        self.button_ch1_0_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 0)
+        self.button_ch1_1_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 1)
+        self.button_ch1_2_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 2)
+        self.button_ch1_3_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 3)
+        self.button_ch1_4_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 4)
+        self.button_ch1_5_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 5)
+        self.button_ch1_6_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 6)
+        self.button_ch1_7_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 7)
+        self.button_ch1_8_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 8)
+        self.button_ch1_9_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 9)
+        self.button_ch1_10_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 10)
+        self.button_ch1_11_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 11)
+        self.button_ch1_12_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 12)
+        self.button_ch1_13_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 13)
+        self.button_ch1_14_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 14)
+        self.button_ch1_15_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 15)
+        self.button_ch1_56_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 56)
+        self.button_ch1_52_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 52)
+        self.button_ch1_53_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 53)
+        self.button_ch1_54_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 54)
+        self.button_ch1_55_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 55)
+        self.button_ch1_48_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 48)
+        self.button_ch1_49_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 49)
+        self.button_ch1_50_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 50)
+        self.button_ch1_51_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 51)
+        self.button_ch1_57_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 57)
+        self.button_ch1_58_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 58)
+        self.button_ch1_59_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 59)
+        self.button_ch1_63_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 63)
+        self.button_ch1_62_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 0, 62)
+        self.mode_main_mode_add_listeners()
+        
+        self.current_mode = self._modes['main_mode']
+        self.goto_mode(self._first_mode)
+        
+        
+        self.knob_ch1_36_CC_shift_mode_sends = [
+             self.knob_ch1_36_CC,
+            self.knob_ch1_37_CC,
+            self.knob_ch1_38_CC,
+            self.knob_ch1_39_CC,
+            self.knob_ch1_40_CC,
+            self.knob_ch1_41_CC,
+            self.knob_ch1_42_CC,
+            self.knob_ch1_43_CC
+        ]
+    
+
+
+    def _on_selected_parameter_changed(self):
+        if self.manager.debug:
+            param = self._song.view.selected_parameter
+            if param is not None:
+                if param.is_quantized:
+                    items = ", items: " +", ".join(param.value_items)
+                else:
+                    items = ""
+                self.log_message(f"Selected parameter changed:  {param.name} (value: {param.value}, min: {param.min}, max: {param.max}, is_quantized: {param.is_quantized}{items})")
+            else:
+                self.log_message("Selected parameter changed: None")
+
+
+    def mode_main_mode_add_listeners(self):
+        self.log_message(f'Adding listeners for mode main_mode')
+    
+
+        self.knob_ch1_16_CC.add_value_listener(self.knob_ch1_16_CC__mode_main_mode_slot1_listener)
+        self._previous_values['knob_ch1_16_CC__mode_main_mode_slot1_listener'] = 0
+        self.knob_ch1_17_CC.add_value_listener(self.knob_ch1_17_CC__mode_main_mode_slot2_listener)
+        self._previous_values['knob_ch1_17_CC__mode_main_mode_slot2_listener'] = 0
+        self.knob_ch1_18_CC.add_value_listener(self.knob_ch1_18_CC__mode_main_mode_slot3_listener)
+        self._previous_values['knob_ch1_18_CC__mode_main_mode_slot3_listener'] = 0
+        self.knob_ch1_19_CC.add_value_listener(self.knob_ch1_19_CC__mode_main_mode_slot4_listener)
+        self._previous_values['knob_ch1_19_CC__mode_main_mode_slot4_listener'] = 0
+        self.knob_ch1_20_CC.add_value_listener(self.knob_ch1_20_CC__mode_main_mode_slot5_listener)
+        self._previous_values['knob_ch1_20_CC__mode_main_mode_slot5_listener'] = 0
+        self.knob_ch1_21_CC.add_value_listener(self.knob_ch1_21_CC__mode_main_mode_slot6_listener)
+        self._previous_values['knob_ch1_21_CC__mode_main_mode_slot6_listener'] = 0
+        self.knob_ch1_22_CC.add_value_listener(self.knob_ch1_22_CC__mode_main_mode_slot7_listener)
+        self._previous_values['knob_ch1_22_CC__mode_main_mode_slot7_listener'] = 0
+        self.knob_ch1_23_CC.add_value_listener(self.knob_ch1_23_CC__mode_main_mode_slot8_listener)
+        self._previous_values['knob_ch1_23_CC__mode_main_mode_slot8_listener'] = 0
+        self.knob_ch1_24_CC.add_value_listener(self.knob_ch1_24_CC__mode_main_mode_slot9_listener)
+        self._previous_values['knob_ch1_24_CC__mode_main_mode_slot9_listener'] = 0
+        self.knob_ch1_25_CC.add_value_listener(self.knob_ch1_25_CC__mode_main_mode_slot10_listener)
+        self._previous_values['knob_ch1_25_CC__mode_main_mode_slot10_listener'] = 0
+        self.knob_ch1_26_CC.add_value_listener(self.knob_ch1_26_CC__mode_main_mode_slot11_listener)
+        self._previous_values['knob_ch1_26_CC__mode_main_mode_slot11_listener'] = 0
+        self.knob_ch1_27_CC.add_value_listener(self.knob_ch1_27_CC__mode_main_mode_slot12_listener)
+        self._previous_values['knob_ch1_27_CC__mode_main_mode_slot12_listener'] = 0
+        self.knob_ch1_28_CC.add_value_listener(self.knob_ch1_28_CC__mode_main_mode_slot13_listener)
+        self._previous_values['knob_ch1_28_CC__mode_main_mode_slot13_listener'] = 0
+        self.knob_ch1_29_CC.add_value_listener(self.knob_ch1_29_CC__mode_main_mode_slot14_listener)
+        self._previous_values['knob_ch1_29_CC__mode_main_mode_slot14_listener'] = 0
+        self.knob_ch1_30_CC.add_value_listener(self.knob_ch1_30_CC__mode_main_mode_slot15_listener)
+        self._previous_values['knob_ch1_30_CC__mode_main_mode_slot15_listener'] = 0
+        self.knob_ch1_31_CC.add_value_listener(self.knob_ch1_31_CC__mode_main_mode_slot16_listener)
+        self._previous_values['knob_ch1_31_CC__mode_main_mode_slot16_listener'] = 0
+        self.knob_ch1_32_CC.add_value_listener(self.knob_ch1_32_CC__mode_main_mode_slot17_listener)
+        self._previous_values['knob_ch1_32_CC__mode_main_mode_slot17_listener'] = 0
+        self.knob_ch1_33_CC.add_value_listener(self.knob_ch1_33_CC__mode_main_mode_slot18_listener)
+        self._previous_values['knob_ch1_33_CC__mode_main_mode_slot18_listener'] = 0
+        self.knob_ch1_34_CC.add_value_listener(self.knob_ch1_34_CC__mode_main_mode_slot19_listener)
+        self._previous_values['knob_ch1_34_CC__mode_main_mode_slot19_listener'] = 0
+        self.knob_ch1_35_CC.add_value_listener(self.knob_ch1_35_CC__mode_main_mode_slot20_listener)
+        self._previous_values['knob_ch1_35_CC__mode_main_mode_slot20_listener'] = 0
+        self.knob_ch1_36_CC.add_value_listener(self.knob_ch1_36_CC__mode_main_mode_slot21_listener)
+        self._previous_values['knob_ch1_36_CC__mode_main_mode_slot21_listener'] = 0
+        self.knob_ch1_37_CC.add_value_listener(self.knob_ch1_37_CC__mode_main_mode_slot22_listener)
+        self._previous_values['knob_ch1_37_CC__mode_main_mode_slot22_listener'] = 0
+        self.knob_ch1_38_CC.add_value_listener(self.knob_ch1_38_CC__mode_main_mode_slot23_listener)
+        self._previous_values['knob_ch1_38_CC__mode_main_mode_slot23_listener'] = 0
+        self.knob_ch1_39_CC.add_value_listener(self.knob_ch1_39_CC__mode_main_mode_slot24_listener)
+        self._previous_values['knob_ch1_39_CC__mode_main_mode_slot24_listener'] = 0
+        self.knob_ch1_40_CC.add_value_listener(self.knob_ch1_40_CC__mode_main_mode_slot25_listener)
+        self._previous_values['knob_ch1_40_CC__mode_main_mode_slot25_listener'] = 0
+        self.knob_ch1_41_CC.add_value_listener(self.knob_ch1_41_CC__mode_main_mode_slot26_listener)
+        self._previous_values['knob_ch1_41_CC__mode_main_mode_slot26_listener'] = 0
+        self.knob_ch1_42_CC.add_value_listener(self.knob_ch1_42_CC__mode_main_mode_slot27_listener)
+        self._previous_values['knob_ch1_42_CC__mode_main_mode_slot27_listener'] = 0
+        self.knob_ch1_43_CC.add_value_listener(self.knob_ch1_43_CC__mode_main_mode_slot28_listener)
+        self._previous_values['knob_ch1_43_CC__mode_main_mode_slot28_listener'] = 0
+        self.knob_ch1_44_CC.add_value_listener(self.knob_ch1_44_CC__mode_main_mode_slot29_listener)
+        self._previous_values['knob_ch1_44_CC__mode_main_mode_slot29_listener'] = 0
+        self.knob_ch1_45_CC.add_value_listener(self.knob_ch1_45_CC__mode_main_mode_slot30_listener)
+        self._previous_values['knob_ch1_45_CC__mode_main_mode_slot30_listener'] = 0
+        self.knob_ch1_46_CC.add_value_listener(self.knob_ch1_46_CC__mode_main_mode_slot31_listener)
+        self._previous_values['knob_ch1_46_CC__mode_main_mode_slot31_listener'] = 0
+        self.knob_ch1_47_CC.add_value_listener(self.knob_ch1_47_CC__mode_main_mode_slot32_listener)
+        self._previous_values['knob_ch1_47_CC__mode_main_mode_slot32_listener'] = 0
+        self.button_ch1_50_note.add_value_listener(self.button_ch1_50_note__mode_main_mode_p0_listener)
+        self._previous_values['button_ch1_50_note__mode_main_mode_p0_listener'] = 0
+        self.button_ch1_0_note.add_value_listener(self.button_ch1_0_note__mode_main_mode_button1_listener)
+        self._previous_values['button_ch1_0_note__mode_main_mode_button1_listener'] = 0
+        self.button_ch1_1_note.add_value_listener(self.button_ch1_1_note__mode_main_mode_button2_listener)
+        self._previous_values['button_ch1_1_note__mode_main_mode_button2_listener'] = 0
+        self.button_ch1_2_note.add_value_listener(self.button_ch1_2_note__mode_main_mode_button3_listener)
+        self._previous_values['button_ch1_2_note__mode_main_mode_button3_listener'] = 0
+        self.button_ch1_3_note.add_value_listener(self.button_ch1_3_note__mode_main_mode_button4_listener)
+        self._previous_values['button_ch1_3_note__mode_main_mode_button4_listener'] = 0
+        self.button_ch1_4_note.add_value_listener(self.button_ch1_4_note__mode_main_mode_button5_listener)
+        self._previous_values['button_ch1_4_note__mode_main_mode_button5_listener'] = 0
+        self.button_ch1_5_note.add_value_listener(self.button_ch1_5_note__mode_main_mode_button6_listener)
+        self._previous_values['button_ch1_5_note__mode_main_mode_button6_listener'] = 0
+        self.button_ch1_6_note.add_value_listener(self.button_ch1_6_note__mode_main_mode_button7_listener)
+        self._previous_values['button_ch1_6_note__mode_main_mode_button7_listener'] = 0
+        self.button_ch1_7_note.add_value_listener(self.button_ch1_7_note__mode_main_mode_button8_listener)
+        self._previous_values['button_ch1_7_note__mode_main_mode_button8_listener'] = 0
+        self.button_ch1_8_note.add_value_listener(self.button_ch1_8_note__mode_main_mode_button9_listener)
+        self._previous_values['button_ch1_8_note__mode_main_mode_button9_listener'] = 0
+        self.button_ch1_9_note.add_value_listener(self.button_ch1_9_note__mode_main_mode_button10_listener)
+        self._previous_values['button_ch1_9_note__mode_main_mode_button10_listener'] = 0
+        self.button_ch1_10_note.add_value_listener(self.button_ch1_10_note__mode_main_mode_button11_listener)
+        self._previous_values['button_ch1_10_note__mode_main_mode_button11_listener'] = 0
+        self.button_ch1_11_note.add_value_listener(self.button_ch1_11_note__mode_main_mode_button12_listener)
+        self._previous_values['button_ch1_11_note__mode_main_mode_button12_listener'] = 0
+        self.button_ch1_12_note.add_value_listener(self.button_ch1_12_note__mode_main_mode_button13_listener)
+        self._previous_values['button_ch1_12_note__mode_main_mode_button13_listener'] = 0
+        self.button_ch1_13_note.add_value_listener(self.button_ch1_13_note__mode_main_mode_button14_listener)
+        self._previous_values['button_ch1_13_note__mode_main_mode_button14_listener'] = 0
+        self.button_ch1_14_note.add_value_listener(self.button_ch1_14_note__mode_main_mode_button15_listener)
+        self._previous_values['button_ch1_14_note__mode_main_mode_button15_listener'] = 0
+        self.button_ch1_15_note.add_value_listener(self.button_ch1_15_note__mode_main_mode_button16_listener)
+        self._previous_values['button_ch1_15_note__mode_main_mode_button16_listener'] = 0
+        self.mixer.selected_strip().set_mute_button(self.button_ch1_48_note)
+        self.mixer.selected_strip().set_solo_button(self.button_ch1_49_note)
+        self.button_ch1_51_note.add_value_listener(self.button_ch1_51_note__mode_main_mode_fn_toggle_mono_on_master_listener)
+        self._previous_values['button_ch1_51_note__mode_main_mode_fn_toggle_mono_on_master_listener'] = 0
+        self.button_ch1_61_note.add_value_listener(self.button_ch1_61_note__mode_main_mode_fn_hud_toggle_listener)
+        self._previous_values['button_ch1_61_note__mode_main_mode_fn_hud_toggle_listener'] = 0
+        self.button_ch1_63_note.add_value_listener(self.button_ch1_63_note__mode_main_mode_right_listener)
+        self._previous_values['button_ch1_63_note__mode_main_mode_right_listener'] = 0
+        self.button_ch1_62_note.add_value_listener(self.button_ch1_62_note__mode_main_mode_left_listener)
+        self._previous_values['button_ch1_62_note__mode_main_mode_left_listener'] = 0
+        self.button_ch1_57_note.add_value_listener(self.button_ch1_57_note__mode_main_mode_first_last_listener)
+        self._previous_values['button_ch1_57_note__mode_main_mode_first_last_listener'] = 0
+        self.button_ch1_59_note.add_value_listener(self.button_ch1_59_note__mode_main_mode_inc_listener)
+        self._previous_values['button_ch1_59_note__mode_main_mode_inc_listener'] = 0
+        self.button_ch1_58_note.add_value_listener(self.button_ch1_58_note__mode_main_mode_dec_listener)
+        self._previous_values['button_ch1_58_note__mode_main_mode_dec_listener'] = 0
+        self.button_ch1_54_note.add_value_listener(self.button_ch1_54_note__mode_main_mode_fn_back8_listener)
+        self._previous_values['button_ch1_54_note__mode_main_mode_fn_back8_listener'] = 0
+        self.button_ch1_55_note.add_value_listener(self.button_ch1_55_note__mode_main_mode_fn_fwd8_listener)
+        self._previous_values['button_ch1_55_note__mode_main_mode_fn_fwd8_listener'] = 0
+        self.button_ch1_52_note.add_value_listener(self.button_ch1_52_note__mode_main_mode_fn_move_loop_left_listener)
+        self._previous_values['button_ch1_52_note__mode_main_mode_fn_move_loop_left_listener'] = 0
+        self.button_ch1_53_note.add_value_listener(self.button_ch1_53_note__mode_main_mode_fn_move_loop_right_listener)
+        self._previous_values['button_ch1_53_note__mode_main_mode_fn_move_loop_right_listener'] = 0
+        self.button_ch1_56_note.add_value_listener(self.button_ch1_56_note__mode_main_mode_fn_move_playhead_to_loop_start_listener)
+        self._previous_values['button_ch1_56_note__mode_main_mode_fn_move_playhead_to_loop_start_listener'] = 0
+
+
+    def mode_shift_mode_add_listeners(self):
+        self.log_message(f'Adding listeners for mode shift_mode')
+    
+
+        self.mixer.selected_strip().set_volume_control(self.knob_ch1_35_CC)
+        self.mixer.selected_strip().set_pan_control(self.knob_ch1_34_CC)
+        self.mixer.selected_strip().set_send_controls(self.knob_ch1_36_CC_shift_mode_sends)
+        self.knob_ch1_16_CC.add_value_listener(self.knob_ch1_16_CC__mode_shift_mode_slot33_listener)
+        self._previous_values['knob_ch1_16_CC__mode_shift_mode_slot33_listener'] = 0
+        self.knob_ch1_17_CC.add_value_listener(self.knob_ch1_17_CC__mode_shift_mode_slot34_listener)
+        self._previous_values['knob_ch1_17_CC__mode_shift_mode_slot34_listener'] = 0
+        self.knob_ch1_18_CC.add_value_listener(self.knob_ch1_18_CC__mode_shift_mode_slot35_listener)
+        self._previous_values['knob_ch1_18_CC__mode_shift_mode_slot35_listener'] = 0
+        self.knob_ch1_19_CC.add_value_listener(self.knob_ch1_19_CC__mode_shift_mode_slot36_listener)
+        self._previous_values['knob_ch1_19_CC__mode_shift_mode_slot36_listener'] = 0
+        self.knob_ch1_20_CC.add_value_listener(self.knob_ch1_20_CC__mode_shift_mode_slot37_listener)
+        self._previous_values['knob_ch1_20_CC__mode_shift_mode_slot37_listener'] = 0
+        self.knob_ch1_21_CC.add_value_listener(self.knob_ch1_21_CC__mode_shift_mode_slot38_listener)
+        self._previous_values['knob_ch1_21_CC__mode_shift_mode_slot38_listener'] = 0
+        self.knob_ch1_22_CC.add_value_listener(self.knob_ch1_22_CC__mode_shift_mode_slot39_listener)
+        self._previous_values['knob_ch1_22_CC__mode_shift_mode_slot39_listener'] = 0
+        self.knob_ch1_23_CC.add_value_listener(self.knob_ch1_23_CC__mode_shift_mode_slot40_listener)
+        self._previous_values['knob_ch1_23_CC__mode_shift_mode_slot40_listener'] = 0
+        self.knob_ch1_24_CC.add_value_listener(self.knob_ch1_24_CC__mode_shift_mode_slot41_listener)
+        self._previous_values['knob_ch1_24_CC__mode_shift_mode_slot41_listener'] = 0
+        self.knob_ch1_25_CC.add_value_listener(self.knob_ch1_25_CC__mode_shift_mode_slot42_listener)
+        self._previous_values['knob_ch1_25_CC__mode_shift_mode_slot42_listener'] = 0
+        self.knob_ch1_26_CC.add_value_listener(self.knob_ch1_26_CC__mode_shift_mode_slot43_listener)
+        self._previous_values['knob_ch1_26_CC__mode_shift_mode_slot43_listener'] = 0
+        self.knob_ch1_27_CC.add_value_listener(self.knob_ch1_27_CC__mode_shift_mode_slot44_listener)
+        self._previous_values['knob_ch1_27_CC__mode_shift_mode_slot44_listener'] = 0
+        self.knob_ch1_28_CC.add_value_listener(self.knob_ch1_28_CC__mode_shift_mode_slot45_listener)
+        self._previous_values['knob_ch1_28_CC__mode_shift_mode_slot45_listener'] = 0
+        self.knob_ch1_29_CC.add_value_listener(self.knob_ch1_29_CC__mode_shift_mode_slot46_listener)
+        self._previous_values['knob_ch1_29_CC__mode_shift_mode_slot46_listener'] = 0
+        self.knob_ch1_30_CC.add_value_listener(self.knob_ch1_30_CC__mode_shift_mode_slot47_listener)
+        self._previous_values['knob_ch1_30_CC__mode_shift_mode_slot47_listener'] = 0
+        self.knob_ch1_31_CC.add_value_listener(self.knob_ch1_31_CC__mode_shift_mode_slot48_listener)
+        self._previous_values['knob_ch1_31_CC__mode_shift_mode_slot48_listener'] = 0
+        self.button_ch1_0_note.add_value_listener(self.button_ch1_0_note__mode_shift_mode_button17_listener)
+        self._previous_values['button_ch1_0_note__mode_shift_mode_button17_listener'] = 0
+        self.button_ch1_1_note.add_value_listener(self.button_ch1_1_note__mode_shift_mode_button18_listener)
+        self._previous_values['button_ch1_1_note__mode_shift_mode_button18_listener'] = 0
+        self.button_ch1_2_note.add_value_listener(self.button_ch1_2_note__mode_shift_mode_button19_listener)
+        self._previous_values['button_ch1_2_note__mode_shift_mode_button19_listener'] = 0
+        self.button_ch1_3_note.add_value_listener(self.button_ch1_3_note__mode_shift_mode_button20_listener)
+        self._previous_values['button_ch1_3_note__mode_shift_mode_button20_listener'] = 0
+        self.button_ch1_4_note.add_value_listener(self.button_ch1_4_note__mode_shift_mode_button21_listener)
+        self._previous_values['button_ch1_4_note__mode_shift_mode_button21_listener'] = 0
+        self.button_ch1_5_note.add_value_listener(self.button_ch1_5_note__mode_shift_mode_button22_listener)
+        self._previous_values['button_ch1_5_note__mode_shift_mode_button22_listener'] = 0
+        self.button_ch1_6_note.add_value_listener(self.button_ch1_6_note__mode_shift_mode_button23_listener)
+        self._previous_values['button_ch1_6_note__mode_shift_mode_button23_listener'] = 0
+        self.button_ch1_7_note.add_value_listener(self.button_ch1_7_note__mode_shift_mode_button24_listener)
+        self._previous_values['button_ch1_7_note__mode_shift_mode_button24_listener'] = 0
+        self.button_ch1_8_note.add_value_listener(self.button_ch1_8_note__mode_shift_mode_button25_listener)
+        self._previous_values['button_ch1_8_note__mode_shift_mode_button25_listener'] = 0
+        self.button_ch1_9_note.add_value_listener(self.button_ch1_9_note__mode_shift_mode_button26_listener)
+        self._previous_values['button_ch1_9_note__mode_shift_mode_button26_listener'] = 0
+        self.button_ch1_10_note.add_value_listener(self.button_ch1_10_note__mode_shift_mode_button27_listener)
+        self._previous_values['button_ch1_10_note__mode_shift_mode_button27_listener'] = 0
+        self.button_ch1_11_note.add_value_listener(self.button_ch1_11_note__mode_shift_mode_button28_listener)
+        self._previous_values['button_ch1_11_note__mode_shift_mode_button28_listener'] = 0
+        self.button_ch1_12_note.add_value_listener(self.button_ch1_12_note__mode_shift_mode_button29_listener)
+        self._previous_values['button_ch1_12_note__mode_shift_mode_button29_listener'] = 0
+        self.button_ch1_13_note.add_value_listener(self.button_ch1_13_note__mode_shift_mode_button30_listener)
+        self._previous_values['button_ch1_13_note__mode_shift_mode_button30_listener'] = 0
+        self.button_ch1_14_note.add_value_listener(self.button_ch1_14_note__mode_shift_mode_button31_listener)
+        self._previous_values['button_ch1_14_note__mode_shift_mode_button31_listener'] = 0
+        self.button_ch1_15_note.add_value_listener(self.button_ch1_15_note__mode_shift_mode_button32_listener)
+        self._previous_values['button_ch1_15_note__mode_shift_mode_button32_listener'] = 0
+        self.button_ch1_56_note.add_value_listener(self.button_ch1_56_note__mode_shift_mode_fn_press_rack_random_button_listener)
+        self._previous_values['button_ch1_56_note__mode_shift_mode_fn_press_rack_random_button_listener'] = 0
+        self.button_ch1_52_note.add_value_listener(self.button_ch1_52_note__mode_shift_mode_fn_halve_loop_length_listener)
+        self._previous_values['button_ch1_52_note__mode_shift_mode_fn_halve_loop_length_listener'] = 0
+        self.button_ch1_53_note.add_value_listener(self.button_ch1_53_note__mode_shift_mode_fn_double_loop_length_listener)
+        self._previous_values['button_ch1_53_note__mode_shift_mode_fn_double_loop_length_listener'] = 0
+        self.button_ch1_54_note.add_value_listener(self.button_ch1_54_note__mode_shift_mode_fn_move_device_left_listener)
+        self._previous_values['button_ch1_54_note__mode_shift_mode_fn_move_device_left_listener'] = 0
+        self.button_ch1_55_note.add_value_listener(self.button_ch1_55_note__mode_shift_mode_fn_move_device_right_listener)
+        self._previous_values['button_ch1_55_note__mode_shift_mode_fn_move_device_right_listener'] = 0
+        self.button_ch1_48_note.add_value_listener(self.button_ch1_48_note__mode_shift_mode_fn_create_audio_track_taking_input_from_selected_track_listener)
+        self._previous_values['button_ch1_48_note__mode_shift_mode_fn_create_audio_track_taking_input_from_selected_track_listener'] = 0
+        self.button_ch1_49_note.add_value_listener(self.button_ch1_49_note__mode_shift_mode_fn_record_audio_resample_listener)
+        self._previous_values['button_ch1_49_note__mode_shift_mode_fn_record_audio_resample_listener'] = 0
+        self.button_ch1_50_note.add_value_listener(self.button_ch1_50_note__mode_shift_mode_fn_record_midi_from_track_to_new_track_listener)
+        self._previous_values['button_ch1_50_note__mode_shift_mode_fn_record_midi_from_track_to_new_track_listener'] = 0
+        self.button_ch1_51_note.add_value_listener(self.button_ch1_51_note__mode_shift_mode_fn_selected_audio_to_simpler_in_new_track_listener)
+        self._previous_values['button_ch1_51_note__mode_shift_mode_fn_selected_audio_to_simpler_in_new_track_listener'] = 0
+        self.button_ch1_57_note.add_value_listener(self.button_ch1_57_note__mode_shift_mode_fn_iterate_midi_pattern_listener)
+        self._previous_values['button_ch1_57_note__mode_shift_mode_fn_iterate_midi_pattern_listener'] = 0
+        self.button_ch1_58_note.add_value_listener(self.button_ch1_58_note__mode_shift_mode_fn_track_nav_left_x3_listener)
+        self._previous_values['button_ch1_58_note__mode_shift_mode_fn_track_nav_left_x3_listener'] = 0
+        self.button_ch1_59_note.add_value_listener(self.button_ch1_59_note__mode_shift_mode_fn_track_nav_right_x3_listener)
+        self._previous_values['button_ch1_59_note__mode_shift_mode_fn_track_nav_right_x3_listener'] = 0
+        self.button_ch1_63_note.add_value_listener(self.button_ch1_63_note__mode_shift_mode_pager_encoder_inc_listener)
+        self._previous_values['button_ch1_63_note__mode_shift_mode_pager_encoder_inc_listener'] = 0
+        self.button_ch1_62_note.add_value_listener(self.button_ch1_62_note__mode_shift_mode_pager_encoder_dec_listener)
+        self._previous_values['button_ch1_62_note__mode_shift_mode_pager_encoder_dec_listener'] = 0
+
+
+    def log_message(self, message):
+        self.manager.log_message(message)
+
+    def fine(self, message):
+        # Gated protocol-trace channel:
+        # silent unless `manager.fine` is on (toggle with `update.py hudtrace`).
+        # Delegates to Helpers.fine so all `[hudtrace]` lines share one gate/tag.
+        self._helpers.fine(message)
+
+    def selected_device(self):
+        return self._song.view.selected_track.view.selected_device
+
+    # device-nav handlers pass source='nav' so the HUD shows even under
+    # show-hud-on='controller-nav'. track-nav keeps the default 'selection'
+    # source (silent in controller-nav mode, per the show-hud-on contract).
+    # Each nav method logs the focused device name before and after the _nav
+    # call, so a [hudtrace] capture shows whether Live's appointed-device
+    # listener fired synchronously inside scroll_view: if it did,
+    # on_device_selected's line lands *between* these two (single-threaded
+    # log order = execution order), which matters because that ordering
+    # decides whether selected_device_changed's same-device guard sees the
+    # nav call or the listener call first.
+    def device_nav_left(self):
+        self.fine(f"[nav] device_nav_left enter dev={getattr(self.selected_device(),'name',None)!r}")
+        self._nav.device_nav_left()
+        self.fine(f"[nav] device_nav_left post-scroll dev={getattr(self.selected_device(),'name',None)!r} source=nav")
+        self._helpers.selected_device_changed(self.selected_device(), source='nav')
+
+    def device_nav_right(self):
+        self.fine(f"[nav] device_nav_right enter dev={getattr(self.selected_device(),'name',None)!r}")
+        self._nav.device_nav_right()
+        self.fine(f"[nav] device_nav_right post-scroll dev={getattr(self.selected_device(),'name',None)!r} source=nav")
+        self._helpers.selected_device_changed(self.selected_device(), source='nav')
+
+    def track_nav_inc(self):
+        self.fine(f"[nav] track_nav_inc enter dev={getattr(self.selected_device(),'name',None)!r}")
+        self._nav.track_nav_inc()
+        self.fine(f"[nav] track_nav_inc post-scroll dev={getattr(self.selected_device(),'name',None)!r} source=selection")
+        self._helpers.selected_device_changed(self.selected_device())
+
+    def track_nav_dec(self):
+        self.fine(f"[nav] track_nav_dec enter dev={getattr(self.selected_device(),'name',None)!r}")
+        self._nav.track_nav_dec()
+        self.fine(f"[nav] track_nav_dec post-scroll dev={getattr(self.selected_device(),'name',None)!r} source=selection")
+        self._helpers.selected_device_changed(self.selected_device())
+
+    def device_nav_first_last(self):
+        self._nav.device_nav_first_last()
+
+    def device_nav_first(self):
+        self.fine(f"[nav] device_nav_first enter dev={getattr(self.selected_device(),'name',None)!r}")
+        self._nav.device_nav_first()
+        self.fine(f"[nav] device_nav_first post-scroll dev={getattr(self.selected_device(),'name',None)!r} source=nav")
+        self._helpers.selected_device_changed(self.selected_device(), source='nav')
+
+    def device_nav_last(self):
+        self.fine(f"[nav] device_nav_last enter dev={getattr(self.selected_device(),'name',None)!r}")
+        self._nav.device_nav_last()
+        self.fine(f"[nav] device_nav_last post-scroll dev={getattr(self.selected_device(),'name',None)!r} source=nav")
+        self._helpers.selected_device_changed(self.selected_device(), source='nav')
+
+    
+    def knob_ch1_16_CC__mode_main_mode_slot1_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(0, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 1, 16, value, "knob_ch1_16_CC__mode_main_mode_slot1_listener", toggle=False)
+        
+    
+    def knob_ch1_17_CC__mode_main_mode_slot2_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(1, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 2, 17, value, "knob_ch1_17_CC__mode_main_mode_slot2_listener", toggle=False)
+        
+    
+    def knob_ch1_18_CC__mode_main_mode_slot3_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(2, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 3, 18, value, "knob_ch1_18_CC__mode_main_mode_slot3_listener", toggle=False)
+        
+    
+    def knob_ch1_19_CC__mode_main_mode_slot4_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(3, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 4, 19, value, "knob_ch1_19_CC__mode_main_mode_slot4_listener", toggle=False)
+        
+    
+    def knob_ch1_20_CC__mode_main_mode_slot5_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(4, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 5, 20, value, "knob_ch1_20_CC__mode_main_mode_slot5_listener", toggle=False)
+        
+    
+    def knob_ch1_21_CC__mode_main_mode_slot6_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(5, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 6, 21, value, "knob_ch1_21_CC__mode_main_mode_slot6_listener", toggle=False)
+        
+    
+    def knob_ch1_22_CC__mode_main_mode_slot7_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(6, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 7, 22, value, "knob_ch1_22_CC__mode_main_mode_slot7_listener", toggle=False)
+        
+    
+    def knob_ch1_23_CC__mode_main_mode_slot8_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(7, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 8, 23, value, "knob_ch1_23_CC__mode_main_mode_slot8_listener", toggle=False)
+        
+    
+    def knob_ch1_24_CC__mode_main_mode_slot9_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(8, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 9, 24, value, "knob_ch1_24_CC__mode_main_mode_slot9_listener", toggle=False)
+        
+    
+    def knob_ch1_25_CC__mode_main_mode_slot10_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(9, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 10, 25, value, "knob_ch1_25_CC__mode_main_mode_slot10_listener", toggle=False)
+        
+    
+    def knob_ch1_26_CC__mode_main_mode_slot11_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(10, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 11, 26, value, "knob_ch1_26_CC__mode_main_mode_slot11_listener", toggle=False)
+        
+    
+    def knob_ch1_27_CC__mode_main_mode_slot12_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(11, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 12, 27, value, "knob_ch1_27_CC__mode_main_mode_slot12_listener", toggle=False)
+        
+    
+    def knob_ch1_28_CC__mode_main_mode_slot13_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(12, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 13, 28, value, "knob_ch1_28_CC__mode_main_mode_slot13_listener", toggle=False)
+        
+    
+    def knob_ch1_29_CC__mode_main_mode_slot14_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(13, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 14, 29, value, "knob_ch1_29_CC__mode_main_mode_slot14_listener", toggle=False)
+        
+    
+    def knob_ch1_30_CC__mode_main_mode_slot15_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(14, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 15, 30, value, "knob_ch1_30_CC__mode_main_mode_slot15_listener", toggle=False)
+        
+    
+    def knob_ch1_31_CC__mode_main_mode_slot16_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(15, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 16, 31, value, "knob_ch1_31_CC__mode_main_mode_slot16_listener", toggle=False)
+        
+    
+    def knob_ch1_32_CC__mode_main_mode_slot17_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 17, 32, value, "knob_ch1_32_CC__mode_main_mode_slot17_listener", toggle=False)
+        
+    
+    def knob_ch1_33_CC__mode_main_mode_slot18_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 18, 33, value, "knob_ch1_33_CC__mode_main_mode_slot18_listener", toggle=False)
+        
+    
+    def knob_ch1_34_CC__mode_main_mode_slot19_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 19, 34, value, "knob_ch1_34_CC__mode_main_mode_slot19_listener", toggle=False)
+        
+    
+    def knob_ch1_35_CC__mode_main_mode_slot20_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 20, 35, value, "knob_ch1_35_CC__mode_main_mode_slot20_listener", toggle=False)
+        
+    
+    def knob_ch1_36_CC__mode_main_mode_slot21_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 21, 36, value, "knob_ch1_36_CC__mode_main_mode_slot21_listener", toggle=False)
+        
+    
+    def knob_ch1_37_CC__mode_main_mode_slot22_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 22, 37, value, "knob_ch1_37_CC__mode_main_mode_slot22_listener", toggle=False)
+        
+    
+    def knob_ch1_38_CC__mode_main_mode_slot23_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 23, 38, value, "knob_ch1_38_CC__mode_main_mode_slot23_listener", toggle=False)
+        
+    
+    def knob_ch1_39_CC__mode_main_mode_slot24_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 24, 39, value, "knob_ch1_39_CC__mode_main_mode_slot24_listener", toggle=False)
+        
+    
+    def knob_ch1_40_CC__mode_main_mode_slot25_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 25, 40, value, "knob_ch1_40_CC__mode_main_mode_slot25_listener", toggle=False)
+        
+    
+    def knob_ch1_41_CC__mode_main_mode_slot26_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 26, 41, value, "knob_ch1_41_CC__mode_main_mode_slot26_listener", toggle=False)
+        
+    
+    def knob_ch1_42_CC__mode_main_mode_slot27_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 27, 42, value, "knob_ch1_42_CC__mode_main_mode_slot27_listener", toggle=False)
+        
+    
+    def knob_ch1_43_CC__mode_main_mode_slot28_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 28, 43, value, "knob_ch1_43_CC__mode_main_mode_slot28_listener", toggle=False)
+        
+    
+    def knob_ch1_44_CC__mode_main_mode_slot29_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 29, 44, value, "knob_ch1_44_CC__mode_main_mode_slot29_listener", toggle=False)
+        
+    
+    def knob_ch1_45_CC__mode_main_mode_slot30_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 30, 45, value, "knob_ch1_45_CC__mode_main_mode_slot30_listener", toggle=False)
+        
+    
+    def knob_ch1_46_CC__mode_main_mode_slot31_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 31, 46, value, "knob_ch1_46_CC__mode_main_mode_slot31_listener", toggle=False)
+        
+    
+    def knob_ch1_47_CC__mode_main_mode_slot32_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 32, 47, value, "knob_ch1_47_CC__mode_main_mode_slot32_listener", toggle=False)
+        
+    
+    def button_ch1_50_note__mode_main_mode_p0_listener(self, value):
+        self._helpers.button_event('button_ch1_50_note__mode_main_mode_p0_listener', value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 0, 50, value, "button_ch1_50_note__mode_main_mode_p0_listener", toggle=True)
+        
+    
+    def button_ch1_0_note__mode_main_mode_button1_listener(self, value):
+        if self.drum_rack.is_active():
+            if self._helpers.should_act_on_edge(value):
+                self.drum_rack.select_pad(0)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_0_note__mode_main_mode_button1_listener")
+        self._helpers.button_event("button_ch1_0_note__mode_main_mode_button1_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 1, value, "button_ch1_0_note__mode_main_mode_button1_listener")
+        
+    
+    def button_ch1_1_note__mode_main_mode_button2_listener(self, value):
+        if self.drum_rack.is_active():
+            if self._helpers.should_act_on_edge(value):
+                self.drum_rack.select_pad(1)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_1_note__mode_main_mode_button2_listener")
+        self._helpers.button_event("button_ch1_1_note__mode_main_mode_button2_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 2, value, "button_ch1_1_note__mode_main_mode_button2_listener")
+        
+    
+    def button_ch1_2_note__mode_main_mode_button3_listener(self, value):
+        if self.drum_rack.is_active():
+            if self._helpers.should_act_on_edge(value):
+                self.drum_rack.select_pad(2)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_2_note__mode_main_mode_button3_listener")
+        self._helpers.button_event("button_ch1_2_note__mode_main_mode_button3_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 3, value, "button_ch1_2_note__mode_main_mode_button3_listener")
+        
+    
+    def button_ch1_3_note__mode_main_mode_button4_listener(self, value):
+        if self.drum_rack.is_active():
+            if self._helpers.should_act_on_edge(value):
+                self.drum_rack.select_pad(3)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_3_note__mode_main_mode_button4_listener")
+        self._helpers.button_event("button_ch1_3_note__mode_main_mode_button4_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 4, value, "button_ch1_3_note__mode_main_mode_button4_listener")
+        
+    
+    def button_ch1_4_note__mode_main_mode_button5_listener(self, value):
+        if self.drum_rack.is_active():
+            if self._helpers.should_act_on_edge(value):
+                self.drum_rack.select_pad(4)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_4_note__mode_main_mode_button5_listener")
+        self._helpers.button_event("button_ch1_4_note__mode_main_mode_button5_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 5, value, "button_ch1_4_note__mode_main_mode_button5_listener")
+        
+    
+    def button_ch1_5_note__mode_main_mode_button6_listener(self, value):
+        if self.drum_rack.is_active():
+            if self._helpers.should_act_on_edge(value):
+                self.drum_rack.select_pad(5)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_5_note__mode_main_mode_button6_listener")
+        self._helpers.button_event("button_ch1_5_note__mode_main_mode_button6_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 6, value, "button_ch1_5_note__mode_main_mode_button6_listener")
+        
+    
+    def button_ch1_6_note__mode_main_mode_button7_listener(self, value):
+        if self.drum_rack.is_active():
+            if self._helpers.should_act_on_edge(value):
+                self.drum_rack.select_pad(6)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_6_note__mode_main_mode_button7_listener")
+        self._helpers.button_event("button_ch1_6_note__mode_main_mode_button7_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 7, value, "button_ch1_6_note__mode_main_mode_button7_listener")
+        
+    
+    def button_ch1_7_note__mode_main_mode_button8_listener(self, value):
+        if self.drum_rack.is_active():
+            if self._helpers.should_act_on_edge(value):
+                self.drum_rack.select_pad(7)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_7_note__mode_main_mode_button8_listener")
+        self._helpers.button_event("button_ch1_7_note__mode_main_mode_button8_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 8, value, "button_ch1_7_note__mode_main_mode_button8_listener")
+        
+    
+    def button_ch1_8_note__mode_main_mode_button9_listener(self, value):
+        if self.drum_rack.is_active():
+            if self._helpers.should_act_on_edge(value):
+                self.drum_rack.select_pad(8)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_8_note__mode_main_mode_button9_listener")
+        self._helpers.button_event("button_ch1_8_note__mode_main_mode_button9_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 9, value, "button_ch1_8_note__mode_main_mode_button9_listener")
+        
+    
+    def button_ch1_9_note__mode_main_mode_button10_listener(self, value):
+        if self.drum_rack.is_active():
+            if self._helpers.should_act_on_edge(value):
+                self.drum_rack.select_pad(9)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_9_note__mode_main_mode_button10_listener")
+        self._helpers.button_event("button_ch1_9_note__mode_main_mode_button10_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 10, value, "button_ch1_9_note__mode_main_mode_button10_listener")
+        
+    
+    def button_ch1_10_note__mode_main_mode_button11_listener(self, value):
+        if self.drum_rack.is_active():
+            if self._helpers.should_act_on_edge(value):
+                self.drum_rack.select_pad(10)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_10_note__mode_main_mode_button11_listener")
+        self._helpers.button_event("button_ch1_10_note__mode_main_mode_button11_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 11, value, "button_ch1_10_note__mode_main_mode_button11_listener")
+        
+    
+    def button_ch1_11_note__mode_main_mode_button12_listener(self, value):
+        if self.drum_rack.is_active():
+            if self._helpers.should_act_on_edge(value):
+                self.drum_rack.select_pad(11)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_11_note__mode_main_mode_button12_listener")
+        self._helpers.button_event("button_ch1_11_note__mode_main_mode_button12_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 12, value, "button_ch1_11_note__mode_main_mode_button12_listener")
+        
+    
+    def button_ch1_12_note__mode_main_mode_button13_listener(self, value):
+        if self.drum_rack.is_active():
+            if self._helpers.should_act_on_edge(value):
+                self.drum_rack.select_pad(12)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_12_note__mode_main_mode_button13_listener")
+        self._helpers.button_event("button_ch1_12_note__mode_main_mode_button13_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 13, value, "button_ch1_12_note__mode_main_mode_button13_listener")
+        
+    
+    def button_ch1_13_note__mode_main_mode_button14_listener(self, value):
+        if self.drum_rack.is_active():
+            if self._helpers.should_act_on_edge(value):
+                self.drum_rack.select_pad(13)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_13_note__mode_main_mode_button14_listener")
+        self._helpers.button_event("button_ch1_13_note__mode_main_mode_button14_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 14, value, "button_ch1_13_note__mode_main_mode_button14_listener")
+        
+    
+    def button_ch1_14_note__mode_main_mode_button15_listener(self, value):
+        if self.drum_rack.is_active():
+            if self._helpers.should_act_on_edge(value):
+                self.drum_rack.select_pad(14)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_14_note__mode_main_mode_button15_listener")
+        self._helpers.button_event("button_ch1_14_note__mode_main_mode_button15_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 15, value, "button_ch1_14_note__mode_main_mode_button15_listener")
+        
+    
+    def button_ch1_15_note__mode_main_mode_button16_listener(self, value):
+        if self.drum_rack.is_active():
+            if self._helpers.should_act_on_edge(value):
+                self.drum_rack.select_pad(15)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_15_note__mode_main_mode_button16_listener")
+        self._helpers.button_event("button_ch1_15_note__mode_main_mode_button16_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 16, value, "button_ch1_15_note__mode_main_mode_button16_listener")
+        
+    
+    # function_toggle_mono_on_master_ch1_51_note
+    def button_ch1_51_note__mode_main_mode_fn_toggle_mono_on_master_listener(self, value):
+        self._helpers.button_event('button_ch1_51_note__mode_main_mode_fn_toggle_mono_on_master_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch1_51_note__mode_main_mode_fn_toggle_mono_on_master_listener (function_toggle_mono_on_master_ch1_51_note) callee = self.functions.toggle_mono_on_master(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch1_51_note__mode_main_mode_fn_toggle_mono_on_master_listener']
+        self._previous_values['button_ch1_51_note__mode_main_mode_fn_toggle_mono_on_master_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.functions.toggle_mono_on_master()
+        self._hud_client.send_ping()
+        
+    
+    # function_hud_toggle_ch1_61_note
+    def button_ch1_61_note__mode_main_mode_fn_hud_toggle_listener(self, value):
+        self._helpers.button_event('button_ch1_61_note__mode_main_mode_fn_hud_toggle_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch1_61_note__mode_main_mode_fn_hud_toggle_listener (function_hud_toggle_ch1_61_note) callee = self._helpers.toggle_hud(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch1_61_note__mode_main_mode_fn_hud_toggle_listener']
+        self._previous_values['button_ch1_61_note__mode_main_mode_fn_hud_toggle_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.toggle_hud()
+        self._hud_client.send_ping()
+        
+    
+    # ch1_no63_note__dn_right
+    def button_ch1_63_note__mode_main_mode_right_listener(self, value):
+        self._helpers.button_event('button_ch1_63_note__mode_main_mode_right_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch1_63_note__mode_main_mode_right_listener (ch1_no63_note__dn_right) callee = self.device_nav_right(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch1_63_note__mode_main_mode_right_listener']
+        self._previous_values['button_ch1_63_note__mode_main_mode_right_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.device_nav_right()
+        self._hud_client.send_ping()
+        
+    
+    # ch1_no62_note__dn_left
+    def button_ch1_62_note__mode_main_mode_left_listener(self, value):
+        self._helpers.button_event('button_ch1_62_note__mode_main_mode_left_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch1_62_note__mode_main_mode_left_listener (ch1_no62_note__dn_left) callee = self.device_nav_left(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch1_62_note__mode_main_mode_left_listener']
+        self._previous_values['button_ch1_62_note__mode_main_mode_left_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.device_nav_left()
+        self._hud_client.send_ping()
+        
+    
+    # ch1_no57_note__dn_first-last
+    def button_ch1_57_note__mode_main_mode_first_last_listener(self, value):
+        self._helpers.button_event('button_ch1_57_note__mode_main_mode_first_last_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch1_57_note__mode_main_mode_first_last_listener (ch1_no57_note__dn_first-last) callee = self.device_nav_first_last(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch1_57_note__mode_main_mode_first_last_listener']
+        self._previous_values['button_ch1_57_note__mode_main_mode_first_last_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.device_nav_first_last()
+        self._hud_client.send_ping()
+        
+    
+    # ch1_no59_note__tn_inc
+    def button_ch1_59_note__mode_main_mode_inc_listener(self, value):
+        self._helpers.button_event('button_ch1_59_note__mode_main_mode_inc_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch1_59_note__mode_main_mode_inc_listener (ch1_no59_note__tn_inc) callee = self.track_nav_inc(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch1_59_note__mode_main_mode_inc_listener']
+        self._previous_values['button_ch1_59_note__mode_main_mode_inc_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.track_nav_inc()
+        self._hud_client.send_ping()
+        
+    
+    # ch1_no58_note__tn_dec
+    def button_ch1_58_note__mode_main_mode_dec_listener(self, value):
+        self._helpers.button_event('button_ch1_58_note__mode_main_mode_dec_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch1_58_note__mode_main_mode_dec_listener (ch1_no58_note__tn_dec) callee = self.track_nav_dec(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch1_58_note__mode_main_mode_dec_listener']
+        self._previous_values['button_ch1_58_note__mode_main_mode_dec_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.track_nav_dec()
+        self._hud_client.send_ping()
+        
+    
+    # function_back8_ch1_54_note
+    def button_ch1_54_note__mode_main_mode_fn_back8_listener(self, value):
+        self._helpers.button_event('button_ch1_54_note__mode_main_mode_fn_back8_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch1_54_note__mode_main_mode_fn_back8_listener (function_back8_ch1_54_note) callee = self.functions.back8(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch1_54_note__mode_main_mode_fn_back8_listener']
+        self._previous_values['button_ch1_54_note__mode_main_mode_fn_back8_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.functions.back8()
+        self._hud_client.send_ping()
+        
+    
+    # function_fwd8_ch1_55_note
+    def button_ch1_55_note__mode_main_mode_fn_fwd8_listener(self, value):
+        self._helpers.button_event('button_ch1_55_note__mode_main_mode_fn_fwd8_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch1_55_note__mode_main_mode_fn_fwd8_listener (function_fwd8_ch1_55_note) callee = self.functions.fwd8(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch1_55_note__mode_main_mode_fn_fwd8_listener']
+        self._previous_values['button_ch1_55_note__mode_main_mode_fn_fwd8_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.functions.fwd8()
+        self._hud_client.send_ping()
+        
+    
+    # function_move_loop_left_ch1_52_note
+    def button_ch1_52_note__mode_main_mode_fn_move_loop_left_listener(self, value):
+        self._helpers.button_event('button_ch1_52_note__mode_main_mode_fn_move_loop_left_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch1_52_note__mode_main_mode_fn_move_loop_left_listener (function_move_loop_left_ch1_52_note) callee = self.functions.move_loop_left(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch1_52_note__mode_main_mode_fn_move_loop_left_listener']
+        self._previous_values['button_ch1_52_note__mode_main_mode_fn_move_loop_left_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.functions.move_loop_left()
+        self._hud_client.send_ping()
+        
+    
+    # function_move_loop_right_ch1_53_note
+    def button_ch1_53_note__mode_main_mode_fn_move_loop_right_listener(self, value):
+        self._helpers.button_event('button_ch1_53_note__mode_main_mode_fn_move_loop_right_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch1_53_note__mode_main_mode_fn_move_loop_right_listener (function_move_loop_right_ch1_53_note) callee = self.functions.move_loop_right(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch1_53_note__mode_main_mode_fn_move_loop_right_listener']
+        self._previous_values['button_ch1_53_note__mode_main_mode_fn_move_loop_right_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.functions.move_loop_right()
+        self._hud_client.send_ping()
+        
+    
+    # function_move_playhead_to_loop_start_ch1_56_note
+    def button_ch1_56_note__mode_main_mode_fn_move_playhead_to_loop_start_listener(self, value):
+        self._helpers.button_event('button_ch1_56_note__mode_main_mode_fn_move_playhead_to_loop_start_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch1_56_note__mode_main_mode_fn_move_playhead_to_loop_start_listener (function_move_playhead_to_loop_start_ch1_56_note) callee = self.functions.move_playhead_to_loop_start(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch1_56_note__mode_main_mode_fn_move_playhead_to_loop_start_listener']
+        self._previous_values['button_ch1_56_note__mode_main_mode_fn_move_playhead_to_loop_start_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.functions.move_playhead_to_loop_start()
+        self._hud_client.send_ping()
+        
+
+
+    def knob_ch1_16_CC__mode_shift_mode_slot33_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(0, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 1, 16, value, "knob_ch1_16_CC__mode_shift_mode_slot33_listener", toggle=False)
+        
+    
+    def knob_ch1_17_CC__mode_shift_mode_slot34_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(1, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 2, 17, value, "knob_ch1_17_CC__mode_shift_mode_slot34_listener", toggle=False)
+        
+    
+    def knob_ch1_18_CC__mode_shift_mode_slot35_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(2, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 3, 18, value, "knob_ch1_18_CC__mode_shift_mode_slot35_listener", toggle=False)
+        
+    
+    def knob_ch1_19_CC__mode_shift_mode_slot36_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(3, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 4, 19, value, "knob_ch1_19_CC__mode_shift_mode_slot36_listener", toggle=False)
+        
+    
+    def knob_ch1_20_CC__mode_shift_mode_slot37_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(4, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 5, 20, value, "knob_ch1_20_CC__mode_shift_mode_slot37_listener", toggle=False)
+        
+    
+    def knob_ch1_21_CC__mode_shift_mode_slot38_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(5, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 6, 21, value, "knob_ch1_21_CC__mode_shift_mode_slot38_listener", toggle=False)
+        
+    
+    def knob_ch1_22_CC__mode_shift_mode_slot39_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(6, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 7, 22, value, "knob_ch1_22_CC__mode_shift_mode_slot39_listener", toggle=False)
+        
+    
+    def knob_ch1_23_CC__mode_shift_mode_slot40_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(7, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 8, 23, value, "knob_ch1_23_CC__mode_shift_mode_slot40_listener", toggle=False)
+        
+    
+    def knob_ch1_24_CC__mode_shift_mode_slot41_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(8, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 9, 24, value, "knob_ch1_24_CC__mode_shift_mode_slot41_listener", toggle=False)
+        
+    
+    def knob_ch1_25_CC__mode_shift_mode_slot42_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(9, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 10, 25, value, "knob_ch1_25_CC__mode_shift_mode_slot42_listener", toggle=False)
+        
+    
+    def knob_ch1_26_CC__mode_shift_mode_slot43_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(10, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 11, 26, value, "knob_ch1_26_CC__mode_shift_mode_slot43_listener", toggle=False)
+        
+    
+    def knob_ch1_27_CC__mode_shift_mode_slot44_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(11, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 12, 27, value, "knob_ch1_27_CC__mode_shift_mode_slot44_listener", toggle=False)
+        
+    
+    def knob_ch1_28_CC__mode_shift_mode_slot45_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(12, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 13, 28, value, "knob_ch1_28_CC__mode_shift_mode_slot45_listener", toggle=False)
+        
+    
+    def knob_ch1_29_CC__mode_shift_mode_slot46_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(13, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 14, 29, value, "knob_ch1_29_CC__mode_shift_mode_slot46_listener", toggle=False)
+        
+    
+    def knob_ch1_30_CC__mode_shift_mode_slot47_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(14, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 15, 30, value, "knob_ch1_30_CC__mode_shift_mode_slot47_listener", toggle=False)
+        
+    
+    def knob_ch1_31_CC__mode_shift_mode_slot48_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.set_velocity(15, value)
+            self._hud_client.send_ping()
+            return
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self.device_parameter_action(device, 16, 31, value, "knob_ch1_31_CC__mode_shift_mode_slot48_listener", toggle=False)
+        
+    
+    def button_ch1_0_note__mode_shift_mode_button17_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.step_event(0, value)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_0_note__mode_shift_mode_button17_listener")
+        self._helpers.button_event("button_ch1_0_note__mode_shift_mode_button17_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 17, value, "button_ch1_0_note__mode_shift_mode_button17_listener")
+        
+    
+    def button_ch1_1_note__mode_shift_mode_button18_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.step_event(1, value)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_1_note__mode_shift_mode_button18_listener")
+        self._helpers.button_event("button_ch1_1_note__mode_shift_mode_button18_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 18, value, "button_ch1_1_note__mode_shift_mode_button18_listener")
+        
+    
+    def button_ch1_2_note__mode_shift_mode_button19_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.step_event(2, value)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_2_note__mode_shift_mode_button19_listener")
+        self._helpers.button_event("button_ch1_2_note__mode_shift_mode_button19_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 19, value, "button_ch1_2_note__mode_shift_mode_button19_listener")
+        
+    
+    def button_ch1_3_note__mode_shift_mode_button20_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.step_event(3, value)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_3_note__mode_shift_mode_button20_listener")
+        self._helpers.button_event("button_ch1_3_note__mode_shift_mode_button20_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 20, value, "button_ch1_3_note__mode_shift_mode_button20_listener")
+        
+    
+    def button_ch1_4_note__mode_shift_mode_button21_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.step_event(4, value)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_4_note__mode_shift_mode_button21_listener")
+        self._helpers.button_event("button_ch1_4_note__mode_shift_mode_button21_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 21, value, "button_ch1_4_note__mode_shift_mode_button21_listener")
+        
+    
+    def button_ch1_5_note__mode_shift_mode_button22_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.step_event(5, value)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_5_note__mode_shift_mode_button22_listener")
+        self._helpers.button_event("button_ch1_5_note__mode_shift_mode_button22_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 22, value, "button_ch1_5_note__mode_shift_mode_button22_listener")
+        
+    
+    def button_ch1_6_note__mode_shift_mode_button23_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.step_event(6, value)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_6_note__mode_shift_mode_button23_listener")
+        self._helpers.button_event("button_ch1_6_note__mode_shift_mode_button23_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 23, value, "button_ch1_6_note__mode_shift_mode_button23_listener")
+        
+    
+    def button_ch1_7_note__mode_shift_mode_button24_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.step_event(7, value)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_7_note__mode_shift_mode_button24_listener")
+        self._helpers.button_event("button_ch1_7_note__mode_shift_mode_button24_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 24, value, "button_ch1_7_note__mode_shift_mode_button24_listener")
+        
+    
+    def button_ch1_8_note__mode_shift_mode_button25_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.step_event(8, value)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_8_note__mode_shift_mode_button25_listener")
+        self._helpers.button_event("button_ch1_8_note__mode_shift_mode_button25_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 25, value, "button_ch1_8_note__mode_shift_mode_button25_listener")
+        
+    
+    def button_ch1_9_note__mode_shift_mode_button26_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.step_event(9, value)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_9_note__mode_shift_mode_button26_listener")
+        self._helpers.button_event("button_ch1_9_note__mode_shift_mode_button26_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 26, value, "button_ch1_9_note__mode_shift_mode_button26_listener")
+        
+    
+    def button_ch1_10_note__mode_shift_mode_button27_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.step_event(10, value)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_10_note__mode_shift_mode_button27_listener")
+        self._helpers.button_event("button_ch1_10_note__mode_shift_mode_button27_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 27, value, "button_ch1_10_note__mode_shift_mode_button27_listener")
+        
+    
+    def button_ch1_11_note__mode_shift_mode_button28_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.step_event(11, value)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_11_note__mode_shift_mode_button28_listener")
+        self._helpers.button_event("button_ch1_11_note__mode_shift_mode_button28_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 28, value, "button_ch1_11_note__mode_shift_mode_button28_listener")
+        
+    
+    def button_ch1_12_note__mode_shift_mode_button29_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.step_event(12, value)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_12_note__mode_shift_mode_button29_listener")
+        self._helpers.button_event("button_ch1_12_note__mode_shift_mode_button29_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 29, value, "button_ch1_12_note__mode_shift_mode_button29_listener")
+        
+    
+    def button_ch1_13_note__mode_shift_mode_button30_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.step_event(13, value)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_13_note__mode_shift_mode_button30_listener")
+        self._helpers.button_event("button_ch1_13_note__mode_shift_mode_button30_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 30, value, "button_ch1_13_note__mode_shift_mode_button30_listener")
+        
+    
+    def button_ch1_14_note__mode_shift_mode_button31_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.step_event(14, value)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_14_note__mode_shift_mode_button31_listener")
+        self._helpers.button_event("button_ch1_14_note__mode_shift_mode_button31_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 31, value, "button_ch1_14_note__mode_shift_mode_button31_listener")
+        
+    
+    def button_ch1_15_note__mode_shift_mode_button32_listener(self, value):
+        if self.drum_rack.is_active():
+            self.drum_rack.step_event(15, value)
+            self._hud_client.send_ping()
+            return
+        self.log_message(f"calling : button_ch1_15_note__mode_shift_mode_button32_listener")
+        self._helpers.button_event("button_ch1_15_note__mode_shift_mode_button32_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 32, value, "button_ch1_15_note__mode_shift_mode_button32_listener")
+        
+    
+    # function_press_rack_random_button_ch1_56_note
+    def button_ch1_56_note__mode_shift_mode_fn_press_rack_random_button_listener(self, value):
+        self._helpers.button_event('button_ch1_56_note__mode_shift_mode_fn_press_rack_random_button_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch1_56_note__mode_shift_mode_fn_press_rack_random_button_listener (function_press_rack_random_button_ch1_56_note) callee = self.functions.press_rack_random_button(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch1_56_note__mode_shift_mode_fn_press_rack_random_button_listener']
+        self._previous_values['button_ch1_56_note__mode_shift_mode_fn_press_rack_random_button_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.functions.press_rack_random_button()
+        self._hud_client.send_ping()
+        
+    
+    # function_halve_loop_length_ch1_52_note
+    def button_ch1_52_note__mode_shift_mode_fn_halve_loop_length_listener(self, value):
+        self._helpers.button_event('button_ch1_52_note__mode_shift_mode_fn_halve_loop_length_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch1_52_note__mode_shift_mode_fn_halve_loop_length_listener (function_halve_loop_length_ch1_52_note) callee = self.functions.halve_loop_length(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch1_52_note__mode_shift_mode_fn_halve_loop_length_listener']
+        self._previous_values['button_ch1_52_note__mode_shift_mode_fn_halve_loop_length_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.functions.halve_loop_length()
+        self._hud_client.send_ping()
+        
+    
+    # function_double_loop_length_ch1_53_note
+    def button_ch1_53_note__mode_shift_mode_fn_double_loop_length_listener(self, value):
+        self._helpers.button_event('button_ch1_53_note__mode_shift_mode_fn_double_loop_length_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch1_53_note__mode_shift_mode_fn_double_loop_length_listener (function_double_loop_length_ch1_53_note) callee = self.functions.double_loop_length(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch1_53_note__mode_shift_mode_fn_double_loop_length_listener']
+        self._previous_values['button_ch1_53_note__mode_shift_mode_fn_double_loop_length_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.functions.double_loop_length()
+        self._hud_client.send_ping()
+        
+    
+    # function_move_device_left_ch1_54_note
+    def button_ch1_54_note__mode_shift_mode_fn_move_device_left_listener(self, value):
+        self._helpers.button_event('button_ch1_54_note__mode_shift_mode_fn_move_device_left_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch1_54_note__mode_shift_mode_fn_move_device_left_listener (function_move_device_left_ch1_54_note) callee = self.functions.move_device_left(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch1_54_note__mode_shift_mode_fn_move_device_left_listener']
+        self._previous_values['button_ch1_54_note__mode_shift_mode_fn_move_device_left_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.functions.move_device_left()
+        self._hud_client.send_ping()
+        
+    
+    # function_move_device_right_ch1_55_note
+    def button_ch1_55_note__mode_shift_mode_fn_move_device_right_listener(self, value):
+        self._helpers.button_event('button_ch1_55_note__mode_shift_mode_fn_move_device_right_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch1_55_note__mode_shift_mode_fn_move_device_right_listener (function_move_device_right_ch1_55_note) callee = self.functions.move_device_right(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch1_55_note__mode_shift_mode_fn_move_device_right_listener']
+        self._previous_values['button_ch1_55_note__mode_shift_mode_fn_move_device_right_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.functions.move_device_right()
+        self._hud_client.send_ping()
+        
+    
+    # function_create_audio_track_taking_input_from_selected_track_ch1_48_note
+    def button_ch1_48_note__mode_shift_mode_fn_create_audio_track_taking_input_from_selected_track_listener(self, value):
+        self._helpers.button_event('button_ch1_48_note__mode_shift_mode_fn_create_audio_track_taking_input_from_selected_track_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch1_48_note__mode_shift_mode_fn_create_audio_track_taking_input_from_selected_track_listener (function_create_audio_track_taking_input_from_selected_track_ch1_48_note) callee = self.functions.create_audio_track_taking_input_from_selected_track(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch1_48_note__mode_shift_mode_fn_create_audio_track_taking_input_from_selected_track_listener']
+        self._previous_values['button_ch1_48_note__mode_shift_mode_fn_create_audio_track_taking_input_from_selected_track_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.functions.create_audio_track_taking_input_from_selected_track()
+        self._hud_client.send_ping()
+        
+    
+    # function_record_audio_resample_ch1_49_note
+    def button_ch1_49_note__mode_shift_mode_fn_record_audio_resample_listener(self, value):
+        self._helpers.button_event('button_ch1_49_note__mode_shift_mode_fn_record_audio_resample_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch1_49_note__mode_shift_mode_fn_record_audio_resample_listener (function_record_audio_resample_ch1_49_note) callee = self.functions.record_audio_resample(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch1_49_note__mode_shift_mode_fn_record_audio_resample_listener']
+        self._previous_values['button_ch1_49_note__mode_shift_mode_fn_record_audio_resample_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.functions.record_audio_resample()
+        self._hud_client.send_ping()
+        
+    
+    # function_record_midi_from_track_to_new_track_ch1_50_note
+    def button_ch1_50_note__mode_shift_mode_fn_record_midi_from_track_to_new_track_listener(self, value):
+        self._helpers.button_event('button_ch1_50_note__mode_shift_mode_fn_record_midi_from_track_to_new_track_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch1_50_note__mode_shift_mode_fn_record_midi_from_track_to_new_track_listener (function_record_midi_from_track_to_new_track_ch1_50_note) callee = self.functions.record_midi_from_track_to_new_track(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch1_50_note__mode_shift_mode_fn_record_midi_from_track_to_new_track_listener']
+        self._previous_values['button_ch1_50_note__mode_shift_mode_fn_record_midi_from_track_to_new_track_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.functions.record_midi_from_track_to_new_track()
+        self._hud_client.send_ping()
+        
+    
+    # function_selected_audio_to_simpler_in_new_track_ch1_51_note
+    def button_ch1_51_note__mode_shift_mode_fn_selected_audio_to_simpler_in_new_track_listener(self, value):
+        self._helpers.button_event('button_ch1_51_note__mode_shift_mode_fn_selected_audio_to_simpler_in_new_track_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch1_51_note__mode_shift_mode_fn_selected_audio_to_simpler_in_new_track_listener (function_selected_audio_to_simpler_in_new_track_ch1_51_note) callee = self.functions.selected_audio_to_simpler_in_new_track(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch1_51_note__mode_shift_mode_fn_selected_audio_to_simpler_in_new_track_listener']
+        self._previous_values['button_ch1_51_note__mode_shift_mode_fn_selected_audio_to_simpler_in_new_track_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.functions.selected_audio_to_simpler_in_new_track()
+        self._hud_client.send_ping()
+        
+    
+    # function_iterate_midi_pattern_ch1_57_note
+    def button_ch1_57_note__mode_shift_mode_fn_iterate_midi_pattern_listener(self, value):
+        self._helpers.button_event('button_ch1_57_note__mode_shift_mode_fn_iterate_midi_pattern_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch1_57_note__mode_shift_mode_fn_iterate_midi_pattern_listener (function_iterate_midi_pattern_ch1_57_note) callee = self.functions.iterate_midi_pattern(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch1_57_note__mode_shift_mode_fn_iterate_midi_pattern_listener']
+        self._previous_values['button_ch1_57_note__mode_shift_mode_fn_iterate_midi_pattern_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.functions.iterate_midi_pattern()
+        self._hud_client.send_ping()
+        
+    
+    # function_track_nav_left_x3_ch1_58_note
+    def button_ch1_58_note__mode_shift_mode_fn_track_nav_left_x3_listener(self, value):
+        self._helpers.button_event('button_ch1_58_note__mode_shift_mode_fn_track_nav_left_x3_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch1_58_note__mode_shift_mode_fn_track_nav_left_x3_listener (function_track_nav_left_x3_ch1_58_note) callee = self.functions.track_nav_left_x3(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch1_58_note__mode_shift_mode_fn_track_nav_left_x3_listener']
+        self._previous_values['button_ch1_58_note__mode_shift_mode_fn_track_nav_left_x3_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.functions.track_nav_left_x3()
+        self._hud_client.send_ping()
+        
+    
+    # function_track_nav_right_x3_ch1_59_note
+    def button_ch1_59_note__mode_shift_mode_fn_track_nav_right_x3_listener(self, value):
+        self._helpers.button_event('button_ch1_59_note__mode_shift_mode_fn_track_nav_right_x3_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch1_59_note__mode_shift_mode_fn_track_nav_right_x3_listener (function_track_nav_right_x3_ch1_59_note) callee = self.functions.track_nav_right_x3(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch1_59_note__mode_shift_mode_fn_track_nav_right_x3_listener']
+        self._previous_values['button_ch1_59_note__mode_shift_mode_fn_track_nav_right_x3_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.functions.track_nav_right_x3()
+        self._hud_client.send_ping()
+        
+    
+    # ch1_no63_note__pager_encoder_inc
+    def button_ch1_63_note__mode_shift_mode_pager_encoder_inc_listener(self, value):
+        self._helpers.button_event('button_ch1_63_note__mode_shift_mode_pager_encoder_inc_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch1_63_note__mode_shift_mode_pager_encoder_inc_listener (ch1_no63_note__pager_encoder_inc) callee = self._helpers.parameter_page_inc('encoder'), value is {value}")
+    
+        previous_value = self._previous_values['button_ch1_63_note__mode_shift_mode_pager_encoder_inc_listener']
+        self._previous_values['button_ch1_63_note__mode_shift_mode_pager_encoder_inc_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.parameter_page_inc('encoder')
+        self._hud_client.send_ping()
+        
+    
+    # ch1_no62_note__pager_encoder_dec
+    def button_ch1_62_note__mode_shift_mode_pager_encoder_dec_listener(self, value):
+        self._helpers.button_event('button_ch1_62_note__mode_shift_mode_pager_encoder_dec_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch1_62_note__mode_shift_mode_pager_encoder_dec_listener (ch1_no62_note__pager_encoder_dec) callee = self._helpers.parameter_page_dec('encoder'), value is {value}")
+    
+        previous_value = self._previous_values['button_ch1_62_note__mode_shift_mode_pager_encoder_dec_listener']
+        self._previous_values['button_ch1_62_note__mode_shift_mode_pager_encoder_dec_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.parameter_page_dec('encoder')
+        self._hud_client.send_ping()
+        
+
+
+    def goto_mode(self, next_mode_name):
+        self.log_message(f'switching to {next_mode_name}')
+        next_mode = self._modes[next_mode_name]
+        self.log_message(f'next mode: {next_mode}')
+        self.remove_all_listeners(modes_only=True)
+        self._modes[next_mode_name]['add_listeners_fn']()
+
+        # The secondary of an lc_parks composition has modes but no physical
+        # mode-button (its FSM is driven remotely via mode_link), so guard the
+        # LED feedback.
+        if self.mode_button is not None:
+            if next_mode['color'] is not None:
+                self.mode_button.send_value(next_mode['color'])
+            else:
+                self.mode_button.send_value(0)
+
+        self.current_mode = next_mode
+
+        # HUD: refresh labels for the new mode's bindings (mixer/functions/etc.).
+        # Device-bound slots are repopulated by the next selected_device_changed.
+        # Trace the order of refresh_hud_for_mode -> send_mode -> mode_sender:
+        # a stray MODE/HIDE interleave here is order-dependent, so a [hudtrace]
+        # capture needs to see these three sends in the order they actually fire.
+        self.fine(f"[mode] goto_mode {next_mode_name!r} is_shift={next_mode['is_shift']} -> refresh_hud_for_mode")
+        self._helpers.refresh_hud_for_mode(next_mode_name, self.selected_device())
+
+        self.fine(f"[mode] goto_mode {next_mode_name!r} -> send_mode({next_mode['is_shift']})")
+        self._hud_client.send_mode(next_mode['is_shift'])
+
+        # Compositor primary only: forward the active mode name to the secondary
+        # so holding shift on the primary also switches the secondary's mappings.
+        if self._mode_sender is not None:
+            self._mode_sender.send_mode(next_mode['name'])
+
+        self.manager.show_message(f'Switched to {next_mode_name}')
+
+    def device_parameter_action(self, device, parameter_no, midi_no, value, fn_name, toggle=False):
+        self._helpers.device_parameter_action(device, parameter_no, midi_no, value, fn_name, toggle)
+
+    def find_device(self, track_name, device_name):
+        return self._helpers.find_device(self._song, track_name, device_name)
+
+
+    def mode_button_listener(self, value):
+        self.log_message(f'mode_button_listener: {value}, current mode is {self.current_mode}')
+
+        if self.current_mode['is_shift']:
+            # Level-driven, self-healing shift: a press (127) means "be in the
+            # shift mode", a release (0) means "be in the base mode". This is
+            # idempotent per level, so a dropped or duplicated MIDI edge (e.g. a
+            # lost note-off) can NOT permanently invert the button — the next
+            # clean press/release re-syncs. The old "advance to next mode on every
+            # edge" logic assumed perfect 127,0,127,0 alternation, so one missed
+            # release flipped rest-state to shift forever. Assumes a 2-mode shift
+            # (base + shift), the only sensible config for a held button; every
+            # shift surface uses exactly two modes.
+            in_base = self.current_mode['name'] == self._first_mode
+            if value == 127:
+                self.fine(f"[mode] mode_button_listener value=127 branch=shift-press in_base={in_base}")
+                if in_base:
+                    self.goto_mode(self.current_mode['next_mode_name'])
+            else:
+                self.fine(f"[mode] mode_button_listener value=0 branch=shift-release in_base={in_base}")
+                if not in_base:
+                    # Return to base directly (not "next"), so this is correct
+                    # regardless of how the FSM got here.
+                    self.goto_mode(self._first_mode)
+                    self.fine("[mode] mode_button_listener shift-release -> send_mode(False)")
+                    self._hud_client.send_mode(False)
+        else:
+            # Switch-type: each press cycles to the next mode.
+            if value == 127:
+                self.fine(f"[mode] mode_button_listener value=127 branch=switch-press cur={self.current_mode['name']!r}")
+                self.goto_mode(self.current_mode['next_mode_name'])
+
+    def on_device_selected(self):
+        # Live's appointed_device listener. If this line lands between a nav
+        # method's enter/post-scroll lines, scroll_view fired it synchronously,
+        # racing selected_device_changed's same-device guard. source defaults
+        # to 'selection'.
+        self.fine(f"[listener] on_device_selected dev={getattr(self.selected_device(),'name',None)!r}")
+        self._helpers.selected_device_changed(self.selected_device())
+
+    def on_selected_track_changed(self):
+        ### This is called when the selected track changes
+        self.fine(f"[listener] on_selected_track_changed dev={getattr(self.selected_device(),'name',None)!r}")
+        # Follow the new track's device chain (see _attach_track_devices_listener).
+        self._attach_track_devices_listener()
+        self._helpers.selected_device_changed(self.selected_device())
\ No newline at end of file
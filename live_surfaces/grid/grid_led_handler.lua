@@ -11,6 +11,12 @@
 -- Canonical signature per Intech is `function(self, sysex)` with sysex as a
 -- hex STRING; we take (self, a, b) and sniff the string arg to be firmware-
 -- version-proof.
+--
+-- Two commands (source_modules/grid_led_client.py), both 7-bit RGB, x2 here:
+--   F0 7D 4C 01  (r g b) x 48    F7   dense frame, every slot, on device focus
+--   F0 7D 44 01  (slot r g b)*   F7   delta: only slots whose colour changed,
+--                                      sent on live value changes (rate-limited
+--                                      host-side, default 30/s)
 -- ====================================================================
 
 -- TEMP boot smoke-test (Test A): lights local elements green at boot, proves
@@ -43,7 +49,21 @@ self.sysexrx_cb = function(self, a, b)
   print("[gridled] fired a=" .. #ba .. " b=" .. #bb)
 
   if #bytes < 5 then return end
-  if bytes[2] ~= 0x7D or bytes[3] ~= 0x4C or bytes[4] ~= 0x01 then return end
+  if bytes[2] ~= 0x7D or bytes[4] ~= 0x01 then return end
+
+  if bytes[3] == 0x44 then
+    -- Delta: 4-byte entries (slot, r, g, b) until the trailing F7.
+    local i = 4
+    while i + 4 <= #bytes - 1 do
+      local elem = SLOT_TO_ELEMENT(bytes[i + 1])
+      if elem ~= nil then
+        glc(elem, LAYER, bytes[i + 2] * 2, bytes[i + 3] * 2, bytes[i + 4] * 2)
+      end
+      i = i + 4
+    end
+    return
+  end
+  if bytes[3] ~= 0x4C then return end
 
   local base = 4
   for slot = 0, 47 do
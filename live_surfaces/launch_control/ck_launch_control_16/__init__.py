@@ -0,0 +1,5 @@
+### Script Generated by Control Surface Studio for Python 3 (resorted to default: no)
+from .ck_launch_control_16 import ck_launch_control_16
+
+def create_instance(c_instance):
+    return ck_launch_control_16(c_instance)
\ No newline at end of file
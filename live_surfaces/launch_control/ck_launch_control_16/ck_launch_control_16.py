@@ -0,0 +1,546 @@
+from pathlib import Path
+
+import Live
+from _Framework.ControlSurface import ControlSurface
+from _Framework.InputControlElement import *
+from _Framework.EncoderElement import EncoderElement
+# from _Framework.EncoderElement import *
+
+import importlib
+import socket
+import traceback
+
+from . import modules
+from .modules import main_component
+from .modules import helpers
+from .modules.listener import OSCListener
+from .modules import hud_arbiter
+from .modules import io_hub
+from .modules.latency_stats import STATS
+
+try:
+    from .modules import functions
+except ImportError:
+    pass
+
+class ck_launch_control_16(ControlSurface):
+    def __init__(self, c_instance):
+        super(ck_launch_control_16, self).__init__(c_instance)
+
+        # HUD-owner election markers. Sibling surfaces read these off
+        # `self._control_surfaces` (Ableton's shared
+        # cross-script registry) to decide who owns the shared HUD sink at
+        # 127.0.0.1:5006 -- set immediately after super().__init__ (which is
+        # where ControlSurface publishes `self` into that registry) so the
+        # window where we're registered but unmarked is as small as possible.
+        self._acsac_hud_enabled = True
+        self._acsac_surface_name = "ck_launch_control_16"
+
+        self.ops = None
+        self.log_message("ck_launch_control_16 custom script loaded")
+
+
+        with self.component_guard():
+
+            # One poll loop for every inbound socket of this surface (command
+            # port, OSC buttons, region/mode links): a single select per tick,
+            # each readable socket drained up to a per-tick budget.
+            self.io_hub = io_hub.IoHub(self, name="ck_launch_control_16")
+
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self.log_message("ck_launch_control_16: starting listen on port 40844")
+            self._socket.bind(('0.0.0.0', 40844))
+            self.io_hub.register(self._socket, self._on_command, bufsize=1024,
+                                 label="ck_launch_control_16-cmd")
+
+            self.init_modules()
+
+            # Elect a single HUD owner among all co-loaded HUD-enabled
+            # surfaces. Re-runs on every control_surfaces change so ownership
+            # self-heals as surfaces load/unload.
+            self._hud_arbiter = hud_arbiter.HudArbiter(self)
+            self._hud_arbiter.register()
+
+            self.show_message("Connected to ck_launch_control_16")
+            self.debug = False
+            # Gated HUD protocol-trace flag.
+            # Off by default; toggled by the `hudtrace` command. Read by
+            # Helpers.fine to emit `[hudtrace]` lines for the HUD<->surface path.
+            self.fine = False
+
+            self.schedule_message(5, self.update_main_component_with_selected_device)
+            # Re-election runs on a recurring tick, not just the
+            # control_surfaces observer registered above: that observer's
+            # method name is Live-API-guessed and unverifiable outside a real
+            # Ableton session, and it fails silently (logged + swallowed) if
+            # wrong. The observer gives near-instant ownership transfer when
+            # it works; this loop is the guarantee that ownership still
+            # converges (within ~1.5s) even if it doesn't -- correctness must
+            # not depend on an assumption we can't test.
+            self.schedule_message(10, self._hud_arbiter_tick)
+
+    def _hud_arbiter_tick(self):
+        self._hud_arbiter.reelect()
+        fifteen_ticks = 15
+        self.schedule_message(fifteen_ticks, self._hud_arbiter_tick)
+
+    def update_main_component_with_selected_device(self):
+        self.main_component.update_selected_device()
+        one_and_a_half_seconds = 15
+        self.schedule_message(one_and_a_half_seconds, self.update_main_component_with_selected_device)
+
+    def functions_file_exsits(self):
+        return (Path(__file__).resolve().parent / 'functions.py').exists()
+
+    def init_modules(self):
+
+        self.main_component = main_component.MainComponent(self)
+        self.main_component.setup_controls()
+
+    def dump_selected_device_parameter_names(self):
+        device = self.song().view.selected_track.view.selected_device
+        if not device:
+            self.log_message("No device selected")
+            return
+
+        self.log_message("Dumping parameters for device; name:" + device.name+", class_name: " + device.class_name)
+
+        params_formated = "\n            - ".join([p.original_name for p in device.parameters])
+
+        res = f"""\n
+    -
+        device-name: {device.name}
+        parameters:
+            - {params_formated}
+"""
+        self.log_message(res)
+
+
+    def dump_selected_device_parameter_info(self):
+        device = self.song().view.selected_track.view.selected_device
+        if not device:
+            self.log_message("No device selected")
+            return
+
+
+        self.log_message("Dumping parameters for device; name:" + device.name+", class_name: " + device.class_name)
+        parameters = []
+
+        for i, p in enumerate(device.parameters):
+            i = str(i).zfill(2)
+            msg = {
+                'no': i,
+                'original_name': p.original_name,
+                'display_name': p.name,
+                'value': p.value,
+                'min': p.min,
+                'max': p.max
+            }
+            parameters.append(msg)
+
+        result_obj = { "class_name" : device.class_name,"name": device.name,  "parameters": parameters }
+        self.log_message('\n' + str(result_obj).replace('\n', ' '))
+
+        string_params = [f"""{{"no": {i}, "name": "{p.original_name}", "min": {p.min}, "max": {p.max}}}""" for i, p in enumerate(device.parameters)]
+        joined = ",\n        ".join(string_params)
+
+        res = f"""    {{
+        "id": "{device.class_name}",
+        "name": "{device.name}",
+        "parameters": [
+        {joined}        
+        ]}}"""
+
+        self.log_message(res)
+
+    def dump_selected_device_parameter_info_split_into_encoders_and_buttons(self):
+        device = self.song().view.selected_track.view.selected_device
+        if not device:
+            self.log_message("No device selected")
+            return
+
+
+        self.log_message("Dumping parameters for device; name:" + device.name+", class_name: " + device.class_name)
+        encoders = []
+        buttons = []
+
+        for i, p in enumerate(device.parameters):
+            msg = {
+                'no': i,
+                'name': p.original_name,
+            }
+
+            if p.is_quantized:
+                buttons.append(msg)
+            else:
+                encoders.append(msg)
+
+        result_obj = { "class_name" : device.class_name,"name": device.name,  "encoders": encoders }
+        self.log_message('\n' + str(result_obj).replace('\n', ' '))
+
+        string_enc_params = [f"""{{"name": "{p['name']}"}}""" for i, p in enumerate(encoders)]
+        joined_encoders = ",\n          ".join(string_enc_params)
+
+        string_button_params = [f"""{{"name": "{p['name']}"}}""" for i, p in enumerate(buttons)]
+        joined_buttons = ",\n          ".join(string_button_params)
+
+        res = f"""    
+    {{
+        "className": "{device.class_name}",
+        "deviceName": "{device.name}",
+        "encoders": [
+          {joined_encoders}
+        ],
+        "buttons": [
+          {joined_buttons}
+        ]
+    }}"""
+
+        self.log_message(res)
+
+    def dump_selected_device_lom(self):
+        """Diagnostic dump of non-parameter LOM attributes on the selected
+        device: properties, methods, and (especially) any enum-typed values
+        with whatever introspection hooks they expose. Use this to figure
+        out how to enumerate things like SimplerDevice.playback_mode."""
+        device = self.song().view.selected_track.view.selected_device
+        if not device:
+            self.log_message("No device selected")
+            return
+
+        self.log_message(f"=== LOM dump for {device.class_name} ({device.name}) ===")
+        self.log_message(f"device python type: {type(device)!r}")
+        self.log_message(f"device mro: {[c.__name__ for c in type(device).__mro__]}")
+
+        skip = {'parameters', 'canonical_parent'}
+        props = []
+        methods = []
+        enums = []
+
+        for attr in sorted(dir(device)):
+            if attr.startswith('_') or attr in skip:
+                continue
+            try:
+                val = getattr(device, attr)
+            except Exception as ex:
+                self.log_message(f"  [skip] {attr}: getattr raised {ex!r}")
+                continue
+            if callable(val):
+                methods.append(attr)
+                continue
+            tname = type(val).__name__
+            tmod = getattr(type(val), '__module__', '?')
+            line = f"  {attr}: type={tmod}.{tname}  value={val!r}"
+            props.append(line)
+            # Heuristic: anything that isn't a plain primitive may be enum-like.
+            if not isinstance(val, (int, float, bool, str, bytes, list, tuple, dict, type(None))):
+                enums.append((attr, val))
+
+        self.log_message("-- properties --")
+        for line in props:
+            self.log_message(line)
+
+        self.log_message("-- methods --")
+        self.log_message("  " + ", ".join(methods))
+
+        self.log_message("-- enum-like introspection --")
+        for attr, val in enums:
+            cls = type(val)
+            self.log_message(f"  {attr}: cls={cls.__module__}.{cls.__name__}")
+            self.log_message(f"    repr(val)={val!r}  int_cast={self._safe_int(val)}")
+            self.log_message(f"    dir(cls)={[d for d in dir(cls) if not d.startswith('_')]}")
+            values = getattr(cls, 'values', None)
+            self.log_message(f"    cls.values={values!r}  type={type(values).__name__}")
+            try:
+                it = list(cls)
+                self.log_message(f"    list(cls)={it!r}")
+            except Exception as ex:
+                self.log_message(f"    list(cls) raised: {ex!r}")
+            try:
+                names = getattr(cls, 'names', None)
+                self.log_message(f"    cls.names={names!r}")
+            except Exception as ex:
+                self.log_message(f"    cls.names raised: {ex!r}")
+
+        self.log_message("=== end LOM dump ===")
+
+    @staticmethod
+    def _safe_int(v):
+        try:
+            return int(v)
+        except Exception:
+            return None
+
+    def _stats_lines(self):
+        mc = self.main_component
+        lines = STATS.summary_lines() or ['no samples yet']
+        for label, stats in (('coalesce', mc._update_coalescer.stats()),
+                             ('hudowner', mc._remote.hud_stats()),
+                             ('burstcache', mc._helpers.burst_cache_stats()),
+                             ('midiout', mc._midi_out.stats()),
+                             ('iohub', self.io_hub.stats())):
+            lines.append(f"{label} " + ' '.join(f'{k}={v}' for k, v in stats.items()))
+        if mc._sender is not None:
+            lines.append('sender ' + ' '.join(f'{k}={v}' for k, v in mc._sender.stats().items()))
+        return lines
+
+    def _stats_reset(self):
+        mc = self.main_component
+        STATS.reset()
+        mc._update_coalescer.reset_stats()
+        mc._remote.reset_hud_stats()
+        mc._helpers.reset_burst_cache_stats()
+        mc._midi_out.reset_stats()
+        self.io_hub.reset_stats()
+        if mc._sender is not None:
+            mc._sender.reset_stats()
+
+    def _close_sender(self):
+        # Drains what is queued (final HIDE/bursts) then stops the thread; must
+        # run before release_all closes the shared socket under it.
+        try:
+            if self.main_component._sender is not None:
+                self.main_component._sender.close()
+        except Exception as e:
+            self.log_message(f"Error closing sender thread: {e}")
+
+    def _on_command(self, data, addr):
+        # One control-port datagram, dispatched by the IoHub poll loop (which
+        # owns the recvfrom and its benign-error handling).
+        try:
+            cmd_str = data.decode('utf-8', errors='ignore').strip()
+            parts = cmd_str.split('|')
+            cmd = parts[0]
+            response = None
+
+            if cmd == 'PING':
+                response = b'PONG'
+
+            elif cmd == 'HELLO':
+                # A (re)started HUD: adopt the capabilities it announced
+                # (`HELLO|delta`), then push the layout + a full keyframe burst.
+                self.main_component._remote.negotiate(cmd_str)
+                self.main_component._remote.resend_layout()
+                self.main_component._helpers.update_remote_parameters()
+
+            elif cmd == 'GET_DEVICE':
+                device = self.song().view.selected_track.view.selected_device
+                if device:
+                    n = len(device.parameters)
+                    response = f'DEVICE|{device.class_name}|{device.name}|{n}'.encode('utf-8')
+                else:
+                    response = b'DEVICE|||0'
+
+            elif cmd == 'GET_PARAMS':
+                device = self.song().view.selected_track.view.selected_device
+                if device and len(parts) >= 3:
+                    start, count = int(parts[1]), int(parts[2])
+                    chunk = device.parameters[start:start + count]
+                    entries = ';'.join(f'{start + i},{p.original_name},{p.min},{p.max},{1 if p.is_quantized else 0}' for i, p in enumerate(chunk))
+                    response = f'PARAMS|{entries}'.encode('utf-8')
+                else:
+                    response = b'PARAMS|'
+
+            elif cmd == 'GET_PARAM_VALUES':
+                device = self.song().view.selected_track.view.selected_device
+                if device and len(parts) >= 3:
+                    start, count = int(parts[1]), int(parts[2])
+                    chunk = device.parameters[start:start + count]
+                    values = ','.join(str(p.value) for p in chunk)
+                    response = f'PARAM_VALUES|{values}'.encode('utf-8')
+                else:
+                    response = b'PARAM_VALUES|'
+
+            elif cmd == 'reload':
+                try:
+                    self.log_message('Reloading modules')
+                    try:
+                        self.main_component.remove_all_listeners()
+                    except Exception as e:
+                        self.log_message(f'Error removing listeners: {e}')
+                        self.log_message(traceback.format_exc())
+                    try:
+                        # Apply queued step edits, drop the clip notes listener.
+                        self.main_component.drum_rack.disconnect()
+                    except Exception as e:
+                        self.log_message(f'Error removing drum clip listener: {e}')
+                    try:
+                        self.main_component._helpers.disconnect()
+                    except Exception as e:
+                        self.log_message(f'Error removing track/device name listeners: {e}')
+                    try:
+                        self.main_component._nav.disconnect()
+                    except Exception as e:
+                        self.log_message(f'Error removing track nav listeners: {e}')
+                    try:
+                        self.main_component.functions.track_nav.disconnect()
+                    except Exception as e:
+                        self.log_message(f'Error removing track position listeners: {e}')
+                    try:
+                        # Its tick reschedules itself until closed.
+                        self.main_component._update_coalescer.close()
+                    except Exception as e:
+                        self.log_message(f'Error closing update coalescer: {e}')
+                    try:
+                        # Write its last queued SysEx and end its tick, as disconnect does.
+                        self.main_component._midi_out.close()
+                    except Exception as e:
+                        self.log_message(f'Error closing MIDI-out queue: {e}')
+
+                    importlib.reload(modules.helpers)
+                    importlib.reload(modules.hud_arbiter)
+                    importlib.reload(modules.main_component)
+
+                    if self.functions_file_exsits():
+                        importlib.reload(modules.functions)
+
+                    self.log_message('Re-initialising modules')
+                    # Close the previous listeners' sockets (everything but the
+                    # command port) so the new instances can bind their ports.
+                    self.io_hub.reset(keep=(self._socket,))
+                    self._close_sender()
+                    self.main_component._share.release_all()
+                    self.init_modules()
+                    response = b'reload complete'
+                    self.show_message("Reload complete")
+                except Exception as e:
+                    self.log_message(f'Error reloading module: {e}')
+                    self.show_message("Reload Failed, check logs")
+                    self.log_message(traceback.format_exc())
+                    response = b'reload failed, check logs'
+
+            elif cmd == 'debug':
+                self.debug = not self.debug
+                self.log_message(f"Debug set to {self.debug}")
+                response = b'Debug set to ' + str(self.debug).encode('utf-8')
+
+            elif cmd == 'hudtrace':
+                # Toggle gated HUD protocol tracing. `[hudtrace]`-tagged lines
+                # then trace the nav/listener/mode/visibility path; capture with
+                # ./bin/tail_logs.sh. The Swift HUD has its own HUD_FINE switch.
+                self.fine = not self.fine
+                self.log_message(f"HUD trace set to {self.fine}")
+                response = b'HUD trace set to ' + str(self.fine).encode('utf-8')
+
+            elif cmd == 'dump':
+                self.dump_selected_device_parameter_info()
+                response = b'Dumped to logs'
+
+
+            elif cmd == 'dump2':
+                self.dump_selected_device_parameter_info_split_into_encoders_and_buttons()
+                response = b'Dumped to logs'
+
+            elif cmd == 'dumpnames':
+                self.dump_selected_device_parameter_names()
+                response = b'Dumped to logs'
+
+            elif cmd == 'lom':
+                self.dump_selected_device_lom()
+                response = b'LOM dump written to logs'
+
+            elif cmd == 'doctor':
+                # Button doctor: first call enables (press each button twice),
+                # second call reports the hardware classification to the logs.
+                enabled = self.main_component._helpers.doctor_toggle()
+                response = (b'doctor enabled - press each button twice, then run `doctor` again'
+                            if enabled else b'doctor report written to logs')
+
+            elif cmd == 'coalesce':
+                # Live-update coalescing counters (how many knob-turn updates
+                # were collapsed into a later one before going on the wire).
+                stats = self.main_component._update_coalescer.stats()
+                summary = ' '.join(f'{k}={v}' for k, v in stats.items())
+                self.log_message(f"[coalesce] {summary}")
+                response = f'coalesce {summary}'.encode('utf-8')
+
+            elif cmd == 'stats':
+                # Hot-path latency percentiles per stage + bytes sent, followed
+                # by the per-component counters (see latency_stats.py).
+                report = '\n'.join(self._stats_lines())
+                self.log_message(f"[stats]\n{report}")
+                response = report.encode('utf-8')
+
+            elif cmd == 'stats reset':
+                self._stats_reset()
+                response = b'stats reset'
+
+            elif cmd == 'hudowner':
+                # HUD-owner election state plus how many bursts/updates skipped
+                # HUD assembly because another surface owns the HUD.
+                stats = self.main_component._remote.hud_stats()
+                summary = ' '.join(f'{k}={v}' for k, v in stats.items())
+                self.log_message(f"[hudowner] {summary}")
+                response = f'hudowner {summary}'.encode('utf-8')
+
+            elif cmd == 'showinfo':
+                # HUD show-info: each button press is explained on the HUD via an
+                # EVENT message until toggled off.
+                enabled = self.main_component._helpers.show_info_toggle()
+                response = (b'show-info enabled - press a button to see it explained on the HUD'
+                            if enabled else b'show-info disabled')
+
+            if response is not None:
+                self._socket.sendto(response, addr)
+
+        except Exception as e:
+            self.log_message(f"ck_launch_control_16: Exception in message processing: {traceback.format_exc()}")
+
+    def refresh_state(self):
+        # Live calls this when a controller's MIDI port comes back: the EC4 may
+        # have power-cycled, so diffing sinks must rewrite in full.
+        super().refresh_state()
+        try:
+            self.main_component._remote.refresh_feedback()
+        except Exception as e:
+            self.log_message(f"Error refreshing feedback sinks: {e}")
+
+    def disconnect(self):
+        self.show_message("Disconnecting...")
+        try:
+            self._hud_arbiter.unregister()
+        except Exception as e:
+            self.log_message(f"Error unregistering HUD arbiter: {e}")
+        try:
+            self.main_component.remove_app_view_listeners()
+        except Exception as e:
+            self.log_message(f"Error removing app view listeners: {e}")
+        try:
+            self.main_component.drum_rack.disconnect()
+        except Exception as e:
+            self.log_message(f"Error removing drum clip listener: {e}")
+        try:
+            self.main_component._helpers.disconnect()
+        except Exception as e:
+            self.log_message(f"Error removing track/device name listeners: {e}")
+        try:
+            self.main_component._nav.disconnect()
+        except Exception as e:
+            self.log_message(f"Error removing track nav listeners: {e}")
+        try:
+            self.main_component.functions.track_nav.disconnect()
+        except Exception as e:
+            self.log_message(f"Error removing track position listeners: {e}")
+        try:
+            self.main_component._update_coalescer.close()
+        except Exception as e:
+            self.log_message(f"Error closing update coalescer: {e}")
+        self.io_hub.close()
+        self._close_sender()
+        try:
+            # Write the sinks' last queued SysEx while the port is still open.
+            self.main_component._midi_out.close()
+        except Exception as e:
+            self.log_message(f"Error closing MIDI-out queue: {e}")
+        try:
+            self.main_component._share.release_all()
+        except Exception as e:
+            self.log_message(f"Error releasing shared resources: {e}")
+        super().disconnect()
+        # def _setup_session(self):
+    #     self._session = SessionComponent(num_tracks=8, num_scenes=1)
+    #     self._session.set_enabled(True)
+    # 
+    # def _setup_mixer(self):
+    #     self._mixer = MixerComponent(num_tracks=8)
+    #     self._mixer.set_enabled(True)
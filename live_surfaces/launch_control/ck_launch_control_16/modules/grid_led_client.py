@@ -0,0 +1,244 @@
+"""Intech Grid RGB-LED feedback sink.
+
+Rides the device-focus burst — same seam as `Ec4Client` and the HUD — but instead
+of text/UDP it emits a single batched SysEx to the Grid's MIDI RX carrying a dense
+48-slot RGB frame (32 pots + 16 buttons). The Grid-side Lua (`self.sysexrx_cb`,
+see `live_surfaces/grid/grid_led_handler.lua`) parses it and drives each element's
+LED via `glc`. See grid-po16-synth-surface-plan §F.
+
+Per slot:
+  * hue    = the slot's zone colour (`snapshot.zone_colors` hex6); unmapped => off.
+  * bright = the slot's live value normalised over vmin..vmax, floored to
+             MAPPED_FLOOR so a mapped-but-low pot / off button stays visibly dim
+             rather than reading as unmapped.
+RGB is pre-multiplied (hue x brightness) and scaled 8-bit -> 7-bit; the Lua scales
+back up for `glc`. The frame is DENSE every burst, so focusing a non-zoned device
+(empty zone_colors) emits all-off and clears the previous synth's tint.
+
+Between bursts, live value changes (`Remote.parameter_updated` -> `on_update`)
+go out as a second, sparse command carrying only the slots whose 7-bit RGB
+actually changed:
+
+    F0 7D 44 01  (slot r g b)*  F7        'D' = delta, slot = 0..47
+
+The client keeps the last RGB sent per slot, so a sweep that does not move a
+slot's brightness step sends nothing, and pending slots are flushed at most
+`max_fps` times a second (a one-shot `schedule_message` tick picks up whatever
+arrived inside the interval). A delta that would be no smaller than the dense
+frame is sent as the dense frame instead.
+
+Transport is `manager._send_midi` (the surface's own MIDI out == the Grid), through
+the surface's `MidiOutQueue` when it has one, exactly like `Ec4Client`.
+"""
+import logging
+import time
+import traceback
+
+from .midi_out import NullMidiOut
+
+logger = logging.getLogger("grid-led-client")
+
+# ---- Grid LED SysEx v1 framing (see module docstring) -----------------------
+SYSEX_START = 0xF0
+NON_COMMERCIAL_ID = 0x7D   # SysEx "non-commercial / educational" manufacturer id
+LED_CMD = 0x4C             # 'L' — set-LEDs command (dense frame)
+LED_DELTA_CMD = 0x44       # 'D' — set changed slots only: (slot r g b)*
+VERSION = 0x01
+SYSEX_END = 0xF7
+
+NUM_DIALS = 32             # grid-2 + grid-3 pots, wire_idx 0..31
+NUM_BUTTONS = 16           # grid-1 buttons, wire_idx 0..15
+NUM_SLOTS = NUM_DIALS + NUM_BUTTONS
+
+# Mapped-but-dark floor: keeps a mapped slot at its minimum value visibly lit so
+# it never reads as an unmapped (fully off) slot. Tuned during LED bring-up.
+MAPPED_FLOOR = 0.15
+
+OFF = [0, 0, 0]
+
+# Live-update LED frames per second. The Grid repaints its LEDs far slower than
+# a pot sweep produces CCs; past ~30fps the extra frames are invisible and only
+# load its MIDI RX.
+DEFAULT_MAX_FPS = 30
+
+_FRAME_LEN = 4 + NUM_SLOTS * 3 + 1
+
+
+def _slot_index(kind, wire):
+    """Frame slot for (kind, wire_idx), or None outside the 48-slot surface."""
+    if kind == 'dial':
+        return wire if 0 <= wire < NUM_DIALS else None
+    if kind == 'button':
+        return NUM_DIALS + wire if 0 <= wire < NUM_BUTTONS else None
+    return None
+
+
+def _normalise(payload):
+    """Value in [0, 1] over vmin..vmax, clamped. Degenerate range => full."""
+    lo, hi = payload.vmin, payload.vmax
+    if hi == lo:
+        return 1.0
+    frac = (payload.value - lo) / (hi - lo)
+    return 0.0 if frac < 0.0 else 1.0 if frac > 1.0 else frac
+
+
+def _rgb7(hexv, payload):
+    """Pre-multiplied, 7-bit-safe [r, g, b] for one slot. `hexv` is a 6-char hex
+    zone colour or None (=> off); `payload` is the slot's SlotPayload or None."""
+    if not hexv:
+        return list(OFF)
+    r = int(hexv[0:2], 16)
+    g = int(hexv[2:4], 16)
+    b = int(hexv[4:6], 16)
+    bright = MAPPED_FLOOR + (1.0 - MAPPED_FLOOR) * _normalise(payload) if payload else MAPPED_FLOOR
+    # scale by brightness, then 8-bit -> 7-bit (>>1) to stay inside SysEx data range.
+    return [(int(c * bright)) >> 1 for c in (r, g, b)]
+
+
+class GridLedClient:
+    def __init__(self, manager, max_fps=DEFAULT_MAX_FPS, clock=None, midi_out=None):
+        """`max_fps` caps live-update LED messages per second (None/0 = send on
+        every update). `midi_out` is the surface's MidiOutQueue (None writes
+        straight to `manager._send_midi`). `clock` is injectable for tests."""
+        self._manager = manager
+        self._midi_out = midi_out if midi_out is not None else NullMidiOut(manager)
+        self._min_interval = (1.0 / max_fps) if max_fps else 0.0
+        self._clock = clock or time.monotonic
+        self._last_send = None
+        self._tick_scheduled = False
+        # Zone colour per (kind, wire_idx) from the last burst: a live update
+        # carries only the value, the hue comes from the focused device's zones.
+        self._colours = {}
+        # Last [r, g, b] the Grid was sent per slot; None = unknown (startup or
+        # a failed send), so live updates wait for the next dense frame.
+        self._sent = None
+        # slot -> [r, g, b] still to send (differs from self._sent[slot]).
+        self._pending = {}
+        self.reset_stats()
+
+    def reset_stats(self):
+        # frames  -- dense 48-slot frames sent
+        # deltas  -- sparse changed-slot messages sent
+        # slots   -- slots carried by deltas
+        # skipped -- live updates whose RGB matched what the Grid already shows
+        self.frames = 0
+        self.deltas = 0
+        self.slots = 0
+        self.skipped = 0
+
+    def stats(self):
+        return {'frames': self.frames, 'deltas': self.deltas,
+                'slots': self.slots, 'skipped': self.skipped}
+
+    def on_burst(self, snapshot):
+        """Emit the dense 48-slot RGB frame for this device-focus burst. Fires on
+        suppressed-HUD bursts too — LEDs are persistent device state, not the
+        transient HUD."""
+        self._colours = {(kind, wire): hexv for kind, wire, hexv in snapshot.zone_colors}
+        dials = {wire: p for wire, p in snapshot.dials}
+        buttons = {wire: p for wire, p in snapshot.buttons}
+
+        frame = []
+        for i in range(NUM_DIALS):
+            frame.append(_rgb7(self._colours.get(('dial', i)), dials.get(i)))
+        for i in range(NUM_BUTTONS):
+            frame.append(_rgb7(self._colours.get(('button', i)), buttons.get(i)))
+        # The dense frame repaints every slot from live values: anything still
+        # pending is superseded.
+        self._pending = {}
+        self._send_frame(frame)
+
+    def on_update(self, kind, wire, payload):
+        """A live value change for one slot. Queued only if it changes what the
+        Grid shows; sent now if the frame interval has passed, else on the next
+        tick."""
+        slot = _slot_index(kind, wire)
+        if slot is None or self._sent is None:
+            return
+        rgb = _rgb7(self._colours.get((kind, wire)), payload)
+        if rgb == self._sent[slot]:
+            self.skipped += 1
+            self._pending.pop(slot, None)
+            return
+        self._pending[slot] = rgb
+        if self._due():
+            self.flush()
+        elif not self._tick_scheduled:
+            self._tick_scheduled = True
+            try:
+                self._manager.schedule_message(1, self._tick)
+            except Exception:
+                self._tick_scheduled = False
+                logger.error(f"GridLedClient: failed to schedule tick: {traceback.format_exc()}")
+
+    def flush(self):
+        """Send pending slots: one sparse delta, or the dense frame when the
+        delta would be no smaller."""
+        pending, self._pending = self._pending, {}
+        if not pending or self._sent is None:
+            return
+        if 4 + 4 * len(pending) + 1 >= _FRAME_LEN:
+            frame = list(self._sent)
+            for slot, rgb in pending.items():
+                frame[slot] = rgb
+            self._send_frame(frame)
+            return
+        body = []
+        for slot in sorted(pending):
+            body.append(slot)
+            body += pending[slot]
+        msg = [SYSEX_START, NON_COMMERCIAL_ID, LED_DELTA_CMD, VERSION] + body + [SYSEX_END]
+        for slot, rgb in pending.items():
+            self._sent[slot] = rgb
+        self.deltas += 1
+        self.slots += len(pending)
+        self._send(msg)
+
+    def _tick(self):
+        self._tick_scheduled = False
+        try:
+            if not self._pending:
+                return
+            if self._due():
+                self.flush()
+            else:
+                self._tick_scheduled = True
+                self._manager.schedule_message(1, self._tick)
+        except Exception:
+            logger.error(f"GridLedClient._tick: {traceback.format_exc()}")
+
+    def _due(self):
+        if self._last_send is None or not self._min_interval:
+            return True
+        return self._clock() - self._last_send >= self._min_interval
+
+    def _send_frame(self, frame):
+        body = [b for rgb in frame for b in rgb]
+        msg = ([SYSEX_START, NON_COMMERCIAL_ID, LED_CMD, VERSION]
+               + body + [SYSEX_END])
+        self._sent = frame
+        self.frames += 1
+        # The dense frame carries every slot: queued deltas are obsolete.
+        self._send(msg, supersede=True)
+
+    def _send(self, msg, supersede=False):
+        # Shadow already updated: a failed send (now, or on the MIDI-out tick)
+        # resets it through _on_send_error.
+        self._last_send = self._clock()
+        self._midi_out.send(self, msg, supersede=supersede, on_error=self._on_send_error)
+
+    def _on_send_error(self):
+        # Unknown LED state now: live updates wait for the next dense frame.
+        self._sent = None
+        self._pending = {}
+
+    def on_hide(self):
+        """No-op: LEDs are persistent physical state, not tied to HUD dismissal.
+        (Kept for feedback-sink interface symmetry; `hide()` never fans to sinks.)"""
+        pass
+
+
+class NullGridLedClient:
+    def on_burst(self, snapshot): pass
+    def on_update(self, kind, wire, payload): pass
+    def on_hide(self): pass
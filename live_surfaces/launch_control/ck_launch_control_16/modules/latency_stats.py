@@ -0,0 +1,140 @@
+"""Hot-path latency probes: fixed-size histograms per stage, plus byte counters.
+
+A probe is two `perf_counter()` reads around a stage:
+
+    t0 = perf_counter()
+    ...
+    STATS.record('burst', t0)
+
+`record` files the elapsed time into the stage's `Histogram`, a preallocated
+list of bucket counts, so a sample allocates nothing beyond the float it was
+handed. Buckets are quarter-octaves of microseconds (4 per power of two), which
+keeps percentiles within ~19% of the true value from 1us up to a minute.
+
+Stages (see the call sites):
+
+- param_event  -- `Helpers.device_parameter_action`: generated listener in,
+                  resolve + write + update queued out
+- resolve      -- the encoder resolve inside param_event
+- param_update -- `Remote.parameter_updated` (OSC + HUD update queued)
+- update_wait  -- a live update's time queued in the coalescer before its flush
+- update_flush -- the coalescer flush: the live updates' socket writes
+- burst        -- `HudPresenter.emit_burst`, device focus to burst sent
+- burst_wire   -- `Remote.refresh_burst`: encoding + the burst's socket write
+- midi_wait    -- a feedback sink's SysEx message queued in `MidiOutQueue`
+                  until the tick that writes it
+
+`STATS` is module-level: each generated surface ships its own copy of this
+module, so the numbers are per surface. Read with the `stats` control command,
+clear with `stats reset`.
+"""
+from time import perf_counter
+
+# 4 exact buckets for 0..3us, then 4 per octave up to 2^26us (~67s).
+_SUB = 4
+_BUCKETS = _SUB + 25 * _SUB
+
+STAGES = ('param_event', 'resolve', 'param_update', 'update_wait', 'update_flush',
+          'burst', 'burst_wire', 'midi_wait')
+
+
+def _bucket(us):
+    v = int(us)
+    if v < _SUB:
+        return v if v > 0 else 0
+    e = v.bit_length() - 1
+    idx = (e - 1) * _SUB + ((v >> (e - 2)) & 3)
+    return idx if idx < _BUCKETS else _BUCKETS - 1
+
+
+def _bucket_upper(idx):
+    """Exclusive upper bound (us) of bucket `idx` — what a percentile reports."""
+    if idx < _SUB:
+        return idx + 1
+    e = idx // _SUB + 1
+    sub = idx % _SUB
+    return ((_SUB + sub) << (e - 2)) + (1 << (e - 2))
+
+
+class Histogram:
+    __slots__ = ('counts', 'count', 'max_us')
+
+    def __init__(self):
+        self.counts = [0] * _BUCKETS
+        self.count = 0
+        self.max_us = 0.0
+
+    def record_us(self, us):
+        self.counts[_bucket(us)] += 1
+        self.count += 1
+        if us > self.max_us:
+            self.max_us = us
+
+    def percentile(self, q):
+        """Upper bound (us) of the bucket holding the q-quantile sample (q in
+        0..1), capped at the largest sample seen. 0 when empty."""
+        if not self.count:
+            return 0
+        rank = max(1, int(q * self.count + 0.999999))
+        seen = 0
+        for idx, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(_bucket_upper(idx), self.max_us)
+        return self.max_us
+
+    def reset(self):
+        for i in range(_BUCKETS):
+            self.counts[i] = 0
+        self.count = 0
+        self.max_us = 0.0
+
+
+class LatencyStats:
+    def __init__(self, clock=perf_counter):
+        self._clock = clock
+        self._hists = {name: Histogram() for name in STAGES}
+        self._counters = {}
+
+    def record(self, stage, t0):
+        """Record the time since `t0` (a value of this stats' clock) for `stage`."""
+        self.record_us(stage, (self._clock() - t0) * 1e6)
+
+    def record_us(self, stage, us):
+        hist = self._hists.get(stage)
+        if hist is None:
+            hist = self._hists[stage] = Histogram()
+        hist.record_us(us)
+
+    def add(self, counter, n=1):
+        """Bump a plain counter (bytes / datagrams / messages sent)."""
+        self._counters[counter] = self._counters.get(counter, 0) + n
+
+    def histogram(self, stage):
+        return self._hists.get(stage)
+
+    def counters(self):
+        return dict(self._counters)
+
+    def reset(self):
+        for hist in self._hists.values():
+            hist.reset()
+        self._counters.clear()
+
+    def summary_lines(self):
+        """One `stage n=.. p50=..us p95=..us p99=..us max=..us` line per stage
+        that has samples, then the counters on one line."""
+        lines = []
+        for name, hist in self._hists.items():
+            if not hist.count:
+                continue
+            lines.append(
+                f"{name} n={hist.count} p50={hist.percentile(0.50):.0f}us "
+                f"p95={hist.percentile(0.95):.0f}us p99={hist.percentile(0.99):.0f}us "
+                f"max={hist.max_us:.0f}us")
+        if self._counters:
+            lines.append(' '.join(f'{k}={v}' for k, v in sorted(self._counters.items())))
+        return lines
+
+
+STATS = LatencyStats()
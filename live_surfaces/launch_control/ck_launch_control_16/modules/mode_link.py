@@ -0,0 +1,78 @@
+"""Reverse mode channel for the `lc_parks` compositor (primary -> secondary).
+
+The secondary controller is on its own MIDI port and can never see the primary's
+shift button, so it cannot switch its own mappings on its own. This module is the
+one-way link that lets the PRIMARY drive the SECONDARY's mode FSM: when the user
+holds shift on the primary, the primary's `goto_mode` forwards the active mode
+NAME over UDP; the secondary receives it and calls its own `goto_mode`, swapping
+its listeners and re-forwarding its HUD region so the combined HUD repaints.
+
+`ModeSender` is the primary side (a tiny UDP line sender, modelled on HudClient).
+`ModeListener` is the secondary side (a socket polled by the surface's `IoHub`,
+like RegionListener). Both are inert/absent on standalone surfaces.
+"""
+import socket
+import traceback
+
+from . import hud_protocol
+from .io_hub import IoHub
+
+
+class ModeSender:
+    """Primary side: send the active mode name to the secondary's mode port --
+    or to each of them, when `port` is a list (one per secondary with modes)."""
+
+    def __init__(self, host='127.0.0.1', port=0):
+        self._host = host
+        self._ports = list(port) if isinstance(port, (list, tuple)) else [port]
+        self._socket = None
+        try:
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        except Exception:
+            self._socket = None
+
+    def send_mode(self, name: str):
+        if self._socket is None:
+            return
+        try:
+            payload = (hud_protocol.encode_set_mode(name) + '\n').encode('utf-8')
+        except Exception:
+            return
+        for port in self._ports:
+            try:
+                self._socket.sendto(payload, (self._host, port))
+            except Exception:
+                pass
+
+
+class ModeListener:
+    """Secondary side: receive forwarded mode names and drive `target.goto_mode`.
+
+    Polled by the surface's `IoHub` (its own when none is passed), like
+    `region_listener.RegionListener`. `target` is the surface's main_component.
+    """
+
+    def __init__(self, manager, target, port, name="mode", hub=None):
+        self._manager = manager
+        self._target = target
+        self._name = name
+        self._socket = None
+        try:
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self._socket.bind(('127.0.0.1', port))
+            self.log_message(f"{name}: mode listener on port {port}")
+            hub = hub if hub is not None else IoHub(manager, name=name)
+            hub.register(self._socket, self.on_datagram, bufsize=4096, label=name)
+        except Exception:
+            self.log_message(f"{name}: mode listener socket error on port {port}: {traceback.format_exc()}")
+
+    def log_message(self, msg):
+        self._manager.log_message(msg)
+
+    def _handle(self, text):
+        for msg in hud_protocol.parse_all(text):
+            if isinstance(msg, hud_protocol.SetModeMsg):
+                self._target.goto_mode(msg.name)
+
+    def on_datagram(self, data, _addr):
+        self._handle(data.decode('utf-8', errors='replace'))
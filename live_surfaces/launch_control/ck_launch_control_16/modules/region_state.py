@@ -0,0 +1,205 @@
+"""Secondary-region cache + relay for the `lc_parks` compositor.
+
+The parks surface forwards its already-resolved HUD region (DEVICE / SLOT /
+COMMIT / UPDATE / HIDE) to lc_parks over UDP instead of to the HUD. lc_parks is
+the single HUD sender; it merges the parks region into its own combined grid.
+
+`RegionState` is the pure, socket-free core (so it's cheap to unit-test):
+- caches the secondary's slots, remapped from the secondary's own wire indices
+  into the combined wire space via the baked dial/button offsets,
+- relays live `UPDATE`s straight to the real HUD (remapped),
+- on a full secondary burst (`COMMIT`), calls `on_commit` so the primary
+  re-emits the combined burst: its cached last burst + this cache
+  (`Remote.reemit_region_burst`), without re-resolving its own device.
+
+Slots are kept in preallocated per-kind lists indexed by the secondary's own
+wire index (combined index = offset + list index). Datagrams are scanned from
+bytes (`hud_protocol.scan_datagram`): a SLOT record is stored as a lazy
+reference into the received datagram and only decoded into a `SlotPayload`
+when the primary re-emits and reads it back -- a slot overwritten by the next
+burst first is never decoded at all.
+
+A compositor with several secondaries has one `RegionState` per secondary,
+each with its own offsets, behind a `RegionSet` -- the merged view Remote
+reads. Each region keeps its published slots as encoded SLOT lines too, re-
+encoded only after that region changed, so a COMMIT from one secondary re-
+encodes that region alone; the others' lines are reused as they are.
+
+`RegionListener` (region_listener.py) wraps this with the UDP socket.
+"""
+from typing import Callable, List, Optional, Tuple
+
+from . import hud_protocol
+from .hud_protocol import (
+    DeviceMsg, DeltaMsg, SlotMsg, CommitMsg, UpdateMsg, HideMsg, PingMsg, SlotPayload,
+    SCAN_SLOT,
+)
+
+
+def _put(slots: list, idx: int, item) -> None:
+    if idx < 0:
+        return
+    if idx >= len(slots):
+        # Only if the secondary sends past the counts baked at codegen.
+        slots.extend([None] * (idx + 1 - len(slots)))
+    slots[idx] = item
+
+
+def _clear(slots: list) -> None:
+    slots[:] = [None] * len(slots)
+
+
+class RegionState:
+    def __init__(self, hud_client, dial_offset: int, button_offset: int,
+                 on_commit: Optional[Callable[[], None]] = None,
+                 dial_count: int = 0, button_count: int = 0):
+        self._hud = hud_client
+        self._dial_offset = dial_offset
+        self._button_offset = button_offset
+        self._on_commit = on_commit
+        # Published region, read by the primary burst path; pending is filled
+        # by a burst and copied over on COMMIT. Entries: None (no slot), a
+        # SlotPayload, or a not-yet-decoded lazy slot from scan_datagram.
+        self._dials: list = [None] * dial_count
+        self._buttons: list = [None] * button_count
+        self._pending_dials: list = [None] * dial_count
+        self._pending_buttons: list = [None] * button_count
+        # The forwarder announces multipart (REGION_CAPABILITIES), so an
+        # oversized region burst arrives as PART fragments reassembled here.
+        self._parts = hud_protocol.PartAssembler()
+        # Published slots as encoded SLOT lines (combined indices), rebuilt on
+        # demand after `version` moves (COMMIT / UPDATE / HIDE).
+        self._lines = None
+        self.version = 0
+
+    def _offset(self, kind: str) -> int:
+        return self._dial_offset if kind == 'dial' else self._button_offset
+
+    def handle(self, msg) -> None:
+        if isinstance(msg, DeviceMsg):
+            _clear(self._pending_dials)
+            _clear(self._pending_buttons)
+        elif isinstance(msg, DeltaMsg):
+            # A delta burst only carries what changed: start from the published
+            # region (UPDATEs included) instead of an empty one.
+            self._pending_dials[:] = self._dials
+            self._pending_buttons[:] = self._buttons
+        elif isinstance(msg, SlotMsg):
+            _put(self._pending_dials if msg.kind == 'dial' else self._pending_buttons,
+                 msg.index, msg.payload)
+        elif isinstance(msg, CommitMsg):
+            self._dials[:] = self._pending_dials
+            self._buttons[:] = self._pending_buttons
+            self._changed()
+            self._fire_commit()
+        elif isinstance(msg, UpdateMsg):
+            _put(self._dials if msg.kind == 'dial' else self._buttons, msg.index, msg.payload)
+            self._changed()
+            p = msg.payload
+            self._hud.send_update(msg.kind, msg.index + self._offset(msg.kind),
+                                  p.name, p.value, p.vmin, p.vmax)
+        elif isinstance(msg, HideMsg):
+            # Drop the secondary region but do NOT re-burst: a parks HIDE means
+            # "navigated away", and a COMMIT here would re-show the HUD (DEVICE/
+            # COMMIT clear the receiver's sticky dismiss), defeating auto-dismiss.
+            # lc_parks's own app-view HIDE owns hiding the panel; the next
+            # legitimate primary burst repaints without the parks region.
+            _clear(self._dials)
+            _clear(self._buttons)
+            self._changed()
+        elif isinstance(msg, PingMsg):
+            # A secondary button/switch press emits PING (keepalive). Relay it to
+            # the real HUD so its dismiss timer re-arms — "alive while either
+            # surface is active". Keepalive only: no re-burst, no state change
+            # (PING can't resurrect a HIDE-dismissed HUD, so this is safe).
+            self._hud.send_ping()
+        # LayoutMsg / ModeMsg / PageMsg from the secondary are ignored:
+        # lc_parks bakes the secondary's placement at codegen and owns paging.
+
+    def handle_data(self, data: str) -> None:
+        for msg in hud_protocol.parse_all(data):
+            self.handle(msg)
+
+    def handle_datagram(self, data: bytes) -> None:
+        """One received datagram, binary frame (the forwarder's default, see
+        REGION_CAPABILITIES) or text, or one PART fragment of either."""
+        if hud_protocol.is_part(data):
+            data = self._parts.feed(data)
+            if data is None:
+                return
+        for tag, kind, index, item in hud_protocol.scan_datagram(data):
+            if tag is None:
+                self.handle(item)
+            elif tag == SCAN_SLOT:
+                # Stored undecoded; see `_payloads`.
+                _put(self._pending_dials if kind == 'dial' else self._pending_buttons, index, item)
+            else:
+                # A live UPDATE is relayed right away, so it is decoded now.
+                payload = item.decode()
+                if payload is not None:
+                    self.handle(UpdateMsg(kind, index, payload))
+
+    def _changed(self) -> None:
+        self._lines = None
+        self.version += 1
+
+    def _fire_commit(self) -> None:
+        if self._on_commit is not None:
+            self._on_commit()
+
+    @staticmethod
+    def _payloads(slots: list, offset: int) -> List[Tuple[int, SlotPayload]]:
+        out = []
+        for i, entry in enumerate(slots):
+            if entry is None:
+                continue
+            if type(entry) is not SlotPayload:
+                # First read since this slot arrived: decode, and keep the
+                # decoded payload so the next re-emit doesn't decode again.
+                entry = slots[i] = entry.decode()
+                if entry is None:
+                    continue
+            out.append((i + offset, entry))
+        return out
+
+    def dial_payloads(self) -> List[Tuple[int, SlotPayload]]:
+        return self._payloads(self._dials, self._dial_offset)
+
+    def button_payloads(self) -> List[Tuple[int, SlotPayload]]:
+        return self._payloads(self._buttons, self._button_offset)
+
+    def slot_lines(self) -> List[str]:
+        """The published region as encoded SLOT lines, buttons after dials."""
+        if self._lines is None:
+            encode = hud_protocol.encode_slot_payload
+            lines = [encode('dial', i, p) for i, p in self.dial_payloads()]
+            lines += [encode('button', i, p) for i, p in self.button_payloads()]
+            self._lines = lines
+        return self._lines
+
+
+class RegionSet:
+    """Merged view over one RegionState per secondary, in section order. Has
+    the same read side as a single RegionState, which is all Remote uses."""
+
+    def __init__(self, regions):
+        self.regions = list(regions)
+        self._versions = None
+        self._lines = []
+
+    def slot_lines(self) -> List[str]:
+        # Concatenation only: a region that did not change since the last call
+        # hands back its cached lines untouched.
+        versions = [r.version for r in self.regions]
+        if versions != self._versions:
+            lines = []
+            for region in self.regions:
+                lines += region.slot_lines()
+            self._lines, self._versions = lines, versions
+        return self._lines
+
+    def dial_payloads(self) -> List[Tuple[int, SlotPayload]]:
+        return [entry for region in self.regions for entry in region.dial_payloads()]
+
+    def button_payloads(self) -> List[Tuple[int, SlotPayload]]:
+        return [entry for region in self.regions for entry in region.button_payloads()]
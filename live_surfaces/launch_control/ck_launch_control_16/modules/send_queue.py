@@ -0,0 +1,159 @@
+"""Background sender: HUD and OSC socket writes off Live's main thread.
+
+Every `sendto` used to run inside a control-surface callback, so a slow or
+momentarily blocked loopback send added its latency to MIDI handling. With a
+`SendQueue`, HudClient and OSCClient still encode on the main thread (the
+datagram is final when it is queued) but only append it to a bounded deque; a
+daemon thread does the writes, in FIFO order.
+
+Ordering and atomicity are unchanged: a burst is still one datagram, queued
+after everything sent before it. What the queue adds is a drop policy for when
+the receiver side stalls and the queue fills:
+
+- `UPDATE` items (live parameter updates) are the only droppable kind. A full
+  queue first drops its *oldest* UPDATE -- the newest value for a slot is the
+  one worth keeping, and the next burst re-sends everything anyway.
+- `BURST` and `CONTROL` items (HIDE, PING, LAYOUT ...) are never dropped. If
+  the queue is full of them it grows past `max_depth` and counts an overflow.
+
+A failed send cannot tell the caller synchronously any more; the item's
+`on_error` callback runs on the sender thread instead (HudClient uses it to
+force its next burst out as a keyframe). Likewise the `<stat>_datagrams` /
+`<stat>_bytes` counters are bumped here, after the write succeeds, so dropped
+and failed datagrams are not counted as sent.
+"""
+import collections
+import logging
+import threading
+
+from .latency_stats import STATS
+
+logger = logging.getLogger("send-queue")
+
+BURST = 'burst'
+UPDATE = 'update'
+CONTROL = 'control'
+
+# Enough for several bursts plus a tick's worth of updates per sink; a queue
+# this deep means the receiver has stalled, not that Live is busy.
+DEFAULT_MAX_DEPTH = 256
+
+
+class SendQueue:
+    def __init__(self, max_depth=DEFAULT_MAX_DEPTH, name="surface"):
+        self._max_depth = max_depth
+        self._items = collections.deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._busy = False
+        self.reset_stats()
+        self._thread = threading.Thread(target=self._run, name=f"{name}-sender", daemon=True)
+        self._thread.start()
+
+    def reset_stats(self):
+        # queued          -- items accepted
+        # sent            -- datagrams written by the sender thread
+        # dropped_updates -- UPDATEs dropped by the full-queue policy
+        # overflows       -- bursts/control items queued past max_depth
+        # errors          -- failed sends
+        # high_water      -- deepest the queue has been
+        self.queued = 0
+        self.sent = 0
+        self.dropped_updates = 0
+        self.overflows = 0
+        self.errors = 0
+        self.high_water = 0
+
+    def stats(self):
+        return {
+            'depth': len(self._items),
+            'high_water': self.high_water,
+            'queued': self.queued,
+            'sent': self.sent,
+            'dropped_updates': self.dropped_updates,
+            'overflows': self.overflows,
+            'errors': self.errors,
+        }
+
+    def put(self, sock, payload, addr, kind=CONTROL, owner=None, on_error=None, stat=None):
+        """Queue one encoded datagram. False only when it was an UPDATE dropped
+        on arrival (full queue holding no older UPDATE to drop instead).
+        `stat` names the STATS counters ('hud' -> hud_datagrams/hud_bytes)
+        bumped once the datagram has actually been written."""
+        with self._cond:
+            if self._closed:
+                return False
+            if len(self._items) >= self._max_depth and not self._make_room(kind):
+                self.dropped_updates += 1
+                return False
+            self._items.append((kind, sock, payload, addr, owner, on_error, stat))
+            self.queued += 1
+            if len(self._items) > self.high_water:
+                self.high_water = len(self._items)
+            self._cond.notify()
+        return True
+
+    def _make_room(self, kind):
+        # Caller holds the lock. Drop the oldest UPDATE; failing that an
+        # incoming UPDATE is refused and anything else overflows the bound.
+        for i, item in enumerate(self._items):
+            if item[0] == UPDATE:
+                del self._items[i]
+                self.dropped_updates += 1
+                return True
+        if kind == UPDATE:
+            return False
+        self.overflows += 1
+        return True
+
+    def discard(self, owner):
+        """Drop every still-queued item of `owner` (a client that was just
+        disabled must not keep talking to the HUD it no longer owns)."""
+        with self._cond:
+            kept = [item for item in self._items if item[4] is not owner]
+            self._items.clear()
+            self._items.extend(kept)
+
+    def wait_idle(self, timeout=1.0):
+        """Block until everything queued so far has been written. For tests and
+        for `close`; the surface itself never waits on the sender."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._items and not self._busy, timeout)
+
+    def close(self, timeout=0.5):
+        """Send what is queued, then stop the thread. Idempotent. Called before
+        the shared socket is released so the final HIDE/bursts still go out."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._items and not self._closed:
+                    self._cond.wait()
+                if not self._items:
+                    return
+                kind, sock, payload, addr, owner, on_error, stat = self._items.popleft()
+                self._busy = True
+            try:
+                sock.sendto(payload, addr)
+                self.sent += 1
+                if stat is not None:
+                    STATS.add(f'{stat}_datagrams')
+                    STATS.add(f'{stat}_bytes', len(payload))
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"SendQueue: {kind} send to {addr} failed: {e}")
+                if on_error is not None:
+                    try:
+                        on_error()
+                    except Exception:
+                        pass
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
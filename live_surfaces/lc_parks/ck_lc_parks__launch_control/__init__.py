@@ -0,0 +1,5 @@
+### Script Generated by Control Surface Studio for Python 3 (resorted to default: no)
+from .ck_lc_parks__launch_control import ck_lc_parks__launch_control
+
+def create_instance(c_instance):
+    return ck_lc_parks__launch_control(c_instance)
\ No newline at end of file
@@ -0,0 +1,7 @@
+export ABLETON_APP="/Applications/Ableton Live 12 Suite.app"
+
+export SCRIPTS_HOME="$ABLETON_APP/Contents/App-Resources/MIDI Remote Scripts"
+echo "Copying files to $SCRIPTS_HOME/ck_lc_parks__launch_control"
+mkdir -p "$SCRIPTS_HOME/ck_lc_parks__launch_control/modules" && \
+cp *.py "$SCRIPTS_HOME/ck_lc_parks__launch_control/" && \
+cp -R modules/. "$SCRIPTS_HOME/ck_lc_parks__launch_control/modules/"
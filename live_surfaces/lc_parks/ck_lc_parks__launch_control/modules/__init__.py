@@ -0,0 +1,5 @@
+# ### Script Generated by Control Surface Studio for Python 3 (resorted to default: no)
+# from .$surface_name import $surface_name
+#
+# def create_instance(c_instance):
+#     return $surface_name(c_instance)
\ No newline at end of file
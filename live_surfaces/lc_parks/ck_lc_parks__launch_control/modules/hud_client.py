@@ -0,0 +1,327 @@
+import socket
+import logging
+import time
+
+from . import hud_protocol
+from .latency_stats import STATS
+from .send_queue import BURST, UPDATE, CONTROL
+
+logger = logging.getLogger("hud-client")
+
+
+class HudClient:
+    # Single-source protocol. `host`/`port` default to the HUD app on
+    # 127.0.0.1:5006, but the parks forwarder points its client at the
+    # `lc_parks` compositor's region port instead, which relays/merges into the
+    # one HUD stream.
+    def __init__(self, host='127.0.0.1', port=5006, clock=None, sock=None, sender=None):
+        # `sock`: an existing UDP socket to send through (the process-wide one
+        # from shared_hub, so co-loaded surfaces don't each open their own).
+        # Its owner closes it; None opens a private socket as before.
+        # `sender`: a send_queue.SendQueue to hand encoded datagrams to instead
+        # of writing them on the caller's (Live's main) thread. None writes
+        # inline as before.
+        self._host = host
+        self._port = port
+        self._socket = None
+        # Single chokepoint for wall-clock "last time anything went out" — every
+        # PING/UPDATE/burst datagram passes through `_sendto`. `hud_toggle` reads
+        # `seconds_since_last_send()` to mirror the Swift idle-dismiss timer (see
+        # IDLE_DISMISS_SECONDS). Injectable clock so the math is unit-testable.
+        self._clock = clock or time.monotonic
+        self._last_send = None
+        # When a list, `_send` buffers lines instead of emitting them, so a whole
+        # burst can be flushed as ONE datagram (burst-atomic on the wire — a lost
+        # datagram then loses the whole burst rather than mixing devices). See
+        # hud_protocol.md "Burst semantics".
+        self._burst_buffer = None
+        # A single UDP datagram is OS-capped (macOS net.inet.udp.maxdgram default
+        # 9216); over it, `sendto` raises EMSGSIZE and the whole burst is lost.
+        # Above this threshold `flush_burst` degrades to per-line datagrams — the
+        # pre-coalescing behavior — so an oversized burst is never *dropped*, only
+        # non-atomic. Real bursts are a few KB, so this never trips in practice.
+        self._max_datagram = 8192
+        # Owner gate for co-loaded surfaces: a surface that lost HUD-owner
+        # election calls set_enabled(False) so it
+        # goes fully silent on the wire -- including HIDE, which is what was
+        # tearing down the elected owner's HUD burst before this existed.
+        self._enabled = True
+        # Delta bursts (hud_protocol.md "Delta bursts"): off until the HUD
+        # announces `delta` in its HELLO. `_shadow` is the {state_key: line}
+        # map of the last burst the receiver actually got; None forces the next
+        # burst out as a full keyframe. A keyframe also goes out every
+        # `_keyframe_interval` deltas so a receiver that silently missed a
+        # datagram re-converges without waiting for a HELLO.
+        self._delta = False
+        self._shadow = None
+        self._keyframe_interval = 32
+        self._deltas_since_keyframe = 0
+        # Binary frames (hud_protocol.md "Binary frames"): off until the
+        # receiver announces `bin1`. Only the datagram encoding changes; bursts,
+        # deltas and the shadow all still work on text lines.
+        self._binary = False
+        # Multipart bursts (hud_protocol.md "Multipart bursts"): off until the
+        # receiver announces `part1`. Only an over-cap burst is affected; it
+        # goes out as PART fragments instead of one datagram per line.
+        self._multipart = False
+        self._part_seq = 0
+        self._sender = sender
+        # Set by the sender thread when a queued datagram failed to go out; the
+        # next flush_burst turns it into a keyframe (the shadow may be ahead).
+        self._send_failed = False
+        try:
+            self._socket = sock if sock is not None else socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            logger.info(f"HudClient created: {host}:{port}")
+        except Exception as e:
+            logger.error(f"HudClient: failed to create socket: {e}")
+
+    def _send(self, line: str):
+        if self._burst_buffer is not None:
+            self._burst_buffer.append(line)
+            return
+        if self._shadow is not None:
+            # A state line outside a burst (an UPDATE, a re-handshake LAYOUT)
+            # changes the receiver behind the shadow's back: forget that key so
+            # the next delta re-sends it rather than trusting a stale copy.
+            key = hud_protocol.state_key(line)
+            if key is not None:
+                self._shadow.pop(key, None)
+        self._sendto(self._frame([line]), UPDATE if line.startswith('UPDATE|') else CONTROL)
+
+    def _frame(self, lines) -> bytes:
+        """Encode lines as one datagram payload: a binary frame once the
+        receiver has announced `bin1`, newline-terminated UTF-8 text otherwise."""
+        if self._binary:
+            return hud_protocol.encode_binary(lines)
+        return ''.join(line + '\n' for line in lines).encode('utf-8')
+
+    def _sendto(self, payload: bytes, kind=CONTROL) -> bool:
+        """Send one datagram. True iff it actually left (enabled, socket up,
+        no error) -- the delta shadow only advances on a real send. With a
+        sender, "left" means queued: a later failure comes back through
+        `_on_send_error`. `kind` is the queue's drop class (send_queue)."""
+        if self._socket is None or not self._enabled:
+            return False
+        try:
+            if self._sender is not None:
+                # Counted by the sender thread once the write succeeds.
+                if not self._sender.put(self._socket, payload, (self._host, self._port),
+                                        kind, owner=self, on_error=self._on_send_error,
+                                        stat='hud'):
+                    return False
+            else:
+                self._socket.sendto(payload, (self._host, self._port))
+                STATS.add('hud_datagrams')
+                STATS.add('hud_bytes', len(payload))
+            # Stamp only on a real send: this timestamp stands in for "the Swift
+            # idle timer was just re-armed", so a discarded/failed datagram must
+            # not count as activity.
+            self._last_send = self._clock()
+            return True
+        except Exception as e:
+            logger.error(f"HudClient._sendto: {e}")
+            return False
+
+    def _on_send_error(self):
+        # Sender thread: only flag it; the main thread acts on it.
+        self._send_failed = True
+
+    def seconds_since_last_send(self):
+        """Seconds since the last datagram actually left, or None if nothing has
+        been sent yet. Read by `hud_toggle` to detect a Swift idle-dismiss."""
+        if self._last_send is None:
+            return None
+        return self._clock() - self._last_send
+
+    def set_enabled(self, flag: bool):
+        """Gate all outgoing datagrams. Used by HudArbiter: only the elected
+        HUD owner stays enabled; a non-owner surface goes silent -- including
+        HIDE -- rather than fighting the owner over the shared HUD sink.
+        Gated in `_sendto` (not `_send`), so burst buffering is untouched:
+        a disabled client still buffers/coalesces normally, it just discards
+        the assembled datagram(s) at the last step."""
+        if flag and not self._enabled:
+            # Another surface owned the HUD meanwhile; our shadow no longer
+            # describes what the receiver holds.
+            self.request_keyframe()
+        self._enabled = flag
+        if not flag and self._sender is not None:
+            # Already-queued datagrams are past the gate; drop them too.
+            self._sender.discard(self)
+
+    def set_delta(self, enabled: bool):
+        """Switch delta bursts on/off. Either way the next burst is a full
+        keyframe, so the receiver and the shadow start from the same state."""
+        self._delta = bool(enabled)
+        self.request_keyframe()
+
+    def negotiate(self, capabilities):
+        """Apply the capabilities a HUD announced in its HELLO. A HELLO means
+        the receiver (re)started with empty state, so this always re-keys."""
+        self._binary = hud_protocol.CAP_BINARY in capabilities
+        self._multipart = hud_protocol.CAP_MULTIPART in capabilities
+        self.set_delta(hud_protocol.CAP_DELTA in capabilities)
+
+    def request_keyframe(self):
+        """Force the next burst out in full (HELLO, owner change, lost send)."""
+        self._shadow = None
+        self._deltas_since_keyframe = 0
+
+    def begin_burst(self):
+        """Start buffering lines. Everything sent until `flush_burst` is held so
+        the burst goes out as a single datagram. Idempotent; a second call just
+        drops any half-buffered lines (a burst is always assembled start-to-end
+        on Live's single thread, so this can't split a live burst)."""
+        self._burst_buffer = []
+
+    def flush_burst(self):
+        """Emit the buffered burst as one datagram and return to pass-through.
+        No-op when nothing was buffered (e.g. a suppressed burst)."""
+        lines, self._burst_buffer = self._burst_buffer, None
+        if not lines:
+            return
+        if self._send_failed:
+            self._send_failed = False
+            self.request_keyframe()
+        state = None
+        if self._delta:
+            shadow = self._shadow
+            if self._deltas_since_keyframe >= self._keyframe_interval:
+                shadow = None
+            delta, state = hud_protocol.diff_burst(lines, shadow)
+            if delta is not None:
+                lines = delta
+                self._deltas_since_keyframe += 1
+            else:
+                self._deltas_since_keyframe = 0
+        payload = self._frame(lines)
+        parts = None
+        if len(payload) > self._max_datagram and self._multipart:
+            parts = hud_protocol.encode_parts(payload, self._part_seq, self._max_datagram)
+            self._part_seq = (self._part_seq + 1) & 0xFFFF
+        if len(payload) <= self._max_datagram:
+            sent = self._sendto(payload, BURST)
+        elif parts is not None:
+            # Oversized burst, multipart receiver: a few near-cap fragments it
+            # reassembles, so the burst stays atomic.
+            sent = all([self._sendto(part, BURST) for part in parts])
+        else:
+            # Oversized burst: send per line so it's delivered (non-atomic) rather
+            # than rejected wholesale by the OS datagram cap.
+            sent = all([self._sendto(self._frame([line]), BURST) for line in lines])
+        if state is not None:
+            # Advance the shadow only when the receiver really got this burst;
+            # otherwise the next burst must be a keyframe.
+            self._shadow = state if sent else None
+
+    def send_layout(self, cells):
+        self._send(hud_protocol.encode_layout(cells))
+
+    def send_dividers(self, cols):
+        self._send(hud_protocol.encode_dividers(cols))
+
+    def send_device(self, name: str):
+        self._send(hud_protocol.encode_device(name))
+
+    def send_slot(self, kind: str, index: int, name: str, value, vmin, vmax, glyph: str = ""):
+        self._send(hud_protocol.encode_slot(kind, index, name, value, vmin, vmax, glyph))
+
+    def send_update(self, kind: str, index: int, name: str, value, vmin, vmax, glyph: str = ""):
+        self._send(hud_protocol.encode_update(kind, index, name, value, vmin, vmax, glyph))
+
+    def send_lines(self, lines):
+        """Send already-encoded lines (e.g. SLOT lines a compositor cached from
+        an earlier burst) exactly as if each had gone through its `send_*`."""
+        if self._burst_buffer is not None:
+            self._burst_buffer.extend(lines)
+            return
+        for line in lines:
+            self._send(line)
+
+    def send_updates(self, updates):
+        """Send a batch of UPDATEs (each a `send_update` argument tuple) packed
+        into as few datagrams as fit under `_max_datagram` -- normally one. Used
+        by UpdateCoalescer's tick flush; UPDATEs are independent patches, so a
+        batch split across datagrams is still correct, just not atomic."""
+        lines = [hud_protocol.encode_update(*u) for u in updates]
+        if self._burst_buffer is not None:
+            self._burst_buffer.extend(lines)
+            return
+        if self._shadow is not None:
+            for line in lines:
+                self._shadow.pop(hud_protocol.state_key(line), None)
+        # Packed by text size: a binary frame of the same lines is smaller for
+        # slot lines and at most a few header bytes larger otherwise, well
+        # inside the headroom between `_max_datagram` and the OS cap.
+        batch, size = [], 0
+        for line in lines:
+            n = len(line.encode('utf-8')) + 1
+            if batch and size + n > self._max_datagram:
+                self._sendto(self._frame(batch), UPDATE)
+                batch, size = [], 0
+            batch.append(line)
+            size += n
+        if batch:
+            self._sendto(self._frame(batch), UPDATE)
+
+    def commit(self, count: int):
+        self._send(hud_protocol.encode_commit(count))
+
+    def send_ping(self):
+        self._send(hud_protocol.encode_ping())
+
+    def send_hide(self):
+        self._send(hud_protocol.encode_hide())
+
+    def send_autohide(self, enabled: bool):
+        self._send(hud_protocol.encode_autohide(enabled))
+
+    def send_toggle(self):
+        self._send(hud_protocol.encode_toggle())
+
+    def send_mode(self, is_shift: bool):
+        self._send(hud_protocol.encode_mode(is_shift))
+
+    def send_page_info(self, enc_page: int, enc_total: int, btn_page: int, btn_total: int,
+                       enc_label: str = '', btn_label: str = ''):
+        self._send(hud_protocol.encode_page_info(
+            enc_page, enc_total, btn_page, btn_total, enc_label, btn_label))
+
+    def send_event(self, kind: str, wire_idx: int, text: str):
+        self._send(hud_protocol.encode_event(kind, wire_idx, text))
+
+    def send_zones(self, entries):
+        self._send(hud_protocol.encode_zones(entries))
+
+    def send_drum(self, pad_name: str, pattern: str, page: int = 1, pages: int = 1,
+                  resolution: str = '16'):
+        self._send(hud_protocol.encode_drum(pad_name, pattern, page, pages, resolution))
+
+
+class NullHudClient:
+    # Parallel interface to HudClient; every method is a no-op.
+    def __init__(self, host='127.0.0.1', port=5006, clock=None, sock=None, sender=None): pass
+    def set_enabled(self, flag: bool): pass
+    def set_delta(self, enabled: bool): pass
+    def negotiate(self, capabilities): pass
+    def request_keyframe(self): pass
+    def seconds_since_last_send(self): return None
+    def begin_burst(self): pass
+    def flush_burst(self): pass
+    def send_layout(self, cells): pass
+    def send_dividers(self, cols): pass
+    def send_device(self, name: str): pass
+    def send_slot(self, kind: str, index: int, name: str, value, vmin, vmax, glyph: str = ""): pass
+    def send_update(self, kind: str, index: int, name: str, value, vmin, vmax, glyph: str = ""): pass
+    def send_lines(self, lines): pass
+    def send_updates(self, updates): pass
+    def commit(self, count: int): pass
+    def send_ping(self): pass
+    def send_hide(self): pass
+    def send_autohide(self, enabled: bool): pass
+    def send_toggle(self): pass
+    def send_mode(self, is_shift: bool): pass
+    def send_page_info(self, enc_page, enc_total, btn_page, btn_total, enc_label='', btn_label=''): pass
+    def send_event(self, kind, wire_idx, text): pass
+    def send_zones(self, entries): pass
+    def send_drum(self, pad_name, pattern, page=1, pages=1, resolution='16'): pass
\ No newline at end of file
@@ -0,0 +1,138 @@
+"""One poll loop for all of a surface's inbound UDP sockets.
+
+The command port, the OSC button listener, the lc_parks region listener and the
+mode link each used to reschedule their own `schedule_message` tick, each with
+its own non-blocking `recvfrom` and exception ladder, and the command port read
+a single datagram per tick. `IoHub` owns one tick instead: a zero-timeout
+`selectors` poll over every registered socket, then each readable socket is
+drained up to `budget` datagrams and every datagram is handed to its handler.
+
+Handlers are `handler(data, addr)` and run on Live's main thread, exactly where
+the per-listener ticks ran them. A handler that raises is logged and the drain
+moves on to the next datagram; it never stops the loop.
+"""
+import errno
+import selectors
+import socket
+import traceback
+
+# Datagrams read per socket per tick. Bounds the time a single tick can spend
+# on a flooded port; anything left is read on the next tick.
+DEFAULT_BUDGET = 32
+
+
+class IoHub:
+    def __init__(self, manager, budget=DEFAULT_BUDGET, name="surface"):
+        self._manager = manager
+        self._budget = budget
+        self._name = name
+        self._selector = selectors.DefaultSelector()
+        self._closed = False
+        self.reset_stats()
+        try:
+            self._manager.schedule_message(1, self.tick)
+        except Exception:
+            self.log_message(f"{name}: IoHub failed to schedule tick: {traceback.format_exc()}")
+
+    def log_message(self, msg):
+        self._manager.log_message(msg)
+
+    def reset_stats(self):
+        # ticks       -- poll passes
+        # datagrams   -- datagrams dispatched to a handler
+        # budget_hits -- drains cut short by the per-tick budget
+        # errors      -- handler exceptions + unexpected socket errors
+        self.ticks = 0
+        self.datagrams = 0
+        self.budget_hits = 0
+        self.errors = 0
+
+    def stats(self):
+        return {
+            'sockets': len(self._selector.get_map() or ()),
+            'ticks': self.ticks,
+            'datagrams': self.datagrams,
+            'budget_hits': self.budget_hits,
+            'errors': self.errors,
+        }
+
+    def register(self, sock, handler, bufsize=65536, label=None):
+        """Poll `sock` (made non-blocking) every tick and pass each datagram to
+        `handler(data, addr)`. `bufsize` must cover the largest datagram the
+        port receives — a shorter UDP read truncates it."""
+        sock.setblocking(False)
+        self._selector.register(sock, selectors.EVENT_READ,
+                                (handler, bufsize, label or self._name))
+
+    def unregister(self, sock, close=False):
+        try:
+            self._selector.unregister(sock)
+        except (KeyError, ValueError):
+            pass
+        if close:
+            try:
+                sock.close()
+            except Exception:
+                pass
+
+    def reset(self, keep=()):
+        """Unregister and close every socket except those in `keep`. Used by the
+        surface's `reload` so the re-created listeners can bind their ports
+        again instead of colliding with the previous instances' sockets."""
+        for key in list(self._selector.get_map().values()):
+            if key.fileobj not in keep:
+                self.unregister(key.fileobj, close=True)
+
+    def close(self):
+        """Close every registered socket and stop rescheduling the tick."""
+        if self._closed:
+            return
+        self.reset()
+        self._selector.close()
+        self._closed = True
+
+    def tick(self):
+        if self._closed:
+            return
+        try:
+            self.poll()
+        except Exception:
+            self.errors += 1
+            self.log_message(f"{self._name}: IoHub poll error: {traceback.format_exc()}")
+        self._manager.schedule_message(1, self.tick)
+
+    def poll(self):
+        """One non-blocking select over every socket, then drain the readable
+        ones. Returns the number of datagrams dispatched."""
+        self.ticks += 1
+        if not self._selector.get_map():
+            return 0
+        dispatched = 0
+        for key, _events in self._selector.select(0):
+            dispatched += self._drain(key.fileobj, *key.data)
+        return dispatched
+
+    def _drain(self, sock, handler, bufsize, label):
+        dispatched = 0
+        for _ in range(self._budget):
+            try:
+                data, addr = sock.recvfrom(bufsize)
+            except socket.error as e:
+                if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    return dispatched
+                if e.errno == errno.ECONNRESET:
+                    # Benign on Windows: an ICMP port-unreachable for an earlier
+                    # send surfaces on the next recv. The socket is still fine.
+                    continue
+                self.errors += 1
+                self.log_message(f"{label}: socket error: {traceback.format_exc()}")
+                return dispatched
+            dispatched += 1
+            self.datagrams += 1
+            try:
+                handler(data, addr)
+            except Exception:
+                self.errors += 1
+                self.log_message(f"{label}: handler error: {traceback.format_exc()}")
+        self.budget_hits += 1
+        return dispatched
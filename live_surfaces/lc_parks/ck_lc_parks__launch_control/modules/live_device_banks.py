@@ -0,0 +1,1461 @@
+"""Bundled snapshot of Ableton's per-device parameter banks.
+
+Source: /Applications/Ableton Live 12 Suite.app/Contents/App-Resources/
+         MIDI Remote Scripts/_Generic/Devices.py
+Snapshot taken from Live 12.
+
+Refresh on Live upgrades; rerun scripts/extract_live_device_banks.py.
+
+Three exports:
+  DEVICE_BANKS: {class_name: (bank_tuple, ...)} -- bank is 8-tuple of original_names
+  BANK_NAMES:   {class_name: (bank_name, ...)}
+  DEVICE_BOBS:  {class_name: (8-tuple,)}  -- Ableton-curated BOB (unused; we hand-author)
+"""
+
+DEVICE_BANKS = {'Amp': (('Amp Type', 'Bass', 'Middle', 'Treble', 'Presence', 'Gain', 'Volume', 'Dry/Wet'),
+         ('Dual Mono', '', '', '', '', '', '', '')),
+ 'AudioEffectGroupDevice': (('Macro 1',
+                             'Macro 2',
+                             'Macro 3',
+                             'Macro 4',
+                             'Macro 5',
+                             'Macro 6',
+                             'Macro 7',
+                             'Macro 8'),
+                            ('Macro 9',
+                             'Macro 10',
+                             'Macro 11',
+                             'Macro 12',
+                             'Macro 13',
+                             'Macro 14',
+                             'Macro 15',
+                             'Macro 16')),
+ 'AutoFilter': (('Frequency',
+                 'Resonance',
+                 'Env. Attack',
+                 'Env. Release',
+                 'Env. Modulation',
+                 'LFO Amount',
+                 'LFO Frequency',
+                 'LFO Phase'),
+                ('Filter Type',
+                 'LFO Quantize On',
+                 'LFO Quantize Rate',
+                 'LFO Stereo Mode',
+                 'LFO Spin',
+                 'LFO Sync',
+                 'LFO Sync Rate',
+                 'LFO Offset'),
+                ('', '', '', '', '', 'S/C On', 'S/C Mix', 'S/C Gain')),
+ 'AutoPan': (('Frequency',
+              'Phase',
+              'Shape',
+              'Waveform',
+              'Sync Rate',
+              'Offset',
+              'Width (Random)',
+              'Amount'),),
+ 'BeatRepeat': (('Interval',
+                 'Offset',
+                 'Grid',
+                 'Variation',
+                 'Filter Freq',
+                 'Filter Width',
+                 'Volume',
+                 'Decay'),
+                ('Chance',
+                 'Gate',
+                 'Pitch',
+                 'Pitch Decay',
+                 'Filter Freq',
+                 'Filter Width',
+                 'Volume',
+                 'Decay')),
+ 'Cabinet': (('Cabinet Type',
+              'Microphone Position',
+              'Microphone Type',
+              'Dual Mono',
+              '',
+              '',
+              '',
+              'Dry/Wet'),),
+ 'Chorus': (('LFO Amount',
+             'LFO Rate',
+             'Delay 1 Time',
+             'Delay 1 HiPass',
+             'Delay 2 Time',
+             'Delay 2 Mode',
+             'Feedback',
+             'Dry/Wet'),),
+ 'Collision': (('Mallet On/Off',
+                'Mallet Volume',
+                'Mallet Noise Amount',
+                'Mallet Stiffness',
+                'Mallet Noise Color',
+                '',
+                '',
+                ''),
+               ('Noise Volume',
+                'Noise Filter Type',
+                'Noise Filter Freq',
+                'Noise Filter Q',
+                'Noise Attack',
+                'Noise Decay',
+                'Noise Sustain',
+                'Noise Release'),
+               ('Res 1 Decay',
+                'Res 1 Material',
+                'Res 1 Type',
+                'Res 1 Quality',
+                'Res 1 Tune',
+                'Res 1 Fine Tune',
+                'Res 1 Pitch Env.',
+                'Res 1 Pitch Env. Time'),
+               ('Res 1 Listening L',
+                'Res 1 Listening R',
+                'Res 1 Hit',
+                'Res 1 Brightness',
+                'Res 1 Inharmonics',
+                'Res 1 Radius',
+                'Res 1 Opening',
+                'Res 1 Ratio'),
+               ('Res 2 Decay',
+                'Res 2 Material',
+                'Res 2 Type',
+                'Res 2 Quality',
+                'Res 2 Tune',
+                'Res 2 Fine Tune',
+                'Res 2 Pitch Env.',
+                'Res 2 Pitch Env. Time'),
+               ('Res 2 Listening L',
+                'Res 2 Listening R',
+                'Res 2 Hit',
+                'Res 2 Brightness',
+                'Res 2 Inharmonics',
+                'Res 2 Radius',
+                'Res 2 Opening',
+                'Res 2 Ratio')),
+ 'Compressor2': (('Threshold',
+                  'Ratio',
+                  'Attack',
+                  'Release',
+                  'Auto Release On/Off',
+                  'Env Mode',
+                  'Knee',
+                  'Model'),
+                 ('Threshold',
+                  'Expansion Ratio',
+                  'LookAhead',
+                  'S/C Listen',
+                  'S/C Gain',
+                  'Makeup',
+                  'Dry/Wet',
+                  'Output Gain'),
+                 ('S/C EQ On',
+                  'S/C EQ Type',
+                  'S/C EQ Freq',
+                  'S/C EQ Q',
+                  'S/C EQ Gain',
+                  'S/C On',
+                  'S/C Mix',
+                  'S/C Gain')),
+ 'Corpus': (('Decay',
+             'Material',
+             'Mid Freq',
+             'Width',
+             'Bleed',
+             'Resonance Type',
+             'Gain',
+             'Dry Wet'),
+            ('Listening L',
+             'Listening R',
+             'Hit',
+             'Brightness',
+             'Inharmonics',
+             'Radius',
+             'Opening',
+             'Ratio'),
+            ('Resonance Type',
+             'Tune',
+             'Transpose',
+             'Fine',
+             'Spread',
+             'Resonator Quality',
+             'Note Off',
+             'Off Decay')),
+ 'DrumBuss': (('Drive',
+               'Drive Type',
+               'Transients',
+               'Crunch',
+               'Boom Freq',
+               'Boom Amt',
+               'Boom Decay',
+               'Boom Audition'),
+              ('Trim', 'Output Gain', 'Dry/Wet', 'Compressor On', 'Damping Freq', '', '', '')),
+ 'DrumGroupDevice': (('Macro 1',
+                      'Macro 2',
+                      'Macro 3',
+                      'Macro 4',
+                      'Macro 5',
+                      'Macro 6',
+                      'Macro 7',
+                      'Macro 8'),
+                     ('Macro 9',
+                      'Macro 10',
+                      'Macro 11',
+                      'Macro 12',
+                      'Macro 13',
+                      'Macro 14',
+                      'Macro 15',
+                      'Macro 16')),
+ 'Echo': (('L Division',
+           'R Division',
+           'L Sync Mode',
+           'R Sync Mode',
+           'L 16th',
+           'R 16th',
+           'L Sync',
+           'R Sync'),
+          ('L Time', 'R Time', 'L Offset', 'R Offset', 'Link', 'Channel Mode', '', ''),
+          ('Gate On',
+           'Gate Thr',
+           'Gate Release',
+           'Duck On',
+           'Duck Thr',
+           'Duck Release',
+           'Env Mix',
+           ''),
+          ('Noise On',
+           'Noise Amt',
+           'Noise Mrph',
+           'Wobble On',
+           'Wobble Amt',
+           'Wobble Mrph',
+           'Repitch',
+           ''),
+          ('Feedback', 'Feedback Inv', 'Input Gain', 'Output Gain', 'Clip Dry', 'Dry Wet', '', ''),
+          ('Filter On', 'HP Freq', 'HP Res', 'LP Freq', 'LP Res', '', '', ''),
+          ('Reverb Level', 'Reverb Decay', 'Reverb Loc', 'Stereo Width', '', '', '', ''),
+          ('Mod Wave',
+           'Mod Sync',
+           'Mod Rate',
+           'Mod Freq',
+           'Mod Phase',
+           'Dly < Mod',
+           'Flt < Mod',
+           'Mod 4x')),
+ 'Eq8': (('1 Filter On A',
+          '2 Filter On A',
+          '3 Filter On A',
+          '4 Filter On A',
+          '5 Filter On A',
+          '6 Filter On A',
+          '7 Filter On A',
+          '8 Filter On A'),
+         ('1 Frequency A',
+          '2 Frequency A',
+          '3 Frequency A',
+          '4 Frequency A',
+          '5 Frequency A',
+          '6 Frequency A',
+          '7 Frequency A',
+          '8 Frequency A'),
+         ('1 Gain A',
+          '2 Gain A',
+          '3 Gain A',
+          '4 Gain A',
+          '5 Gain A',
+          '6 Gain A',
+          '7 Gain A',
+          '8 Gain A'),
+         ('1 Resonance A',
+          '2 Resonance A',
+          '3 Resonance A',
+          '4 Resonance A',
+          '5 Resonance A',
+          '6 Resonance A',
+          '7 Resonance A',
+          '8 Resonance A'),
+         ('1 Filter Type A',
+          '2 Filter Type A',
+          '3 Filter Type A',
+          '4 Filter Type A',
+          '5 Filter Type A',
+          '6 Filter Type A',
+          '7 Filter Type A',
+          '8 Filter Type A'),
+         ('Adaptive Q', '', '', '', '', '', 'Scale', 'Output Gain'),
+         ('3 Gain A',
+          '3 Frequency A',
+          '3 Resonance A',
+          '4 Gain A',
+          '4 Frequency A',
+          '4 Resonance A',
+          '5 Gain A',
+          '5 Frequency A')),
+ 'Erosion': (('Frequency', 'Width', 'Mode', 'Amount', '', '', '', ''),),
+ 'FilterDelay': (('1 Filter Freq',
+                  '1 Filter Width',
+                  '1 Beat Delay',
+                  '1 Beat Swing',
+                  '1 Feedback',
+                  '1 Pan',
+                  '1 Volume',
+                  'Dry'),
+                 ('2 Filter Freq',
+                  '2 Filter Width',
+                  '2 Beat Delay',
+                  '2 Beat Swing',
+                  '2 Feedback',
+                  '2 Pan',
+                  '2 Volume',
+                  'Dry'),
+                 ('3 Filter Freq',
+                  '3 Filter Width',
+                  '3 Beat Delay',
+                  '3 Beat Swing',
+                  '3 Feedback',
+                  '3 Pan',
+                  '3 Volume',
+                  'Dry')),
+ 'FilterEQ3': (('GainLo', 'GainMid', 'GainHi', 'FreqLo', 'LowOn', 'MidOn', 'HighOn', 'FreqHi'),),
+ 'Flanger': (('Hi Pass',
+              'Dry/Wet',
+              'Delay Time',
+              'Feedback',
+              'Env. Modulation',
+              'Env. Attack',
+              'Env. Release',
+              ''),
+             ('LFO Amount',
+              'Frequency',
+              'LFO Phase',
+              'Sync',
+              'LFO Offset',
+              'Sync Rate',
+              'LFO Width (Random)',
+              'LFO Waveform')),
+ 'FrequencyShifter': (('Coarse',
+                       'Fine',
+                       'Mode',
+                       'Ring Mod Frequency',
+                       'Drive On/Off',
+                       'Drive',
+                       'Wide',
+                       'Dry/Wet'),),
+ 'Gate': (('Threshold', 'Return', 'FlipMode', 'LookAhead', 'Attack', 'Hold', 'Release', 'Floor'),
+          ('S/C EQ On',
+           'S/C EQ Type',
+           'S/C EQ Freq',
+           'S/C EQ Q',
+           'S/C EQ Gain',
+           'S/C On',
+           'S/C Mix',
+           'S/C Gain')),
+ 'GlueCompressor': (('Threshold',
+                     'Ratio',
+                     'Attack',
+                     'Release',
+                     'Peak Clip In',
+                     'Range',
+                     'Dry/Wet',
+                     'Makeup'),
+                    ('S/C EQ On',
+                     'S/C EQ Type',
+                     'S/C EQ Freq',
+                     'S/C EQ Q',
+                     'S/C EQ Gain',
+                     'S/C On',
+                     'S/C Mix',
+                     'S/C Gain')),
+ 'GrainDelay': (('Frequency',
+                 'Pitch',
+                 'Time Delay',
+                 'Beat Swing',
+                 'Random',
+                 'Spray',
+                 'Feedback',
+                 'DryWet'),),
+ 'InstrumentGroupDevice': (('Macro 1',
+                            'Macro 2',
+                            'Macro 3',
+                            'Macro 4',
+                            'Macro 5',
+                            'Macro 6',
+                            'Macro 7',
+                            'Macro 8'),
+                           ('Macro 9',
+                            'Macro 10',
+                            'Macro 11',
+                            'Macro 12',
+                            'Macro 13',
+                            'Macro 14',
+                            'Macro 15',
+                            'Macro 16')),
+ 'InstrumentImpulse': (('1 Start',
+                        '1 Transpose',
+                        '1 Stretch Factor',
+                        '1 Saturator Drive',
+                        '1 Filter Freq',
+                        '1 Filter Res',
+                        '1 Pan',
+                        '1 Volume'),
+                       ('2 Start',
+                        '2 Transpose',
+                        '2 Stretch Factor',
+                        '2 Saturator Drive',
+                        '2 Filter Freq',
+                        '2 Filter Res',
+                        '2 Pan',
+                        '2 Volume'),
+                       ('3 Start',
+                        '3 Transpose',
+                        '3 Stretch Factor',
+                        '3 Saturator Drive',
+                        '3 Filter Freq',
+                        '3 Filter Res',
+                        '3 Pan',
+                        '3 Volume'),
+                       ('4 Start',
+                        '4 Transpose',
+                        '4 Stretch Factor',
+                        '4 Saturator Drive',
+                        '4 Filter Freq',
+                        '4 Filter Res',
+                        '4 Pan',
+                        '4 Volume'),
+                       ('5 Start',
+                        '5 Transpose',
+                        '5 Stretch Factor',
+                        '5 Saturator Drive',
+                        '5 Filter Freq',
+                        '5 Filter Res',
+                        '5 Pan',
+                        '5 Volume'),
+                       ('6 Start',
+                        '6 Transpose',
+                        '6 Stretch Factor',
+                        '6 Saturator Drive',
+                        '6 Filter Freq',
+                        '6 Filter Res',
+                        '6 Pan',
+                        '6 Volume'),
+                       ('7 Start',
+                        '7 Transpose',
+                        '7 Stretch Factor',
+                        '7 Saturator Drive',
+                        '7 Filter Freq',
+                        '7 Filter Res',
+                        '7 Pan',
+                        '7 Volume'),
+                       ('8 Start',
+                        '8 Transpose',
+                        '8 Stretch Factor',
+                        '8 Saturator Drive',
+                        '8 Filter Freq',
+                        '8 Filter Res',
+                        '8 Pan',
+                        '8 Volume')),
+ 'InstrumentVector': (('Osc 1 Transp',
+                       'Osc 1 Detune',
+                       'Osc 1 Pos',
+                       'Osc 1 Effect 1',
+                       'Osc 1 Effect 2',
+                       'Osc 1 Pan',
+                       'Osc 1 Gain',
+                       'Osc 1 On'),
+                      ('Osc 2 Transp',
+                       'Osc 2 Detune',
+                       'Osc 2 Pos',
+                       'Osc 2 Effect 1',
+                       'Osc 2 Effect 2',
+                       'Osc 2 Pan',
+                       'Osc 2 Gain',
+                       'Osc 2 On'),
+                      ('Filter 1 On',
+                       'Filter 1 Freq',
+                       'Filter 1 Res',
+                       'Filter 1 Drive',
+                       'Filter 1 Type',
+                       'Filter 1 Slope',
+                       'Filter 1 LP/HP',
+                       'Filter 1 BP/NO/Morph'),
+                      ('Filter 2 On',
+                       'Filter 2 Freq',
+                       'Filter 2 Res',
+                       'Filter 2 Drive',
+                       'Filter 2 Type',
+                       'Filter 2 Slope',
+                       'Filter 2 LP/HP',
+                       'Filter 2 BP/NO/Morph'),
+                      ('Amp Attack',
+                       'Amp Decay',
+                       'Amp Sustain',
+                       'Amp Release',
+                       'Amp A Slope',
+                       'Amp D Slope',
+                       'Amp R Slope',
+                       'Amp Loop Mode'),
+                      ('Env 2 Attack',
+                       'Env 2 Decay',
+                       'Env 2 Sustain',
+                       'Env 2 Release',
+                       'Env 3 Attack',
+                       'Env 3 Decay',
+                       'Env 3 Sustain',
+                       'Env 3 Release'),
+                      ('LFO 1 Amount',
+                       'LFO 1 Rate',
+                       'LFO 1 S. Rate',
+                       'LFO 1 Sync',
+                       'LFO 2 Amount',
+                       'LFO 2 Rate',
+                       'LFO 2 S. Rate',
+                       'LFO 2 Sync'),
+                      ('Time',
+                       'Global Mod Amount',
+                       'Unison Amount',
+                       'Transpose',
+                       'Glide',
+                       'Sub Gain',
+                       'Sub Transpose',
+                       'Volume')),
+ 'Looper': (('State',
+             'Speed',
+             'Reverse',
+             'Quantization',
+             'Monitor',
+             'Song Control',
+             'Tempo Control',
+             'Feedback'),),
+ 'LoungeLizard': (('M Stiffness',
+                   'M Force',
+                   'Noise Pitch',
+                   'Noise Decay',
+                   'Noise Amount',
+                   'F Tine Color',
+                   'F Tine Decay',
+                   'F Tine Vol'),
+                  ('F Tone Decay',
+                   'F Tone Vol',
+                   'F Release',
+                   'Damp Tone',
+                   'Damp Balance',
+                   'Damp Amount',
+                   '',
+                   ''),
+                  ('P Symmetry', 'P Distance', 'P Amp In', 'P Amp Out', 'Pickup Model', '', '', ''),
+                  ('M Stiff < Vel',
+                   'M Stiff < Key',
+                   'M Force < Vel',
+                   'M Force < Key',
+                   'Noise < Key',
+                   'F Tine < Key',
+                   'P Amp < Key',
+                   ''),
+                  ('Volume',
+                   'Voices',
+                   'Semitone',
+                   'Detune',
+                   'KB Stretch',
+                   'PB Range',
+                   'Note PB Range',
+                   '')),
+ 'MidiArpeggiator': (('Style',
+                      'Groove',
+                      'Offset',
+                      'Synced Rate',
+                      'Retrigger Mode',
+                      'Ret. Interval',
+                      'Repeats',
+                      'Gate'),
+                     ('Tranpose Mode',
+                      'Tranpose Key',
+                      'Transp. Steps',
+                      'Transp. Dist.',
+                      'Velocity Decay',
+                      'Velocity Target',
+                      'Velocity On',
+                      'Vel. Retrigger')),
+ 'MidiChord': (('Shift1', 'Shift2', 'Shift3', 'Shift4', 'Shift5', 'Shift6', '', ''),
+               ('Velocity1',
+                'Velocity2',
+                'Velocity3',
+                'Velocity4',
+                'Velocity5',
+                'Velocity6',
+                '',
+                '')),
+ 'MidiEffectGroupDevice': (('Macro 1',
+                            'Macro 2',
+                            'Macro 3',
+                            'Macro 4',
+                            'Macro 5',
+                            'Macro 6',
+                            'Macro 7',
+                            'Macro 8'),
+                           ('Macro 9',
+                            'Macro 10',
+                            'Macro 11',
+                            'Macro 12',
+                            'Macro 13',
+                            'Macro 14',
+                            'Macro 15',
+                            'Macro 16')),
+ 'MidiNoteLength': (('Sync On',
+                     'Time Length',
+                     'Synced Length',
+                     'Gate',
+                     'Release Velocity',
+                     'Decay Time',
+                     'Decay Key Scale',
+                     'Latch'),),
+ 'MidiPitcher': (('Pitch', 'Range', 'Lowest', '', '', '', '', ''),),
+ 'MidiRandom': (('Chance', 'Choices', 'Interval', 'Sign', '', '', '', ''),),
+ 'MidiScale': (('Base', 'Transpose', 'Range', 'Lowest', '', '', '', ''),),
+ 'MidiVelocity': (('Drive', 'Compand', 'Random', 'Mode', 'Out Hi', 'Out Low', 'Range', 'Lowest'),),
+ 'MultiSampler': (('Volume',
+                   'Ve Attack',
+                   'Ve Decay',
+                   'Ve Sustain',
+                   'Ve Release',
+                   'Vol < Vel',
+                   'Ve R < Vel',
+                   'Time'),
+                  ('Filter Type',
+                   'Filter Morph',
+                   'Filter Freq',
+                   'Filter Res',
+                   'Filt < Vel',
+                   'Filt < Key',
+                   'Fe < Env',
+                   'Shaper Amt'),
+                  ('Fe Attack',
+                   'Fe Decay',
+                   'Fe Sustain',
+                   'Fe Release',
+                   'Fe End',
+                   'Fe Mode',
+                   'Fe Loop',
+                   'Fe Retrig'),
+                  ('L 1 Wave',
+                   'L 1 Sync',
+                   'L 1 Sync Rate',
+                   'L 1 Rate',
+                   'Vol < LFO',
+                   'Filt < LFO',
+                   'Pan < LFO',
+                   'Pitch < LFO'),
+                  ('L 2 Wave',
+                   'L 2 Sync',
+                   'L 2 Sync Rate',
+                   'L 2 Rate',
+                   'L 2 R < Key',
+                   'L 2 St Mode',
+                   'L 2 Spin',
+                   'L 2 Phase'),
+                  ('L 3 Wave',
+                   'L 3 Sync',
+                   'L 3 Sync Rate',
+                   'L 3 Rate',
+                   'L 3 R < Key',
+                   'L 3 St Mode',
+                   'L 3 Spin',
+                   'L 3 Phase'),
+                  ('O Mode',
+                   'O Volume',
+                   'O Coarse',
+                   'O Fine',
+                   'Oe Attack',
+                   'Oe Decay',
+                   'Oe Sustain',
+                   'Oe Release'),
+                  ('Transpose',
+                   'Spread',
+                   'Pe < Env',
+                   'Pe Attack',
+                   'Pe Peak',
+                   'Pe Decay',
+                   'Pe Sustain',
+                   'Pe Release')),
+ 'MultibandDynamics': (('Master Output',
+                        'Amount',
+                        'Time Scaling',
+                        'Soft Knee On/Off',
+                        'Peak/RMS Mode',
+                        'Band Activator (High)',
+                        'Band Activator (Mid)',
+                        'Band Activator (Low)'),
+                       ('Input Gain (Low)',
+                        'Below Threshold (Low)',
+                        'Below Ratio (Low)',
+                        'Above Threshold (Low)',
+                        'Above Ratio (Low)',
+                        'Attack Time (Low)',
+                        'Release Time (Low)',
+                        'Output Gain (Low)'),
+                       ('Input Gain (Mid)',
+                        'Below Threshold (Mid)',
+                        'Below Ratio (Mid)',
+                        'Above Threshold (Mid)',
+                        'Above Ratio (Mid)',
+                        'Attack Time (Mid)',
+                        'Release Time (Mid)',
+                        'Output Gain (Mid)'),
+                       ('Input Gain (High)',
+                        'Below Threshold (High)',
+                        'Below Ratio (High)',
+                        'Above Threshold (High)',
+                        'Above Ratio (High)',
+                        'Attack Time (High)',
+                        'Release Time (High)',
+                        'Output Gain (High)'),
+                       ('Low-Mid Crossover', 'Mid-High Crossover', '', '', '', '', '', ''),
+                       ('', '', '', '', '', 'S/C On', 'S/C Mix', 'S/C Gain')),
+ 'Operator': (('Ae Attack',
+               'Ae Decay',
+               'Ae Sustain',
+               'Ae Release',
+               'A Coarse',
+               'A Fine',
+               'Osc-A Lev < Vel',
+               'Osc-A Level'),
+              ('Be Attack',
+               'Be Decay',
+               'Be Sustain',
+               'Be Release',
+               'B Coarse',
+               'B Fine',
+               'Osc-B Lev < Vel',
+               'Osc-B Level'),
+              ('Ce Attack',
+               'Ce Decay',
+               'Ce Sustain',
+               'Ce Release',
+               'C Coarse',
+               'C Fine',
+               'Osc-C Lev < Vel',
+               'Osc-C Level'),
+              ('De Attack',
+               'De Decay',
+               'De Sustain',
+               'De Release',
+               'D Coarse',
+               'D Fine',
+               'Osc-D Lev < Vel',
+               'Osc-D Level'),
+              ('Le Attack',
+               'Le Decay',
+               'Le Sustain',
+               'Le Release',
+               'LFO Rate',
+               'LFO Amt',
+               'LFO Type',
+               'LFO R < K'),
+              ('Fe Attack',
+               'Fe Decay',
+               'Fe Sustain',
+               'Fe Release',
+               'Filter Freq',
+               'Filter Res',
+               'Fe R < Vel',
+               'Fe Amount'),
+              ('Pe Attack',
+               'Pe Decay',
+               'Pe Sustain',
+               'Pe Release',
+               'Pe Init',
+               'Glide Time',
+               'Pe Amount',
+               'Spread'),
+              ('Time < Key',
+               'Panorama',
+               'Pan < Key',
+               'Pan < Rnd',
+               'Algorithm',
+               'Time',
+               'Tone',
+               'Volume')),
+ 'OriginalSimpler': (('Ve Attack',
+                      'Ve Decay',
+                      'Ve Sustain',
+                      'Ve Release',
+                      'S Start',
+                      'S Loop Length',
+                      'S Length',
+                      'S Loop Fade'),
+                     ('Fe Attack',
+                      'Fe Decay',
+                      'Fe Sustain',
+                      'Fe Release',
+                      'Filter Freq',
+                      'Filter Res',
+                      'Filt < Vel',
+                      'Fe < Env'),
+                     ('L Attack',
+                      'L Rate',
+                      'L R < Key',
+                      'L Wave',
+                      'Vol < LFO',
+                      'Filt < LFO',
+                      'Pitch < LFO',
+                      'Pan < LFO'),
+                     ('Pe Attack',
+                      'Pe Decay',
+                      'Pe Sustain',
+                      'Pe Release',
+                      'Glide Time',
+                      'Spread',
+                      'Pan',
+                      'Volume')),
+ 'Overdrive': (('Filter Freq',
+                'Filter Width',
+                'Drive',
+                'Tone',
+                'Preserve Dynamics',
+                '',
+                '',
+                'Dry/Wet'),),
+ 'Pedal': (('Type', 'Gain', 'Output', 'Bass', 'Mid', 'Treble', 'Sub', 'Dry/Wet'),
+           ('Mid Freq', '', '', '', '', '', '', '')),
+ 'Phaser': (('Poles',
+             'Color',
+             'Dry/Wet',
+             'Frequency',
+             'Env. Modulation',
+             'Env. Attack',
+             'Env. Release',
+             'Feedback'),
+            ('LFO Amount',
+             'LFO Frequency',
+             'LFO Phase',
+             'LFO Sync',
+             'LFO Offset',
+             'LFO Sync Rate',
+             'LFO Spin',
+             'LFO Waveform')),
+ 'Redux': (('Bit Depth', 'Sample Mode', 'Sample Hard', 'Sample Soft', 'Bit On', '', '', ''),),
+ 'Resonator': (('Frequency',
+                'Width',
+                'Global Gain',
+                'Dry/Wet',
+                'Decay',
+                'I Note',
+                'Color',
+                'I Gain'),
+               ('II Gain',
+                'III Gain',
+                'IV Gain',
+                'V Gain',
+                'II Pitch',
+                'III Pitch',
+                'IV Pitch',
+                'V Pitch')),
+ 'Reverb': (('In Filter Freq',
+             'In Filter Width',
+             'Predelay',
+             'ER Spin On',
+             'ER Spin Rate',
+             'ER Spin Amount',
+             'ER Shape',
+             'Decay Time'),
+            ('HiFilter Freq',
+             'LowShelf Freq',
+             'Chorus Rate',
+             'Diffusion',
+             'HiShelf Gain',
+             'LowShelf Gain',
+             'Chorus Amount',
+             'Scale'),
+            ('Decay Time',
+             'Freeze On',
+             'Room Size',
+             'Stereo Image',
+             'Reflect Level',
+             'Diffuse Level',
+             'Dry/Wet',
+             'Density')),
+ 'Saturator': (('Drive', 'Base', 'Frequency', 'Width', 'Depth', 'Output', 'Dry/Wet', 'Type'),
+               ('WS Drive',
+                'WS Lin',
+                'WS Curve',
+                'WS Damp',
+                'WS Depth',
+                'WS Period',
+                'Dry/Wet',
+                '')),
+ 'StereoGain': (('Left Inv',
+                 'Right Inv',
+                 'Channel Mode',
+                 'Stereo Width',
+                 'Mono',
+                 'Balance',
+                 'Gain',
+                 'Mute'),
+                ('Bass Mono', 'Bass Freq', 'DC Filter', '', '', '', '', '')),
+ 'StringStudio': (('Exciter Type',
+                   'String Decay',
+                   'Str Inharmon',
+                   'Str Damping',
+                   'Exc ForceMassProt',
+                   'Exc FricStiff',
+                   'Exc Velocity',
+                   'E Pos'),
+                  ('Damper On',
+                   'Damper Mass',
+                   'D Stiffness',
+                   'D Velocity',
+                   'Damp Pos',
+                   'D Damping',
+                   'D Pos < Vel',
+                   'D Pos Abs'),
+                  ('Term On/Off',
+                   'Term Mass',
+                   'Term Fng Stiff',
+                   'Term Fret Stiff',
+                   'Pickup On/Off',
+                   'Pickup Pos',
+                   'T Mass < Vel',
+                   'T Mass < Key'),
+                  ('Body On/Off',
+                   'Body Type',
+                   'Body Size',
+                   'Body Decay',
+                   'Body Low-Cut',
+                   'Body High-Cut',
+                   'Body Mix',
+                   'Volume'),
+                  ('Vibrato On/Off',
+                   'Vib Delay',
+                   'Vib Fade-In',
+                   'Vib Speed',
+                   'Vib Amount',
+                   'Vib < ModWh',
+                   'Vib Error',
+                   'Volume'),
+                  ('Filter On/Off',
+                   'Filter Type',
+                   'Filter Freq',
+                   'Filter Reso',
+                   'Freq < Env',
+                   'Freq < LFO',
+                   'Reso < Env',
+                   'Reso < LFO'),
+                  ('FEG On/Off',
+                   'FEG Attack',
+                   'FEG Decay',
+                   'FEG Sustain',
+                   'FEG Release',
+                   'LFO On/Off',
+                   'LFO Shape',
+                   'LFO Speed'),
+                  ('Unison On/Off',
+                   'Uni Detune',
+                   'Porta On/Off',
+                   'Porta Time',
+                   'Voices',
+                   'Octave',
+                   'Semitone',
+                   'Volume')),
+ 'Tube': (('Drive', 'Bias', 'Envelope', 'Tone', 'Attack', 'Release', 'Output', 'Dry/Wet'),),
+ 'UltraAnalog': (('OSC1 Level',
+                  'OSC1 Octave',
+                  'OSC1 Semi',
+                  'OSC1 Shape',
+                  'OSC2 Level',
+                  'OSC2 Octave',
+                  'OSC2 Semi',
+                  'OSC2 Shape'),
+                 ('OSC1 Balance',
+                  'F1 Freq',
+                  'F1 Resonance',
+                  'F1 Type',
+                  'OSC2 Balance',
+                  'F2 Freq',
+                  'F2 Resonance',
+                  'F2 Type'),
+                 ('FEG1 Attack',
+                  'FEG1 Decay',
+                  'FEG1 Sustain',
+                  'FEG1 Rel',
+                  'FEG2 Attack',
+                  'FEG2 Decay',
+                  'FEG2 Sustain',
+                  'FEG2 Rel'),
+                 ('F1 On/Off',
+                  'F1 Freq < LFO',
+                  'F1 Freq < Env',
+                  'F1 Res < LFO',
+                  'F2 On/Off',
+                  'F2 Freq < LFO',
+                  'F2 Freq < Env',
+                  'F2 Res < LFO'),
+                 ('AEG1 Attack',
+                  'AEG1 Decay',
+                  'AEG1 Sustain',
+                  'AEG1 Rel',
+                  'AEG2 Attack',
+                  'AEG2 Decay',
+                  'AEG2 Sustain',
+                  'AEG2 Rel'),
+                 ('AMP1 Level',
+                  'AMP1 Pan',
+                  'LFO1 Shape',
+                  'LFO1 Speed',
+                  'AMP2 Level',
+                  'AMP2 Pan',
+                  'LFO2 Shape',
+                  'LFO2 Speed'),
+                 ('Volume',
+                  'Noise On/Off',
+                  'Noise Level',
+                  'Noise Color',
+                  'Unison On/Off',
+                  'Unison Detune',
+                  'Vib On/Off',
+                  'Vib Amount')),
+ 'Vinyl': (('Tracing Freq.',
+            'Tracing Width',
+            'Tracing Drive',
+            'Crackle Density',
+            'Pinch Freq.',
+            'Pinch Width',
+            'Pinch Drive',
+            'Crackle Volume'),),
+ 'Vocoder': (('Formant Shift',
+              'Attack Time',
+              'Release Time',
+              'Mono/Stereo',
+              'Output Level',
+              'Gate Threshold',
+              'Envelope Depth',
+              'Dry/Wet'),
+             ('Filter Bandwidth',
+              'Upper Filter Band',
+              'Lower Filter Band',
+              'Precise/Retro',
+              'Unvoiced Level',
+              'Unvoiced Sensitivity',
+              'Unvoiced Speed',
+              'Enhance'),
+             ('Noise Rate',
+              'Noise Crackle',
+              'Upper Pitch Detection',
+              'Lower Pitch Detection',
+              'Oscillator Pitch',
+              'Oscillator Waveform',
+              'Ext. In Gain',
+              ''))}
+
+BANK_NAMES = {'Amp': ('Global', 'Dual Mono'),
+ 'AudioEffectGroupDevice': ('Macros', 'Macros 2'),
+ 'AutoFilter': ('Filter', 'Filter Extra', 'Side Chain'),
+ 'BeatRepeat': ('Repeat Rate', 'Gate/Pitch'),
+ 'Collision': ('Mallet',
+               'Noise',
+               'Resonator 1, Set A',
+               'Resonator 1, Set B',
+               'Resonator 2, Set A',
+               'Resonator 2, Set B'),
+ 'Compressor2': ('Compression', 'Output', 'Side Chain'),
+ 'Corpus': ('Amount', 'Body', 'Tune'),
+ 'DrumBuss': ('Drive', 'Gain'),
+ 'DrumGroupDevice': ('Macros', 'Macros 2'),
+ 'Echo': ('Sync', 'Time', 'Gate/Ducking', 'Noise/Wobble', 'Gain', 'Filter', 'Reverb', 'Modulation'),
+ 'Eq8': ('Band On/Off', 'Frequency', 'Gain', 'Resonance', 'Filter Type', 'Output', 'EQs 3-5'),
+ 'FilterDelay': ('Input L Filter', 'Input L+R Filter', 'Input R Filter'),
+ 'Flanger': ('Frequency Controls', 'LFO / S&H'),
+ 'Gate': ('Gate', 'Side Chain'),
+ 'GlueCompressor': ('Compression', 'Side Chain'),
+ 'InstrumentGroupDevice': ('Macros', 'Macros 2'),
+ 'InstrumentImpulse': ('Pad 1', 'Pad 2', 'Pad 3', 'Pad 4', 'Pad 5', 'Pad 6', 'Pad 7', 'Pad 8'),
+ 'InstrumentVector': ('Oscillator 1',
+                      'Oscillator 2',
+                      'Filter 1',
+                      'Filter 2',
+                      'Amp Envelope',
+                      'Envelope 2/3',
+                      'LFO 1/2',
+                      'Global'),
+ 'LoungeLizard': ('Mallet and Tine', 'Tone and Damper', 'Pickup', 'Modulation', 'Global'),
+ 'MidiArpeggiator': ('Style', 'Pitch/Velocity'),
+ 'MidiChord': ('Shift', 'Shift %'),
+ 'MidiEffectGroupDevice': ('Macros', 'Macros 2'),
+ 'MultiSampler': ('Volume',
+                  'Filter',
+                  'Filter Envelope',
+                  'LFO 1',
+                  'LFO 2',
+                  'LFO 3',
+                  'Oscillator',
+                  'Pitch'),
+ 'MultibandDynamics': ('Global',
+                       'Low Band',
+                       'Mid Band',
+                       'High Band',
+                       'Split Frequencies',
+                       'Side Chain'),
+ 'Operator': ('Oscillator A',
+              'Oscillator B',
+              'Oscillator C',
+              'Oscillator D',
+              'LFO',
+              'Filter',
+              'Pitch Modulation',
+              'Routing'),
+ 'OriginalSimpler': ('Amplitude', 'Filter', 'LFO', 'Pitch Modifiers'),
+ 'Pedal': ('General', 'Eq'),
+ 'Phaser': ('Frequency Controls', 'LFO / S&H'),
+ 'Resonator': ('General / Mode I', 'Modes II-IV'),
+ 'Reverb': ('Reflections', 'Diffusion Network', 'Global'),
+ 'Saturator': ('General Controls', 'Waveshaper Controls'),
+ 'StereoGain': ('General Controls', 'Low Frequency'),
+ 'StringStudio': ('Exciter and String',
+                  'Damper',
+                  'Termination and Pickup',
+                  'Body',
+                  'Vibrato',
+                  'Filter',
+                  'Envelope and LFO',
+                  'Global'),
+ 'UltraAnalog': ('Oscillators',
+                 'Filters',
+                 'Filter Envelopes',
+                 'Filter Modulation',
+                 'Volume Envelopes',
+                 'Mix',
+                 'Output'),
+ 'Vocoder': ('Global', 'Filters/Voicing', 'Carrier')}
+
+DEVICE_BOBS = {'Amp': (('Amp Type', 'Bass', 'Middle', 'Treble', 'Presence', 'Gain', 'Volume', 'Dry/Wet'),),
+ 'AudioEffectGroupDevice': (('Macro 1',
+                             'Macro 2',
+                             'Macro 3',
+                             'Macro 4',
+                             'Macro 5',
+                             'Macro 6',
+                             'Macro 7',
+                             'Macro 8'),),
+ 'AutoFilter': (('Frequency',
+                 'Resonance',
+                 'Filter Type',
+                 'Env. Modulation',
+                 'LFO Amount',
+                 'LFO Waveform',
+                 'LFO Frequency',
+                 'LFO Phase'),),
+ 'AutoPan': (('Frequency',
+              'Phase',
+              'Shape',
+              'Waveform',
+              'Sync Rate',
+              'Offset',
+              'Width (Random)',
+              'Amount'),),
+ 'BeatRepeat': (('Grid',
+                 'Interval',
+                 'Offset',
+                 'Gate',
+                 'Pitch',
+                 'Pitch Decay',
+                 'Variation',
+                 'Chance'),),
+ 'Cabinet': (('Cabinet Type',
+              'Microphone Position',
+              'Microphone Type',
+              'Dual Mono',
+              '',
+              '',
+              '',
+              'Dry/Wet'),),
+ 'Chorus': (('LFO Amount',
+             'LFO Rate',
+             'Delay 1 Time',
+             'Delay 1 HiPass',
+             'Delay 2 Time',
+             'Delay 2 Mode',
+             'Feedback',
+             'Dry/Wet'),),
+ 'Collision': (('Res 1 Brightness',
+                'Res 1 Type',
+                'Mallet Stiffness',
+                'Mallet Noise Amount',
+                'Res 1 Inharmonics',
+                'Res 1 Decay',
+                'Res 1 Tune',
+                'Volume'),),
+ 'Compressor2': (('Threshold',
+                  'Ratio',
+                  'Attack',
+                  'Release',
+                  'Model',
+                  'Knee',
+                  'Dry/Wet',
+                  'Output Gain'),),
+ 'Corpus': (('Brightness',
+             'Resonance Type',
+             'Material',
+             'Inharmonics',
+             'Decay',
+             'Ratio',
+             'Tune',
+             'Dry Wet'),),
+ 'DrumBuss': (('Drive',
+               'Drive Type',
+               'Crunch',
+               'Boom Amt',
+               'Trim',
+               'Damping Freq',
+               'Output Gain',
+               'Dry/Wet'),),
+ 'DrumGroupDevice': (('Macro 1',
+                      'Macro 2',
+                      'Macro 3',
+                      'Macro 4',
+                      'Macro 5',
+                      'Macro 6',
+                      'Macro 7',
+                      'Macro 8'),),
+ 'Echo': (('L Division',
+           'R Division',
+           'L Time',
+           'R Time',
+           'Input Gain',
+           'Feedback',
+           'Stereo Width',
+           'Dry Wet'),),
+ 'Eq8': (('1 Frequency A',
+          '1 Gain A',
+          '2 Frequency A',
+          '2 Gain A',
+          '3 Frequency A',
+          '3 Gain A',
+          '4 Frequency A',
+          '4 Gain A'),),
+ 'Erosion': (('Frequency', 'Width', 'Mode', 'Amount', '', '', '', ''),),
+ 'FilterDelay': (('2 Filter Freq',
+                  '2 Filter Width',
+                  '2 Beat Delay',
+                  '2 Feedback',
+                  '1 Volume',
+                  '3 Volume',
+                  '2 Volume',
+                  'Dry'),),
+ 'FilterEQ3': (('GainLo', 'GainMid', 'GainHi', 'FreqLo', 'LowOn', 'MidOn', 'HighOn', 'FreqHi'),),
+ 'Flanger': (('Hi Pass',
+              'Delay Time',
+              'Frequency',
+              'Sync Rate',
+              'LFO Amount',
+              'Env. Modulation',
+              'Feedback',
+              'Dry/Wet'),),
+ 'FrequencyShifter': (('Coarse',
+                       'Fine',
+                       'Mode',
+                       'Ring Mod Frequency',
+                       'Drive On/Off',
+                       'Drive',
+                       'Wide',
+                       'Dry/Wet'),),
+ 'Gate': (('Threshold', 'Return', 'FlipMode', 'LookAhead', 'Attack', 'Hold', 'Release', 'Floor'),),
+ 'GlueCompressor': (('Threshold',
+                     'Ratio',
+                     'Attack',
+                     'Release',
+                     'Peak Clip In',
+                     'Range',
+                     'Makeup',
+                     'Dry/Wet'),),
+ 'GrainDelay': (('Frequency',
+                 'Pitch',
+                 'Time Delay',
+                 'Beat Swing',
+                 'Random',
+                 'Spray',
+                 'Feedback',
+                 'DryWet'),),
+ 'InstrumentGroupDevice': (('Macro 1',
+                            'Macro 2',
+                            'Macro 3',
+                            'Macro 4',
+                            'Macro 5',
+                            'Macro 6',
+                            'Macro 7',
+                            'Macro 8'),),
+ 'InstrumentImpulse': (('Global Time',
+                        'Global Transpose',
+                        '1 Transpose',
+                        '2 Transpose',
+                        '3 Transpose',
+                        '4 Transpose',
+                        '5 Transpose',
+                        '6 Transpose'),),
+ 'InstrumentVector': (('Osc 1 Pos',
+                       'Osc 1 Transp',
+                       'Osc 2 Pos',
+                       'Osc 2 Transp',
+                       'Filter 1 Freq',
+                       'Filter 1 Res',
+                       'Global Mod Amount',
+                       'Volume'),),
+ 'Looper': (('State',
+             'Speed',
+             'Reverse',
+             'Quantization',
+             'Monitor',
+             'Song Control',
+             'Tempo Control',
+             'Feedback'),),
+ 'LoungeLizard': (('M Stiffness',
+                   'M Force',
+                   'Noise Amount',
+                   'F Tine Vol',
+                   'F Tone Vol',
+                   'F Release',
+                   'P Symmetry',
+                   'Volume'),),
+ 'MidiArpeggiator': (('Synced Rate',
+                      'Free Rate',
+                      'Transp. Steps',
+                      'Transp. Dist.',
+                      'Gate',
+                      'Tranpose Key',
+                      'Velocity Decay',
+                      'Velocity Target'),),
+ 'MidiChord': (('Shift1',
+                'Shift2',
+                'Shift3',
+                'Shift4',
+                'Shift5',
+                'Velocity5',
+                'Shift6',
+                'Velocity6'),),
+ 'MidiEffectGroupDevice': (('Macro 1',
+                            'Macro 2',
+                            'Macro 3',
+                            'Macro 4',
+                            'Macro 5',
+                            'Macro 6',
+                            'Macro 7',
+                            'Macro 8'),),
+ 'MidiNoteLength': (('Sync On',
+                     'Time Length',
+                     'Synced Length',
+                     'Gate',
+                     'Release Velocity',
+                     'Decay Time',
+                     'Decay Key Scale',
+                     'Latch'),),
+ 'MidiPitcher': (('Pitch', 'Range', 'Lowest', '', '', '', '', ''),),
+ 'MidiRandom': (('Chance', 'Choices', 'Interval', 'Sign', '', '', '', ''),),
+ 'MidiScale': (('Base', 'Transpose', 'Range', 'Lowest', '', '', '', ''),),
+ 'MidiVelocity': (('Drive', 'Compand', 'Random', 'Mode', 'Out Hi', 'Out Low', 'Range', 'Lowest'),),
+ 'MultiSampler': (('Filter Freq',
+                   'Filter Res',
+                   'Fe < Env',
+                   'Fe Decay',
+                   'Ve Attack',
+                   'Ve Release',
+                   'Transpose',
+                   'Volume'),),
+ 'MultibandDynamics': (('Above Threshold (Low)',
+                        'Above Ratio (Low)',
+                        'Above Threshold (Mid)',
+                        'Above Ratio (Mid)',
+                        'Above Threshold (High)',
+                        'Above Ratio (High)',
+                        'Master Output',
+                        'Amount'),),
+ 'Operator': (('Filter Freq',
+               'Filter Res',
+               'A Coarse',
+               'A Fine',
+               'B Coarse',
+               'B Fine',
+               'Osc-B Level',
+               'Volume'),),
+ 'OriginalSimpler': (('Filter Freq',
+                      'Filter Res',
+                      'S Start',
+                      'S Length',
+                      'Ve Attack',
+                      'Ve Release',
+                      'Transpose',
+                      'Volume'),),
+ 'Overdrive': (('Filter Freq',
+                'Filter Width',
+                'Drive',
+                'Tone',
+                'Preserve Dynamics',
+                '',
+                '',
+                'Dry/Wet'),),
+ 'Pedal': (('Type', 'Gain', 'Output', 'Bass', 'Mid', 'Treble', 'Sub', 'Dry/Wet'),),
+ 'Phaser': (('Frequency',
+             'Feedback',
+             'Poles',
+             'Env. Modulation',
+             'Color',
+             'LFO Amount',
+             'LFO Frequency',
+             'Dry/Wet'),),
+ 'Redux': (('Bit Depth', 'Sample Mode', 'Sample Hard', 'Sample Soft', 'Bit On', '', '', ''),),
+ 'Resonator': (('Decay',
+                'I Note',
+                'II Pitch',
+                'III Pitch',
+                'IV Pitch',
+                'V Pitch',
+                'Global Gain',
+                'Dry/Wet'),),
+ 'Reverb': (('Decay Time',
+             'Room Size',
+             'Predelay',
+             'In Filter Freq',
+             'Reflect Level',
+             'Diffuse Level',
+             'Stereo Image',
+             'Dry/Wet'),),
+ 'Saturator': (('Drive', 'Type', 'Base', 'Frequency', 'Width', 'Depth', 'Output', 'Dry/Wet'),),
+ 'StereoGain': (('Left Inv',
+                 'Right Inv',
+                 'Channel Mode',
+                 'Stereo Width',
+                 'Mono',
+                 'Balance',
+                 'Gain',
+                 'Mute'),),
+ 'StringStudio': (('Filter Freq',
+                   'Filter Reso',
+                   'Filter Type',
+                   'Exciter Type',
+                   'E Pos',
+                   'String Decay',
+                   'Str Damping',
+                   'Volume'),),
+ 'Tube': (('Drive', 'Bias', 'Envelope', 'Tone', 'Attack', 'Release', 'Output', 'Dry/Wet'),),
+ 'UltraAnalog': (('F1 Freq',
+                  'F1 Resonance',
+                  'OSC1 Shape',
+                  'OSC1 Octave',
+                  'OSC2 Shape',
+                  'OSC2 Octave',
+                  'OSC2 Detune',
+                  'Volume'),),
+ 'Vinyl': (('Tracing Freq.',
+            'Tracing Width',
+            'Tracing Drive',
+            'Crackle Density',
+            'Pinch Freq.',
+            'Pinch Width',
+            'Pinch Drive',
+            'Crackle Volume'),),
+ 'Vocoder': (('Formant Shift',
+              'Attack Time',
+              'Release Time',
+              'Unvoiced Level',
+              'Gate Threshold',
+              'Filter Bandwidth',
+              'Envelope Depth',
+              'Dry/Wet'),)}
@@ -0,0 +1,1184 @@
+from _Framework.ControlSurfaceComponent import ControlSurfaceComponent
+import Live
+from _Framework.ControlSurface import ControlSurface
+from _Framework.InputControlElement import *
+from _Framework.EncoderElement import EncoderElement
+from _Framework.MixerComponent import MixerComponent
+from Launchpad.ConfigurableButtonElement import ConfigurableButtonElement
+from .helpers import Helpers, Remote, SurfaceConfig
+from .osc_client import OSCClient, OSCMultiClient, NullOSCClient
+from .hud_client import HudClient, NullHudClient
+from .send_queue import SendQueue
+from .hud_protocol import REGION_CAPABILITIES
+from .update_coalescer import UpdateCoalescer
+from .midi_out import MidiOutQueue
+from .ec4_client import Ec4Client, NullEc4Client
+from .grid_led_client import GridLedClient, NullGridLedClient
+from .clip_actions import ClipActions
+from .drum_rack import DrumRackController
+from .listener import OSCListener
+from .region_state import RegionState, RegionSet
+from .region_listener import RegionListener
+from .mode_link import ModeSender, ModeListener
+from .nav import Nav
+from .shared_hub import SurfaceShare
+# from _Framework.EncoderElement import *
+
+functions_loaded_error = None
+
+try:
+    from .functions import Functions
+except Exception as e:
+    functions_loaded_error = e
+
+class MainComponent(ControlSurfaceComponent):
+    def __init__(self, manager):
+        super().__init__(manager)
+        self.class_identifier = "main_component"
+
+        self.manager = manager
+
+        self.mixer = MixerComponent(124, 24)
+        # self.setup_controls()
+        # self.setup_listeners()
+
+        if functions_loaded_error is not None:
+            self.log_message(f"Error loading functions: {functions_loaded_error}")
+        else:
+            self.functions = Functions(self)
+
+        self._modes = {}
+        # Default None so goto_mode's guards hold on surfaces with no physical
+        # mode-button and on non-composition surfaces. The mode setup and the
+        # MODE_LINK block below overwrite these when present.
+        self.mode_button = None
+        self._mode_sender = None
+        self._song = self.manager.song()
+        self._nav = Nav(self.manager)
+        self.clip_actions = ClipActions(self.manager)
+
+        # `send-thread: true`: HUD/OSC datagrams are encoded here but written by
+        # a background thread, so a stalled receiver can't delay MIDI handling.
+        # Closed on disconnect/reload, before the shared socket is released.
+        self._sender = SendQueue(name="ck_lc_parks__launch_control") if False else None
+
+        self._osc_client = NullOSCClient()
+        _osc_targets = []
+        if _osc_targets:
+            self._osc_client = OSCMultiClient(_osc_targets, sender=self._sender)
+
+        # HUD_TARGET is data, not code: None for a standalone surface (HUD on
+        # 127.0.0.1:5006), or (host, port) for the parks forwarder which retargets
+        # its HUD client at the compositor's region port.
+        HUD_TARGET = None
+        _hud_host, _hud_port = HUD_TARGET if HUD_TARGET is not None else ('127.0.0.1', 5006)
+        # Process-wide resources shared with co-loaded surfaces (one UDP send
+        # socket, one compiled table per unique mapping, one bank index);
+        # released on disconnect/reload.
+        self._share = SurfaceShare()
+        self._hud_client = HudClient(
+            _hud_host, _hud_port, sock=self._share.udp_socket(), sender=self._sender)
+        if HUD_TARGET is not None:
+            # The compositor's region port never sends a HELLO; it is generated
+            # from the same tree, so its wire capabilities are known up front.
+            self._hud_client.negotiate(REGION_CAPABILITIES)
+        # SysEx feedback sinks enqueue here; the tick writes them, so a burst
+        # never waits on the MIDI port.
+        self._midi_out = MidiOutQueue(self.manager)
+        self._feedback_sinks = []
+        # Knob sweeps: keep only the latest value per slot and flush once per
+        # tick (one HUD datagram) instead of a datagram per incoming CC.
+        self._update_coalescer = UpdateCoalescer(self.manager, self._hud_client, self._osc_client)
+        self._remote = Remote(self.manager, self._osc_client, self._hud_client, self._feedback_sinks,
+                              update_coalescer=self._update_coalescer)
+
+        # Drum-rack step/velocity editor. Resolves the focused drum rack + detail
+        # clip at call time and is inert when the focused device isn't a drum
+        # rack, so this instantiation is unconditional (like clip_actions).
+        # DEFERRED SEAM: controller pad-tap selection + audition are not wired
+        # yet (need a Live note-forwarding spike); step/velocity edits already
+        # work against Live's mouse-selected pad. Edits are batched per tick:
+        # one clip rewrite per finger-run / velocity sweep, not one per event.
+        self.drum_rack = DrumRackController(self.manager, self._hud_client, batch=True)
+
+        
+        self.current_mode = None
+        self._first_mode = 'main_mode'
+        self.mode_button = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 8, 9)
+    
+
+        self._modes['main_mode'] = {
+            'name': 'main_mode',
+            'next_mode_name': 'shift_mode',
+            'add_listeners_fn': self.mode_main_mode_add_listeners,
+            'is_shift': True,
+            'color': 13
+        }
+
+
+        self._modes['shift_mode'] = {
+            'name': 'shift_mode',
+            'next_mode_name': 'main_mode',
+            'add_listeners_fn': self.mode_shift_mode_add_listeners,
+            'is_shift': True,
+            'color': 60
+        }
+
+        self.mode_button.add_value_listener(self.mode_button_listener)
+
+
+        code_slot_assignments = [
+            (1, 'slot1'),
+			(2, 'slot2'),
+			(3, 'slot3'),
+			(4, 'slot4'),
+			(5, 'slot5'),
+			(6, 'slot6'),
+			(7, 'slot7'),
+			(8, 'slot8'),
+			(9, 'slot9'),
+			(10, 'slot10'),
+			(11, 'slot11'),
+			(12, 'slot12'),
+			(13, 'slot13'),
+			(14, 'slot14'),
+			(15, 'slot15'),
+			(16, 'slot16')
+
+        ]
+
+        code_switch_slot_assignments = [
+            (4, 1),
+			(5, 2),
+			(6, 3),
+			(7, 4)
+
+        ]
+
+        # Per-mode device bindings so the HUD resolves only the active mode's
+        # device slots (a slot device-bound in one mode otherwise shows stale
+        # device data in a mode where it is mixer/empty-bound).
+        code_slot_assignments_by_mode = {'main_mode': [(1, 'slot1'), (2, 'slot2'), (3, 'slot3'), (4, 'slot4'), (5, 'slot5'), (6, 'slot6'), (7, 'slot7'), (8, 'slot8'), (9, 'slot9'), (10, 'slot10'), (11, 'slot11'), (12, 'slot12'), (13, 'slot13'), (14, 'slot14'), (15, 'slot15'), (16, 'slot16')], 'shift_mode': []}
+        code_switch_slot_assignments_by_mode = {'main_mode': [], 'shift_mode': [(4, 1), (5, 2), (6, 3), (7, 4)]}
+
+        self._helpers = Helpers(self.manager, self._remote, SurfaceConfig(
+            slot_assignments=code_slot_assignments,
+            switch_slot_assignments=code_switch_slot_assignments,
+            slot_assignments_by_mode=code_slot_assignments_by_mode,
+            switch_slot_assignments_by_mode=code_switch_slot_assignments_by_mode,
+            pager_preview_mode='main_mode',
+            parameter_mappings_raw={'devices': [{'className': 'Amp', 'deviceName': 'Amp', 'fixed': True, 'encoders': [{'name': 'Bass'}, {'name': 'Middle'}, {'name': 'Treble'}, {'name': 'Presence'}, {'name': 'Gain'}, {'name': 'Volume'}, {'name': 'Dry/Wet'}, {'name': 'Dry/Wet'}], 'buttons': [{'name': 'Amp Type', 'type': 'param'}, {'name': 'Dual Mono', 'type': 'param'}]}, {'className': 'AutoPan2', 'deviceName': 'Auto Pan-Tremolo', 'encoders': [{'name': 'Amount'}, {'name': 'Frequency'}, {'name': 'Panning Shape'}, {'name': 'Tremolo Shape'}, {'name': 'Time'}, {'name': 'Rate'}, {'name': '16th'}, {'name': 'Phase'}, {'name': 'Offset'}, {'name': 'Spin'}, {'name': 'Attack Time'}, {'name': 'Dyn Mod'}], 'buttons': [{'name': 'Mode', 'type': 'param'}, {'name': 'Invert', 'type': 'param'}, {'name': 'Harmonic', 'type': 'param'}, {'name': 'Vintage', 'type': 'param'}, {'name': 'Time Mode', 'type': 'param'}, {'name': 'Stereo Mode', 'type': 'param'}, {'name': 'Waveform', 'type': 'param'}]}, {'className': 'OriginalSimpler', 'deviceName': 'stb_dark solo stab', 'encoders': [{'name': 'S Start', 'display': 'Start'}, {'name': 'S Length', 'display': 'Length'}, {'name': 'Transpose'}, {'name': 'Detune'}, {'name': 'Ve Attack', 'display': 'Attack'}, {'name': 'Ve Decay', 'display': 'Decay'}, {'name': 'Ve Sustain', 'display': 'Sustain'}, {'name': 'Ve Release', 'display': 'Release'}, {'name': 'Filter Freq'}, {'name': 'Filter Res'}, {'name': 'Filter Morph'}, {'name': 'Filter Drive'}, {'name': 'Volume'}, {'name': 'Fade In'}, {'name': 'Fade Out'}, {'name': 'Spread'}, {'name': 'Vol < Vel'}, {'name': 'Filt < Vel'}, {'name': 'Vol < LFO'}, {'name': 'Filt < LFO'}, {'name': 'Fe Attack'}, {'name': 'Fe Decay'}, {'name': 'Fe Sustain'}, {'name': 'Fe Release'}, {'name': 'Pitch < LFO'}, {'name': 'S Loop Length'}, {'name': 'S Loop Fade'}, {'name': 'Glide Time'}, {'name': 'Pan'}, {'name': 'Pan < Rnd'}, {'name': 'Pan < LFO'}, {'name': 'Ve Loop'}, {'name': 'Ve Retrig'}, {'name': 'Sample Selector'}, {'name': 'Fe < Env'}, {'name': 'Filt < Key'}], 'buttons': [{'lom_property': 'playback_mode', 'type': 'enum'}, {'name': 'Trigger Mode', 'type': 'param'}, {'name': 'Filter Type', 'type': 'param'}, {'name': 'Filter Slope', 'type': 'param'}, {'name': 'Filter Circuit - LP/HP', 'type': 'param'}, {'name': 'F On', 'type': 'param'}, {'name': 'Filter Circuit - BP/NO/Morph', 'type': 'param'}, {'name': 'Snap', 'type': 'param'}, {'name': 'S Loop On', 'type': 'param'}, {'name': 'Glide Mode', 'type': 'param'}, {'name': 'Pe On', 'type': 'param'}, {'name': 'Ve Mode', 'type': 'param'}, {'name': 'Fe On', 'type': 'param'}, {'name': 'L On', 'type': 'param'}]}, {'className': 'Hybrid', 'deviceName': 'Hybrid Reverb', 'encoders': [{'name': 'Blend'}, {'name': 'Decay'}, {'name': 'Size'}, {'name': 'Damping'}, {'name': 'Width'}, {'name': 'Diffusion'}, {'name': 'Modulation'}, {'name': 'Dry/Wet'}, {'controlledBy': 'Algo Type', 'group': [{'name': 'DH Shape', 'activeWhen': [0]}, {'name': 'Qz Low Damp', 'activeWhen': [1]}, {'name': 'Sh Pitch Shift', 'activeWhen': [2]}, {'name': 'Ti Tide', 'activeWhen': [3]}, {'name': 'Pr High Mult', 'activeWhen': [4]}]}, {'controlledBy': 'Algo Type', 'group': [{'name': 'DH BassMult', 'activeWhen': [0]}, {'name': 'Qz Distance', 'activeWhen': [1]}, {'name': 'Sh Shimmer', 'activeWhen': [2]}, {'name': 'Ti Rate', 'activeWhen': [3]}, {'name': 'Pr X Over', 'activeWhen': [4]}]}, {'name': 'Algo Delay'}, {'name': 'Predelay'}, {'name': 'Predelay 16th'}, {'name': 'Predelay FB'}, {'name': 'Predel. FB 16th'}, {'name': 'Vintage'}, {'name': 'Sh Pitch Shift'}, {'name': 'Ti Rate'}, {'name': 'Ti Waveform'}, {'name': 'Qz Low Damp'}, {'name': 'Qz Distance'}, {'name': 'Pr High Mult'}, {'name': 'Pr Low Mult'}, {'name': 'Pr X Over'}, {'name': 'Pr Sixth'}, {'name': 'Pr Seventh'}, {'name': 'EQ Lo Freq'}, {'name': 'EQ Lo Gain'}, {'name': 'EQ Lo Slope'}, {'name': 'EQ Peak 1 Freq'}, {'name': 'EQ Peak 1 Gain'}, {'name': 'EQ Peak 1 Q'}, {'name': 'EQ Peak 2 Freq'}, {'name': 'EQ Peak 2 Gain'}, {'name': 'EQ Peak 2 Q'}, {'name': 'EQ Hi Freq'}, {'name': 'EQ Hi Gain'}, {'name': 'EQ Hi Slope'}, {'name': 'Send Gain'}], 'buttons': [{'name': 'Algo Type', 'type': 'param'}, {'name': 'Predelay Sync', 'type': 'param'}, {'name': 'Freeze', 'type': 'param'}, {'name': 'Bass Mono', 'type': 'param'}, {'name': 'Freeze In', 'type': 'param'}, {'name': 'EQ On', 'type': 'param'}, {'name': 'EQ Pre Algo', 'type': 'param'}, {'name': 'EQ Lo Type', 'type': 'param'}, {'name': 'EQ Hi Type', 'type': 'param'}, {'name': 'Routing', 'type': 'param'}]}, {'className': 'Corpus', 'deviceName': 'Corpus', 'encoders': [{'name': 'Tune'}, {'name': 'Transpose'}, {'name': 'Fine'}, {'name': 'Spread'}, {'name': 'Decay'}, {'name': 'Material'}, {'name': 'Radius'}, {'name': 'Dry Wet'}, {'name': 'Brightness'}, {'name': 'Inharmonics'}, {'name': 'Opening'}, {'name': 'Ratio'}, {'name': 'Hit'}, {'name': 'Listening L'}, {'name': 'Listening R'}, {'name': 'LFO Rate'}, {'name': 'LFO Sync Rate'}, {'name': 'Spin'}, {'name': 'Phase'}, {'name': 'Offset'}, {'name': 'LFO Amount'}, {'name': 'Mid Freq'}, {'name': 'Width'}, {'name': 'PB Range'}, {'name': 'Off Decay'}, {'name': 'Gain'}, {'name': 'Width'}, {'name': 'Bleed'}], 'buttons': [{'name': 'Resonance Type', 'type': 'param'}, {'name': 'Resonator Quality', 'type': 'param'}, {'name': 'Filter On/Off', 'type': 'param'}, {'name': 'LFO On/Off', 'type': 'param'}, {'name': 'LFO Shape', 'type': 'param'}, {'name': 'LFO Sync', 'type': 'param'}, {'name': 'LFO Stereo Mode', 'type': 'param'}, {'name': 'MIDI Frequency', 'type': 'param'}, {'name': 'MIDI Mode', 'type': 'param'}, {'name': 'Note Off', 'type': 'param'}]}, {'className': 'AutoFilter2', 'deviceName': 'Auto Filter', 'fixed': True, 'encoders': [{'name': 'Frequency'}, {'name': 'Resonance'}, {'name': 'LFO Amount'}, {'name': 'LFO Wave'}, {'controlledBy': 'LFO T Mode', 'group': [{'name': 'LFO Freq', 'activeWhen': [0]}, {'name': 'LFO Time', 'activeWhen': [1]}, {'name': 'LFO Rate', 'activeWhen': [2, 3, 4]}, {'name': 'LFO 16th', 'activeWhen': [5]}]}, {'name': 'Drive'}, {'name': 'Env Amount'}, {'name': 'Dry/Wet'}, {'name': 'Output'}, {'name': 'Morph Slope'}, {'name': 'Filter Morph'}, {'name': 'Control'}, {'name': 'Pitch'}, {'name': 'Formant'}, {'name': 'LFO Phase'}, {'name': 'LFO Offset'}, {'name': 'LFO S Mode'}, {'name': 'LFO Spin'}, {'name': 'LFO Morph'}, {'name': 'LFO Smoothing'}, {'name': 'LFO Q Mode'}, {'name': 'LFO Steps'}, {'name': 'LFO S&H'}, {'name': 'Env Attack'}, {'name': 'Env Hold On'}, {'name': 'Env Release'}, {'name': 'Env S&H On'}, {'name': 'Env S&H'}, {'name': 'S/C EQ On'}, {'name': 'S/C EQ Type'}, {'name': 'S/C EQ Freq'}, {'name': 'S/C EQ Q'}, {'name': 'S/C EQ Gain'}, {'name': 'S/C On'}, {'name': 'S/C Gain'}, {'name': 'S/C Mix'}], 'buttons': [{'name': 'Filter Type', 'type': 'param'}, {'name': 'Filter Slope', 'type': 'param'}, {'name': 'LFO T Mode', 'type': 'param'}, {'name': 'Circuit', 'type': 'param'}, {'name': 'Soft Clip On', 'type': 'param'}]}, {'className': 'Delay', 'deviceName': 'Delay', 'encoders': [{'name': 'L 16th'}, {'name': 'R 16th'}, {'name': 'Filter Freq'}, {'name': 'Filter Width'}, {'name': 'Feedback'}, {'name': 'L Offset'}, {'name': 'R Offset'}, {'name': 'Dry/Wet'}, {'name': 'LFO Freq'}, {'name': 'LFO Time'}, {'name': 'LFO Synced'}, {'name': 'LFO 16th'}, {'name': 'LFO Morph'}, {'name': 'LFO > Delay'}, {'name': 'LFO > Filter'}, {'name': 'L Time'}, {'name': 'R Time'}], 'buttons': [{'name': 'Link', 'type': 'param'}, {'name': 'Smoothing', 'type': 'param'}, {'name': 'Ping Pong', 'type': 'param'}, {'name': 'L Sync', 'type': 'param'}, {'name': 'R Sync', 'type': 'param'}, {'name': 'Freeze', 'type': 'param'}, {'name': 'Filter On', 'type': 'param'}, {'name': 'LFO Mode', 'type': 'param'}, {'name': 'LFO Wave', 'type': 'param'}]}, {'className': 'Compressor2', 'deviceName': 'Compressor', 'encoders': [{'name': 'Threshold'}, {'name': 'Ratio'}, {'name': 'Attack'}, {'name': 'Release'}, {'name': 'Output'}, {'name': 'Knee'}, {'name': 'Expansion Ratio'}, {'name': 'Dry/Wet'}, {'name': 'S/C EQ Freq'}, {'name': 'S/C EQ Q'}, {'name': 'S/C EQ Gain'}, {'name': 'S/C Gain'}, {'name': 'S/C Mix'}], 'buttons': [{'name': 'Model', 'type': 'param'}, {'name': 'Auto Release On/Off', 'type': 'param'}, {'name': 'Makeup', 'type': 'param'}, {'name': 'LookAhead', 'type': 'param'}, {'name': 'Env Mode', 'type': 'param'}, {'name': 'S/C On', 'type': 'param'}, {'name': 'S/C Listen', 'type': 'param'}, {'name': 'S/C EQ On', 'type': 'param'}, {'name': 'S/C EQ Type', 'type': 'param'}]}, {'className': 'GlueCompressor', 'deviceName': 'Glue Compressor', 'encoders': [{'name': 'Threshold'}, {'name': 'Range'}, {'name': 'Output'}, {'name': 'Attack'}, {'name': 'Ratio'}, {'name': 'Release'}, {'name': 'Dry/Wet'}, {'name': 'Dry/Wet'}, {'name': 'S/C Gain'}, {'name': 'S/C Mix'}, {'name': 'S/C EQ Freq'}, {'name': 'S/C EQ Gain'}, {'name': 'S/C EQ Q'}], 'buttons': [{'name': 'Peak Clip In', 'type': 'param'}, {'name': 'S/C On', 'type': 'param'}, {'name': 'S/C EQ Type', 'type': 'param'}, {'name': 'S/C EQ On', 'type': 'param'}]}, {'className': 'StereoGain', 'deviceName': 'Utility', 'encoders': [{'name': 'Output'}, {'name': 'Balance'}, {'name': 'Stereo Width'}, {'name': 'Bass Freq'}], 'buttons': [{'name': 'Mono', 'type': 'param'}, {'name': 'Bass Mono', 'type': 'param'}, {'name': 'Left Inv', 'type': 'param'}, {'name': 'Right Inv', 'type': 'param'}, {'name': 'Channel Mode', 'type': 'param'}, {'name': 'Mute', 'type': 'param'}, {'name': 'DC Filter', 'type': 'param'}]}, {'className': 'Echo', 'deviceName': 'Echo', 'encoders': [{'name': 'L 16th'}, {'name': 'R 16th'}, {'name': 'L Synced'}, {'name': 'R Synced'}, {'name': 'Feedback'}, {'name': 'Output'}, {'name': 'Reverb Level'}, {'name': 'Dry Wet'}, {'name': 'Reverb Decay'}, {'name': 'Input Gain'}, {'name': 'Repitch Smoothing Time'}, {'name': 'Stereo Width'}, {'name': 'Gate Thr'}, {'name': 'Gate Release'}, {'name': 'Duck Thr'}, {'name': 'Duck Release'}, {'name': 'HP Freq'}, {'name': 'HP Res'}, {'name': 'L Time'}, {'name': 'R Time'}, {'name': 'L Offset'}, {'name': 'R Offset'}, {'name': 'LP Freq'}, {'name': 'Wobble Mrph'}, {'name': 'LP Res'}, {'name': 'Mod Freq'}, {'name': 'Mod Rate'}, {'name': 'Mod Phase'}, {'name': 'Env Mix'}, {'name': 'Dly < Mod'}, {'name': 'Flt < Mod'}, {'name': 'Noise Amt'}, {'name': 'Noise Mrph'}, {'name': 'Wobble Amt'}], 'buttons': [{'name': 'Link', 'type': 'param'}, {'name': 'Channel Mode', 'type': 'param'}, {'name': 'L Sync Mode', 'type': 'param'}, {'name': 'R Sync Mode', 'type': 'param'}, {'name': 'Gate On', 'type': 'param'}, {'name': 'Duck On', 'type': 'param'}, {'name': 'Noise On', 'type': 'param'}, {'name': 'Wobble On', 'type': 'param'}, {'name': 'L Sync', 'type': 'param'}, {'name': 'R Sync', 'type': 'param'}, {'name': 'Repitch', 'type': 'param'}, {'name': 'FB Invert', 'type': 'param'}, {'name': 'Clip Dry', 'type': 'param'}, {'name': 'Filter On', 'type': 'param'}, {'name': 'Mod Wave', 'type': 'param'}, {'name': 'Mod Sync', 'type': 'param'}, {'name': 'Mod 4x', 'type': 'param'}, {'name': 'Reverb Loc', 'type': 'param'}]}, {'className': 'DrumBuss', 'deviceName': 'Drum Buss', 'encoders': [{'name': 'Drive'}, {'name': 'Crunch'}, {'name': 'Damping Freq'}, {'name': 'Transients'}, {'name': 'Boom Freq'}, {'name': 'Boom Amt'}, {'name': 'Output'}, {'name': 'Dry/Wet'}, {'name': 'Trim'}, {'name': 'Boom Decay'}], 'buttons': [{'name': 'Compressor On', 'type': 'param'}, {'name': 'Drive Type', 'type': 'param'}, {'name': 'Boom Audition', 'type': 'param'}]}, {'className': 'MxDeviceAudioEffect', 'deviceName': 'LFO', 'encoders': [{'name': 'Rate'}, {'name': 'Depth'}, {'name': 'Jitter'}, {'name': 'Offset'}, {'name': 'Phase'}, {'name': 'Smooth'}, {'name': 'Wave Shape'}], 'buttons': [{'name': 'Time Mode', 'type': 'param'}, {'name': 'Shape', 'type': 'param'}, {'name': 'Steps', 'type': 'param'}, {'name': 'Rate', 'type': 'param'}, {'name': 'x10', 'type': 'param'}, {'name': 'Hold', 'type': 'param'}, {'name': 'Re-Trigger', 'type': 'param'}]}, {'className': 'PhaserNew', 'deviceName': 'Phaser-Flanger', 'encoders': [{'name': 'Mod Freq'}, {'name': 'Mod Rate'}, {'name': 'Amount'}, {'name': 'Feedback'}, {'name': 'Warmth'}, {'name': 'Spread'}, {'name': 'Output'}, {'name': 'Dry/Wet'}, {'name': 'Flanger Time'}, {'name': 'Doubler Time'}, {'name': 'Mod Phase'}, {'name': 'Spin'}, {'name': 'Duty Cycle'}, {'name': 'Lfo Blend'}, {'name': 'Env Amount'}, {'name': 'Env Attack'}, {'name': 'Env Release'}, {'name': 'Notches'}, {'name': 'Mod Blend'}, {'name': 'Center Freq'}, {'name': 'Safe Freq'}, {'name': 'Mod Freq 2'}, {'name': 'Mod Rate 2'}], 'buttons': [{'name': 'Mode', 'type': 'param'}, {'name': 'Mod Sync', 'type': 'param'}, {'name': 'Mod Wave', 'type': 'param'}, {'name': 'Mod Sync 2', 'type': 'param'}, {'name': 'Spin Enabled', 'type': 'param'}, {'name': 'Env Enabled', 'type': 'param'}, {'name': 'FB Invert', 'type': 'param'}]}, {'className': 'Saturator', 'deviceName': 'Saturator', 'encoders': [{'name': 'Drive'}, {'name': 'Output'}, {'name': 'Threshold'}, {'name': 'Color Amt Low'}, {'name': 'Color Freq'}, {'name': 'Color Width'}, {'name': 'Color Amt Hi'}, {'name': 'Dry/Wet'}, {'name': 'WS Drive'}, {'name': 'WS Linearity'}, {'name': 'WS Curve'}, {'name': 'WS Damp'}, {'name': 'WS Period'}, {'name': 'WS Depth'}], 'buttons': [{'name': 'Type', 'type': 'param'}, {'name': 'Pre Dc Filter', 'type': 'param'}, {'name': 'Color On', 'type': 'param'}, {'name': 'Post Clip Mode', 'type': 'param'}]}, {'className': 'Shifter', 'deviceName': 'Shifter', 'encoders': [{'name': 'Pitch Fine'}, {'name': 'Pitch Coarse'}, {'name': 'Tone'}, {'name': 'Delay Time'}, {'name': 'FShift Coarse'}, {'name': 'Delay Synced'}, {'name': 'Delay Feedback'}, {'name': 'Dry/Wet'}, {'name': 'Lfo Amount Hz'}, {'name': 'Lfo Amount St'}, {'name': 'Lfo Rate Hz'}, {'name': 'Lfo S. Rate'}, {'name': 'Lfo Phase'}, {'name': 'Lfo Spin Amount'}, {'name': 'Lfo Offset'}, {'name': 'Lfo Width'}, {'name': 'Lfo Duty Cycle'}, {'name': 'Pitch Window'}, {'name': 'Mod Fine'}, {'name': 'RM Coarse'}, {'name': 'RM Drive Gain'}, {'name': 'MidiPitch Glide'}, {'name': 'Env Attack'}, {'name': 'Env Release'}, {'name': 'Env Amount Hz'}, {'name': 'Env Amount St'}], 'buttons': [{'name': 'Mode', 'type': 'param'}, {'name': 'Delay On', 'type': 'param'}, {'name': 'Delay Sync', 'type': 'param'}, {'name': 'Env On', 'type': 'param'}, {'name': 'Lfo Waveform', 'type': 'param'}, {'name': 'Lfo Sync', 'type': 'param'}, {'name': 'Lfo Spin', 'type': 'param'}, {'name': 'RM Drive', 'type': 'param'}, {'name': 'Wide', 'type': 'param'}]}, {'className': 'MxDeviceMidiEffect', 'deviceName': 'SQ Sequencer', 'encoders': [{'name': 'PStep1', 'display': 'Note 1'}, {'name': 'PStep2', 'display': 'Note 2'}, {'name': 'PStep3', 'display': 'Note 3'}, {'name': 'PStep4', 'display': 'Note 4'}, {'name': 'PStep5', 'display': 'Note 5'}, {'name': 'PStep6', 'display': 'Note 6'}, {'name': 'PStep7', 'display': 'Note 7'}, {'name': 'PStep8', 'display': 'Note 8'}, {'name': 'VelStep1', 'display': 'Vel 1'}, {'name': 'VelStep2', 'display': 'Vel 2'}, {'name': 'VelStep3', 'display': 'Vel 3'}, {'name': 'VelStep4', 'display': 'Vel 4'}, {'name': 'VelStep5', 'display': 'Vel 5'}, {'name': 'VelStep6', 'display': 'Vel 6'}, {'name': 'VelStep7', 'display': 'Vel 7'}, {'name': 'VelStep8', 'display': 'Vel 8'}, {'name': 'SQMax', 'display': 'Seq length'}, {'name': 'Swing'}, {'name': 'LStep1'}, {'name': 'LStep2'}, {'name': 'LStep3'}, {'name': 'LStep4'}, {'name': 'LStep5'}, {'name': 'LStep6'}, {'name': 'VelStep9'}, {'name': 'VelStep10'}, {'name': 'VelStep11'}, {'name': 'VelStep12'}, {'name': 'VelStep13'}, {'name': 'VelStep14'}, {'name': 'VelStep15'}, {'name': 'VelStep16'}, {'name': 'LStep9'}, {'name': 'LStep10'}, {'name': 'LStep11'}, {'name': 'LStep12'}, {'name': 'LStep13'}, {'name': 'LStep14'}, {'name': 'LStep15'}, {'name': 'LStep16'}, {'name': 'PStep10'}, {'name': 'PStep11'}, {'name': 'PStep12'}, {'name': 'PStep13'}, {'name': 'PStep14'}, {'name': 'PStep15'}, {'name': 'PStep16'}, {'name': 'PStep9'}, {'name': 'LStep7'}, {'name': 'LStep8'}, {'name': 'BPM'}, {'name': 'ConStep10'}, {'name': 'ConStep11'}, {'name': 'ConStep12'}, {'name': 'ConStep13'}, {'name': 'ConStep14'}, {'name': 'ConStep15'}, {'name': 'ConStep16'}, {'name': 'ConStep9'}, {'name': 'ConditionAll'}, {'name': 'ConditionMax1'}, {'name': 'ConditionMax2'}, {'name': 'ConditionMin1'}, {'name': 'ConditionMin2'}, {'name': 'CondRandRange'}, {'name': 'LengthMax1'}, {'name': 'LengthMax2'}, {'name': 'LengthMin2'}, {'name': 'LengthAll'}, {'name': 'LengthRandRange'}, {'name': 'LengthMin1'}, {'name': 'OStep1'}, {'name': 'OStep10'}, {'name': 'OStep11'}, {'name': 'OStep12'}, {'name': 'OStep13'}, {'name': 'OStep14'}, {'name': 'OStep15'}, {'name': 'OStep16'}, {'name': 'OStep2'}, {'name': 'OStep3'}, {'name': 'OStep4'}, {'name': 'OStep5'}, {'name': 'OStep6'}, {'name': 'OStep7'}, {'name': 'OStep8'}, {'name': 'OStep9'}, {'name': 'OctaveMax1'}, {'name': 'OctaveMax2'}, {'name': 'OctaveMin1'}, {'name': 'OctaveMin2'}, {'name': 'OctaveAll'}, {'name': 'OctaveRandRange'}, {'name': 'PitchMax1'}, {'name': 'PitchMax2'}, {'name': 'PitchMin1'}, {'name': 'PitchMin2'}, {'name': 'PitchAll'}, {'name': 'PitchRandRange'}, {'name': 'RatchetAll'}, {'name': 'RatchetMax1'}, {'name': 'RatchetMax2'}, {'name': 'RatchetMin1'}, {'name': 'RatchetMin2'}, {'name': 'RatStep1'}, {'name': 'RatStep10'}, {'name': 'RatStep11'}, {'name': 'RatStep12'}, {'name': 'RatStep13'}, {'name': 'RatStep14'}, {'name': 'RatStep15'}, {'name': 'RatStep16'}, {'name': 'RatStep2'}, {'name': 'RatStep3'}, {'name': 'RatStep4'}, {'name': 'RatStep5'}, {'name': 'RatStep6'}, {'name': 'RatStep7'}, {'name': 'RatStep8'}, {'name': 'RatStep9'}, {'name': 'RatchetRandRange'}, {'name': 'SQMax'}, {'name': 'SQMax2'}, {'name': 'SQMin'}, {'name': 'SQMin2'}, {'name': 'StepNumber'}, {'name': 'TimeShiftAll'}, {'name': 'TimeShiftMax1'}, {'name': 'TimeShiftMax2'}, {'name': 'TimeShiftMin1'}, {'name': 'TimeShiftMin2'}, {'name': 'TSRandRange'}, {'name': 'TShift1'}, {'name': 'TShift10'}, {'name': 'TShift11'}, {'name': 'TShift12'}, {'name': 'TShift13'}, {'name': 'TShift14'}, {'name': 'TShift15'}, {'name': 'TShift16'}, {'name': 'TShift2'}, {'name': 'TShift3'}, {'name': 'TShift4'}, {'name': 'TShift5'}, {'name': 'TShift6'}, {'name': 'TShift7'}, {'name': 'TShift8'}, {'name': 'TShift9'}, {'name': 'Tab'}, {'name': 'VelocityAll'}, {'name': 'VelocityMax1'}, {'name': 'VelocityMax2'}, {'name': 'VelocityMin1'}, {'name': 'VelocityMin2'}, {'name': 'VelRandRange'}], 'buttons': [{'name': 'RandPitch', 'display': 'Rnd Pitch', 'type': 'param', 'min_max': True}, {'name': 'VelRandom', 'display': 'Rnd Velocity', 'type': 'param', 'min_max': True}, {'name': 'RandLength', 'display': 'Rnd Length', 'type': 'param', 'min_max': True}, {'name': 'RandSteps', 'display': 'Rnd Steps', 'type': 'param', 'min_max': True}, {'name': 'ResetPitch', 'display': 'Reset Pitch', 'type': 'param'}, {'name': 'ResetVelocity', 'display': 'Reset Velocity', 'type': 'param'}, {'name': 'ResetLength', 'display': 'Reset Length', 'type': 'param'}, {'name': 'ResetSteps', 'display': 'Reset Steps', 'type': 'param'}, {'name': 'ScramblePitch', 'type': 'param', 'min_max': True}, {'name': 'ScrambleVel', 'type': 'param', 'min_max': True}, {'name': 'ScrambleLength', 'type': 'param', 'min_max': True}, {'name': 'ScrambleSteps', 'type': 'param', 'min_max': True}, {'name': 'ShiftLeft', 'type': 'param', 'min_max': True}, {'name': 'ShiftRight', 'type': 'param', 'min_max': True}, {'name': 'RandomSelect', 'type': 'param', 'min_max': True}, {'name': 'Scale', 'type': 'param'}, {'name': 'ResetOctave', 'type': 'param'}, {'name': 'ResetRatchet', 'type': 'param'}, {'name': 'ResetTS', 'type': 'param'}, {'name': 'RandOct', 'type': 'param', 'min_max': True}, {'name': 'ClockSource', 'type': 'param'}, {'name': 'ConditionDirection', 'type': 'param'}, {'name': 'ConditionLock', 'type': 'param'}, {'name': 'ScrambleCond', 'type': 'param', 'min_max': True}, {'name': 'ConditionRand', 'type': 'param', 'min_max': True}, {'name': 'Division', 'type': 'param'}, {'name': 'FollowRoot', 'type': 'param'}, {'name': 'FollowScales', 'type': 'param'}, {'name': 'LaneLock', 'type': 'param'}, {'name': 'LengthDirection', 'type': 'param'}, {'name': 'LengthLock', 'type': 'param'}, {'name': 'LockSelect', 'type': 'param'}, {'name': 'MIDItrnsp', 'type': 'param'}, {'name': 'OctaveDirection', 'type': 'param'}, {'name': 'ScrambleOct', 'type': 'param', 'min_max': True}, {'name': 'OctaveLock', 'type': 'param'}, {'name': 'PitchDirection', 'type': 'param'}, {'name': 'PitchLock', 'type': 'param'}, {'name': 'RandTS', 'type': 'param', 'min_max': True}, {'name': 'RatchetDirection', 'type': 'param'}, {'name': 'RatchetLock', 'type': 'param'}, {'name': 'RatchetRand', 'type': 'param', 'min_max': True}, {'name': 'ScrambleRatchet', 'type': 'param', 'min_max': True}, {'name': 'ResetCond', 'type': 'param', 'min_max': True}, {'name': 'SQ Run', 'type': 'param'}, {'name': 'SQDirection', 'type': 'param'}, {'name': 'ShiftDown', 'type': 'param', 'min_max': True}, {'name': 'ShiftUp', 'type': 'param', 'min_max': True}, {'name': 'StepMode', 'type': 'param'}, {'name': 'On/Off', 'type': 'param'}, {'name': 'StepRecord', 'type': 'param'}, {'name': 'TimeShiftDirection', 'type': 'param'}, {'name': 'ScrambleTS', 'type': 'param', 'min_max': True}, {'name': 'Time/MIDI', 'type': 'param'}, {'name': 'TimeShiftLock', 'type': 'param'}, {'name': 'VelocityDirection', 'type': 'param'}, {'name': 'VelocityLock', 'type': 'param'}, {'name': 'View', 'type': 'param'}, {'name': 'TimeMode', 'type': 'param'}, {'name': 'DotSync', 'type': 'param'}, {'name': 'Triplet', 'type': 'param'}]}, {'className': 'InstrumentGroupDevice', 'deviceName': 'SHED SKIN - LOW END GENERATOR RACK', 'encoders': [], 'buttons': [{'name': 'Macro 1', 'min_max': True, 'type': 'param'}]}]},
+            smart_zoning=False,
+            zone_tables_raw=None,
+            encoder_slot_count=16,
+            hud_cells=[(0, 0, 'dial', 8, 0, 0), (1, 0, 'dial', 8, 8, 0), (2, 0, 'button', 8, 0, 0), (0, 0, 'button', 2, 8, 1), (1, 0, 'button', 2, 10, 1), (2, 0, 'button', 2, 12, 1), (3, 0, 'button', 2, 14, 1)],
+            hud_dividers=[],
+            mode_hud_labels={'main_mode': {('button', 3): ('dev on/off', ''), ('button', 1): ('mute', ''), ('button', 2): ('solo', ''), ('button', 4): ('iterate_midi_pattern', ''), ('button', 5): ('Back 8', ''), ('button', 6): ('update_colors', ''), ('button', 7): ('Rack Random', '')}, 'shift_mode': {('dial', 7): ('volume', ''), ('dial', 15): ('pan', ''), ('dial', 4): ('send 1', ''), ('dial', 5): ('send 2', ''), ('dial', 6): ('send 3', ''), ('dial', 12): ('send 4', ''), ('dial', 13): ('send 5', ''), ('dial', 14): ('send 6', ''), ('button', 1): ('Rec MIDI new', ''), ('button', 2): ('Rec Audio new', ''), ('button', 3): ('Audio -> Simpler', '')}},
+            hud_trigger='selection',
+            button_behaviour='toggle'), share=self._share)
+
+        self._song.add_appointed_device_listener(self.on_device_selected)
+        # A device *replace* (e.g. Wavetable → Drift) doesn't reliably fire the
+        # appointed-device listener, so also observe the selected track and its
+        # device chain. The devices-list observer fires on any add/remove/replace
+        # and re-bursts against the live device; it is re-attached whenever the
+        # selected track changes.
+        self._devices_listener_track = None
+        self._song.view.add_selected_track_listener(self.on_selected_track_changed)
+        self._attach_track_devices_listener()
+
+
+        self.log_message(f"main_component finish init.")
+        self._previous_values = {}
+
+        self._lisetenr = OSCListener(self.manager, self.button_handler, port=29139,
+                                     name="ck_lc_parks__launch_control", hub=self.manager.io_hub)
+
+        # Compositor only: receive each secondary surface's forwarded HUD region
+        # and merge them into this surface's single combined HUD stream. The
+        # wiring is real (always present, syntax-checked) and gated on
+        # REGION_CONFIG — data, not a code string built in gen.py. None for
+        # standalone surfaces; one dict for a single secondary, a list of them
+        # (section order) for several.
+        REGION_CONFIG = {'dial_offset': 16, 'button_offset': 8, 'port': 21110, 'dial_count': 0, 'button_count': 8}
+        if REGION_CONFIG is not None:
+            _regions = REGION_CONFIG if isinstance(REGION_CONFIG, list) else [REGION_CONFIG]
+            self._region_state = RegionSet([
+                RegionState(self._hud_client,
+                    dial_offset=region['dial_offset'],
+                    button_offset=region['button_offset'],
+                    on_commit=self._helpers.reemit_combined_burst,
+                    dial_count=region.get('dial_count', 0),
+                    button_count=region.get('button_count', 0))
+                for region in _regions])
+            self._remote.set_region_state(self._region_state)
+            self._region_listeners = [
+                RegionListener(self.manager, state, port=region['port'],
+                    name=f"ck_lc_parks__launch_control-region{i}", hub=self.manager.io_hub)
+                for i, (region, state) in enumerate(zip(_regions, self._region_state.regions))]
+
+        # Reverse mode channel (lc_parks only): the primary sends the active mode
+        # name to the secondary so holding shift on the primary switches the
+        # secondary's mappings too. Data, not code; None on standalone surfaces.
+        # role='sender' -> primary (this surface owns a shift mode-button; its
+        #                  port is a list when several secondaries follow it);
+        # role='listener' -> secondary (headless FSM driven remotely).
+        MODE_LINK = None
+        if MODE_LINK is not None:
+            if MODE_LINK['role'] == 'sender':
+                self._mode_sender = ModeSender('127.0.0.1', MODE_LINK['port'])
+            else:
+                self._mode_listener = ModeListener(self.manager, self,
+                    port=MODE_LINK['port'], name="ck_lc_parks__launch_control-mode", hub=self.manager.io_hub)
+
+        self._song.view.add_selected_parameter_listener(self._on_selected_parameter_changed)
+
+        # Dismiss the HUD when the user navigates away from the device
+        # (Session/Arrangement switch, leaving the device chain, opening a clip).
+        # We over-index on hiding: only a fresh device burst re-shows the HUD.
+        # Callbacks are directional so they can't race our own show burst. The
+        # broader "any GUI interaction" auto-hide (browser/mixer/etc.) lives in
+        # the Swift input monitor (hud-input-autohide-plan), not here.
+        self._app_view = Live.Application.get_application().view
+        self._register_app_view_listeners()
+
+    def _register_app_view_listeners(self):
+        try:
+            self._app_view.add_focused_document_view_listener(self._on_doc_view_changed)
+        except Exception as e:
+            self.log_message(f"HUD dismiss: failed to add focused_document_view listener: {e}")
+        # Note: the browser (and mixer/arrangement/etc.) are handled by the Swift
+        # HUD's global input monitor now (hud-input-autohide-plan) — any mac
+        # mouse/keyboard input in Ableton sticky-hides a summon HUD — not by
+        # enumerating view listeners here (Live's API can't even observe a click
+        # into an already-open docked browser).
+        try:
+            self._app_view.add_is_view_visible_listener('Detail/DeviceChain', self._on_detail_changed)
+        except Exception as e:
+            self.log_message(f"HUD dismiss: failed to add Detail/DeviceChain visibility listener: {e}")
+        try:
+            # Detail/Clip visibility gates the HUD under show-hud-on: summon
+            # (hud-summon-only-plan): opening a clip hides the HUD and keeps it
+            # silent through selection/mode bursts; closing it clears the gate.
+            # Unlike the other three (dismiss-only), this forwards BOTH directions.
+            self._app_view.add_is_view_visible_listener('Detail/Clip', self._on_clip_view_changed)
+            self._helpers.hud_clip_view_changed(self._app_view.is_view_visible('Detail/Clip'))
+        except Exception as e:
+            self.log_message(f"HUD dismiss: failed to add Detail/Clip visibility listener: {e}")
+
+    def _attach_track_devices_listener(self):
+        """Observe the selected track's device chain so a device *replace*
+        (Wavetable → Drift) — which doesn't reliably fire the appointed-device
+        listener — still re-bursts. Idempotent: detaches the previous track's
+        observer first, so repeated calls (e.g. on every track change) don't
+        stack listeners."""
+        self._teardown_track_devices_listener()
+        try:
+            track = self._song.view.selected_track
+        except Exception:
+            track = None
+        if track is None:
+            return
+        try:
+            track.add_devices_listener(self._on_track_devices_changed)
+            self._devices_listener_track = track
+        except Exception as e:
+            self.log_message(f"HUD: failed to add devices listener: {e}")
+
+    def _teardown_track_devices_listener(self):
+        track = getattr(self, '_devices_listener_track', None)
+        if track is None:
+            return
+        try:
+            track.remove_devices_listener(self._on_track_devices_changed)
+        except Exception:
+            pass
+        self._devices_listener_track = None
+
+    def _on_track_devices_changed(self):
+        # Device chain changed (add/remove/replace). Re-resolve the focused
+        # device and funnel through selected_device_changed; its fail-open guard
+        # treats a now-dead previous handle as changed and re-bursts for the live
+        # device.
+        self.fine(f"[listener] _on_track_devices_changed dev={getattr(self.selected_device(),'name',None)!r}")
+        self._helpers.selected_device_changed(self.selected_device())
+
+    def remove_app_view_listeners(self):
+        self._teardown_track_devices_listener()
+        try:
+            self._song.view.remove_selected_track_listener(self.on_selected_track_changed)
+        except Exception:
+            pass
+        try:
+            self._app_view.remove_focused_document_view_listener(self._on_doc_view_changed)
+        except Exception:
+            pass
+        try:
+            self._app_view.remove_is_view_visible_listener('Detail/DeviceChain', self._on_detail_changed)
+        except Exception:
+            pass
+        try:
+            self._app_view.remove_is_view_visible_listener('Detail/Clip', self._on_clip_view_changed)
+        except Exception:
+            pass
+
+    def _on_doc_view_changed(self):
+        # Session <-> Arrangement switch. Device selection never changes this, so
+        # an unconditional hide can't race our show burst. Note: Live emits this
+        # redundantly (several times per change); HIDE is idempotent so that's fine.
+        self.fine("[appview] _on_doc_view_changed -> hud_view_left")
+        self._helpers.hud_view_left()
+
+    def _on_detail_changed(self):
+        # Hide only when the device chain becomes hidden. Selecting a device makes
+        # it visible, so this won't fire a hide on selection.
+        try:
+            visible = self._app_view.is_view_visible('Detail/DeviceChain')
+            self.fine(f"[appview] _on_detail_changed device_chain_visible={visible}")
+            if not visible:
+                self._helpers.hud_view_left()
+        except Exception as e:
+            self.log_message(f"HUD dismiss: Detail/DeviceChain visibility check failed: {e}")
+
+    def _on_clip_view_changed(self):
+        # Detail/Clip visibility flipped. Both directions matter: visible=True
+        # hides + arms the clip-view gate, visible=False disarms it (without
+        # re-showing). The visibility table owns that logic.
+        try:
+            visible = self._app_view.is_view_visible('Detail/Clip')
+            self.fine(f"[appview] _on_clip_view_changed clip_visible={visible}")
+            self._helpers.hud_clip_view_changed(visible)
+        except Exception as e:
+            self.log_message(f"HUD dismiss: Detail/Clip visibility check failed: {e}")
+
+    def button_handler(self, button, send_value):
+        value = 127 if send_value > 0.0 else 0
+
+        self._helpers.device_parameter_action(self.selected_device(), button, -1, value, '<OSC Button Press>')
+
+    def remove_all_listeners(self, modes_only=False):
+        
+        self.knob_ch3_21_CC.remove_value_listener(self.knob_ch3_21_CC__mode_main_mode_slot1_listener)
+        self.knob_ch3_22_CC.remove_value_listener(self.knob_ch3_22_CC__mode_main_mode_slot2_listener)
+        self.knob_ch3_23_CC.remove_value_listener(self.knob_ch3_23_CC__mode_main_mode_slot3_listener)
+        self.knob_ch3_24_CC.remove_value_listener(self.knob_ch3_24_CC__mode_main_mode_slot4_listener)
+        self.knob_ch3_25_CC.remove_value_listener(self.knob_ch3_25_CC__mode_main_mode_slot5_listener)
+        self.knob_ch3_26_CC.remove_value_listener(self.knob_ch3_26_CC__mode_main_mode_slot6_listener)
+        self.knob_ch3_27_CC.remove_value_listener(self.knob_ch3_27_CC__mode_main_mode_slot7_listener)
+        self.knob_ch3_28_CC.remove_value_listener(self.knob_ch3_28_CC__mode_main_mode_slot8_listener)
+        self.knob_ch3_29_CC.remove_value_listener(self.knob_ch3_29_CC__mode_main_mode_slot9_listener)
+        self.knob_ch3_42_CC.remove_value_listener(self.knob_ch3_42_CC__mode_main_mode_slot10_listener)
+        self.knob_ch3_43_CC.remove_value_listener(self.knob_ch3_43_CC__mode_main_mode_slot11_listener)
+        self.knob_ch3_44_CC.remove_value_listener(self.knob_ch3_44_CC__mode_main_mode_slot12_listener)
+        self.knob_ch3_45_CC.remove_value_listener(self.knob_ch3_45_CC__mode_main_mode_slot13_listener)
+        self.knob_ch3_46_CC.remove_value_listener(self.knob_ch3_46_CC__mode_main_mode_slot14_listener)
+        self.knob_ch3_47_CC.remove_value_listener(self.knob_ch3_47_CC__mode_main_mode_slot15_listener)
+        self.knob_ch3_48_CC.remove_value_listener(self.knob_ch3_48_CC__mode_main_mode_slot16_listener)
+        self.button_ch9_38_note.remove_value_listener(self.button_ch9_38_note__mode_main_mode_p0_listener)
+        self.mixer.selected_strip().set_mute_button(None)
+        self.mixer.selected_strip().set_solo_button(None)
+        self.button_ch9_36_note.remove_value_listener(self.button_ch9_36_note__mode_main_mode_fn_iterate_midi_pattern_listener)
+        self.button_ch9_60_note.remove_value_listener(self.button_ch9_60_note__mode_main_mode_fn_back8_listener)
+        self.button_ch9_41_note.remove_value_listener(self.button_ch9_41_note__mode_main_mode_fn_update_colors_listener)
+        self.button_ch9_43_note.remove_value_listener(self.button_ch9_43_note__mode_main_mode_fn_press_rack_random_button_listener)
+        self.button_ch3_117_CC.remove_value_listener(self.button_ch3_117_CC__mode_main_mode_right_listener)
+        self.button_ch3_116_CC.remove_value_listener(self.button_ch3_116_CC__mode_main_mode_left_listener)
+        self.button_ch3_115_CC.remove_value_listener(self.button_ch3_115_CC__mode_main_mode_inc_listener)
+        self.button_ch3_114_CC.remove_value_listener(self.button_ch3_114_CC__mode_main_mode_dec_listener)
+
+
+        self.mixer.selected_strip().set_volume_control(None)
+        self.mixer.selected_strip().set_pan_control(None)
+        self.mixer.selected_strip().set_send_controls(None)
+        self.button_ch9_36_note.remove_value_listener(self.button_ch9_36_note__mode_shift_mode_button1_listener)
+        self.button_ch9_60_note.remove_value_listener(self.button_ch9_60_note__mode_shift_mode_button2_listener)
+        self.button_ch9_41_note.remove_value_listener(self.button_ch9_41_note__mode_shift_mode_button3_listener)
+        self.button_ch9_43_note.remove_value_listener(self.button_ch9_43_note__mode_shift_mode_button4_listener)
+        self.button_ch9_12_note.remove_value_listener(self.button_ch9_12_note__mode_shift_mode_fn_record_midi_from_track_to_new_track_listener)
+        self.button_ch9_37_note.remove_value_listener(self.button_ch9_37_note__mode_shift_mode_fn_create_audio_track_taking_input_from_selected_track_listener)
+        self.button_ch9_38_note.remove_value_listener(self.button_ch9_38_note__mode_shift_mode_fn_selected_audio_to_simpler_in_new_track_listener)
+        self.button_ch3_117_CC.remove_value_listener(self.button_ch3_117_CC__mode_shift_mode_fn_clip_extend_listener)
+        self.button_ch3_116_CC.remove_value_listener(self.button_ch3_116_CC__mode_shift_mode_fn_clip_delete_end_listener)
+        self.button_ch3_115_CC.remove_value_listener(self.button_ch3_115_CC__mode_shift_mode_pager_encoder_inc_listener)
+        self.button_ch3_114_CC.remove_value_listener(self.button_ch3_114_CC__mode_shift_mode_pager_encoder_dec_listener)
+
+
+        if not modes_only:
+            self.mode_button.remove_value_listener(self.mode_button_listener)
+    
+
+    def debug(self):
+        return self.manager.debug
+
+    def update_selected_device(self):
+        self._helpers.selected_device_changed(self.selected_device())
+
+    def setup_controls(self):
+        
+        self.knob_ch3_21_CC = EncoderElement(MIDI_CC_TYPE, 2, 21, Live.MidiMap.MapMode.absolute)
+        self.knob_ch3_22_CC = EncoderElement(MIDI_CC_TYPE, 2, 22, Live.MidiMap.MapMode.absolute)
+        self.knob_ch3_23_CC = EncoderElement(MIDI_CC_TYPE, 2, 23, Live.MidiMap.MapMode.absolute)
+        self.knob_ch3_24_CC = EncoderElement(MIDI_CC_TYPE, 2, 24, Live.MidiMap.MapMode.absolute)
+        self.knob_ch3_25_CC = EncoderElement(MIDI_CC_TYPE, 2, 25, Live.MidiMap.MapMode.absolute)
+        self.knob_ch3_26_CC = EncoderElement(MIDI_CC_TYPE, 2, 26, Live.MidiMap.MapMode.absolute)
+        self.knob_ch3_27_CC = EncoderElement(MIDI_CC_TYPE, 2, 27, Live.MidiMap.MapMode.absolute)
+        self.knob_ch3_28_CC = EncoderElement(MIDI_CC_TYPE, 2, 28, Live.MidiMap.MapMode.absolute)
+        self.knob_ch3_29_CC = EncoderElement(MIDI_CC_TYPE, 2, 29, Live.MidiMap.MapMode.absolute)
+        self.knob_ch3_42_CC = EncoderElement(MIDI_CC_TYPE, 2, 42, Live.MidiMap.MapMode.absolute)
+        self.knob_ch3_43_CC = EncoderElement(MIDI_CC_TYPE, 2, 43, Live.MidiMap.MapMode.absolute)
+        self.knob_ch3_44_CC = EncoderElement(MIDI_CC_TYPE, 2, 44, Live.MidiMap.MapMode.absolute)
+        self.knob_ch3_45_CC = EncoderElement(MIDI_CC_TYPE, 2, 45, Live.MidiMap.MapMode.absolute)
+        self.knob_ch3_46_CC = EncoderElement(MIDI_CC_TYPE, 2, 46, Live.MidiMap.MapMode.absolute)
+        self.knob_ch3_47_CC = EncoderElement(MIDI_CC_TYPE, 2, 47, Live.MidiMap.MapMode.absolute)
+        self.knob_ch3_48_CC = EncoderElement(MIDI_CC_TYPE, 2, 48, Live.MidiMap.MapMode.absolute)
+        self.button_ch9_38_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 8, 38)
+        self.button_ch9_12_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 8, 12)
+        self.button_ch9_37_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 8, 37)
+        self.button_ch9_36_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 8, 36)
+        self.button_ch9_60_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 8, 60)
+        self.button_ch9_41_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 8, 41)
+        self.button_ch9_43_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 8, 43)
+        self.button_ch3_117_CC = ConfigurableButtonElement(True, MIDI_CC_TYPE, 2, 117)
+        self.button_ch3_116_CC = ConfigurableButtonElement(True, MIDI_CC_TYPE, 2, 116)
+        self.button_ch3_115_CC = ConfigurableButtonElement(True, MIDI_CC_TYPE, 2, 115)
+        self.button_ch3_114_CC = ConfigurableButtonElement(True, MIDI_CC_TYPE, 2, 114)
+        self.knob_ch3_28_CC = EncoderElement(MIDI_CC_TYPE, 2, 28, Live.MidiMap.MapMode.absolute)
+        self.knob_ch3_48_CC = EncoderElement(MIDI_CC_TYPE, 2, 48, Live.MidiMap.MapMode.absolute)
+        self.knob_ch3_25_CC = EncoderElement(MIDI_CC_TYPE, 2, 25, Live.MidiMap.MapMode.absolute)
+        self.knob_ch3_26_CC = EncoderElement(MIDI_CC_TYPE, 2, 26, Live.MidiMap.MapMode.absolute)
+        self.knob_ch3_27_CC = EncoderElement(MIDI_CC_TYPE, 2, 27, Live.MidiMap.MapMode.absolute)
+        self.knob_ch3_45_CC = EncoderElement(MIDI_CC_TYPE, 2, 45, Live.MidiMap.MapMode.absolute)
+        self.knob_ch3_46_CC = EncoderElement(MIDI_CC_TYPE, 2, 46, Live.MidiMap.MapMode.absolute)
+        self.knob_ch3_47_CC = EncoderElement(MIDI_CC_TYPE, 2, 47, Live.MidiMap.MapMode.absolute)
+        self.button_ch9_36_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 8, 36)
+        self.button_ch9_60_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 8, 60)
+        self.button_ch9_41_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 8, 41)
+        self.button_ch9_43_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 8, 43)
+        self.button_ch9_12_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 8, 12)
+        self.button_ch9_37_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 8, 37)
+        self.button_ch9_38_note = ConfigurableButtonElement(True, MIDI_NOTE_TYPE, 8, 38)
+        self.button_ch3_117_CC = ConfigurableButtonElement(True, MIDI_CC_TYPE, 2, 117)
+        self.button_ch3_116_CC = ConfigurableButtonElement(True, MIDI_CC_TYPE, 2, 116)
+        self.button_ch3_115_CC = ConfigurableButtonElement(True, MIDI_CC_TYPE, 2, 115)
+        self.button_ch3_114_CC = ConfigurableButtonElement(True, MIDI_CC_TYPE, 2, 114)
+        self.mode_main_mode_add_listeners()
+        
+        self.current_mode = self._modes['main_mode']
+        self.goto_mode(self._first_mode)
+        
+        
+        self.knob_ch3_25_CC_shift_mode_sends = [
+             self.knob_ch3_25_CC,
+            self.knob_ch3_26_CC,
+            self.knob_ch3_27_CC,
+            self.knob_ch3_45_CC,
+            self.knob_ch3_46_CC,
+            self.knob_ch3_47_CC
+        ]
+    
+
+
+    def _on_selected_parameter_changed(self):
+        if self.manager.debug:
+            param = self._song.view.selected_parameter
+            if param is not None:
+                if param.is_quantized:
+                    items = ", items: " +", ".join(param.value_items)
+                else:
+                    items = ""
+                self.log_message(f"Selected parameter changed:  {param.name} (value: {param.value}, min: {param.min}, max: {param.max}, is_quantized: {param.is_quantized}{items})")
+            else:
+                self.log_message("Selected parameter changed: None")
+
+
+    def mode_main_mode_add_listeners(self):
+        self.log_message(f'Adding listeners for mode main_mode')
+    
+
+        self.knob_ch3_21_CC.add_value_listener(self.knob_ch3_21_CC__mode_main_mode_slot1_listener)
+        self._previous_values['knob_ch3_21_CC__mode_main_mode_slot1_listener'] = 0
+        self.knob_ch3_22_CC.add_value_listener(self.knob_ch3_22_CC__mode_main_mode_slot2_listener)
+        self._previous_values['knob_ch3_22_CC__mode_main_mode_slot2_listener'] = 0
+        self.knob_ch3_23_CC.add_value_listener(self.knob_ch3_23_CC__mode_main_mode_slot3_listener)
+        self._previous_values['knob_ch3_23_CC__mode_main_mode_slot3_listener'] = 0
+        self.knob_ch3_24_CC.add_value_listener(self.knob_ch3_24_CC__mode_main_mode_slot4_listener)
+        self._previous_values['knob_ch3_24_CC__mode_main_mode_slot4_listener'] = 0
+        self.knob_ch3_25_CC.add_value_listener(self.knob_ch3_25_CC__mode_main_mode_slot5_listener)
+        self._previous_values['knob_ch3_25_CC__mode_main_mode_slot5_listener'] = 0
+        self.knob_ch3_26_CC.add_value_listener(self.knob_ch3_26_CC__mode_main_mode_slot6_listener)
+        self._previous_values['knob_ch3_26_CC__mode_main_mode_slot6_listener'] = 0
+        self.knob_ch3_27_CC.add_value_listener(self.knob_ch3_27_CC__mode_main_mode_slot7_listener)
+        self._previous_values['knob_ch3_27_CC__mode_main_mode_slot7_listener'] = 0
+        self.knob_ch3_28_CC.add_value_listener(self.knob_ch3_28_CC__mode_main_mode_slot8_listener)
+        self._previous_values['knob_ch3_28_CC__mode_main_mode_slot8_listener'] = 0
+        self.knob_ch3_29_CC.add_value_listener(self.knob_ch3_29_CC__mode_main_mode_slot9_listener)
+        self._previous_values['knob_ch3_29_CC__mode_main_mode_slot9_listener'] = 0
+        self.knob_ch3_42_CC.add_value_listener(self.knob_ch3_42_CC__mode_main_mode_slot10_listener)
+        self._previous_values['knob_ch3_42_CC__mode_main_mode_slot10_listener'] = 0
+        self.knob_ch3_43_CC.add_value_listener(self.knob_ch3_43_CC__mode_main_mode_slot11_listener)
+        self._previous_values['knob_ch3_43_CC__mode_main_mode_slot11_listener'] = 0
+        self.knob_ch3_44_CC.add_value_listener(self.knob_ch3_44_CC__mode_main_mode_slot12_listener)
+        self._previous_values['knob_ch3_44_CC__mode_main_mode_slot12_listener'] = 0
+        self.knob_ch3_45_CC.add_value_listener(self.knob_ch3_45_CC__mode_main_mode_slot13_listener)
+        self._previous_values['knob_ch3_45_CC__mode_main_mode_slot13_listener'] = 0
+        self.knob_ch3_46_CC.add_value_listener(self.knob_ch3_46_CC__mode_main_mode_slot14_listener)
+        self._previous_values['knob_ch3_46_CC__mode_main_mode_slot14_listener'] = 0
+        self.knob_ch3_47_CC.add_value_listener(self.knob_ch3_47_CC__mode_main_mode_slot15_listener)
+        self._previous_values['knob_ch3_47_CC__mode_main_mode_slot15_listener'] = 0
+        self.knob_ch3_48_CC.add_value_listener(self.knob_ch3_48_CC__mode_main_mode_slot16_listener)
+        self._previous_values['knob_ch3_48_CC__mode_main_mode_slot16_listener'] = 0
+        self.button_ch9_38_note.add_value_listener(self.button_ch9_38_note__mode_main_mode_p0_listener)
+        self._previous_values['button_ch9_38_note__mode_main_mode_p0_listener'] = 0
+        self.mixer.selected_strip().set_mute_button(self.button_ch9_12_note)
+        self.mixer.selected_strip().set_solo_button(self.button_ch9_37_note)
+        self.button_ch9_36_note.add_value_listener(self.button_ch9_36_note__mode_main_mode_fn_iterate_midi_pattern_listener)
+        self._previous_values['button_ch9_36_note__mode_main_mode_fn_iterate_midi_pattern_listener'] = 0
+        self.button_ch9_60_note.add_value_listener(self.button_ch9_60_note__mode_main_mode_fn_back8_listener)
+        self._previous_values['button_ch9_60_note__mode_main_mode_fn_back8_listener'] = 0
+        self.button_ch9_41_note.add_value_listener(self.button_ch9_41_note__mode_main_mode_fn_update_colors_listener)
+        self._previous_values['button_ch9_41_note__mode_main_mode_fn_update_colors_listener'] = 0
+        self.button_ch9_43_note.add_value_listener(self.button_ch9_43_note__mode_main_mode_fn_press_rack_random_button_listener)
+        self._previous_values['button_ch9_43_note__mode_main_mode_fn_press_rack_random_button_listener'] = 0
+        self.button_ch3_117_CC.add_value_listener(self.button_ch3_117_CC__mode_main_mode_right_listener)
+        self._previous_values['button_ch3_117_CC__mode_main_mode_right_listener'] = 0
+        self.button_ch3_116_CC.add_value_listener(self.button_ch3_116_CC__mode_main_mode_left_listener)
+        self._previous_values['button_ch3_116_CC__mode_main_mode_left_listener'] = 0
+        self.button_ch3_115_CC.add_value_listener(self.button_ch3_115_CC__mode_main_mode_inc_listener)
+        self._previous_values['button_ch3_115_CC__mode_main_mode_inc_listener'] = 0
+        self.button_ch3_114_CC.add_value_listener(self.button_ch3_114_CC__mode_main_mode_dec_listener)
+        self._previous_values['button_ch3_114_CC__mode_main_mode_dec_listener'] = 0
+
+
+    def mode_shift_mode_add_listeners(self):
+        self.log_message(f'Adding listeners for mode shift_mode')
+    
+
+        self.mixer.selected_strip().set_volume_control(self.knob_ch3_28_CC)
+        self.mixer.selected_strip().set_pan_control(self.knob_ch3_48_CC)
+        self.mixer.selected_strip().set_send_controls(self.knob_ch3_25_CC_shift_mode_sends)
+        self.button_ch9_36_note.add_value_listener(self.button_ch9_36_note__mode_shift_mode_button1_listener)
+        self._previous_values['button_ch9_36_note__mode_shift_mode_button1_listener'] = 0
+        self.button_ch9_60_note.add_value_listener(self.button_ch9_60_note__mode_shift_mode_button2_listener)
+        self._previous_values['button_ch9_60_note__mode_shift_mode_button2_listener'] = 0
+        self.button_ch9_41_note.add_value_listener(self.button_ch9_41_note__mode_shift_mode_button3_listener)
+        self._previous_values['button_ch9_41_note__mode_shift_mode_button3_listener'] = 0
+        self.button_ch9_43_note.add_value_listener(self.button_ch9_43_note__mode_shift_mode_button4_listener)
+        self._previous_values['button_ch9_43_note__mode_shift_mode_button4_listener'] = 0
+        self.button_ch9_12_note.add_value_listener(self.button_ch9_12_note__mode_shift_mode_fn_record_midi_from_track_to_new_track_listener)
+        self._previous_values['button_ch9_12_note__mode_shift_mode_fn_record_midi_from_track_to_new_track_listener'] = 0
+        self.button_ch9_37_note.add_value_listener(self.button_ch9_37_note__mode_shift_mode_fn_create_audio_track_taking_input_from_selected_track_listener)
+        self._previous_values['button_ch9_37_note__mode_shift_mode_fn_create_audio_track_taking_input_from_selected_track_listener'] = 0
+        self.button_ch9_38_note.add_value_listener(self.button_ch9_38_note__mode_shift_mode_fn_selected_audio_to_simpler_in_new_track_listener)
+        self._previous_values['button_ch9_38_note__mode_shift_mode_fn_selected_audio_to_simpler_in_new_track_listener'] = 0
+        self.button_ch3_117_CC.add_value_listener(self.button_ch3_117_CC__mode_shift_mode_fn_clip_extend_listener)
+        self._previous_values['button_ch3_117_CC__mode_shift_mode_fn_clip_extend_listener'] = 0
+        self.button_ch3_116_CC.add_value_listener(self.button_ch3_116_CC__mode_shift_mode_fn_clip_delete_end_listener)
+        self._previous_values['button_ch3_116_CC__mode_shift_mode_fn_clip_delete_end_listener'] = 0
+        self.button_ch3_115_CC.add_value_listener(self.button_ch3_115_CC__mode_shift_mode_pager_encoder_inc_listener)
+        self._previous_values['button_ch3_115_CC__mode_shift_mode_pager_encoder_inc_listener'] = 0
+        self.button_ch3_114_CC.add_value_listener(self.button_ch3_114_CC__mode_shift_mode_pager_encoder_dec_listener)
+        self._previous_values['button_ch3_114_CC__mode_shift_mode_pager_encoder_dec_listener'] = 0
+
+
+    def log_message(self, message):
+        self.manager.log_message(message)
+
+    def fine(self, message):
+        # Gated protocol-trace channel:
+        # silent unless `manager.fine` is on (toggle with `update.py hudtrace`).
+        # Delegates to Helpers.fine so all `[hudtrace]` lines share one gate/tag.
+        self._helpers.fine(message)
+
+    def selected_device(self):
+        return self._song.view.selected_track.view.selected_device
+
+    # device-nav handlers pass source='nav' so the HUD shows even under
+    # show-hud-on='controller-nav'. track-nav keeps the default 'selection'
+    # source (silent in controller-nav mode, per the show-hud-on contract).
+    # Each nav method logs the focused device name before and after the _nav
+    # call, so a [hudtrace] capture shows whether Live's appointed-device
+    # listener fired synchronously inside scroll_view: if it did,
+    # on_device_selected's line lands *between* these two (single-threaded
+    # log order = execution order), which matters because that ordering
+    # decides whether selected_device_changed's same-device guard sees the
+    # nav call or the listener call first.
+    def device_nav_left(self):
+        self.fine(f"[nav] device_nav_left enter dev={getattr(self.selected_device(),'name',None)!r}")
+        self._nav.device_nav_left()
+        self.fine(f"[nav] device_nav_left post-scroll dev={getattr(self.selected_device(),'name',None)!r} source=nav")
+        self._helpers.selected_device_changed(self.selected_device(), source='nav')
+
+    def device_nav_right(self):
+        self.fine(f"[nav] device_nav_right enter dev={getattr(self.selected_device(),'name',None)!r}")
+        self._nav.device_nav_right()
+        self.fine(f"[nav] device_nav_right post-scroll dev={getattr(self.selected_device(),'name',None)!r} source=nav")
+        self._helpers.selected_device_changed(self.selected_device(), source='nav')
+
+    def track_nav_inc(self):
+        self.fine(f"[nav] track_nav_inc enter dev={getattr(self.selected_device(),'name',None)!r}")
+        self._nav.track_nav_inc()
+        self.fine(f"[nav] track_nav_inc post-scroll dev={getattr(self.selected_device(),'name',None)!r} source=selection")
+        self._helpers.selected_device_changed(self.selected_device())
+
+    def track_nav_dec(self):
+        self.fine(f"[nav] track_nav_dec enter dev={getattr(self.selected_device(),'name',None)!r}")
+        self._nav.track_nav_dec()
+        self.fine(f"[nav] track_nav_dec post-scroll dev={getattr(self.selected_device(),'name',None)!r} source=selection")
+        self._helpers.selected_device_changed(self.selected_device())
+
+    def device_nav_first_last(self):
+        self._nav.device_nav_first_last()
+
+    def device_nav_first(self):
+        self.fine(f"[nav] device_nav_first enter dev={getattr(self.selected_device(),'name',None)!r}")
+        self._nav.device_nav_first()
+        self.fine(f"[nav] device_nav_first post-scroll dev={getattr(self.selected_device(),'name',None)!r} source=nav")
+        self._helpers.selected_device_changed(self.selected_device(), source='nav')
+
+    def device_nav_last(self):
+        self.fine(f"[nav] device_nav_last enter dev={getattr(self.selected_device(),'name',None)!r}")
+        self._nav.device_nav_last()
+        self.fine(f"[nav] device_nav_last post-scroll dev={getattr(self.selected_device(),'name',None)!r} source=nav")
+        self._helpers.selected_device_changed(self.selected_device(), source='nav')
+
+    
+    def knob_ch3_21_CC__mode_main_mode_slot1_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 1, 21, value, "knob_ch3_21_CC__mode_main_mode_slot1_listener", toggle=False)
+        
+    
+    def knob_ch3_22_CC__mode_main_mode_slot2_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 2, 22, value, "knob_ch3_22_CC__mode_main_mode_slot2_listener", toggle=False)
+        
+    
+    def knob_ch3_23_CC__mode_main_mode_slot3_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 3, 23, value, "knob_ch3_23_CC__mode_main_mode_slot3_listener", toggle=False)
+        
+    
+    def knob_ch3_24_CC__mode_main_mode_slot4_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 4, 24, value, "knob_ch3_24_CC__mode_main_mode_slot4_listener", toggle=False)
+        
+    
+    def knob_ch3_25_CC__mode_main_mode_slot5_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 5, 25, value, "knob_ch3_25_CC__mode_main_mode_slot5_listener", toggle=False)
+        
+    
+    def knob_ch3_26_CC__mode_main_mode_slot6_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 6, 26, value, "knob_ch3_26_CC__mode_main_mode_slot6_listener", toggle=False)
+        
+    
+    def knob_ch3_27_CC__mode_main_mode_slot7_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 7, 27, value, "knob_ch3_27_CC__mode_main_mode_slot7_listener", toggle=False)
+        
+    
+    def knob_ch3_28_CC__mode_main_mode_slot8_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 8, 28, value, "knob_ch3_28_CC__mode_main_mode_slot8_listener", toggle=False)
+        
+    
+    def knob_ch3_29_CC__mode_main_mode_slot9_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 9, 29, value, "knob_ch3_29_CC__mode_main_mode_slot9_listener", toggle=False)
+        
+    
+    def knob_ch3_42_CC__mode_main_mode_slot10_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 10, 42, value, "knob_ch3_42_CC__mode_main_mode_slot10_listener", toggle=False)
+        
+    
+    def knob_ch3_43_CC__mode_main_mode_slot11_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 11, 43, value, "knob_ch3_43_CC__mode_main_mode_slot11_listener", toggle=False)
+        
+    
+    def knob_ch3_44_CC__mode_main_mode_slot12_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 12, 44, value, "knob_ch3_44_CC__mode_main_mode_slot12_listener", toggle=False)
+        
+    
+    def knob_ch3_45_CC__mode_main_mode_slot13_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 13, 45, value, "knob_ch3_45_CC__mode_main_mode_slot13_listener", toggle=False)
+        
+    
+    def knob_ch3_46_CC__mode_main_mode_slot14_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 14, 46, value, "knob_ch3_46_CC__mode_main_mode_slot14_listener", toggle=False)
+        
+    
+    def knob_ch3_47_CC__mode_main_mode_slot15_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 15, 47, value, "knob_ch3_47_CC__mode_main_mode_slot15_listener", toggle=False)
+        
+    
+    def knob_ch3_48_CC__mode_main_mode_slot16_listener(self, value):
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 16, 48, value, "knob_ch3_48_CC__mode_main_mode_slot16_listener", toggle=False)
+        
+    
+    def button_ch9_38_note__mode_main_mode_p0_listener(self, value):
+        self._helpers.button_event('button_ch9_38_note__mode_main_mode_p0_listener', value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+    
+    
+        self.device_parameter_action(device, 0, 38, value, "button_ch9_38_note__mode_main_mode_p0_listener", toggle=True)
+        
+    
+    # function_iterate_midi_pattern_ch9_36_note
+    def button_ch9_36_note__mode_main_mode_fn_iterate_midi_pattern_listener(self, value):
+        self._helpers.button_event('button_ch9_36_note__mode_main_mode_fn_iterate_midi_pattern_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch9_36_note__mode_main_mode_fn_iterate_midi_pattern_listener (function_iterate_midi_pattern_ch9_36_note) callee = self.functions.iterate_midi_pattern(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch9_36_note__mode_main_mode_fn_iterate_midi_pattern_listener']
+        self._previous_values['button_ch9_36_note__mode_main_mode_fn_iterate_midi_pattern_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.functions.iterate_midi_pattern()
+        self._hud_client.send_ping()
+        
+    
+    # function_back8_ch9_60_note
+    def button_ch9_60_note__mode_main_mode_fn_back8_listener(self, value):
+        self._helpers.button_event('button_ch9_60_note__mode_main_mode_fn_back8_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch9_60_note__mode_main_mode_fn_back8_listener (function_back8_ch9_60_note) callee = self.functions.back8(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch9_60_note__mode_main_mode_fn_back8_listener']
+        self._previous_values['button_ch9_60_note__mode_main_mode_fn_back8_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.functions.back8()
+        self._hud_client.send_ping()
+        
+    
+    # function_update_colors_ch9_41_note
+    def button_ch9_41_note__mode_main_mode_fn_update_colors_listener(self, value):
+        self._helpers.button_event('button_ch9_41_note__mode_main_mode_fn_update_colors_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch9_41_note__mode_main_mode_fn_update_colors_listener (function_update_colors_ch9_41_note) callee = self.functions.update_colors(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch9_41_note__mode_main_mode_fn_update_colors_listener']
+        self._previous_values['button_ch9_41_note__mode_main_mode_fn_update_colors_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.functions.update_colors()
+        self._hud_client.send_ping()
+        
+    
+    # function_press_rack_random_button_ch9_43_note
+    def button_ch9_43_note__mode_main_mode_fn_press_rack_random_button_listener(self, value):
+        self._helpers.button_event('button_ch9_43_note__mode_main_mode_fn_press_rack_random_button_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch9_43_note__mode_main_mode_fn_press_rack_random_button_listener (function_press_rack_random_button_ch9_43_note) callee = self.functions.press_rack_random_button(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch9_43_note__mode_main_mode_fn_press_rack_random_button_listener']
+        self._previous_values['button_ch9_43_note__mode_main_mode_fn_press_rack_random_button_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.functions.press_rack_random_button()
+        self._hud_client.send_ping()
+        
+    
+    # ch3_no117_CC__dn_right
+    def button_ch3_117_CC__mode_main_mode_right_listener(self, value):
+        self._helpers.button_event('button_ch3_117_CC__mode_main_mode_right_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch3_117_CC__mode_main_mode_right_listener (ch3_no117_CC__dn_right) callee = self.device_nav_right(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch3_117_CC__mode_main_mode_right_listener']
+        self._previous_values['button_ch3_117_CC__mode_main_mode_right_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.device_nav_right()
+        self._hud_client.send_ping()
+        
+    
+    # ch3_no116_CC__dn_left
+    def button_ch3_116_CC__mode_main_mode_left_listener(self, value):
+        self._helpers.button_event('button_ch3_116_CC__mode_main_mode_left_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch3_116_CC__mode_main_mode_left_listener (ch3_no116_CC__dn_left) callee = self.device_nav_left(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch3_116_CC__mode_main_mode_left_listener']
+        self._previous_values['button_ch3_116_CC__mode_main_mode_left_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.device_nav_left()
+        self._hud_client.send_ping()
+        
+    
+    # ch3_no115_CC__tn_inc
+    def button_ch3_115_CC__mode_main_mode_inc_listener(self, value):
+        self._helpers.button_event('button_ch3_115_CC__mode_main_mode_inc_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch3_115_CC__mode_main_mode_inc_listener (ch3_no115_CC__tn_inc) callee = self.track_nav_inc(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch3_115_CC__mode_main_mode_inc_listener']
+        self._previous_values['button_ch3_115_CC__mode_main_mode_inc_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.track_nav_inc()
+        self._hud_client.send_ping()
+        
+    
+    # ch3_no114_CC__tn_dec
+    def button_ch3_114_CC__mode_main_mode_dec_listener(self, value):
+        self._helpers.button_event('button_ch3_114_CC__mode_main_mode_dec_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch3_114_CC__mode_main_mode_dec_listener (ch3_no114_CC__tn_dec) callee = self.track_nav_dec(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch3_114_CC__mode_main_mode_dec_listener']
+        self._previous_values['button_ch3_114_CC__mode_main_mode_dec_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.track_nav_dec()
+        self._hud_client.send_ping()
+        
+
+
+    def button_ch9_36_note__mode_shift_mode_button1_listener(self, value):
+        self.log_message(f"calling : button_ch9_36_note__mode_shift_mode_button1_listener")
+        self._helpers.button_event("button_ch9_36_note__mode_shift_mode_button1_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        # Switch slots act once per press. The edge guard adapts to the controller's
+        # hardware button mode (momentary: act on the down, ignore the 0 release;
+        # toggle: every alternating edge is its own press). Without it a momentary
+        # bool slot toggles twice per press (net nothing); with a 127-only guard a
+        # toggle-hardware button fires every *other* press.
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 1, value, "button_ch9_36_note__mode_shift_mode_button1_listener")
+        
+    
+    def button_ch9_60_note__mode_shift_mode_button2_listener(self, value):
+        self.log_message(f"calling : button_ch9_60_note__mode_shift_mode_button2_listener")
+        self._helpers.button_event("button_ch9_60_note__mode_shift_mode_button2_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        # Switch slots act once per press. The edge guard adapts to the controller's
+        # hardware button mode (momentary: act on the down, ignore the 0 release;
+        # toggle: every alternating edge is its own press). Without it a momentary
+        # bool slot toggles twice per press (net nothing); with a 127-only guard a
+        # toggle-hardware button fires every *other* press.
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 2, value, "button_ch9_60_note__mode_shift_mode_button2_listener")
+        
+    
+    def button_ch9_41_note__mode_shift_mode_button3_listener(self, value):
+        self.log_message(f"calling : button_ch9_41_note__mode_shift_mode_button3_listener")
+        self._helpers.button_event("button_ch9_41_note__mode_shift_mode_button3_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        # Switch slots act once per press. The edge guard adapts to the controller's
+        # hardware button mode (momentary: act on the down, ignore the 0 release;
+        # toggle: every alternating edge is its own press). Without it a momentary
+        # bool slot toggles twice per press (net nothing); with a 127-only guard a
+        # toggle-hardware button fires every *other* press.
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 3, value, "button_ch9_41_note__mode_shift_mode_button3_listener")
+        
+    
+    def button_ch9_43_note__mode_shift_mode_button4_listener(self, value):
+        self.log_message(f"calling : button_ch9_43_note__mode_shift_mode_button4_listener")
+        self._helpers.button_event("button_ch9_43_note__mode_shift_mode_button4_listener", value)
+        device = self.find_device("selected", "selected")
+        if device is None:
+            self.log_message(f"device not found: selected - selected")
+            return
+        self._hud_client.send_ping()
+        # Switch slots act once per press. The edge guard adapts to the controller's
+        # hardware button mode (momentary: act on the down, ignore the 0 release;
+        # toggle: every alternating edge is its own press). Without it a momentary
+        # bool slot toggles twice per press (net nothing); with a 127-only guard a
+        # toggle-hardware button fires every *other* press.
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.switch_slot_action(device, 4, value, "button_ch9_43_note__mode_shift_mode_button4_listener")
+        
+    
+    # function_record_midi_from_track_to_new_track_ch9_12_note
+    def button_ch9_12_note__mode_shift_mode_fn_record_midi_from_track_to_new_track_listener(self, value):
+        self._helpers.button_event('button_ch9_12_note__mode_shift_mode_fn_record_midi_from_track_to_new_track_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch9_12_note__mode_shift_mode_fn_record_midi_from_track_to_new_track_listener (function_record_midi_from_track_to_new_track_ch9_12_note) callee = self.functions.record_midi_from_track_to_new_track(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch9_12_note__mode_shift_mode_fn_record_midi_from_track_to_new_track_listener']
+        self._previous_values['button_ch9_12_note__mode_shift_mode_fn_record_midi_from_track_to_new_track_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.functions.record_midi_from_track_to_new_track()
+        self._hud_client.send_ping()
+        
+    
+    # function_create_audio_track_taking_input_from_selected_track_ch9_37_note
+    def button_ch9_37_note__mode_shift_mode_fn_create_audio_track_taking_input_from_selected_track_listener(self, value):
+        self._helpers.button_event('button_ch9_37_note__mode_shift_mode_fn_create_audio_track_taking_input_from_selected_track_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch9_37_note__mode_shift_mode_fn_create_audio_track_taking_input_from_selected_track_listener (function_create_audio_track_taking_input_from_selected_track_ch9_37_note) callee = self.functions.create_audio_track_taking_input_from_selected_track(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch9_37_note__mode_shift_mode_fn_create_audio_track_taking_input_from_selected_track_listener']
+        self._previous_values['button_ch9_37_note__mode_shift_mode_fn_create_audio_track_taking_input_from_selected_track_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.functions.create_audio_track_taking_input_from_selected_track()
+        self._hud_client.send_ping()
+        
+    
+    # function_selected_audio_to_simpler_in_new_track_ch9_38_note
+    def button_ch9_38_note__mode_shift_mode_fn_selected_audio_to_simpler_in_new_track_listener(self, value):
+        self._helpers.button_event('button_ch9_38_note__mode_shift_mode_fn_selected_audio_to_simpler_in_new_track_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch9_38_note__mode_shift_mode_fn_selected_audio_to_simpler_in_new_track_listener (function_selected_audio_to_simpler_in_new_track_ch9_38_note) callee = self.functions.selected_audio_to_simpler_in_new_track(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch9_38_note__mode_shift_mode_fn_selected_audio_to_simpler_in_new_track_listener']
+        self._previous_values['button_ch9_38_note__mode_shift_mode_fn_selected_audio_to_simpler_in_new_track_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.functions.selected_audio_to_simpler_in_new_track()
+        self._hud_client.send_ping()
+        
+    
+    # function_clip_extend_ch3_117_CC
+    def button_ch3_117_CC__mode_shift_mode_fn_clip_extend_listener(self, value):
+        self._helpers.button_event('button_ch3_117_CC__mode_shift_mode_fn_clip_extend_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch3_117_CC__mode_shift_mode_fn_clip_extend_listener (function_clip_extend_ch3_117_CC) callee = self.functions.clip_extend(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch3_117_CC__mode_shift_mode_fn_clip_extend_listener']
+        self._previous_values['button_ch3_117_CC__mode_shift_mode_fn_clip_extend_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.functions.clip_extend()
+        self._hud_client.send_ping()
+        
+    
+    # function_clip_delete_end_ch3_116_CC
+    def button_ch3_116_CC__mode_shift_mode_fn_clip_delete_end_listener(self, value):
+        self._helpers.button_event('button_ch3_116_CC__mode_shift_mode_fn_clip_delete_end_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch3_116_CC__mode_shift_mode_fn_clip_delete_end_listener (function_clip_delete_end_ch3_116_CC) callee = self.functions.clip_delete_end(), value is {value}")
+    
+        previous_value = self._previous_values['button_ch3_116_CC__mode_shift_mode_fn_clip_delete_end_listener']
+        self._previous_values['button_ch3_116_CC__mode_shift_mode_fn_clip_delete_end_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self.functions.clip_delete_end()
+        self._hud_client.send_ping()
+        
+    
+    # ch3_no115_CC__pager_encoder_inc
+    def button_ch3_115_CC__mode_shift_mode_pager_encoder_inc_listener(self, value):
+        self._helpers.button_event('button_ch3_115_CC__mode_shift_mode_pager_encoder_inc_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch3_115_CC__mode_shift_mode_pager_encoder_inc_listener (ch3_no115_CC__pager_encoder_inc) callee = self._helpers.parameter_page_inc('encoder'), value is {value}")
+    
+        previous_value = self._previous_values['button_ch3_115_CC__mode_shift_mode_pager_encoder_inc_listener']
+        self._previous_values['button_ch3_115_CC__mode_shift_mode_pager_encoder_inc_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.parameter_page_inc('encoder')
+        self._hud_client.send_ping()
+        
+    
+    # ch3_no114_CC__pager_encoder_dec
+    def button_ch3_114_CC__mode_shift_mode_pager_encoder_dec_listener(self, value):
+        self._helpers.button_event('button_ch3_114_CC__mode_shift_mode_pager_encoder_dec_listener', value)
+        if self.manager.debug:
+            self.log_message(f"button_ch3_114_CC__mode_shift_mode_pager_encoder_dec_listener (ch3_no114_CC__pager_encoder_dec) callee = self._helpers.parameter_page_dec('encoder'), value is {value}")
+    
+        previous_value = self._previous_values['button_ch3_114_CC__mode_shift_mode_pager_encoder_dec_listener']
+        self._previous_values['button_ch3_114_CC__mode_shift_mode_pager_encoder_dec_listener'] = value
+    
+        if self._helpers.should_act_on_edge(value):
+            self._helpers.parameter_page_dec('encoder')
+        self._hud_client.send_ping()
+        
+
+
+    def goto_mode(self, next_mode_name):
+        self.log_message(f'switching to {next_mode_name}')
+        next_mode = self._modes[next_mode_name]
+        self.log_message(f'next mode: {next_mode}')
+        self.remove_all_listeners(modes_only=True)
+        self._modes[next_mode_name]['add_listeners_fn']()
+
+        # The secondary of an lc_parks composition has modes but no physical
+        # mode-button (its FSM is driven remotely via mode_link), so guard the
+        # LED feedback.
+        if self.mode_button is not None:
+            if next_mode['color'] is not None:
+                self.mode_button.send_value(next_mode['color'])
+            else:
+                self.mode_button.send_value(0)
+
+        self.current_mode = next_mode
+
+        # HUD: refresh labels for the new mode's bindings (mixer/functions/etc.).
+        # Device-bound slots are repopulated by the next selected_device_changed.
+        # Trace the order of refresh_hud_for_mode -> send_mode -> mode_sender:
+        # a stray MODE/HIDE interleave here is order-dependent, so a [hudtrace]
+        # capture needs to see these three sends in the order they actually fire.
+        self.fine(f"[mode] goto_mode {next_mode_name!r} is_shift={next_mode['is_shift']} -> refresh_hud_for_mode")
+        self._helpers.refresh_hud_for_mode(next_mode_name, self.selected_device())
+
+        self.fine(f"[mode] goto_mode {next_mode_name!r} -> send_mode({next_mode['is_shift']})")
+        self._hud_client.send_mode(next_mode['is_shift'])
+
+        # Compositor primary only: forward the active mode name to the secondary
+        # so holding shift on the primary also switches the secondary's mappings.
+        if self._mode_sender is not None:
+            self._mode_sender.send_mode(next_mode['name'])
+
+        self.manager.show_message(f'Switched to {next_mode_name}')
+
+    def device_parameter_action(self, device, parameter_no, midi_no, value, fn_name, toggle=False):
+        self._helpers.device_parameter_action(device, parameter_no, midi_no, value, fn_name, toggle)
+
+    def find_device(self, track_name, device_name):
+        return self._helpers.find_device(self._song, track_name, device_name)
+
+
+    def mode_button_listener(self, value):
+        self.log_message(f'mode_button_listener: {value}, current mode is {self.current_mode}')
+
+        if self.current_mode['is_shift']:
+            # Level-driven, self-healing shift: a press (127) means "be in the
+            # shift mode", a release (0) means "be in the base mode". This is
+            # idempotent per level, so a dropped or duplicated MIDI edge (e.g. a
+            # lost note-off) can NOT permanently invert the button — the next
+            # clean press/release re-syncs. The old "advance to next mode on every
+            # edge" logic assumed perfect 127,0,127,0 alternation, so one missed
+            # release flipped rest-state to shift forever. Assumes a 2-mode shift
+            # (base + shift), the only sensible config for a held button; every
+            # shift surface uses exactly two modes.
+            in_base = self.current_mode['name'] == self._first_mode
+            if value == 127:
+                self.fine(f"[mode] mode_button_listener value=127 branch=shift-press in_base={in_base}")
+                if in_base:
+                    self.goto_mode(self.current_mode['next_mode_name'])
+            else:
+                self.fine(f"[mode] mode_button_listener value=0 branch=shift-release in_base={in_base}")
+                if not in_base:
+                    # Return to base directly (not "next"), so this is correct
+                    # regardless of how the FSM got here.
+                    self.goto_mode(self._first_mode)
+                    self.fine("[mode] mode_button_listener shift-release -> send_mode(False)")
+                    self._hud_client.send_mode(False)
+        else:
+            # Switch-type: each press cycles to the next mode.
+            if value == 127:
+                self.fine(f"[mode] mode_button_listener value=127 branch=switch-press cur={self.current_mode['name']!r}")
+                self.goto_mode(self.current_mode['next_mode_name'])
+
+    def on_device_selected(self):
+        # Live's appointed_device listener. If this line lands between a nav
+        # method's enter/post-scroll lines, scroll_view fired it synchronously,
+        # racing selected_device_changed's same-device guard. source defaults
+        # to 'selection'.
+        self.fine(f"[listener] on_device_selected dev={getattr(self.selected_device(),'name',None)!r}")
+        self._helpers.selected_device_changed(self.selected_device())
+
+    def on_selected_track_changed(self):
+        ### This is called when the selected track changes
+        self.fine(f"[listener] on_selected_track_changed dev={getattr(self.selected_device(),'name',None)!r}")
+        # Follow the new track's device chain (see _attach_track_devices_listener).
+        self._attach_track_devices_listener()
+        self._helpers.selected_device_changed(self.selected_device())
\ No newline at end of file
@@ -0,0 +1,202 @@
+"""Name -> track and (track, name) -> device indexes for named-target mappings.
+
+A mapping bound to a named track/device (`track: Bass`, `device: Echo`) calls
+`Helpers.find_device` on every CC, which used to walk `song.tracks` comparing
+names and then walk `track.devices` the same way -- a string compare per track
+per encoder tick, ~120 of them in a large set. `NameIndex` answers both from
+dicts instead.
+
+The dicts are kept honest by Live's listeners, not by rescanning:
+
+- `song.tracks` and every track's `name` mark the track index stale;
+- a track's `devices` and each of its devices' `name` mark that track's
+  device index stale.
+
+Listeners only mark; the index is rebuilt (and its listeners re-attached) on
+the next lookup, so a burst of renames or a set load costs one rebuild, and
+nothing is attached or detached from inside a Live notification.
+
+Lookups keep the old first-match-wins semantics. A hit is re-checked against
+the object's current name (one compare) so a missed notification or a dead
+handle costs a rebuild, never a wrong target. A song or track that can't be
+watched is never cached: each lookup scans, exactly as before.
+"""
+import logging
+
+logger = logging.getLogger("name-index")
+
+
+def live_key(obj):
+    """Dict key for a Live object. Live hands out a fresh Python wrapper per
+    access; `_live_ptr` is the stable identity of the underlying object. Fakes
+    fall back to id(), so callers keep a reference to whatever they key."""
+    ptr = getattr(obj, '_live_ptr', None)
+    return ptr if ptr is not None else id(obj)
+
+
+def _first_by_name(objs):
+    index = {}
+    for obj in objs:
+        if obj is None:
+            continue
+        try:
+            index.setdefault(obj.name, obj)
+        except Exception:
+            continue
+    return index
+
+
+def _named(obj, name):
+    try:
+        return obj.name == name
+    except Exception:
+        return False
+
+
+def _same(a, b):
+    if a is b:
+        return True
+    try:
+        return a is not None and b is not None and a == b
+    except Exception:
+        return False
+
+
+class ListenerSet:
+    """Live-style (subject, property, callback) listener attachments, detached
+    together by `clear()`. Shared with nav.TrackPositions."""
+
+    def __init__(self):
+        self._attached = []
+
+    def add(self, subject, prop, callback):
+        getattr(subject, f'add_{prop}_listener')(callback)
+        self._attached.append((subject, prop, callback))
+
+    def clear(self):
+        for subject, prop, callback in self._attached:
+            try:
+                if getattr(subject, f'{prop}_has_listener')(callback):
+                    getattr(subject, f'remove_{prop}_listener')(callback)
+            except Exception:
+                pass  # deleted track/device: its listeners went with it
+        self._attached = []
+
+
+class _TrackDevices:
+    __slots__ = ('track', 'index', 'listeners')
+
+    def __init__(self, track):
+        self.track = track          # held so an id() key stays unique
+        self.index = None           # device name -> device; None = stale
+        self.listeners = ListenerSet()
+
+
+class NameIndex:
+    def __init__(self):
+        self._song = None
+        self._tracks = None         # track name -> track; None = stale
+        self._song_listeners = ListenerSet()
+        self._devices = {}          # track key -> _TrackDevices
+        self._devices_stale = False
+        self.builds = 0
+        self.invalidations = 0
+
+    def track(self, song, name):
+        """First track of `song` named `name`, or None."""
+        track = self._track_index(song).get(name)
+        if track is not None and not _named(track, name):
+            self._invalidate_tracks()
+            track = self._track_index(song).get(name)
+        return track
+
+    def device(self, track, name):
+        """First device on `track` named `name`, or None."""
+        device = self._device_index(track).get(name)
+        if device is not None and not _named(device, name):
+            self._invalidate_devices(live_key(track))
+            device = self._device_index(track).get(name)
+        return device
+
+    def release(self):
+        """Detach every listener and forget both indexes (song changed,
+        surface disconnect)."""
+        self._song_listeners.clear()
+        self._song = None
+        self._tracks = None
+        self._release_devices()
+
+    # -- tracks --------------------------------------------------------------
+
+    def _track_index(self, song):
+        if not _same(song, self._song):
+            self.release()
+            self._song = song
+        if self._tracks is not None:
+            return self._tracks
+        self._song_listeners.clear()
+        tracks = list(song.tracks)
+        index = _first_by_name(tracks)
+        self.builds += 1
+        try:
+            self._song_listeners.add(song, 'tracks', self._on_tracks_changed)
+            for track in tracks:
+                if track is not None:
+                    self._song_listeners.add(track, 'name', self._invalidate_tracks)
+        except Exception:
+            # Nothing would tell us the index went stale: don't keep it.
+            self._song_listeners.clear()
+            return index
+        self._tracks = index
+        return index
+
+    def _on_tracks_changed(self):
+        self._invalidate_tracks()
+        # Device indexes of deleted tracks are dropped on the next lookup.
+        self._devices_stale = True
+
+    def _invalidate_tracks(self):
+        if self._tracks is not None:
+            self.invalidations += 1
+        self._tracks = None
+
+    # -- devices -------------------------------------------------------------
+
+    def _device_index(self, track):
+        if self._devices_stale:
+            self._release_devices()
+        key = live_key(track)
+        entry = self._devices.get(key)
+        if entry is not None and entry.index is not None:
+            return entry.index
+        if entry is None:
+            entry = _TrackDevices(track)
+        entry.listeners.clear()
+        devices = list(track.devices)
+        index = _first_by_name(devices)
+        self.builds += 1
+        stale = lambda: self._invalidate_devices(key)
+        try:
+            entry.listeners.add(track, 'devices', stale)
+            for device in devices:
+                if device is not None:
+                    entry.listeners.add(device, 'name', stale)
+        except Exception:
+            entry.listeners.clear()
+            self._devices.pop(key, None)
+            return index
+        entry.index = index
+        self._devices[key] = entry
+        return index
+
+    def _invalidate_devices(self, key):
+        entry = self._devices.get(key)
+        if entry is not None and entry.index is not None:
+            self.invalidations += 1
+            entry.index = None
+
+    def _release_devices(self):
+        for entry in self._devices.values():
+            entry.listeners.clear()
+        self._devices = {}
+        self._devices_stale = False
@@ -0,0 +1,36 @@
+"""UDP receiver for the secondary surface's forwarded HUD region.
+
+Binds a loopback port that the parks (secondary) surface points its HudClient at.
+Incoming datagrams are fed to a `RegionState`, which caches/relays them into the
+lc_parks compositor's single HUD stream. Polled by the surface's `IoHub`, like
+`OSCListener`.
+"""
+import socket
+import traceback
+
+from .io_hub import IoHub
+
+
+class RegionListener:
+    def __init__(self, manager, region_state, port, name="region", hub=None):
+        self._manager = manager
+        self._region_state = region_state
+        self._name = name
+        self._socket = None
+        try:
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self._socket.bind(('127.0.0.1', port))
+            self.log_message(f"{name}: HUD region listener on port {port}")
+            # 64K reads: the secondary coalesces each region burst into one
+            # datagram; a read shorter than the datagram truncates it (UDP),
+            # which would drop the burst's trailing COMMIT.
+            hub = hub if hub is not None else IoHub(manager, name=name)
+            hub.register(self._socket, self.on_datagram, bufsize=65536, label=name)
+        except Exception:
+            self.log_message(f"{name}: region listener socket error on port {port}: {traceback.format_exc()}")
+
+    def log_message(self, msg):
+        self._manager.log_message(msg)
+
+    def on_datagram(self, data, _addr):
+        self._region_state.handle_datagram(data)
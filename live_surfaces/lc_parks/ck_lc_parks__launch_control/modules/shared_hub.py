@@ -0,0 +1,150 @@
+"""Process-wide resources shared by co-loaded generated surfaces.
+
+Every generated surface runs in the same Live Python interpreter, but each is
+its own package with its own copy of these modules — so a plain module-level
+cache here would still be one cache per surface. The registry therefore lives
+on a synthetic module in `sys.modules`, which every surface's copy of
+`shared_hub` finds under the same name.
+
+What is shared is plain data or a plain socket, never an object of one
+surface's classes (another surface may have been generated from a different
+tree):
+
+- the UDP send socket the HudClients write through (each surface keeps its own
+  HudClient: owner gate, delta shadow and negotiated capabilities are
+  per-surface state, only the socket is common);
+- one compiled device table / zone table per unique baked mapping;
+- one bank index per unique `live_device_banks.py`, read without importing it
+  again when another surface already has it.
+
+Entries are reference-counted. A surface acquires through its `SurfaceShare`
+and calls `release_all()` on disconnect/reload; the last release closes the
+socket and drops the tables.
+"""
+import hashlib
+import json
+import socket
+import sys
+import threading
+import types
+from pathlib import Path
+
+from .param_resolver import _build_device_table, _build_zone_tables, _load_bundled_banks
+
+_REGISTRY_MODULE = '_acsac_shared_hub'
+
+# Bump when the compiled table shapes change, so surfaces generated from an
+# older tree never pick up tables compiled by a newer one (or vice versa).
+TABLE_FORMAT = 1
+
+
+def _registry():
+    mod = sys.modules.get(_REGISTRY_MODULE)
+    if mod is None:
+        mod = types.ModuleType(_REGISTRY_MODULE)
+        mod.entries = {}  # key -> [value, refcount, closer]
+        mod.lock = threading.Lock()
+        sys.modules[_REGISTRY_MODULE] = mod
+    return mod
+
+
+def acquire(key, factory, closer=None):
+    """The shared value for `key`, created with `factory()` on first use.
+    Each call takes one reference; pair it with `release(key)`."""
+    reg = _registry()
+    with reg.lock:
+        entry = reg.entries.get(key)
+        if entry is None:
+            entry = [factory(), 0, closer]
+            reg.entries[key] = entry
+        entry[1] += 1
+        return entry[0]
+
+
+def release(key):
+    """Drop one reference; the last one closes (if a closer was given) and
+    forgets the value."""
+    reg = _registry()
+    with reg.lock:
+        entry = reg.entries.get(key)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+        del reg.entries[key]
+    value, _refs, closer = entry
+    if closer is not None:
+        try:
+            closer(value)
+        except Exception:
+            pass
+
+
+def stats():
+    """{key: refcount} for every live entry."""
+    reg = _registry()
+    with reg.lock:
+        return {key: entry[1] for key, entry in reg.entries.items()}
+
+
+def _digest(raw):
+    # Baked mappings are JSON-shaped (they come from json.loads in gen.py), so
+    # a canonical dump identifies equal configs across surfaces.
+    blob = json.dumps(raw, sort_keys=True, separators=(',', ':'), default=repr)
+    return hashlib.sha1(blob.encode('utf-8')).hexdigest()
+
+
+def _bank_file():
+    # Shipped next to this module in a generated surface (see
+    # param_resolver._load_bundled_banks); absent when running from the repo.
+    path = Path(__file__).with_name('live_device_banks.py')
+    return path if path.exists() else None
+
+
+class SurfaceShare:
+    """One surface's handle on the shared registry. Remembers every key it
+    acquired so `release_all` drops exactly this surface's references."""
+
+    def __init__(self):
+        self._held = []
+
+    def _acquire(self, key, factory, closer=None):
+        value = acquire(key, factory, closer)
+        self._held.append(key)
+        return value
+
+    def udp_socket(self):
+        """The process-wide UDP send socket (unconnected: every sender passes
+        its own destination to `sendto`)."""
+        return self._acquire(('udp-send',), lambda: socket.socket(socket.AF_INET, socket.SOCK_DGRAM),
+                             closer=lambda s: s.close())
+
+    def device_table(self, raw):
+        if not raw:
+            return _build_device_table(raw)
+        return self._acquire(('device-table', TABLE_FORMAT, _digest(raw)),
+                             lambda: _build_device_table(raw))
+
+    def zone_tables(self, raw):
+        if not raw:
+            return _build_zone_tables(raw)
+        return self._acquire(('zone-tables', TABLE_FORMAT, _digest(raw)),
+                             lambda: _build_zone_tables(raw))
+
+    def banks(self):
+        """(DEVICE_BANKS, BANK_NAMES). Keyed by the bank file's content, so a
+        surface whose copy matches one already loaded skips importing it."""
+        path = _bank_file()
+        if path is None:
+            return _load_bundled_banks()
+        try:
+            digest = hashlib.sha1(path.read_bytes()).hexdigest()
+        except OSError:
+            return _load_bundled_banks()
+        return self._acquire(('banks', digest), _load_bundled_banks)
+
+    def release_all(self):
+        held, self._held = self._held, []
+        for key in held:
+            release(key)
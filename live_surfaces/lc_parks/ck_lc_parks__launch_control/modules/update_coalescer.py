@@ -0,0 +1,163 @@
+"""Per-slot coalescing of live parameter updates.
+
+A knob sweep on a 16-encoder controller fires `Remote.parameter_updated` once
+per incoming CC — hundreds of times a second, each one a HUD UPDATE datagram
+plus an OSC `/selected-device/parameter-update`, all sent from Live's main
+thread. Only the *latest* value per slot is worth anything by the time the HUD
+repaints, so `UpdateCoalescer` keeps exactly that: one pending HUD UPDATE per
+(kind, wire index) and one pending OSC message per parameter number,
+overwritten in place. A `schedule_message` tick loop (same pattern as
+`OSCListener`/`RegionListener`) flushes them — all HUD UPDATEs as a single
+datagram via `HudClient.send_updates`, then the OSC messages.
+
+Pending updates are dropped, not flushed, when a burst or HIDE supersedes them
+(`discard_hud` / `discard`): a burst repaints every slot from live values, and a
+stale UPDATE landing after a device change would patch the new device's slot by
+index with the old device's value.
+
+`NullUpdateCoalescer` is the pass-through default: `Remote` built without a
+coalescer sends every update immediately, exactly as before.
+"""
+import logging
+import time
+import traceback
+
+from .latency_stats import STATS
+
+logger = logging.getLogger("update-coalescer")
+
+PARAMETER_UPDATE_ADDRESS = "/selected-device/parameter-update"
+
+
+class UpdateCoalescer:
+    def __init__(self, manager, hud_client, osc_client, max_rate_hz=None, clock=None):
+        """`max_rate_hz` caps flushes per second on top of the tick cadence;
+        None flushes on every tick. `clock` is injectable for tests."""
+        self._manager = manager
+        self._hud_client = hud_client
+        self._osc_client = osc_client
+        self._min_interval = (1.0 / max_rate_hz) if max_rate_hz else 0.0
+        self._clock = clock or time.monotonic
+        self._last_flush = None
+        # Insertion-ordered dicts: a re-offered key keeps its original position,
+        # so the flushed datagram is stable slot order, not sweep order.
+        self._pending_hud = {}
+        self._pending_osc = {}
+        # perf_counter() of the oldest update still pending (None when empty):
+        # its age at flush is the `update_wait` latency sample.
+        self._pending_since = None
+        self._closed = False
+        self.reset_stats()
+        try:
+            self._manager.schedule_message(1, self.tick)
+        except Exception:
+            logger.error(f"UpdateCoalescer: failed to schedule tick: {traceback.format_exc()}")
+
+    def reset_stats(self):
+        # offered   -- updates handed to the coalescer
+        # collapsed -- updates overwritten before they were sent
+        # discarded -- pending updates dropped by a superseding burst/HIDE
+        # sent      -- updates that reached a client
+        # flushes   -- non-empty flushes (one HUD datagram each)
+        self.offered = 0
+        self.collapsed = 0
+        self.discarded = 0
+        self.sent = 0
+        self.flushes = 0
+
+    def stats(self):
+        return {
+            'offered': self.offered,
+            'collapsed': self.collapsed,
+            'discarded': self.discarded,
+            'sent': self.sent,
+            'flushes': self.flushes,
+        }
+
+    def send_update(self, kind, index, *fields):
+        """Same arguments as `HudClient.send_update` (name, value, vmin, vmax
+        [, glyph]); only the latest per (kind, index) is kept."""
+        self._offer(self._pending_hud, (kind, index), (kind, index) + fields)
+
+    def send_parameter_update(self, parameter_no, args):
+        self._offer(self._pending_osc, parameter_no, args)
+
+    def _offer(self, pending, key, entry):
+        if self._pending_since is None:
+            self._pending_since = time.perf_counter()
+        self.offered += 1
+        if key in pending:
+            self.collapsed += 1
+        pending[key] = entry
+
+    def discard_hud(self):
+        """Drop pending HUD UPDATEs (a burst or HIDE is about to supersede them)."""
+        self.discarded += len(self._pending_hud)
+        self._pending_hud = {}
+
+    def discard(self):
+        """Drop everything pending (device changed: both sinks get a full resend)."""
+        self.discard_hud()
+        self.discarded += len(self._pending_osc)
+        self._pending_osc = {}
+        self._pending_since = None
+
+    def flush(self):
+        hud, self._pending_hud = self._pending_hud, {}
+        osc, self._pending_osc = self._pending_osc, {}
+        since, self._pending_since = self._pending_since, None
+        if not hud and not osc:
+            return
+        t0 = time.perf_counter()
+        if since is not None:
+            STATS.record('update_wait', since)
+        self.flushes += 1
+        self._last_flush = self._clock()
+        if hud:
+            self._hud_client.send_updates(list(hud.values()))
+        for args in osc.values():
+            self._osc_client.send_message(PARAMETER_UPDATE_ADDRESS, args)
+        self.sent += len(hud) + len(osc)
+        STATS.record('update_flush', t0)
+
+    def _due(self):
+        if self._last_flush is None or not self._min_interval:
+            return True
+        return self._clock() - self._last_flush >= self._min_interval
+
+    def close(self):
+        """Drop what is pending and stop the tick loop (reload, disconnect):
+        the clients it would flush into are being replaced or closed."""
+        self.discard()
+        self._closed = True
+
+    def tick(self):
+        if self._closed:
+            return
+        try:
+            if self._due():
+                self.flush()
+        except Exception:
+            logger.error(f"UpdateCoalescer.tick: {traceback.format_exc()}")
+        self._manager.schedule_message(1, self.tick)
+
+
+class NullUpdateCoalescer:
+    # Pass-through: same interface, but every update goes straight out.
+    def __init__(self, hud_client, osc_client):
+        self._hud_client = hud_client
+        self._osc_client = osc_client
+
+    def reset_stats(self): pass
+    def stats(self): return {}
+
+    def send_update(self, kind, index, *fields):
+        self._hud_client.send_update(kind, index, *fields)
+
+    def send_parameter_update(self, parameter_no, args):
+        self._osc_client.send_message(PARAMETER_UPDATE_ADDRESS, args)
+
+    def discard_hud(self): pass
+    def discard(self): pass
+    def flush(self): pass
+    def close(self): pass
@@ -0,0 +1,3 @@
+#!/usr/bin/env bash
+
+tail -f ~/Library/Preferences/Ableton/*/Log.txt
\ No newline at end of file
@@ -0,0 +1,5 @@
+### Script Generated by Control Surface Studio for Python 3 (resorted to default: no)
+from .ck_lc_parks__parks import ck_lc_parks__parks
+
+def create_instance(c_instance):
+    return ck_lc_parks__parks(c_instance)
\ No newline at end of file
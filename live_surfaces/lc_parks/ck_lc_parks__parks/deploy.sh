@@ -0,0 +1,7 @@
+export ABLETON_APP="/Applications/Ableton Live 12 Suite.app"
+
+export SCRIPTS_HOME="$ABLETON_APP/Contents/App-Resources/MIDI Remote Scripts"
+echo "Copying files to $SCRIPTS_HOME/ck_lc_parks__parks"
+mkdir -p "$SCRIPTS_HOME/ck_lc_parks__parks/modules" && \
+cp *.py "$SCRIPTS_HOME/ck_lc_parks__parks/" && \
+cp -R modules/. "$SCRIPTS_HOME/ck_lc_parks__parks/modules/"
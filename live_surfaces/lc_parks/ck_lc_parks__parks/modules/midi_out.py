@@ -0,0 +1,188 @@
+"""Per-surface MIDI-out queue for the SysEx feedback sinks.
+
+`Ec4Client` and `GridLedClient` used to call `manager._send_midi` from inside
+`Remote.refresh_burst`, so every device burst waited on their MIDI writes (an
+EC4 keyframe is ~200 bytes, a dense Grid frame ~150) in sink order before the
+HUD datagram was flushed, and two sinks writing in the same tick interleaved on
+the port however the burst happened to order them.
+
+`MidiOutQueue` takes those writes off the burst: a sink `send`s a finished
+message, which is only appended to a FIFO, and the surface's `schedule_message`
+tick loop (same pattern as `UpdateCoalescer`) writes them out on the next tick,
+oldest first, up to `budget` bytes per tick. Per message, a sink says how it
+relates to what is still pending from it:
+
+- `supersede=True` -- the message carries the sink's whole state (an EC4 full
+  write, a dense Grid frame): every message of that sink still queued is
+  obsolete and is dropped;
+- `key=...`        -- replaces a still-queued message of the same sink and key
+  in place (keeps its queue position);
+- neither          -- appended (partial writes that build on each other, like
+  EC4 runs and Grid deltas, must all arrive, in order).
+
+Sends fail on the tick now, not in the sink, so the sink's `on_error` callback
+runs there (both sinks use it to forget their shadow of the hardware and
+rewrite it in full next time).
+
+Queue latency is recorded as the `midi_wait` stage (enqueue to write) and the
+bytes written as the `midi_bytes` counter. `NullMidiOut` is the pass-through
+default: a sink built without a queue writes immediately, exactly as before.
+"""
+import collections
+import logging
+import time
+import traceback
+
+from .latency_stats import STATS
+
+logger = logging.getLogger("midi-out")
+
+# Bytes written per tick. Live ticks at ~100ms; 1 KB/tick is well inside a
+# USB-MIDI port and several full EC4 + Grid writes, yet bounds how long one tick
+# can spend writing when sinks pile up. A message larger than the budget still
+# goes out alone at the head of a tick.
+DEFAULT_BUDGET = 1024
+
+
+def _log(manager, text):
+    try:
+        manager.log_message(text)
+    except Exception:
+        logger.error(text)
+
+
+def _send_now(manager, payload, owner, on_error):
+    try:
+        manager._send_midi(payload)
+        return True
+    except Exception as e:
+        # Route through the surface log so a bad send path is visible in
+        # tail_logs.sh, not just python logging.
+        _log(manager, f"{type(owner).__name__} MIDI send failed: {e}")
+        if on_error is not None:
+            try:
+                on_error()
+            except Exception:
+                pass
+        return False
+
+
+class MidiOutQueue:
+    def __init__(self, manager, budget=DEFAULT_BUDGET):
+        self._manager = manager
+        self._budget = budget
+        # [owner, key, payload, on_error, perf_counter() at enqueue]
+        self._items = collections.deque()
+        self._closed = False
+        self.reset_stats()
+        try:
+            self._manager.schedule_message(1, self.tick)
+        except Exception:
+            logger.error(f"MidiOutQueue: failed to schedule tick: {traceback.format_exc()}")
+
+    def reset_stats(self):
+        # queued     -- messages accepted
+        # replaced   -- queued messages overwritten by a same-key message
+        # superseded -- queued messages dropped by a full-state message
+        # sent       -- messages written
+        # errors     -- failed writes
+        # deferred   -- ticks that left messages queued (budget spent)
+        # high_water -- deepest the queue has been
+        self.queued = 0
+        self.replaced = 0
+        self.superseded = 0
+        self.sent = 0
+        self.errors = 0
+        self.deferred = 0
+        self.high_water = 0
+
+    def stats(self):
+        return {
+            'depth': len(self._items),
+            'high_water': self.high_water,
+            'queued': self.queued,
+            'replaced': self.replaced,
+            'superseded': self.superseded,
+            'sent': self.sent,
+            'errors': self.errors,
+            'deferred': self.deferred,
+        }
+
+    def send(self, owner, payload, key=None, supersede=False, on_error=None):
+        """Queue one complete MIDI message (a tuple of bytes) from `owner`."""
+        if self._closed:
+            return
+        payload = tuple(payload)
+        self.queued += 1
+        if supersede:
+            kept = [item for item in self._items if item[0] is not owner]
+            self.superseded += len(self._items) - len(kept)
+            if len(kept) != len(self._items):
+                self._items.clear()
+                self._items.extend(kept)
+        elif key is not None:
+            for item in self._items:
+                if item[0] is owner and item[1] == key:
+                    item[2], item[3] = payload, on_error
+                    self.replaced += 1
+                    return
+        self._items.append([owner, key, payload, on_error, time.perf_counter()])
+        if len(self._items) > self.high_water:
+            self.high_water = len(self._items)
+
+    def discard(self, owner):
+        """Drop every still-queued message of `owner`."""
+        kept = [item for item in self._items if item[0] is not owner]
+        self._items.clear()
+        self._items.extend(kept)
+
+    def flush(self, budget=None):
+        """Write queued messages oldest first until `budget` bytes are spent
+        (None = the queue's own budget; 0 = no limit)."""
+        budget = self._budget if budget is None else budget
+        spent = 0
+        while self._items:
+            owner, _key, payload, on_error, since = self._items[0]
+            if budget and spent and spent + len(payload) > budget:
+                self.deferred += 1
+                return
+            self._items.popleft()
+            STATS.record('midi_wait', since)
+            if _send_now(self._manager, payload, owner, on_error):
+                self.sent += 1
+                spent += len(payload)
+                STATS.add('midi_bytes', len(payload))
+            else:
+                self.errors += 1
+
+    def close(self):
+        """Write everything still queued and stop accepting (disconnect)."""
+        try:
+            self.flush(budget=0)
+        finally:
+            self._closed = True
+
+    def tick(self):
+        if self._closed:
+            return
+        try:
+            self.flush()
+        except Exception:
+            logger.error(f"MidiOutQueue.tick: {traceback.format_exc()}")
+        self._manager.schedule_message(1, self.tick)
+
+
+class NullMidiOut:
+    # Pass-through: same interface, but every message is written immediately.
+    def __init__(self, manager):
+        self._manager = manager
+
+    def reset_stats(self): pass
+    def stats(self): return {}
+
+    def send(self, owner, payload, key=None, supersede=False, on_error=None):
+        _send_now(self._manager, tuple(payload), owner, on_error)
+
+    def discard(self, owner): pass
+    def flush(self, budget=None): pass
+    def close(self): pass
@@ -9,82 +9,44 @@ import time
 
 from .extensions import parsers, sample_categories, synth_categories
 from .hud_name import hud_name
+from .nav import TrackPositions
 
 primes = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71]
 
 class TrackNav(ControlSurfaceComponent):
+    # Visible tracks, returns, master, wrapping round to the first track.
     def __init__(self, ins, song):
         ControlSurfaceComponent.__init__(self)
         self._manager = ins
         self._song = song
+        self._positions = TrackPositions(song)
+
+    def disconnect(self):
+        self._positions.release()
+        ControlSurfaceComponent.disconnect(self)
 
     def log_message(self, message):
         self._manager.log_message(message)
 
-    def track_nav_inc(self):
-        all_tracks = len(self._song.visible_tracks)
+    def _select(self, n, wrap):
         selected_track = self._song.view.selected_track
+        target = self._positions.step(selected_track, n, wrap)
+        if target is not None and target != selected_track:
+            self._song.view.selected_track = target
 
-        next_index = 1
-        is_return_track = selected_track in self._song.return_tracks
-        is_main_track = selected_track == self._song.master_track
-
-        if is_main_track and len(self._song.visible_tracks) > 0:
-            self._song.view.selected_track = self._song.visible_tracks[0]
-        elif not is_return_track:
-            next_index = list(self._song.visible_tracks).index(selected_track) + 1
-            if next_index < all_tracks:
-                self._song.view.selected_track = self._song.visible_tracks[next_index]
-            elif next_index == all_tracks and len(self._song.return_tracks) > 0:
-                self._song.view.selected_track = self._song.return_tracks[0]
-        elif is_return_track:
-            next_index = list(self._song.return_tracks).index(selected_track) + 1
-            if next_index < len(self._song.return_tracks):
-                self._song.view.selected_track = self._song.return_tracks[next_index]
-            elif next_index == len(self._song.return_tracks):
-                self._song.view.selected_track = self._song.master_track
+    def track_nav_inc(self):
+        self._select(1, wrap=True)
 
     def track_nav_dec(self):
-        all_tracks = len(self._song.visible_tracks)
-        selected_track = self._song.view.selected_track
-
-        next_index = 1
-        is_return_track = selected_track in self._song.return_tracks
-        is_main_track = selected_track == self._song.master_track
-
-        if is_main_track and len(self._song.visible_tracks) > 0:
-            if len(self._song.return_tracks) > 0:
-                self._song.view.selected_track = self._song.return_tracks[-1]
-            else:
-                self._song.view.selected_track = self._song.visible_tracks[-1]
-        elif not is_return_track:
-            next_index = list(self._song.visible_tracks).index(selected_track) - 1
-            if next_index >= 0:
-                self._song.view.selected_track = self._song.visible_tracks[next_index]
-            elif next_index < 0:
-                self._song.view.selected_track = self._song.master_track
-        elif is_return_track:
-            next_index = list(self._song.return_tracks).index(selected_track) - 1
-            if next_index >= 0:
-                self._song.view.selected_track = self._song.return_tracks[next_index]
-            elif next_index < 0:
-                self._song.view.selected_track = self._song.visible_tracks[-1]
+        self._select(-1, wrap=True)
 
     def track_nav_inc_x3(self):
-        if self._song.view.selected_track is None:
-            return
-        for _ in range(3):
-            if self._song.view.selected_track is self._song.master_track:
-                break
-            self.track_nav_inc()
+        # One jump, stopping at master rather than wrapping.
+        self._select(3, wrap=False)
 
     def track_nav_dec_x3(self):
-        if self._song.view.selected_track is None:
-            return
-        for _ in range(3):
-            if self._song.view.selected_track is self._song.tracks[0]:
-                break
-            self.track_nav_dec()
+        # One jump, stopping at the first track rather than wrapping.
+        self._select(-3, wrap=False)
 
 class Functions(ControlSurface):
     def __init__(self, c_instance=None, publish_self=True, *a, **k):
@@ -256,6 +218,22 @@ class Functions(ControlSurface):
     def record_audio_resample(self):
         self.bounce.record_audio_resample()
 
+    @hud_name("Drum page >")
+    def drum_page_next(self):
+        self._manager.drum_rack.page_next()
+
+    @hud_name("Drum page <")
+    def drum_page_prev(self):
+        self._manager.drum_rack.page_prev()
+
+    @hud_name("Drum bars")
+    def drum_bars_cycle(self):
+        self._manager.drum_rack.cycle_bars()
+
+    @hud_name("Drum res")
+    def drum_resolution_cycle(self):
+        self._manager.drum_rack.cycle_resolution()
+
     def sequencer_random_notes(self):
         self.sequencer.sequencer_random_notes()
 
@@ -6,18 +6,40 @@ step pattern for the selected pad. Mirrors the `clip_actions.py` pattern: no
 Live import at module top level (imported lazily so unit tests run pure), and a
 Null* fallback so generated code never branches.
 
-V1 scope (see ai-coding/plans/drum_rack.md):
-  - edits bar 1 only, at sixteenth resolution (16 steps).
+Scope (see ai-coding/plans/drum_rack.md):
+  - 1-8 bar patterns (`set_bars`) at 1/16, 1/32 or 1/16-triplet resolution
+    (`set_resolution` / `cycle_resolution`), shown and edited a page of
+    STEPS_PER_PAGE steps at a time (`page_next` / `page_prev`): a step event's
+    index is relative to the visible page.
   - "selected pad" = the pad tapped from the controller if pad wiring is present
     (deferred seam), otherwise Live's own `drum_rack.view.selected_drum_pad`, so
     the step/velocity editing already works against the mouse-selected pad.
   - a step tap toggles the note on/off (needs momentary buttons for a clean edge).
 
+Step state is read from a `NoteIndex`: per pitch of the clip being edited, the
+sorted start times of its notes, built with a single `get_notes_extended` query
+and then kept current in place by our own toggles. A `notes` listener on the
+clip drops it when the clip changes under us (mouse edits, undo, recording).
+"Is this step filled" is a bisect and rendering a page is a bisect plus a walk
+over that page's notes, so a tap costs one note mutation and no note queries,
+and does not get slower as the loop gets longer.
+
+With `batch=True` (what the generated surface uses) step toggles and velocity
+targets are not written per event: they queue until the next
+`schedule_message` tick, which folds them into at most one removal, one
+`apply_note_modifications` and one `add_new_notes` for the clip -- one Live
+clip rewrite instead of one per button/encoder event -- and sends a single HUD
+DRUM. Folding replays the events in order per step, so the clip ends up exactly
+as per-event editing would leave it (tests/test_drum_rack.py has the
+equivalence harness).
+
 DEFERRED SEAM: pad *audition* + controller-driven pad *selection* wiring depend
 on a Live note-forwarding/translation spike and are not wired here. `select_pad`
 is implemented so the wiring is a one-liner once the spike resolves.
 """
+from bisect import bisect_left, insort
 from collections import namedtuple
+from contextlib import contextmanager
 
 # Lazy Live handle: real Live inside Ableton, None under unit test. Note specs
 # fall back to a plain namedtuple so the clip-editing math is testable without
@@ -34,6 +56,16 @@ STEPS_PER_BAR = 16
 DEFAULT_VELOCITY = 100
 BAR_BEATS = STEP_BEATS * STEPS_PER_BAR
 
+# Steps shown (and addressed by the controller's step buttons) at a time.
+STEPS_PER_PAGE = 16
+MAX_BARS = 8
+# Resolution name (also its HUD label) -> step length in beats.
+RESOLUTIONS = {'16': STEP_BEATS, '32': STEP_BEATS / 2, '16t': 1.0 / 6}
+RESOLUTION_ORDER = ('16', '32', '16t')
+DEFAULT_RESOLUTION = '16'
+# Triplet steps are not exact binary fractions: window edges get this slack.
+_EPS = 1e-6
+
 # A drum-rack bank is a 4x4 grid of pads, and so is the controller's pad grid.
 PAD_GRID_WIDTH = 4
 PAD_GRID_HEIGHT = 4
@@ -55,6 +87,142 @@ def bank_index_from_controller(index, width=PAD_GRID_WIDTH, height=PAD_GRID_HEIG
     return (height - 1 - row) * width + col
 
 
+def _query_starts(clip, pitch):
+    """Sorted start times of `pitch`'s notes across the longest pattern, or
+    None when the clip can't be read."""
+    try:
+        result = clip.get_notes_extended(pitch, 1, 0.0, MAX_BARS * BAR_BEATS)
+    except Exception:
+        return None
+    return sorted(getattr(n, "start_time", 0.0) for n in (result if result is not None else ()))
+
+
+class NoteIndex:
+    """Per-(clip, pitch) sorted note start times for the one clip being edited.
+
+    Watches that clip's notes through Live's `add_notes_listener`; any change
+    we did not make ourselves clears every pitch of it. A clip that can't be
+    watched is never cached (each read queries), since nothing would tell us
+    when it went stale. Our own edits are bracketed by `editing()` so their
+    notification keeps the in-place update; if Live delivers it late the index
+    is merely rebuilt on the next read."""
+
+    def __init__(self):
+        self._clip = None
+        self._watched = False
+        self._starts = {}
+        self._own_edit = False
+        self.builds = 0
+        self.invalidations = 0
+
+    def starts(self, clip, pitch):
+        """Sorted start times for `pitch` in `clip` ([] if unreadable)."""
+        self._watch(clip)
+        starts = self._starts.get(pitch)
+        if starts is None:
+            starts = _query_starts(clip, pitch)
+            if starts is None:
+                return []
+            self.builds += 1
+            if self._watched:
+                self._starts[pitch] = starts
+        return starts
+
+    def filled(self, clip, pitch, start, span):
+        """True when a note of `pitch` starts in [start, start + span)."""
+        starts = self.starts(clip, pitch)
+        i = bisect_left(starts, start - _EPS)
+        return i < len(starts) and starts[i] < start + span - _EPS
+
+    def add(self, clip, pitch, start):
+        """Record our own added note in place."""
+        starts = self._own(clip, pitch)
+        if starts is not None:
+            insort(starts, start)
+
+    def remove(self, clip, pitch, start, span):
+        """Record our own removal of every note starting in the window."""
+        starts = self._own(clip, pitch)
+        if starts is not None:
+            del starts[bisect_left(starts, start - _EPS):bisect_left(starts, start + span - _EPS)]
+
+    def _own(self, clip, pitch):
+        return self._starts.get(pitch) if clip is self._clip else None
+
+    @contextmanager
+    def editing(self, clip):
+        self._watch(clip)
+        self._own_edit = True
+        try:
+            yield
+        finally:
+            self._own_edit = False
+
+    def _watch(self, clip):
+        if clip is self._clip:
+            return
+        self.release()
+        self._clip = clip
+        try:
+            clip.add_notes_listener(self._on_notes_changed)
+            self._watched = True
+        except Exception:
+            self._watched = False
+
+    def _on_notes_changed(self):
+        if self._own_edit:
+            return
+        if self._starts:
+            self.invalidations += 1
+        self._starts = {}
+
+    def release(self):
+        """Stop watching the current clip (clip changed, surface disconnect)."""
+        clip, self._clip = self._clip, None
+        self._starts = {}
+        if clip is not None and self._watched:
+            try:
+                if clip.notes_has_listener(self._on_notes_changed):
+                    clip.remove_notes_listener(self._on_notes_changed)
+            except Exception:
+                pass
+        self._watched = False
+
+
+# Queued edit kinds (DrumRackController batch mode).
+_TOGGLE = 'toggle'
+_VELOCITY = 'velocity'
+
+
+def fold_step_edits(filled, events):
+    """Fold an ordered list of (step, kind, value) edits against the steps'
+    current state (`filled(step)` -> bool) into a per-step outcome:
+
+        {step: (removed, filled, velocity)}
+
+    `removed`  -- the step's original notes must go (it was toggled off at
+                  some point, even if toggled on again afterwards);
+    `filled`   -- a note is there at the end: a fresh DEFAULT_VELOCITY note if
+                  `removed` or the step started empty, else the original notes;
+    `velocity` -- final velocity target for what is there, or None.
+
+    Mirrors per-event editing: a velocity on an empty step is a no-op, and
+    toggling a step off discards any velocity set on it."""
+    state = {}
+    for step, kind, value in events:
+        st = state.get(step)
+        if st is None:
+            st = state[step] = [False, bool(filled(step)), None]
+        if kind == _TOGGLE:
+            if st[1]:
+                st[0], st[1], st[2] = True, False, None
+            else:
+                st[1] = True
+        elif st[1]:
+            st[2] = clamp(int(value), 1, 127)
+    return {step: tuple(st) for step, st in state.items()}
+
+
 def make_note_spec(pitch, start_time, duration, velocity):
     if Live is not None:  # pragma: no cover - exercised inside Ableton
         return Live.Clip.MidiNoteSpecification(
@@ -64,12 +232,87 @@ def make_note_spec(pitch, start_time, duration, velocity):
 
 
 class DrumRackController:
-    def __init__(self, manager, hud_client=None):
+    def __init__(self, manager, hud_client=None, batch=False):
+        """`batch=True` queues step/velocity edits and commits them once per
+        tick (see module docstring); False writes each event immediately."""
         self._manager = manager
         self._hud_client = hud_client
         # Pad tapped from the controller (0-based index into the visible bank).
         # None => fall back to Live's mouse-selected drum pad.
         self._selected_pad_index = None
+        self._index = NoteIndex()
+        # Pattern shape: length in bars, step resolution, visible page (0-based).
+        self._bars = 1
+        self._resolution = DEFAULT_RESOLUTION
+        self._page = 0
+        self._batch = batch
+        # Batch mode: the (clip, pitch, step_beats) the queued events edit, the
+        # events (absolute steps) in arrival order, and whether a step event
+        # asked for a HUD DRUM.
+        self._batch_target = None
+        self._batch_events = []
+        self._batch_hud = False
+        self._flush_scheduled = False
+        self.batches = 0
+
+    def disconnect(self):
+        self.flush()
+        self._index.release()
+
+    # -- pattern shape / paging ----------------------------------------------
+
+    def _step_beats(self):
+        return RESOLUTIONS[self._resolution]
+
+    def total_steps(self):
+        return int(round(self._bars * BAR_BEATS / self._step_beats()))
+
+    def pages(self):
+        return -(-self.total_steps() // STEPS_PER_PAGE)
+
+    def _abs_step(self, step):
+        """Pattern step for a page-relative step index, or None past the end."""
+        abs_step = self._page * STEPS_PER_PAGE + step
+        return abs_step if 0 <= step < STEPS_PER_PAGE and abs_step < self.total_steps() else None
+
+    def set_page(self, page):
+        self._page = clamp(int(page), 0, self.pages() - 1)
+        self._emit_hud(self._drum_rack())
+
+    def page_next(self):
+        self.set_page(self._page + 1)
+
+    def page_prev(self):
+        self.set_page(self._page - 1)
+
+    def set_bars(self, bars):
+        """Pattern length 1..MAX_BARS; loops the detail clip over it."""
+        self.flush()
+        self._bars = clamp(int(bars), 1, MAX_BARS)
+        clip = self._detail_clip()
+        if clip is not None:
+            try:
+                clip.loop_end = clip.loop_start + self._bars * BAR_BEATS
+            except Exception:
+                pass
+        self.set_page(self._page)
+
+    def cycle_bars(self):
+        """1 -> 2 -> 4 -> 8 -> 1 bars."""
+        self.set_bars(1 if self._bars >= MAX_BARS else self._bars * 2)
+
+    def set_resolution(self, name):
+        """Switch step resolution, keeping the visible page's start time in view."""
+        if name not in RESOLUTIONS:
+            return
+        self.flush()
+        page_start = self._page * STEPS_PER_PAGE * self._step_beats()
+        self._resolution = name
+        self.set_page(int(page_start / (STEPS_PER_PAGE * self._step_beats()) + _EPS))
+
+    def cycle_resolution(self):
+        i = RESOLUTION_ORDER.index(self._resolution)
+        self.set_resolution(RESOLUTION_ORDER[(i + 1) % len(RESOLUTION_ORDER)])
 
     # -- device / clip resolution -------------------------------------------
 
@@ -125,7 +368,7 @@ class DrumRackController:
             return None
         try:
             if not slot.has_clip:
-                slot.create_clip(BAR_BEATS)
+                slot.create_clip(self._bars * BAR_BEATS)
             return slot.clip
         except Exception:
             return None
@@ -153,7 +396,7 @@ class DrumRackController:
             song = self._manager.song()
             track = song.view.selected_track
             loop_start = song.loop_start
-            span = max(song.loop_length, BAR_BEATS)
+            span = max(song.loop_length, self._bars * BAR_BEATS)
         except Exception:
             return None
         if track is None:
@@ -170,7 +413,7 @@ class DrumRackController:
         try:
             clip.looping = True
             clip.loop_start = 0.0
-            clip.loop_end = BAR_BEATS
+            clip.loop_end = self._bars * BAR_BEATS
         except Exception:
             pass
         try:
@@ -251,7 +494,7 @@ class DrumRackController:
                 self._log(f"[drum] select_pad: could not set selected_drum_pad: {e}")
         self._log(f"[drum] select_pad index={index} active={drum_rack is not None} "
                   f"visible_pads={len(pads)} note={note}")
-        self._emit_hud()
+        self._emit_hud(drum_rack)
 
     def _log(self, message):
         try:
@@ -263,14 +506,25 @@ class DrumRackController:
 
     def step_event(self, step, value):
         # A step tap toggles the note. Act on the release edge (value == 0) so a
-        # single press-and-let-go is one toggle on momentary buttons.
+        # single press-and-let-go is one toggle on momentary buttons. The rack is
+        # resolved once and shared by the edit and the HUD pattern.
+        drum_rack = self._drum_rack()
+        if self._batch:
+            if value == 0:
+                self._queue(drum_rack, self._abs_step(step), _TOGGLE, None)
+            self._batch_hud = True
+            self._schedule_flush()
+            return
         if value == 0:
-            self.toggle_step(step)
-        self._emit_hud()
+            self._toggle_step(drum_rack, step)
+        self._emit_hud(drum_rack)
 
     def toggle_step(self, step):
-        drum_rack = self._drum_rack()
-        if drum_rack is None:
+        self._toggle_step(self._drum_rack(), step)
+
+    def _toggle_step(self, drum_rack, step):
+        step = self._abs_step(step)
+        if drum_rack is None or step is None:
             return
         pitch = self._selected_pad_note(drum_rack)
         self._log(f"[drum] toggle_step step={step} sel_index={self._selected_pad_index} pitch={pitch}")
@@ -279,17 +533,26 @@ class DrumRackController:
         clip = self._clip_for_edit()
         if clip is None:
             return
-        start, span = step * STEP_BEATS, STEP_BEATS
-        if self._notes_in_window(clip, pitch, start, span):
-            clip.remove_notes_extended(pitch, 1, start, span)
-        else:
-            clip.add_new_notes([make_note_spec(pitch, start, span, DEFAULT_VELOCITY)])
+        span = self._step_beats()
+        start = step * span
+        with self._index.editing(clip):
+            if self._index.filled(clip, pitch, start, span):
+                clip.remove_notes_extended(pitch, 1, start, span)
+                self._index.remove(clip, pitch, start, span)
+            else:
+                clip.add_new_notes([make_note_spec(pitch, start, span, DEFAULT_VELOCITY)])
+                self._index.add(clip, pitch, start)
 
     # -- velocity editing ----------------------------------------------------
 
     def set_velocity(self, step, value):
         drum_rack = self._drum_rack()
-        if drum_rack is None:
+        step = self._abs_step(step)
+        if self._batch:
+            self._queue(drum_rack, step, _VELOCITY, value)
+            self._schedule_flush()
+            return
+        if drum_rack is None or step is None:
             return
         pitch = self._selected_pad_note(drum_rack)
         if pitch is None:
@@ -297,7 +560,10 @@ class DrumRackController:
         clip = self._clip_for_edit()
         if clip is None:
             return
-        start, span = step * STEP_BEATS, STEP_BEATS
+        span = self._step_beats()
+        start = step * span
+        if not self._index.filled(clip, pitch, start, span):
+            return  # empty step: turning the encoder does nothing
         notes = self._notes_in_window(clip, pitch, start, span)
         if not notes:
             return  # empty step: turning the encoder does nothing
@@ -308,10 +574,124 @@ class DrumRackController:
             except Exception:
                 pass
         try:
-            clip.apply_note_modifications(notes)
+            # Velocity only: the note index is unaffected.
+            with self._index.editing(clip):
+                clip.apply_note_modifications(notes)
         except Exception:
             pass
 
+    # -- batched editing -----------------------------------------------------
+
+    def _queue(self, drum_rack, step, kind, value):
+        if drum_rack is None or step is None:
+            return
+        pitch = self._selected_pad_note(drum_rack)
+        if pitch is None:
+            return
+        clip = self._clip_for_edit()
+        if clip is None:
+            return
+        target = (clip, pitch, self._step_beats())
+        if self._batch_target is not None and (
+                self._batch_target[0] is not clip or self._batch_target[1:] != target[1:]):
+            # Pad, clip or resolution changed mid-tick: commit what the old
+            # target has.
+            self._apply_batch()
+        self._batch_target = target
+        self._batch_events.append((step, kind, value))
+
+    def _schedule_flush(self):
+        if self._flush_scheduled:
+            return
+        self._flush_scheduled = True
+        try:
+            self._manager.schedule_message(1, self.flush)
+        except Exception:
+            self._flush_scheduled = False
+            self.flush()
+
+    def flush(self):
+        """Commit queued edits as one batched note mutation, then send one HUD
+        DRUM if a step event asked for it."""
+        self._flush_scheduled = False
+        try:
+            self._apply_batch()
+        except Exception as e:
+            self._log(f"[drum] batch failed: {e}")
+        if self._batch_hud:
+            self._batch_hud = False
+            self._emit_hud(self._drum_rack())
+
+    def _apply_batch(self):
+        target, events = self._batch_target, self._batch_events
+        self._batch_target, self._batch_events = None, []
+        if target is None or not events:
+            return
+        clip, pitch, span = target
+        was_filled = {}
+        for step, _kind, _value in events:
+            if step not in was_filled:
+                was_filled[step] = self._index.filled(clip, pitch, step * span, span)
+        outcome = fold_step_edits(was_filled.__getitem__, events)
+        removed, retuned, added = [], {}, []
+        for step, (rm, filled, velocity) in sorted(outcome.items()):
+            if rm:
+                removed.append(step)
+            if filled and (rm or not was_filled[step]):
+                added.append(make_note_spec(pitch, step * span, span,
+                                            velocity if velocity is not None else DEFAULT_VELOCITY))
+            elif filled and velocity is not None:
+                retuned[step] = velocity
+        self.batches += 1
+        self._log(f"[drum] batch pitch={pitch} events={len(events)} remove={len(removed)} "
+                  f"velocity={len(retuned)} add={len(added)}")
+        with self._index.editing(clip):
+            if removed or retuned:
+                self._remove_and_retune(clip, pitch, span, removed, retuned)
+            if added:
+                clip.add_new_notes(added)
+        for step in removed:
+            self._index.remove(clip, pitch, step * span, span)
+        for spec in added:
+            self._index.add(clip, pitch, spec.start_time)
+
+    def _remove_and_retune(self, clip, pitch, span, removed, retuned):
+        # One read of the touched steps' notes serves both the removal ids and
+        # the velocity edits.
+        touched = list(removed) + list(retuned)
+        lo, hi = min(touched) * span, (max(touched) + 1) * span
+        try:
+            result = clip.get_notes_extended(pitch, 1, lo, hi - lo)
+        except Exception:
+            result = None
+        notes = list(result) if result is not None else []
+        by_step = {}
+        for n in notes:
+            idx = int((getattr(n, "start_time", 0.0) + _EPS) / span)
+            by_step.setdefault(idx, []).append(n)
+        if removed:
+            ids = [getattr(n, "note_id", None) for step in removed for n in by_step.get(step, ())]
+            if hasattr(clip, "remove_notes_by_id") and None not in ids:
+                clip.remove_notes_by_id(ids)
+            else:
+                # Pre-note-id API: one ranged removal per step.
+                for step in removed:
+                    clip.remove_notes_extended(pitch, 1, step * span, span)
+        if retuned:
+            modified = []
+            for step, velocity in retuned.items():
+                for n in by_step.get(step, ()):
+                    try:
+                        n.velocity = velocity
+                    except Exception:
+                        continue
+                    modified.append(n)
+            if modified:
+                try:
+                    clip.apply_note_modifications(modified)
+                except Exception:
+                    pass
+
     # -- helpers -------------------------------------------------------------
 
     def _notes_in_window(self, clip, pitch, start, span):
@@ -325,28 +705,34 @@ class DrumRackController:
         return [n for n in notes if start <= getattr(n, "start_time", start) < start + span]
 
     def pattern(self):
-        """16-char pattern for the selected pad: 'X' filled, '.' empty."""
-        drum_rack = self._drum_rack()
+        """The visible page of the selected pad's pattern, one char per step:
+        'X' filled, '.' empty. STEPS_PER_PAGE long, shorter on a last page the
+        pattern only partly fills."""
+        return self._pattern(self._drum_rack())
+
+    def _pattern(self, drum_rack):
+        first = self._page * STEPS_PER_PAGE
+        count = max(0, min(STEPS_PER_PAGE, self.total_steps() - first))
         if drum_rack is None:
-            return "." * STEPS_PER_BAR
+            return "." * count
         pitch = self._selected_pad_note(drum_rack)
         clip = self._detail_clip()
         if pitch is None or clip is None:
-            return "." * STEPS_PER_BAR
-        try:
-            result = clip.get_notes_extended(pitch, 1, 0.0, BAR_BEATS)
-        except Exception:
-            return "." * STEPS_PER_BAR
-        notes = list(result) if result is not None else []
-        cells = ["."] * STEPS_PER_BAR
-        for n in notes:
-            idx = int(getattr(n, "start_time", 0.0) / STEP_BEATS)
-            if 0 <= idx < STEPS_PER_BAR:
-                cells[idx] = "X"
+            return "." * count
+        span = self._step_beats()
+        page_start = first * span
+        page_end = page_start + count * span
+        starts = self._index.starts(clip, pitch)
+        cells = ["."] * count
+        # Bisect to the page, then walk only the notes on it.
+        for i in range(bisect_left(starts, page_start - _EPS), len(starts)):
+            t = starts[i]
+            if t >= page_end - _EPS:
+                break
+            cells[int((t - page_start + _EPS) / span)] = "X"
         return "".join(cells)
 
-    def _pad_name(self):
-        drum_rack = self._drum_rack()
+    def _pad_name(self, drum_rack):
         if drum_rack is None:
             return ""
         view = getattr(drum_rack, "view", None)
@@ -355,11 +741,13 @@ class DrumRackController:
             return ""
         return getattr(pad, "name", "") or ""
 
-    def _emit_hud(self):
+    def _emit_hud(self, drum_rack):
         if self._hud_client is None:
             return
         try:
-            self._hud_client.send_drum(self._pad_name(), self.pattern())
+            self._hud_client.send_drum(self._pad_name(drum_rack), self._pattern(drum_rack),
+                                       page=self._page + 1, pages=self.pages(),
+                                       resolution=self._resolution)
         except Exception:
             pass
 
@@ -4,7 +4,8 @@ The EC4 has 16 encoders, each with a 4-character OLED readout. This sink writes
 the currently-mapped parameter names to those readouts on every device-focus /
 mode burst, mirroring what the HUD shows — but rendered on the controller itself.
 
-Transport is MIDI SysEx out the surface's port (`manager._send_midi`), not UDP.
+Transport is MIDI SysEx out the surface's port (`manager._send_midi`, through the
+surface's `MidiOutQueue` when it has one), not UDP.
 `HudClient` is the sibling sink over UDP; both are driven from `Remote` off the
 same dial payloads, so the EC4 readouts stay in lock-step with the HUD.
 
@@ -19,10 +20,16 @@ and the Faderfox EC4 SysEx manual. The "set encoder display" message:
     4D 2<vh> 1<vl>  x N    one triple per char
     F7
 
-16 cells x 4 chars = 64 char addresses; cell N starts at address N*4. We always
-send the full 64-char buffer in one message (one handshake), exactly like the
-stock driver. Unset cells are '-' (0x2D) — the EC4 only honours a live overwrite
-for encoders whose configured name is '----', so dashes are the blank state.
+16 cells x 4 chars = 64 char addresses; cell N starts at address N*4. Unset
+cells are '-' (0x2D) — the EC4 only honours a live overwrite for encoders whose
+configured name is '----', so dashes are the blank state.
+
+The first write (and every write after `on_hide` / `refresh`) sends the full
+64-char buffer in one message, exactly like the stock driver. After that the
+client diffs against what it last wrote and sends only the changed runs, each
+as its own message with the run's start address — a one-label change is ~26
+bytes instead of ~206 on the EC4's slow MIDI link. Runs a few chars apart are
+merged, since every message pays 14 bytes of framing.
 
 NOTE: the EC4 setup/group must have all 16 encoder names set to '----' or the
 readouts won't update (hardware-side overwrite rule).
@@ -30,6 +37,8 @@ readouts won't update (hardware-side overwrite rule).
 import logging
 import re
 
+from .midi_out import NullMidiOut
+
 logger = logging.getLogger("ec4-client")
 
 # ---- SysEx framing (see module docstring) -----------------------------------
@@ -43,6 +52,18 @@ NUM_CELLS = 16
 CHARS_PER_CELL = 4
 BLANK_CELL = "-" * CHARS_PER_CELL
 
+# Framing bytes per message (header + address + F7) = 14, i.e. ~5 chars of
+# data triples: changed runs at most this many unchanged chars apart are cheaper
+# written as one message (re-sending the gap) than as two.
+MERGE_GAP = 4
+_FRAMING = len(SYSEX_START) + len(FADERFOX_EC4_DEVICE_ID) + len(SET_TEXT_MSG_HEADER) + 3 + 1
+
+# Fitted cells per label. Labels come from a bounded set (parameter names /
+# aliases of the mapped devices), so this stays small; cleared if it ever
+# grows past the cap rather than tracking recency.
+_CELL_CACHE = {}
+_CELL_CACHE_MAX = 512
+
 
 # OLED character table (OLEDM204), copied verbatim from Ableton's stock
 # Faderfox_Universal_2/consts.py. Maps an input character to the display's
@@ -82,18 +103,56 @@ def translate_string(string):
 
 def _fit_cell(name):
     """Translate a label and fit it to exactly CHARS_PER_CELL display codes,
-    truncating long names and padding short ones with '-'."""
-    t = translate_string(name or '')[:CHARS_PER_CELL]
-    return t.ljust(CHARS_PER_CELL, '-')
+    truncating long names and padding short ones with '-'. Memoised per label."""
+    cell = _CELL_CACHE.get(name)
+    if cell is None:
+        t = translate_string(name or '')[:CHARS_PER_CELL]
+        cell = t.ljust(CHARS_PER_CELL, '-')
+        if len(_CELL_CACHE) >= _CELL_CACHE_MAX:
+            _CELL_CACHE.clear()
+        _CELL_CACHE[name] = cell
+    return cell
 
 
 def _data_triple(code):
     return [0x4D, 0x20 | (code >> 4), 0x10 | (code & 0x0F)]
 
 
+def _address(addr):
+    """Start-char address field for char `addr` (0..63); BASE_ADDRESS is 0."""
+    return (0x4A, 0x20 | (addr >> 4), 0x10 | (addr & 0x0F))
+
+
+def _message(addr, text):
+    data = [b for ch in text for b in _data_triple(ord(ch))]
+    return (list(SYSEX_START) + list(FADERFOX_EC4_DEVICE_ID)
+            + list(SET_TEXT_MSG_HEADER) + list(_address(addr))
+            + data + list(SYSEX_END))
+
+
+def _changed_runs(old, new):
+    """[start, end) char ranges where `new` differs from `old`, with runs at
+    most MERGE_GAP unchanged chars apart merged into one."""
+    runs = []
+    for i, (a, b) in enumerate(zip(old, new)):
+        if a == b:
+            continue
+        if runs and i - runs[-1][1] <= MERGE_GAP:
+            runs[-1][1] = i + 1
+        else:
+            runs.append([i, i + 1])
+    return runs
+
+
 class Ec4Client:
-    def __init__(self, manager):
+    def __init__(self, manager, midi_out=None):
+        """`midi_out` is the surface's MidiOutQueue; None writes straight to
+        `manager._send_midi`."""
         self._manager = manager
+        self._midi_out = midi_out if midi_out is not None else NullMidiOut(manager)
+        # The 64-char buffer the EC4 last received; None = unknown (startup,
+        # reconnect, failed send), which makes the next write a full one.
+        self._text = None
 
     def on_burst(self, snapshot):
         """Preferred sink entrypoint: receives the whole BurstSnapshot. The EC4
@@ -115,26 +174,47 @@ class Ec4Client:
         self._send_cells(cells)
 
     def on_hide(self):
+        self._text = None
         self._send_cells([BLANK_CELL] * NUM_CELLS)
 
+    def refresh(self):
+        """Rewrite the whole buffer (Live's refresh_state: the controller was
+        reconnected and may have lost what we wrote)."""
+        text, self._text = self._text, None
+        if text is not None:
+            self._send_text(text)
+
     def _send_cells(self, cells):
-        text = "".join(cells)
-        data = [b for ch in text for b in _data_triple(ord(ch))]
-        payload = (list(SYSEX_START) + list(FADERFOX_EC4_DEVICE_ID)
-                   + list(SET_TEXT_MSG_HEADER) + list(BASE_ADDRESS)
-                   + data + list(SYSEX_END))
-        try:
-            self._manager._send_midi(tuple(payload))
-        except Exception as e:
-            # Route through the surface log so failures (e.g. a bad send path on
-            # first bringup) land in tail_logs.sh, not just python logging.
-            try:
-                self._manager.log_message(f"Ec4Client._send_cells failed: {e}")
-            except Exception:
-                logger.error(f"Ec4Client._send_cells: {e}")
+        self._send_text("".join(cells))
+
+    def _send_text(self, text):
+        old = self._text
+        messages = None
+        if old is not None:
+            runs = _changed_runs(old, text)
+            if not runs:
+                return
+            messages = [_message(start, text[start:end]) for start, end in runs]
+            if sum(len(m) for m in messages) >= _FRAMING + 3 * len(text):
+                # Scattered changes: one full write is no bigger.
+                messages = None
+        full = messages is None
+        if full:
+            messages = [_message(0, text)]
+        # Shadow first: a failed send (now, or on the MIDI-out tick) resets it
+        # through _on_send_error so the next write goes out full.
+        self._text = text
+        for payload in messages:
+            # A full write makes any still-queued partial runs obsolete.
+            self._midi_out.send(self, payload, supersede=full, on_error=self._on_send_error)
+
+    def _on_send_error(self):
+        # The EC4 may hold a partial write now; the next one goes out full.
+        self._text = None
 
 
 class NullEc4Client:
     def on_burst(self, snapshot): pass
     def on_device_burst(self, device_name, dial_payloads, button_payloads=None): pass
     def on_hide(self): pass
+    def refresh(self): pass
@@ -15,17 +15,34 @@ RGB is pre-multiplied (hue x brightness) and scaled 8-bit -> 7-bit; the Lua scal
 back up for `glc`. The frame is DENSE every burst, so focusing a non-zoned device
 (empty zone_colors) emits all-off and clears the previous synth's tint.
 
-Transport is `manager._send_midi` (the surface's own MIDI out == the Grid), exactly
-like `Ec4Client`.
+Between bursts, live value changes (`Remote.parameter_updated` -> `on_update`)
+go out as a second, sparse command carrying only the slots whose 7-bit RGB
+actually changed:
+
+    F0 7D 44 01  (slot r g b)*  F7        'D' = delta, slot = 0..47
+
+The client keeps the last RGB sent per slot, so a sweep that does not move a
+slot's brightness step sends nothing, and pending slots are flushed at most
+`max_fps` times a second (a one-shot `schedule_message` tick picks up whatever
+arrived inside the interval). A delta that would be no smaller than the dense
+frame is sent as the dense frame instead.
+
+Transport is `manager._send_midi` (the surface's own MIDI out == the Grid), through
+the surface's `MidiOutQueue` when it has one, exactly like `Ec4Client`.
 """
 import logging
+import time
+import traceback
+
+from .midi_out import NullMidiOut
 
 logger = logging.getLogger("grid-led-client")
 
 # ---- Grid LED SysEx v1 framing (see module docstring) -----------------------
 SYSEX_START = 0xF0
 NON_COMMERCIAL_ID = 0x7D   # SysEx "non-commercial / educational" manufacturer id
-LED_CMD = 0x4C             # 'L' — set-LEDs command
+LED_CMD = 0x4C             # 'L' — set-LEDs command (dense frame)
+LED_DELTA_CMD = 0x44       # 'D' — set changed slots only: (slot r g b)*
 VERSION = 0x01
 SYSEX_END = 0xF7
 
@@ -39,6 +56,22 @@ MAPPED_FLOOR = 0.15
 
 OFF = [0, 0, 0]
 
+# Live-update LED frames per second. The Grid repaints its LEDs far slower than
+# a pot sweep produces CCs; past ~30fps the extra frames are invisible and only
+# load its MIDI RX.
+DEFAULT_MAX_FPS = 30
+
+_FRAME_LEN = 4 + NUM_SLOTS * 3 + 1
+
+
+def _slot_index(kind, wire):
+    """Frame slot for (kind, wire_idx), or None outside the 48-slot surface."""
+    if kind == 'dial':
+        return wire if 0 <= wire < NUM_DIALS else None
+    if kind == 'button':
+        return NUM_DIALS + wire if 0 <= wire < NUM_BUTTONS else None
+    return None
+
 
 def _normalise(payload):
     """Value in [0, 1] over vmin..vmax, clamped. Degenerate range => full."""
@@ -63,34 +96,141 @@ def _rgb7(hexv, payload):
 
 
 class GridLedClient:
-    def __init__(self, manager):
+    def __init__(self, manager, max_fps=DEFAULT_MAX_FPS, clock=None, midi_out=None):
+        """`max_fps` caps live-update LED messages per second (None/0 = send on
+        every update). `midi_out` is the surface's MidiOutQueue (None writes
+        straight to `manager._send_midi`). `clock` is injectable for tests."""
         self._manager = manager
+        self._midi_out = midi_out if midi_out is not None else NullMidiOut(manager)
+        self._min_interval = (1.0 / max_fps) if max_fps else 0.0
+        self._clock = clock or time.monotonic
+        self._last_send = None
+        self._tick_scheduled = False
+        # Zone colour per (kind, wire_idx) from the last burst: a live update
+        # carries only the value, the hue comes from the focused device's zones.
+        self._colours = {}
+        # Last [r, g, b] the Grid was sent per slot; None = unknown (startup or
+        # a failed send), so live updates wait for the next dense frame.
+        self._sent = None
+        # slot -> [r, g, b] still to send (differs from self._sent[slot]).
+        self._pending = {}
+        self.reset_stats()
+
+    def reset_stats(self):
+        # frames  -- dense 48-slot frames sent
+        # deltas  -- sparse changed-slot messages sent
+        # slots   -- slots carried by deltas
+        # skipped -- live updates whose RGB matched what the Grid already shows
+        self.frames = 0
+        self.deltas = 0
+        self.slots = 0
+        self.skipped = 0
+
+    def stats(self):
+        return {'frames': self.frames, 'deltas': self.deltas,
+                'slots': self.slots, 'skipped': self.skipped}
 
     def on_burst(self, snapshot):
         """Emit the dense 48-slot RGB frame for this device-focus burst. Fires on
         suppressed-HUD bursts too — LEDs are persistent device state, not the
         transient HUD."""
-        colours = {(kind, wire): hexv for kind, wire, hexv in snapshot.zone_colors}
+        self._colours = {(kind, wire): hexv for kind, wire, hexv in snapshot.zone_colors}
         dials = {wire: p for wire, p in snapshot.dials}
         buttons = {wire: p for wire, p in snapshot.buttons}
 
-        body = []
+        frame = []
         for i in range(NUM_DIALS):
-            body += _rgb7(colours.get(('dial', i)), dials.get(i))
+            frame.append(_rgb7(self._colours.get(('dial', i)), dials.get(i)))
         for i in range(NUM_BUTTONS):
-            body += _rgb7(colours.get(('button', i)), buttons.get(i))
-
-        msg = ([SYSEX_START, NON_COMMERCIAL_ID, LED_CMD, VERSION]
-               + body + [SYSEX_END])
-        try:
-            self._manager._send_midi(tuple(msg))
-        except Exception as e:
-            # Route through the surface log so a bad send path is visible in
-            # tail_logs.sh, mirroring Ec4Client.
+            frame.append(_rgb7(self._colours.get(('button', i)), buttons.get(i)))
+        # The dense frame repaints every slot from live values: anything still
+        # pending is superseded.
+        self._pending = {}
+        self._send_frame(frame)
+
+    def on_update(self, kind, wire, payload):
+        """A live value change for one slot. Queued only if it changes what the
+        Grid shows; sent now if the frame interval has passed, else on the next
+        tick."""
+        slot = _slot_index(kind, wire)
+        if slot is None or self._sent is None:
+            return
+        rgb = _rgb7(self._colours.get((kind, wire)), payload)
+        if rgb == self._sent[slot]:
+            self.skipped += 1
+            self._pending.pop(slot, None)
+            return
+        self._pending[slot] = rgb
+        if self._due():
+            self.flush()
+        elif not self._tick_scheduled:
+            self._tick_scheduled = True
             try:
-                self._manager.log_message(f"GridLedClient.on_burst failed: {e}")
+                self._manager.schedule_message(1, self._tick)
             except Exception:
-                logger.error(f"GridLedClient.on_burst: {e}")
+                self._tick_scheduled = False
+                logger.error(f"GridLedClient: failed to schedule tick: {traceback.format_exc()}")
+
+    def flush(self):
+        """Send pending slots: one sparse delta, or the dense frame when the
+        delta would be no smaller."""
+        pending, self._pending = self._pending, {}
+        if not pending or self._sent is None:
+            return
+        if 4 + 4 * len(pending) + 1 >= _FRAME_LEN:
+            frame = list(self._sent)
+            for slot, rgb in pending.items():
+                frame[slot] = rgb
+            self._send_frame(frame)
+            return
+        body = []
+        for slot in sorted(pending):
+            body.append(slot)
+            body += pending[slot]
+        msg = [SYSEX_START, NON_COMMERCIAL_ID, LED_DELTA_CMD, VERSION] + body + [SYSEX_END]
+        for slot, rgb in pending.items():
+            self._sent[slot] = rgb
+        self.deltas += 1
+        self.slots += len(pending)
+        self._send(msg)
+
+    def _tick(self):
+        self._tick_scheduled = False
+        try:
+            if not self._pending:
+                return
+            if self._due():
+                self.flush()
+            else:
+                self._tick_scheduled = True
+                self._manager.schedule_message(1, self._tick)
+        except Exception:
+            logger.error(f"GridLedClient._tick: {traceback.format_exc()}")
+
+    def _due(self):
+        if self._last_send is None or not self._min_interval:
+            return True
+        return self._clock() - self._last_send >= self._min_interval
+
+    def _send_frame(self, frame):
+        body = [b for rgb in frame for b in rgb]
+        msg = ([SYSEX_START, NON_COMMERCIAL_ID, LED_CMD, VERSION]
+               + body + [SYSEX_END])
+        self._sent = frame
+        self.frames += 1
+        # The dense frame carries every slot: queued deltas are obsolete.
+        self._send(msg, supersede=True)
+
+    def _send(self, msg, supersede=False):
+        # Shadow already updated: a failed send (now, or on the MIDI-out tick)
+        # resets it through _on_send_error.
+        self._last_send = self._clock()
+        self._midi_out.send(self, msg, supersede=supersede, on_error=self._on_send_error)
+
+    def _on_send_error(self):
+        # Unknown LED state now: live updates wait for the next dense frame.
+        self._sent = None
+        self._pending = {}
 
     def on_hide(self):
         """No-op: LEDs are persistent physical state, not tied to HUD dismissal.
@@ -100,4 +240,5 @@ class GridLedClient:
 
 class NullGridLedClient:
     def on_burst(self, snapshot): pass
+    def on_update(self, kind, wire, payload): pass
     def on_hide(self): pass
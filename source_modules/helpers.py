@@ -1,8 +1,13 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from time import perf_counter
 from typing import Any, Optional
 
 from .hud_client import HudClient, NullHudClient
-from .hud_protocol import SlotPayload, EMPTY_SLOT, LayoutCell, PageInfo, BurstSnapshot
+from .update_coalescer import NullUpdateCoalescer
+from .hud_protocol import (
+    SlotPayload, EMPTY_SLOT, LayoutCell, PageInfo, BurstSnapshot, parse_hello, encode_slot,
+    encode_slot_payload,
+)
 from .param_resolver import (
     ParameterResolver, RealParameter, ParameterMapping, SwitchSlotMapping,
     M4L_CLASSES, _device_table_key, _build_device_table, _build_zone_tables,
@@ -10,6 +15,8 @@ from .param_resolver import (
     _device_alive, _safe_device_attr, _same_device,
 )
 from .hud_presenter import HudPresenter
+from .latency_stats import STATS
+from .name_index import NameIndex
 from .doctor import Doctor
 from .show_info import ShowInfo
 import logging
@@ -94,7 +101,10 @@ class SurfaceConfig:
 
 
 class Helpers:
-    def __init__(self, manager, remote, config: 'SurfaceConfig' = None):
+    def __init__(self, manager, remote, config: 'SurfaceConfig' = None, share=None):
+        """`share` is the surface's shared_hub.SurfaceShare: compiled tables and
+        the bank index come from the process-wide registry instead of being
+        built per surface. None builds them privately."""
         if config is None:
             config = SurfaceConfig()
         self._manager = manager
@@ -104,8 +114,13 @@ class Helpers:
         hud_cells = [LayoutCell.from_raw(c) for c in (config.hud_cells or [])]
         slot_assignments = list(config.slot_assignments or [])
         switch_slot_assignments = list(config.switch_slot_assignments or [])
-        device_banks = config.device_banks if config.device_banks is not None else _default_device_banks()
-        bank_names = config.bank_names if config.bank_names is not None else _default_bank_names()
+        device_banks, bank_names = config.device_banks, config.bank_names
+        if share is not None and (device_banks is None or bank_names is None):
+            shipped_banks, shipped_names = share.banks()
+            device_banks = device_banks if device_banks is not None else shipped_banks
+            bank_names = bank_names if bank_names is not None else shipped_names
+        device_banks = device_banks if device_banks is not None else _default_device_banks()
+        bank_names = bank_names if bank_names is not None else _default_bank_names()
         # 16-slot controllers pack two 8-param banks per page; 8-slot pack one.
         banks_per_page = 2 if config.encoder_slot_count >= 16 else 1
         # Number of distinct physical button switches: max switch slot number from
@@ -120,12 +135,14 @@ class Helpers:
         # HudPresenter (no Live writes). The Live-coupled writes/listeners/
         # messages stay here on the facade.
         self._resolver = ParameterResolver(
-            device_table=_build_device_table(config.parameter_mappings_raw),
+            device_table=(share.device_table(config.parameter_mappings_raw) if share is not None
+                          else _build_device_table(config.parameter_mappings_raw)),
             device_banks=device_banks, bank_names=bank_names,
             banks_per_page=banks_per_page, button_switch_count=button_switch_count,
             button_slot_count=config.button_slot_count, log=self.log_message,
             smart_zoning=config.smart_zoning,
-            zone_tables=_build_zone_tables(config.zone_tables_raw))
+            zone_tables=(share.zone_tables(config.zone_tables_raw) if share is not None
+                         else _build_zone_tables(config.zone_tables_raw)))
         self._presenter = HudPresenter(
             remote=remote, resolver=self._resolver,
             slot_assignments=slot_assignments,
@@ -143,6 +160,8 @@ class Helpers:
         self._remote.init_layout(hud_cells, config.hud_dividers)
         self._last_selected_device = None
         self._group_selector_listeners = []  # [(param, callback)] for teardown
+        # Named-target lookups (find_track/find_device_on_track), listener-kept.
+        self._names = NameIndex()
         self._button_behaviour = config.button_behaviour
         self._pager_preview_mode = config.pager_preview_mode
         # Button diagnostics, both off until their update.py command enables them.
@@ -315,23 +334,31 @@ class Helpers:
     def device_parameter_action(self, device, raw_parameter_no, midi_no, value, fn_name, toggle=False):
         if device is None:
             return
-        self.selected_device_changed(device)
-        rp = self._resolver.resolve_encoder(device, raw_parameter_no)
-        if rp is None:
-            self.log_message(f"{fn_name}: encoder {raw_parameter_no} not resolvable on {device.class_name}")
-            return
-        parameter = rp.param
-        # For a latching button (toggle=True) act once per *press*; the edge
-        # guard handles momentary vs toggle hardware. Continuous knobs
-        # (toggle=False) always apply.
-        will_fire = not toggle or self.should_act_on_edge(value)
-        if toggle:
-            next_value = parameter.max if parameter.value == parameter.min else parameter.min
-        else:
-            next_value = self.normalise(value, parameter.min, parameter.max)
-        if will_fire:
-            parameter.value = next_value
-            self._remote.parameter_updated(rp, raw_parameter_no)
+        t0 = perf_counter()
+        try:
+            self.selected_device_changed(device)
+            t_resolve = perf_counter()
+            rp = self._resolver.resolve_encoder(device, raw_parameter_no)
+            STATS.record('resolve', t_resolve)
+            if rp is None:
+                self.log_message(f"{fn_name}: encoder {raw_parameter_no} not resolvable on {device.class_name}")
+                return
+            parameter = rp.param
+            # For a latching button (toggle=True) act once per *press*; the edge
+            # guard handles momentary vs toggle hardware. Continuous knobs
+            # (toggle=False) always apply.
+            will_fire = not toggle or self.should_act_on_edge(value)
+            if toggle:
+                next_value = parameter.max if parameter.value == parameter.min else parameter.min
+            else:
+                next_value = self.normalise(value, parameter.min, parameter.max)
+            if will_fire:
+                parameter.value = next_value
+                self._remote.parameter_updated(rp, raw_parameter_no)
+        finally:
+            # Every event, resolved or not, so the histogram isn't biased
+            # towards the ones that reached a parameter.
+            STATS.record('param_event', t0)
 
     def switch_slot_action(self, device, slot, value, fn_name):
         """`slot` is a 1-based device switch-slot index (int)."""
@@ -519,10 +546,16 @@ class Helpers:
         self._presenter.emit_burst(self._last_selected_device, suppress_hud=suppress_hud,
                                    preview_mode_name=preview_mode_name)
 
+    def burst_cache_stats(self):
+        return self._presenter.burst_cache_stats()
+
+    def reset_burst_cache_stats(self):
+        self._presenter.reset_burst_cache_stats()
+
     def reemit_combined_burst(self):
-        """Compositor hook (lc_parks): re-emit a full combined burst for the
-        current device with the parks region appended. See
-        HudPresenter.reemit_combined_burst."""
+        """Compositor hook (lc_parks): re-emit the combined burst for the
+        current device with the parks region appended -- from the cached
+        primary burst when there is one. See HudPresenter.reemit_combined_burst."""
         self._presenter.reemit_combined_burst(self._last_selected_device)
 
     def refresh_hud_for_mode(self, mode_name, device):
@@ -578,31 +611,37 @@ class Helpers:
             return song.master_track
         elif track_name.isnumeric():
             return song.tracks[int(track_name) - 1]
-        for track in self._manager.song().tracks:
-            if track is not None and track.name == track_name:
-                return track
-        return None
+        return self._names.track(self._manager.song(), track_name)
 
     def find_device_on_track(self, track, device_name):
         if device_name == "selected":
             return track.view.selected_device
         elif device_name.isnumeric():
             return track.devices[int(device_name) - 1]
-        for device in track.devices:
-            if device is not None and device.name == device_name:
-                return device
-        return None
+        return self._names.device(track, device_name)
+
+    def disconnect(self):
+        """Detach the name-index listeners (surface disconnect)."""
+        self._names.release()
 
 
 class Remote:
-    def __init__(self, manager, osc_client, hud_client=None, feedback_sinks=None):
+    def __init__(self, manager, osc_client, hud_client=None, feedback_sinks=None, update_coalescer=None):
         self._manager = manager
         self._osc_client = osc_client
         self._hud_client = hud_client if hud_client is not None else NullHudClient()
+        # Live (knob-turn) updates go through the coalescer, which keeps only the
+        # latest value per slot and flushes once per tick. The default is the
+        # pass-through NullUpdateCoalescer: every update is sent immediately.
+        self._updates = (update_coalescer if update_coalescer is not None
+                         else NullUpdateCoalescer(self._hud_client, self._osc_client))
         # Generic feedback sinks (e.g. Ec4Client) driven off the same burst as
         # the HUD. The HUD keeps its own bespoke wire protocol; these consume
         # the dense dial/button payloads.
         self._feedback_sinks = list(feedback_sinks) if feedback_sinks else []
+        # ...and the subset that also follows live value changes between bursts
+        # (GridLedClient.on_update). Sinks rate-limit themselves.
+        self._update_sinks = [s for s in self._feedback_sinks if hasattr(s, 'on_update')]
         self._in_burst = False  # suppresses UPDATE during device_update burst
         # Controller layout (HUD LAYOUT cells). Stored so every burst can re-emit
         # it: LAYOUT is otherwise a one-shot at surface init, and if the HUD app
@@ -622,10 +661,70 @@ class Remote:
         # cached dial/button payloads are appended to the HUD burst so the parks
         # region rides along in the single combined stream.
         self._region_state = None
+        # Compositor only: the last primary burst (dials/buttons as lists) and
+        # each dial's position in it by wire index. A secondary-region COMMIT
+        # re-sends this plus the new region (`reemit_region_burst`) instead of
+        # re-resolving the primary's device; live dial UPDATEs patch it so it
+        # never lags what the HUD shows.
+        self._region_base = None
+        self._region_base_dial_pos = {}
+        # ... and its slots as encoded SLOT lines (dials first, so a dial's
+        # position is the same in both), built on first use.
+        self._region_base_lines = None
+        # HUD-owner election result (HudArbiter). A non-owner's HUD datagrams
+        # would only be discarded by the disabled HudClient, so it skips HUD
+        # assembly altogether; OSC and feedback sinks are unaffected.
+        self._hud_owner = True
+        self.reset_hud_stats()
+
+    def reset_hud_stats(self):
+        # bursts_assembled -- bursts whose HUD lines were built
+        # bursts_skipped   -- bursts whose HUD lines were skipped (non-owner)
+        # updates_skipped  -- live HUD UPDATEs not built (non-owner)
+        # region_reemits   -- combined bursts re-sent from the cached primary
+        self.bursts_assembled = 0
+        self.bursts_skipped = 0
+        self.updates_skipped = 0
+        self.region_reemits = 0
+
+    def hud_stats(self):
+        return {
+            'owner': self._hud_owner,
+            'bursts_assembled': self.bursts_assembled,
+            'bursts_skipped': self.bursts_skipped,
+            'updates_skipped': self.updates_skipped,
+            'region_reemits': self.region_reemits,
+        }
+
+    @property
+    def hud_owner(self):
+        return self._hud_owner
+
+    def set_hud_owner(self, flag):
+        """Apply a HUD-owner election. Gates the HudClient exactly as before
+        (silent on the wire, including HIDE) and, as a non-owner, also stops
+        building the HUD side of bursts and live updates."""
+        self._hud_owner = bool(flag)
+        self._hud_client.set_enabled(self._hud_owner)
+        if not self._hud_owner:
+            self._updates.discard_hud()
 
     def set_region_state(self, region_state):
         self._region_state = region_state
 
+    def refresh_feedback(self):
+        """Ask feedback sinks that diff against what they last wrote (Ec4Client)
+        to rewrite everything: after a controller reconnect their shadow of the
+        hardware's state can no longer be trusted."""
+        for sink in self._feedback_sinks:
+            refresh = getattr(sink, 'refresh', None)
+            if refresh is None:
+                continue
+            try:
+                refresh()
+            except Exception as e:
+                logger.error(f"feedback sink {type(sink).__name__} refresh failed: {e}")
+
     def set_autohide_on_input(self, enabled):
         """Record + emit the input-driven auto-hide flag (summon surfaces only).
         Stored so every burst re-emits it (restart-resilient), and sent once now
@@ -655,8 +754,16 @@ class Remote:
             self._hud_client.send_dividers(self._hud_dividers)
         self._hud_client.send_autohide(self._hud_autohide)
 
+    def negotiate(self, hello_line):
+        """HELLO from a (re)started HUD. Adopt the optional wire features it
+        announced (e.g. delta bursts) and drop any delta shadow, so the burst
+        the HELLO handler sends next is a full keyframe."""
+        self._hud_client.negotiate(parse_hello(hello_line))
+
     def hide(self):
         """Sticky-dismiss the HUD (HIDE). Stays hidden until the next burst."""
+        # A pending UPDATE flushed after HIDE would patch stale slots; drop it.
+        self._updates.discard_hud()
         self._hud_client.send_hide()
 
     def send_toggle(self):
@@ -673,6 +780,15 @@ class Remote:
 
     #TODO unit tests datatypes sent
     def parameter_updated(self, real_param, parameter_no):
+        if self._in_burst:
+            # Burst fill: timed as part of the burst, not as a live update.
+            self._parameter_updated(real_param, parameter_no)
+            return
+        t0 = perf_counter()
+        self._parameter_updated(real_param, parameter_no)
+        STATS.record('param_update', t0)
+
+    def _parameter_updated(self, real_param, parameter_no):
         param = real_param.param
         fields = _safe_param_fields(param, real_param.alias)
         if fields is None:
@@ -684,13 +800,76 @@ class Remote:
                 logger.error(f"[deadparam] skipped parameter_no={parameter_no}")
             return
         name, value, pmin, pmax = fields
-        self._osc_client.send_message(f"/selected-device/parameter-update",
-                                      [parameter_no, value, name, pmin, pmax, real_param.button])
-        # Live HUD update — skip on/off (index 0) and skip during the initial burst
-        if parameter_no > 0 and not self._in_burst:
-            self._hud_client.send_update('dial', parameter_no - 1, name, value, pmin, pmax)
+        osc_args = [parameter_no, value, name, pmin, pmax, real_param.button]
+        if self._in_burst:
+            # Burst fill: sent directly, in order between the burst's
+            # `/selected-device/name` and `parameter-update-complete`.
+            self._osc_client.send_message(f"/selected-device/parameter-update", osc_args)
+            return
+        self._updates.send_parameter_update(parameter_no, osc_args)
+        # Live HUD update — skip on/off (index 0)
+        if parameter_no > 0:
+            if self._region_base is not None:
+                pos = self._region_base_dial_pos.get(parameter_no - 1)
+                if pos is not None:
+                    self._region_base.dials[pos] = (
+                        parameter_no - 1, SlotPayload(name, value, pmin, pmax))
+                    if self._region_base_lines is not None:
+                        self._region_base_lines[pos] = encode_slot(
+                            'dial', parameter_no - 1, name, value, pmin, pmax)
+            if self._update_sinks:
+                self._update_feedback_sinks(parameter_no - 1, SlotPayload(name, value, pmin, pmax))
+            if not self._hud_owner:
+                self.updates_skipped += 1
+                return
+            self._updates.send_update('dial', parameter_no - 1, name, value, pmin, pmax)
 
-    def refresh_burst(self, snapshot: BurstSnapshot):
+    def _update_feedback_sinks(self, index, payload):
+        for sink in self._update_sinks:
+            try:
+                sink.on_update('dial', index, payload)
+            except Exception as e:
+                logger.error(f"feedback sink {type(sink).__name__} update failed: {e}")
+
+    def reemit_region_burst(self, suppress_hud=False):
+        """Compositor hook: the secondary region changed. Re-send the cached
+        primary burst with the region's current slots appended -- no resolver
+        or Live reads, and no OSC/feedback-sink traffic (nothing on the primary
+        changed). With delta bursts negotiated the HudClient turns this into a
+        delta carrying just the region's changed slots.
+
+        False when there is no cached primary burst; the caller then falls back
+        to a full device burst."""
+        base = self._region_base
+        if base is None:
+            return False
+        self.region_reemits += 1
+        self.refresh_burst(replace(base, suppress_hud=suppress_hud), region_only=True)
+        return True
+
+    def _remember_region_base(self, snapshot):
+        dials = list(snapshot.dials)
+        self._region_base = replace(snapshot, dials=dials, buttons=list(snapshot.buttons))
+        self._region_base_dial_pos = {idx: i for i, (idx, _p) in enumerate(dials)}
+        self._region_base_lines = None
+        return self._region_base
+
+    def _send_region_burst_slots(self):
+        """Compositor burst body: the cached primary lines, then every
+        region's (each re-encoded only if that region changed). Returns the
+        slot count for COMMIT."""
+        lines = self._region_base_lines
+        if lines is None:
+            base = self._region_base
+            lines = [encode_slot_payload('dial', i, p) for i, p in base.dials]
+            lines += [encode_slot_payload('button', i, p) for i, p in base.buttons]
+            self._region_base_lines = lines
+        region_lines = self._region_state.slot_lines()
+        self._hud_client.send_lines(lines)
+        self._hud_client.send_lines(region_lines)
+        return len(lines) + len(region_lines)
+
+    def refresh_burst(self, snapshot: BurstSnapshot, region_only=False):
         """Generic dense burst. `snapshot.dials` / `snapshot.buttons` are
         iterables of (wire_idx, SlotPayload). Caller is responsible for filling
         empty slots with hud_protocol.EMPTY_SLOT — the wire is sender-dense.
@@ -699,8 +878,19 @@ class Remote:
 
         snapshot.suppress_hud skips the HUD wire (show-hud-on='controller-nav'
         on a non-nav selection change). Feedback sinks (EC4 readouts) still fire
-        — they reflect device state regardless of the HUD trigger."""
+        — they reflect device state regardless of the HUD trigger. A surface
+        that isn't the elected HUD owner skips the HUD wire the same way.
+
+        region_only marks a `reemit_region_burst` re-send: the snapshot is the
+        cached primary burst, so it is neither re-cached nor fanned out to the
+        feedback sinks again."""
+        t0 = perf_counter()
+        if self._region_state is not None and not region_only:
+            snapshot = self._remember_region_base(snapshot)
         self._in_burst = True
+        # The burst repaints every slot from live values; a pending UPDATE
+        # flushed after it could only re-apply an older value.
+        self._updates.discard_hud()
         # Buffer the whole burst into one datagram so it lands atomically: a
         # dropped datagram loses the entire burst (HUD stays on the last good
         # device) rather than dropping a lone DEVICE frame and publishing the new
@@ -708,7 +898,10 @@ class Remote:
         # hud-burst-datagram-atomicity-plan.
         self._hud_client.begin_burst()
         try:
-            if not snapshot.suppress_hud:
+            if not self._hud_owner:
+                self.bursts_skipped += 1
+            elif not snapshot.suppress_hud:
+                self.bursts_assembled += 1
                 # Re-emit LAYOUT at the head of the burst so a HUD that started
                 # after the surface (and missed the one-shot init LAYOUT) still
                 # gets a grid. The receiver stores it in pendingCells and
@@ -728,26 +921,24 @@ class Remote:
                 # burst — empty for a non-zoned device, which clears any previous
                 # synth's tint (same stale-state care as HIDE).
                 self._hud_client.send_zones(snapshot.zone_colors)
-                # Append the secondary region's cached slots (lc_parks). These
-                # carry combined wire indices already; sent after the primary's
-                # so any same-index empty placeholder is overridden on the
-                # receiver (last-write-wins per index).
-                hud_dials = list(snapshot.dials)
-                hud_buttons = list(snapshot.buttons)
                 if self._region_state is not None:
-                    hud_dials += self._region_state.dial_payloads()
-                    hud_buttons += self._region_state.button_payloads()
-
-                count = 0
-                for idx, p in hud_dials:
-                    self._hud_client.send_slot('dial', idx, p.name, p.value, p.vmin, p.vmax)
-                    count += 1
-                for idx, p in hud_buttons:
-                    self._hud_client.send_slot('button', idx, p.name, p.value, p.vmin, p.vmax, p.glyph)
-                    count += 1
+                    # Compositor (lc_parks): the primary's slots, then the
+                    # secondary regions' cached slots. These carry combined wire
+                    # indices already; sent after the primary's so any
+                    # same-index empty placeholder is overridden on the receiver
+                    # (last-write-wins per index).
+                    count = self._send_region_burst_slots()
+                else:
+                    count = 0
+                    for idx, p in snapshot.dials:
+                        self._hud_client.send_slot('dial', idx, p.name, p.value, p.vmin, p.vmax)
+                        count += 1
+                    for idx, p in snapshot.buttons:
+                        self._hud_client.send_slot('button', idx, p.name, p.value, p.vmin, p.vmax, p.glyph)
+                        count += 1
                 self._hud_client.commit(count)
             # Fan the whole snapshot out to generic feedback sinks (EC4 readouts, etc.).
-            for sink in self._feedback_sinks:
+            for sink in (() if region_only else self._feedback_sinks):
                 try:
                     sink.on_burst(snapshot)
                 except Exception as e:
@@ -761,8 +952,26 @@ class Remote:
         finally:
             self._hud_client.flush_burst()
             self._in_burst = False
+            STATS.record('burst_wire', t0)
 
     def device_update(self, device_name, real_parameters, info_text="", switch_entries=None, device_parameters=None, hud_layout=None, mode_labels=None, page: PageInfo = None, suppress_hud=False, dial_zone_colors=None, button_zone_colors=None):
+        # Pending live updates belong to whatever was focused before; both sinks
+        # get a full resend below.
+        self._updates.discard()
+        # OSC targets configured with `bundle: true` collect name .. complete
+        # into one bundle (one datagram, atomic like the HUD burst); the rest
+        # send each message as before.
+        self._osc_client.begin_burst()
+        try:
+            self._device_update(device_name, real_parameters, info_text, switch_entries,
+                                device_parameters, hud_layout, mode_labels, page,
+                                suppress_hud, dial_zone_colors, button_zone_colors)
+        finally:
+            self._osc_client.flush_burst()
+
+    def _device_update(self, device_name, real_parameters, info_text, switch_entries,
+                       device_parameters, hud_layout, mode_labels, page, suppress_hud,
+                       dial_zone_colors, button_zone_colors):
         self._osc_client.send_message(f"/selected-device/name", [f"{device_name} [{info_text}]"])
 
         # HUD burst: suppress live UPDATE calls while we build the full snapshot.
@@ -776,17 +985,22 @@ class Remote:
         finally:
             self._in_burst = False
 
-        dial_payloads = self._build_dial_payloads(real_parameters, hud_layout)
-        button_payloads = self._build_button_payloads(switch_entries, device_parameters, hud_layout)
-        if mode_labels:
-            dial_payloads = _overlay_labels(dial_payloads, mode_labels, 'dial')
-            button_payloads = _overlay_labels(button_payloads, mode_labels, 'button')
-        zone_colors = self._build_zone_color_entries(
-            dial_zone_colors, button_zone_colors, hud_layout)
-        self.refresh_burst(BurstSnapshot(
-            device_name, dial_payloads, button_payloads,
-            page=page if page is not None else PageInfo(),
-            suppress_hud=suppress_hud, zone_colors=zone_colors))
+        if self._hud_owner or self._feedback_sinks:
+            dial_payloads = self._build_dial_payloads(real_parameters, hud_layout)
+            button_payloads = self._build_button_payloads(switch_entries, device_parameters, hud_layout)
+            if mode_labels:
+                dial_payloads = _overlay_labels(dial_payloads, mode_labels, 'dial')
+                button_payloads = _overlay_labels(button_payloads, mode_labels, 'button')
+            zone_colors = self._build_zone_color_entries(
+                dial_zone_colors, button_zone_colors, hud_layout)
+            self.refresh_burst(BurstSnapshot(
+                device_name, dial_payloads, button_payloads,
+                page=page if page is not None else PageInfo(),
+                suppress_hud=suppress_hud, zone_colors=zone_colors))
+        else:
+            # Non-owner with no feedback sinks: nothing would consume the
+            # payloads, so don't build them. OSC above already went out.
+            self.bursts_skipped += 1
 
         self._osc_client.send_message(f"/selected-device/parameter-update-complete", [min(len(real_parameters), 16)])
 
@@ -52,7 +52,9 @@ class HudArbiter:
     Only the elected owner's HudClient stays enabled; the rest go silent on
     the HUD (see HudClient.set_enabled) -- this kills both the cross-surface
     HIDE flicker and burst interleaving by construction, since the HUD only
-    ever hears from one sender.
+    ever hears from one sender. Ownership is applied through
+    `Remote.set_hud_owner`, so a non-owner also skips building the HUD side of
+    its bursts (OSC and feedback sinks keep flowing).
 
     Built on two facts about the Ableton Remote Script host:
     - `ControlSurface.__init__` publishes `self` into a registry shared across
@@ -111,9 +113,11 @@ class HudArbiter:
         was_owner = self._is_owner
         self._is_owner = elect_hud_owner(siblings, self.manager)
 
-        hud_client = getattr(self.manager.main_component, '_hud_client', None)
-        if hud_client is not None:
-            hud_client.set_enabled(self._is_owner)
+        # Remote gates its HudClient and, as a non-owner, also stops
+        # assembling the HUD side of bursts.
+        remote = getattr(self.manager.main_component, '_remote', None)
+        if remote is not None:
+            remote.set_hud_owner(self._is_owner)
 
         if self._is_owner and not was_owner:
             # Just became owner (first election, or the previous owner
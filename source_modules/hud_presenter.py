@@ -11,13 +11,99 @@ fires events (`DeviceFocus`, `ModeChange`, `ClipViewChanged`, `ViewLeft`,
 changes inside `HudVisibility.apply`. The hud_toggle button is HUD-arbitrated
 (see `toggle`) and does not fire a table event.
 """
-from .param_resolver import ParameterMapping, SwitchSlotMapping, _device_alive
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Optional
+
+from .param_resolver import (
+    ParameterMapping, SwitchSlotMapping, ResolutionPlan, _device_alive, _same_device,
+)
 from .hud_protocol import PageInfo, IDLE_DISMISS_SECONDS
+from .latency_stats import STATS
 from .hud_visibility import (
     HudVisibility, Decision, DeviceFocus, ModeChange, ViewLeft, RegionCommit,
     ClipViewChanged,
 )
 
+# Devices remembered by the burst cache. A set is typically a handful of
+# devices per track; 16 covers flipping around a track or two without holding
+# on to every device ever focused.
+BURST_CACHE_SIZE = 16
+
+
+@dataclass
+class BurstSkeleton:
+    """Everything in a burst that doesn't depend on parameter values, for one
+    (device, mode, encoder page, button page). `plan` carries the resolved
+    indices/names/aliases (adopted back into the resolver on a revisit); the
+    rest is what the presenter would otherwise re-derive — zone tints and the
+    page totals/label, which walk the device's banks or parameter list.
+    `param_count` is the cheap guard against a list rebuilt to a new length.
+    The page fields are HUD-only and stay None until an owner burst needs them."""
+    plan: Optional[ResolutionPlan]
+    param_count: int
+    dial_zone_colors: list
+    button_zone_colors: dict
+    enc_total: Optional[int] = None
+    btn_total: Optional[int] = None
+    enc_label: Optional[str] = None
+
+
+class BurstCache:
+    """Small LRU of BurstSkeletons keyed by device identity + a hashable key.
+
+    Live device handles aren't reliably hashable and go dead on delete/replace,
+    so entries are a short most-recent-last list matched with `_same_device`
+    (fail-open, never raises). An entry whose handle is dead is dropped as soon
+    as a lookup reaches it; the oldest entry goes when the size bound is hit."""
+
+    def __init__(self, max_entries=BURST_CACHE_SIZE):
+        self._max_entries = max_entries
+        self._entries = []  # [device, key, skeleton], most recently used last
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.dead = 0
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'dead': self.dead, 'size': len(self._entries)}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, device, key):
+        # Newest first: the common revisit is the device just left. Indices are
+        # walked downwards so deleting a dead entry doesn't shift the rest.
+        for i in range(len(self._entries) - 1, -1, -1):
+            entry_device, entry_key, skeleton = self._entries[i]
+            if entry_key != key:
+                continue
+            if not _device_alive(entry_device):
+                del self._entries[i]
+                self.dead += 1
+                continue
+            if _same_device(device, entry_device):
+                self._entries.append(self._entries.pop(i))
+                self.hits += 1
+                return skeleton
+        self.misses += 1
+        return None
+
+    def put(self, device, key, skeleton):
+        self._entries = [e for e in self._entries
+                         if not (e[1] == key and _same_device(device, e[0]))]
+        self._entries.append([device, key, skeleton])
+        while len(self._entries) > self._max_entries:
+            self._entries.pop(0)
+            self.evictions += 1
+
+    def clear(self):
+        self._entries = []
+
 
 class HudPresenter:
     def __init__(self, remote, resolver, slot_assignments, switch_slot_assignments,
@@ -49,6 +135,14 @@ class HudPresenter:
         # the Swift sticky-dismiss flag; a real burst clears it. Shares the trace
         # sink so the decide() line interleaves with the presenter's own lines.
         self._visibility = HudVisibility(hud_trigger, fine=self._fine)
+        # Value-independent burst parts per (device, mode, pages): flipping back
+        # to a recently focused device reuses its resolution + page metadata and
+        # only re-reads parameter values.
+        self._burst_cache = BurstCache()
+        # Device of the last device burst, i.e. the one Remote's cached primary
+        # burst belongs to. reemit_combined_burst only re-sends that cache for
+        # this device; anything else takes the full emit_burst path.
+        self._burst_device = None
 
     @property
     def hud_dismissed(self):
@@ -85,8 +179,10 @@ class HudPresenter:
         # funnel re-bursts against the live device.
         if not _device_alive(device):
             self._fine("[burst] emit_burst skipped: dead/removed device handle")
+            self._burst_device = None
             self._remote.hide()
             return
+        t0 = perf_counter()
         # Single source of truth: if this burst is for a device the funnel never
         # reset (a bypassed selection path), drop the stale name index + paging
         # here so the burst can't inherit the previous device's page/index.
@@ -105,16 +201,22 @@ class HudPresenter:
             f"suppress_hud={suppress_hud} mode={self._current_mode_name!r} "
             f"burst_mode={burst_mode!r}"
         )
-        # Zone colour tints apply only to a zoned device, but then to EVERY
-        # template slot — an unmapped/dim slot still shows its zone hue (colour
-        # is a template property, not tied to what resolved).
-        zoned = self._resolver.is_zoned(device)
-        on_off = ParameterMapping.on_off().with_real_param(device.parameters[0])
+        params = device.parameters
+        cache_key = (burst_mode, self._resolver.encoder_page, self._resolver.button_page)
+        skeleton = self._burst_cache.get(device, cache_key)
+        if skeleton is not None and skeleton.param_count != len(params):
+            skeleton = None
+        if skeleton is not None:
+            # Revisit: the kept plan turns every resolve below into a lookup +
+            # liveness check. A stale slot makes the resolver drop it, which the
+            # plan-identity check after the loops picks up.
+            self._resolver.adopt_plan(skeleton.plan)
+            dial_zone_colors = skeleton.dial_zone_colors
+            button_zone_colors = skeleton.button_zone_colors
+        else:
+            dial_zone_colors, button_zone_colors = self._zone_colors(device, burst_mode)
+        on_off = ParameterMapping.on_off().with_real_param(params[0])
         real_params = [on_off]
-        # dial_zone_colors is kept parallel to real_params (index 0 = Device On
-        # = no tint), so `_build_zone_color_entries` can index it exactly like
-        # the dial payloads.
-        dial_zone_colors = [None]
         # Append unconditionally — a None placeholder for a failed resolve
         # keeps the wire-index alignment in `_build_dial_payloads`. Squashing
         # Nones here shifts every later encoder one slot left on the HUD.
@@ -122,8 +224,6 @@ class HudPresenter:
         for c_idx, _slot in sorted(self._active_slot_assignments(burst_mode)):
             rp = self._resolver.resolve_encoder(device, c_idx)
             real_params.append(rp)
-            dial_zone_colors.append(
-                self._resolver.color_for_slot('dial', c_idx) if zoned else None)
             if rp is None:
                 missing_c_idxs.append(c_idx)
         if missing_c_idxs:
@@ -135,17 +235,10 @@ class HudPresenter:
                 f"enc_page={self._resolver.encoder_page} unresolved_c_idxs={missing_c_idxs}"
             )
         switch_entries = []
-        button_zone_colors = {}
         for wire_idx, slot in self._active_switch_slot_assignments(burst_mode):
             # slot is a 1-based device switch-slot int; it drives JSON-table
             # parameter resolution. wire_idx is the HUD button index assigned
             # at codegen.
-            # Tint by zone before resolving — an unmapped button still shows its
-            # zone hue (dim), so the colour must not depend on info being non-None.
-            if zoned:
-                c = self._resolver.color_for_slot('button', slot)
-                if c:
-                    button_zone_colors[wire_idx] = c
             logical_idx = slot - 1
             info = self._resolver.resolve_switch(device, logical_idx)
             if info is None:
@@ -155,31 +248,52 @@ class HudPresenter:
             if kind == 'param':
                 switch_entries.append(SwitchSlotMapping(wire_idx, info['d_idx'], alias))
             else:
+                # LOM payloads carry live state (track arm, etc.) — never cached.
                 payload = self._resolver.lom_slot_payload(info)
                 if payload is not None:
                     switch_entries.append(SwitchSlotMapping(wire_idx, None, alias, payload))
         info_text = f"e{self._resolver.encoder_page}/b{self._resolver.button_page}"
         mode_labels = self._mode_hud_labels.get(burst_mode)
-        enc_total = self._resolver.encoder_pages_count(device)
-        btn_total = self._resolver.button_pages_count(device)
-        enc_label = self._resolver.page_label_for(device, self._resolver.encoder_page)
-        btn_label = ''  # button pages don't use named banks
+        if skeleton is None or self._resolver.current_plan() is not skeleton.plan:
+            skeleton = BurstSkeleton(
+                plan=self._resolver.current_plan(),
+                param_count=len(params),
+                dial_zone_colors=dial_zone_colors,
+                button_zone_colors=button_zone_colors,
+            )
+            self._burst_cache.put(device, cache_key, skeleton)
+        page = None
+        if self._remote.hud_owner:
+            # Page totals/labels only ever reach the HUD PAGE line; a surface
+            # that lost HUD-owner election doesn't walk the banks for them.
+            if skeleton.enc_total is None:
+                skeleton.enc_total = self._resolver.encoder_pages_count(device)
+                skeleton.btn_total = self._resolver.button_pages_count(device)
+                skeleton.enc_label = self._resolver.page_label_for(
+                    device, self._resolver.encoder_page)
+            page = PageInfo(enc_page=self._resolver.encoder_page, enc_total=skeleton.enc_total,
+                            btn_page=self._resolver.button_page, btn_total=skeleton.btn_total,
+                            enc_label=skeleton.enc_label,
+                            btn_label='')  # button pages don't use named banks
         self._remote.device_update(
-            device.name, real_params, info_text, switch_entries, device.parameters,
+            device.name, real_params, info_text, switch_entries, params,
             hud_layout=self._hud_cells, mode_labels=mode_labels,
-            page=PageInfo(enc_page=self._resolver.encoder_page, enc_total=enc_total,
-                          btn_page=self._resolver.button_page, btn_total=btn_total,
-                          enc_label=enc_label, btn_label=btn_label),
+            page=page,
             suppress_hud=suppress_hud,
             dial_zone_colors=dial_zone_colors,
             button_zone_colors=button_zone_colors,
         )
+        self._burst_device = device
+        self._apply_burst_visibility(suppress_hud)
+        STATS.record('burst', t0)
+
+    def _apply_burst_visibility(self, suppress_hud):
         if not suppress_hud:
             # A real burst clears the Swift sticky dismissed flag — re-sync intent.
             self._visibility.apply(Decision.EMIT_BURST)
         else:
             # Suppressed (controller-nav mode, non-nav selection change). The
-            # device_update above kept OSC + feedback sinks flowing but emitted
+            # burst's device_update kept OSC + feedback sinks flowing but emitted
             # no HUD burst. We must also send HIDE: otherwise the next live
             # `send_update` (turning a knob) would wake the HUD — UPDATE is a
             # show path while the Swift `dismissed` flag is clear — and patch the
@@ -190,6 +304,33 @@ class HudPresenter:
             self._remote.hide()
             self._visibility.apply(Decision.EMIT_SILENT_AND_HIDE)
 
+    def _zone_colors(self, device, burst_mode):
+        """(dial_zone_colors, button_zone_colors) for a burst. Zone colour tints
+        apply only to a zoned device, but then to EVERY template slot — an
+        unmapped/dim slot still shows its zone hue (colour is a template
+        property, not tied to what resolved). dial_zone_colors is kept parallel
+        to real_params (index 0 = Device On = no tint), so
+        `_build_zone_color_entries` can index it exactly like the dial
+        payloads; button_zone_colors is keyed by wire index."""
+        zoned = self._resolver.is_zoned(device)
+        dial_zone_colors = [None]
+        for c_idx, _slot in sorted(self._active_slot_assignments(burst_mode)):
+            dial_zone_colors.append(
+                self._resolver.color_for_slot('dial', c_idx) if zoned else None)
+        button_zone_colors = {}
+        if zoned:
+            for wire_idx, slot in self._active_switch_slot_assignments(burst_mode):
+                c = self._resolver.color_for_slot('button', slot)
+                if c:
+                    button_zone_colors[wire_idx] = c
+        return dial_zone_colors, button_zone_colors
+
+    def burst_cache_stats(self):
+        return self._burst_cache.stats()
+
+    def reset_burst_cache_stats(self):
+        self._burst_cache.reset_stats()
+
     def on_device_focus(self, device, source):
         """A device became focused (source 'nav' | 'selection'). The single
         visibility table decides whether this shows the HUD or only feeds the
@@ -243,7 +384,15 @@ class HudPresenter:
             # suppressed (OSC/sinks still flow, HUD wire skipped + HIDE) rather
             # than re-showing over the clip editor.
             decision = self._visibility.decide(RegionCommit())
-            self.emit_burst(device, suppress_hud=(decision is Decision.EMIT_SILENT_AND_HIDE))
+            suppress_hud = decision is Decision.EMIT_SILENT_AND_HIDE
+            # Only the region changed: re-send the primary's cached burst with
+            # the new region rather than re-resolving the device, as long as
+            # that cache is this device's.
+            if device is self._burst_device and self._remote.reemit_region_burst(suppress_hud):
+                self._fine(f"[burst] region re-emit suppress_hud={suppress_hud}")
+                self._apply_burst_visibility(suppress_hud)
+                return
+            self.emit_burst(device, suppress_hud=suppress_hud)
 
     def refresh_for_mode(self, mode_name, device):
         """Called by the surface when goto_mode swaps bindings. Sets the active
@@ -281,6 +430,7 @@ class HudPresenter:
             self.emit_burst(device, suppress_hud=suppress_hud)
         else:
             # No focused device yet — emit a label-only burst.
+            self._burst_device = None
             mode_labels = self._mode_hud_labels.get(self._current_mode_name) or {}
             self._remote.device_update(
                 '', [], info_text='', switch_entries=[], device_parameters=[],
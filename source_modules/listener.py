@@ -2,10 +2,10 @@
 OSC listener class for receiving OSC messages.
 """
 
-import errno
 import socket
 import traceback
 
+from .io_hub import IoHub
 from .pythonosc.osc_message import OscMessage
 
 
@@ -13,7 +13,7 @@ class OSCListener:
     """
     A listener for OSC messages that sets up a UDP socket and processes received messages.
     """
-    def __init__(self, manager, button_handler, port=5015, name="surface"):
+    def __init__(self, manager, button_handler, port=5015, name="surface", hub=None):
         """
         Initialize the OSC listener.
 
@@ -23,68 +23,41 @@ class OSCListener:
             port: UDP port to bind for OSC button input. Must be unique per
                 surface so multiple surfaces can run at once (set by codegen).
             name: surface name, for log messages.
+            hub: the surface's IoHub, which polls this socket alongside the
+                others; a listener built without one gets its own.
         """
         self._manager = manager
+        self.button_handler = button_handler
+        self._socket = None
         try:
             self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self._socket.setblocking(0)
             self._socket.bind(('0.0.0.0', port))
             self.log_message(f"{name}: OSC button listener on port {port}")
 
-            self._manager.schedule_message(1, self.tick)
+            hub = hub if hub is not None else IoHub(manager, name=name)
+            hub.register(self._socket, self.on_datagram, bufsize=1024, label=f"{name}-osc")
         except Exception as e:
             self.log_message(f"{name}: OSC listener socket error on port {port}: {traceback.format_exc()}")
-        self.button_handler = button_handler
-    
+
     def log_message(self, msg):
         """
         Log a message using the manager.
-        
+
         Args:
             msg: The message to log
         """
         self._manager.log_message(msg)
-    
-    def tick(self):
+
+    def on_datagram(self, data, addr):
         """
-        Process any received OSC messages.
-        This method is called periodically by the manager.
+        Process one received OSC message. Called by the IoHub poll loop.
         """
-        # self.log_message(f"Ticking..")
-        try:
-            while True:
-                data, addr = self._socket.recvfrom(1024)
-                self.log_message(f"data = {data}")
-                response = None
-
-                message = OscMessage(data)
-                self.log_message(f"message.address: {message.address}")
-                self.log_message(f"message.params: {message.params}")
+        self.log_message(f"data = {data}")
 
-                if message.address == '/button/down':
-                    if len(message.params) > 1:
-                        self.button_handler(message.params[0], message.params[1])
+        message = OscMessage(data)
+        self.log_message(f"message.address: {message.address}")
+        self.log_message(f"message.params: {message.params}")
 
-                if response is not None:
-                    self._socket.sendto(response, addr)
-                    print(f"Sent response to {addr}")
-                
-        except socket.error as e:
-            if e.errno == errno.ECONNRESET:
-                #--------------------------------------------------------------------------------
-                # This benign error seems to occur on startup on Windows
-                #--------------------------------------------------------------------------------
-                self.log_message(f"ck_launch_control_16: Non-fatal socket error: {traceback.format_exc}")
-            elif e.errno == errno.EAGAIN or e.errno == errno.EWOULDBLOCK:
-                #--------------------------------------------------------------------------------
-                # Another benign networking error, throw when no data is received
-                # on a call to recvfrom() on a non-blocking socket
-                #--------------------------------------------------------------------------------
-                pass
-            else:
-                #--------------------------------------------------------------------------------
-                # Something more serious has happened
-                #--------------------------------------------------------------------------------
-                self.log_message(f"ck_launch_control_16: Socket error: {traceback.format_exc()}")
-        
-        self._manager.schedule_message(1, self.tick)
\ No newline at end of file
+        if message.address == '/button/down':
+            if len(message.params) > 1:
+                self.button_handler(message.params[0], message.params[1])
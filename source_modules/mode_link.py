@@ -8,22 +8,23 @@ NAME over UDP; the secondary receives it and calls its own `goto_mode`, swapping
 its listeners and re-forwarding its HUD region so the combined HUD repaints.
 
 `ModeSender` is the primary side (a tiny UDP line sender, modelled on HudClient).
-`ModeListener` is the secondary side (a non-blocking poll loop, modelled on
-RegionListener). Both are inert/absent on standalone surfaces.
+`ModeListener` is the secondary side (a socket polled by the surface's `IoHub`,
+like RegionListener). Both are inert/absent on standalone surfaces.
 """
-import errno
 import socket
 import traceback
 
 from . import hud_protocol
+from .io_hub import IoHub
 
 
 class ModeSender:
-    """Primary side: send the active mode name to the secondary's mode port."""
+    """Primary side: send the active mode name to the secondary's mode port --
+    or to each of them, when `port` is a list (one per secondary with modes)."""
 
     def __init__(self, host='127.0.0.1', port=0):
         self._host = host
-        self._port = port
+        self._ports = list(port) if isinstance(port, (list, tuple)) else [port]
         self._socket = None
         try:
             self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -34,30 +35,34 @@ class ModeSender:
         if self._socket is None:
             return
         try:
-            line = hud_protocol.encode_set_mode(name) + '\n'
-            self._socket.sendto(line.encode('utf-8'), (self._host, self._port))
+            payload = (hud_protocol.encode_set_mode(name) + '\n').encode('utf-8')
         except Exception:
-            pass
+            return
+        for port in self._ports:
+            try:
+                self._socket.sendto(payload, (self._host, port))
+            except Exception:
+                pass
 
 
 class ModeListener:
     """Secondary side: receive forwarded mode names and drive `target.goto_mode`.
 
-    Mirrors `region_listener.RegionListener`'s non-blocking tick loop (driven by
-    `manager.schedule_message`). `target` is the surface's main_component.
+    Polled by the surface's `IoHub` (its own when none is passed), like
+    `region_listener.RegionListener`. `target` is the surface's main_component.
     """
 
-    def __init__(self, manager, target, port, name="mode"):
+    def __init__(self, manager, target, port, name="mode", hub=None):
         self._manager = manager
         self._target = target
         self._name = name
         self._socket = None
         try:
             self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self._socket.setblocking(0)
             self._socket.bind(('127.0.0.1', port))
             self.log_message(f"{name}: mode listener on port {port}")
-            self._manager.schedule_message(1, self.tick)
+            hub = hub if hub is not None else IoHub(manager, name=name)
+            hub.register(self._socket, self.on_datagram, bufsize=4096, label=name)
         except Exception:
             self.log_message(f"{name}: mode listener socket error on port {port}: {traceback.format_exc()}")
 
@@ -69,16 +74,5 @@ class ModeListener:
             if isinstance(msg, hud_protocol.SetModeMsg):
                 self._target.goto_mode(msg.name)
 
-    def tick(self):
-        try:
-            while True:
-                data, _addr = self._socket.recvfrom(4096)
-                self._handle(data.decode('utf-8', errors='replace'))
-        except socket.error as e:
-            if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK, errno.ECONNRESET):
-                pass
-            else:
-                self.log_message(f"{self._name}: mode socket error: {traceback.format_exc()}")
-        except Exception:
-            self.log_message(f"{self._name}: mode listener error: {traceback.format_exc()}")
-        self._manager.schedule_message(1, self.tick)
+    def on_datagram(self, data, _addr):
+        self._handle(data.decode('utf-8', errors='replace'))
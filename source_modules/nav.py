@@ -1,4 +1,93 @@
-import Live
+from .name_index import live_key, ListenerSet
+
+
+def _nav_direction():
+    # Imported lazily so TrackPositions is unit-testable without Live.
+    import Live
+    return Live.Application.Application.View.NavDirection
+
+
+class TrackPositions:
+    """Navigation order of the song's tracks and each track's position in it.
+
+    Track nav used to call `list(song.tracks).index(selected)` on every press:
+    the whole track list materialised and searched linearly, per press, per
+    step of a multi-step jump. Here the order -- visible tracks (children of a
+    folded group are not visible, so they are skipped), then return tracks,
+    then master -- is built once, with a position dict keyed like NameIndex.
+
+    The song's `tracks`, `visible_tracks` (fold/unfold) and `return_tracks`
+    listeners only mark it stale; it is rebuilt on the next press. A song that
+    can't be watched is rebuilt on every press, as before."""
+
+    def __init__(self, song):
+        self._song = song
+        self._order = None          # None = stale
+        self._built = []            # last build, kept or not
+        self._positions = {}
+        self._listeners = ListenerSet()
+        self.builds = 0
+
+    def order(self):
+        if self._order is not None:
+            return self._order
+        self._listeners.clear()
+        song = self._song
+        order = list(song.visible_tracks) + list(song.return_tracks) + [song.master_track]
+        self._positions = {live_key(t): i for i, t in enumerate(order) if t is not None}
+        self._built = order
+        self.builds += 1
+        try:
+            for prop in ('tracks', 'visible_tracks', 'return_tracks'):
+                self._listeners.add(song, prop, self._invalidate)
+        except Exception:
+            self._listeners.clear()
+            return order
+        self._order = order
+        return order
+
+    def position(self, track):
+        """Index of `track` in `order()`. A child of a folded group resolves to
+        its visible group track; None when the track isn't in the song."""
+        if track is None:
+            return None
+        self.order()
+        p = self._positions.get(live_key(track))
+        if p is not None:
+            return p
+        group = getattr(track, 'group_track', None)
+        while group is not None:
+            p = self._positions.get(live_key(group))
+            if p is not None:
+                return p
+            group = getattr(group, 'group_track', None)
+        # A track added under us without a notification: one rebuild.
+        if self._order is not None:
+            self._invalidate()
+            self.order()
+            return self._positions.get(live_key(track))
+        return None
+
+    def step(self, track, n, wrap=False):
+        """Track `n` positions from `track` (negative = towards the first),
+        wrapping around master when `wrap`, else stopping at either end."""
+        p = self.position(track)
+        if p is None:
+            return None
+        order = self._built
+        p += n
+        p = p % len(order) if wrap else max(0, min(p, len(order) - 1))
+        return order[p]
+
+    def _invalidate(self):
+        self._order = None
+
+    def release(self):
+        """Detach the song listeners (surface disconnect)."""
+        self._listeners.clear()
+        self._order = None
+        self._built = []
+        self._positions = {}
 
 
 class Nav:
@@ -6,14 +95,16 @@ class Nav:
     def __init__(self, manager):
         self._manager = manager
         self._song = self._manager.song()
+        self._positions = TrackPositions(self._song)
+
+    def disconnect(self):
+        self._positions.release()
 
     def device_nav_left(self):
-        NavDirection = Live.Application.Application.View.NavDirection
-        self._scroll_device_chain(NavDirection.left)
+        self._scroll_device_chain(_nav_direction().left)
 
     def device_nav_right(self):
-        NavDirection = Live.Application.Application.View.NavDirection
-        self._scroll_device_chain(NavDirection.right)
+        self._scroll_device_chain(_nav_direction().right)
 
     def _scroll_device_chain(self, direction):
         view = self._manager.application().view
@@ -24,29 +115,17 @@ class Nav:
             view.scroll_view(direction, 'Detail/DeviceChain', False)
 
     def track_nav_inc(self):
-        all_tracks = len(self._song.tracks)
-        selected_track = self._song.view.selected_track  # Get the currently selected track
-
-        self._manager.log_message(f"Selected track name is {selected_track.name}")
-
-        if selected_track.name == "Master":
-            self._manager.log_message("Can't increment from Master")
-
-        next_index = list(self._song.tracks).index(selected_track) + 1  # Get the index of the selected track
-
-        if next_index < all_tracks:
-            self._song.view.selected_track = self._song.tracks[next_index]
+        self.track_nav_by(1)
 
     def track_nav_dec(self):
-        selected_track = self._song.view.selected_track  # Get the currently selected track
-
-        if selected_track.name == "Master":
-            next_index = len(list(self._song.tracks)) - 1
-        else:
-            next_index = list(self._song.tracks).index(selected_track) - 1  # Get the index of the selected track
+        self.track_nav_by(-1)
 
-        if next_index >= 0:
-            self._song.view.selected_track = self._song.tracks[next_index]
+    def track_nav_by(self, n, wrap=False):
+        """Select the track `n` positions away (see TrackPositions for the order)."""
+        selected_track = self._song.view.selected_track
+        target = self._positions.step(selected_track, n, wrap)
+        if target is not None and target != selected_track:
+            self._song.view.selected_track = target
 
     def device_nav_first_last(self):
         devices = self._song.view.selected_track.devices
@@ -60,14 +139,14 @@ class Nav:
             self.device_nav_last()
 
     def device_nav_first(self):
-        NavDirection = Live.Application.Application.View.NavDirection
+        NavDirection = _nav_direction()
         devices = self._song.view.selected_track.devices
 
         for i in range(0, len(devices) + 3):
             self._scroll_device_chain(NavDirection.left)
 
     def device_nav_last(self):
-        NavDirection = Live.Application.Application.View.NavDirection
+        NavDirection = _nav_direction()
         devices = self._song.view.selected_track.devices
 
         for i in range(0, len(devices) + 3):
@@ -1,34 +1,241 @@
 import logging
+import struct
 
+from .latency_stats import STATS
 from .pythonosc.udp_client import SimpleUDPClient
 from .pythonosc.osc_message_builder import ArgValue
+from .pythonosc.parsing import osc_types
+from .send_queue import BURST, UPDATE
+
+# '#bundle' + the IMMEDIATELY time tag: every burst bundle starts with these 16
+# bytes, so they are written once here rather than per flush.
+_BUNDLE_HEADER = b'#bundle\x00' + osc_types.write_date(osc_types.IMMEDIATELY)
+
+_TAG_BY_TYPE = {float: 'f', str: 's', bytes: 'b', type(None): 'N'}
+_NUMERIC_TAGS = {'i': 'i', 'h': 'q', 'f': 'f', 'd': 'd'}
+
+
+def _type_tags(values):
+    """The OSC type tag string `OscMessageBuilder` would infer for `values`, or
+    None when one of them needs the builder (arrays, MIDI tuples, subclasses)."""
+    tags = ''
+    for v in values:
+        tag = _TAG_BY_TYPE.get(type(v))
+        if tag is None:
+            t = type(v)
+            if t is int:
+                tag = 'h' if v.bit_length() > 32 else 'i'
+            elif t is bool:
+                tag = 'T' if v else 'F'
+            else:
+                return None
+        tags += tag
+    return tags
+
+
+def _osc_string(v):
+    b = v.encode('utf-8')
+    return b + b'\x00' * (4 - len(b) % 4)
+
+
+class MessageTemplate:
+    """One (address, type tags) pair, compiled: the address and type tag
+    strings are encoded and padded once into `prefix`, and each run of
+    consecutive numeric arguments packs through a single precompiled Struct.
+    `encode(values)` then only packs the argument payload."""
+    __slots__ = ('prefix', 'steps')
+
+    def __init__(self, address, tags):
+        self.prefix = osc_types.write_string(address) + osc_types.write_string(',' + tags)
+        # (kind, arg): kind 'n' packs values[start:stop] with arg=(pack, start,
+        # stop); 's' / 'b' encode values[arg]. T/F/N carry no payload.
+        steps = []
+        run_start, run_codes = None, ''
+        for i, tag in enumerate(tags + ' '):
+            code = _NUMERIC_TAGS.get(tag)
+            if code is not None:
+                if run_start is None:
+                    run_start = i
+                run_codes += code
+                continue
+            if run_start is not None:
+                steps.append(('n', (struct.Struct('>' + run_codes).pack, run_start, i)))
+                run_start, run_codes = None, ''
+            if tag == 's':
+                steps.append(('s', i))
+            elif tag == 'b':
+                steps.append(('b', i))
+        self.steps = tuple(steps)
+
+    def encode(self, values):
+        parts = [self.prefix]
+        for kind, arg in self.steps:
+            if kind == 'n':
+                pack, start, stop = arg
+                parts.append(pack(*values[start:stop]))
+            elif kind == 's':
+                parts.append(_osc_string(values[arg]))
+            else:
+                parts.append(osc_types.write_blob(values[arg]))
+        return b''.join(parts)
+
+
+class MessageTemplates:
+    """Compiled `MessageTemplate`s keyed by (address, type tags). The surface
+    sends a handful of fixed addresses, so after the first few sends every
+    message is a dict hit plus the argument packing. Produces the same bytes
+    as `OscMessageBuilder`; anything it can't template returns None and the
+    caller falls back to the builder."""
+
+    # Addresses are literals in this codebase; the cap only stops a caller
+    # that formats values into addresses from growing the table without bound.
+    MAX_TEMPLATES = 256
+
+    def __init__(self):
+        self._templates = {}
+        self.compiled = 0
+
+    def encode(self, address, value):
+        if value is None:
+            values = ()
+        elif type(value) in (list, tuple):
+            values = value
+        elif isinstance(value, (str, bytes, int, float)):
+            values = (value,)
+        else:
+            return None
+        tags = _type_tags(values)
+        if tags is None:
+            return None
+        key = (address, tags)
+        template = self._templates.get(key)
+        if template is None:
+            if len(self._templates) >= self.MAX_TEMPLATES:
+                self._templates.clear()
+            template = self._templates[key] = MessageTemplate(address, tags)
+            self.compiled += 1
+        return template.encode(values)
+
+
+# Shared by every OSCClient of this surface: the addresses are the same for
+# every target, so one table compiles each of them once.
+TEMPLATES = MessageTemplates()
+
+
+class _BufferingUDPClient(SimpleUDPClient):
+    # `send_dgram` is the one place an encoded datagram is in hand: it counts
+    # what actually went out (for the `stats` command) and, while `buffer` is a
+    # list, collects datagrams for a bundle instead of sending them. With a
+    # `sender` the write itself happens on the send_queue thread; `kind` is
+    # BURST between begin_burst/flush_burst so burst messages are never dropped.
+    def __init__(self, host, port):
+        super().__init__(host, port)
+        self.buffer = None
+        self.sender = None
+        self.kind = UPDATE
+
+    def send(self, content):
+        # Builder path (SimpleUDPClient.send_message) lands here.
+        self.send_dgram(content.dgram)
+
+    def send_dgram(self, dgram):
+        if self.buffer is not None:
+            self.buffer.append(dgram)
+            return
+        if self.sender is not None:
+            # Counted by the sender thread once the write succeeds.
+            self.sender.put(self._sock, dgram, (self._address, self._port), self.kind,
+                            stat='osc')
+            return
+        self._sock.sendto(dgram, (self._address, self._port))
+        STATS.add('osc_datagrams')
+        STATS.add('osc_bytes', len(dgram))
 
 
 class NullOSCClient:
     def send_message(self, address: str, value: ArgValue) -> None:
         pass
 
+    def begin_burst(self): pass
+    def flush_burst(self): pass
+
 
 class OSCClient:
 
-    def __init__(self, host='127.0.0.1', port=5005):
-        self.client = SimpleUDPClient(host, port)
+    def __init__(self, host='127.0.0.1', port=5005, bundle=False):
+        """`bundle`: send each device burst (name, parameter updates, complete)
+        as one OSC bundle instead of one datagram per message. Opt-in per
+        output target — a receiver must unpack `#bundle` datagrams."""
+        self.client = _BufferingUDPClient(host, port)
         self.logger = logging.getLogger("osc-client")
+        self._bundle = bundle
+        # Same ceiling as HudClient._max_datagram: a bigger bundle is sent as
+        # its individual messages rather than risk EMSGSIZE losing all of it.
+        self._max_datagram = 8192
 
         self.logger.info(f"OSCClient created with host {host} and port {port}")
 
     def send_message(self, address: str, value: ArgValue) -> None:
         try:
-            self.client.send_message(address, value)
+            dgram = TEMPLATES.encode(address, value)
+            if dgram is None:
+                self.client.send_message(address, value)
+            else:
+                self.client.send_dgram(dgram)
         except Exception as e:
             self.logger.error(f"Error sending OSC message {address} {value} {e}")
 
+    def set_sender(self, sender):
+        """Write through a send_queue.SendQueue instead of inline."""
+        self.client.sender = sender
+
+    def begin_burst(self):
+        """Start collecting messages for one bundle (no-op unless bundling)."""
+        self.client.kind = BURST
+        if self._bundle:
+            self.client.buffer = []
+
+    def flush_burst(self):
+        """Send what was collected since `begin_burst` as a single bundle. The
+        time tag is IMMEDIATELY: the bundle is for atomicity, not scheduling, and
+        a wall-clock tag would be delayed by a receiver whose clock runs behind."""
+        messages, self.client.buffer = self.client.buffer, None
+        if not messages:
+            self.client.kind = UPDATE
+            return
+        try:
+            parts = [_BUNDLE_HEADER]
+            for dgram in messages:
+                parts.append(struct.pack('>i', len(dgram)))
+                parts.append(dgram)
+            bundle = b''.join(parts)
+            if len(bundle) <= self._max_datagram:
+                self.client.send_dgram(bundle)
+                return
+            for dgram in messages:
+                self.client.send_dgram(dgram)
+        except Exception as e:
+            self.logger.error(f"Error sending OSC bundle of {len(messages)} messages: {e}")
+        finally:
+            self.client.kind = UPDATE
+
 
 class OSCMultiClient:
 
-    def __init__(self, clients: list[OSCClient]):
+    def __init__(self, clients: list[OSCClient], sender=None):
         self.clients = clients
+        if sender is not None:
+            for client in clients:
+                client.set_sender(sender)
 
     def send_message(self, address: str, value: ArgValue) -> None:
         for client in self.clients:
             client.send_message(address, value)
+
+    def begin_burst(self):
+        for client in self.clients:
+            client.begin_burst()
+
+    def flush_burst(self):
+        for client in self.clients:
+            client.flush_burst()
@@ -7,6 +7,12 @@ introspection. It has no Live-surface coupling — its only outside dependency i
 a `log` callable — so it is testable with plain data and fakes, not a whole
 surface. The Live-coupled side (writing parameter.value, listeners, messages)
 stays in Helpers, which owns one of these and delegates to it.
+
+Encoder/switch resolution is compiled: the first resolve of a slot walks the
+tiers and records the parameter's index in a `ResolutionPlan` for the current
+(device, encoder page, button page); later resolves are an index plus one
+liveness check. The mode needs no key of its own — modes only change which
+c_idx a control maps to, never what a c_idx resolves to.
 """
 from dataclasses import dataclass
 from typing import Any, Optional
@@ -48,6 +54,42 @@ class SwitchSlotMapping:
     payload: Optional[SlotPayload] = None  # set for LOM-kind entries
 
 
+@dataclass(frozen=True)
+class PlanSlot:
+    """One compiled slot of a `ResolutionPlan`: where the parameter lives
+    (`d_idx` into `device.parameters`) plus the attribute/value that must still
+    match there for the index to be trusted. `info` is the switch-slot dict
+    template (everything but the live 'param'); LOM-kind switches carry only
+    `info` and no index."""
+    d_idx: Optional[int]
+    key_attr: Optional[str] = None
+    key: Any = None
+    alias: Optional[str] = None
+    button: Optional[str] = None
+    info: Optional[dict] = None
+
+
+@dataclass
+class ResolutionPlan:
+    """Compiled resolution for one (device, encoder page, button page): c_idx /
+    switch index -> PlanSlot (or None for a slot that resolves to nothing).
+    Filled lazily, one slot per first resolve, so the first burst after focus
+    compiles it and every later encoder event is a dict hit plus one liveness
+    check instead of the zone/BOB/bank/fallback walk."""
+    device: Any
+    encoder_page: int
+    button_page: int
+    encoders: dict
+    switches: dict
+
+
+# Marks a slot not compiled yet. Slots whose resolution depends on live state
+# other than the compiled index -- a group member picked by its selector's
+# current value, or a name that isn't in the parameter list *yet* (a device
+# that rebuilds its list in place may add it) -- are never stored.
+_UNCOMPILED = object()
+
+
 # Max-for-Live wrappers: every M4L plugin reports the same class_name, so
 # entries for these must be disambiguated by device.name. Non-M4L entries
 # are keyed by (class_name, None) and resolve regardless of device.name.
@@ -202,10 +244,18 @@ class ParameterResolver:
         self.button_page = 1
         self._name_index = None  # {original_name: idx}, rebuilt on device focus change
         self._display_name_index = None  # {name: idx}, bank fallback only
+        # Unknown-class fallback tiers as index arrays into device.parameters:
+        # (param count, continuous indices, quantized indices). Built once per
+        # focus instead of filtering every parameter on every CC; rebuilt with
+        # the name indices, or when the list length changes under us.
+        self._fallback_index = None
         # The device this resolver's per-device state was last built for. Lets
         # `ensure_focused` detect a burst assembled for a device the Helpers
         # funnel never reset and self-correct. None = no device focused yet.
         self._focused_device = None
+        # Compiled per-(device, page) resolution; see ResolutionPlan. Dropped on
+        # focus and by the stale-index detection in `_live_entry`.
+        self._plan = None
 
     @property
     def device_table(self):
@@ -214,11 +264,20 @@ class ParameterResolver:
     def focus(self):
         """Reset per-device state on a focus change: drop the name indices and
         return to page 1 for both encoders and buttons."""
-        self._name_index = None
-        self._display_name_index = None
+        self._drop_indices()
         self.encoder_page = 1
         self.button_page = 1
 
+    def _drop_indices(self):
+        """Forget everything indexed against the device's parameter list (name
+        indices, fallback index arrays, compiled plan) — on focus, and when a
+        stale index shows the list was rebuilt in place."""
+        self._name_index = None
+        self._display_name_index = None
+        self._indexed_count = None
+        self._fallback_index = None
+        self._plan = None
+
     def ensure_focused(self, device):
         """Defensive per-device guard, called at burst assembly so the burst is
         the single source of truth for per-device state. If `device` differs
@@ -292,6 +351,7 @@ class ParameterResolver:
                 for i, p in enumerate(device.parameters)
                 if self._attr(p, 'name')
             }
+            self._indexed_count = self._param_count(device)
 
     @staticmethod
     def _attr(param, attr):
@@ -311,20 +371,41 @@ class ParameterResolver:
         reordered/resized so the cached index no longer matches — or the cached
         index is dead — rebuild the indices once and retry, so consumers always
         get a current handle."""
+        return self._live_entry(device, name, index_map, key_attr)[1]
+
+    def _live_entry(self, device, name, index_map, key_attr):
+        """`_live_param`, returning `(index, param)` — `(None, None)` on a miss —
+        so the plan compiler can record where the parameter lives."""
         if device is None or not name or not index_map:
-            return None
-        p = self._param_at(device, index_map.get(name))
-        if p is not None and self._attr(p, key_attr) == name:
-            return p
-        # Stale index (list rebuilt). Rebuild once and retry against the fresh map.
-        self._name_index = None
-        self._display_name_index = None
+            return None, None
+        idx = index_map.get(name)
+        if idx is None:
+            # A plain miss, unless the list changed size since it was indexed.
+            # (The standard-bank display-name fallback misses the strict index
+            # on every compile; dropping here would orphan the plan mid-compile.)
+            if self._param_count(device) == self._indexed_count:
+                return None, None
+        else:
+            p = self._param_at(device, idx)
+            if p is not None and self._attr(p, key_attr) == name:
+                return idx, p
+        # Stale index (list rebuilt). Rebuild once and retry against the fresh
+        # map. The plan and fallback arrays indexed the old list too, so they go.
+        self._drop_indices()
         self._ensure_name_index(device)
         fresh_map = self._name_index if key_attr == 'original_name' else self._display_name_index
-        p = self._param_at(device, (fresh_map or {}).get(name))
+        idx = (fresh_map or {}).get(name)
+        p = self._param_at(device, idx)
         if p is not None and self._attr(p, key_attr) == name:
-            return p
-        return None
+            return idx, p
+        return None, None
+
+    @staticmethod
+    def _param_count(device):
+        try:
+            return len(device.parameters)
+        except Exception:
+            return None
 
     @staticmethod
     def _param_at(device, idx):
@@ -383,19 +464,32 @@ class ParameterResolver:
             return ()
         return self._device_banks.get(cn, ())
 
+    def _ensure_fallback_index(self, device):
+        """Unknown-class fallback index arrays, built once per focus: every
+        parameter but on/off (index 0), split continuous / quantized. A length
+        change means the list was rebuilt, so it re-partitions; a same-length
+        rebuild is caught by the plan's liveness check (`_drop_indices`)."""
+        params = device.parameters
+        n = len(params)
+        if self._fallback_index is None or self._fallback_index[0] != n:
+            continuous, quantized = [], []
+            for i in range(1, n):
+                (quantized if self._attr(params[i], 'is_quantized') else continuous).append(i)
+            self._fallback_index = (n, continuous, quantized)
+        return self._fallback_index
+
     def _fallback_continuous(self, device):
-        """Unknown-class identity fallback list: skip on/off and quantized,
-        keyed by original_name."""
+        """Unknown-class identity fallback: `device.parameters` indices of the
+        continuous params, skipping on/off and quantized."""
         if device is None:
             return []
-        return [p for i, p in enumerate(device.parameters)
-                if i > 0 and not getattr(p, 'is_quantized', False)]
+        return self._ensure_fallback_index(device)[1]
 
     def _fallback_quantized(self, device):
+        """Indices of the quantized params (the fallback switch tier)."""
         if device is None:
             return []
-        return [(i, p) for i, p in enumerate(device.parameters)
-                if i > 0 and getattr(p, 'is_quantized', False)]
+        return self._ensure_fallback_index(device)[2]
 
     def _has_bob(self, device):
         return self.device_entry(device) is not None
@@ -544,9 +638,115 @@ class ParameterResolver:
                 labels.append(names[idx])
         return ' / '.join(labels)
 
+    # ---- compiled resolution plan -------------------------------------------
+
+    def _plan_for(self, device):
+        """The ResolutionPlan for `device` at the current pages, starting a fresh
+        (empty) one when the device or either page changed since it was built.
+        Identity first: Live hands back the same wrapper for the focused device,
+        so the common case never touches the C++ handle."""
+        plan = self._plan
+        if plan is not None and plan.encoder_page == self.encoder_page \
+                and plan.button_page == self.button_page:
+            if plan.device is device:
+                return plan
+            try:
+                if plan.device == device:
+                    return plan
+            except Exception:
+                pass
+        plan = ResolutionPlan(device, self.encoder_page, self.button_page, {}, {})
+        self._plan = plan
+        return plan
+
+    def current_plan(self):
+        """The plan the last resolve compiled into (None before any resolve or
+        after a drop). HudPresenter's burst cache keeps it per device so a
+        revisit doesn't recompile."""
+        return self._plan
+
+    def adopt_plan(self, plan):
+        """Install a plan kept from an earlier visit. Only taken when it matches
+        the current pages; `_plan_for` still checks the device, and the
+        per-slot liveness check in `_resolve_planned` drops it if the parameter
+        list changed in the meantime."""
+        if plan is not None and plan.encoder_page == self.encoder_page \
+                and plan.button_page == self.button_page:
+            self._plan = plan
+
+    def _planned(self, device, table, idx, compile_fn):
+        """Compiled slot for `idx` in the plan's `table` ('encoders'|'switches'),
+        compiling it on first use. Uncacheable slots (group members) compile on
+        every call and are not stored."""
+        slots = getattr(self._plan_for(device), table)
+        slot = slots.get(idx, _UNCOMPILED)
+        if slot is _UNCOMPILED:
+            slot, cacheable = compile_fn(device, idx)
+            if cacheable:
+                slots[idx] = slot
+        return slot
+
+    def _plan_param(self, device, slot):
+        """Live parameter for a compiled slot, or None when the index no longer
+        holds the parameter it was compiled against (list rebuilt in place)."""
+        p = self._param_at(device, slot.d_idx)
+        if p is not None and self._attr(p, slot.key_attr) == slot.key:
+            return p
+        return None
+
+    def _resolve_planned(self, device, table, idx, compile_fn):
+        """(slot, live param) via the plan. A failed liveness check is the plan's
+        stale-index signal: drop the plan and name indices, recompile the slot
+        once against the fresh parameter list, and give up if it still fails."""
+        slot = self._planned(device, table, idx, compile_fn)
+        if slot is None or slot.d_idx is None:
+            return slot, None
+        p = self._plan_param(device, slot)
+        if p is not None:
+            return slot, p
+        self._drop_indices()
+        slot = self._planned(device, table, idx, compile_fn)
+        if slot is None or slot.d_idx is None:
+            return slot, None
+        return slot, self._plan_param(device, slot)
+
+    def _name_slot(self, device, name, alias=None, button=None):
+        """PlanSlot for a strict `original_name` lookup, or None on a miss."""
+        if device is None or not name:
+            return None
+        self._ensure_name_index(device)
+        idx, _p = self._live_entry(device, name, self._name_index, 'original_name')
+        if idx is None:
+            return None
+        return PlanSlot(idx, 'original_name', name, alias, button)
+
+    def _bank_slot(self, device, name):
+        """PlanSlot for a standard-bank name: strict first, display-name second
+        (see `_resolve_bank_param`)."""
+        slot = self._name_slot(device, name)
+        if slot is not None:
+            return slot
+        idx, _p = self._live_entry(device, name, self._display_name_index, 'name')
+        if idx is None:
+            return None
+        return PlanSlot(idx, 'name', name)
+
+    def _index_slot(self, device, idx, p, alias=None, button=None, info=None):
+        """PlanSlot for a positional (fallback-tier) parameter, pinned to the
+        `original_name` it had when compiled."""
+        return PlanSlot(idx, 'original_name', self._attr(p, 'original_name'), alias, button, info)
+
     def resolve_encoder(self, device, c_idx):
         if device is None:
             return None
+        slot, p = self._resolve_planned(device, 'encoders', c_idx, self._compile_encoder)
+        if p is None:
+            return None
+        return RealParameter(p, slot.alias, slot.button)
+
+    def _compile_encoder(self, device, c_idx):
+        """Walk the zone / BOB / standard-bank / fallback tiers for one encoder
+        at the current page. Returns `(PlanSlot or None, cacheable)`."""
         page = self.encoder_page
         slot_in_page = c_idx - 1
         class_name = getattr(device, 'class_name', None)
@@ -560,74 +760,82 @@ class ParameterResolver:
         if page == 1 and self._is_zoned(device):
             outcome, entry = self._zone_lookup(device, 'encoders', c_idx)
             if outcome == 'unmapped':
-                return None  # dim LED, blank HUD — a legitimate role miss
+                return None, True  # dim LED, blank HUD — a legitimate role miss
             if outcome == 'mapped':
+                cacheable = True
                 # Toggle-dependent zone role (e.g. Operator Fixed): resolve the
                 # currently-active member first, identical to the BOB branch. A
                 # None member (selector unreadable / no activeWhen match) dims.
                 if 'controlledBy' in entry and 'group' in entry:
+                    cacheable = False
                     entry = self._resolve_group_member(device, entry)
                     if entry is None:
-                        return None
+                        return None, False
                 name = entry['name']
-                p = self.resolve_param_by_name(device, name)
-                if p is None:
+                slot = self._name_slot(device, name, entry.get('display') or name, entry.get('button'))
+                if slot is None:
                     self._log(
                         f"[zone] '{name}' (slot {c_idx}) not found in "
                         f"{class_name} original_names — zone table drift."
                     )
-                    return None
-                return RealParameter(p, entry.get('display') or name, entry.get('button'))
+                    return None, False
+                return slot, cacheable
             # outcome == 'fallthrough' — slot not owned by the template
 
         if page == 1 and self._has_bob_encoders(device):
             encoders = self._bob_encoders(device)
             if slot_in_page < len(encoders):
                 e = encoders[slot_in_page]
+                cacheable = True
                 if 'controlledBy' in e and 'group' in e:
+                    cacheable = False
                     e = self._resolve_group_member(device, e)
                     if e is None:
-                        return None
+                        return None, False
                 name = e.get('name')
-                p = self.resolve_param_by_name(device, name)
-                if p is None:
+                slot = self._name_slot(device, name, e.get('display') or name, e.get('button'))
+                if slot is None:
                     available = list((self._name_index or {}).keys())[:30]
                     self._log(
                         f"[bob] '{name}' not found in {getattr(device,'class_name','?')} "
                         f"({getattr(device,'name','?')}) original_names. "
                         f"Available (first 30): {available}"
                     )
-                    return None
-                return RealParameter(p, e.get('display') or name, e.get('button'))
-            return None
+                    return None, False
+                return slot, cacheable
+            return None, True
 
         if page >= self._first_standard_page(device) and self.standard_banks(device):
             name = self._standard_bank_name_for(device, page, slot_in_page)
             if name is None:
-                return None
-            p = self._resolve_bank_param(device, name)
-            if p is None:
+                return None, True
+            slot = self._bank_slot(device, name)
+            if slot is None:
                 available = list((self._name_index or {}).keys())[:30]
                 self._log(
                     f"[bank] '{name}' (slot {slot_in_page}, page {page}) not found in "
                     f"{getattr(device,'class_name','?')} original_names. "
                     f"Available (first 30): {available}"
                 )
-                return None
-            return RealParameter(p, None, None)
+                return None, False
+            return slot, True
 
         if known:
             # Known class but no banks (only BOB), and we've already handled
             # page 1 above. Higher pages render empty.
-            return None
+            return None, True
 
         # Unknown class — chunked identity fallback over continuous params,
         # paired onto pages when slot_count >= 16.
-        params = self._fallback_continuous(device)
+        indices = self._fallback_continuous(device)
         offset = (page - 1) * 8 * self._banks_per_page + slot_in_page
-        if offset >= len(params):
-            return None
-        return RealParameter(params[offset], None, None)
+        if offset >= len(indices):
+            return None, True
+        d_idx = indices[offset]
+        p = self._param_at(device, d_idx)
+        if p is None:
+            return None, False
+        return self._index_slot(device, d_idx, p), True
 
     def _resolve_group_member(self, device, entry):
         selector_name = entry['controlledBy']
@@ -646,6 +854,19 @@ class ParameterResolver:
     def resolve_switch(self, device, switch_idx):
         if device is None:
             return None
+        slot, p = self._resolve_planned(device, 'switches', switch_idx, self._compile_switch)
+        if slot is None:
+            return None
+        if slot.d_idx is None:
+            return dict(slot.info)  # LOM kind: no parameter to re-fetch
+        if p is None:
+            return None
+        return dict(slot.info, param=p)
+
+    def _compile_switch(self, device, switch_idx):
+        """Switch-slot analogue of `_compile_encoder`: `(PlanSlot or None,
+        cacheable)`, the slot's `info` being the resolve_switch dict sans the
+        live 'param'."""
         class_name = getattr(device, 'class_name', None)
         # Zone tier — button slot on an enrolled synth (page 1 only). Precedes
         # BOB, same precedence as the encoder path. A slot outside the 16-button
@@ -655,77 +876,78 @@ class ParameterResolver:
             outcome, entry = self._zone_lookup(device, 'buttons', switch_idx + 1)
             if outcome != 'fallthrough':
                 if self.button_page != 1 or outcome == 'unmapped':
-                    return None  # dim LED / no zone paging beyond page 1
+                    return None, True  # dim LED / no zone paging beyond page 1
                 name = entry['name']
-                p = self.resolve_param_by_name(device, name)
-                if p is None:
+                slot = self._name_slot(device, name)
+                if slot is None:
                     self._log(
                         f"[zone] button '{name}' (slot {switch_idx + 1}) not found in "
                         f"{class_name} original_names — zone table drift."
                     )
-                    return None
+                    return None, False
                 # has_range=False: a quantized param (Algorithm 0-10, filter
                 # type, on/off) is cycled by the switch handler over its own
                 # min/max — identical to a rangeless BOB toggle button.
-                return {
+                return PlanSlot(slot.d_idx, slot.key_attr, slot.key, info={
                     'kind': 'param',
-                    'param': p,
                     'alias': entry.get('display') or name,
-                    'd_idx': self._resolve_param_d_idx(device, name),
+                    'd_idx': slot.d_idx,
                     'has_range': False, 'min': None, 'max': None, 'min_max': False,
-                }
+                }), True
         if self._has_bob(device):
             buttons = self._bob_buttons(device)
             stride = self._button_switch_count or self._button_slot_count
             actual_idx = (self.button_page - 1) * stride + switch_idx
             if actual_idx >= len(buttons):
-                return None
+                return None, True
             b = buttons[actual_idx]
             btype = b.get('type', 'param')
             if btype == 'enum':
                 prop = b['lom_property']
-                return {'kind': 'enum', 'device': device, 'prop': prop,
-                        'alias': b.get('display') or prop}
+                return PlanSlot(None, info={'kind': 'enum', 'device': device, 'prop': prop,
+                                            'alias': b.get('display') or prop}), True
             if btype == 'bool':
                 prop = b['lom_property']
-                return {'kind': 'bool', 'device': device, 'prop': prop,
-                        'alias': b.get('display') or prop}
+                return PlanSlot(None, info={'kind': 'bool', 'device': device, 'prop': prop,
+                                            'alias': b.get('display') or prop}), True
             if btype == 'function':
                 fn = b['lom_function']
-                return {'kind': 'function', 'device': device, 'fn': fn,
-                        'alias': b.get('display') or fn}
+                return PlanSlot(None, info={'kind': 'function', 'device': device, 'fn': fn,
+                                            'alias': b.get('display') or fn}), True
             name = b.get('name')
-            p = self.resolve_param_by_name(device, name)
-            if p is None:
+            slot = self._name_slot(device, name)
+            if slot is None:
                 available = list((self._name_index or {}).keys())[:20]
                 self._log(
                     f"[switch] '{name}' not found in {class_name} params. "
                     f"Available (first 20): {available}"
                 )
-                return None
+                return None, False
             has_range = b.get('min') is not None and b.get('max') is not None
-            return {
+            return PlanSlot(slot.d_idx, slot.key_attr, slot.key, info={
                 'kind': 'param',
-                'param': p,
                 'alias': b.get('display') or name,
-                'd_idx': self._resolve_param_d_idx(device, name),
+                'd_idx': slot.d_idx,
                 'has_range': has_range,
                 'min': int(b['min']) if has_range else None,
                 'max': int(b['max']) if has_range else None,
                 'min_max': bool(b.get('min_max')),
-            }
+            }), True
         # Unknown-class fallback: existing quantized chunking.
         idx = (self.button_page - 1) * self._button_slot_count + switch_idx
         quantized = self._fallback_quantized(device)
         if idx >= len(quantized):
-            return None
-        d_idx, p = quantized[idx]
-        return {
+            return None, True
+        d_idx = quantized[idx]
+        p = self._param_at(device, d_idx)
+        if p is None:
+            return None, False
+        return self._index_slot(device, d_idx, p, info={
             'kind': 'param',
-            'param': p, 'alias': getattr(p, 'name', ''), 'd_idx': d_idx,
+            'alias': getattr(p, 'name', ''), 'd_idx': d_idx,
             'has_range': True, 'min': int(p.min), 'max': int(p.max),
             'min_max': False,
-        }
+        }), True
 
     def enum_members(self, current_value, device=None, prop=None):
         """Return ordered list of enum members for an LOM enum property.
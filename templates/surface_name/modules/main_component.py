@@ -8,15 +8,20 @@ from Launchpad.ConfigurableButtonElement import ConfigurableButtonElement
 from .helpers import Helpers, Remote, SurfaceConfig
 from .osc_client import OSCClient, OSCMultiClient, NullOSCClient
 from .hud_client import HudClient, NullHudClient
+from .send_queue import SendQueue
+from .hud_protocol import REGION_CAPABILITIES
+from .update_coalescer import UpdateCoalescer
+from .midi_out import MidiOutQueue
 from .ec4_client import Ec4Client, NullEc4Client
 from .grid_led_client import GridLedClient, NullGridLedClient
 from .clip_actions import ClipActions
 from .drum_rack import DrumRackController
 from .listener import OSCListener
-from .region_state import RegionState
+from .region_state import RegionState, RegionSet
 from .region_listener import RegionListener
 from .mode_link import ModeSender, ModeListener
 from .nav import Nav
+from .shared_hub import SurfaceShare
 # from _Framework.EncoderElement import *
 
 functions_loaded_error = None
@@ -52,27 +57,49 @@ class MainComponent(ControlSurfaceComponent):
         self._nav = Nav(self.manager)
         self.clip_actions = ClipActions(self.manager)
 
+        # `send-thread: true`: HUD/OSC datagrams are encoded here but written by
+        # a background thread, so a stalled receiver can't delay MIDI handling.
+        # Closed on disconnect/reload, before the shared socket is released.
+        self._sender = SendQueue(name="$surface_name") if $send_thread else None
+
         self._osc_client = NullOSCClient()
         _osc_targets = [$osc_clients]
         if _osc_targets:
-            self._osc_client = OSCMultiClient(_osc_targets)
+            self._osc_client = OSCMultiClient(_osc_targets, sender=self._sender)
 
         # HUD_TARGET is data, not code: None for a standalone surface (HUD on
         # 127.0.0.1:5006), or (host, port) for the parks forwarder which retargets
         # its HUD client at the compositor's region port.
         HUD_TARGET = $hud_target
         _hud_host, _hud_port = HUD_TARGET if HUD_TARGET is not None else ('127.0.0.1', 5006)
-        self._hud_client = $hud_client_class(_hud_host, _hud_port)
+        # Process-wide resources shared with co-loaded surfaces (one UDP send
+        # socket, one compiled table per unique mapping, one bank index);
+        # released on disconnect/reload.
+        self._share = SurfaceShare()
+        self._hud_client = $hud_client_class(
+            _hud_host, _hud_port, sock=self._share.udp_socket(), sender=self._sender)
+        if HUD_TARGET is not None:
+            # The compositor's region port never sends a HELLO; it is generated
+            # from the same tree, so its wire capabilities are known up front.
+            self._hud_client.negotiate(REGION_CAPABILITIES)
+        # SysEx feedback sinks enqueue here; the tick writes them, so a burst
+        # never waits on the MIDI port.
+        self._midi_out = MidiOutQueue(self.manager)
         self._feedback_sinks = [$feedback_sinks]
-        self._remote = Remote(self.manager, self._osc_client, self._hud_client, self._feedback_sinks)
+        # Knob sweeps: keep only the latest value per slot and flush once per
+        # tick (one HUD datagram) instead of a datagram per incoming CC.
+        self._update_coalescer = UpdateCoalescer(self.manager, self._hud_client, self._osc_client)
+        self._remote = Remote(self.manager, self._osc_client, self._hud_client, self._feedback_sinks,
+                              update_coalescer=self._update_coalescer)
 
         # Drum-rack step/velocity editor. Resolves the focused drum rack + detail
         # clip at call time and is inert when the focused device isn't a drum
         # rack, so this instantiation is unconditional (like clip_actions).
         # DEFERRED SEAM: controller pad-tap selection + audition are not wired
         # yet (need a Live note-forwarding spike); step/velocity edits already
-        # work against Live's mouse-selected pad.
-        self.drum_rack = DrumRackController(self.manager, self._hud_client)
+        # work against Live's mouse-selected pad. Edits are batched per tick:
+        # one clip rewrite per finger-run / velocity sweep, not one per event.
+        self.drum_rack = DrumRackController(self.manager, self._hud_client, batch=True)
 
         $code_setup
 
@@ -104,7 +131,7 @@ class MainComponent(ControlSurfaceComponent):
             hud_dividers=$hud_dividers,
             mode_hud_labels=$mode_hud_labels,
             hud_trigger=$hud_trigger,
-            button_behaviour=$button_behaviour))
+            button_behaviour=$button_behaviour), share=self._share)
 
         self._song.add_appointed_device_listener(self.on_device_selected)
         # A device *replace* (e.g. Wavetable → Drift) doesn't reliably fire the
@@ -120,26 +147,37 @@ class MainComponent(ControlSurfaceComponent):
         self.log_message(f"main_component finish init.")
         self._previous_values = {}
 
-        self._lisetenr = OSCListener(self.manager, self.button_handler, port=$osc_listen_port, name="$surface_name")
+        self._lisetenr = OSCListener(self.manager, self.button_handler, port=$osc_listen_port,
+                                     name="$surface_name", hub=self.manager.io_hub)
 
-        # Compositor only: receive the secondary surface's forwarded HUD region
-        # and merge it into this surface's single combined HUD stream. The wiring
-        # is real (always present, syntax-checked) and gated on REGION_CONFIG —
-        # data, not a code string built in gen.py. None for standalone surfaces.
+        # Compositor only: receive each secondary surface's forwarded HUD region
+        # and merge them into this surface's single combined HUD stream. The
+        # wiring is real (always present, syntax-checked) and gated on
+        # REGION_CONFIG — data, not a code string built in gen.py. None for
+        # standalone surfaces; one dict for a single secondary, a list of them
+        # (section order) for several.
         REGION_CONFIG = $region_config
         if REGION_CONFIG is not None:
-            self._region_state = RegionState(self._hud_client,
-                dial_offset=REGION_CONFIG['dial_offset'],
-                button_offset=REGION_CONFIG['button_offset'],
-                on_commit=self._helpers.reemit_combined_burst)
+            _regions = REGION_CONFIG if isinstance(REGION_CONFIG, list) else [REGION_CONFIG]
+            self._region_state = RegionSet([
+                RegionState(self._hud_client,
+                    dial_offset=region['dial_offset'],
+                    button_offset=region['button_offset'],
+                    on_commit=self._helpers.reemit_combined_burst,
+                    dial_count=region.get('dial_count', 0),
+                    button_count=region.get('button_count', 0))
+                for region in _regions])
             self._remote.set_region_state(self._region_state)
-            self._region_listener = RegionListener(self.manager, self._region_state,
-                port=REGION_CONFIG['port'], name="$surface_name-region")
+            self._region_listeners = [
+                RegionListener(self.manager, state, port=region['port'],
+                    name=f"$surface_name-region{i}", hub=self.manager.io_hub)
+                for i, (region, state) in enumerate(zip(_regions, self._region_state.regions))]
 
         # Reverse mode channel (lc_parks only): the primary sends the active mode
         # name to the secondary so holding shift on the primary switches the
         # secondary's mappings too. Data, not code; None on standalone surfaces.
-        # role='sender' -> primary (this surface owns a shift mode-button);
+        # role='sender' -> primary (this surface owns a shift mode-button; its
+        #                  port is a list when several secondaries follow it);
         # role='listener' -> secondary (headless FSM driven remotely).
         MODE_LINK = $mode_link
         if MODE_LINK is not None:
@@ -147,7 +185,7 @@ class MainComponent(ControlSurfaceComponent):
                 self._mode_sender = ModeSender('127.0.0.1', MODE_LINK['port'])
             else:
                 self._mode_listener = ModeListener(self.manager, self,
-                    port=MODE_LINK['port'], name="$surface_name-mode")
+                    port=MODE_LINK['port'], name="$surface_name-mode", hub=self.manager.io_hub)
 
         self._song.view.add_selected_parameter_listener(self._on_selected_parameter_changed)
 
@@ -1,4 +1,3 @@
-import errno
 from pathlib import Path
 
 import Live
@@ -16,6 +15,8 @@ from .modules import main_component
 from .modules import helpers
 from .modules.listener import OSCListener
 from .modules import hud_arbiter
+from .modules import io_hub
+from .modules.latency_stats import STATS
 
 try:
     from .modules import functions
@@ -41,10 +42,16 @@ class $surface_name(ControlSurface):
 
         with self.component_guard():
 
+            # One poll loop for every inbound socket of this surface (command
+            # port, OSC buttons, region/mode links): a single select per tick,
+            # each readable socket drained up to a per-tick budget.
+            self.io_hub = io_hub.IoHub(self, name="$surface_name")
+
             self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self._socket.setblocking(0)
             self.log_message("$surface_name: starting listen on port $udp_port")
             self._socket.bind(('0.0.0.0', $udp_port))
+            self.io_hub.register(self._socket, self._on_command, bufsize=1024,
+                                 label="$surface_name-cmd")
 
             self.init_modules()
 
@@ -54,7 +61,6 @@ class $surface_name(ControlSurface):
             self._hud_arbiter = hud_arbiter.HudArbiter(self)
             self._hud_arbiter.register()
 
-            self.schedule_message(1, self.tick)
             self.show_message("Connected to $surface_name")
             self.debug = False
             # Gated HUD protocol-trace flag.
@@ -265,10 +271,43 @@ class $surface_name(ControlSurface):
         except Exception:
             return None
 
-    def tick(self):
-        # self.log_message(f"Ticking..")
+    def _stats_lines(self):
+        mc = self.main_component
+        lines = STATS.summary_lines() or ['no samples yet']
+        for label, stats in (('coalesce', mc._update_coalescer.stats()),
+                             ('hudowner', mc._remote.hud_stats()),
+                             ('burstcache', mc._helpers.burst_cache_stats()),
+                             ('midiout', mc._midi_out.stats()),
+                             ('iohub', self.io_hub.stats())):
+            lines.append(f"{label} " + ' '.join(f'{k}={v}' for k, v in stats.items()))
+        if mc._sender is not None:
+            lines.append('sender ' + ' '.join(f'{k}={v}' for k, v in mc._sender.stats().items()))
+        return lines
+
+    def _stats_reset(self):
+        mc = self.main_component
+        STATS.reset()
+        mc._update_coalescer.reset_stats()
+        mc._remote.reset_hud_stats()
+        mc._helpers.reset_burst_cache_stats()
+        mc._midi_out.reset_stats()
+        self.io_hub.reset_stats()
+        if mc._sender is not None:
+            mc._sender.reset_stats()
+
+    def _close_sender(self):
+        # Drains what is queued (final HIDE/bursts) then stops the thread; must
+        # run before release_all closes the shared socket under it.
+        try:
+            if self.main_component._sender is not None:
+                self.main_component._sender.close()
+        except Exception as e:
+            self.log_message(f"Error closing sender thread: {e}")
+
+    def _on_command(self, data, addr):
+        # One control-port datagram, dispatched by the IoHub poll loop (which
+        # owns the recvfrom and its benign-error handling).
         try:
-            data, addr = self._socket.recvfrom(1024)
             cmd_str = data.decode('utf-8', errors='ignore').strip()
             parts = cmd_str.split('|')
             cmd = parts[0]
@@ -278,6 +317,9 @@ class $surface_name(ControlSurface):
                 response = b'PONG'
 
             elif cmd == 'HELLO':
+                # A (re)started HUD: adopt the capabilities it announced
+                # (`HELLO|delta`), then push the layout + a full keyframe burst.
+                self.main_component._remote.negotiate(cmd_str)
                 self.main_component._remote.resend_layout()
                 self.main_component._helpers.update_remote_parameters()
 
@@ -317,6 +359,33 @@ class $surface_name(ControlSurface):
                     except Exception as e:
                         self.log_message(f'Error removing listeners: {e}')
                         self.log_message(traceback.format_exc())
+                    try:
+                        # Apply queued step edits, drop the clip notes listener.
+                        self.main_component.drum_rack.disconnect()
+                    except Exception as e:
+                        self.log_message(f'Error removing drum clip listener: {e}')
+                    try:
+                        self.main_component._helpers.disconnect()
+                    except Exception as e:
+                        self.log_message(f'Error removing track/device name listeners: {e}')
+                    try:
+                        self.main_component._nav.disconnect()
+                    except Exception as e:
+                        self.log_message(f'Error removing track nav listeners: {e}')
+                    try:
+                        self.main_component.functions.track_nav.disconnect()
+                    except Exception as e:
+                        self.log_message(f'Error removing track position listeners: {e}')
+                    try:
+                        # Its tick reschedules itself until closed.
+                        self.main_component._update_coalescer.close()
+                    except Exception as e:
+                        self.log_message(f'Error closing update coalescer: {e}')
+                    try:
+                        # Write its last queued SysEx and end its tick, as disconnect does.
+                        self.main_component._midi_out.close()
+                    except Exception as e:
+                        self.log_message(f'Error closing MIDI-out queue: {e}')
 
                     importlib.reload(modules.helpers)
                     importlib.reload(modules.hud_arbiter)
@@ -326,6 +395,11 @@ class $surface_name(ControlSurface):
                         importlib.reload(modules.functions)
 
                     self.log_message('Re-initialising modules')
+                    # Close the previous listeners' sockets (everything but the
+                    # command port) so the new instances can bind their ports.
+                    self.io_hub.reset(keep=(self._socket,))
+                    self._close_sender()
+                    self.main_component._share.release_all()
                     self.init_modules()
                     response = b'reload complete'
                     self.show_message("Reload complete")
@@ -372,6 +446,33 @@ class $surface_name(ControlSurface):
                 response = (b'doctor enabled - press each button twice, then run `doctor` again'
                             if enabled else b'doctor report written to logs')
 
+            elif cmd == 'coalesce':
+                # Live-update coalescing counters (how many knob-turn updates
+                # were collapsed into a later one before going on the wire).
+                stats = self.main_component._update_coalescer.stats()
+                summary = ' '.join(f'{k}={v}' for k, v in stats.items())
+                self.log_message(f"[coalesce] {summary}")
+                response = f'coalesce {summary}'.encode('utf-8')
+
+            elif cmd == 'stats':
+                # Hot-path latency percentiles per stage + bytes sent, followed
+                # by the per-component counters (see latency_stats.py).
+                report = '\n'.join(self._stats_lines())
+                self.log_message(f"[stats]\n{report}")
+                response = report.encode('utf-8')
+
+            elif cmd == 'stats reset':
+                self._stats_reset()
+                response = b'stats reset'
+
+            elif cmd == 'hudowner':
+                # HUD-owner election state plus how many bursts/updates skipped
+                # HUD assembly because another surface owns the HUD.
+                stats = self.main_component._remote.hud_stats()
+                summary = ' '.join(f'{k}={v}' for k, v in stats.items())
+                self.log_message(f"[hudowner] {summary}")
+                response = f'hudowner {summary}'.encode('utf-8')
+
             elif cmd == 'showinfo':
                 # HUD show-info: each button press is explained on the HUD via an
                 # EVENT message until toggled off.
@@ -382,27 +483,17 @@ class $surface_name(ControlSurface):
             if response is not None:
                 self._socket.sendto(response, addr)
 
-        except socket.error as e:
-            if e.errno == errno.ECONNRESET:
-                #--------------------------------------------------------------------------------
-                # This benign error seems to occur on startup on Windows
-                #--------------------------------------------------------------------------------
-                self.log_message(f"$surface_name: Non-fatal socket error: {traceback.format_exc}")
-            elif e.errno == errno.EAGAIN or e.errno == errno.EWOULDBLOCK:
-                #--------------------------------------------------------------------------------
-                # Another benign networking error, throw when no data is received
-                # on a call to recvfrom() on a non-blocking socket
-                #--------------------------------------------------------------------------------
-                pass
-            else:
-                #--------------------------------------------------------------------------------
-                # Something more serious has happened
-                #--------------------------------------------------------------------------------
-                self.log_message(f"$surface_name: Socket error: {traceback.format_exc()}")
         except Exception as e:
             self.log_message(f"$surface_name: Exception in message processing: {traceback.format_exc()}")
-        finally:
-            self.schedule_message(1, self.tick)
+
+    def refresh_state(self):
+        # Live calls this when a controller's MIDI port comes back: the EC4 may
+        # have power-cycled, so diffing sinks must rewrite in full.
+        super().refresh_state()
+        try:
+            self.main_component._remote.refresh_feedback()
+        except Exception as e:
+            self.log_message(f"Error refreshing feedback sinks: {e}")
 
     def disconnect(self):
         self.show_message("Disconnecting...")
@@ -414,7 +505,37 @@ class $surface_name(ControlSurface):
             self.main_component.remove_app_view_listeners()
         except Exception as e:
             self.log_message(f"Error removing app view listeners: {e}")
-        self._socket.close()
+        try:
+            self.main_component.drum_rack.disconnect()
+        except Exception as e:
+            self.log_message(f"Error removing drum clip listener: {e}")
+        try:
+            self.main_component._helpers.disconnect()
+        except Exception as e:
+            self.log_message(f"Error removing track/device name listeners: {e}")
+        try:
+            self.main_component._nav.disconnect()
+        except Exception as e:
+            self.log_message(f"Error removing track nav listeners: {e}")
+        try:
+            self.main_component.functions.track_nav.disconnect()
+        except Exception as e:
+            self.log_message(f"Error removing track position listeners: {e}")
+        try:
+            self.main_component._update_coalescer.close()
+        except Exception as e:
+            self.log_message(f"Error closing update coalescer: {e}")
+        self.io_hub.close()
+        self._close_sender()
+        try:
+            # Write the sinks' last queued SysEx while the port is still open.
+            self.main_component._midi_out.close()
+        except Exception as e:
+            self.log_message(f"Error closing MIDI-out queue: {e}")
+        try:
+            self.main_component._share.release_all()
+        except Exception as e:
+            self.log_message(f"Error releasing shared resources: {e}")
         super().disconnect()
         # def _setup_session(self):
     #     self._session = SessionComponent(num_tracks=8, num_scenes=1)
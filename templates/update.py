@@ -6,7 +6,7 @@ from time import sleep
 
 ableton_dir = Path("$ableton_dir")
 
-def send_udp_message(message, ip, port):
+def send_udp_message(message, ip, port, text=False):
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     try:
         # Send the message
@@ -15,8 +15,11 @@ def send_udp_message(message, ip, port):
         sleep(1)
         # Wait for a response
         try:
-            data, server = sock.recvfrom(4096)
-            print(f"Received response from {server}: {data}")
+            data, server = sock.recvfrom(65536)
+            if text:
+                print(data.decode('utf-8', errors='replace'))
+            else:
+                print(f"Received response from {server}: {data}")
         except socket.timeout:
             print("No response received within the timeout period.")
     finally:
@@ -25,7 +28,8 @@ def send_udp_message(message, ip, port):
 
 def main():
     parser = argparse.ArgumentParser(description="Send a UDP message based on command parameter.")
-    parser.add_argument('command', type=str, choices=['reload', 'debug', 'hudtrace', 'dump', 'dump2', 'dumpnames', 'lom', 'doctor', 'showinfo', 'cs_dir', 'options'], help='Command to be executed')
+    parser.add_argument('command', type=str, choices=['reload', 'debug', 'hudtrace', 'dump', 'dump2', 'dumpnames', 'lom', 'doctor', 'showinfo', 'coalesce', 'hudowner', 'stats', 'cs_dir', 'options'], help='Command to be executed')
+    parser.add_argument('action', nargs='?', choices=['reset'], help='`stats reset` clears the counters')
 
     args = parser.parse_args()
 
@@ -63,6 +67,15 @@ def main():
     elif args.command == 'showinfo': # toggle HUD edge-annotated button feedback
         message = b'showinfo'
         send_udp_message(message, ip, port)
+    elif args.command == 'coalesce': # live-update coalescing counters
+        message = b'coalesce'
+        send_udp_message(message, ip, port)
+    elif args.command == 'stats': # hot-path latency percentiles; `stats reset` clears them
+        message = b'stats reset' if args.action == 'reset' else b'stats'
+        send_udp_message(message, ip, port, text=True)
+    elif args.command == 'hudowner': # HUD-owner election + skipped-assembly counters
+        message = b'hudowner'
+        send_udp_message(message, ip, port)
     else:
         print("Invalid command. Use 'reload' or 'debug' to send the respective message.")
         sys.exit(1)
@@ -86,5 +86,37 @@ class TestIsCompositionFile(unittest.TestCase):
         self.assertFalse(is_composition_file(normal))
 
 
+class TestReadCompositionSecondaries(unittest.TestCase):
+    MULTI = ("ableton-dir: /x\nprimary: a.nt\nsecondaries:\n"
+             "    -\n        mapping: b.nt\n"
+             "    -\n        mapping: c.nt\n        region-port: 5200\n")
+
+    def test_parses_secondary_list_in_order(self):
+        comp = read_composition(self.MULTI)
+        self.assertEqual([s.mapping for s in comp.all_secondaries()], ["b.nt", "c.nt"])
+        self.assertEqual([s.region_port for s in comp.all_secondaries()], [None, 5200])
+
+    def test_single_secondary_takes_top_level_region_port(self):
+        comp = read_composition(
+            "ableton-dir: /x\nprimary: a.nt\nsecondary:\n    mapping: b.nt\nregion-port: 5123\n")
+        [spec] = comp.all_secondaries()
+        self.assertEqual((spec.mapping, spec.region_port), ("b.nt", 5123))
+
+    def test_rejects_both_forms(self):
+        with self.assertRaises(Exception):
+            read_composition(self.MULTI + "secondary:\n    mapping: d.nt\n")
+
+    def test_rejects_top_level_region_port_with_list(self):
+        with self.assertRaises(Exception):
+            read_composition(self.MULTI + "region-port: 5123\n")
+
+    def test_list_form_is_a_composition_file(self):
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "three.nt"
+            path.write_text(self.MULTI)
+            self.assertTrue(is_composition_file(path))
+
+
 if __name__ == '__main__':
     unittest.main()
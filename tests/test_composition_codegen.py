@@ -54,7 +54,7 @@ class TestCompositionCodegenDormant(unittest.TestCase):
     def test_region_wiring_unchanged_on_primary(self):
         # The reverse-channel addition must not disturb the existing region merge.
         self.assertIn("REGION_CONFIG = {'dial_offset'", self.primary)
-        self.assertIn("RegionListener(self.manager, self._region_state", self.primary)
+        self.assertIn("RegionListener(self.manager, state, port=region['port']", self.primary)
 
     def test_goto_mode_guards_shipped(self):
         # The template guards that make a headless secondary safe ship in every
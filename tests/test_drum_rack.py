@@ -1,4 +1,6 @@
 import ast
+import itertools
+import random
 import unittest
 from pathlib import Path
 
@@ -16,7 +18,8 @@ from ableton_control_surface_as_code.model_v2 import (
     ModeGroupWithMidi, validate_mappings, build_validated_model,
 )
 from source_modules.drum_rack import (
-    DrumRackController, NoteSpec, STEP_BEATS, DEFAULT_VELOCITY, BAR_BEATS,
+    DrumRackController, NoteSpec, STEP_BEATS, STEPS_PER_BAR, DEFAULT_VELOCITY, BAR_BEATS,
+    MAX_BARS,
 )
 
 _SURFACE_DIR = Path(__file__).resolve().parent / 'fixtures' / 'drum_rack_surface'
@@ -307,8 +310,12 @@ class TestDrumRackSurfaceEndToEnd(unittest.TestCase):
 
 # ---- runtime: fakes ---------------------------------------------------------
 
+_note_ids = itertools.count(1)
+
+
 class FakeNote:
     def __init__(self, pitch, start_time, duration=STEP_BEATS, velocity=DEFAULT_VELOCITY):
+        self.note_id = next(_note_ids)
         self.pitch = pitch
         self.start_time = start_time
         self.duration = duration
@@ -325,23 +332,53 @@ class FakeClip:
         self.looping = False
         self.loop_start = 0.0
         self.loop_end = 0.0
+        # Live.Clip notes listeners: fired synchronously on every note change.
+        self.notes_listeners = []
+        self.queries = 0
+        # Note-changing calls (each one a Live clip rewrite + undo step).
+        self.mutations = 0
+
+    def add_notes_listener(self, fn):
+        self.notes_listeners.append(fn)
+
+    def remove_notes_listener(self, fn):
+        self.notes_listeners.remove(fn)
+
+    def notes_has_listener(self, fn):
+        return fn in self.notes_listeners
+
+    def fire_notes(self):
+        for fn in list(self.notes_listeners):
+            fn()
 
     def get_notes_extended(self, from_pitch, pitch_span, from_time, time_span):
+        self.queries += 1
         return [n for n in self.notes
                 if from_pitch <= n.pitch < from_pitch + pitch_span
                 and from_time <= n.start_time < from_time + time_span]
 
     def add_new_notes(self, specs):
+        self.mutations += 1
         for s in specs:
             self.notes.append(FakeNote(s.pitch, s.start_time, s.duration, s.velocity))
+        self.fire_notes()
 
     def remove_notes_extended(self, from_pitch, pitch_span, from_time, time_span):
+        self.mutations += 1
         self.notes = [n for n in self.notes
                       if not (from_pitch <= n.pitch < from_pitch + pitch_span
                               and from_time <= n.start_time < from_time + time_span)]
+        self.fire_notes()
+
+    def remove_notes_by_id(self, ids):
+        self.mutations += 1
+        ids = set(ids)
+        self.notes = [n for n in self.notes if n.note_id not in ids]
+        self.fire_notes()
 
     def apply_note_modifications(self, notes):
-        pass  # notes are mutated in place in these fakes
+        self.mutations += 1
+        self.fire_notes()  # notes are mutated in place in these fakes
 
 
 class FakePad:
@@ -425,6 +462,15 @@ class FakeManager:
         self._song = FakeSong(device, clip, highlighted_slot,
                               loop_start=loop_start, loop_length=loop_length)
         self._app = FakeApplication(focused_document_view)
+        self.scheduled = []
+
+    def schedule_message(self, delay, fn):
+        self.scheduled.append(fn)
+
+    def run_scheduled(self):
+        pending, self.scheduled = self.scheduled, []
+        for fn in pending:
+            fn()
 
     def song(self):
         return self._song
@@ -714,7 +760,7 @@ class TestDrumRackPattern(unittest.TestCase):
         sent = []
 
         class FakeHud:
-            def send_drum(self, name, pattern):
+            def send_drum(self, name, pattern, **kw):
                 sent.append((name, pattern))
 
         clip = FakeClip()
@@ -727,5 +773,287 @@ class TestDrumRackPattern(unittest.TestCase):
         self.assertEqual(pattern[0], 'X')
 
 
+class _UnwatchableClip(FakeClip):
+    def add_notes_listener(self, fn):
+        raise RuntimeError("no notes listener")
+
+
+class TestDrumRackStepCache(unittest.TestCase):
+    """Step state comes from a cached per-(clip, pitch) bitmap, not a note query
+    per tap."""
+
+    def _tap(self, c, step):
+        c.step_event(step, 127)
+        c.step_event(step, 0)
+
+    def test_fast_step_programming_queries_the_clip_once(self):
+        sent = []
+        hud = type('Hud', (), {'send_drum': lambda self, n, p, **kw: sent.append(p)})()
+        clip = FakeClip([FakeNote(36, 2 * STEP_BEATS)])
+        c = _controller_with(clip, hud=hud)
+        for step in (0, 2, 4, 6, 0):
+            self._tap(c, step)
+        self.assertEqual(clip.queries, 1)
+        self.assertEqual(sent[-1], '....X.X.........')
+        self.assertEqual(sorted(n.start_time / STEP_BEATS for n in clip.notes), [4, 6])
+
+    def test_external_edit_invalidates(self):
+        clip = FakeClip()
+        c = _controller_with(clip)
+        self.assertEqual(c.pattern(), '.' * 16)
+        clip.notes.append(FakeNote(36, 5 * STEP_BEATS))  # e.g. a mouse edit in Live
+        clip.fire_notes()
+        self.assertEqual(c.pattern()[5], 'X')
+        self.assertEqual(c._index.invalidations, 1)
+        self._tap(c, 5)
+        self.assertEqual(clip.notes, [])
+
+    def test_each_pitch_has_its_own_bitmap(self):
+        clip = FakeClip([FakeNote(36, 0.0), FakeNote(38, STEP_BEATS)])
+        device = FakeDrumRack(36)
+        c = _controller_with(clip, device=device)
+        self.assertEqual(c.pattern()[:2], 'X.')
+        device.view.selected_drum_pad = FakePad(38)
+        self.assertEqual(c.pattern()[:2], '.X')
+        device.view.selected_drum_pad = FakePad(36)
+        c.pattern()
+        self.assertEqual(clip.queries, 2)
+
+    def test_clip_change_and_disconnect_release_the_listener(self):
+        first, second = FakeClip(), FakeClip()
+        c = _controller_with(first)
+        c.pattern()
+        self.assertEqual(len(first.notes_listeners), 1)
+        c._manager.song().view.detail_clip = second
+        c.pattern()
+        self.assertEqual(first.notes_listeners, [])
+        self.assertEqual(len(second.notes_listeners), 1)
+        c.disconnect()
+        self.assertEqual(second.notes_listeners, [])
+
+    def test_unwatchable_clip_is_read_every_time(self):
+        clip = _UnwatchableClip()
+        c = _controller_with(clip)
+        self._tap(c, 1)
+        self._tap(c, 1)
+        self.assertEqual(clip.notes, [])
+        clip.notes.append(FakeNote(36, 3 * STEP_BEATS))
+        self.assertEqual(c.pattern()[3], 'X')
+
+
+def _clip_state(clip):
+    return sorted((n.pitch, n.start_time, n.duration, n.velocity) for n in clip.notes)
+
+
+class TestDrumRackBatchedEdits(unittest.TestCase):
+    """batch=True queues edits until the tick and commits them as one batched
+    note mutation with one HUD DRUM."""
+
+    def _batched(self, clip, hud=None, device=None):
+        device = device if device is not None else FakeDrumRack(36)
+        return DrumRackController(FakeManager(device, clip), hud_client=hud, batch=True)
+
+    def test_finger_run_is_one_add_and_one_hud_emit(self):
+        sent = []
+        hud = type('Hud', (), {'send_drum': lambda self, n, p, **kw: sent.append(p)})()
+        clip = FakeClip()
+        c = self._batched(clip, hud=hud)
+        for step in range(8):
+            c.step_event(step, 127)
+            c.step_event(step, 0)
+        self.assertEqual(clip.notes, [])  # nothing written until the tick
+        c._manager.run_scheduled()
+        self.assertEqual(len(clip.notes), 8)
+        self.assertEqual(clip.mutations, 1)
+        self.assertEqual(sent, ['XXXXXXXX........'])
+
+    def test_velocity_sweep_is_one_modification(self):
+        note = FakeNote(36, 4 * STEP_BEATS)
+        clip = FakeClip([note])
+        c = self._batched(clip)
+        for value in range(40, 90, 5):
+            c.set_velocity(4, value)
+        c._manager.run_scheduled()
+        self.assertEqual(note.velocity, 85)
+        self.assertEqual(clip.mutations, 1)
+
+    def test_removals_and_additions_commit_together(self):
+        clip = FakeClip([FakeNote(36, 0.0), FakeNote(36, STEP_BEATS)])
+        c = self._batched(clip)
+        for step in (0, 1, 2):
+            c.step_event(step, 0)
+        c._manager.run_scheduled()
+        self.assertEqual(_clip_state(clip), [(36, 2 * STEP_BEATS, STEP_BEATS, DEFAULT_VELOCITY)])
+        self.assertEqual(clip.mutations, 2)  # one removal + one add
+
+    def test_pad_change_mid_tick_commits_the_old_pad_first(self):
+        device = FakeDrumRack(36)
+        clip = FakeClip()
+        c = self._batched(clip, device=device)
+        c.step_event(0, 0)
+        device.view.selected_drum_pad = FakePad(38)
+        c.step_event(1, 0)
+        self.assertEqual(len(clip.notes), 1)
+        c._manager.run_scheduled()
+        self.assertEqual(sorted((n.pitch, n.start_time) for n in clip.notes),
+                         [(36, 0.0), (38, STEP_BEATS)])
+
+    def test_disconnect_commits_pending_edits(self):
+        clip = FakeClip()
+        c = self._batched(clip)
+        c.step_event(3, 0)
+        c.disconnect()
+        self.assertEqual(len(clip.notes), 1)
+
+
+class TestDrumRackBatchEquivalence(unittest.TestCase):
+    """Harness: random event streams give the same final clip batched as
+    per-event, wherever the tick boundaries fall."""
+
+    def _events(self, rng, n):
+        events = []
+        for _ in range(n):
+            step = rng.randrange(STEPS_PER_BAR)
+            if rng.random() < 0.6:
+                events.append(('step', step, 127))
+                events.append(('step', step, 0))
+            else:
+                events.append(('velocity', step, rng.randrange(-10, 140)))
+            if rng.random() < 0.15:
+                events.append(('tick', None, None))
+        return events
+
+    def _initial_notes(self, rng):
+        return [(36, step * STEP_BEATS, rng.randrange(1, 128))
+                for step in range(STEPS_PER_BAR) if rng.random() < 0.4]
+
+    def _run(self, initial, events, batch):
+        clip = FakeClip([FakeNote(p, t, velocity=v) for p, t, v in initial])
+        mgr = FakeManager(FakeDrumRack(36), clip)
+        c = DrumRackController(mgr, batch=batch)
+        for kind, step, value in events:
+            if kind == 'step':
+                c.step_event(step, value)
+            elif kind == 'velocity':
+                c.set_velocity(step, value)
+            else:
+                mgr.run_scheduled()
+        mgr.run_scheduled()
+        return clip
+
+    def test_batched_matches_per_event(self):
+        rng = random.Random(22)
+        for trial in range(200):
+            initial = self._initial_notes(rng)
+            events = self._events(rng, rng.randrange(1, 40))
+            per_event = self._run(initial, events, batch=False)
+            batched = self._run(initial, events, batch=True)
+            self.assertEqual(_clip_state(batched), _clip_state(per_event), (trial, events))
+            self.assertLessEqual(batched.mutations, per_event.mutations)
+
+
+class TestDrumRackPagedSequencer(unittest.TestCase):
+    """Multi-bar patterns are edited a page of 16 steps at a time; step indexes
+    are page-relative."""
+
+    def _tap(self, c, step):
+        c.step_event(step, 127)
+        c.step_event(step, 0)
+
+    def test_pages_follow_bars_and_resolution(self):
+        c = _controller_with(FakeClip())
+        self.assertEqual(c.pages(), 1)
+        c.set_bars(4)
+        self.assertEqual(c.pages(), 4)
+        c.set_resolution('32')
+        self.assertEqual(c.pages(), 8)
+        c.set_resolution('16t')
+        self.assertEqual((c.total_steps(), c.pages()), (96, 6))
+        c.set_bars(99)
+        self.assertEqual(c.total_steps(), MAX_BARS * 24)
+
+    def test_step_on_a_later_page_lands_in_that_bar(self):
+        clip = FakeClip()
+        c = _controller_with(clip)
+        c.set_bars(4)
+        c.page_next()
+        c.page_next()
+        self._tap(c, 1)
+        self.assertEqual([n.start_time for n in clip.notes], [2 * BAR_BEATS + STEP_BEATS])
+        self.assertEqual(c.pattern(), '.X..............')
+        c.page_prev()
+        self.assertEqual(c.pattern(), '.' * 16)
+
+    def test_paging_is_clamped(self):
+        c = _controller_with(FakeClip())
+        c.set_bars(2)
+        for _ in range(5):
+            c.page_next()
+        self.assertEqual(c._page, 1)
+        for _ in range(5):
+            c.page_prev()
+        self.assertEqual(c._page, 0)
+
+    def test_triplet_steps(self):
+        clip = FakeClip()
+        c = _controller_with(clip)
+        c.set_resolution('16t')
+        self._tap(c, 3)
+        self.assertAlmostEqual(clip.notes[0].start_time, 0.5)
+        self.assertAlmostEqual(clip.notes[0].duration, 1.0 / 6)
+        self.assertEqual(c.pattern()[:4], '...X')
+        # 24 triplet steps in one bar: page 2 shows only the last 8.
+        c.page_next()
+        self.assertEqual(len(c.pattern()), 8)
+        self._tap(c, 8)  # past the pattern end: ignored
+        self.assertEqual(len(clip.notes), 1)
+
+    def test_resolution_change_keeps_the_page_time_in_view(self):
+        c = _controller_with(FakeClip())
+        c.set_bars(4)
+        c.set_page(2)           # beats 8..12 at 1/16
+        c.set_resolution('32')  # 1/32 pages are 2 beats: beat 8 is page 4
+        self.assertEqual(c._page, 4)
+
+    def test_set_bars_loops_the_detail_clip(self):
+        clip = FakeClip()
+        c = _controller_with(clip)
+        c.set_bars(2)
+        self.assertAlmostEqual(clip.loop_end, 2 * BAR_BEATS)
+
+    def test_hud_gets_only_the_visible_page_and_its_metadata(self):
+        sent = []
+
+        class FakeHud:
+            def send_drum(self, name, pattern, **kw):
+                sent.append((pattern, kw))
+
+        clip = FakeClip([FakeNote(36, 4 * BAR_BEATS)])
+        c = _controller_with(clip, hud=FakeHud())
+        c.set_bars(8)
+        c.set_page(4)
+        self.assertEqual(sent[-1], ('X' + '.' * 15, {'page': 5, 'pages': 8, 'resolution': '16'}))
+
+    def test_long_loop_tap_does_not_query_the_clip(self):
+        clip = FakeClip([FakeNote(36, i * STEP_BEATS) for i in range(0, 128, 3)])
+        c = _controller_with(clip)
+        c.set_bars(8)
+        for page in range(8):
+            c.set_page(page)
+            self._tap(c, 5)
+        self.assertEqual(clip.queries, 1)
+
+    def test_batched_edits_use_absolute_steps_across_pages(self):
+        clip = FakeClip()
+        c = DrumRackController(FakeManager(FakeDrumRack(36), clip), batch=True)
+        c.set_bars(2)
+        self._tap(c, 0)
+        c.page_next()
+        self._tap(c, 0)
+        c._manager.run_scheduled()
+        self.assertEqual(sorted(n.start_time for n in clip.notes), [0.0, BAR_BEATS])
+        self.assertEqual(clip.mutations, 1)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -81,6 +81,71 @@ class TestEc4ClientMessage(unittest.TestCase):
         self.assertEqual(cell0, _data_triples("Q---"))
 
 
+class TestEc4ClientDiffWrites(unittest.TestCase):
+    """After the first full write only changed runs go out, each addressed at
+    its first char."""
+
+    def setUp(self):
+        self.manager = Mock()
+        self.client = Ec4Client(self.manager)
+        self.client.on_device_burst("Dev", [(0, _payload("Vol")), (5, _payload("Freq"))], [])
+        self.manager._send_midi.reset_mock()
+
+    def _messages(self):
+        return [list(c[0][0]) for c in self.manager._send_midi.call_args_list]
+
+    def test_identical_burst_sends_nothing(self):
+        self.client.on_device_burst("Dev", [(0, _payload("Vol")), (5, _payload("Freq"))], [])
+        self.manager._send_midi.assert_not_called()
+
+    def test_one_cell_change_is_addressed_at_its_first_changed_char(self):
+        self.client.on_device_burst("Dev", [(0, _payload("Vol")), (5, _payload("Fine"))], [])
+        [msg] = self._messages()
+        # 'Freq' -> 'Fine': chars 21..23 of cell 5 (char 20) changed.
+        self.assertEqual(msg[10:13], [0x4A, 0x21, 0x15])
+        self.assertEqual(msg[13:-1], _data_triples("ine"))
+        self.assertEqual(len(msg), 13 + 3 * 3 + 1)
+
+    def test_nearby_changes_merge_into_one_message(self):
+        self.client.on_device_burst("Dev", [(0, _payload("Pan")), (1, _payload("Gain")),
+                                            (5, _payload("Freq"))], [])
+        [msg] = self._messages()
+        self.assertEqual(msg[10:13], [0x4A, 0x20, 0x10])
+        self.assertEqual(msg[13:-1], _data_triples("Pan-Gain"))
+
+    def test_changes_in_every_cell_stay_one_message(self):
+        labels = [(i, _payload("X%d" % i)) for i in range(16)]
+        self.client.on_device_burst("Dev", labels, [])
+        [msg] = self._messages()
+        self.assertEqual(msg[10:13], [0x4A, 0x20, 0x10])
+        self.assertLessEqual(len(msg), 13 + 64 * 3 + 1)
+
+    def test_on_hide_and_refresh_write_in_full(self):
+        self.client.on_hide()
+        self.client.refresh()
+        msgs = self._messages()
+        self.assertEqual([len(m) for m in msgs], [13 + 64 * 3 + 1] * 2)
+        self.assertEqual(msgs[1][13:-1], _data_triples("-" * 64))
+
+    def test_failed_send_makes_next_write_full(self):
+        self.manager._send_midi.side_effect = RuntimeError("port gone")
+        self.client.on_device_burst("Dev", [(0, _payload("Pan"))], [])
+        self.manager._send_midi.side_effect = None
+        self.manager._send_midi.reset_mock()
+        self.client.on_device_burst("Dev", [(0, _payload("Pan"))], [])
+        [msg] = self._messages()
+        self.assertEqual(len(msg), 13 + 64 * 3 + 1)
+
+    def test_remote_refresh_feedback_rewrites_sinks(self):
+        from source_modules.helpers import Remote
+        remote = Remote(manager=Mock(), osc_client=Mock(), hud_client=Mock(),
+                        feedback_sinks=[self.client, NullEc4Client()])
+        remote.refresh_feedback()
+        [msg] = self._messages()
+        self.assertEqual(msg[13:13 + 12], _data_triples("Vol-"))
+        self.assertEqual(len(msg), 13 + 64 * 3 + 1)
+
+
 class TestEc4ClientThroughRemote(unittest.TestCase):
     """Integration across the real seam: a real Ec4Client registered as a
     feedback sink on Remote must emit one SysEx message on a device burst. This
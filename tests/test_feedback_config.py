@@ -38,6 +38,25 @@ feedback:
         self.assertIsInstance(root.feedback[0], FeedbackSinkDef)
         self.assertEqual(root.feedback[0].type, "grid_led")
 
+    def test_grid_led_fps_parsed(self):
+        doc = _BASE + """\
+feedback:
+    -
+        type: grid_led
+        led-fps: 20
+"""
+        self.assertEqual(read_root(doc).feedback[0].led_fps, 20)
+
+    def test_led_fps_rejected_on_other_sinks(self):
+        doc = _BASE + """\
+feedback:
+    -
+        type: ec4_text
+        led-fps: 20
+"""
+        with self.assertRaises(Exception):
+            read_root(doc)
+
     def test_unknown_sink_type_rejected(self):
         doc = _BASE + """\
 feedback:
@@ -218,7 +218,8 @@ class TestGenerateComposition(unittest.TestCase):
         # and the wiring (always present + syntax-checked in the template) is gated off.
         self.assertIn("REGION_CONFIG = {'dial_offset': 16, 'button_offset': 8,", comp_src)
         self.assertIn("RegionState(self._hud_client,", comp_src)
-        self.assertIn("dial_offset=REGION_CONFIG['dial_offset']", comp_src)
+        self.assertIn("dial_offset=region['dial_offset']", comp_src)
+        self.assertIn("'dial_count': 0, 'button_count': 8}", comp_src)
         self.assertIn("self._remote.set_region_state(self._region_state)", comp_src)
         # The region re-emit must bypass the primary's show-hud-on gate, so it
         # routes through reemit_combined_burst (not the trigger-gated
@@ -240,7 +241,7 @@ class TestGenerateComposition(unittest.TestCase):
         # The two surfaces agree on the region port; the forwarder retargets its
         # HUD client at it via the HUD_TARGET data constant, and runs no region.
         import re
-        port = re.search(r"REGION_CONFIG = \{'dial_offset': 16, 'button_offset': 8, 'port': (\d+)\}", comp_src).group(1)
+        port = re.search(r"REGION_CONFIG = \{'dial_offset': 16, 'button_offset': 8, 'port': (\d+)[,}]", comp_src).group(1)
         self.assertIn(f"HUD_TARGET = ('127.0.0.1', {port})", fwd_src)
         self.assertIn("REGION_CONFIG = None", fwd_src)
 
@@ -251,6 +252,44 @@ class TestGenerateComposition(unittest.TestCase):
         self.assertIn("(0, 0, 'button', 2, 8, 1)", comp_src)
 
 
+class TestGenerateNWayComposition(unittest.TestCase):
+    """`secondaries:` emits one forwarder per secondary, each with its own
+    region port and section; the compositor bakes a list of region configs."""
+
+    def test_emits_one_forwarder_per_secondary(self):
+        import ast
+        import re
+        import tempfile
+        from pathlib import Path
+        from ableton_control_surface_as_code.gen import generate
+
+        repo = Path(__file__).resolve().parent.parent
+        surfaces = repo / "live_surfaces"
+        with tempfile.TemporaryDirectory() as tmp:
+            comp_path = Path(tmp) / "trio.nt"
+            comp_path.write_text(
+                "ableton-dir: /x\n"
+                f"primary: {surfaces / 'launch_control' / 'ck_launch_control_16.nt'}\n"
+                "secondaries:\n"
+                f"    -\n        mapping: {surfaces / 'parks' / 'ck_parkstool_buttons.nt'}\n"
+                f"    -\n        mapping: {surfaces / 'parks' / 'ck_parkstool_buttons.nt'}\n"
+                "        region-port: 5301\n")
+            generate(comp_path)
+
+            comp_src = (Path(tmp) / "ck_trio__launch_control" / "modules" / "main_component.py").read_text()
+            fwd1 = (Path(tmp) / "ck_trio__parks" / "modules" / "main_component.py").read_text()
+            fwd2 = (Path(tmp) / "ck_trio__parks2" / "modules" / "main_component.py").read_text()
+
+        regions = ast.literal_eval(re.search(r"REGION_CONFIG = (\[.*\])", comp_src).group(1))
+        self.assertEqual([(r['dial_offset'], r['button_offset']) for r in regions], [(16, 8), (16, 16)])
+        self.assertEqual(regions[1]['port'], 5301)
+        self.assertIn(f"HUD_TARGET = ('127.0.0.1', {regions[0]['port']})", fwd1)
+        self.assertIn("HUD_TARGET = ('127.0.0.1', 5301)", fwd2)
+        # Each parks block is its own section with its own wire range.
+        self.assertIn("(0, 0, 'button', 2, 8, 1)", comp_src)
+        self.assertIn("(0, 0, 'button', 2, 16, 2)", comp_src)
+
+
 class TestHudModeOnTemplateVar(unittest.TestCase):
     """hud-owner-election-plan: HudArbiter reads `_acsac_hud_enabled` off
     sibling surfaces to decide who's even eligible to own the HUD. This must
@@ -2,8 +2,8 @@ import unittest
 from unittest.mock import Mock
 
 from source_modules.grid_led_client import (
-    GridLedClient, SYSEX_START, NON_COMMERCIAL_ID, LED_CMD, VERSION,
-    SYSEX_END, NUM_DIALS, NUM_BUTTONS, NUM_SLOTS, MAPPED_FLOOR,
+    GridLedClient, NullGridLedClient, SYSEX_START, NON_COMMERCIAL_ID, LED_CMD,
+    LED_DELTA_CMD, VERSION, SYSEX_END, NUM_DIALS, NUM_BUTTONS, NUM_SLOTS, MAPPED_FLOOR,
 )
 from source_modules.hud_protocol import BurstSnapshot, SlotPayload
 
@@ -129,6 +129,98 @@ class TestGridLedFrame(unittest.TestCase):
         self.manager.log_message.assert_called()
 
 
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestGridLedLiveUpdates(unittest.TestCase):
+    """Between bursts only changed slots go out, as LED_DELTA_CMD entries, at
+    most max_fps times a second."""
+
+    def setUp(self):
+        self.manager = Mock()
+        self.clock = _Clock()
+        self.client = GridLedClient(self.manager, max_fps=10, clock=self.clock)
+        self.client.on_burst(_snap(
+            dials=[(0, SlotPayload("P", 0.0, 0.0, 1.0)), (3, SlotPayload("Q", 0.0, 0.0, 1.0))],
+            zone_colors=[('dial', 0, 'FFFFFF'), ('dial', 3, 'FFFFFF')],
+        ))
+        self.manager._send_midi.reset_mock()
+        self.clock.now = 1.0
+
+    def _messages(self):
+        return [list(c[0][0]) for c in self.manager._send_midi.call_args_list]
+
+    def test_changed_slot_sends_one_delta_entry(self):
+        self.client.on_update('dial', 3, SlotPayload("Q", 1.0, 0.0, 1.0))
+        [msg] = self._messages()
+        self.assertEqual(msg, [SYSEX_START, NON_COMMERCIAL_ID, LED_DELTA_CMD, VERSION,
+                               3, 0x7F, 0x7F, 0x7F, SYSEX_END])
+
+    def test_unchanged_brightness_sends_nothing(self):
+        self.client.on_update('dial', 0, SlotPayload("P", 0.0, 0.0, 1.0))
+        # No zone colour -> off before and after.
+        self.client.on_update('dial', 7, SlotPayload("R", 1.0, 0.0, 1.0))
+        self.manager._send_midi.assert_not_called()
+        self.assertEqual(self.client.stats()['skipped'], 2)
+
+    def test_updates_inside_the_frame_interval_wait_for_the_tick(self):
+        self.client.on_update('dial', 0, SlotPayload("P", 1.0, 0.0, 1.0))
+        self.clock.now += 0.01
+        self.client.on_update('dial', 0, SlotPayload("P", 0.5, 0.0, 1.0))
+        self.client.on_update('dial', 3, SlotPayload("Q", 1.0, 0.0, 1.0))
+        self.assertEqual(len(self._messages()), 1)
+        tick = self.manager.schedule_message.call_args[0][1]
+        tick()  # still inside the interval: reschedules
+        self.assertEqual(len(self._messages()), 1)
+        self.clock.now += 0.1
+        self.manager.schedule_message.call_args[0][1]()
+        msgs = self._messages()
+        self.assertEqual(len(msgs), 2)
+        self.assertEqual(msgs[1][2], LED_DELTA_CMD)
+        self.assertEqual([msgs[1][4], msgs[1][8]], [0, 3])
+
+    def test_burst_supersedes_pending_slots(self):
+        self.client.on_update('dial', 0, SlotPayload("P", 1.0, 0.0, 1.0))
+        self.client.on_update('dial', 3, SlotPayload("Q", 1.0, 0.0, 1.0))
+        self.client.on_burst(_snap())
+        self.clock.now += 1.0
+        self.manager.schedule_message.call_args[0][1]()
+        self.assertEqual([m[2] for m in self._messages()], [LED_DELTA_CMD, LED_CMD])
+
+    def test_many_changed_slots_fall_back_to_dense_frame(self):
+        # 48 delta entries (4 bytes each) outweigh the 3-byte dense frame.
+        self.client.on_burst(_snap(
+            zone_colors=[('dial', i, 'FFFFFF') for i in range(NUM_DIALS)]
+            + [('button', i, 'FFFFFF') for i in range(NUM_BUTTONS)]))
+        full = SlotPayload("P", 1.0, 0.0, 1.0)
+        for i in range(NUM_DIALS):
+            self.client.on_update('dial', i, full)
+        for i in range(NUM_BUTTONS):
+            self.client.on_update('button', i, full)
+        self.clock.now += 1.0
+        self.manager.schedule_message.call_args[0][1]()
+        msg = self._messages()[-1]
+        self.assertEqual(msg[2], LED_CMD)
+        self.assertEqual(msg[4:-1], [0x7F] * (NUM_SLOTS * 3))
+
+    def test_failed_send_waits_for_next_burst(self):
+        self.manager._send_midi.side_effect = RuntimeError("bad port")
+        self.client.on_update('dial', 0, SlotPayload("P", 1.0, 0.0, 1.0))
+        self.manager._send_midi.side_effect = None
+        self.manager._send_midi.reset_mock()
+        self.clock.now += 1.0
+        self.client.on_update('dial', 3, SlotPayload("Q", 1.0, 0.0, 1.0))
+        self.manager._send_midi.assert_not_called()
+
+    def test_null_client_accepts_updates(self):
+        NullGridLedClient().on_update('dial', 0, SlotPayload("P", 1.0, 0.0, 1.0))
+
+
 class TestGridLedThroughRemote(unittest.TestCase):
     """Integration across the real seam: a real GridLedClient registered as a
     feedback sink on Remote must emit a non-zero LED frame when a zoned device
@@ -167,6 +259,27 @@ class TestGridLedThroughRemote(unittest.TestCase):
         self.assertEqual(body[0:3], [0xE0 >> 1, 0xA3 >> 1, 0x3E >> 1])
         self.assertTrue(any(b > 0 for b in body), "LED frame must not be all-off")
 
+    def test_parameter_update_drives_led_delta(self):
+        from source_modules.helpers import Remote
+
+        grid_manager = Mock()
+        client = GridLedClient(grid_manager, max_fps=None)
+        remote = Remote(manager=Mock(), osc_client=Mock(), hud_client=Mock(),
+                        feedback_sinks=[client])
+        client.on_burst(_snap(dials=[(0, SlotPayload("Cut", 0.0, 0.0, 1.0))],
+                              zone_colors=[('dial', 0, 'FFFFFF')]))
+        grid_manager._send_midi.reset_mock()
+
+        dial = Mock()
+        dial.param = Mock(); dial.param.name = "Cut"
+        dial.param.value, dial.param.min, dial.param.max = 1.0, 0.0, 1.0
+        dial.alias = None; dial.button = None
+        remote.parameter_updated(dial, 1)
+
+        msg = list(grid_manager._send_midi.call_args[0][0])
+        self.assertEqual(msg, [SYSEX_START, NON_COMMERCIAL_ID, LED_DELTA_CMD, VERSION,
+                               0, 0x7F, 0x7F, 0x7F, SYSEX_END])
+
 
 if __name__ == '__main__':
     unittest.main()
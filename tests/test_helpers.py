@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from unittest.mock import Mock
 
 from source_modules.helpers import Helpers, ParameterMapping, Remote, SwitchSlotMapping, SurfaceConfig
-from source_modules.hud_protocol import EMPTY_SLOT, SlotPayload, BurstSnapshot, PageInfo
+from source_modules.hud_protocol import EMPTY_SLOT, SlotPayload, BurstSnapshot, PageInfo, encode_slot_payload
 
 
 @dataclass
@@ -792,6 +792,76 @@ class TestFeedbackSinkFanout(unittest.TestCase):
         self.hud.commit.assert_called_once()
 
 
+class _FakeRegion:
+    """RegionState stand-in: fixed combined-index payloads."""
+
+    def __init__(self):
+        self.dials = []
+        self.buttons = []
+
+    def dial_payloads(self):
+        return list(self.dials)
+
+    def button_payloads(self):
+        return list(self.buttons)
+
+    def slot_lines(self):
+        return ([encode_slot_payload('dial', i, p) for i, p in self.dials]
+                + [encode_slot_payload('button', i, p) for i, p in self.buttons])
+
+
+class TestRemoteRegionReemit(unittest.TestCase):
+    """A secondary-region COMMIT re-sends the cached primary burst plus the
+    region, without touching the primary's parameters, OSC or feedback sinks."""
+
+    def setUp(self):
+        self.hud = Mock()
+        self.osc = Mock()
+        self.sink = Mock()
+        self.region = _FakeRegion()
+        self.remote = Remote(manager=Mock(), osc_client=self.osc, hud_client=self.hud,
+                             feedback_sinks=[self.sink])
+        self.remote.set_region_state(self.region)
+        self.freq = _make_param("Freq", value=0.5)
+        self.remote.device_update("Dev", [_make_real_param(_make_param("On/Off")),
+                                          _make_real_param(self.freq)],
+                                  hud_layout=[(0, 0, 'dial', 2, 0)])
+
+    def _lines(self):
+        return [line for c in self.hud.send_lines.call_args_list for line in c.args[0]]
+
+    def test_reemit_sends_cached_primary_and_new_region(self):
+        for m in (self.hud, self.osc, self.sink):
+            m.reset_mock()
+        # The primary's Live parameter must not be read again.
+        self.freq.name = "STALE"
+        self.region.dials = [(16, SlotPayload("Parks", 0.3, 0.0, 1.0))]
+        self.assertTrue(self.remote.reemit_region_burst())
+        self.assertEqual(self._lines(), ['SLOT|dial|0|Freq|0.5|0.0|1.0', 'SLOT|dial|1||0|0|1',
+                                         'SLOT|dial|16|Parks|0.3|0.0|1.0'])
+        self.hud.commit.assert_called_once_with(3)
+        self.osc.send_message.assert_not_called()
+        self.sink.on_burst.assert_not_called()
+        self.assertEqual(self.remote.hud_stats()['region_reemits'], 1)
+
+    def test_live_update_patches_cached_burst(self):
+        self.remote.parameter_updated(_make_real_param(_make_param("Freq", value=0.9)), 1)
+        self.hud.reset_mock()
+        self.remote.reemit_region_burst()
+        self.assertEqual(self._lines()[0], 'SLOT|dial|0|Freq|0.9|0.0|1.0')
+
+    def test_suppressed_reemit_sends_no_hud_lines(self):
+        self.hud.reset_mock()
+        self.remote.reemit_region_burst(suppress_hud=True)
+        self.hud.send_lines.assert_not_called()
+        self.hud.flush_burst.assert_called_once()
+
+    def test_no_cache_without_region_state(self):
+        remote = Remote(manager=Mock(), osc_client=Mock(), hud_client=Mock())
+        remote.device_update("Dev", [_make_real_param(_make_param("On/Off"))])
+        self.assertFalse(remote.reemit_region_burst())
+
+
 class TestHudLayoutSeparation(unittest.TestCase):
     """
     LAYOUT describes the physical controller — it never changes between devices.
@@ -908,6 +978,13 @@ class TestRemoteResendLayout(unittest.TestCase):
         self.hud.send_layout.assert_not_called()
 
 
+class TestRemoteNegotiate(unittest.TestCase):
+    def test_hello_capabilities_reach_hud_client(self):
+        hud = Mock()
+        Remote(manager=Mock(), osc_client=Mock(), hud_client=hud).negotiate("HELLO|delta\n")
+        hud.negotiate.assert_called_once_with(frozenset({'delta'}))
+
+
 class TestDenseSymmetricEmission(unittest.TestCase):
     """Dials and buttons must follow the same emission rule: one SLOT per cell
     position, whether or not a parameter resolves. Empty slots use the
@@ -1,5 +1,8 @@
 import unittest
+from unittest.mock import Mock, patch
 
+from source_modules.helpers import Remote
+from source_modules.hud_protocol import LayoutCell
 from source_modules.hud_arbiter import elect_hud_owner, eligible_surfaces, count_hud_surfaces, HudArbiter
 
 
@@ -91,9 +94,14 @@ class FakeHudClientForArbiter:
 
 
 class FakeRemote:
-    def __init__(self):
+    def __init__(self, hud_client):
+        self._hud_client = hud_client
         self.resend_layout_calls = 0
 
+    def set_hud_owner(self, flag):
+        # Same gating as Remote.set_hud_owner, minus the assembly skip.
+        self._hud_client.set_enabled(flag)
+
     def resend_layout(self):
         self.resend_layout_calls += 1
 
@@ -109,7 +117,7 @@ class FakeHelpers:
 class FakeMainComponent:
     def __init__(self):
         self._hud_client = FakeHudClientForArbiter()
-        self._remote = FakeRemote()
+        self._remote = FakeRemote(self._hud_client)
         self._helpers = FakeHelpers()
 
 
@@ -238,5 +246,91 @@ class TestHudArbiterReelect(unittest.TestCase):
         self.assertEqual(alpha.messages, [])
 
 
+def _real_param(name, value):
+    rp = Mock()
+    rp.param.name = name
+    rp.param.value = value
+    rp.param.min = 0.0
+    rp.param.max = 1.0
+    rp.alias = None
+    rp.button = None
+    return rp
+
+
+class TestRemoteHudOwnership(unittest.TestCase):
+    """A surface that lost the election skips HUD assembly entirely (its
+    datagrams would only be discarded by the disabled HudClient) while OSC and
+    feedback sinks keep working."""
+
+    LAYOUT = [LayoutCell(0, 0, 'dial', 1, 0)]
+
+    def _remote(self, sinks=None):
+        self.hud = Mock()
+        self.osc = Mock()
+        return Remote(manager=Mock(), osc_client=self.osc, hud_client=self.hud,
+                      feedback_sinks=sinks)
+
+    def _burst(self, remote):
+        remote.device_update("Dev", [_real_param("On", 1.0), _real_param("Cut", 0.5)],
+                             hud_layout=self.LAYOUT)
+
+    def _osc_addresses(self):
+        return [c[0][0] for c in self.osc.send_message.call_args_list]
+
+    def test_set_hud_owner_gates_the_client(self):
+        remote = self._remote()
+        remote.set_hud_owner(False)
+        self.hud.set_enabled.assert_called_once_with(False)
+        self.assertFalse(remote.hud_owner)
+
+    def test_owner_assembles_the_burst(self):
+        remote = self._remote()
+        self._burst(remote)
+        self.hud.send_slot.assert_called()
+        self.assertEqual(remote.hud_stats()['bursts_assembled'], 1)
+
+    def test_non_owner_skips_payloads_but_keeps_osc(self):
+        remote = self._remote()
+        remote.set_hud_owner(False)
+        with patch.object(Remote, '_build_dial_payloads',
+                          side_effect=AssertionError("payloads built for nobody")):
+            self._burst(remote)
+        self.hud.send_slot.assert_not_called()
+        self.hud.commit.assert_not_called()
+        self.assertEqual(self._osc_addresses(), [
+            "/selected-device/name",
+            "/selected-device/parameter-update",
+            "/selected-device/parameter-update",
+            "/selected-device/parameter-update-complete",
+        ])
+        stats = remote.hud_stats()
+        self.assertEqual((stats['bursts_assembled'], stats['bursts_skipped']), (0, 1))
+
+    def test_non_owner_still_feeds_sinks(self):
+        sink = Mock()
+        remote = self._remote(sinks=[sink])
+        remote.set_hud_owner(False)
+        self._burst(remote)
+        sink.on_burst.assert_called_once()
+        self.assertEqual(sink.on_burst.call_args[0][0].dials[0][1].name, "Cut")
+        self.hud.send_slot.assert_not_called()
+        self.assertEqual(remote.hud_stats()['bursts_skipped'], 1)
+
+    def test_non_owner_skips_live_hud_updates(self):
+        remote = self._remote()
+        remote.set_hud_owner(False)
+        remote.parameter_updated(_real_param("Cut", 0.7), 1)
+        self.hud.send_update.assert_not_called()
+        self.osc.send_message.assert_called_once()
+        self.assertEqual(remote.hud_stats()['updates_skipped'], 1)
+
+    def test_regaining_ownership_resumes_assembly(self):
+        remote = self._remote()
+        remote.set_hud_owner(False)
+        remote.set_hud_owner(True)
+        self._burst(remote)
+        self.hud.send_slot.assert_called()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 
 from source_modules.hud_client import HudClient, NullHudClient
+from source_modules.hud_protocol import is_binary, is_part, parse_all, parse_datagram, PartAssembler
 
 
 class CapturingHudClient(HudClient):
@@ -62,6 +63,16 @@ class TestHudClientDatagrams(unittest.TestCase):
         c.send_slot('button', 2, "Mute", 0.0, 0.0, 1.0)
         self.assertEqual(c._socket.datagrams, ["SLOT|button|2|Mute|0.0|0.0|1.0\n"])
 
+    def test_send_lines_joins_the_burst(self):
+        c = self._client()
+        c.begin_burst()
+        c.send_device("EQ Eight")
+        c.send_lines(["SLOT|dial|0|Freq|0.5|0.0|1.0", "SLOT|dial|1|Q|0.1|0.0|1.0"])
+        c.commit(2)
+        c.flush_burst()
+        self.assertEqual(c._socket.datagrams, [
+            "DEVICE|EQ Eight\nSLOT|dial|0|Freq|0.5|0.0|1.0\nSLOT|dial|1|Q|0.1|0.0|1.0\nCOMMIT|2\n"])
+
     def test_outside_burst_each_line_is_its_own_datagram(self):
         c = self._client()
         c.send_ping()
@@ -153,6 +164,179 @@ class TestHudClientActivityClock(unittest.TestCase):
         self.assertIsNone(NullHudClient().seconds_since_last_send())
 
 
+class TestHudClientDelta(unittest.TestCase):
+    """Delta bursts (hud_protocol.md "Delta bursts"): once the HUD announces
+    `delta`, a burst only carries what changed since the last one it got."""
+
+    def _client(self):
+        c = HudClient()
+        c._socket = FakeSocket()
+        c.negotiate(frozenset({'delta'}))
+        return c
+
+    def _burst(self, c, freq=0.5, res=0.1, page=1):
+        c.begin_burst()
+        c.send_layout([(0, 0, 'dial', 2, 0, 0)])
+        c.send_autohide(False)
+        c.send_device("Auto Filter")
+        c.send_page_info(page, 2, 1, 1)
+        c.send_zones(())
+        c.send_slot('dial', 0, "Freq", freq, 0.0, 1.0)
+        c.send_slot('dial', 1, "Res", res, 0.0, 1.0)
+        c.commit(2)
+        c.flush_burst()
+        return c._socket.datagrams[-1]
+
+    def test_first_burst_is_a_full_keyframe(self):
+        c = self._client()
+        self.assertTrue(self._burst(c).startswith("LAYOUT|"))
+
+    def test_second_burst_carries_only_changed_lines(self):
+        c = self._client()
+        self._burst(c)
+        self.assertEqual(
+            self._burst(c, res=0.7, page=2),
+            "DELTA|Auto Filter\n"
+            "PAGE|2|2|1|1\n"
+            "SLOT|dial|1|Res|0.7|0.0|1.0\n"
+            "COMMIT|1\n",
+        )
+
+    def test_unchanged_burst_still_commits(self):
+        # The COMMIT is what re-shows a dismissed HUD, so even a no-op delta
+        # goes out.
+        c = self._client()
+        self._burst(c)
+        self.assertEqual(self._burst(c), "DELTA|Auto Filter\nCOMMIT|0\n")
+
+    def test_update_outside_burst_is_resent_in_next_delta(self):
+        c = self._client()
+        self._burst(c)
+        c.send_update('dial', 0, "Freq", 0.9, 0.0, 1.0)
+        self.assertIn("SLOT|dial|0|Freq|0.5|0.0|1.0", self._burst(c))
+
+    def test_hello_forces_a_keyframe(self):
+        c = self._client()
+        self._burst(c)
+        c.negotiate(frozenset({'delta'}))
+        self.assertTrue(self._burst(c).startswith("LAYOUT|"))
+
+    def test_periodic_keyframe(self):
+        c = self._client()
+        c._keyframe_interval = 2
+        self._burst(c)
+        self.assertTrue(self._burst(c).startswith("DELTA|"))
+        self.assertTrue(self._burst(c).startswith("DELTA|"))
+        self.assertTrue(self._burst(c).startswith("LAYOUT|"))
+
+    def test_burst_missed_while_disabled_is_followed_by_keyframe(self):
+        c = self._client()
+        self._burst(c)
+        c.set_enabled(False)
+        c.begin_burst()
+        c.send_device("Other")
+        c.commit(0)
+        c.flush_burst()
+        c.set_enabled(True)
+        self.assertTrue(self._burst(c).startswith("LAYOUT|"))
+
+    def test_without_delta_capability_bursts_stay_full(self):
+        c = self._client()
+        c.negotiate(frozenset())
+        self._burst(c)
+        self.assertTrue(self._burst(c).startswith("LAYOUT|"))
+
+    def test_null_client_negotiate_is_noop(self):
+        NullHudClient().negotiate(frozenset({'delta'}))
+        NullHudClient().request_keyframe()
+
+
+class RawSocket:
+    def __init__(self):
+        self.datagrams = []
+
+    def sendto(self, data, addr):
+        self.datagrams.append(data)
+
+
+class TestHudClientBinary(unittest.TestCase):
+    def _client(self, caps):
+        c = HudClient()
+        c._socket = RawSocket()
+        c.negotiate(frozenset(caps))
+        return c
+
+    def test_burst_goes_out_as_one_binary_frame(self):
+        c = self._client({'bin1'})
+        c.begin_burst()
+        c.send_device("EQ Eight")
+        c.send_slot('dial', 0, "Freq", 0.5, 0.0, 1.0)
+        c.commit(1)
+        c.flush_burst()
+        frame, = c._socket.datagrams
+        self.assertEqual(parse_datagram(frame), parse_all("DEVICE|EQ Eight\nSLOT|dial|0|Freq|0.5|0.0|1.0\nCOMMIT|1"))
+
+    def test_control_lines_are_framed_too(self):
+        c = self._client({'bin1'})
+        c.send_ping()
+        self.assertTrue(is_binary(c._socket.datagrams[0]))
+
+    def test_text_without_capability(self):
+        c = self._client({'delta'})
+        c.send_ping()
+        self.assertEqual(c._socket.datagrams, [b"PING\n"])
+
+
+class TestHudClientMultipart(unittest.TestCase):
+    def _client(self, caps):
+        c = HudClient()
+        c._socket = RawSocket()
+        c._max_datagram = 512
+        c.negotiate(frozenset(caps))
+        return c
+
+    def _big_burst(self, c):
+        c.begin_burst()
+        c.send_device("Wide")
+        for i in range(40):
+            c.send_slot('dial', i, f"Parameter name {i}", 0.5, 0.0, 1.0)
+        c.commit(40)
+        c.flush_burst()
+
+    def test_oversized_burst_goes_out_as_parts(self):
+        c = self._client({'part1'})
+        self._big_burst(c)
+        dgrams = c._socket.datagrams
+        self.assertTrue(1 < len(dgrams) < 10)
+        self.assertTrue(all(is_part(d) and len(d) <= 512 for d in dgrams))
+        asm = PartAssembler()
+        whole = [asm.feed(d) for d in dgrams][-1]
+        msgs = parse_datagram(whole)
+        self.assertEqual(len(msgs), 42)
+        self.assertEqual(str(msgs[-1]), str(parse_all("COMMIT|40")[0]))
+
+    def test_parts_carry_binary_frames(self):
+        c = self._client({'part1', 'bin1'})
+        c._max_datagram = 128
+        self._big_burst(c)
+        asm = PartAssembler()
+        whole = [asm.feed(d) for d in c._socket.datagrams][-1]
+        self.assertTrue(is_binary(whole))
+
+    def test_sequence_advances_per_burst(self):
+        c = self._client({'part1'})
+        self._big_burst(c)
+        self._big_burst(c)
+        seqs = {d.split(b'|')[1] for d in c._socket.datagrams}
+        self.assertEqual(seqs, {b'0', b'1'})
+
+    def test_without_capability_falls_back_to_lines(self):
+        c = self._client(set())
+        self._big_burst(c)
+        self.assertEqual(len(c._socket.datagrams), 42)
+        self.assertFalse(any(is_part(d) for d in c._socket.datagrams))
+
+
 class TestHudClientWire(unittest.TestCase):
     def test_single_source_lines(self):
         c = CapturingHudClient()
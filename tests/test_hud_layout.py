@@ -6,6 +6,7 @@ from ableton_control_surface_as_code.hud_layout import (
     dial_count,
     button_count,
     combine_layouts,
+    combine_sections,
     _label_pairs_for_mapping,
 )
 from tests.builders import build_functions_with_midi
@@ -175,5 +176,25 @@ class TestCombineLayouts(unittest.TestCase):
         self.assertEqual(cells, [(0, 0, 'dial', 4, 0, 0)])
 
 
+class TestCombineSections(unittest.TestCase):
+    def test_offsets_accumulate_across_sections(self):
+        primary = [(0, 0, 'dial', 8, 0, 0), (1, 0, 'button', 4, 0, 0)]
+        second = [(0, 0, 'button', 8, 0, 0)]
+        third = [(0, 0, 'dial', 2, 0, 0), (1, 0, 'button', 2, 0, 0)]
+        combined, offsets = combine_sections([primary, second, third])
+        self.assertEqual(offsets, [(0, 0), (8, 4), (8, 12)])
+        self.assertEqual(combined, primary + [
+            (0, 0, 'button', 8, 4, 1),
+            (0, 0, 'dial', 2, 8, 2),
+            (1, 0, 'button', 2, 12, 2),
+        ])
+
+    def test_two_sections_match_combine_layouts(self):
+        primary = [(0, 0, 'dial', 16, 0, 0), (1, 0, 'button', 8, 0, 0)]
+        secondary = [(0, 0, 'button', 8, 0, 0)]
+        combined, offsets = combine_sections([primary, secondary])
+        self.assertEqual(combine_layouts(primary, secondary), (combined,) + offsets[1])
+
+
 if __name__ == '__main__':
     unittest.main()
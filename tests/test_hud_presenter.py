@@ -1,9 +1,9 @@
 """Direct unit tests for HudPresenter (R9): burst assembly + show/hide intent,
 testable with a fake Remote + a real ParameterResolver, no surface needed."""
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
-from source_modules.hud_presenter import HudPresenter
+from source_modules.hud_presenter import HudPresenter, BurstCache
 from source_modules.param_resolver import ParameterResolver, _build_device_table
 
 
@@ -451,6 +451,49 @@ class TestReemitCombinedBurstClipGate(unittest.TestCase):
         self.assertFalse(remote.device_update.call_args.kwargs.get('suppress_hud'))
 
 
+class TestReemitCombinedBurstFromCache(unittest.TestCase):
+    """A region COMMIT for the device of the last burst re-sends Remote's
+    cached primary burst instead of resolving the device again."""
+
+    def test_same_device_uses_cached_burst(self):
+        p, remote = _presenter(slot_assignments=[(1, 'slot1')], hud_trigger='selection')
+        dev = FakeDevice("X", [FakeParam("On/Off"), FakeParam("A")])
+        p.emit_burst(dev)
+        remote.reset_mock()
+        p.reemit_combined_burst(dev)
+        remote.reemit_region_burst.assert_called_once_with(False)
+        remote.device_update.assert_not_called()
+        self.assertFalse(p.hud_dismissed)
+
+    def test_other_device_takes_full_burst(self):
+        p, remote = _presenter(slot_assignments=[(1, 'slot1')], hud_trigger='selection')
+        p.emit_burst(FakeDevice("X", [FakeParam("On/Off"), FakeParam("A")]))
+        remote.reset_mock()
+        p.reemit_combined_burst(FakeDevice("Y", [FakeParam("On/Off"), FakeParam("B")]))
+        remote.reemit_region_burst.assert_not_called()
+        remote.device_update.assert_called_once()
+
+    def test_no_cached_burst_falls_back(self):
+        p, remote = _presenter(slot_assignments=[(1, 'slot1')], hud_trigger='selection')
+        dev = FakeDevice("X", [FakeParam("On/Off"), FakeParam("A")])
+        p.emit_burst(dev)
+        remote.reset_mock()
+        remote.reemit_region_burst.return_value = False
+        p.reemit_combined_burst(dev)
+        remote.device_update.assert_called_once()
+
+    def test_clip_open_hides_without_burst(self):
+        p, remote = _presenter(slot_assignments=[(1, 'slot1')], hud_trigger='selection')
+        dev = FakeDevice("X", [FakeParam("On/Off"), FakeParam("A")])
+        p.emit_burst(dev)
+        p.clip_view_changed(True)
+        remote.reset_mock()
+        p.reemit_combined_burst(dev)
+        remote.reemit_region_burst.assert_called_once_with(True)
+        remote.hide.assert_called_once()
+        self.assertTrue(p.hud_dismissed)
+
+
 class TestIdleSyncOnDeviceFocus(unittest.TestCase):
     """The idle-sync mirror fix still guards the device-focus / mode-refresh
     paths (a Swift idle-dismiss the Python mirror never learned about)."""
@@ -493,5 +536,136 @@ class TestIdleSyncOnDeviceFocus(unittest.TestCase):
         remote.hide.assert_not_called()
 
 
+class _KillableDevice(FakeDevice):
+    """A live device until `kill()`; afterwards every read raises like a freed
+    Boost handle (see _DeadDevice)."""
+    def __init__(self, class_name, parameters):
+        super().__init__(class_name, parameters)
+        self._dead = False
+
+    def kill(self):
+        self._dead = True
+
+    def __getattribute__(self, name):
+        if name not in ('_dead', 'kill') and object.__getattribute__(self, '_dead'):
+            raise TypeError("Boost.Python.ArgumentError: dead device handle")
+        return object.__getattribute__(self, name)
+
+
+def _plugin(name, n=20):
+    return FakeDevice(name, [FakeParam("On/Off")] + [FakeParam(f"{name} {i}") for i in range(n)])
+
+
+class TestBurstCache(unittest.TestCase):
+    """Flipping back to a recently focused device reuses its burst skeleton
+    (resolution plan + page metadata) and only re-reads parameter values."""
+
+    def _burst_params(self, remote):
+        return [rp.param if rp is not None else None
+                for rp in remote.device_update.call_args[0][1]]
+
+    def test_revisit_hits_and_reuses_resolution(self):
+        p, remote = _presenter(slot_assignments=[(1, 's1'), (2, 's2')])
+        dev_a, dev_b = _plugin("A"), _plugin("B")
+        p.emit_burst(dev_a)
+        first = self._burst_params(remote)
+        p.emit_burst(dev_b)
+        p.emit_burst(dev_a)
+        self.assertEqual(self._burst_params(remote), first)
+        self.assertEqual(p.burst_cache_stats()['hits'], 1)
+        self.assertEqual(p.burst_cache_stats()['misses'], 2)
+
+    def test_revisit_skips_page_metadata(self):
+        p, remote = _presenter(slot_assignments=[(1, 's1')])
+        dev_a, dev_b = _plugin("A"), _plugin("B")
+        p.emit_burst(dev_a)
+        p.emit_burst(dev_b)
+        with patch.object(
+                p._resolver, 'encoder_pages_count',
+                side_effect=AssertionError("recomputed on a hit")):
+            p.emit_burst(dev_a)
+        page = remote.device_update.call_args[1]['page']
+        self.assertEqual(page.enc_total, 3)   # 20 continuous params, 8 per page
+
+    def test_revisit_reads_fresh_values(self):
+        p, remote = _presenter(slot_assignments=[(1, 's1')])
+        dev_a, dev_b = _plugin("A"), _plugin("B")
+        p.emit_burst(dev_a)
+        p.emit_burst(dev_b)
+        dev_a.parameters[1].value = 0.75
+        p.emit_burst(dev_a)
+        self.assertEqual(self._burst_params(remote)[1].value, 0.75)
+
+    def test_page_is_part_of_the_key(self):
+        p, remote = _presenter(slot_assignments=[(1, 's1')])
+        dev = _plugin("A")
+        p.emit_burst(dev)
+        p._resolver.encoder_page = 2
+        p.emit_burst(dev)
+        self.assertEqual(self._burst_params(remote)[1].name, "A 8")
+        p._resolver.encoder_page = 1
+        p.emit_burst(dev)
+        self.assertEqual(self._burst_params(remote)[1].name, "A 0")
+        self.assertEqual(p.burst_cache_stats()['hits'], 1)
+
+    def test_rebuilt_parameter_list_recompiles(self):
+        p, remote = _presenter(slot_assignments=[(1, 's1')])
+        dev_a, dev_b = _plugin("A"), _plugin("B")
+        p.emit_burst(dev_a)
+        p.emit_burst(dev_b)
+        # Same length, different parameters: the plan's liveness check fails.
+        dev_a.parameters = [FakeParam("On/Off")] + [FakeParam(f"X {i}") for i in range(20)]
+        p.emit_burst(dev_a)
+        self.assertEqual(self._burst_params(remote)[1].name, "X 0")
+        # Different length: the skeleton itself is discarded.
+        dev_a.parameters = dev_a.parameters + [FakeParam("X extra")]
+        p.emit_burst(dev_b)
+        p.emit_burst(dev_a)
+        self.assertEqual(self._burst_params(remote)[1].name, "X 0")
+
+    def test_dead_handle_is_dropped(self):
+        p, remote = _presenter(slot_assignments=[(1, 's1')])
+        dev_a, dev_b = _KillableDevice("A", [FakeParam("On/Off"), FakeParam("A")]), _plugin("B")
+        p.emit_burst(dev_a)
+        p.emit_burst(dev_b)
+        dev_a.kill()
+        p.emit_burst(_plugin("C"))
+        stats = p.burst_cache_stats()
+        self.assertEqual(stats['dead'], 1)
+        self.assertEqual(stats['size'], 2)
+
+    def test_size_bound_evicts_least_recently_used(self):
+        cache = BurstCache(max_entries=2)
+        a, b, c = _plugin("A"), _plugin("B"), _plugin("C")
+        cache.put(a, 'k', 'sa')
+        cache.put(b, 'k', 'sb')
+        self.assertEqual(cache.get(a, 'k'), 'sa')    # a is now most recent
+        cache.put(c, 'k', 'sc')
+        self.assertIsNone(cache.get(b, 'k'))
+        self.assertEqual(cache.get(a, 'k'), 'sa')
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+
+class TestNonOwnerBurst(unittest.TestCase):
+    def test_non_owner_skips_page_metadata(self):
+        p, remote = _presenter(slot_assignments=[(1, 's1')])
+        remote.hud_owner = False
+        with patch.object(p._resolver, 'encoder_pages_count',
+                          side_effect=AssertionError("page walk on a non-owner")):
+            p.emit_burst(_plugin("A"))
+        self.assertIsNone(remote.device_update.call_args[1]['page'])
+        # Still resolved: OSC and feedback sinks need the parameters.
+        self.assertEqual(remote.device_update.call_args[0][1][1].param.name, "A 0")
+
+    def test_page_metadata_filled_in_once_owner(self):
+        p, remote = _presenter(slot_assignments=[(1, 's1')])
+        dev = _plugin("A")
+        remote.hud_owner = False
+        p.emit_burst(dev)
+        remote.hud_owner = True
+        p.emit_burst(dev)
+        self.assertEqual(remote.device_update.call_args[1]['page'].enc_total, 3)
+
+
 if __name__ == "__main__":
     unittest.main()
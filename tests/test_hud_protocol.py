@@ -7,6 +7,7 @@ from source_modules.hud_protocol import (
     SlotAddress,
     LayoutMsg,
     DeviceMsg,
+    DeltaMsg,
     SlotMsg,
     UpdateMsg,
     CommitMsg,
@@ -17,6 +18,16 @@ from source_modules.hud_protocol import (
     SetModeMsg,
     UnknownMsg,
     encode_event,
+    encode_delta,
+    encode_hello,
+    parse_hello,
+    encode_binary,
+    parse_binary,
+    parse_datagram,
+    is_binary,
+    BINARY_MAGIC,
+    state_key,
+    diff_burst,
     encode_zones,
     encode_set_mode,
     encode_layout,
@@ -32,6 +43,11 @@ from source_modules.hud_protocol import (
     DrumMsg,
     parse,
     parse_all,
+    encode_parts,
+    is_part,
+    parse_part,
+    PartAssembler,
+    MAX_PARTS,
 )
 
 
@@ -53,6 +69,20 @@ class TestDrumMessage(unittest.TestCase):
         from source_modules.hud_protocol import UnknownMsg as _U
         self.assertIsInstance(parse('DRUM|onlyone'), _U)
 
+    def test_page_metadata_rides_on_the_pattern_field(self):
+        line = encode_drum('Kick|Sub', 'X.......', page=2, pages=6, resolution='16t')
+        self.assertEqual(line, 'DRUM|X.......@2/6/16t|Kick|Sub')
+        self.assertEqual(parse(line), DrumMsg('X.......', 'Kick|Sub', 2, 6, '16t'))
+
+    def test_single_page_sixteenths_keep_the_short_form(self):
+        self.assertEqual(encode_drum('Kick', 'X' * 16, page=1, pages=1), 'DRUM|' + 'X' * 16 + '|Kick')
+        self.assertEqual(parse('DRUM|X...|Kick').pages, 1)
+
+    def test_malformed_page_metadata_is_unknown(self):
+        from source_modules.hud_protocol import UnknownMsg as _U
+        self.assertIsInstance(parse('DRUM|X...@2/x/16|Kick'), _U)
+        self.assertIsInstance(parse('DRUM|X...@2/6|Kick'), _U)
+
 
 class TestLayoutCell(unittest.TestCase):
     def test_named_field_access(self):
@@ -330,9 +360,138 @@ class TestMalformed(unittest.TestCase):
     def test_page_info_wrong_field_count(self):
         self.assertIsInstance(parse("PAGE|1|3|1"), UnknownMsg)
 
-
-if __name__ == '__main__':
-    unittest.main()
+class TestBinaryFrames(unittest.TestCase):
+    LINES = [
+        encode_layout([(0, 0, 'dial', 2, 0, 0)]),
+        encode_device("EQ Eight"),
+        encode_slot('dial', 0, "Freq", 0.5, 0.0, 1.0),
+        encode_slot('dial', 1, "", 0, 0, 1),
+        encode_update('button', 2, "On", 1.0, 0.0, 1.0, "power"),
+        encode_commit(2),
+    ]
+
+    def test_frame_decodes_to_the_same_messages_as_text(self):
+        frame = encode_binary(self.LINES)
+        self.assertTrue(is_binary(frame))
+        self.assertEqual(parse_datagram(frame), parse_all('\n'.join(self.LINES)))
+
+    def test_text_to_binary_to_text_round_trips(self):
+        # 0.1, 0.3, -0.7 and 12.1 aren't representable in float32: re-encoding
+        # a decoded slot must not leak 0.10000000149011612.
+        lines = [encode_slot('dial', 0, "Q", 0.1, -0.7, 12.1),
+                 encode_update('dial', 1, "Mix", 0.3, 0.0, 1.0, "pct")]
+        decoded = parse_binary(encode_binary(lines))
+        self.assertEqual([encode_slot_payload(m.kind, m.index, m.payload) for m in decoded[:1]],
+                         lines[:1])
+        self.assertEqual(decoded, parse_all('\n'.join(lines)))
+
+    def test_values_keep_float32_precision(self):
+        msg, = parse_binary(encode_binary([encode_slot('dial', 0, "Q", 0.4960629940032959, 0.0, 1.0)]))
+        self.assertAlmostEqual(msg.payload.value, 0.4960629940032959, places=6)
+
+    def test_names_are_interned_once_per_frame(self):
+        lines = [encode_slot('button', i, "", 0, 0, 1) for i in range(16)]
+        frame = encode_binary(lines)
+        # one empty name, one 0..1 range, 16 fixed-width records
+        self.assertEqual(len(frame), len(BINARY_MAGIC) + (2 + 2) + (2 + 8) + 2 + 16 * 14)
+
+    def test_unparseable_slot_line_rides_along_as_text(self):
+        line = "SLOT|dial|0|Freq|nan-ish|0.0|1.0"
+        self.assertEqual(parse_binary(encode_binary([line])), [parse(line)])
+
+    def test_out_of_float32_range_line_rides_along_as_text(self):
+        huge = "SLOT|dial|0|Freq|1e+39|0.0|1e+39"
+        lines = [huge, "SLOT|dial|1|Res|0.5|0.0|1.0", "UPDATE|button|70000|X|0.0|0.0|1.0"]
+        frame = encode_binary(lines)
+        self.assertEqual(parse_binary(frame), parse_all('\n'.join(lines)))
+
+    def test_truncated_frame_keeps_decoded_prefix(self):
+        msgs = parse_binary(encode_binary(self.LINES)[:-4])
+        self.assertEqual(msgs[:5], parse_all('\n'.join(self.LINES[:5])))
+        self.assertIsInstance(msgs[-1], UnknownMsg)
+
+    def test_text_datagram_still_parses(self):
+        self.assertEqual(parse_datagram(b"DEVICE|X\nCOMMIT|0\n"), [DeviceMsg("X"), parse("COMMIT|0")])
+
+    def test_dense_burst_shrinks(self):
+        lines = [encode_device("Wavetable")] + [
+            encode_slot('dial', i, f"Osc {i} Pos", 0.123456789 * i, 0.0, 1.0) for i in range(16)
+        ] + [encode_slot('button', i, "", 0, 0, 1) for i in range(16)] + [encode_commit(32)]
+        text = ''.join(line + '\n' for line in lines).encode('utf-8')
+        self.assertLess(len(encode_binary(lines)), len(text) * 0.7)
+
+
+class TestMultipart(unittest.TestCase):
+    PAYLOAD = bytes(range(256)) * 40  # 10240 bytes
+
+    def test_fragments_fit_and_reassemble(self):
+        parts = encode_parts(self.PAYLOAD, 7, 4096)
+        self.assertEqual(len(parts), 3)
+        self.assertTrue(all(len(p) <= 4096 and is_part(p) for p in parts))
+        self.assertEqual(parse_part(parts[1])[:3], (7, 1, 3))
+        asm = PartAssembler()
+        self.assertIsNone(asm.feed(parts[0]))
+        self.assertIsNone(asm.feed(parts[2]))
+        self.assertEqual(asm.feed(parts[1]), self.PAYLOAD)
+
+    def test_too_many_fragments_is_refused(self):
+        self.assertIsNone(encode_parts(b'x' * (MAX_PARTS * 100 + 1), 0, 120))
+
+    def test_newer_burst_evicts_stale_fragments(self):
+        old = encode_parts(self.PAYLOAD, 1, 4096)
+        new = encode_parts(self.PAYLOAD[::-1], 2, 4096)
+        asm = PartAssembler()
+        asm.feed(old[0])  # rest of burst 1 lost
+        for p in new:
+            out = asm.feed(p)
+        self.assertEqual(out, self.PAYLOAD[::-1])
+        self.assertEqual(asm.evicted, 1)
+        # A late fragment of burst 1 can't complete it any more.
+        self.assertIsNone(asm.feed(old[1]))
+        self.assertIsNone(asm.feed(old[2]))
+
+    def test_duplicate_of_delivered_burst_is_ignored(self):
+        parts = encode_parts(self.PAYLOAD, 3, 4096)
+        asm = PartAssembler()
+        for p in parts:
+            asm.feed(p)
+        self.assertIsNone(asm.feed(parts[0]))
+        self.assertEqual(asm.completed, 1)
+
+    def test_sequence_restart_is_accepted(self):
+        asm = PartAssembler()
+        for seq in (500, 0):
+            for p in encode_parts(self.PAYLOAD, seq, 4096):
+                out = asm.feed(p)
+            self.assertEqual(out, self.PAYLOAD)
+
+    def test_reload_restarting_at_the_delivered_seq_is_accepted(self):
+        asm = PartAssembler()
+        for p in encode_parts(self.PAYLOAD, 0, 4096):
+            asm.feed(p)
+        # New instance after a reload: its counter starts at 0 again.
+        for p in encode_parts(self.PAYLOAD[::-1], 0, 4096):
+            out = asm.feed(p)
+        self.assertEqual(out, self.PAYLOAD[::-1])
+        self.assertEqual(asm.completed, 2)
+
+    def test_restart_sharing_a_leading_fragment_still_completes(self):
+        asm = PartAssembler()
+        first = encode_parts(self.PAYLOAD, 0, 4096)
+        for p in first:
+            asm.feed(p)
+        changed = self.PAYLOAD[:8000] + bytes(len(self.PAYLOAD) - 8000)
+        second = encode_parts(changed, 0, 4096)
+        self.assertEqual(second[0], first[0])
+        self.assertIsNone(asm.feed(second[0]))  # indistinguishable from a duplicate
+        self.assertIsNone(asm.feed(second[1]))
+        self.assertEqual(asm.feed(second[2]), changed)
+
+    def test_malformed_header(self):
+        asm = PartAssembler()
+        self.assertIsNone(asm.feed(b'PART|x|0|1\nabc'))
+        self.assertIsNone(asm.feed(b'PART|1|3|2\nabc'))
+        self.assertEqual(asm.malformed, 2)
 
 
 class TestDividers(unittest.TestCase):
@@ -363,3 +522,48 @@ class TestDividers(unittest.TestCase):
 
     def test_parse_dividers_non_int_is_unknown(self):
         self.assertIsInstance(parse("DIVIDERS|1|x"), UnknownMsg)
+
+
+class TestDeltaBursts(unittest.TestCase):
+    def test_delta_roundtrip(self):
+        self.assertEqual(encode_delta("EQ Eight"), "DELTA|EQ Eight")
+        self.assertEqual(parse("DELTA|EQ Eight"), DeltaMsg("EQ Eight"))
+        self.assertIsInstance(parse("DELTA"), UnknownMsg)
+
+    def test_hello_capabilities(self):
+        self.assertEqual(parse_hello("HELLO"), frozenset())
+        self.assertEqual(parse_hello(encode_hello(['delta'])), frozenset({'delta'}))
+        self.assertEqual(parse_hello("HELLO|delta, other\n"), frozenset({'delta', 'other'}))
+        self.assertEqual(parse_hello("PING|delta"), frozenset())
+
+    def test_slot_and_update_share_a_state_key(self):
+        self.assertEqual(state_key(encode_slot('dial', 3, "A", 0.1, 0, 1)),
+                         state_key(encode_update('dial', 3, "B", 0.2, 0, 1)))
+        self.assertEqual(state_key(encode_page_info(1, 2, 1, 1)), 'PAGE')
+        self.assertIsNone(state_key(encode_device("X")))
+        self.assertIsNone(state_key(encode_commit(0)))
+
+    def test_diff_without_shadow_is_a_keyframe(self):
+        lines = [encode_device("D"), encode_slot('dial', 0, "A", 0.1, 0, 1), encode_commit(1)]
+        delta, state = diff_burst(lines, None)
+        self.assertIsNone(delta)
+        self.assertEqual(state, {('SLOT', 'dial', '0'): lines[1]})
+
+    def test_diff_emits_changed_slots_only(self):
+        old = [encode_device("D"), encode_slot('dial', 0, "A", 0.1, 0, 1),
+               encode_slot('dial', 1, "B", 0.1, 0, 1), encode_commit(2)]
+        new = [encode_device("D2"), encode_slot('dial', 0, "A", 0.1, 0, 1),
+               encode_slot('dial', 1, "B", 0.5, 0, 1), encode_commit(2)]
+        _, shadow = diff_burst(old, None)
+        delta, _ = diff_burst(new, shadow)
+        self.assertEqual(delta, ["DELTA|D2", new[2], "COMMIT|1"])
+
+    def test_diff_falls_back_to_keyframe_when_a_slot_disappears(self):
+        old = [encode_device("D"), encode_slot('button', 4, "P", 0, 0, 1), encode_commit(1)]
+        _, shadow = diff_burst(old, None)
+        delta, _ = diff_burst([encode_device("D"), encode_commit(0)], shadow)
+        self.assertIsNone(delta)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import socket
+import time
+import unittest
+
+from source_modules.io_hub import IoHub
+from source_modules.mode_link import ModeListener
+
+
+class FakeManager:
+    def __init__(self):
+        self.logs = []
+        self.scheduled = []
+
+    def log_message(self, msg):
+        self.logs.append(msg)
+
+    def schedule_message(self, delay, fn):
+        # Record but don't recurse — tests call poll() directly.
+        self.scheduled.append((delay, fn))
+
+
+def _bound_socket():
+    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    s.bind(('127.0.0.1', 0))
+    return s
+
+
+class TestIoHub(unittest.TestCase):
+    def setUp(self):
+        self.manager = FakeManager()
+        self.hub = IoHub(self.manager, budget=4)
+        self.sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.addCleanup(self.sender.close)
+        self.addCleanup(self.hub.close)
+
+    def _listen(self, handler=None):
+        sock = _bound_socket()
+        received = []
+        self.hub.register(sock, handler or (lambda data, addr: received.append(data)))
+        return sock, received
+
+    def _send(self, sock, *payloads):
+        for p in payloads:
+            self.sender.sendto(p, sock.getsockname())
+        # Loopback delivery is near-instant but not synchronous.
+        time.sleep(0.05)
+
+    def test_schedules_a_single_tick(self):
+        self.assertEqual([fn for _d, fn in self.manager.scheduled], [self.hub.tick])
+
+    def test_drains_several_datagrams_in_one_poll(self):
+        # The old command-port tick read one datagram per tick.
+        sock, received = self._listen()
+        self._send(sock, b'a', b'b', b'c')
+        self.assertEqual(self.hub.poll(), 3)
+        self.assertEqual(received, [b'a', b'b', b'c'])
+
+    def test_budget_leaves_the_rest_for_the_next_tick(self):
+        sock, received = self._listen()
+        self._send(sock, *[bytes([i]) for i in range(6)])
+        self.assertEqual(self.hub.poll(), 4)
+        self.assertEqual(self.hub.stats()['budget_hits'], 1)
+        self.assertEqual(self.hub.poll(), 2)
+        self.assertEqual(len(received), 6)
+
+    def test_one_poll_serves_every_socket(self):
+        a, got_a = self._listen()
+        b, got_b = self._listen()
+        self._send(a, b'1')
+        self._send(b, b'2')
+        self.assertEqual(self.hub.poll(), 2)
+        self.assertEqual((got_a, got_b), ([b'1'], [b'2']))
+
+    def test_handler_error_is_logged_and_drain_continues(self):
+        received = []
+
+        def handler(data, addr):
+            if data == b'bad':
+                raise ValueError("boom")
+            received.append(data)
+
+        sock, _ = self._listen(handler)
+        self._send(sock, b'bad', b'good')
+        self.hub.poll()
+        self.assertEqual(received, [b'good'])
+        self.assertEqual(self.hub.stats()['errors'], 1)
+        self.assertTrue(any('handler error' in m for m in self.manager.logs))
+
+    def test_idle_poll_dispatches_nothing(self):
+        self._listen()
+        self.assertEqual(self.hub.poll(), 0)
+
+    def test_reset_closes_all_but_kept_sockets(self):
+        keep, _ = self._listen()
+        drop, _ = self._listen()
+        self.hub.reset(keep=(keep,))
+        self.assertEqual(self.hub.stats()['sockets'], 1)
+        self.assertEqual(drop.fileno(), -1)
+        self.assertNotEqual(keep.fileno(), -1)
+
+    def test_closed_hub_stops_rescheduling(self):
+        self.hub.close()
+        self.manager.scheduled.clear()
+        self.hub.tick()
+        self.assertEqual(self.manager.scheduled, [])
+
+    def test_listener_registers_on_the_shared_hub(self):
+        class Target:
+            modes = []
+
+            def goto_mode(self, name):
+                self.modes.append(name)
+
+        target = Target()
+        listener = ModeListener(self.manager, target, port=0, name="t-mode", hub=self.hub)
+        self._send(listener._socket, b"SETMODE|shift_mode\n")
+        self.hub.poll()
+        self.assertEqual(target.modes, ["shift_mode"])
+        # No per-listener tick: the hub's is the only one scheduled.
+        self.assertEqual(len(self.manager.scheduled), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+from unittest.mock import Mock
+
+from source_modules.latency_stats import LatencyStats, Histogram, STATS, _bucket, _bucket_upper
+from source_modules.update_coalescer import UpdateCoalescer
+from source_modules.hud_client import HudClient
+from source_modules.helpers import Helpers
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestHistogram(unittest.TestCase):
+    def test_buckets_are_contiguous_quarter_octaves(self):
+        for us in (0, 1, 3, 4, 5, 7, 8, 9, 15, 16, 1000, 123456):
+            idx = _bucket(us)
+            self.assertLess(us, _bucket_upper(idx))
+            if idx:
+                self.assertGreaterEqual(us, _bucket_upper(idx - 1))
+
+    def test_percentiles_within_bucket_resolution(self):
+        h = Histogram()
+        for us in range(1, 1001):
+            h.record_us(us)
+        for q, true in ((0.50, 500), (0.95, 950), (0.99, 990)):
+            p = h.percentile(q)
+            self.assertGreaterEqual(p, true)
+            self.assertLessEqual(p, true * 1.25)
+
+    def test_percentile_capped_at_max_sample(self):
+        h = Histogram()
+        h.record_us(600)
+        self.assertEqual(h.percentile(0.99), 600)
+
+    def test_huge_samples_land_in_the_last_bucket(self):
+        h = Histogram()
+        h.record_us(1e12)
+        self.assertEqual(h.count, 1)
+        self.assertEqual(h.counts[-1], 1)
+
+    def test_recording_reuses_the_bucket_list(self):
+        h = Histogram()
+        counts = h.counts
+        h.record_us(10)
+        h.reset()
+        self.assertIs(h.counts, counts)
+        self.assertEqual((h.count, sum(counts)), (0, 0))
+
+
+class TestLatencyStats(unittest.TestCase):
+    def test_record_uses_the_clock(self):
+        clock = FakeClock()
+        stats = LatencyStats(clock=clock)
+        t0 = clock()
+        clock.now = 0.000250
+        stats.record('burst', t0)
+        self.assertEqual(stats.histogram('burst').count, 1)
+        self.assertAlmostEqual(stats.histogram('burst').max_us, 250)
+
+    def test_summary_lists_sampled_stages_and_counters(self):
+        stats = LatencyStats()
+        stats.record_us('burst', 120)
+        stats.add('hud_bytes', 300)
+        lines = stats.summary_lines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].startswith('burst n=1 p50='))
+        self.assertEqual(lines[1], 'hud_bytes=300')
+
+    def test_reset_clears_everything(self):
+        stats = LatencyStats()
+        stats.record_us('resolve', 5)
+        stats.add('osc_bytes', 10)
+        stats.reset()
+        self.assertEqual(stats.summary_lines(), [])
+
+
+class TestProbes(unittest.TestCase):
+    def setUp(self):
+        STATS.reset()
+        self.addCleanup(STATS.reset)
+
+    def test_hud_client_counts_bytes_sent(self):
+        c = HudClient()
+        c._socket = Mock()
+        c.send_ping()
+        self.assertEqual(STATS.counters(), {'hud_datagrams': 1, 'hud_bytes': len(b'PING\n')})
+
+    def test_coalescer_flush_records_wait_and_flush(self):
+        c = UpdateCoalescer(Mock(), Mock(), Mock())
+        c.send_update('dial', 0, "Cut", 0.5, 0.0, 1.0)
+        c.flush()
+        self.assertEqual(STATS.histogram('update_wait').count, 1)
+        self.assertEqual(STATS.histogram('update_flush').count, 1)
+        c.flush()   # nothing pending: no samples
+        self.assertEqual(STATS.histogram('update_flush').count, 1)
+
+    def test_parameter_event_records_resolve_and_total(self):
+        helpers = Helpers(Mock(), Mock())
+        param = Mock(min=0.0, max=1.0, value=0.0)
+        helpers._resolver.resolve_encoder = Mock(return_value=Mock(param=param))
+        helpers.selected_device_changed = Mock()
+        helpers.device_parameter_action(Mock(), 1, 1, 64, 'enc_1')
+        self.assertEqual(STATS.histogram('resolve').count, 1)
+        self.assertEqual(STATS.histogram('param_event').count, 1)
+
+    def test_unresolved_parameter_event_is_still_recorded(self):
+        helpers = Helpers(Mock(), Mock())
+        helpers._resolver.resolve_encoder = Mock(return_value=None)
+        helpers.selected_device_changed = Mock()
+        helpers.device_parameter_action(Mock(), 1, 1, 64, 'enc_1')
+        self.assertEqual(STATS.histogram('param_event').count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
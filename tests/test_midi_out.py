@@ -0,0 +1,141 @@
+import unittest
+from unittest.mock import Mock
+
+from source_modules.ec4_client import Ec4Client
+from source_modules.grid_led_client import GridLedClient, LED_CMD
+from source_modules.hud_protocol import BurstSnapshot, SlotPayload
+from source_modules.latency_stats import STATS
+from source_modules.midi_out import MidiOutQueue, NullMidiOut
+
+
+def _snap(dials=()):
+    return BurstSnapshot(device_name="Dev", dials=tuple(dials), buttons=(),
+                         zone_colors=(), suppress_hud=False)
+
+
+class TestMidiOutQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = Mock()
+        self.queue = MidiOutQueue(self.manager, budget=10)
+        self.a, self.b = object(), object()
+
+    def _written(self):
+        return [c[0][0] for c in self.manager._send_midi.call_args_list]
+
+    def test_send_only_queues_until_the_tick(self):
+        self.queue.send(self.a, [1, 2, 3])
+        self.manager._send_midi.assert_not_called()
+        self.queue.tick()
+        self.assertEqual(self._written(), [(1, 2, 3)])
+        self.assertEqual(self.queue.stats()['sent'], 1)
+
+    def test_supersede_drops_only_that_owners_pending(self):
+        self.queue.send(self.a, [1])
+        self.queue.send(self.b, [2])
+        self.queue.send(self.a, [3])
+        self.queue.send(self.a, [4], supersede=True)
+        self.queue.flush()
+        self.assertEqual(self._written(), [(2,), (4,)])
+        self.assertEqual(self.queue.stats()['superseded'], 2)
+
+    def test_same_key_replaces_in_place(self):
+        self.queue.send(self.a, [1], key='k')
+        self.queue.send(self.b, [2])
+        self.queue.send(self.a, [3], key='k')
+        self.queue.flush()
+        self.assertEqual(self._written(), [(3,), (2,)])
+        self.assertEqual(self.queue.stats()['replaced'], 1)
+
+    def test_budget_defers_the_rest_to_the_next_tick(self):
+        for i in range(4):
+            self.queue.send(self.a, [i] * 4)
+        self.queue.tick()
+        self.assertEqual(len(self._written()), 2)
+        self.queue.tick()
+        self.assertEqual(len(self._written()), 4)
+        self.assertEqual(self.queue.stats()['deferred'], 1)
+
+    def test_oversized_message_still_goes_out_alone(self):
+        self.queue.send(self.a, [0] * 50)
+        self.queue.send(self.a, [1])
+        self.queue.tick()
+        self.assertEqual(len(self._written()), 1)
+
+    def test_failed_write_calls_on_error_and_continues(self):
+        failed = Mock()
+        self.manager._send_midi.side_effect = [RuntimeError("port gone"), None]
+        self.queue.send(self.a, [1], on_error=failed)
+        self.queue.send(self.b, [2])
+        self.queue.flush()
+        failed.assert_called_once()
+        self.manager.log_message.assert_called()
+        self.assertEqual(self.queue.stats()['errors'], 1)
+        self.assertEqual(self.queue.stats()['sent'], 1)
+
+    def test_records_queue_latency_and_bytes(self):
+        STATS.reset()
+        self.addCleanup(STATS.reset)
+        self.queue.send(self.a, [1, 2, 3])
+        self.queue.flush()
+        self.assertEqual(STATS.histogram('midi_wait').count, 1)
+        self.assertEqual(STATS.counters()['midi_bytes'], 3)
+
+    def test_close_writes_everything_then_refuses(self):
+        for i in range(4):
+            self.queue.send(self.a, [i] * 4)
+        self.queue.close()
+        self.assertEqual(len(self._written()), 4)
+        self.queue.send(self.a, [9])
+        self.queue.tick()
+        self.assertEqual(len(self._written()), 4)
+
+    def test_null_midi_out_writes_immediately(self):
+        NullMidiOut(self.manager).send(self.a, [1, 2])
+        self.assertEqual(self._written(), [(1, 2)])
+
+
+class TestSinksThroughMidiOutQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = Mock()
+        self.queue = MidiOutQueue(self.manager, budget=0)
+        self.ec4 = Ec4Client(self.manager, midi_out=self.queue)
+        self.grid = GridLedClient(self.manager, midi_out=self.queue)
+
+    def test_burst_does_not_touch_the_port(self):
+        self.ec4.on_burst(_snap([(0, SlotPayload("Vol", 0.5, 0.0, 1.0))]))
+        self.grid.on_burst(_snap())
+        self.manager._send_midi.assert_not_called()
+        self.queue.tick()
+        self.assertEqual(self.manager._send_midi.call_count, 2)
+
+    def test_full_write_supersedes_queued_runs(self):
+        self.ec4.on_burst(_snap([(0, SlotPayload("Vol", 0.5, 0.0, 1.0))]))
+        self.ec4.on_burst(_snap([(0, SlotPayload("Pan", 0.5, 0.0, 1.0))]))
+        self.ec4.on_hide()
+        self.queue.flush()
+        [msg] = [c[0][0] for c in self.manager._send_midi.call_args_list]
+        self.assertEqual(len(msg), 13 + 64 * 3 + 1)
+
+    def test_dense_frame_supersedes_queued_deltas(self):
+        self.grid.on_burst(_snap())
+        self.grid.on_burst(_snap())
+        self.queue.flush()
+        msgs = [c[0][0] for c in self.manager._send_midi.call_args_list]
+        self.assertEqual([m[2] for m in msgs], [LED_CMD])
+
+    def test_failed_write_on_the_tick_resets_the_sink_shadow(self):
+        self.ec4.on_burst(_snap([(0, SlotPayload("Vol", 0.5, 0.0, 1.0))]))
+        self.manager._send_midi.side_effect = RuntimeError("port gone")
+        self.queue.flush()
+        self.manager._send_midi.side_effect = None
+        self.manager._send_midi.reset_mock()
+        self.ec4.on_burst(_snap([(0, SlotPayload("Vol", 0.5, 0.0, 1.0))]))
+        self.queue.flush()
+        [msg] = [c[0][0] for c in self.manager._send_midi.call_args_list]
+        self.assertEqual(len(msg), 13 + 64 * 3 + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
+import socket
 import unittest
 
-from source_modules.mode_link import ModeListener
+from source_modules.mode_link import ModeListener, ModeSender
 
 
 class FakeManager:
@@ -45,5 +46,25 @@ class TestModeListener(unittest.TestCase):
         self.assertEqual(self.surface.modes, ["main_mode", "shift_mode"])
 
 
+class TestModeSender(unittest.TestCase):
+    def _receiver(self):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.bind(('127.0.0.1', 0))
+        sock.settimeout(1.0)
+        self.addCleanup(sock.close)
+        return sock
+
+    def test_sends_to_every_port(self):
+        a, b = self._receiver(), self._receiver()
+        ModeSender('127.0.0.1', [a.getsockname()[1], b.getsockname()[1]]).send_mode("shift_mode")
+        self.assertEqual(a.recv(1024), b"SETMODE|shift_mode\n")
+        self.assertEqual(b.recv(1024), b"SETMODE|shift_mode\n")
+
+    def test_single_port(self):
+        a = self._receiver()
+        ModeSender('127.0.0.1', a.getsockname()[1]).send_mode("main_mode")
+        self.assertEqual(a.recv(1024), b"SETMODE|main_mode\n")
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,228 @@
+import unittest
+from unittest.mock import Mock
+
+from source_modules.helpers import Helpers
+from source_modules.name_index import NameIndex
+
+
+class _Observable:
+    """Live-style `add_<prop>_listener` / `remove_...` / `..._has_listener`."""
+
+    def __init__(self):
+        self._listeners = {}
+
+    def __getattr__(self, attr):
+        for prefix, op in (('add_', 'add'), ('remove_', 'remove')):
+            if attr.startswith(prefix) and attr.endswith('_listener'):
+                prop = attr[len(prefix):-len('_listener')]
+                return lambda fn: self._change(prop, op, fn)
+        if attr.endswith('_has_listener'):
+            prop = attr[:-len('_has_listener')]
+            return lambda fn: fn in self._listeners.get(prop, [])
+        raise AttributeError(attr)
+
+    def _change(self, prop, op, fn):
+        listeners = self.__dict__['_listeners'].setdefault(prop, [])
+        listeners.append(fn) if op == 'add' else listeners.remove(fn)
+
+    def fire(self, prop):
+        for fn in list(self._listeners.get(prop, [])):
+            fn()
+
+    def listener_count(self):
+        return sum(len(v) for v in self._listeners.values())
+
+
+class _Named(_Observable):
+    def __init__(self, name):
+        super().__init__()
+        self._name = name
+        self.reads = 0
+
+    @property
+    def name(self):
+        self.reads += 1
+        return self._name
+
+    def rename(self, name):
+        self._name = name
+        self.fire('name')
+
+
+class FakeDevice(_Named):
+    pass
+
+
+class FakeTrack(_Named):
+    def __init__(self, name, devices=()):
+        super().__init__(name)
+        self._devices = list(devices)
+
+    @property
+    def devices(self):
+        return list(self._devices)
+
+    def set_devices(self, devices):
+        self._devices = list(devices)
+        self.fire('devices')
+
+
+class FakeSong(_Observable):
+    def __init__(self, tracks):
+        super().__init__()
+        self._tracks = list(tracks)
+        self.scans = 0
+
+    @property
+    def tracks(self):
+        self.scans += 1
+        return list(self._tracks)
+
+    def set_tracks(self, tracks):
+        self._tracks = list(tracks)
+        self.fire('tracks')
+
+
+class TestNameIndexTracks(unittest.TestCase):
+
+    def setUp(self):
+        self.tracks = [FakeTrack(f"Track {i}") for i in range(120)]
+        self.song = FakeSong(self.tracks)
+        self.names = NameIndex()
+
+    def test_repeated_lookups_scan_once(self):
+        for _ in range(50):
+            self.assertIs(self.names.track(self.song, "Track 99"), self.tracks[99])
+        self.assertEqual(self.song.scans, 1)
+
+    def test_missing_name_is_none_without_rescanning(self):
+        self.assertIsNone(self.names.track(self.song, "Nope"))
+        self.assertIsNone(self.names.track(self.song, "Nope"))
+        self.assertEqual(self.song.scans, 1)
+
+    def test_first_match_wins(self):
+        dup = FakeTrack("Track 3")
+        self.song.set_tracks(self.tracks + [dup])
+        self.assertIs(self.names.track(self.song, "Track 3"), self.tracks[3])
+
+    def test_rename_is_seen_on_the_next_lookup(self):
+        self.names.track(self.song, "Track 0")
+        self.tracks[5].rename("Bass")
+        self.assertIs(self.names.track(self.song, "Bass"), self.tracks[5])
+        self.assertIsNone(self.names.track(self.song, "Track 5"))
+        self.assertEqual(self.names.invalidations, 1)
+
+    def test_invalidation_is_lazy(self):
+        self.names.track(self.song, "Track 0")
+        for i in range(10):
+            self.tracks[i].rename(f"Renamed {i}")
+        self.assertEqual(self.song.scans, 1)
+        self.names.track(self.song, "Renamed 9")
+        self.assertEqual(self.song.scans, 2)
+
+    def test_added_and_deleted_tracks(self):
+        self.names.track(self.song, "Track 0")
+        new = FakeTrack("Drums")
+        self.song.set_tracks(self.tracks[1:] + [new])
+        self.assertIs(self.names.track(self.song, "Drums"), new)
+        self.assertIsNone(self.names.track(self.song, "Track 0"))
+        # The deleted track's listener went with the rebuild.
+        self.assertEqual(self.tracks[0].listener_count(), 0)
+
+    def test_missed_rename_never_returns_the_wrong_track(self):
+        self.names.track(self.song, "Track 1")
+        self.tracks[1]._name = "Silent"  # no notification
+        self.assertIsNone(self.names.track(self.song, "Track 1"))
+        self.assertIs(self.names.track(self.song, "Silent"), self.tracks[1])
+
+    def test_unwatchable_song_is_scanned_every_time(self):
+        class PlainSong:
+            def __init__(self, tracks):
+                self.tracks = tracks
+
+        song = PlainSong(self.tracks)
+        self.assertIs(self.names.track(song, "Track 7"), self.tracks[7])
+        self.tracks[7]._name = "Moved"
+        self.assertIs(self.names.track(song, "Moved"), self.tracks[7])
+
+    def test_release_detaches_every_listener(self):
+        self.names.track(self.song, "Track 0")
+        self.names.device(self.tracks[0], "Echo")
+        self.names.release()
+        self.assertEqual(self.song.listener_count(), 0)
+        self.assertTrue(all(t.listener_count() == 0 for t in self.tracks))
+
+
+class TestNameIndexDevices(unittest.TestCase):
+
+    def setUp(self):
+        self.devices = [FakeDevice("EQ Eight"), FakeDevice("Echo"), FakeDevice("Echo")]
+        self.track = FakeTrack("Bass", self.devices)
+        self.other = FakeTrack("Keys", [FakeDevice("Echo")])
+        self.song = FakeSong([self.track, self.other])
+        self.names = NameIndex()
+
+    def test_lookup_is_per_track_and_first_match(self):
+        self.assertIs(self.names.device(self.track, "Echo"), self.devices[1])
+        self.assertIs(self.names.device(self.other, "Echo"), self.other._devices[0])
+        self.assertEqual(self.names.builds, 2)
+        self.names.device(self.track, "EQ Eight")
+        self.assertEqual(self.names.builds, 2)
+
+    def test_device_rename_and_chain_edit(self):
+        self.names.device(self.track, "Echo")
+        self.devices[1].rename("Delay")
+        self.assertIs(self.names.device(self.track, "Delay"), self.devices[1])
+        self.assertIs(self.names.device(self.track, "Echo"), self.devices[2])
+        reverb = FakeDevice("Reverb")
+        self.track.set_devices([reverb])
+        self.assertIs(self.names.device(self.track, "Reverb"), reverb)
+        self.assertEqual(self.devices[0].listener_count(), 0)
+
+    def test_other_tracks_stay_cached(self):
+        self.names.device(self.track, "Echo")
+        self.names.device(self.other, "Echo")
+        self.track.set_devices([])
+        builds = self.names.builds
+        self.names.device(self.other, "Echo")
+        self.assertEqual(self.names.builds, builds)
+
+    def test_track_list_change_drops_device_indexes(self):
+        self.names.track(self.song, "Bass")
+        self.names.device(self.track, "Echo")
+        self.song.set_tracks([self.other])
+        self.names.device(self.other, "Echo")
+        self.assertEqual(self.track._listeners['devices'], [])
+        self.assertTrue(all(d.listener_count() == 0 for d in self.devices))
+
+
+class TestHelpersNamedTargets(unittest.TestCase):
+
+    def setUp(self):
+        self.echo = FakeDevice("Echo")
+        self.bass = FakeTrack("Bass", [FakeDevice("EQ Eight"), self.echo])
+        self.song = FakeSong([FakeTrack(f"T{i}") for i in range(10)] + [self.bass])
+        manager = Mock()
+        manager.song.return_value = self.song
+        self.helpers = Helpers(manager, Mock())
+
+    def test_find_device_by_names_uses_the_indexes(self):
+        for _ in range(20):
+            self.assertIs(self.helpers.find_device(self.song, "Bass", "Echo"), self.echo)
+        self.assertEqual(self.song.scans, 1)
+        # One verification read per hit, not one per track scanned.
+        self.assertEqual(self.bass.reads, 1 + 20)
+
+    def test_numeric_and_special_names_are_unchanged(self):
+        self.assertIs(self.helpers.find_device(self.song, "11", "2"), self.echo)
+        self.assertIsNone(self.helpers.find_device(self.song, "Nope", "Echo"))
+
+    def test_disconnect_releases_listeners(self):
+        self.helpers.find_device(self.song, "Bass", "Echo")
+        self.helpers.disconnect()
+        self.assertEqual(self.song.listener_count(), 0)
+        self.assertEqual(self.bass.listener_count(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
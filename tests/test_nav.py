@@ -0,0 +1,166 @@
+import unittest
+from unittest.mock import Mock
+
+from source_modules.nav import Nav, TrackPositions
+
+
+class FakeTrack:
+    def __init__(self, name, group_track=None):
+        self.name = name
+        self.group_track = group_track
+
+    def __repr__(self):
+        return self.name
+
+
+class FakeSongView:
+    def __init__(self, selected_track):
+        self.selected_track = selected_track
+
+
+class FakeSong:
+    """`tracks` is every track; `visible_tracks` leaves out children of folded
+    groups, as Live does."""
+
+    def __init__(self, tracks, returns=(), folded=()):
+        self.tracks = list(tracks)
+        self.return_tracks = list(returns)
+        self.master_track = FakeTrack("Master")
+        self.folded = set(folded)
+        self.view = FakeSongView(self.tracks[0] if self.tracks else None)
+        self.listeners = {}
+        self.visible_reads = 0
+
+    @property
+    def visible_tracks(self):
+        self.visible_reads += 1
+        return [t for t in self.tracks if not self._hidden(t)]
+
+    def _hidden(self, track):
+        group = track.group_track
+        while group is not None:
+            if group in self.folded:
+                return True
+            group = group.group_track
+        return False
+
+    def _add(self, prop, fn):
+        self.listeners.setdefault(prop, []).append(fn)
+
+    def add_tracks_listener(self, fn): self._add('tracks', fn)
+    def add_visible_tracks_listener(self, fn): self._add('visible_tracks', fn)
+    def add_return_tracks_listener(self, fn): self._add('return_tracks', fn)
+    def tracks_has_listener(self, fn): return fn in self.listeners.get('tracks', [])
+    def visible_tracks_has_listener(self, fn): return fn in self.listeners.get('visible_tracks', [])
+    def return_tracks_has_listener(self, fn): return fn in self.listeners.get('return_tracks', [])
+    def remove_tracks_listener(self, fn): self.listeners['tracks'].remove(fn)
+    def remove_visible_tracks_listener(self, fn): self.listeners['visible_tracks'].remove(fn)
+    def remove_return_tracks_listener(self, fn): self.listeners['return_tracks'].remove(fn)
+
+    def fire(self, prop):
+        for fn in list(self.listeners.get(prop, [])):
+            fn()
+
+    def set_tracks(self, tracks):
+        self.tracks = list(tracks)
+        self.fire('tracks')
+        self.fire('visible_tracks')
+
+    def fold(self, group, folded=True):
+        (self.folded.add if folded else self.folded.discard)(group)
+        self.fire('visible_tracks')
+
+
+def _set(n=6):
+    # T0 T1 [Grp: C0 C1] T2 ... plus two returns.
+    tracks = [FakeTrack(f"T{i}") for i in range(n)]
+    group = FakeTrack("Grp")
+    children = [FakeTrack("C0", group), FakeTrack("C1", group)]
+    song = FakeSong(tracks[:2] + [group] + children + tracks[2:],
+                    returns=[FakeTrack("A"), FakeTrack("B")])
+    return song, tracks, group, children
+
+
+class TestTrackPositions(unittest.TestCase):
+
+    def setUp(self):
+        self.song, self.tracks, self.group, self.children = _set()
+        self.positions = TrackPositions(self.song)
+
+    def _names(self, start, n, wrap=False):
+        return self.positions.step(start, n, wrap).name
+
+    def test_order_is_visible_then_returns_then_master(self):
+        self.assertEqual([t.name for t in self.positions.order()],
+                         ['T0', 'T1', 'Grp', 'C0', 'C1', 'T2', 'T3', 'T4', 'T5', 'A', 'B', 'Master'])
+
+    def test_presses_do_not_rescan(self):
+        track = self.tracks[0]
+        for _ in range(100):
+            track = self.positions.step(track, 1, wrap=True)
+        self.assertEqual(self.song.visible_reads, 1)
+
+    def test_jumps_clamp_or_wrap(self):
+        self.assertEqual(self._names(self.tracks[4], 3), 'B')
+        self.assertEqual(self._names(self.tracks[0], -3), 'T0')
+        self.assertEqual(self._names(self.song.master_track, 1), 'Master')
+        self.assertEqual(self._names(self.song.master_track, 1, wrap=True), 'T0')
+        self.assertEqual(self._names(self.tracks[0], -1, wrap=True), 'Master')
+        self.assertEqual(self._names(self.tracks[1], 25, wrap=True), 'Grp')
+
+    def test_folded_group_children_are_skipped(self):
+        self.positions.order()
+        self.song.fold(self.group)
+        self.assertEqual(self._names(self.group, 1), 'T2')
+        self.assertEqual(self._names(self.tracks[2], -1), 'Grp')
+        self.song.fold(self.group, False)
+        self.assertEqual(self._names(self.group, 1), 'C0')
+        self.assertEqual(self.positions.builds, 3)
+
+    def test_selected_child_of_a_folded_group_moves_from_its_group(self):
+        self.song.fold(self.group)
+        self.assertEqual(self._names(self.children[1], 1), 'T2')
+        self.assertEqual(self._names(self.children[1], -1), 'T1')
+
+    def test_added_and_deleted_tracks(self):
+        self.positions.order()
+        new = FakeTrack("New")
+        self.song.set_tracks([new] + self.song.tracks[1:])
+        self.assertEqual(self._names(new, 1), 'T1')
+        self.assertIsNone(self.positions.step(self.tracks[0], 1))
+
+    def test_unknown_track_does_not_move(self):
+        self.assertIsNone(self.positions.step(None, 1))
+        self.assertIsNone(self.positions.step(FakeTrack("Gone"), 1))
+
+    def test_release_detaches_listeners(self):
+        self.positions.order()
+        self.positions.release()
+        self.assertTrue(all(not fns for fns in self.song.listeners.values()))
+
+
+class TestNavTrackNav(unittest.TestCase):
+
+    def setUp(self):
+        self.song, self.tracks, self.group, _ = _set(3)
+        manager = Mock()
+        manager.song.return_value = self.song
+        self.nav = Nav(manager)
+
+    def test_inc_and_dec_stop_at_the_ends(self):
+        self.nav.track_nav_dec()
+        self.assertIs(self.song.view.selected_track, self.tracks[0])
+        for _ in range(20):
+            self.nav.track_nav_inc()
+        self.assertIs(self.song.view.selected_track, self.song.master_track)
+        self.nav.track_nav_dec()
+        self.assertEqual(self.song.view.selected_track.name, 'B')
+
+    def test_jump_by_n(self):
+        self.song.fold(self.group)
+        self.nav.track_nav_by(3)
+        self.assertIs(self.song.view.selected_track, self.tracks[2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+import socket
+import unittest
+from unittest.mock import Mock
+
+from source_modules.helpers import Remote
+from source_modules.osc_client import OSCClient, OSCMultiClient, MessageTemplates
+from source_modules.pythonosc.osc_bundle import OscBundle
+from source_modules.pythonosc.osc_message import OscMessage
+from source_modules.pythonosc.osc_message_builder import OscMessageBuilder
+
+
+def _real_param(name, value):
+    rp = Mock()
+    rp.param.name = name
+    rp.param.value = value
+    rp.param.min = 0.0
+    rp.param.max = 1.0
+    rp.alias = None
+    rp.button = None
+    return rp
+
+
+class _Receiver:
+    """A bound UDP socket standing in for an OSC target."""
+
+    def __init__(self):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(('127.0.0.1', 0))
+        self.sock.settimeout(0.2)
+        self.port = self.sock.getsockname()[1]
+
+    def datagrams(self):
+        out = []
+        while True:
+            try:
+                out.append(self.sock.recv(65536))
+            except socket.timeout:
+                return out
+
+    def close(self):
+        self.sock.close()
+
+
+class TestOSCBundle(unittest.TestCase):
+
+    def setUp(self):
+        self.rx = _Receiver()
+        self.addCleanup(self.rx.close)
+
+    def _burst(self, client, n=3):
+        client.begin_burst()
+        for i in range(n):
+            client.send_message(f"/p/{i}", [float(i)])
+        client.flush_burst()
+
+    def test_bundling_client_sends_one_bundle(self):
+        self._burst(OSCClient(port=self.rx.port, bundle=True))
+        dgrams = self.rx.datagrams()
+        self.assertEqual(len(dgrams), 1)
+        self.assertTrue(OscBundle.dgram_is_bundle(dgrams[0]))
+        bundle = OscBundle(dgrams[0])
+        self.assertEqual([m.address for m in bundle], ['/p/0', '/p/1', '/p/2'])
+
+    def test_default_client_sends_each_message(self):
+        self._burst(OSCClient(port=self.rx.port))
+        dgrams = self.rx.datagrams()
+        self.assertEqual([OscMessage(d).address for d in dgrams], ['/p/0', '/p/1', '/p/2'])
+
+    def test_outside_a_burst_messages_go_straight_out(self):
+        client = OSCClient(port=self.rx.port, bundle=True)
+        client.send_message("/live", [1.0])
+        self.assertEqual(len(self.rx.datagrams()), 1)
+        self.assertIsNone(client.client.buffer)
+
+    def test_oversized_bundle_falls_back_to_messages(self):
+        client = OSCClient(port=self.rx.port, bundle=True)
+        client._max_datagram = 64
+        self._burst(client)
+        dgrams = self.rx.datagrams()
+        self.assertEqual(len(dgrams), 3)
+        self.assertFalse(any(OscBundle.dgram_is_bundle(d) for d in dgrams))
+
+    def test_empty_burst_sends_nothing(self):
+        client = OSCClient(port=self.rx.port, bundle=True)
+        client.begin_burst()
+        client.flush_burst()
+        self.assertEqual(self.rx.datagrams(), [])
+
+    def test_multi_client_bundles_per_target(self):
+        other = _Receiver()
+        self.addCleanup(other.close)
+        multi = OSCMultiClient([OSCClient(port=self.rx.port, bundle=True),
+                                OSCClient(port=other.port)])
+        self._burst(multi)
+        self.assertEqual(len(self.rx.datagrams()), 1)
+        self.assertEqual(len(other.datagrams()), 3)
+
+
+class TestRemoteDeviceUpdateBundle(unittest.TestCase):
+
+    def test_device_update_is_one_bundle_ending_in_complete(self):
+        rx = _Receiver()
+        self.addCleanup(rx.close)
+        remote = Remote(manager=Mock(), osc_client=OSCClient(port=rx.port, bundle=True),
+                        hud_client=Mock())
+        remote.device_update("Dev", [_real_param("On", 1.0), _real_param("Cut", 0.5)])
+        dgrams = rx.datagrams()
+        self.assertEqual(len(dgrams), 1)
+        addresses = [m.address for m in OscBundle(dgrams[0])]
+        self.assertEqual(addresses[0], "/selected-device/name")
+        self.assertEqual(addresses[-1], "/selected-device/parameter-update-complete")
+        self.assertIsNone(remote._osc_client.client.buffer)
+
+
+def _builder_dgram(address, values):
+    builder = OscMessageBuilder(address=address)
+    for v in values:
+        builder.add_arg(v)
+    return builder.build().dgram
+
+
+class TestMessageTemplates(unittest.TestCase):
+    """Templated encoding must be byte-for-byte what OscMessageBuilder builds."""
+
+    CASES = [
+        ("/selected-device/parameter-update", [3, 0.25, "Cutoff", 0.0, 1.0, None]),
+        ("/selected-device/parameter-update", [3, 0.25, "Cutoff", 0.0, 1.0, "toggle"]),
+        ("/selected-device/name", ["Operator [page 1]"]),
+        ("/selected-device/parameter-update-complete", [16]),
+        ("/x", ["abc", "abcd", "", "caf\u00e9"]),
+        ("/x", [True, False, 2 ** 40, -7, b"\x01\x02\x03"]),
+        ("/x", []),
+    ]
+
+    def test_matches_builder(self):
+        templates = MessageTemplates()
+        for address, values in self.CASES:
+            for _ in range(2):  # compile, then cached
+                self.assertEqual(templates.encode(address, values),
+                                 _builder_dgram(address, values), (address, values))
+
+    def test_scalar_value_is_one_argument(self):
+        self.assertEqual(MessageTemplates().encode("/n", 5), _builder_dgram("/n", [5]))
+
+    def test_compiles_once_per_address_and_signature(self):
+        templates = MessageTemplates()
+        for i in range(10):
+            templates.encode("/p", [i, float(i), "n", 0.0, 1.0, None])
+        templates.encode("/p", [1, 0.5, "n", 0.0, 1.0, "toggle"])
+        self.assertEqual(templates.compiled, 2)
+
+    def test_untemplatable_values_fall_back(self):
+        templates = MessageTemplates()
+        self.assertIsNone(templates.encode("/a", [[1, 2]]))
+        self.assertIsNone(templates.encode("/a", [(1, 2, 3, 4)]))
+
+    def test_client_sends_fallback_through_builder(self):
+        rx = _Receiver()
+        self.addCleanup(rx.close)
+        OSCClient(port=rx.port).send_message("/a", [[1, 2]])
+        self.assertEqual(rx.datagrams(), [_builder_dgram("/a", [[1, 2]])])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -47,6 +47,10 @@ outputs:
         self.assertEqual(sink.targets[1].host, '192.168.1.10')
         self.assertEqual(sink.targets[1].port, 9000)
 
+    def test_send_thread_defaults_off_and_parses(self):
+        self.assertFalse(read_root(_BASE).send_thread)
+        self.assertTrue(read_root(_BASE + "send-thread: true\n").send_thread)
+
     def test_remote_on_true_synthesises_legacy_osc_sink(self):
         doc = _BASE + "remote_on: true\n"
         root = read_root(doc)
@@ -121,6 +125,22 @@ class TestOscClientsCodegen(unittest.TestCase):
         self.assertIn("OSCClient(host='127.0.0.1', port=5005)", result['osc_clients'])
         self.assertIn("OSCClient(host='192.168.68.84', port=5005)", result['osc_clients'])
 
+    def test_bundle_flag_parsed_and_rendered(self):
+        doc = _BASE + """\
+outputs:
+    -
+        type: osc
+        bundle: true
+        targets:
+            -
+                host: 127.0.0.1
+"""
+        sink = read_root(doc).outputs[0]
+        self.assertTrue(sink.bundle)
+        result = generate_code_as_template_vars(self._make_mock_modes(), outputs=[sink])
+        self.assertEqual(result['osc_clients'],
+                         "OSCClient(host='127.0.0.1', port=5005, bundle=True)")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -173,6 +173,148 @@ class TestResolverDirect(unittest.TestCase):
         self.assertTrue(any("[bob]" in m and "Missing" in m for m in logs))
 
 
+class TestResolutionPlan(unittest.TestCase):
+    """resolve_encoder / resolve_switch compile each slot once per (device,
+    page) into a ResolutionPlan; later events are an index + liveness check."""
+    RAW = {"devices": [{"className": "Amp",
+                        "encoders": [{"name": "Bass", "display": "Low"}],
+                        "buttons": [{"name": "Mode"}, {"type": "bool", "lom_property": "is_active"}]}]}
+
+    def _amp(self):
+        return FakeDevice("Amp", [FakeParam("On/Off"), FakeParam("Bass"), FakeParam("Mode", is_quantized=True)])
+
+    def _no_compile(self, r):
+        def fail(*_a):
+            raise AssertionError("slot recompiled")
+        r._compile_encoder = fail
+        r._compile_switch = fail
+
+    def test_second_resolve_uses_compiled_slot(self):
+        r, _ = _resolver(self.RAW)
+        dev = self._amp()
+        r.resolve_encoder(dev, 1)
+        r.resolve_switch(dev, 0)
+        self._no_compile(r)
+        rp = r.resolve_encoder(dev, 1)
+        self.assertIs(rp.param, dev.parameters[1])
+        self.assertEqual(rp.alias, "Low")
+        info = r.resolve_switch(dev, 0)
+        self.assertIs(info['param'], dev.parameters[2])
+        self.assertEqual(info['d_idx'], 2)
+
+    def test_page_change_starts_a_new_plan(self):
+        r, _ = _resolver(self.RAW)
+        dev = self._amp()
+        r.resolve_encoder(dev, 1)
+        r.encoder_page = 2
+        self.assertIsNone(r.resolve_encoder(dev, 1))
+        self.assertEqual(r._plan.encoder_page, 2)
+
+    def test_focus_drops_the_plan(self):
+        r, _ = _resolver(self.RAW)
+        r.resolve_encoder(self._amp(), 1)
+        r.focus()
+        self.assertIsNone(r._plan)
+
+    def test_stale_index_recompiles_the_slot(self):
+        r, _ = _resolver(self.RAW)
+        dev = self._amp()
+        r.resolve_encoder(dev, 1)
+        moved = FakeParam("Bass")
+        dev.parameters = [FakeParam("On/Off"), FakeParam("Inserted"), moved]
+        self.assertIs(r.resolve_encoder(dev, 1).param, moved)
+        self.assertEqual(r._plan.encoders[1].d_idx, 2)
+
+    def test_name_miss_is_not_cached(self):
+        raw = {"devices": [{"className": "Amp", "encoders": [{"name": "Late"}], "buttons": []}]}
+        r, _ = _resolver(raw)
+        dev = FakeDevice("Amp", [FakeParam("On/Off")])
+        self.assertIsNone(r.resolve_encoder(dev, 1))
+        dev.parameters = [FakeParam("On/Off"), FakeParam("Late")]
+        self.assertIs(r.resolve_encoder(dev, 1).param, dev.parameters[1])
+
+    def test_display_name_bank_slot_compiles_once(self):
+        # Standard-bank names come from Live's display-name table; a slot whose
+        # original_name differs misses the strict index on every compile.
+        r, _ = _resolver(device_banks={'Reverb': (('Lo Cut', 'Size'),)},
+                         bank_names={'Reverb': ('Main',)})
+        dev = FakeDevice('Reverb', [FakeParam('Device On'),
+                                    FakeParam('Lo Cut', original_name='LowCut On'),
+                                    FakeParam('Size')])
+        compiles = []
+        compile_encoder = r._compile_encoder
+        r._compile_encoder = lambda *a: compiles.append(a[1]) or compile_encoder(*a)
+        for _ in range(3):
+            self.assertIs(r.resolve_encoder(dev, 1).param, dev.parameters[1])
+            self.assertIs(r.resolve_encoder(dev, 2).param, dev.parameters[2])
+        self.assertEqual(compiles, [1, 2])
+
+    def test_group_member_follows_selector_every_time(self):
+        raw = {"devices": [{"className": "Amp", "encoders": [{
+            "controlledBy": "Sel", "group": [
+                {"name": "A", "activeWhen": [0]}, {"name": "B", "activeWhen": [1]}]}],
+            "buttons": []}]}
+        r, _ = _resolver(raw)
+        sel = FakeParam("Sel", value=0)
+        dev = FakeDevice("Amp", [FakeParam("On/Off"), sel, FakeParam("A"), FakeParam("B")])
+        self.assertEqual(r.resolve_encoder(dev, 1).param.name, "A")
+        sel.value = 1
+        self.assertEqual(r.resolve_encoder(dev, 1).param.name, "B")
+
+    def test_lom_switch_info_is_a_fresh_dict(self):
+        r, _ = _resolver(self.RAW, button_slot_count=2)
+        dev = self._amp()
+        first = r.resolve_switch(dev, 1)
+        first['alias'] = 'mutated'
+        self.assertEqual(r.resolve_switch(dev, 1)['alias'], 'is_active')
+
+
+class _CountingParam(FakeParam):
+    """Counts `is_quantized` reads — each one is a Live API call per parameter."""
+    reads = 0
+
+    @property
+    def is_quantized(self):
+        _CountingParam.reads += 1
+        return self._q
+
+    @is_quantized.setter
+    def is_quantized(self, q):
+        self._q = q
+
+
+class TestFallbackIndex(unittest.TestCase):
+    def setUp(self):
+        _CountingParam.reads = 0
+        self.dev = FakeDevice("Plugin", [_CountingParam(f"p{i}", is_quantized=(i % 5 == 0))
+                                         for i in range(200)])
+
+    def test_partitioned_once_per_focus(self):
+        r, _ = _resolver(banks_per_page=2)
+        for page in (1, 2, 1):
+            r.encoder_page = page
+            for c_idx in range(1, 17):
+                r.resolve_encoder(self.dev, c_idx)
+            r.encoder_pages_count(self.dev)
+            r.button_pages_count(self.dev)
+            r.resolve_switch(self.dev, 0)
+        self.assertEqual(_CountingParam.reads, 199)
+
+    def test_indices_skip_onoff_and_split_by_quantization(self):
+        r, _ = _resolver()
+        self.assertEqual(r._fallback_continuous(self.dev)[:4], [1, 2, 3, 4])
+        self.assertEqual(r._fallback_quantized(self.dev)[:3], [5, 10, 15])
+
+    def test_focus_and_length_change_rebuild(self):
+        r, _ = _resolver()
+        r._fallback_continuous(self.dev)
+        r.focus()
+        r._fallback_continuous(self.dev)
+        self.assertEqual(_CountingParam.reads, 2 * 199)
+        self.dev.parameters = self.dev.parameters + [FakeParam("added")]
+        self.assertEqual(r._fallback_continuous(self.dev)[-1], 200)
+
+
 class TestDeviceLivenessPrimitives(unittest.TestCase):
     """The shared dead-handle guards used by the burst path and the
     focus/selection guards. Boost.Python.ArgumentError is a TypeError subclass,
@@ -1,8 +1,9 @@
 import unittest
 
-from source_modules.region_state import RegionState
+from source_modules.region_state import RegionState, RegionSet
 from source_modules.hud_protocol import (
-    DeviceMsg, SlotMsg, CommitMsg, UpdateMsg, HideMsg, LayoutMsg, PingMsg, SlotPayload,
+    DeviceMsg, DeltaMsg, SlotMsg, CommitMsg, UpdateMsg, HideMsg, LayoutMsg, PingMsg, SlotPayload, encode_binary,
+    encode_parts, parse_datagram, LazyBinarySlot,
 )
 
 
@@ -41,6 +42,36 @@ class TestRegionStateCaching(unittest.TestCase):
         # COMMIT triggers a combined re-burst on the primary
         self.assertEqual(len(self.commits), 1)
 
+    def test_binary_datagram_is_decoded(self):
+        self.state.handle_datagram(encode_binary([
+            "DEVICE|Dev", "SLOT|button|0|Hi|1.0|0.0|1.0", "COMMIT|1"]))
+        self.assertEqual(self.state.button_payloads(), [(4, SlotPayload("Hi", 1.0, 0.0, 1.0))])
+
+    def test_multipart_burst_is_reassembled(self):
+        frame = encode_binary(["DEVICE|Dev"] + [
+            f"SLOT|button|{i}|Button {i}|1.0|0.0|1.0" for i in range(8)] + ["COMMIT|8"])
+        parts = encode_parts(frame, 0, 64)
+        self.assertGreater(len(parts), 1)
+        for p in parts[:-1]:
+            self.state.handle_datagram(p)
+        self.assertEqual(self.commits, [])
+        self.state.handle_datagram(parts[-1])
+        self.assertEqual(len(self.commits), 1)
+        self.assertEqual(len(self.state.button_payloads()), 8)
+
+    def test_delta_burst_keeps_unchanged_region_slots(self):
+        self.state.handle(DeviceMsg("Dev"))
+        self.state.handle(SlotMsg('button', 0, SlotPayload("Hi", 0.0, 0.0, 1.0)))
+        self.state.handle(SlotMsg('button', 1, SlotPayload("Lo", 0.0, 0.0, 1.0)))
+        self.state.handle(CommitMsg(2))
+        self.state.handle(DeltaMsg("Dev"))
+        self.state.handle(SlotMsg('button', 1, SlotPayload("Lo", 1.0, 0.0, 1.0)))
+        self.state.handle(CommitMsg(1))
+        self.assertEqual(
+            self.state.button_payloads(),
+            [(4, SlotPayload("Hi", 0.0, 0.0, 1.0)), (5, SlotPayload("Lo", 1.0, 0.0, 1.0))],
+        )
+
     def test_dial_offset_applied(self):
         self.state.handle(DeviceMsg("Dev"))
         self.state.handle(SlotMsg('dial', 2, SlotPayload("Cut", 0.5, 0.0, 1.0)))
@@ -100,5 +131,104 @@ class TestRegionStateCaching(unittest.TestCase):
         self.assertEqual(len(self.commits), 0)
 
 
+class TestRegionSet(unittest.TestCase):
+    """One RegionState per secondary behind a merged view; a COMMIT from one
+    secondary re-encodes only that region."""
+
+    def setUp(self):
+        hud = CapturingHud()
+        self.a = RegionState(hud, dial_offset=16, button_offset=8, button_count=2)
+        self.b = RegionState(hud, dial_offset=16, button_offset=10, button_count=2)
+        self.regions = RegionSet([self.a, self.b])
+
+    @staticmethod
+    def _burst(state, name):
+        state.handle_data(f"DEVICE|D\nSLOT|button|0|{name}|1.0|0.0|1.0\nCOMMIT|1\n")
+
+    def test_merged_view_in_section_order(self):
+        self._burst(self.b, "B")
+        self._burst(self.a, "A")
+        self.assertEqual(self.regions.slot_lines(),
+                         ["SLOT|button|8|A|1.0|0.0|1.0", "SLOT|button|10|B|1.0|0.0|1.0"])
+        self.assertEqual([i for i, _p in self.regions.button_payloads()], [8, 10])
+
+    def test_commit_reencodes_only_the_changed_region(self):
+        self._burst(self.a, "A")
+        self._burst(self.b, "B")
+        self.regions.slot_lines()
+        a_lines = self.a.slot_lines()
+        self._burst(self.b, "B2")
+        lines = self.regions.slot_lines()
+        self.assertIs(self.a.slot_lines(), a_lines)
+        self.assertEqual(lines[-1], "SLOT|button|10|B2|1.0|0.0|1.0")
+
+    def test_unchanged_regions_reuse_merged_lines(self):
+        self._burst(self.a, "A")
+        self.assertIs(self.regions.slot_lines(), self.regions.slot_lines())
+
+    def test_live_update_invalidates_lines(self):
+        self._burst(self.a, "A")
+        self.regions.slot_lines()
+        self.a.handle_data("UPDATE|button|0|A|0.0|0.0|1.0\n")
+        self.assertEqual(self.regions.slot_lines()[0], "SLOT|button|8|A|0.0|0.0|1.0")
+
+
 if __name__ == '__main__':
     unittest.main()
+
+
+class TestRegionStateBytesScan(unittest.TestCase):
+    """handle_datagram scans bytes into the slot lists; the result must match
+    feeding the same datagram through parse_datagram message by message."""
+
+    LINES = ["DEVICE|Dev",
+             "SLOT|dial|0|Cut|0.25|0.0|1.0",
+             "SLOT|dial|3|Res|0.5|0.0|127.0",
+             "SLOT|button|1|On|1.0|0.0|1.0|power",
+             "SLOT|button|2|Bad|x|0.0|1.0",
+             "COMMIT|3",
+             "UPDATE|dial|0|Cut|0.75|0.0|1.0"]
+
+    def _state(self, hud):
+        return RegionState(hud, dial_offset=16, button_offset=4, dial_count=4, button_count=4)
+
+    def _check(self, data):
+        fast_hud, ref_hud = CapturingHud(), CapturingHud()
+        fast, ref = self._state(fast_hud), self._state(ref_hud)
+        fast.handle_datagram(data)
+        for msg in parse_datagram(data):
+            ref.handle(msg)
+        self.assertEqual(fast.dial_payloads(), ref.dial_payloads())
+        self.assertEqual(fast.button_payloads(), ref.button_payloads())
+        self.assertEqual(fast_hud.updates, ref_hud.updates)
+
+    def test_text_matches_message_path(self):
+        self._check(("\n".join(self.LINES) + "\n").encode())
+
+    def test_binary_matches_message_path(self):
+        self._check(encode_binary(self.LINES))
+
+    def test_binary_round_trip_re_encodes_the_text_lines(self):
+        # 0.1, 0.3 and 12.1 aren't representable in float32; the re-encoded
+        # SLOT lines and the relayed UPDATE must not carry float32 artefacts.
+        hud = CapturingHud()
+        state = RegionState(hud, dial_offset=0, button_offset=0, dial_count=4, button_count=4)
+        lines = ["SLOT|dial|0|Cut|0.1|0.0|12.1", "SLOT|button|0|Hi|0.1|0.0|1.0"]
+        state.handle_datagram(encode_binary(["DEVICE|Dev"] + lines + ["COMMIT|2"]))
+        self.assertEqual(state.slot_lines(), lines)
+        state.handle_datagram(encode_binary(["UPDATE|dial|0|Cut|0.3|0.0|12.1"]))
+        self.assertEqual(hud.updates, [('dial', 0, 'Cut', 0.3, 0.0, 12.1)])
+
+    def test_slots_decode_only_when_read(self):
+        state = self._state(CapturingHud())
+        state.handle_datagram(encode_binary(["DEVICE|Dev", "SLOT|dial|1|Cut|0.5|0.0|1.0", "COMMIT|1"]))
+        self.assertIsInstance(state._dials[1], LazyBinarySlot)
+        self.assertEqual(state.dial_payloads(), [(17, SlotPayload("Cut", 0.5, 0.0, 1.0))])
+        self.assertIsInstance(state._dials[1], SlotPayload)
+
+    def test_truncated_frame_keeps_prefix(self):
+        frame = encode_binary(["DEVICE|Dev", "SLOT|dial|1|Cut|0.5|0.0|1.0", "COMMIT|1"])
+        state = self._state(CapturingHud())
+        state.handle_datagram(frame[:-4])
+        # The COMMIT never arrived: nothing published.
+        self.assertEqual(state.dial_payloads(), [])
@@ -0,0 +1,167 @@
+import threading
+import time
+import unittest
+
+from source_modules.hud_client import HudClient
+from source_modules.latency_stats import STATS
+from source_modules.send_queue import SendQueue, BURST, UPDATE, CONTROL
+
+ADDR = ('127.0.0.1', 5006)
+
+
+class _GatedSocket:
+    """Records sends; closing `gate` stalls the sender thread inside sendto,
+    like a blocked loopback write."""
+
+    def __init__(self, fail=False):
+        self.sent = []
+        self.fail = fail
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def sendto(self, payload, addr):
+        self.gate.wait(2)
+        if self.fail:
+            raise OSError("send failed")
+        self.sent.append(payload)
+
+
+def _wait_until(pred, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not pred():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.001)
+
+
+class TestSendQueue(unittest.TestCase):
+
+    def _queue(self, **kw):
+        q = SendQueue(**kw)
+        self.addCleanup(q.close)
+        return q
+
+    def _stall(self, q, sock):
+        # Park the thread inside sendto so everything after queues up.
+        sock.gate.clear()
+        q.put(sock, b'stalled', ADDR, CONTROL)
+        _wait_until(lambda: q.stats()['depth'] == 0)
+
+    def test_sends_in_fifo_order(self):
+        q, sock = self._queue(), _GatedSocket()
+        for i in range(20):
+            q.put(sock, b'%d' % i, ADDR, UPDATE if i % 2 else BURST)
+        self.assertTrue(q.wait_idle())
+        self.assertEqual(sock.sent, [b'%d' % i for i in range(20)])
+        self.assertEqual(q.stats()['sent'], 20)
+
+    def test_full_queue_drops_oldest_update_never_bursts(self):
+        q, sock = self._queue(max_depth=3), _GatedSocket()
+        self._stall(q, sock)
+        q.put(sock, b'u1', ADDR, UPDATE)
+        q.put(sock, b'b1', ADDR, BURST)
+        q.put(sock, b'u2', ADDR, UPDATE)
+        q.put(sock, b'b2', ADDR, BURST)    # drops u1
+        q.put(sock, b'b3', ADDR, BURST)    # drops u2
+        self.assertFalse(q.put(sock, b'u3', ADDR, UPDATE))  # nothing older to drop
+        q.put(sock, b'hide', ADDR, CONTROL)  # overflows rather than dropping
+        sock.gate.set()
+        self.assertTrue(q.wait_idle())
+        self.assertEqual(sock.sent, [b'stalled', b'b1', b'b2', b'b3', b'hide'])
+        stats = q.stats()
+        self.assertEqual(stats['dropped_updates'], 3)
+        self.assertEqual(stats['overflows'], 1)
+        self.assertEqual(stats['high_water'], 4)
+
+    def test_discard_drops_only_that_owner(self):
+        q, sock = self._queue(), _GatedSocket()
+        self._stall(q, sock)
+        a, b = object(), object()
+        q.put(sock, b'a', ADDR, BURST, owner=a)
+        q.put(sock, b'b', ADDR, BURST, owner=b)
+        q.discard(a)
+        sock.gate.set()
+        q.wait_idle()
+        self.assertEqual(sock.sent, [b'stalled', b'b'])
+
+    def test_close_sends_what_is_queued(self):
+        q, sock = SendQueue(), _GatedSocket()
+        self._stall(q, sock)
+        q.put(sock, b'last', ADDR, CONTROL)
+        sock.gate.set()
+        q.close()
+        self.assertEqual(sock.sent, [b'stalled', b'last'])
+        self.assertFalse(q.put(sock, b'late', ADDR, CONTROL))
+
+    def test_send_error_reports_through_callback(self):
+        q, sock = self._queue(), _GatedSocket(fail=True)
+        failed = threading.Event()
+        q.put(sock, b'x', ADDR, BURST, on_error=failed.set)
+        self.assertTrue(failed.wait(2))
+        q.wait_idle()
+        self.assertEqual(q.stats()['errors'], 1)
+
+    def test_only_written_datagrams_are_counted(self):
+        STATS.reset()
+        self.addCleanup(STATS.reset)
+        q, sock = self._queue(max_depth=1), _GatedSocket()
+        self._stall(q, sock)
+        q.put(sock, b'old', ADDR, UPDATE, stat='hud')
+        q.put(sock, b'new', ADDR, UPDATE, stat='hud')   # drops 'old'
+        sock.gate.set()
+        q.wait_idle()
+        sock.fail = True
+        q.put(sock, b'lost', ADDR, BURST, stat='hud')
+        q.wait_idle()
+        self.assertEqual(STATS.counters(), {'hud_datagrams': 1, 'hud_bytes': len(b'new')})
+
+
+class TestHudClientWithSender(unittest.TestCase):
+
+    def _client(self, sock):
+        q = SendQueue()
+        self.addCleanup(q.close)
+        return HudClient(sock=sock, sender=q), q
+
+    def test_burst_is_one_queued_datagram(self):
+        sock = _GatedSocket()
+        client, q = self._client(sock)
+        client.begin_burst()
+        client.send_device("Operator")
+        client.send_slot('dial', 0, 'Freq', 0.5, 0.0, 1.0)
+        client.commit(1)
+        client.flush_burst()
+        q.wait_idle()
+        self.assertEqual(len(sock.sent), 1)
+        self.assertIn(b'DEVICE|Operator', sock.sent[0])
+        self.assertIsNotNone(client.seconds_since_last_send())
+
+    def test_disable_discards_queued_datagrams(self):
+        sock = _GatedSocket()
+        client, q = self._client(sock)
+        sock.gate.clear()
+        client.send_ping()
+        _wait_until(lambda: q.stats()['depth'] == 0)
+        client.send_hide()
+        client.set_enabled(False)
+        client.send_hide()
+        sock.gate.set()
+        q.wait_idle()
+        self.assertEqual(len(sock.sent), 1)  # only the PING already in flight
+
+    def test_failed_queued_send_forces_keyframe(self):
+        sock = _GatedSocket(fail=True)
+        client, q = self._client(sock)
+        client.set_delta(True)
+        client._shadow = {'stale': 'line'}
+        client._on_send_error()
+        client.begin_burst()
+        client.send_device("Operator")
+        client.flush_burst()
+        q.wait_idle()
+        # The burst went out as a keyframe (not a delta against the stale shadow).
+        self.assertEqual(client._deltas_since_keyframe, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import sys
+import unittest
+from unittest.mock import Mock
+
+from source_modules import shared_hub
+from source_modules.shared_hub import SurfaceShare
+from source_modules.helpers import Helpers, SurfaceConfig
+from source_modules.hud_client import HudClient
+
+MAPPINGS = {'devices': [{'className': 'Eq8', 'encoders': ['Gain A'], 'buttons': []}]}
+OTHER_MAPPINGS = {'devices': [{'className': 'Drift', 'encoders': ['Shape'], 'buttons': []}]}
+
+
+class CapturingSocket:
+    def __init__(self):
+        self.sent = []
+        self.closed = False
+
+    def sendto(self, data, addr):
+        self.sent.append((data, addr))
+
+    def close(self):
+        self.closed = True
+
+
+class TestSharedRegistry(unittest.TestCase):
+    def _share(self):
+        share = SurfaceShare()
+        self.addCleanup(share.release_all)
+        return share
+
+    def test_registry_lives_in_sys_modules(self):
+        # Each generated surface imports its own copy of shared_hub; they can
+        # only meet on a name every copy resolves the same way.
+        shared_hub.stats()
+        self.assertIn(shared_hub._REGISTRY_MODULE, sys.modules)
+
+    def test_equal_mappings_compile_once(self):
+        a, b = self._share(), self._share()
+        table = a.device_table(MAPPINGS)
+        self.assertIs(b.device_table(dict(MAPPINGS)), table)
+        self.assertIn(('Eq8', None), table)
+
+    def test_different_mappings_get_their_own_table(self):
+        a, b = self._share(), self._share()
+        self.assertIsNot(a.device_table(MAPPINGS), b.device_table(OTHER_MAPPINGS))
+
+    def test_empty_mappings_are_not_registered(self):
+        before = shared_hub.stats()
+        self.assertEqual(self._share().device_table(None), {})
+        self.assertEqual(shared_hub.stats(), before)
+
+    def test_refcounted_teardown(self):
+        key = ('test-entry',)
+        closed = []
+        a, b = SurfaceShare(), SurfaceShare()
+        value = a._acquire(key, object, closer=closed.append)
+        self.assertIs(b._acquire(key, object), value)
+        self.assertEqual(shared_hub.stats()[key], 2)
+        a.release_all()
+        self.assertEqual(closed, [])
+        b.release_all()
+        self.assertEqual(closed, [value])
+        self.assertNotIn(key, shared_hub.stats())
+
+    def test_udp_socket_is_shared_and_closed_by_last_release(self):
+        a, b = SurfaceShare(), SurfaceShare()
+        sock = a.udp_socket()
+        self.assertIs(b.udp_socket(), sock)
+        a.release_all()
+        self.assertNotEqual(sock.fileno(), -1)
+        b.release_all()
+        self.assertEqual(sock.fileno(), -1)
+
+
+class TestSharedConsumers(unittest.TestCase):
+    def test_hud_client_sends_through_the_given_socket(self):
+        sock = CapturingSocket()
+        c = HudClient('127.0.0.1', 5099, sock=sock)
+        c.send_ping()
+        self.assertEqual(sock.sent, [(b'PING\n', ('127.0.0.1', 5099))])
+
+    def test_helpers_on_one_share_reuse_the_compiled_table(self):
+        share = SurfaceShare()
+        self.addCleanup(share.release_all)
+        config = SurfaceConfig(parameter_mappings_raw=MAPPINGS)
+        first = Helpers(Mock(), Mock(), config, share=share)
+        second = Helpers(Mock(), Mock(), config, share=share)
+        self.assertIs(first._resolver.device_table, second._resolver.device_table)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+import unittest
+from unittest.mock import Mock
+
+from source_modules.update_coalescer import UpdateCoalescer, NullUpdateCoalescer
+from source_modules.hud_client import HudClient
+from source_modules.helpers import Remote
+from tests.test_hud_client import FakeSocket
+
+
+def _make_real_param(name, value, vmin=0.0, vmax=1.0):
+    rp = Mock()
+    rp.param.name = name
+    rp.param.value = value
+    rp.param.min = vmin
+    rp.param.max = vmax
+    rp.alias = None
+    rp.button = None
+    return rp
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _coalescer(**kwargs):
+    hud = HudClient()
+    hud._socket = FakeSocket()
+    osc = Mock()
+    return UpdateCoalescer(Mock(), hud, osc, **kwargs), hud, osc
+
+
+class TestUpdateCoalescer(unittest.TestCase):
+    def test_tick_is_scheduled_on_creation_and_after_each_tick(self):
+        manager = Mock()
+        c = UpdateCoalescer(manager, Mock(), Mock())
+        c.tick()
+        self.assertEqual(manager.schedule_message.call_count, 2)
+
+    def test_sweep_collapses_to_latest_value_per_slot(self):
+        c, hud, _ = _coalescer()
+        for v in (0.1, 0.2, 0.3):
+            c.send_update('dial', 0, "Freq", v, 0.0, 1.0)
+        c.send_update('dial', 1, "Res", 0.5, 0.0, 1.0)
+        self.assertEqual(hud._socket.datagrams, [])
+        c.tick()
+        self.assertEqual(hud._socket.datagrams, [
+            "UPDATE|dial|0|Freq|0.3|0.0|1.0\n"
+            "UPDATE|dial|1|Res|0.5|0.0|1.0\n"
+        ])
+        self.assertEqual(c.stats(), {'offered': 4, 'collapsed': 2, 'discarded': 0,
+                                     'sent': 2, 'flushes': 1})
+
+    def test_osc_updates_keep_latest_per_parameter(self):
+        c, _, osc = _coalescer()
+        c.send_parameter_update(3, [3, 0.1])
+        c.send_parameter_update(3, [3, 0.9])
+        c.tick()
+        osc.send_message.assert_called_once_with("/selected-device/parameter-update", [3, 0.9])
+
+    def test_empty_tick_sends_nothing(self):
+        c, hud, osc = _coalescer()
+        c.tick()
+        self.assertEqual(hud._socket.datagrams, [])
+        osc.send_message.assert_not_called()
+        self.assertEqual(c.flushes, 0)
+
+    def test_discard_drops_pending(self):
+        c, hud, osc = _coalescer()
+        c.send_update('dial', 0, "Freq", 0.3, 0.0, 1.0)
+        c.send_parameter_update(1, [1, 0.3])
+        c.discard()
+        c.tick()
+        self.assertEqual(hud._socket.datagrams, [])
+        osc.send_message.assert_not_called()
+        self.assertEqual(c.discarded, 2)
+
+    def test_max_rate_holds_updates_until_interval_elapses(self):
+        clock = FakeClock()
+        c, hud, _ = _coalescer(max_rate_hz=10, clock=clock)
+        c.send_update('dial', 0, "Freq", 0.1, 0.0, 1.0)
+        c.tick()
+        c.send_update('dial', 0, "Freq", 0.2, 0.0, 1.0)
+        clock.now = 0.05
+        c.tick()
+        self.assertEqual(len(hud._socket.datagrams), 1)
+        clock.now = 0.1
+        c.tick()
+        self.assertEqual(hud._socket.datagrams[-1], "UPDATE|dial|0|Freq|0.2|0.0|1.0\n")
+
+    def test_close_drops_pending_and_stops_the_tick(self):
+        manager = Mock()
+        hud = HudClient()
+        hud._socket = FakeSocket()
+        c = UpdateCoalescer(manager, hud, Mock())
+        c.send_update('dial', 0, "Freq", 0.3, 0.0, 1.0)
+        c.close()
+        c.tick()
+        self.assertEqual(hud._socket.datagrams, [])
+        self.assertEqual(manager.schedule_message.call_count, 1)  # creation only
+
+    def test_null_coalescer_passes_through(self):
+        hud, osc = Mock(), Mock()
+        c = NullUpdateCoalescer(hud, osc)
+        c.send_update('dial', 2, "Freq", 0.4, 0.0, 1.0)
+        c.send_parameter_update(3, [3, 0.4])
+        hud.send_update.assert_called_once_with('dial', 2, "Freq", 0.4, 0.0, 1.0)
+        osc.send_message.assert_called_once_with("/selected-device/parameter-update", [3, 0.4])
+
+
+class TestHudClientSendUpdates(unittest.TestCase):
+    def test_oversized_batch_splits_on_line_boundaries(self):
+        hud = HudClient()
+        hud._socket = FakeSocket()
+        hud._max_datagram = 64  # two 31-byte UPDATE lines per datagram
+        hud.send_updates([('dial', i, "Freq", 0.5, 0.0, 1.0) for i in range(4)])
+        self.assertEqual([d.count('\n') for d in hud._socket.datagrams], [2, 2])
+
+
+class TestRemoteCoalescing(unittest.TestCase):
+    def setUp(self):
+        self.hud = Mock()
+        self.osc = Mock()
+        self.coalescer = UpdateCoalescer(Mock(), self.hud, self.osc)
+        self.remote = Remote(manager=Mock(), osc_client=self.osc, hud_client=self.hud,
+                             update_coalescer=self.coalescer)
+
+    def test_knob_turns_are_queued_until_tick(self):
+        for v in (0.2, 0.4):
+            self.remote.parameter_updated(_make_real_param("Freq", v), 1)
+        self.hud.send_updates.assert_not_called()
+        self.osc.send_message.assert_not_called()
+        self.coalescer.tick()
+        self.hud.send_updates.assert_called_once_with([('dial', 0, "Freq", 0.4, 0.0, 1.0)])
+
+    def test_device_update_discards_pending_and_sends_burst_fill_directly(self):
+        self.remote.parameter_updated(_make_real_param("Freq", 0.2), 1)
+        self.remote.device_update("Other", [_make_real_param("Cut", 0.9)])
+        self.coalescer.tick()
+        self.hud.send_updates.assert_not_called()
+        self.assertEqual(self.coalescer.discarded, 2)
+
+    def test_hide_discards_pending_hud_updates(self):
+        self.remote.parameter_updated(_make_real_param("Freq", 0.2), 1)
+        self.remote.hide()
+        self.coalescer.tick()
+        self.hud.send_updates.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()